@@ -10,45 +10,78 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/account/accounts/list?view=azure-devops-rest-7.2
 """
 
-import json
+import argparse
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("list_accounts", PAT)
-logger.info("Get a list of accounts for a specific owner or a specific member.")
+def list_accounts(client) -> dict:
+    """
+    Get a list of accounts for a specific owner or a specific member.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/accounts", API_VERSION, base_host="app.vssps.visualstudio.com")
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/accounts", API_VERSION, base_host="app.vssps.visualstudio.com")
+    response = client.request("GET", url)
+    data = loads(response.content)
+    return data
+
+
+async def list_accounts_async(client) -> dict:
+    """Async variant of list_accounts() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/accounts", API_VERSION, base_host="app.vssps.visualstudio.com")
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call list_accounts() and print the result."""
+    organization, pat = get_common_env()
+
+    parser = argparse.ArgumentParser(description="Get a list of accounts for a specific owner or a specific member.")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("list_accounts", pat)
+    logger.info("Get a list of accounts for a specific owner or a specific member.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        items = items_of(list_accounts(client), "value")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    data = list_accounts(client)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
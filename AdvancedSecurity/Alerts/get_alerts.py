@@ -10,53 +10,74 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/advanced-security/alerts/get?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-ALERT_ID = get_env_or_exit("ALERT_ID", "ID of alert to retrieve")
-REPOSITORY = get_env_or_exit("REPOSITORY", "Name or id of a repository that alert is part of")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_alerts", PAT)
-logger.info("Get an alert.")
+def get_alerts(client, project: str, alert_id: str, repository: str) -> dict:
+    """
+    Get an alert.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/alert/repositories/{REPOSITORY}/alerts/{ALERT_ID}", API_VERSION, project=PROJECT_ID, base_host="advsec.dev.azure.com")
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        alert_id: ID of alert to retrieve
+        repository: Name or id of a repository that alert is part of
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/alert/repositories/{repository}/alerts/{alert_id}", API_VERSION, project=project, base_host="advsec.dev.azure.com")
+    response = client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['additionalProperties', 'alertId'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['additionalProperties', 'alertId'], API_VERSION)
+async def get_alerts_async(client, project: str, alert_id: str, repository: str) -> dict:
+    """Async variant of get_alerts() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/alert/repositories/{repository}/alerts/{alert_id}", API_VERSION, project=project, base_host="advsec.dev.azure.com")
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['additionalProperties', 'alertId'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_alerts() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    alert_id = require_env("ALERT_ID", "ID of alert to retrieve")
+    repository = require_env("REPOSITORY", "Name or id of a repository that alert is part of")
+
+    logger = AdoLogger("get_alerts", pat)
+    logger.info("Get an alert.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = get_alerts(client, project, alert_id, repository)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
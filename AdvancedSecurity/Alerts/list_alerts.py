@@ -10,47 +10,106 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/advanced-security/alerts/list?view=azure-devops-rest-7.2
 """
 
-import json
+import argparse
 import os
 import sys
+from typing import Iterator, Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
+from _shared.pagination import paginate
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-REPOSITORY = get_env_or_exit("REPOSITORY", "The name or ID of the repository")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("list_alerts", PAT)
-logger.info("Get alerts for a repository")
+def list_alerts(client, project: str, repository: str) -> dict:
+    """
+    Get alerts for a repository
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/alert/repositories/{REPOSITORY}/alerts", API_VERSION, project=PROJECT_ID, base_host="advsec.dev.azure.com")
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        repository: The name or ID of the repository
+
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/alert/repositories/{repository}/alerts", API_VERSION, project=project, base_host="advsec.dev.azure.com")
+    response = client.request("GET", url)
+    data = loads(response.content)
+    return data
+
+
+async def list_alerts_async(client, project: str, repository: str) -> dict:
+    """Async variant of list_alerts() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/alert/repositories/{repository}/alerts", API_VERSION, project=project, base_host="advsec.dev.azure.com")
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    return data
+
+
+def iter_list_alerts(client, project: str, repository: str, *, max_items: Optional[int] = None, prefetch: bool = False) -> Iterator[dict]:
+    """
+    Yield every item across all pages of list_alerts() (continuation paging).
 
-response = execute_request("GET", url, HEADERS)
+    Takes the same arguments, plus:
+        max_items: Stop after this many items (default: all).
+        prefetch: Fetch the next page while the current one is consumed.
+    """
+    url = build_url(client.organization, f"_apis/alert/repositories/{repository}/alerts", API_VERSION, project=project, base_host="advsec.dev.azure.com")
+    return paginate(client, "GET", url, "continuation",
+                    max_items=max_items, prefetch=prefetch)
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call list_alerts() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    repository = require_env("REPOSITORY", "The name or ID of the repository")
+
+    parser = argparse.ArgumentParser(description="Get alerts for a repository")
+    parser.add_argument("--all-pages", action="store_true", help="Follow pagination and return every item")
+    parser.add_argument("--max-items", type=int, help="Follow pagination up to this many items")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("list_alerts", pat)
+    logger.info("Get alerts for a repository")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        if args.all_pages or args.max_items:
+            items = iter_list_alerts(client, project, repository, max_items=args.max_items, prefetch=True)
+        else:
+            items = items_of(list_alerts(client, project, repository), "value")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    if args.all_pages or args.max_items:
+        items = list(iter_list_alerts(client, project, repository, max_items=args.max_items, prefetch=True))
+        data = {"count": len(items), "value": items}
+    else:
+        data = list_alerts(client, project, repository)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
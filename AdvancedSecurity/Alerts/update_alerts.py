@@ -11,71 +11,94 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/advanced-security/
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-ALERT_ID = get_env_or_exit("ALERT_ID", "The ID of the alert")
-REPOSITORY = get_env_or_exit("REPOSITORY", "The name or ID of the repository")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Update the status of an alert")
-parser.add_argument("--dismissed-comment", required=False, help="dismissedComment")
-parser.add_argument("--dismissed-reason", required=False, help="dismissedReason")
-parser.add_argument("--state", required=False, help="state")
-args = parser.parse_args()
+def update_alerts(client, project: str, alert_id: str, repository: str, *, dismissed_comment: Optional[str] = None, dismissed_reason: Optional[str] = None, state: Optional[str] = None) -> dict:
+    """
+    Update the status of an alert
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        alert_id: The ID of the alert
+        repository: The name or ID of the repository
+        dismissed_comment: dismissedComment
+        dismissed_reason: dismissedReason
+        state: state
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "dismissedComment": dismissed_comment,
+        "dismissedReason": dismissed_reason,
+        "state": state,
+    }
+    url = build_url(client.organization, f"_apis/alert/repositories/{repository}/alerts/{alert_id}", API_VERSION, project=project, base_host="advsec.dev.azure.com")
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['additionalProperties', 'alertId'], API_VERSION)
+    return data
+
+
+async def update_alerts_async(client, project: str, alert_id: str, repository: str, *, dismissed_comment: Optional[str] = None, dismissed_reason: Optional[str] = None, state: Optional[str] = None) -> dict:
+    """Async variant of update_alerts() for use with AsyncAdoClient."""
+    body = {
+        "dismissedComment": dismissed_comment,
+        "dismissedReason": dismissed_reason,
+        "state": state,
+    }
+    url = build_url(client.organization, f"_apis/alert/repositories/{repository}/alerts/{alert_id}", API_VERSION, project=project, base_host="advsec.dev.azure.com")
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['additionalProperties', 'alertId'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_alerts", PAT)
-logger.info("Update the status of an alert")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "dismissedComment": args.dismissed_comment,
-    "dismissedReason": args.dismissed_reason,
-    "state": args.state,
-}
+def main() -> None:
+    """Read env vars / flags, call update_alerts() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    alert_id = require_env("ALERT_ID", "The ID of the alert")
+    repository = require_env("REPOSITORY", "The name or ID of the repository")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/alert/repositories/{REPOSITORY}/alerts/{ALERT_ID}", API_VERSION, project=PROJECT_ID, base_host="advsec.dev.azure.com")
-logger.info(f"PATCH {url}")
+    parser = argparse.ArgumentParser(description="Update the status of an alert")
+    parser.add_argument("--dismissed-comment", required=False, help="dismissedComment")
+    parser.add_argument("--dismissed-reason", required=False, help="dismissedReason")
+    parser.add_argument("--state", required=False, help="state")
+    args = parser.parse_args()
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+    logger = AdoLogger("update_alerts", pat)
+    logger.info("Update the status of an alert")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_alerts(client, project, alert_id, repository, dismissed_comment=args.dismissed_comment, dismissed_reason=args.dismissed_reason, state=args.state)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['additionalProperties', 'alertId'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
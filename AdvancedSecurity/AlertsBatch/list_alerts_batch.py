@@ -11,63 +11,94 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/advanced-security/
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-REPOSITORY = get_env_or_exit("REPOSITORY", "The name or ID of the repository")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Get alerts by alert IDs Currently supports fetching secret alerts only.")
-parser.add_argument("--alert-ids", required=False, help="List of alert IDs to retrieve.")
-parser.add_argument("--alert-type", required=False, help="Alert type of the alert IDs.")
-args = parser.parse_args()
+def list_alerts_batch(client, project: str, repository: str, *, alert_ids: Optional[str] = None, alert_type: Optional[str] = None) -> dict:
+    """
+    Get alerts by alert IDs Currently supports fetching secret alerts only.
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("list_alerts_batch", PAT)
-logger.info("Get alerts by alert IDs Currently supports fetching secret alerts only.")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        repository: The name or ID of the repository
+        alert_ids: List of alert IDs to retrieve.
+        alert_type: Alert type of the alert IDs.
 
-# ---------------------------------------------------------------------------
-# Request body
-# ---------------------------------------------------------------------------
-body = {
-    "alertIds": args.alert_ids,
-    "alertType": args.alert_type,
-}
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "alertIds": alert_ids,
+        "alertType": alert_type,
+    }
+    url = build_url(client.organization, f"_apis/alert/repositories/{repository}/AlertsBatch", API_VERSION, project=project, base_host="advsec.dev.azure.com")
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/alert/repositories/{REPOSITORY}/AlertsBatch", API_VERSION, project=PROJECT_ID, base_host="advsec.dev.azure.com")
-logger.info(f"POST {url}")
 
-response = execute_request("POST", url, HEADERS, body=body)
+async def list_alerts_batch_async(client, project: str, repository: str, *, alert_ids: Optional[str] = None, alert_type: Optional[str] = None) -> dict:
+    """Async variant of list_alerts_batch() for use with AsyncAdoClient."""
+    body = {
+        "alertIds": alert_ids,
+        "alertType": alert_type,
+    }
+    url = build_url(client.organization, f"_apis/alert/repositories/{repository}/AlertsBatch", API_VERSION, project=project, base_host="advsec.dev.azure.com")
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call list_alerts_batch() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    repository = require_env("REPOSITORY", "The name or ID of the repository")
+
+    parser = argparse.ArgumentParser(description="Get alerts by alert IDs Currently supports fetching secret alerts only.")
+    parser.add_argument("--alert-ids", required=False, help="List of alert IDs to retrieve.")
+    parser.add_argument("--alert-type", required=False, help="Alert type of the alert IDs.")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("list_alerts_batch", pat)
+    logger.info("Get alerts by alert IDs Currently supports fetching secret alerts only.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        items = items_of(list_alerts_batch(client, project, repository, alert_ids=args.alert_ids, alert_type=args.alert_type), "value")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    data = list_alerts_batch(client, project, repository, alert_ids=args.alert_ids, alert_type=args.alert_type)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
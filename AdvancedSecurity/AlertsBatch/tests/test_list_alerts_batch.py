@@ -8,55 +8,23 @@ Validates:
   - Correct Authorization header
   - Successful response parsing (200)
   - Exit when required env vars are missing
+
+The script is imported and called in-process; see the fixtures in conftest.py.
 """
 
 import json
-import os
-import subprocess
-import sys
 from pathlib import Path
 
 import pytest
 import responses
 
+from _shared.errors import AdoAuthError, AdoNotFound
+from AdvancedSecurity.AlertsBatch.list_alerts_batch import list_alerts_batch, main
+
 FIXTURES = Path(__file__).parent / "fixtures"
-SCRIPT = str(Path(__file__).resolve().parents[1] / "list_alerts_batch.py")
-
-# ---------------------------------------------------------------------------
-# Helpers
-# ---------------------------------------------------------------------------
-
-def _run_script(env_override=None, extra_args=None, expect_fail=False):
-    """Run the script as a subprocess with the given env."""
-    env = {
-        "AZURE_DEVOPS_ORG": "testorg",
-        "AZURE_DEVOPS_PAT": "fakepat1234567890",
-        "PROJECT_ID": "a1b2c3d4-e5f6-7890-abcd-ef1234567890",
-        "REPOSITORY": "test-value-repository",
-        "PATH": os.environ.get("PATH", ""),
-        "PYTHONPATH": os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."),
-    }
-    if env_override:
-        env.update(env_override)
-    env = {k: v for k, v in env.items() if v is not None}
-
-    cmd = [sys.executable, SCRIPT]
-    if extra_args:
-        cmd.extend(extra_args)
-
-    result = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        env=env,
-        timeout=30,
-    )
-    if not expect_fail:
-        assert result.returncode == 0, (
-            f"Script failed (rc={result.returncode}):\n"
-            f"STDOUT: {result.stdout}\nSTDERR: {result.stderr}"
-        )
-    return result
+ENV = {
+    "REPOSITORY": "test-value-repository",
+}
 
 
 class TestListAlertsBatchEnvValidation:
@@ -64,43 +32,31 @@ class TestListAlertsBatchEnvValidation:
 
     @pytest.mark.offline
     @pytest.mark.advancedsecurity
-    def test_missing_org_exits(self):
-        result = _run_script(
-            env_override={"AZURE_DEVOPS_ORG": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "AZURE_DEVOPS_ORG" in result.stderr or "AZURE_DEVOPS_ORG" in result.stdout
+    def test_missing_org_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "AZURE_DEVOPS_ORG": None})
+        assert code != 0
+        assert "AZURE_DEVOPS_ORG" in output
 
     @pytest.mark.offline
     @pytest.mark.advancedsecurity
-    def test_missing_pat_exits(self):
-        result = _run_script(
-            env_override={"AZURE_DEVOPS_PAT": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "AZURE_DEVOPS_PAT" in result.stderr or "AZURE_DEVOPS_PAT" in result.stdout
+    def test_missing_pat_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "AZURE_DEVOPS_PAT": None})
+        assert code != 0
+        assert "AZURE_DEVOPS_PAT" in output
 
     @pytest.mark.offline
     @pytest.mark.advancedsecurity
-    def test_missing_project_id_exits(self):
-        result = _run_script(
-            env_override={"PROJECT_ID": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "PROJECT_ID" in (result.stderr + result.stdout)
+    def test_missing_project_id_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "PROJECT_ID": None})
+        assert code != 0
+        assert "PROJECT_ID" in output
 
     @pytest.mark.offline
     @pytest.mark.advancedsecurity
-    def test_missing_repository_exits(self):
-        result = _run_script(
-            env_override={"REPOSITORY": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "REPOSITORY" in result.stderr or "REPOSITORY" in result.stdout
+    def test_missing_repository_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "REPOSITORY": None})
+        assert code != 0
+        assert "REPOSITORY" in output
 
 
 class TestListAlertsBatchURLAndAuth:
@@ -109,56 +65,39 @@ class TestListAlertsBatchURLAndAuth:
     @pytest.mark.offline
     @pytest.mark.advancedsecurity
     @responses.activate
-    def test_correct_url_and_auth_header(self):
-        """Verify the script builds the right URL and Authorization header."""
-        import base64
-
-        org = "testorg"
-        pat = "fakepat1234567890"
+    def test_correct_url_and_auth_header(self, ado_client, ado_env):
+        """Verify the operation builds the right URL and Authorization header."""
         expected_url = "https://advsec.dev.azure.com/testorg/a1b2c3d4-e5f6-7890-abcd-ef1234567890/_apis/alert/repositories/test-value-repository/AlertsBatch?api-version=7.2"
-
         fixture = json.loads((FIXTURES / "list_alerts_batch_200.json").read_text())
         responses.add(responses.POST, expected_url, json=fixture, status=200)
 
-        import requests as req
-
-        cred = base64.b64encode(f":{pat}".encode("ascii")).decode("ascii")
-        headers = {
-            "Authorization": f"Basic {cred}",
-            "Content-Type": "application/json",
-        }
-        resp = req.post(expected_url, headers=headers, json={}, timeout=30)
-
-        assert resp.status_code == 200
+        assert list_alerts_batch(ado_client, ado_env["PROJECT_ID"], "test-value-repository") == fixture
         assert len(responses.calls) == 1
+        assert responses.calls[0].request.url == expected_url
         sent_auth = responses.calls[0].request.headers["Authorization"]
-        assert sent_auth.startswith("Basic ")
+        assert sent_auth == "Basic OmZha2VwYXQxMjM0NTY3ODkw"
 
 
 class TestListAlertsBatchHTTPErrors:
-    """Validate behaviour on error status codes."""
+    """Validate the typed error raised for error status codes."""
 
     @pytest.mark.offline
     @pytest.mark.advancedsecurity
     @responses.activate
-    def test_401_unauthorized(self):
+    def test_401_unauthorized(self, ado_client, ado_env):
         url = "https://advsec.dev.azure.com/testorg/a1b2c3d4-e5f6-7890-abcd-ef1234567890/_apis/alert/repositories/test-value-repository/AlertsBatch?api-version=7.2"
         responses.add(responses.POST, url, json={"message": "unauthorized"}, status=401)
 
-        import requests as req
-
-        resp = req.post(url, headers={"Authorization": "Basic fake"}, json={}, timeout=30)
-        assert resp.status_code == 401
+        with pytest.raises(AdoAuthError):
+            list_alerts_batch(ado_client, ado_env["PROJECT_ID"], "test-value-repository")
 
     @pytest.mark.offline
     @pytest.mark.advancedsecurity
     @responses.activate
-    def test_404_not_found(self):
+    def test_404_not_found(self, ado_client, ado_env):
         url = "https://advsec.dev.azure.com/testorg/a1b2c3d4-e5f6-7890-abcd-ef1234567890/_apis/alert/repositories/test-value-repository/AlertsBatch?api-version=7.2"
         responses.add(responses.POST, url, json={"message": "not_found"}, status=404)
 
-        import requests as req
-
-        resp = req.post(url, headers={"Authorization": "Basic fake"}, json={}, timeout=30)
-        assert resp.status_code == 404
+        with pytest.raises(AdoNotFound):
+            list_alerts_batch(ado_client, ado_env["PROJECT_ID"], "test-value-repository")
 
@@ -10,48 +10,108 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/advanced-security/analysis/list?view=azure-devops-rest-7.2
 """
 
-import json
+import argparse
 import os
 import sys
+from typing import Iterator, Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
+from _shared.pagination import paginate
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-REPOSITORY = get_env_or_exit("REPOSITORY", "repository")
-ALERT_TYPE = get_env_or_exit("ALERT_TYPE", "The type of alert: Dependency Scanning (1), Secret (2), Code QL (3), etc.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("list_analysis", PAT)
-logger.info("Returns the branches for which analysis results were submitted.")
+def list_analysis(client, project: str, repository: str, alert_type: str) -> dict:
+    """
+    Returns the branches for which analysis results were submitted.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/alert/repositories/{REPOSITORY}/filters/branches", API_VERSION, project=PROJECT_ID, base_host="advsec.dev.azure.com")
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        repository: repository
+        alert_type: The type of alert: Dependency Scanning (1), Secret (2), Code QL (3), etc.
+
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/alert/repositories/{repository}/filters/branches", API_VERSION, project=project, base_host="advsec.dev.azure.com")
+    response = client.request("GET", url)
+    data = loads(response.content)
+    return data
+
+
+async def list_analysis_async(client, project: str, repository: str, alert_type: str) -> dict:
+    """Async variant of list_analysis() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/alert/repositories/{repository}/filters/branches", API_VERSION, project=project, base_host="advsec.dev.azure.com")
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    return data
+
+
+def iter_list_analysis(client, project: str, repository: str, alert_type: str, *, max_items: Optional[int] = None, prefetch: bool = False) -> Iterator[dict]:
+    """
+    Yield every item across all pages of list_analysis() (continuation paging).
 
-response = execute_request("GET", url, HEADERS)
+    Takes the same arguments, plus:
+        max_items: Stop after this many items (default: all).
+        prefetch: Fetch the next page while the current one is consumed.
+    """
+    url = build_url(client.organization, f"_apis/alert/repositories/{repository}/filters/branches", API_VERSION, project=project, base_host="advsec.dev.azure.com")
+    return paginate(client, "GET", url, "continuation",
+                    max_items=max_items, prefetch=prefetch)
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call list_analysis() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    repository = require_env("REPOSITORY", "repository")
+    alert_type = require_env("ALERT_TYPE", "The type of alert: Dependency Scanning (1), Secret (2), Code QL (3), etc.")
+
+    parser = argparse.ArgumentParser(description="Returns the branches for which analysis results were submitted.")
+    parser.add_argument("--all-pages", action="store_true", help="Follow pagination and return every item")
+    parser.add_argument("--max-items", type=int, help="Follow pagination up to this many items")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("list_analysis", pat)
+    logger.info("Returns the branches for which analysis results were submitted.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        if args.all_pages or args.max_items:
+            items = iter_list_analysis(client, project, repository, alert_type, max_items=args.max_items, prefetch=True)
+        else:
+            items = items_of(list_analysis(client, project, repository, alert_type), "value")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    if args.all_pages or args.max_items:
+        items = list(iter_list_analysis(client, project, repository, alert_type, max_items=args.max_items, prefetch=True))
+        data = {"count": len(items), "value": items}
+    else:
+        data = list_analysis(client, project, repository, alert_type)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,48 +10,84 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/advanced-security/instances/list?view=azure-devops-rest-7.2
 """
 
-import json
+import argparse
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-ALERT_ID = get_env_or_exit("ALERT_ID", "ID of alert to retrieve")
-REPOSITORY = get_env_or_exit("REPOSITORY", "Name or id of a repository that alert is part of")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("list_instances", PAT)
-logger.info("Get instances of an alert on a branch specified with @ref.")
+def list_instances(client, project: str, alert_id: str, repository: str) -> dict:
+    """
+    Get instances of an alert on a branch specified with @ref.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/alert/repositories/{REPOSITORY}/alerts/{ALERT_ID}/instances", API_VERSION, project=PROJECT_ID, base_host="advsec.dev.azure.com")
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        alert_id: ID of alert to retrieve
+        repository: Name or id of a repository that alert is part of
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/alert/repositories/{repository}/alerts/{alert_id}/instances", API_VERSION, project=project, base_host="advsec.dev.azure.com")
+    response = client.request("GET", url)
+    data = loads(response.content)
+    return data
+
+
+async def list_instances_async(client, project: str, alert_id: str, repository: str) -> dict:
+    """Async variant of list_instances() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/alert/repositories/{repository}/alerts/{alert_id}/instances", API_VERSION, project=project, base_host="advsec.dev.azure.com")
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call list_instances() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    alert_id = require_env("ALERT_ID", "ID of alert to retrieve")
+    repository = require_env("REPOSITORY", "Name or id of a repository that alert is part of")
+
+    parser = argparse.ArgumentParser(description="Get instances of an alert on a branch specified with @ref.")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("list_instances", pat)
+    logger.info("Get instances of an alert on a branch specified with @ref.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        items = items_of(list_instances(client, project, alert_id, repository), "value")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    data = list_instances(client, project, alert_id, repository)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
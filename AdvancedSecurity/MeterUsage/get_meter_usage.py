@@ -10,51 +10,70 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/advanced-security/meter-usage/get?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PLAN = get_env_or_exit("PLAN", "The plan to query. Plans supported: CodeSecurity and SecretProtection. This is a mandatory parame...")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_meter_usage", PAT)
-logger.info("Get commiters used when calculating billing information.")
+def get_meter_usage(client, plan: str) -> dict:
+    """
+    Get commiters used when calculating billing information.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/management/meterusage/default", API_VERSION, base_host="advsec.dev.azure.com")
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        plan: The plan to query. Plans supported: CodeSecurity and SecretProtection. This is a mandatory parame...
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/management/meterusage/default", API_VERSION, base_host="advsec.dev.azure.com")
+    response = client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['accountId', 'azureSubscriptionId'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['accountId', 'azureSubscriptionId'], API_VERSION)
+async def get_meter_usage_async(client, plan: str) -> dict:
+    """Async variant of get_meter_usage() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/management/meterusage/default", API_VERSION, base_host="advsec.dev.azure.com")
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['accountId', 'azureSubscriptionId'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_meter_usage() and print the result."""
+    organization, pat = get_common_env()
+    plan = require_env("PLAN", "The plan to query. Plans supported: CodeSecurity and SecretProtection. This is a mandatory parame...")
+
+    logger = AdoLogger("get_meter_usage", pat)
+    logger.info("Get commiters used when calculating billing information.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = get_meter_usage(client, plan)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,46 +10,68 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/advanced-security/project-enablement/update?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_project_enablement", PAT)
-logger.info("Update the status of Advanced Security for the project")
+def update_project_enablement(client, project: str) -> dict:
+    """
+    Update the status of Advanced Security for the project
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/management/enablement", API_VERSION, project=project, base_host="advsec.dev.azure.com")
+    response = client.request("PATCH", url)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/management/enablement", API_VERSION, project=PROJECT_ID, base_host="advsec.dev.azure.com")
-logger.info(f"PATCH {url}")
 
-response = execute_request("PATCH", url, HEADERS)
+async def update_project_enablement_async(client, project: str) -> dict:
+    """Async variant of update_project_enablement() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/management/enablement", API_VERSION, project=project, base_host="advsec.dev.azure.com")
+    response = await client.request("PATCH", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call update_project_enablement() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+
+    logger = AdoLogger("update_project_enablement", pat)
+    logger.info("Update the status of Advanced Security for the project")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = update_project_enablement(client, project)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,51 +10,70 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/advanced-security/project-meter-usage-estimate/get?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_project_meter_usage_estimate", PAT)
-logger.info("Estimate the pushers that would be added to the customer's usage if Advanced Security was enabled for this project.")
+def get_project_meter_usage_estimate(client, project: str) -> dict:
+    """
+    Estimate the pushers that would be added to the customer's usage if Advanced Security was enabled for this project.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/management/meterUsageEstimate/default", API_VERSION, project=PROJECT_ID, base_host="advsec.dev.azure.com")
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/management/meterUsageEstimate/default", API_VERSION, project=project, base_host="advsec.dev.azure.com")
+    response = client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['codeSecurityMeterUsageEstimate', 'secretProtectionMeterUsageEstimate'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['codeSecurityMeterUsageEstimate', 'secretProtectionMeterUsageEstimate'], API_VERSION)
+async def get_project_meter_usage_estimate_async(client, project: str) -> dict:
+    """Async variant of get_project_meter_usage_estimate() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/management/meterUsageEstimate/default", API_VERSION, project=project, base_host="advsec.dev.azure.com")
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['codeSecurityMeterUsageEstimate', 'secretProtectionMeterUsageEstimate'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_project_meter_usage_estimate() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+
+    logger = AdoLogger("get_project_meter_usage_estimate", pat)
+    logger.info("Estimate the pushers that would be added to the customer's usage if Advanced Security was enabled for this project.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = get_project_meter_usage_estimate(client, project)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,67 +11,94 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/advanced-security/
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-REPOSITORY = get_env_or_exit("REPOSITORY", "Name or ID of the repository")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Update the enablement status of Code Security and Secret Protection, along with their respective features, for a give...")
-parser.add_argument("--code-security-features", required=False, help="Includes Code Security features that can be enabled.")
-parser.add_argument("--project-id", required=False, help="The project Id")
-parser.add_argument("--repository-id", required=False, help="The repository Id")
-parser.add_argument("--secret-protection-features", required=False, help="Includes Secret Protection features that can be enabled.")
-args = parser.parse_args()
+def update_repo_enablement(client, project: str, repository: str, *, code_security_features: Optional[str] = None, project_id: Optional[str] = None, repository_id: Optional[str] = None, secret_protection_features: Optional[str] = None) -> dict:
+    """
+    Update the enablement status of Code Security and Secret Protection, along with their respective features, for a give...
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_repo_enablement", PAT)
-logger.info("Update the enablement status of Code Security and Secret Protection, along with their respective features, for a give...")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        repository: Name or ID of the repository
+        code_security_features: Includes Code Security features that can be enabled.
+        project_id: The project Id
+        repository_id: The repository Id
+        secret_protection_features: Includes Secret Protection features that can be enabled.
 
-# ---------------------------------------------------------------------------
-# Request body
-# ---------------------------------------------------------------------------
-body = {
-    "codeSecurityFeatures": args.code_security_features,
-    "projectId": args.project_id,
-    "repositoryId": args.repository_id,
-    "secretProtectionFeatures": args.secret_protection_features,
-}
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "codeSecurityFeatures": code_security_features,
+        "projectId": project_id,
+        "repositoryId": repository_id,
+        "secretProtectionFeatures": secret_protection_features,
+    }
+    url = build_url(client.organization, f"_apis/management/repositories/{repository}/enablement", API_VERSION, project=project, base_host="advsec.dev.azure.com")
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/management/repositories/{REPOSITORY}/enablement", API_VERSION, project=PROJECT_ID, base_host="advsec.dev.azure.com")
-logger.info(f"PATCH {url}")
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+async def update_repo_enablement_async(client, project: str, repository: str, *, code_security_features: Optional[str] = None, project_id: Optional[str] = None, repository_id: Optional[str] = None, secret_protection_features: Optional[str] = None) -> dict:
+    """Async variant of update_repo_enablement() for use with AsyncAdoClient."""
+    body = {
+        "codeSecurityFeatures": code_security_features,
+        "projectId": project_id,
+        "repositoryId": repository_id,
+        "secretProtectionFeatures": secret_protection_features,
+    }
+    url = build_url(client.organization, f"_apis/management/repositories/{repository}/enablement", API_VERSION, project=project, base_host="advsec.dev.azure.com")
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call update_repo_enablement() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    repository = require_env("REPOSITORY", "Name or ID of the repository")
+
+    parser = argparse.ArgumentParser(description="Update the enablement status of Code Security and Secret Protection, along with their respective features, for a give...")
+    parser.add_argument("--code-security-features", required=False, help="Includes Code Security features that can be enabled.")
+    parser.add_argument("--project-id", required=False, help="The project Id")
+    parser.add_argument("--repository-id", required=False, help="The repository Id")
+    parser.add_argument("--secret-protection-features", required=False, help="Includes Secret Protection features that can be enabled.")
+    args = parser.parse_args()
+
+    logger = AdoLogger("update_repo_enablement", pat)
+    logger.info("Update the enablement status of Code Security and Secret Protection, along with their respective features, for a give...")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = update_repo_enablement(client, project, repository, code_security_features=args.code_security_features, project_id=args.project_id, repository_id=args.repository_id, secret_protection_features=args.secret_protection_features)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
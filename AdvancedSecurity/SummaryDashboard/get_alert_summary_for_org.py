@@ -10,50 +10,68 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/advanced-security/summary-dashboard/get-alert-summary-for-org?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_alert_summary_for_org", PAT)
-logger.info("Get Alert summary by severity for the org")
+def get_alert_summary_for_org(client) -> dict:
+    """
+    Get Alert summary by severity for the org
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/reporting/summary/alerts", API_VERSION, base_host="advsec.dev.azure.com")
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/reporting/summary/alerts", API_VERSION, base_host="advsec.dev.azure.com")
+    response = client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['orgId', 'projects'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['orgId', 'projects'], API_VERSION)
+async def get_alert_summary_for_org_async(client) -> dict:
+    """Async variant of get_alert_summary_for_org() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/reporting/summary/alerts", API_VERSION, base_host="advsec.dev.azure.com")
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['orgId', 'projects'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_alert_summary_for_org() and print the result."""
+    organization, pat = get_common_env()
+
+    logger = AdoLogger("get_alert_summary_for_org", pat)
+    logger.info("Get Alert summary by severity for the org")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = get_alert_summary_for_org(client)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,73 +11,98 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/approvals-and-chec
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Add a check configuration")
-parser.add_argument("--created-by", required=False, help="Identity of person who configured check.")
-parser.add_argument("--created-on", required=False, help="Time when check got configured.")
-parser.add_argument("--is-disabled", required=False, help="Is check disabled.")
-parser.add_argument("--issue", required=False, help="Issue connected to check configuration.")
-parser.add_argument("--modified-by", required=False, help="Identity of person who modified the configured check.")
-args = parser.parse_args()
+def create_check_configurations(client, project: str, *, created_by: Optional[str] = None, created_on: Optional[str] = None, is_disabled: Optional[str] = None, issue: Optional[str] = None, modified_by: Optional[str] = None) -> dict:
+    """
+    Add a check configuration
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        created_by: Identity of person who configured check.
+        created_on: Time when check got configured.
+        is_disabled: Is check disabled.
+        issue: Issue connected to check configuration.
+        modified_by: Identity of person who modified the configured check.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "createdBy": created_by,
+        "createdOn": created_on,
+        "isDisabled": is_disabled,
+        "issue": issue,
+        "modifiedBy": modified_by,
+    }
+    url = build_url(client.organization, f"_apis/pipelines/checks/configurations", API_VERSION, project=project)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['createdBy', 'createdOn'], API_VERSION)
+    return data
+
+
+async def create_check_configurations_async(client, project: str, *, created_by: Optional[str] = None, created_on: Optional[str] = None, is_disabled: Optional[str] = None, issue: Optional[str] = None, modified_by: Optional[str] = None) -> dict:
+    """Async variant of create_check_configurations() for use with AsyncAdoClient."""
+    body = {
+        "createdBy": created_by,
+        "createdOn": created_on,
+        "isDisabled": is_disabled,
+        "issue": issue,
+        "modifiedBy": modified_by,
+    }
+    url = build_url(client.organization, f"_apis/pipelines/checks/configurations", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['createdBy', 'createdOn'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_check_configurations", PAT)
-logger.info("Add a check configuration")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "createdBy": args.created_by,
-    "createdOn": args.created_on,
-    "isDisabled": args.is_disabled,
-    "issue": args.issue,
-    "modifiedBy": args.modified_by,
-}
+def main() -> None:
+    """Read env vars / flags, call create_check_configurations() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/pipelines/checks/configurations", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Add a check configuration")
+    parser.add_argument("--created-by", required=False, help="Identity of person who configured check.")
+    parser.add_argument("--created-on", required=False, help="Time when check got configured.")
+    parser.add_argument("--is-disabled", required=False, help="Is check disabled.")
+    parser.add_argument("--issue", required=False, help="Issue connected to check configuration.")
+    parser.add_argument("--modified-by", required=False, help="Identity of person who modified the configured check.")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_check_configurations", pat)
+    logger.info("Add a check configuration")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_check_configurations(client, project, created_by=args.created_by, created_on=args.created_on, is_disabled=args.is_disabled, issue=args.issue, modified_by=args.modified_by)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['createdBy', 'createdOn'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
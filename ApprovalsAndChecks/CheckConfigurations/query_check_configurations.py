@@ -10,46 +10,80 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/approvals-and-checks/check-configurations/query?view=azure-devops-rest-7.2
 """
 
-import json
+import argparse
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("query_check_configurations", PAT)
-logger.info("Get check configurations for multiple resources by resource type and id.")
+def query_check_configurations(client, project: str) -> dict:
+    """
+    Get check configurations for multiple resources by resource type and id.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/pipelines/checks/queryconfigurations", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
 
-response = execute_request("POST", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/pipelines/checks/queryconfigurations", API_VERSION, project=project)
+    response = client.request("POST", url)
+    data = loads(response.content)
+    return data
+
+
+async def query_check_configurations_async(client, project: str) -> dict:
+    """Async variant of query_check_configurations() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/pipelines/checks/queryconfigurations", API_VERSION, project=project)
+    response = await client.request("POST", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call query_check_configurations() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+
+    parser = argparse.ArgumentParser(description="Get check configurations for multiple resources by resource type and id.")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("query_check_configurations", pat)
+    logger.info("Get check configurations for multiple resources by resource type and id.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        items = items_of(query_check_configurations(client, project), "value")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    data = query_check_configurations(client, project)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
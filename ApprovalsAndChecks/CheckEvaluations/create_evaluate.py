@@ -11,69 +11,90 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/approvals-and-chec
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Initiate an evaluation for a check in a pipeline")
-parser.add_argument("--context", required=False, help="context")
-parser.add_argument("--id", required=False, help="id")
-parser.add_argument("--resources", required=False, help="resources")
-args = parser.parse_args()
+def create_evaluate(client, project: str, *, context: Optional[str] = None, id: Optional[str] = None, resources: Optional[str] = None) -> dict:
+    """
+    Initiate an evaluation for a check in a pipeline
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        context: context
+        id: id
+        resources: resources
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "context": context,
+        "id": id,
+        "resources": resources,
+    }
+    url = build_url(client.organization, f"_apis/pipelines/checks/runs", API_VERSION, project=project)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['checkRuns', 'completedDate'], API_VERSION)
+    return data
+
+
+async def create_evaluate_async(client, project: str, *, context: Optional[str] = None, id: Optional[str] = None, resources: Optional[str] = None) -> dict:
+    """Async variant of create_evaluate() for use with AsyncAdoClient."""
+    body = {
+        "context": context,
+        "id": id,
+        "resources": resources,
+    }
+    url = build_url(client.organization, f"_apis/pipelines/checks/runs", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['checkRuns', 'completedDate'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_evaluate", PAT)
-logger.info("Initiate an evaluation for a check in a pipeline")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "context": args.context,
-    "id": args.id,
-    "resources": args.resources,
-}
+def main() -> None:
+    """Read env vars / flags, call create_evaluate() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/pipelines/checks/runs", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Initiate an evaluation for a check in a pipeline")
+    parser.add_argument("--context", required=False, help="context")
+    parser.add_argument("--id", required=False, help="id")
+    parser.add_argument("--resources", required=False, help="resources")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_evaluate", pat)
+    logger.info("Initiate an evaluation for a check in a pipeline")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_evaluate(client, project, context=args.context, id=args.id, resources=args.resources)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['checkRuns', 'completedDate'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
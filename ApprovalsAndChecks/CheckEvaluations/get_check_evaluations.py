@@ -10,52 +10,72 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/approvals-and-checks/check-evaluations/get?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-CHECK_SUITE_ID = get_env_or_exit("CHECK_SUITE_ID", "checkSuiteId")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_check_evaluations", PAT)
-logger.info("Get details for a specific check evaluation")
+def get_check_evaluations(client, project: str, check_suite_id: str) -> dict:
+    """
+    Get details for a specific check evaluation
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/pipelines/checks/runs/{CHECK_SUITE_ID}", API_VERSION, project=PROJECT_ID)
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        check_suite_id: checkSuiteId
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/pipelines/checks/runs/{check_suite_id}", API_VERSION, project=project)
+    response = client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['checkRuns', 'completedDate'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['checkRuns', 'completedDate'], API_VERSION)
+async def get_check_evaluations_async(client, project: str, check_suite_id: str) -> dict:
+    """Async variant of get_check_evaluations() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/pipelines/checks/runs/{check_suite_id}", API_VERSION, project=project)
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['checkRuns', 'completedDate'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_check_evaluations() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    check_suite_id = require_env("CHECK_SUITE_ID", "checkSuiteId")
+
+    logger = AdoLogger("get_check_evaluations", pat)
+    logger.info("Get details for a specific check evaluation")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = get_check_evaluations(client, project, check_suite_id)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
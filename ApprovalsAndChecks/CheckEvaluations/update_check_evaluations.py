@@ -11,68 +11,88 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/approvals-and-chec
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-CHECK_SUITE_ID = get_env_or_exit("CHECK_SUITE_ID", "checkSuiteId")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Update a check run of a check suite Following update actions are supported: * rerun - allows to rerun an already comp...")
-parser.add_argument("--action", required=False, help="Action that has to be taken for the specified check.")
-parser.add_argument("--check-id", required=False, help="Check id of the check run to be updated.")
-args = parser.parse_args()
+def update_check_evaluations(client, project: str, check_suite_id: str, *, action: Optional[str] = None, check_id: Optional[str] = None) -> dict:
+    """
+    Update a check run of a check suite Following update actions are supported: * rerun - allows to rerun an already comp...
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        check_suite_id: checkSuiteId
+        action: Action that has to be taken for the specified check.
+        check_id: Check id of the check run to be updated.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "action": action,
+        "checkId": check_id,
+    }
+    url = build_url(client.organization, f"_apis/pipelines/checks/runs/{check_suite_id}", API_VERSION, project=project)
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['checkRuns', 'completedDate'], API_VERSION)
+    return data
+
+
+async def update_check_evaluations_async(client, project: str, check_suite_id: str, *, action: Optional[str] = None, check_id: Optional[str] = None) -> dict:
+    """Async variant of update_check_evaluations() for use with AsyncAdoClient."""
+    body = {
+        "action": action,
+        "checkId": check_id,
+    }
+    url = build_url(client.organization, f"_apis/pipelines/checks/runs/{check_suite_id}", API_VERSION, project=project)
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['checkRuns', 'completedDate'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_check_evaluations", PAT)
-logger.info("Update a check run of a check suite Following update actions are supported: * rerun - allows to rerun an already comp...")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "action": args.action,
-    "checkId": args.check_id,
-}
+def main() -> None:
+    """Read env vars / flags, call update_check_evaluations() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    check_suite_id = require_env("CHECK_SUITE_ID", "checkSuiteId")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/pipelines/checks/runs/{CHECK_SUITE_ID}", API_VERSION, project=PROJECT_ID)
-logger.info(f"PATCH {url}")
+    parser = argparse.ArgumentParser(description="Update a check run of a check suite Following update actions are supported: * rerun - allows to rerun an already comp...")
+    parser.add_argument("--action", required=False, help="Action that has to be taken for the specified check.")
+    parser.add_argument("--check-id", required=False, help="Check id of the check run to be updated.")
+    args = parser.parse_args()
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+    logger = AdoLogger("update_check_evaluations", pat)
+    logger.info("Update a check run of a check suite Following update actions are supported: * rerun - allows to rerun an already comp...")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_check_evaluations(client, project, check_suite_id, action=args.action, check_id=args.check_id)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['checkRuns', 'completedDate'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
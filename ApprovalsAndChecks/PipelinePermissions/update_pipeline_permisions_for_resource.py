@@ -11,71 +11,94 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/approvals-and-chec
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-RESOURCE_TYPE = get_env_or_exit("RESOURCE_TYPE", "resourceType")
-RESOURCE_ID = get_env_or_exit("RESOURCE_ID", "resourceId")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Authorizes/Unauthorizes a list of definitions for a given resource.")
-parser.add_argument("--all-pipelines", required=False, help="allPipelines")
-parser.add_argument("--pipelines", required=False, help="pipelines")
-parser.add_argument("--resource", required=False, help="resource")
-args = parser.parse_args()
+def update_pipeline_permisions_for_resource(client, project: str, resource_type: str, resource_id: str, *, all_pipelines: Optional[str] = None, pipelines: Optional[str] = None, resource: Optional[str] = None) -> dict:
+    """
+    Authorizes/Unauthorizes a list of definitions for a given resource.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        resource_type: resourceType
+        resource_id: resourceId
+        all_pipelines: allPipelines
+        pipelines: pipelines
+        resource: resource
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "allPipelines": all_pipelines,
+        "pipelines": pipelines,
+        "resource": resource,
+    }
+    url = build_url(client.organization, f"_apis/pipelines/pipelinepermissions/{resource_type}/{resource_id}", API_VERSION, project=project)
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['allPipelines', 'pipelines'], API_VERSION)
+    return data
+
+
+async def update_pipeline_permisions_for_resource_async(client, project: str, resource_type: str, resource_id: str, *, all_pipelines: Optional[str] = None, pipelines: Optional[str] = None, resource: Optional[str] = None) -> dict:
+    """Async variant of update_pipeline_permisions_for_resource() for use with AsyncAdoClient."""
+    body = {
+        "allPipelines": all_pipelines,
+        "pipelines": pipelines,
+        "resource": resource,
+    }
+    url = build_url(client.organization, f"_apis/pipelines/pipelinepermissions/{resource_type}/{resource_id}", API_VERSION, project=project)
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['allPipelines', 'pipelines'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_pipeline_permisions_for_resource", PAT)
-logger.info("Authorizes/Unauthorizes a list of definitions for a given resource.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "allPipelines": args.all_pipelines,
-    "pipelines": args.pipelines,
-    "resource": args.resource,
-}
+def main() -> None:
+    """Read env vars / flags, call update_pipeline_permisions_for_resource() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    resource_type = require_env("RESOURCE_TYPE", "resourceType")
+    resource_id = require_env("RESOURCE_ID", "resourceId")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/pipelines/pipelinepermissions/{RESOURCE_TYPE}/{RESOURCE_ID}", API_VERSION, project=PROJECT_ID)
-logger.info(f"PATCH {url}")
+    parser = argparse.ArgumentParser(description="Authorizes/Unauthorizes a list of definitions for a given resource.")
+    parser.add_argument("--all-pipelines", required=False, help="allPipelines")
+    parser.add_argument("--pipelines", required=False, help="pipelines")
+    parser.add_argument("--resource", required=False, help="resource")
+    args = parser.parse_args()
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+    logger = AdoLogger("update_pipeline_permisions_for_resource", pat)
+    logger.info("Authorizes/Unauthorizes a list of definitions for a given resource.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_pipeline_permisions_for_resource(client, project, resource_type, resource_id, all_pipelines=args.all_pipelines, pipelines=args.pipelines, resource=args.resource)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['allPipelines', 'pipelines'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,48 +10,78 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/artifacts/artifact--details/get-badge?view=azure-devops-rest-7.2
 """
 
-import json
+import argparse
 import os
 import sys
+from typing import BinaryIO, Union
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.async_http_client import astream_to
+from _shared.http_client import AdoClient, build_url, stream_to
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-FEED_ID = get_env_or_exit("FEED_ID", "Name or Id of the feed.")
-PACKAGE_ID = get_env_or_exit("PACKAGE_ID", "Id of the package (GUID Id, not name).")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_badge", PAT)
-logger.info("Generate a SVG badge for the latest version of a package.")
+def get_badge(client, project: str, feed_id: str, package_id: str, *, destination: Union[str, BinaryIO]) -> int:
+    """
+    Generate a SVG badge for the latest version of a package.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        feed_id: Name or Id of the feed.
+        package_id: Id of the package (GUID Id, not name).
+        destination: Output path or binary file (e.g. sys.stdout.buffer).
+
+    Returns:
+        Bytes written; the image/svg+xml body is streamed in constant memory.
+    """
+    url = build_url(client.organization, f"_apis/public/packaging/Feeds/{feed_id}/Packages/{package_id}/badge", API_VERSION, project=project, base_host="feeds.dev.azure.com")
+    response = client.request("GET", url, stream=True, accept="image/svg+xml")
+    return stream_to(response, destination)
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/public/packaging/Feeds/{FEED_ID}/Packages/{PACKAGE_ID}/badge", API_VERSION, project=PROJECT_ID, base_host="feeds.dev.azure.com")
-logger.info(f"GET {url}")
 
-response = execute_request("GET", url, HEADERS)
+async def get_badge_async(client, project: str, feed_id: str, package_id: str, *, destination: Union[str, BinaryIO]) -> int:
+    """Async variant of get_badge() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/public/packaging/Feeds/{feed_id}/Packages/{package_id}/badge", API_VERSION, project=project, base_host="feeds.dev.azure.com")
+    response = await client.request("GET", url, stream=True, accept="image/svg+xml")
+    return await astream_to(response, destination)
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_badge() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    feed_id = require_env("FEED_ID", "Name or Id of the feed.")
+    package_id = require_env("PACKAGE_ID", "Id of the package (GUID Id, not name).")
+
+    parser = argparse.ArgumentParser(description="Generate a SVG badge for the latest version of a package.")
+    parser.add_argument("--output", help="Write the content to this file (default: stdout)")
+    args = parser.parse_args()
+
+    logger = AdoLogger("get_badge", pat)
+    logger.info("Generate a SVG badge for the latest version of a package.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    written = get_badge(client, project, feed_id, package_id, destination=args.output or sys.stdout.buffer)
+    logger.info(f"Downloaded {written} bytes")
+    if args.output:
+        print(f"Saved {written} bytes to {args.output}")
+
+
+if __name__ == "__main__":
+    run_cli(main)
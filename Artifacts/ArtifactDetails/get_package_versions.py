@@ -10,48 +10,84 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/artifacts/artifact--details/get-package-versions?view=azure-devops-rest-7.2
 """
 
-import json
+import argparse
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-FEED_ID = get_env_or_exit("FEED_ID", "Name or Id of the feed.")
-PACKAGE_ID = get_env_or_exit("PACKAGE_ID", "Id of the package (GUID Id, not name).")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_package_versions", PAT)
-logger.info("Get a list of package versions, optionally filtering by state.")
+def get_package_versions(client, project: str, feed_id: str, package_id: str) -> dict:
+    """
+    Get a list of package versions, optionally filtering by state.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/packaging/Feeds/{FEED_ID}/Packages/{PACKAGE_ID}/versions", API_VERSION, project=PROJECT_ID, base_host="feeds.dev.azure.com")
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        feed_id: Name or Id of the feed.
+        package_id: Id of the package (GUID Id, not name).
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/packaging/Feeds/{feed_id}/Packages/{package_id}/versions", API_VERSION, project=project, base_host="feeds.dev.azure.com")
+    response = client.request("GET", url)
+    data = loads(response.content)
+    return data
+
+
+async def get_package_versions_async(client, project: str, feed_id: str, package_id: str) -> dict:
+    """Async variant of get_package_versions() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/packaging/Feeds/{feed_id}/Packages/{package_id}/versions", API_VERSION, project=project, base_host="feeds.dev.azure.com")
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_package_versions() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    feed_id = require_env("FEED_ID", "Name or Id of the feed.")
+    package_id = require_env("PACKAGE_ID", "Id of the package (GUID Id, not name).")
+
+    parser = argparse.ArgumentParser(description="Get a list of package versions, optionally filtering by state.")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("get_package_versions", pat)
+    logger.info("Get a list of package versions, optionally filtering by state.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        items = items_of(get_package_versions(client, project, feed_id, package_id), "value")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    data = get_package_versions(client, project, feed_id, package_id)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
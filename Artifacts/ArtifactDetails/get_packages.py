@@ -10,47 +10,106 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/artifacts/artifact--details/get-packages?view=azure-devops-rest-7.2
 """
 
-import json
+import argparse
 import os
 import sys
+from typing import Iterator, Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
+from _shared.pagination import paginate
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-FEED_ID = get_env_or_exit("FEED_ID", "Name or Id of the feed.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_packages", PAT)
-logger.info("Get details about all of the packages in the feed.")
+def get_packages(client, project: str, feed_id: str) -> dict:
+    """
+    Get details about all of the packages in the feed.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/packaging/Feeds/{FEED_ID}/packages", API_VERSION, project=PROJECT_ID, base_host="feeds.dev.azure.com")
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        feed_id: Name or Id of the feed.
+
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/packaging/Feeds/{feed_id}/packages", API_VERSION, project=project, base_host="feeds.dev.azure.com")
+    response = client.request("GET", url)
+    data = loads(response.content)
+    return data
+
+
+async def get_packages_async(client, project: str, feed_id: str) -> dict:
+    """Async variant of get_packages() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/packaging/Feeds/{feed_id}/packages", API_VERSION, project=project, base_host="feeds.dev.azure.com")
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    return data
+
+
+def iter_get_packages(client, project: str, feed_id: str, *, max_items: Optional[int] = None, prefetch: bool = False) -> Iterator[dict]:
+    """
+    Yield every item across all pages of get_packages() (top_skip paging).
 
-response = execute_request("GET", url, HEADERS)
+    Takes the same arguments, plus:
+        max_items: Stop after this many items (default: all).
+        prefetch: Fetch the next page while the current one is consumed.
+    """
+    url = build_url(client.organization, f"_apis/packaging/Feeds/{feed_id}/packages", API_VERSION, project=project, base_host="feeds.dev.azure.com")
+    return paginate(client, "GET", url, "top_skip",
+                    max_items=max_items, prefetch=prefetch)
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_packages() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    feed_id = require_env("FEED_ID", "Name or Id of the feed.")
+
+    parser = argparse.ArgumentParser(description="Get details about all of the packages in the feed.")
+    parser.add_argument("--all-pages", action="store_true", help="Follow pagination and return every item")
+    parser.add_argument("--max-items", type=int, help="Follow pagination up to this many items")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("get_packages", pat)
+    logger.info("Get details about all of the packages in the feed.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        if args.all_pages or args.max_items:
+            items = iter_get_packages(client, project, feed_id, max_items=args.max_items, prefetch=True)
+        else:
+            items = items_of(get_packages(client, project, feed_id), "value")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    if args.all_pages or args.max_items:
+        items = list(iter_get_packages(client, project, feed_id, max_items=args.max_items, prefetch=True))
+        data = {"count": len(items), "value": items}
+    else:
+        data = get_packages(client, project, feed_id)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,61 +11,90 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/artifacts/artifact
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-FEED_ID = get_env_or_exit("FEED_ID", "feedId")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Query Package Metrics for Artifact Details")
-parser.add_argument("--package-ids", required=False, help="List of package ids")
-args = parser.parse_args()
+def query_package_metrics(client, project: str, feed_id: str, *, package_ids: Optional[str] = None) -> dict:
+    """
+    Query Package Metrics for Artifact Details
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("query_package_metrics", PAT)
-logger.info("Query Package Metrics for Artifact Details")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        feed_id: feedId
+        package_ids: List of package ids
 
-# ---------------------------------------------------------------------------
-# Request body
-# ---------------------------------------------------------------------------
-body = {
-    "packageIds": args.package_ids,
-}
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "packageIds": package_ids,
+    }
+    url = build_url(client.organization, f"_apis/packaging/Feeds/{feed_id}/packagemetricsbatch", API_VERSION, project=project, base_host="feeds.dev.azure.com")
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/packaging/Feeds/{FEED_ID}/packagemetricsbatch", API_VERSION, project=PROJECT_ID, base_host="feeds.dev.azure.com")
-logger.info(f"POST {url}")
 
-response = execute_request("POST", url, HEADERS, body=body)
+async def query_package_metrics_async(client, project: str, feed_id: str, *, package_ids: Optional[str] = None) -> dict:
+    """Async variant of query_package_metrics() for use with AsyncAdoClient."""
+    body = {
+        "packageIds": package_ids,
+    }
+    url = build_url(client.organization, f"_apis/packaging/Feeds/{feed_id}/packagemetricsbatch", API_VERSION, project=project, base_host="feeds.dev.azure.com")
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call query_package_metrics() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    feed_id = require_env("FEED_ID", "feedId")
+
+    parser = argparse.ArgumentParser(description="Query Package Metrics for Artifact Details")
+    parser.add_argument("--package-ids", required=False, help="List of package ids")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("query_package_metrics", pat)
+    logger.info("Query Package Metrics for Artifact Details")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        items = items_of(query_package_metrics(client, project, feed_id, package_ids=args.package_ids), "value")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    data = query_package_metrics(client, project, feed_id, package_ids=args.package_ids)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,53 +10,107 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/artifacts/change--tracking/get-feed-changes?view=azure-devops-rest-7.2
 """
 
-import json
+import argparse
 import os
 import sys
+from typing import Iterator, Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
+from _shared.pagination import paginate
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_feed_changes", PAT)
-logger.info("Query to determine which feeds have changed since the last call, tracked through the provided continuationToken.")
+def get_feed_changes(client, project: str) -> dict:
+    """
+    Query to determine which feeds have changed since the last call, tracked through the provided continuationToken.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/packaging/feedchanges", API_VERSION, project=PROJECT_ID, base_host="feeds.dev.azure.com")
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/packaging/feedchanges", API_VERSION, project=project, base_host="feeds.dev.azure.com")
+    response = client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['count', 'feedChanges'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['count', 'feedChanges'], API_VERSION)
+async def get_feed_changes_async(client, project: str) -> dict:
+    """Async variant of get_feed_changes() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/packaging/feedchanges", API_VERSION, project=project, base_host="feeds.dev.azure.com")
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['count', 'feedChanges'], API_VERSION)
+    return data
+
+
+def iter_get_feed_changes(client, project: str, *, max_items: Optional[int] = None, prefetch: bool = False) -> Iterator[dict]:
+    """
+    Yield every item across all pages of get_feed_changes() (continuation paging).
+
+    Takes the same arguments, plus:
+        max_items: Stop after this many items (default: all).
+        prefetch: Fetch the next page while the current one is consumed.
+    """
+    url = build_url(client.organization, f"_apis/packaging/feedchanges", API_VERSION, project=project, base_host="feeds.dev.azure.com")
+    return paginate(client, "GET", url, "continuation", list_key="feedChanges",
+                    max_items=max_items, prefetch=prefetch)
 
-logger.info(f"Retrieved {data.get('count', '?')} items")
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_feed_changes() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+
+    parser = argparse.ArgumentParser(description="Query to determine which feeds have changed since the last call, tracked through the provided continuationToken.")
+    parser.add_argument("--all-pages", action="store_true", help="Follow pagination and return every item")
+    parser.add_argument("--max-items", type=int, help="Follow pagination up to this many items")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("get_feed_changes", pat)
+    logger.info("Query to determine which feeds have changed since the last call, tracked through the provided continuationToken.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        if args.all_pages or args.max_items:
+            items = iter_get_feed_changes(client, project, max_items=args.max_items, prefetch=True)
+        else:
+            items = items_of(get_feed_changes(client, project), "feedChanges")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    if args.all_pages or args.max_items:
+        items = list(iter_get_feed_changes(client, project, max_items=args.max_items, prefetch=True))
+        data = {"count": len(items), "feedChanges": items}
+    else:
+        data = get_feed_changes(client, project)
+    logger.info(f"Retrieved {data.get('count', '?')} items")
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,73 +11,98 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/artifacts/feed--ma
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Create a feed, a container for various package types.")
-parser.add_argument("--badges-enabled", required=False, help="If set, this feed supports generation of package badges.")
-parser.add_argument("--default-view-id", required=False, help="The view that the feed administrator has indicated is the default experience for readers.")
-parser.add_argument("--deleted-date", required=False, help="The date that this feed was deleted.")
-parser.add_argument("--description", required=False, help="A description for the feed. Descriptions must not exceed 255 characters.")
-parser.add_argument("--hide-deleted-package-versions", required=False, help="If set, the feed will hide all deleted/unpublished versions")
-args = parser.parse_args()
+def create_feed(client, project: str, *, badges_enabled: Optional[str] = None, default_view_id: Optional[str] = None, deleted_date: Optional[str] = None, description: Optional[str] = None, hide_deleted_package_versions: Optional[str] = None) -> dict:
+    """
+    Create a feed, a container for various package types.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        badges_enabled: If set, this feed supports generation of package badges.
+        default_view_id: The view that the feed administrator has indicated is the default experience for readers.
+        deleted_date: The date that this feed was deleted.
+        description: A description for the feed. Descriptions must not exceed 255 characters.
+        hide_deleted_package_versions: If set, the feed will hide all deleted/unpublished versions
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "badgesEnabled": badges_enabled,
+        "defaultViewId": default_view_id,
+        "deletedDate": deleted_date,
+        "description": description,
+        "hideDeletedPackageVersions": hide_deleted_package_versions,
+    }
+    url = build_url(client.organization, f"_apis/packaging/feeds", API_VERSION, project=project, base_host="feeds.dev.azure.com")
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['badgesEnabled', 'defaultViewId'], API_VERSION)
+    return data
+
+
+async def create_feed_async(client, project: str, *, badges_enabled: Optional[str] = None, default_view_id: Optional[str] = None, deleted_date: Optional[str] = None, description: Optional[str] = None, hide_deleted_package_versions: Optional[str] = None) -> dict:
+    """Async variant of create_feed() for use with AsyncAdoClient."""
+    body = {
+        "badgesEnabled": badges_enabled,
+        "defaultViewId": default_view_id,
+        "deletedDate": deleted_date,
+        "description": description,
+        "hideDeletedPackageVersions": hide_deleted_package_versions,
+    }
+    url = build_url(client.organization, f"_apis/packaging/feeds", API_VERSION, project=project, base_host="feeds.dev.azure.com")
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['badgesEnabled', 'defaultViewId'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_feed", PAT)
-logger.info("Create a feed, a container for various package types.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "badgesEnabled": args.badges_enabled,
-    "defaultViewId": args.default_view_id,
-    "deletedDate": args.deleted_date,
-    "description": args.description,
-    "hideDeletedPackageVersions": args.hide_deleted_package_versions,
-}
+def main() -> None:
+    """Read env vars / flags, call create_feed() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/packaging/feeds", API_VERSION, project=PROJECT_ID, base_host="feeds.dev.azure.com")
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Create a feed, a container for various package types.")
+    parser.add_argument("--badges-enabled", required=False, help="If set, this feed supports generation of package badges.")
+    parser.add_argument("--default-view-id", required=False, help="The view that the feed administrator has indicated is the default experience for readers.")
+    parser.add_argument("--deleted-date", required=False, help="The date that this feed was deleted.")
+    parser.add_argument("--description", required=False, help="A description for the feed. Descriptions must not exceed 255 characters.")
+    parser.add_argument("--hide-deleted-package-versions", required=False, help="If set, the feed will hide all deleted/unpublished versions")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_feed", pat)
+    logger.info("Create a feed, a container for various package types.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_feed(client, project, badges_enabled=args.badges_enabled, default_view_id=args.default_view_id, deleted_date=args.deleted_date, description=args.description, hide_deleted_package_versions=args.hide_deleted_package_versions)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['badgesEnabled', 'defaultViewId'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
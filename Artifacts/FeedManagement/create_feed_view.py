@@ -11,75 +11,101 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/artifacts/feed--ma
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-FEED_ID = get_env_or_exit("FEED_ID", "Name or Id of the feed.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Create a new view on the referenced feed.")
-parser.add_argument("--id", required=False, help="Id of the view.")
-parser.add_argument("--name", required=False, help="Name of the view.")
-parser.add_argument("--type", required=False, help="Type of view.")
-parser.add_argument("--url", required=False, help="Url of the view.")
-parser.add_argument("--visibility", required=False, help="Visibility status of the view.")
-args = parser.parse_args()
+def create_feed_view(client, project: str, feed_id: str, *, id: Optional[str] = None, name: Optional[str] = None, type: Optional[str] = None, url_value: Optional[str] = None, visibility: Optional[str] = None) -> dict:
+    """
+    Create a new view on the referenced feed.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        feed_id: Name or Id of the feed.
+        id: Id of the view.
+        name: Name of the view.
+        type: Type of view.
+        url_value: Url of the view.
+        visibility: Visibility status of the view.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "id": id,
+        "name": name,
+        "type": type,
+        "url": url_value,
+        "visibility": visibility,
+    }
+    url = build_url(client.organization, f"_apis/packaging/Feeds/{feed_id}/views", API_VERSION, project=project, base_host="feeds.dev.azure.com")
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name'], API_VERSION)
+    return data
+
+
+async def create_feed_view_async(client, project: str, feed_id: str, *, id: Optional[str] = None, name: Optional[str] = None, type: Optional[str] = None, url_value: Optional[str] = None, visibility: Optional[str] = None) -> dict:
+    """Async variant of create_feed_view() for use with AsyncAdoClient."""
+    body = {
+        "id": id,
+        "name": name,
+        "type": type,
+        "url": url_value,
+        "visibility": visibility,
+    }
+    url = build_url(client.organization, f"_apis/packaging/Feeds/{feed_id}/views", API_VERSION, project=project, base_host="feeds.dev.azure.com")
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_feed_view", PAT)
-logger.info("Create a new view on the referenced feed.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "id": args.id,
-    "name": args.name,
-    "type": args.type,
-    "url": args.url,
-    "visibility": args.visibility,
-}
+def main() -> None:
+    """Read env vars / flags, call create_feed_view() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    feed_id = require_env("FEED_ID", "Name or Id of the feed.")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/packaging/Feeds/{FEED_ID}/views", API_VERSION, project=PROJECT_ID, base_host="feeds.dev.azure.com")
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Create a new view on the referenced feed.")
+    parser.add_argument("--id", required=False, help="Id of the view.")
+    parser.add_argument("--name", required=False, help="Name of the view.")
+    parser.add_argument("--type", required=False, help="Type of view.")
+    parser.add_argument("--url", required=False, help="Url of the view.")
+    parser.add_argument("--visibility", required=False, help="Visibility status of the view.")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_feed_view", pat)
+    logger.info("Create a new view on the referenced feed.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_feed_view(client, project, feed_id, id=args.id, name=args.name, type=args.type, url_value=args.url, visibility=args.visibility)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'name'], API_VERSION)
+    print(f"Feed  Management: {data.get('name', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Feed  Management: {data.get("name", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,76 +11,104 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/artifacts/feed--ma
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-FEED_ID = get_env_or_exit("FEED_ID", "Name or Id of the feed.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Change the attributes of a feed.")
-parser.add_argument("--allow-upstream-name-conflict", required=False, help="If set, the feed will allow upload of packages that exist on the upstream")
-parser.add_argument("--badges-enabled", required=False, help="If set, this feed supports generation of package badges.")
-parser.add_argument("--default-view-id", required=False, help="The view that the feed administrator has indicated is the default experience for readers.")
-parser.add_argument("--description", required=False, help="A description for the feed. Descriptions must not exceed 255 characters.")
-parser.add_argument("--hide-deleted-package-versions", required=False, help="If set, feed will hide all deleted/unpublished versions")
-parser.add_argument("--id", required=False, help="A GUID that uniquely identifies this feed.")
-args = parser.parse_args()
+def update_feed(client, project: str, feed_id: str, *, allow_upstream_name_conflict: Optional[str] = None, badges_enabled: Optional[str] = None, default_view_id: Optional[str] = None, description: Optional[str] = None, hide_deleted_package_versions: Optional[str] = None, id: Optional[str] = None) -> dict:
+    """
+    Change the attributes of a feed.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        feed_id: Name or Id of the feed.
+        allow_upstream_name_conflict: If set, the feed will allow upload of packages that exist on the upstream
+        badges_enabled: If set, this feed supports generation of package badges.
+        default_view_id: The view that the feed administrator has indicated is the default experience for readers.
+        description: A description for the feed. Descriptions must not exceed 255 characters.
+        hide_deleted_package_versions: If set, feed will hide all deleted/unpublished versions
+        id: A GUID that uniquely identifies this feed.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "allowUpstreamNameConflict": allow_upstream_name_conflict,
+        "badgesEnabled": badges_enabled,
+        "defaultViewId": default_view_id,
+        "description": description,
+        "hideDeletedPackageVersions": hide_deleted_package_versions,
+        "id": id,
+    }
+    url = build_url(client.organization, f"_apis/packaging/feeds/{feed_id}", API_VERSION, project=project, base_host="feeds.dev.azure.com")
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['badgesEnabled', 'defaultViewId'], API_VERSION)
+    return data
+
+
+async def update_feed_async(client, project: str, feed_id: str, *, allow_upstream_name_conflict: Optional[str] = None, badges_enabled: Optional[str] = None, default_view_id: Optional[str] = None, description: Optional[str] = None, hide_deleted_package_versions: Optional[str] = None, id: Optional[str] = None) -> dict:
+    """Async variant of update_feed() for use with AsyncAdoClient."""
+    body = {
+        "allowUpstreamNameConflict": allow_upstream_name_conflict,
+        "badgesEnabled": badges_enabled,
+        "defaultViewId": default_view_id,
+        "description": description,
+        "hideDeletedPackageVersions": hide_deleted_package_versions,
+        "id": id,
+    }
+    url = build_url(client.organization, f"_apis/packaging/feeds/{feed_id}", API_VERSION, project=project, base_host="feeds.dev.azure.com")
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['badgesEnabled', 'defaultViewId'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_feed", PAT)
-logger.info("Change the attributes of a feed.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "allowUpstreamNameConflict": args.allow_upstream_name_conflict,
-    "badgesEnabled": args.badges_enabled,
-    "defaultViewId": args.default_view_id,
-    "description": args.description,
-    "hideDeletedPackageVersions": args.hide_deleted_package_versions,
-    "id": args.id,
-}
+def main() -> None:
+    """Read env vars / flags, call update_feed() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    feed_id = require_env("FEED_ID", "Name or Id of the feed.")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/packaging/feeds/{FEED_ID}", API_VERSION, project=PROJECT_ID, base_host="feeds.dev.azure.com")
-logger.info(f"PATCH {url}")
+    parser = argparse.ArgumentParser(description="Change the attributes of a feed.")
+    parser.add_argument("--allow-upstream-name-conflict", required=False, help="If set, the feed will allow upload of packages that exist on the upstream")
+    parser.add_argument("--badges-enabled", required=False, help="If set, this feed supports generation of package badges.")
+    parser.add_argument("--default-view-id", required=False, help="The view that the feed administrator has indicated is the default experience for readers.")
+    parser.add_argument("--description", required=False, help="A description for the feed. Descriptions must not exceed 255 characters.")
+    parser.add_argument("--hide-deleted-package-versions", required=False, help="If set, feed will hide all deleted/unpublished versions")
+    parser.add_argument("--id", required=False, help="A GUID that uniquely identifies this feed.")
+    args = parser.parse_args()
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+    logger = AdoLogger("update_feed", pat)
+    logger.info("Change the attributes of a feed.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_feed(client, project, feed_id, allow_upstream_name_conflict=args.allow_upstream_name_conflict, badges_enabled=args.badges_enabled, default_view_id=args.default_view_id, description=args.description, hide_deleted_package_versions=args.hide_deleted_package_versions, id=args.id)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['badgesEnabled', 'defaultViewId'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,70 +11,92 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/artifacts/provenan
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-PROTOCOL = get_env_or_exit("PROTOCOL", "The protocol that the session will target")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Creates a session, a wrapper around a feed that can store additional metadata on the packages published to it.")
-parser.add_argument("--data", required=False, help="Generic property bag to store data about the session")
-parser.add_argument("--feed", required=False, help="The feed name or id for the session")
-parser.add_argument("--source", required=False, help="The type of session If a known value is provided, the Data dictionary will be validated for the p...")
-args = parser.parse_args()
+def create_session(client, project: str, protocol: str, *, data_value: Optional[str] = None, feed: Optional[str] = None, source: Optional[str] = None) -> dict:
+    """
+    Creates a session, a wrapper around a feed that can store additional metadata on the packages published to it.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        protocol: The protocol that the session will target
+        data_value: Generic property bag to store data about the session
+        feed: The feed name or id for the session
+        source: The type of session If a known value is provided, the Data dictionary will be validated for the p...
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "data": data_value,
+        "feed": feed,
+        "source": source,
+    }
+    url = build_url(client.organization, f"_apis/provenance/session/{protocol}", API_VERSION, project=project, base_host="pkgs.dev.azure.com")
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['sessionId', 'sessionName'], API_VERSION)
+    return data
+
+
+async def create_session_async(client, project: str, protocol: str, *, data_value: Optional[str] = None, feed: Optional[str] = None, source: Optional[str] = None) -> dict:
+    """Async variant of create_session() for use with AsyncAdoClient."""
+    body = {
+        "data": data_value,
+        "feed": feed,
+        "source": source,
+    }
+    url = build_url(client.organization, f"_apis/provenance/session/{protocol}", API_VERSION, project=project, base_host="pkgs.dev.azure.com")
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['sessionId', 'sessionName'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_session", PAT)
-logger.info("Creates a session, a wrapper around a feed that can store additional metadata on the packages published to it.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "data": args.data,
-    "feed": args.feed,
-    "source": args.source,
-}
+def main() -> None:
+    """Read env vars / flags, call create_session() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    protocol = require_env("PROTOCOL", "The protocol that the session will target")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/provenance/session/{PROTOCOL}", API_VERSION, project=PROJECT_ID, base_host="pkgs.dev.azure.com")
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Creates a session, a wrapper around a feed that can store additional metadata on the packages published to it.")
+    parser.add_argument("--data", required=False, help="Generic property bag to store data about the session")
+    parser.add_argument("--feed", required=False, help="The feed name or id for the session")
+    parser.add_argument("--source", required=False, help="The type of session If a known value is provided, the Data dictionary will be validated for the p...")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_session", pat)
+    logger.info("Creates a session, a wrapper around a feed that can store additional metadata on the packages published to it.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_session(client, project, protocol, data_value=args.data, feed=args.feed, source=args.source)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['sessionId', 'sessionName'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
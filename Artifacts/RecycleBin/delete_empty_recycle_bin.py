@@ -10,53 +10,73 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/artifacts/recycle--bin/empty-recycle-bin?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-FEED_ID = get_env_or_exit("FEED_ID", "Name or Id of the feed")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("delete_empty_recycle_bin", PAT)
-logger.info("Queues a job to remove all package versions from a feed's recycle bin")
+def delete_empty_recycle_bin(client, project: str, feed_id: str) -> dict:
+    """
+    Queues a job to remove all package versions from a feed's recycle bin
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/packaging/Feeds/{FEED_ID}/RecycleBin/Packages", API_VERSION, project=PROJECT_ID, base_host="feeds.dev.azure.com")
-logger.info(f"DELETE {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        feed_id: Name or Id of the feed
 
-response = execute_request("DELETE", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/packaging/Feeds/{feed_id}/RecycleBin/Packages", API_VERSION, project=project, base_host="feeds.dev.azure.com")
+    response = client.request("DELETE", url)
+    data = loads(response.content)
+    version_guard(data, ['id', 'pluginId'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'pluginId'], API_VERSION)
+async def delete_empty_recycle_bin_async(client, project: str, feed_id: str) -> dict:
+    """Async variant of delete_empty_recycle_bin() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/packaging/Feeds/{feed_id}/RecycleBin/Packages", API_VERSION, project=project, base_host="feeds.dev.azure.com")
+    response = await client.request("DELETE", url)
+    data = loads(response.content)
+    version_guard(data, ['id', 'pluginId'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(f"Recycle  Bin ID: {data.get("id", "N/A")}")
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call delete_empty_recycle_bin() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    feed_id = require_env("FEED_ID", "Name or Id of the feed")
+
+    logger = AdoLogger("delete_empty_recycle_bin", pat)
+    logger.info("Queues a job to remove all package versions from a feed's recycle bin")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = delete_empty_recycle_bin(client, project, feed_id)
+
+    print(f"Recycle  Bin ID: {data.get('id', 'N/A')}")
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,70 +11,92 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/artifacts/retentio
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-FEED_ID = get_env_or_exit("FEED_ID", "Name or ID of the feed.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Set the retention policy for a feed.")
-parser.add_argument("--age-limit-in-days", required=False, help="This attribute is deprecated and is not honoured by retention")
-parser.add_argument("--count-limit", required=False, help="Maximum versions to preserve per package and package type.")
-parser.add_argument("--days-to-keep-recently-downloaded-packages", required=False, help="Number of days to preserve a package version after its latest download.")
-args = parser.parse_args()
+def set_retention_policy(client, project: str, feed_id: str, *, age_limit_in_days: Optional[str] = None, count_limit: Optional[str] = None, days_to_keep_recently_downloaded_packages: Optional[str] = None) -> dict:
+    """
+    Set the retention policy for a feed.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        feed_id: Name or ID of the feed.
+        age_limit_in_days: This attribute is deprecated and is not honoured by retention
+        count_limit: Maximum versions to preserve per package and package type.
+        days_to_keep_recently_downloaded_packages: Number of days to preserve a package version after its latest download.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "ageLimitInDays": age_limit_in_days,
+        "countLimit": count_limit,
+        "daysToKeepRecentlyDownloadedPackages": days_to_keep_recently_downloaded_packages,
+    }
+    url = build_url(client.organization, f"_apis/packaging/Feeds/{feed_id}/retentionpolicies", API_VERSION, project=project, base_host="feeds.dev.azure.com")
+    response = client.request("PUT", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['ageLimitInDays', 'countLimit'], API_VERSION)
+    return data
+
+
+async def set_retention_policy_async(client, project: str, feed_id: str, *, age_limit_in_days: Optional[str] = None, count_limit: Optional[str] = None, days_to_keep_recently_downloaded_packages: Optional[str] = None) -> dict:
+    """Async variant of set_retention_policy() for use with AsyncAdoClient."""
+    body = {
+        "ageLimitInDays": age_limit_in_days,
+        "countLimit": count_limit,
+        "daysToKeepRecentlyDownloadedPackages": days_to_keep_recently_downloaded_packages,
+    }
+    url = build_url(client.organization, f"_apis/packaging/Feeds/{feed_id}/retentionpolicies", API_VERSION, project=project, base_host="feeds.dev.azure.com")
+    response = await client.request("PUT", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['ageLimitInDays', 'countLimit'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("set_retention_policy", PAT)
-logger.info("Set the retention policy for a feed.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "ageLimitInDays": args.age_limit_in_days,
-    "countLimit": args.count_limit,
-    "daysToKeepRecentlyDownloadedPackages": args.days_to_keep_recently_downloaded_packages,
-}
+def main() -> None:
+    """Read env vars / flags, call set_retention_policy() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    feed_id = require_env("FEED_ID", "Name or ID of the feed.")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/packaging/Feeds/{FEED_ID}/retentionpolicies", API_VERSION, project=PROJECT_ID, base_host="feeds.dev.azure.com")
-logger.info(f"PUT {url}")
+    parser = argparse.ArgumentParser(description="Set the retention policy for a feed.")
+    parser.add_argument("--age-limit-in-days", required=False, help="This attribute is deprecated and is not honoured by retention")
+    parser.add_argument("--count-limit", required=False, help="Maximum versions to preserve per package and package type.")
+    parser.add_argument("--days-to-keep-recently-downloaded-packages", required=False, help="Number of days to preserve a package version after its latest download.")
+    args = parser.parse_args()
 
-response = execute_request("PUT", url, HEADERS, body=body)
+    logger = AdoLogger("set_retention_policy", pat)
+    logger.info("Set the retention policy for a feed.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = set_retention_policy(client, project, feed_id, age_limit_in_days=args.age_limit_in_days, count_limit=args.count_limit, days_to_keep_recently_downloaded_packages=args.days_to_keep_recently_downloaded_packages)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['ageLimitInDays', 'countLimit'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
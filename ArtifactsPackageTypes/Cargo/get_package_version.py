@@ -10,55 +10,77 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/artifacts-package-types/cargo/get-package-version?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-FEED_ID = get_env_or_exit("FEED_ID", "Name or ID of the feed.")
-PACKAGE_NAME = get_env_or_exit("PACKAGE_NAME", "Name of the package.")
-PACKAGE_VERSION = get_env_or_exit("PACKAGE_VERSION", "Version of the package.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_package_version", PAT)
-logger.info("Get information about a package version.")
+def get_package_version(client, project: str, feed_id: str, package_name: str, package_version: str) -> dict:
+    """
+    Get information about a package version.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/packaging/feeds/{FEED_ID}/cargo/packages/{PACKAGE_NAME}/versions/{PACKAGE_VERSION}", API_VERSION, project=PROJECT_ID, base_host="pkgs.dev.azure.com")
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        feed_id: Name or ID of the feed.
+        package_name: Name of the package.
+        package_version: Version of the package.
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/packaging/feeds/{feed_id}/cargo/packages/{package_name}/versions/{package_version}", API_VERSION, project=project, base_host="pkgs.dev.azure.com")
+    response = client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'name'], API_VERSION)
+async def get_package_version_async(client, project: str, feed_id: str, package_name: str, package_version: str) -> dict:
+    """Async variant of get_package_version() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/packaging/feeds/{feed_id}/cargo/packages/{package_name}/versions/{package_version}", API_VERSION, project=project, base_host="pkgs.dev.azure.com")
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(f"Cargo: {data.get("name", "N/A")}")
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_package_version() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    feed_id = require_env("FEED_ID", "Name or ID of the feed.")
+    package_name = require_env("PACKAGE_NAME", "Name of the package.")
+    package_version = require_env("PACKAGE_VERSION", "Version of the package.")
+
+    logger = AdoLogger("get_package_version", pat)
+    logger.info("Get information about a package version.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = get_package_version(client, project, feed_id, package_name, package_version)
+
+    print(f"Cargo: {data.get('name', 'N/A')}")
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,50 +10,76 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/artifacts-package-types/maven/delete-package-version?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-FEED = get_env_or_exit("FEED", "Name or ID of the feed.")
-GROUP_ID = get_env_or_exit("GROUP_ID", "Group ID of the package.")
-ARTIFACT_ID = get_env_or_exit("ARTIFACT_ID", "Artifact ID of the package.")
-VERSION = get_env_or_exit("VERSION", "Version of the package.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("delete_packageversion", PAT)
-logger.info("Delete a package version from the feed and move it to the feed's recycle bin.")
+def delete_packageversion(client, project: str, feed: str, group_id: str, artifact_id: str, version: str) -> dict:
+    """
+    Delete a package version from the feed and move it to the feed's recycle bin.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        feed: Name or ID of the feed.
+        group_id: Group ID of the package.
+        artifact_id: Artifact ID of the package.
+        version: Version of the package.
+
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/packaging/feeds/{feed}/maven/groups/{group_id}/artifacts/{artifact_id}/versions/{version}", API_VERSION, project=project, base_host="pkgs.dev.azure.com")
+    response = client.request("DELETE", url, expected_status=202)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/packaging/feeds/{FEED}/maven/groups/{GROUP_ID}/artifacts/{ARTIFACT_ID}/versions/{VERSION}", API_VERSION, project=PROJECT_ID, base_host="pkgs.dev.azure.com")
-logger.info(f"DELETE {url}")
 
-response = execute_request("DELETE", url, HEADERS, expected_status=202)
+async def delete_packageversion_async(client, project: str, feed: str, group_id: str, artifact_id: str, version: str) -> dict:
+    """Async variant of delete_packageversion() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/packaging/feeds/{feed}/maven/groups/{group_id}/artifacts/{artifact_id}/versions/{version}", API_VERSION, project=project, base_host="pkgs.dev.azure.com")
+    response = await client.request("DELETE", url, expected_status=202)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call delete_packageversion() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    feed = require_env("FEED", "Name or ID of the feed.")
+    group_id = require_env("GROUP_ID", "Group ID of the package.")
+    artifact_id = require_env("ARTIFACT_ID", "Artifact ID of the package.")
+    version = require_env("VERSION", "Version of the package.")
+
+    logger = AdoLogger("delete_packageversion", pat)
+    logger.info("Delete a package version from the feed and move it to the feed's recycle bin.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = delete_packageversion(client, project, feed, group_id, artifact_id, version)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
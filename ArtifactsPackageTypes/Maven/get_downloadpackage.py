@@ -10,51 +10,85 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/artifacts-package-types/maven/download-package?view=azure-devops-rest-7.2
 """
 
-import json
+import argparse
 import os
 import sys
+from typing import BinaryIO, Union
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.async_http_client import astream_to
+from _shared.download import download_file
+from _shared.http_client import AdoClient, build_url
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-FEED_ID = get_env_or_exit("FEED_ID", "Name or ID of the feed.")
-GROUP_ID = get_env_or_exit("GROUP_ID", "GroupId of the maven package")
-ARTIFACT_ID = get_env_or_exit("ARTIFACT_ID", "ArtifactId of the maven package")
-VERSION = get_env_or_exit("VERSION", "Version of the package")
-FILE_NAME = get_env_or_exit("FILE_NAME", "File name to download")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_downloadpackage", PAT)
-logger.info("Fulfills Maven package file download requests by either returning the URL of the requested package file or, in the ca...")
+def get_downloadpackage(client, project: str, feed_id: str, group_id: str, artifact_id: str, version: str, file_name: str, *, destination: Union[str, BinaryIO]) -> int:
+    """
+    Fulfills Maven package file download requests by either returning the URL of the requested package file or, in the ca...
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        feed_id: Name or ID of the feed.
+        group_id: GroupId of the maven package
+        artifact_id: ArtifactId of the maven package
+        version: Version of the package
+        file_name: File name to download
+        destination: Output path or binary file (e.g. sys.stdout.buffer).
+
+    Returns:
+        Bytes written. A path destination is fetched in parallel ranged
+        segments and resumes after an interruption (see _shared.download).
+    """
+    url = build_url(client.organization, f"_apis/packaging/feeds/{feed_id}/maven/{group_id}/{artifact_id}/{version}/{file_name}/content", API_VERSION, project=project, base_host="pkgs.dev.azure.com")
+    return download_file(client, url, destination, accept="application/octet-stream")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/packaging/feeds/{FEED_ID}/maven/{GROUP_ID}/{ARTIFACT_ID}/{VERSION}/{FILE_NAME}/content", API_VERSION, project=PROJECT_ID, base_host="pkgs.dev.azure.com")
-logger.info(f"GET {url}")
 
-response = execute_request("GET", url, HEADERS)
+async def get_downloadpackage_async(client, project: str, feed_id: str, group_id: str, artifact_id: str, version: str, file_name: str, *, destination: Union[str, BinaryIO]) -> int:
+    """Async variant of get_downloadpackage() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/packaging/feeds/{feed_id}/maven/{group_id}/{artifact_id}/{version}/{file_name}/content", API_VERSION, project=project, base_host="pkgs.dev.azure.com")
+    response = await client.request("GET", url, stream=True, accept="application/octet-stream")
+    return await astream_to(response, destination)
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_downloadpackage() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    feed_id = require_env("FEED_ID", "Name or ID of the feed.")
+    group_id = require_env("GROUP_ID", "GroupId of the maven package")
+    artifact_id = require_env("ARTIFACT_ID", "ArtifactId of the maven package")
+    version = require_env("VERSION", "Version of the package")
+    file_name = require_env("FILE_NAME", "File name to download")
+
+    parser = argparse.ArgumentParser(description="Fulfills Maven package file download requests by either returning the URL of the requested package file or, in the ca...")
+    parser.add_argument("--output", help="Write the content to this file (default: stdout)")
+    args = parser.parse_args()
+
+    logger = AdoLogger("get_downloadpackage", pat)
+    logger.info("Fulfills Maven package file download requests by either returning the URL of the requested package file or, in the ca...")
+    client = AdoClient(organization, pat, logger=logger)
+
+    written = get_downloadpackage(client, project, feed_id, group_id, artifact_id, version, file_name, destination=args.output or sys.stdout.buffer)
+    logger.info(f"Downloaded {written} bytes")
+    if args.output:
+        print(f"Saved {written} bytes to {args.output}")
+
+
+if __name__ == "__main__":
+    run_cli(main)
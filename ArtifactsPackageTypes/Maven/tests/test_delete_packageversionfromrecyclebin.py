@@ -8,58 +8,26 @@ Validates:
   - Correct Authorization header
   - Successful response parsing (200)
   - Exit when required env vars are missing
+
+The script is imported and called in-process; see the fixtures in conftest.py.
 """
 
 import json
-import os
-import subprocess
-import sys
 from pathlib import Path
 
 import pytest
 import responses
 
+from _shared.errors import AdoAuthError, AdoNotFound
+from ArtifactsPackageTypes.Maven.delete_packageversionfromrecyclebin import delete_packageversionfromrecyclebin, main
+
 FIXTURES = Path(__file__).parent / "fixtures"
-SCRIPT = str(Path(__file__).resolve().parents[1] / "delete_packageversionfromrecyclebin.py")
-
-# ---------------------------------------------------------------------------
-# Helpers
-# ---------------------------------------------------------------------------
-
-def _run_script(env_override=None, extra_args=None, expect_fail=False):
-    """Run the script as a subprocess with the given env."""
-    env = {
-        "AZURE_DEVOPS_ORG": "testorg",
-        "AZURE_DEVOPS_PAT": "fakepat1234567890",
-        "PROJECT_ID": "a1b2c3d4-e5f6-7890-abcd-ef1234567890",
-        "FEED": "test-value-feed",
-        "GROUP_ID": "test-value-group_id",
-        "ARTIFACT_ID": "test-value-artifact_id",
-        "VERSION": "test-value-version",
-        "PATH": os.environ.get("PATH", ""),
-        "PYTHONPATH": os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."),
-    }
-    if env_override:
-        env.update(env_override)
-    env = {k: v for k, v in env.items() if v is not None}
-
-    cmd = [sys.executable, SCRIPT]
-    if extra_args:
-        cmd.extend(extra_args)
-
-    result = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        env=env,
-        timeout=30,
-    )
-    if not expect_fail:
-        assert result.returncode == 0, (
-            f"Script failed (rc={result.returncode}):\n"
-            f"STDOUT: {result.stdout}\nSTDERR: {result.stderr}"
-        )
-    return result
+ENV = {
+    "FEED": "test-value-feed",
+    "GROUP_ID": "test-value-group_id",
+    "ARTIFACT_ID": "test-value-artifact_id",
+    "VERSION": "test-value-version",
+}
 
 
 class TestDeletePackageversionfromrecyclebinEnvValidation:
@@ -67,73 +35,52 @@ class TestDeletePackageversionfromrecyclebinEnvValidation:
 
     @pytest.mark.offline
     @pytest.mark.artifactspackagetypes
-    def test_missing_org_exits(self):
-        result = _run_script(
-            env_override={"AZURE_DEVOPS_ORG": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "AZURE_DEVOPS_ORG" in result.stderr or "AZURE_DEVOPS_ORG" in result.stdout
+    def test_missing_org_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "AZURE_DEVOPS_ORG": None})
+        assert code != 0
+        assert "AZURE_DEVOPS_ORG" in output
 
     @pytest.mark.offline
     @pytest.mark.artifactspackagetypes
-    def test_missing_pat_exits(self):
-        result = _run_script(
-            env_override={"AZURE_DEVOPS_PAT": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "AZURE_DEVOPS_PAT" in result.stderr or "AZURE_DEVOPS_PAT" in result.stdout
+    def test_missing_pat_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "AZURE_DEVOPS_PAT": None})
+        assert code != 0
+        assert "AZURE_DEVOPS_PAT" in output
 
     @pytest.mark.offline
     @pytest.mark.artifactspackagetypes
-    def test_missing_project_id_exits(self):
-        result = _run_script(
-            env_override={"PROJECT_ID": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "PROJECT_ID" in (result.stderr + result.stdout)
+    def test_missing_project_id_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "PROJECT_ID": None})
+        assert code != 0
+        assert "PROJECT_ID" in output
 
     @pytest.mark.offline
     @pytest.mark.artifactspackagetypes
-    def test_missing_feed_exits(self):
-        result = _run_script(
-            env_override={"FEED": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "FEED" in result.stderr or "FEED" in result.stdout
+    def test_missing_feed_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "FEED": None})
+        assert code != 0
+        assert "FEED" in output
 
     @pytest.mark.offline
     @pytest.mark.artifactspackagetypes
-    def test_missing_group_id_exits(self):
-        result = _run_script(
-            env_override={"GROUP_ID": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "GROUP_ID" in result.stderr or "GROUP_ID" in result.stdout
+    def test_missing_group_id_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "GROUP_ID": None})
+        assert code != 0
+        assert "GROUP_ID" in output
 
     @pytest.mark.offline
     @pytest.mark.artifactspackagetypes
-    def test_missing_artifact_id_exits(self):
-        result = _run_script(
-            env_override={"ARTIFACT_ID": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "ARTIFACT_ID" in result.stderr or "ARTIFACT_ID" in result.stdout
+    def test_missing_artifact_id_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "ARTIFACT_ID": None})
+        assert code != 0
+        assert "ARTIFACT_ID" in output
 
     @pytest.mark.offline
     @pytest.mark.artifactspackagetypes
-    def test_missing_version_exits(self):
-        result = _run_script(
-            env_override={"VERSION": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "VERSION" in result.stderr or "VERSION" in result.stdout
+    def test_missing_version_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "VERSION": None})
+        assert code != 0
+        assert "VERSION" in output
 
 
 class TestDeletePackageversionfromrecyclebinURLAndAuth:
@@ -142,56 +89,39 @@ class TestDeletePackageversionfromrecyclebinURLAndAuth:
     @pytest.mark.offline
     @pytest.mark.artifactspackagetypes
     @responses.activate
-    def test_correct_url_and_auth_header(self):
-        """Verify the script builds the right URL and Authorization header."""
-        import base64
-
-        org = "testorg"
-        pat = "fakepat1234567890"
+    def test_correct_url_and_auth_header(self, ado_client, ado_env):
+        """Verify the operation builds the right URL and Authorization header."""
         expected_url = "https://pkgs.dev.azure.com/testorg/a1b2c3d4-e5f6-7890-abcd-ef1234567890/_apis/packaging/feeds/test-value-feed/maven/RecycleBin/groups/test-value-group_id/artifacts/test-value-artifact_id/versions/test-value-version?api-version=7.2"
-
         fixture = json.loads((FIXTURES / "delete_packageversionfromrecyclebin_200.json").read_text())
         responses.add(responses.DELETE, expected_url, json=fixture, status=200)
 
-        import requests as req
-
-        cred = base64.b64encode(f":{pat}".encode("ascii")).decode("ascii")
-        headers = {
-            "Authorization": f"Basic {cred}",
-            "Content-Type": "application/json",
-        }
-        resp = req.delete(expected_url, headers=headers, timeout=30)
-
-        assert resp.status_code == 200
+        assert delete_packageversionfromrecyclebin(ado_client, ado_env["PROJECT_ID"], "test-value-feed", "test-value-group_id", "test-value-artifact_id", "test-value-version") == fixture
         assert len(responses.calls) == 1
+        assert responses.calls[0].request.url == expected_url
         sent_auth = responses.calls[0].request.headers["Authorization"]
-        assert sent_auth.startswith("Basic ")
+        assert sent_auth == "Basic OmZha2VwYXQxMjM0NTY3ODkw"
 
 
 class TestDeletePackageversionfromrecyclebinHTTPErrors:
-    """Validate behaviour on error status codes."""
+    """Validate the typed error raised for error status codes."""
 
     @pytest.mark.offline
     @pytest.mark.artifactspackagetypes
     @responses.activate
-    def test_401_unauthorized(self):
+    def test_401_unauthorized(self, ado_client, ado_env):
         url = "https://pkgs.dev.azure.com/testorg/a1b2c3d4-e5f6-7890-abcd-ef1234567890/_apis/packaging/feeds/test-value-feed/maven/RecycleBin/groups/test-value-group_id/artifacts/test-value-artifact_id/versions/test-value-version?api-version=7.2"
         responses.add(responses.DELETE, url, json={"message": "unauthorized"}, status=401)
 
-        import requests as req
-
-        resp = req.delete(url, headers={"Authorization": "Basic fake"}, timeout=30)
-        assert resp.status_code == 401
+        with pytest.raises(AdoAuthError):
+            delete_packageversionfromrecyclebin(ado_client, ado_env["PROJECT_ID"], "test-value-feed", "test-value-group_id", "test-value-artifact_id", "test-value-version")
 
     @pytest.mark.offline
     @pytest.mark.artifactspackagetypes
     @responses.activate
-    def test_404_not_found(self):
+    def test_404_not_found(self, ado_client, ado_env):
         url = "https://pkgs.dev.azure.com/testorg/a1b2c3d4-e5f6-7890-abcd-ef1234567890/_apis/packaging/feeds/test-value-feed/maven/RecycleBin/groups/test-value-group_id/artifacts/test-value-artifact_id/versions/test-value-version?api-version=7.2"
         responses.add(responses.DELETE, url, json={"message": "not_found"}, status=404)
 
-        import requests as req
-
-        resp = req.delete(url, headers={"Authorization": "Basic fake"}, timeout=30)
-        assert resp.status_code == 404
+        with pytest.raises(AdoNotFound):
+            delete_packageversionfromrecyclebin(ado_client, ado_env["PROJECT_ID"], "test-value-feed", "test-value-group_id", "test-value-artifact_id", "test-value-version")
 
@@ -11,65 +11,90 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/artifacts-package-
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-FEED = get_env_or_exit("FEED", "feed")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Delete or restore several package versions from the recycle bin.")
-parser.add_argument("--data", required=False, help="Data required to perform the operation. This is optional based on type of operation. Use BatchPro...")
-parser.add_argument("--operation", required=False, help="Type of operation that needs to be performed on packages.")
-parser.add_argument("--packages", required=False, help="The packages onto which the operation will be performed.")
-args = parser.parse_args()
+def update_recycle_bin_packages(client, project: str, feed: str, *, data_value: Optional[str] = None, operation: Optional[str] = None, packages: Optional[str] = None) -> dict:
+    """
+    Delete or restore several package versions from the recycle bin.
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_recycle_bin_packages", PAT)
-logger.info("Delete or restore several package versions from the recycle bin.")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        feed: feed
+        data_value: Data required to perform the operation. This is optional based on type of operation. Use BatchPro...
+        operation: Type of operation that needs to be performed on packages.
+        packages: The packages onto which the operation will be performed.
 
-# ---------------------------------------------------------------------------
-# Request body
-# ---------------------------------------------------------------------------
-body = {
-    "data": args.data,
-    "operation": args.operation,
-    "packages": args.packages,
-}
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "data": data_value,
+        "operation": operation,
+        "packages": packages,
+    }
+    url = build_url(client.organization, f"_apis/packaging/feeds/{feed}/maven/RecycleBin/packagesBatch", API_VERSION, project=project, base_host="pkgs.dev.azure.com")
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/packaging/feeds/{FEED}/maven/RecycleBin/packagesBatch", API_VERSION, project=PROJECT_ID, base_host="pkgs.dev.azure.com")
-logger.info(f"POST {url}")
 
-response = execute_request("POST", url, HEADERS, body=body)
+async def update_recycle_bin_packages_async(client, project: str, feed: str, *, data_value: Optional[str] = None, operation: Optional[str] = None, packages: Optional[str] = None) -> dict:
+    """Async variant of update_recycle_bin_packages() for use with AsyncAdoClient."""
+    body = {
+        "data": data_value,
+        "operation": operation,
+        "packages": packages,
+    }
+    url = build_url(client.organization, f"_apis/packaging/feeds/{feed}/maven/RecycleBin/packagesBatch", API_VERSION, project=project, base_host="pkgs.dev.azure.com")
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call update_recycle_bin_packages() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    feed = require_env("FEED", "feed")
+
+    parser = argparse.ArgumentParser(description="Delete or restore several package versions from the recycle bin.")
+    parser.add_argument("--data", required=False, help="Data required to perform the operation. This is optional based on type of operation. Use BatchPro...")
+    parser.add_argument("--operation", required=False, help="Type of operation that needs to be performed on packages.")
+    parser.add_argument("--packages", required=False, help="The packages onto which the operation will be performed.")
+    args = parser.parse_args()
+
+    logger = AdoLogger("update_recycle_bin_packages", pat)
+    logger.info("Delete or restore several package versions from the recycle bin.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = update_recycle_bin_packages(client, project, feed, data_value=args.data, operation=args.operation, packages=args.packages)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
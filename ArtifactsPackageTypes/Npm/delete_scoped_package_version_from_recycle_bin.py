@@ -10,50 +10,76 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/artifacts-package-types/npm/delete-scoped-package-version-from-recycle-bin?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-FEED_ID = get_env_or_exit("FEED_ID", "Name or ID of the feed.")
-PACKAGE_SCOPE = get_env_or_exit("PACKAGE_SCOPE", "Scope of the package (the 'scope' part of @scope/name).")
-UNSCOPED_PACKAGE_NAME = get_env_or_exit("UNSCOPED_PACKAGE_NAME", "Name of the package (the 'name' part of @scope/name).")
-PACKAGE_VERSION = get_env_or_exit("PACKAGE_VERSION", "Version of the package.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("delete_scoped_package_version_from_recycle_bin", PAT)
-logger.info("Delete a package version with an npm scope from the recycle bin.")
+def delete_scoped_package_version_from_recycle_bin(client, project: str, feed_id: str, package_scope: str, unscoped_package_name: str, package_version: str) -> dict:
+    """
+    Delete a package version with an npm scope from the recycle bin.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        feed_id: Name or ID of the feed.
+        package_scope: Scope of the package (the 'scope' part of @scope/name).
+        unscoped_package_name: Name of the package (the 'name' part of @scope/name).
+        package_version: Version of the package.
+
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/packaging/feeds/{feed_id}/npm/RecycleBin/packages/@{package_scope}/{unscoped_package_name}/versions/{package_version}", API_VERSION, project=project, base_host="pkgs.dev.azure.com")
+    response = client.request("DELETE", url)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/packaging/feeds/{FEED_ID}/npm/RecycleBin/packages/@{PACKAGE_SCOPE}/{UNSCOPED_PACKAGE_NAME}/versions/{PACKAGE_VERSION}", API_VERSION, project=PROJECT_ID, base_host="pkgs.dev.azure.com")
-logger.info(f"DELETE {url}")
 
-response = execute_request("DELETE", url, HEADERS)
+async def delete_scoped_package_version_from_recycle_bin_async(client, project: str, feed_id: str, package_scope: str, unscoped_package_name: str, package_version: str) -> dict:
+    """Async variant of delete_scoped_package_version_from_recycle_bin() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/packaging/feeds/{feed_id}/npm/RecycleBin/packages/@{package_scope}/{unscoped_package_name}/versions/{package_version}", API_VERSION, project=project, base_host="pkgs.dev.azure.com")
+    response = await client.request("DELETE", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call delete_scoped_package_version_from_recycle_bin() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    feed_id = require_env("FEED_ID", "Name or ID of the feed.")
+    package_scope = require_env("PACKAGE_SCOPE", "Scope of the package (the 'scope' part of @scope/name).")
+    unscoped_package_name = require_env("UNSCOPED_PACKAGE_NAME", "Name of the package (the 'name' part of @scope/name).")
+    package_version = require_env("PACKAGE_VERSION", "Version of the package.")
+
+    logger = AdoLogger("delete_scoped_package_version_from_recycle_bin", pat)
+    logger.info("Delete a package version with an npm scope from the recycle bin.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = delete_scoped_package_version_from_recycle_bin(client, project, feed_id, package_scope, unscoped_package_name, package_version)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
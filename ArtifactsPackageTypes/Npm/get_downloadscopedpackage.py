@@ -10,50 +10,83 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/artifacts-package-types/npm/download-scoped-package?view=azure-devops-rest-7.2
 """
 
-import json
+import argparse
 import os
 import sys
+from typing import BinaryIO, Union
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.async_http_client import astream_to
+from _shared.download import download_file
+from _shared.http_client import AdoClient, build_url
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-FEED_ID = get_env_or_exit("FEED_ID", "Name or ID of the feed.")
-PACKAGE_SCOPE = get_env_or_exit("PACKAGE_SCOPE", "Scope of the npm package (the @scope portion of @scope/packageName).")
-UNSCOPED_PACKAGE_NAME = get_env_or_exit("UNSCOPED_PACKAGE_NAME", "Name of the package without the scope component.")
-PACKAGE_VERSION = get_env_or_exit("PACKAGE_VERSION", "Version of the package.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_downloadscopedpackage", PAT)
-logger.info("Get scoped npm package.")
+def get_downloadscopedpackage(client, project: str, feed_id: str, package_scope: str, unscoped_package_name: str, package_version: str, *, destination: Union[str, BinaryIO]) -> int:
+    """
+    Get scoped npm package.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        feed_id: Name or ID of the feed.
+        package_scope: Scope of the npm package (the @scope portion of @scope/packageName).
+        unscoped_package_name: Name of the package without the scope component.
+        package_version: Version of the package.
+        destination: Output path or binary file (e.g. sys.stdout.buffer).
+
+    Returns:
+        Bytes written. A path destination is fetched in parallel ranged
+        segments and resumes after an interruption (see _shared.download).
+    """
+    url = build_url(client.organization, f"_apis/packaging/feeds/{feed_id}/npm/packages/@{package_scope}/{unscoped_package_name}/versions/{package_version}/content", API_VERSION, project=project, base_host="pkgs.dev.azure.com")
+    return download_file(client, url, destination, accept="application/octet-stream")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/packaging/feeds/{FEED_ID}/npm/packages/@{PACKAGE_SCOPE}/{UNSCOPED_PACKAGE_NAME}/versions/{PACKAGE_VERSION}/content", API_VERSION, project=PROJECT_ID, base_host="pkgs.dev.azure.com")
-logger.info(f"GET {url}")
 
-response = execute_request("GET", url, HEADERS)
+async def get_downloadscopedpackage_async(client, project: str, feed_id: str, package_scope: str, unscoped_package_name: str, package_version: str, *, destination: Union[str, BinaryIO]) -> int:
+    """Async variant of get_downloadscopedpackage() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/packaging/feeds/{feed_id}/npm/packages/@{package_scope}/{unscoped_package_name}/versions/{package_version}/content", API_VERSION, project=project, base_host="pkgs.dev.azure.com")
+    response = await client.request("GET", url, stream=True, accept="application/octet-stream")
+    return await astream_to(response, destination)
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_downloadscopedpackage() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    feed_id = require_env("FEED_ID", "Name or ID of the feed.")
+    package_scope = require_env("PACKAGE_SCOPE", "Scope of the npm package (the @scope portion of @scope/packageName).")
+    unscoped_package_name = require_env("UNSCOPED_PACKAGE_NAME", "Name of the package without the scope component.")
+    package_version = require_env("PACKAGE_VERSION", "Version of the package.")
+
+    parser = argparse.ArgumentParser(description="Get scoped npm package.")
+    parser.add_argument("--output", help="Write the content to this file (default: stdout)")
+    args = parser.parse_args()
+
+    logger = AdoLogger("get_downloadscopedpackage", pat)
+    logger.info("Get scoped npm package.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    written = get_downloadscopedpackage(client, project, feed_id, package_scope, unscoped_package_name, package_version, destination=args.output or sys.stdout.buffer)
+    logger.info(f"Downloaded {written} bytes")
+    if args.output:
+        print(f"Saved {written} bytes to {args.output}")
+
+
+if __name__ == "__main__":
+    run_cli(main)
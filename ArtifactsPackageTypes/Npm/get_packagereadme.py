@@ -10,49 +10,80 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/artifacts-package-types/npm/get-package-readme?view=azure-devops-rest-7.2
 """
 
-import json
+import argparse
 import os
 import sys
+from typing import BinaryIO, Union
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.async_http_client import astream_to
+from _shared.http_client import AdoClient, build_url, stream_to
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-FEED_ID = get_env_or_exit("FEED_ID", "Name or ID of the feed.")
-PACKAGE_NAME = get_env_or_exit("PACKAGE_NAME", "Name of the package.")
-PACKAGE_VERSION = get_env_or_exit("PACKAGE_VERSION", "Version of the package.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_packagereadme", PAT)
-logger.info("Get the Readme for a package version that has no npm scope.")
+def get_packagereadme(client, project: str, feed_id: str, package_name: str, package_version: str, *, destination: Union[str, BinaryIO]) -> int:
+    """
+    Get the Readme for a package version that has no npm scope.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        feed_id: Name or ID of the feed.
+        package_name: Name of the package.
+        package_version: Version of the package.
+        destination: Output path or binary file (e.g. sys.stdout.buffer).
+
+    Returns:
+        Bytes written; the text/plain body is streamed in constant memory.
+    """
+    url = build_url(client.organization, f"_apis/packaging/feeds/{feed_id}/npm/packages/{package_name}/versions/{package_version}/readme", API_VERSION, project=project, base_host="pkgs.dev.azure.com")
+    response = client.request("GET", url, stream=True, accept="text/plain")
+    return stream_to(response, destination)
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/packaging/feeds/{FEED_ID}/npm/packages/{PACKAGE_NAME}/versions/{PACKAGE_VERSION}/readme", API_VERSION, project=PROJECT_ID, base_host="pkgs.dev.azure.com")
-logger.info(f"GET {url}")
 
-response = execute_request("GET", url, HEADERS)
+async def get_packagereadme_async(client, project: str, feed_id: str, package_name: str, package_version: str, *, destination: Union[str, BinaryIO]) -> int:
+    """Async variant of get_packagereadme() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/packaging/feeds/{feed_id}/npm/packages/{package_name}/versions/{package_version}/readme", API_VERSION, project=project, base_host="pkgs.dev.azure.com")
+    response = await client.request("GET", url, stream=True, accept="text/plain")
+    return await astream_to(response, destination)
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_packagereadme() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    feed_id = require_env("FEED_ID", "Name or ID of the feed.")
+    package_name = require_env("PACKAGE_NAME", "Name of the package.")
+    package_version = require_env("PACKAGE_VERSION", "Version of the package.")
+
+    parser = argparse.ArgumentParser(description="Get the Readme for a package version that has no npm scope.")
+    parser.add_argument("--output", help="Write the content to this file (default: stdout)")
+    args = parser.parse_args()
+
+    logger = AdoLogger("get_packagereadme", pat)
+    logger.info("Get the Readme for a package version that has no npm scope.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    written = get_packagereadme(client, project, feed_id, package_name, package_version, destination=args.output or sys.stdout.buffer)
+    logger.info(f"Downloaded {written} bytes")
+    if args.output:
+        print(f"Saved {written} bytes to {args.output}")
+
+
+if __name__ == "__main__":
+    run_cli(main)
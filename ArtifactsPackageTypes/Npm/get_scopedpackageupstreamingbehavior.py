@@ -10,53 +10,74 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/artifacts-package-types/npm/get-scoped-package-upstreaming-behavior?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-FEED_ID = get_env_or_exit("FEED_ID", "The name or id of the feed")
-PACKAGE_NAME = get_env_or_exit("PACKAGE_NAME", "The name of the package")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_scopedpackageupstreamingbehavior", PAT)
-logger.info("Get the upstreaming behavior of the (unscoped) package within the context of a feed")
+def get_scopedpackageupstreamingbehavior(client, project: str, feed_id: str, package_name: str) -> dict:
+    """
+    Get the upstreaming behavior of the (unscoped) package within the context of a feed
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/packaging/feeds/{FEED_ID}/npm/packages/{PACKAGE_NAME}/upstreaming", API_VERSION, project=PROJECT_ID, base_host="pkgs.dev.azure.com")
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        feed_id: The name or id of the feed
+        package_name: The name of the package
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/packaging/feeds/{feed_id}/npm/packages/{package_name}/upstreaming", API_VERSION, project=project, base_host="pkgs.dev.azure.com")
+    response = client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['versionsFromExternalUpstreams'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['versionsFromExternalUpstreams'], API_VERSION)
+async def get_scopedpackageupstreamingbehavior_async(client, project: str, feed_id: str, package_name: str) -> dict:
+    """Async variant of get_scopedpackageupstreamingbehavior() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/packaging/feeds/{feed_id}/npm/packages/{package_name}/upstreaming", API_VERSION, project=project, base_host="pkgs.dev.azure.com")
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['versionsFromExternalUpstreams'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_scopedpackageupstreamingbehavior() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    feed_id = require_env("FEED_ID", "The name or id of the feed")
+    package_name = require_env("PACKAGE_NAME", "The name of the package")
+
+    logger = AdoLogger("get_scopedpackageupstreamingbehavior", pat)
+    logger.info("Get the upstreaming behavior of the (unscoped) package within the context of a feed")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = get_scopedpackageupstreamingbehavior(client, project, feed_id, package_name)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
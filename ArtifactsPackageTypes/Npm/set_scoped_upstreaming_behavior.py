@@ -11,63 +11,86 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/artifacts-package-
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-FEED_ID = get_env_or_exit("FEED_ID", "The name or id of the feed")
-PACKAGE_SCOPE = get_env_or_exit("PACKAGE_SCOPE", "The scope of the package")
-UNSCOPED_PACKAGE_NAME = get_env_or_exit("UNSCOPED_PACKAGE_NAME", "The name of the scoped package")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Set the upstreaming behavior of a (scoped) package within the context of a feed The package does not need to necessar...")
-parser.add_argument("--versions-from-external-upstreams", required=False, help="Indicates whether external upstream versions should be considered for this package")
-args = parser.parse_args()
+def set_scoped_upstreaming_behavior(client, project: str, feed_id: str, package_scope: str, unscoped_package_name: str, *, versions_from_external_upstreams: Optional[str] = None) -> dict:
+    """
+    Set the upstreaming behavior of a (scoped) package within the context of a feed The package does not need to necessar...
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("set_scoped_upstreaming_behavior", PAT)
-logger.info("Set the upstreaming behavior of a (scoped) package within the context of a feed The package does not need to necessar...")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        feed_id: The name or id of the feed
+        package_scope: The scope of the package
+        unscoped_package_name: The name of the scoped package
+        versions_from_external_upstreams: Indicates whether external upstream versions should be considered for this package
 
-# ---------------------------------------------------------------------------
-# Request body
-# ---------------------------------------------------------------------------
-body = {
-    "versionsFromExternalUpstreams": args.versions_from_external_upstreams,
-}
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "versionsFromExternalUpstreams": versions_from_external_upstreams,
+    }
+    url = build_url(client.organization, f"_apis/packaging/feeds/{feed_id}/npm/packages/@{package_scope}/{unscoped_package_name}/upstreaming", API_VERSION, project=project, base_host="pkgs.dev.azure.com")
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/packaging/feeds/{FEED_ID}/npm/packages/@{PACKAGE_SCOPE}/{UNSCOPED_PACKAGE_NAME}/upstreaming", API_VERSION, project=PROJECT_ID, base_host="pkgs.dev.azure.com")
-logger.info(f"PATCH {url}")
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+async def set_scoped_upstreaming_behavior_async(client, project: str, feed_id: str, package_scope: str, unscoped_package_name: str, *, versions_from_external_upstreams: Optional[str] = None) -> dict:
+    """Async variant of set_scoped_upstreaming_behavior() for use with AsyncAdoClient."""
+    body = {
+        "versionsFromExternalUpstreams": versions_from_external_upstreams,
+    }
+    url = build_url(client.organization, f"_apis/packaging/feeds/{feed_id}/npm/packages/@{package_scope}/{unscoped_package_name}/upstreaming", API_VERSION, project=project, base_host="pkgs.dev.azure.com")
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call set_scoped_upstreaming_behavior() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    feed_id = require_env("FEED_ID", "The name or id of the feed")
+    package_scope = require_env("PACKAGE_SCOPE", "The scope of the package")
+    unscoped_package_name = require_env("UNSCOPED_PACKAGE_NAME", "The name of the scoped package")
+
+    parser = argparse.ArgumentParser(description="Set the upstreaming behavior of a (scoped) package within the context of a feed The package does not need to necessar...")
+    parser.add_argument("--versions-from-external-upstreams", required=False, help="Indicates whether external upstream versions should be considered for this package")
+    args = parser.parse_args()
+
+    logger = AdoLogger("set_scoped_upstreaming_behavior", pat)
+    logger.info("Set the upstreaming behavior of a (scoped) package within the context of a feed The package does not need to necessar...")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = set_scoped_upstreaming_behavior(client, project, feed_id, package_scope, unscoped_package_name, versions_from_external_upstreams=args.versions_from_external_upstreams)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
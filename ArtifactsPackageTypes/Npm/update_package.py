@@ -11,71 +11,93 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/artifacts-package-
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-FEED_ID = get_env_or_exit("FEED_ID", "Name or ID of the feed.")
-PACKAGE_NAME = get_env_or_exit("PACKAGE_NAME", "Name of the package.")
-PACKAGE_VERSION = get_env_or_exit("PACKAGE_VERSION", "Version of the package.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Update state for an unscoped package version.")
-parser.add_argument("--deprecate-message", required=False, help="Indicates the deprecate message of a package version")
-parser.add_argument("--views", required=False, help="The view to which the package version will be added")
-args = parser.parse_args()
+def update_package(client, project: str, feed_id: str, package_name: str, package_version: str, *, deprecate_message: Optional[str] = None, views: Optional[str] = None) -> dict:
+    """
+    Update state for an unscoped package version.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        feed_id: Name or ID of the feed.
+        package_name: Name of the package.
+        package_version: Version of the package.
+        deprecate_message: Indicates the deprecate message of a package version
+        views: The view to which the package version will be added
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "deprecateMessage": deprecate_message,
+        "views": views,
+    }
+    url = build_url(client.organization, f"_apis/packaging/feeds/{feed_id}/npm/{package_name}/versions/{package_version}", API_VERSION, project=project, base_host="pkgs.dev.azure.com")
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name'], API_VERSION)
+    return data
+
+
+async def update_package_async(client, project: str, feed_id: str, package_name: str, package_version: str, *, deprecate_message: Optional[str] = None, views: Optional[str] = None) -> dict:
+    """Async variant of update_package() for use with AsyncAdoClient."""
+    body = {
+        "deprecateMessage": deprecate_message,
+        "views": views,
+    }
+    url = build_url(client.organization, f"_apis/packaging/feeds/{feed_id}/npm/{package_name}/versions/{package_version}", API_VERSION, project=project, base_host="pkgs.dev.azure.com")
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_package", PAT)
-logger.info("Update state for an unscoped package version.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "deprecateMessage": args.deprecate_message,
-    "views": args.views,
-}
+def main() -> None:
+    """Read env vars / flags, call update_package() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    feed_id = require_env("FEED_ID", "Name or ID of the feed.")
+    package_name = require_env("PACKAGE_NAME", "Name of the package.")
+    package_version = require_env("PACKAGE_VERSION", "Version of the package.")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/packaging/feeds/{FEED_ID}/npm/{PACKAGE_NAME}/versions/{PACKAGE_VERSION}", API_VERSION, project=PROJECT_ID, base_host="pkgs.dev.azure.com")
-logger.info(f"PATCH {url}")
+    parser = argparse.ArgumentParser(description="Update state for an unscoped package version.")
+    parser.add_argument("--deprecate-message", required=False, help="Indicates the deprecate message of a package version")
+    parser.add_argument("--views", required=False, help="The view to which the package version will be added")
+    args = parser.parse_args()
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+    logger = AdoLogger("update_package", pat)
+    logger.info("Update state for an unscoped package version.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_package(client, project, feed_id, package_name, package_version, deprecate_message=args.deprecate_message, views=args.views)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'name'], API_VERSION)
+    print(f"Npm: {data.get('name', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Npm: {data.get("name", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,50 +10,104 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/audit/audit-log/query?view=azure-devops-rest-7.2
 """
 
-import json
+import argparse
 import os
 import sys
+from typing import Iterator, Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
+from _shared.pagination import paginate
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("query_audit_log", PAT)
-logger.info("Queries audit log entries")
+def query_audit_log(client) -> dict:
+    """
+    Queries audit log entries
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/audit/auditlog", API_VERSION, base_host="auditservice.dev.azure.com")
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/audit/auditlog", API_VERSION, base_host="auditservice.dev.azure.com")
+    response = client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['continuationToken', 'decoratedAuditLogEntries'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['continuationToken', 'decoratedAuditLogEntries'], API_VERSION)
+async def query_audit_log_async(client) -> dict:
+    """Async variant of query_audit_log() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/audit/auditlog", API_VERSION, base_host="auditservice.dev.azure.com")
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['continuationToken', 'decoratedAuditLogEntries'], API_VERSION)
+    return data
+
+
+def iter_query_audit_log(client, *, max_items: Optional[int] = None, prefetch: bool = False) -> Iterator[dict]:
+    """
+    Yield every item across all pages of query_audit_log() (continuation paging).
+
+    Takes the same arguments, plus:
+        max_items: Stop after this many items (default: all).
+        prefetch: Fetch the next page while the current one is consumed.
+    """
+    url = build_url(client.organization, f"_apis/audit/auditlog", API_VERSION, base_host="auditservice.dev.azure.com")
+    return paginate(client, "GET", url, "continuation", list_key="decoratedAuditLogEntries",
+                    max_items=max_items, prefetch=prefetch)
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call query_audit_log() and print the result."""
+    organization, pat = get_common_env()
+
+    parser = argparse.ArgumentParser(description="Queries audit log entries")
+    parser.add_argument("--all-pages", action="store_true", help="Follow pagination and return every item")
+    parser.add_argument("--max-items", type=int, help="Follow pagination up to this many items")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("query_audit_log", pat)
+    logger.info("Queries audit log entries")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        if args.all_pages or args.max_items:
+            items = iter_query_audit_log(client, max_items=args.max_items, prefetch=True)
+        else:
+            items = items_of(query_audit_log(client), "decoratedAuditLogEntries")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    if args.all_pages or args.max_items:
+        items = list(iter_query_audit_log(client, max_items=args.max_items, prefetch=True))
+        data = {"count": len(items), "decoratedAuditLogEntries": items}
+    else:
+        data = query_audit_log(client)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
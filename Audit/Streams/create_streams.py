@@ -11,76 +11,103 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/audit/streams/crea
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-DAYS_TO_BACKFILL = get_env_or_exit("DAYS_TO_BACKFILL", "The number of days of previously recorded audit data that will be replayed into the stream. A val...")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Create new Audit Stream")
-parser.add_argument("--consumer-inputs", required=False, help="Inputs used to communicate with external service. Inputs could be url, a connection string, a tok...")
-parser.add_argument("--consumer-type", required=False, help="Type of the consumer, i.e. splunk, azureEventHub, etc.")
-parser.add_argument("--created-time", required=False, help="The time when the stream was created")
-parser.add_argument("--display-name", required=False, help="Used to identify individual streams")
-parser.add_argument("--id", required=False, help="Unique stream identifier")
-parser.add_argument("--status", required=False, help="Status of the stream, Enabled, Disabled")
-args = parser.parse_args()
+def create_streams(client, days_to_backfill: str, *, consumer_inputs: Optional[str] = None, consumer_type: Optional[str] = None, created_time: Optional[str] = None, display_name: Optional[str] = None, id: Optional[str] = None, status: Optional[str] = None) -> dict:
+    """
+    Create new Audit Stream
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        days_to_backfill: The number of days of previously recorded audit data that will be replayed into the stream. A val...
+        consumer_inputs: Inputs used to communicate with external service. Inputs could be url, a connection string, a tok...
+        consumer_type: Type of the consumer, i.e. splunk, azureEventHub, etc.
+        created_time: The time when the stream was created
+        display_name: Used to identify individual streams
+        id: Unique stream identifier
+        status: Status of the stream, Enabled, Disabled
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "consumerInputs": consumer_inputs,
+        "consumerType": consumer_type,
+        "createdTime": created_time,
+        "displayName": display_name,
+        "id": id,
+        "status": status,
+    }
+    url = build_url(client.organization, f"_apis/audit/streams", API_VERSION, base_host="auditservice.dev.azure.com")
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'consumerInputs'], API_VERSION)
+    return data
+
+
+async def create_streams_async(client, days_to_backfill: str, *, consumer_inputs: Optional[str] = None, consumer_type: Optional[str] = None, created_time: Optional[str] = None, display_name: Optional[str] = None, id: Optional[str] = None, status: Optional[str] = None) -> dict:
+    """Async variant of create_streams() for use with AsyncAdoClient."""
+    body = {
+        "consumerInputs": consumer_inputs,
+        "consumerType": consumer_type,
+        "createdTime": created_time,
+        "displayName": display_name,
+        "id": id,
+        "status": status,
+    }
+    url = build_url(client.organization, f"_apis/audit/streams", API_VERSION, base_host="auditservice.dev.azure.com")
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'consumerInputs'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_streams", PAT)
-logger.info("Create new Audit Stream")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "consumerInputs": args.consumer_inputs,
-    "consumerType": args.consumer_type,
-    "createdTime": args.created_time,
-    "displayName": args.display_name,
-    "id": args.id,
-    "status": args.status,
-}
+def main() -> None:
+    """Read env vars / flags, call create_streams() and print the result."""
+    organization, pat = get_common_env()
+    days_to_backfill = require_env("DAYS_TO_BACKFILL", "The number of days of previously recorded audit data that will be replayed into the stream. A val...")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/audit/streams", API_VERSION, base_host="auditservice.dev.azure.com")
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Create new Audit Stream")
+    parser.add_argument("--consumer-inputs", required=False, help="Inputs used to communicate with external service. Inputs could be url, a connection string, a tok...")
+    parser.add_argument("--consumer-type", required=False, help="Type of the consumer, i.e. splunk, azureEventHub, etc.")
+    parser.add_argument("--created-time", required=False, help="The time when the stream was created")
+    parser.add_argument("--display-name", required=False, help="Used to identify individual streams")
+    parser.add_argument("--id", required=False, help="Unique stream identifier")
+    parser.add_argument("--status", required=False, help="Status of the stream, Enabled, Disabled")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_streams", pat)
+    logger.info("Create new Audit Stream")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_streams(client, days_to_backfill, consumer_inputs=args.consumer_inputs, consumer_type=args.consumer_type, created_time=args.created_time, display_name=args.display_name, id=args.id, status=args.status)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'consumerInputs'], API_VERSION)
+    print(f"Streams ID: {data.get('id', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Streams ID: {data.get("id", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,52 +10,71 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/audit/streams/query-stream-by-id?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-STREAM_ID = get_env_or_exit("STREAM_ID", "Id of stream entry to retrieve")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("query_stream_by_id", PAT)
-logger.info("Return Audit Stream with id of streamId if one exists otherwise throw")
+def query_stream_by_id(client, stream_id: str) -> dict:
+    """
+    Return Audit Stream with id of streamId if one exists otherwise throw
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/audit/streams/{STREAM_ID}", API_VERSION, base_host="auditservice.dev.azure.com")
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        stream_id: Id of stream entry to retrieve
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/audit/streams/{stream_id}", API_VERSION, base_host="auditservice.dev.azure.com")
+    response = client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['id', 'consumerInputs'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'consumerInputs'], API_VERSION)
+async def query_stream_by_id_async(client, stream_id: str) -> dict:
+    """Async variant of query_stream_by_id() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/audit/streams/{stream_id}", API_VERSION, base_host="auditservice.dev.azure.com")
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['id', 'consumerInputs'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(f"Streams ID: {data.get("id", "N/A")}")
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call query_stream_by_id() and print the result."""
+    organization, pat = get_common_env()
+    stream_id = require_env("STREAM_ID", "Id of stream entry to retrieve")
+
+    logger = AdoLogger("query_stream_by_id", pat)
+    logger.info("Return Audit Stream with id of streamId if one exists otherwise throw")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = query_stream_by_id(client, stream_id)
+
+    print(f"Streams ID: {data.get('id', 'N/A')}")
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
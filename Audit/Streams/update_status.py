@@ -10,53 +10,73 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/audit/streams/update-status?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-STREAM_ID = get_env_or_exit("STREAM_ID", "Id of stream entry to be updated")
-STATUS = get_env_or_exit("STATUS", "Status of the stream")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_status", PAT)
-logger.info("Update existing Audit Stream status")
+def update_status(client, stream_id: str, status: str) -> dict:
+    """
+    Update existing Audit Stream status
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/audit/streams/{STREAM_ID}", API_VERSION, base_host="auditservice.dev.azure.com")
-logger.info(f"PUT {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        stream_id: Id of stream entry to be updated
+        status: Status of the stream
 
-response = execute_request("PUT", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/audit/streams/{stream_id}", API_VERSION, base_host="auditservice.dev.azure.com")
+    response = client.request("PUT", url)
+    data = loads(response.content)
+    version_guard(data, ['id', 'consumerInputs'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'consumerInputs'], API_VERSION)
+async def update_status_async(client, stream_id: str, status: str) -> dict:
+    """Async variant of update_status() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/audit/streams/{stream_id}", API_VERSION, base_host="auditservice.dev.azure.com")
+    response = await client.request("PUT", url)
+    data = loads(response.content)
+    version_guard(data, ['id', 'consumerInputs'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(f"Streams ID: {data.get("id", "N/A")}")
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call update_status() and print the result."""
+    organization, pat = get_common_env()
+    stream_id = require_env("STREAM_ID", "Id of stream entry to be updated")
+    status = require_env("STATUS", "Status of the stream")
+
+    logger = AdoLogger("update_status", pat)
+    logger.info("Update existing Audit Stream status")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = update_status(client, stream_id, status)
+
+    print(f"Streams ID: {data.get('id', 'N/A')}")
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
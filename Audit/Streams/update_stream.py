@@ -11,75 +11,101 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/audit/streams/upda
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Update existing Audit Stream")
-parser.add_argument("--consumer-inputs", required=False, help="Inputs used to communicate with external service. Inputs could be url, a connection string, a tok...")
-parser.add_argument("--consumer-type", required=False, help="Type of the consumer, i.e. splunk, azureEventHub, etc.")
-parser.add_argument("--created-time", required=False, help="The time when the stream was created")
-parser.add_argument("--display-name", required=False, help="Used to identify individual streams")
-parser.add_argument("--id", required=False, help="Unique stream identifier")
-parser.add_argument("--status", required=False, help="Status of the stream, Enabled, Disabled")
-args = parser.parse_args()
+def update_stream(client, *, consumer_inputs: Optional[str] = None, consumer_type: Optional[str] = None, created_time: Optional[str] = None, display_name: Optional[str] = None, id: Optional[str] = None, status: Optional[str] = None) -> dict:
+    """
+    Update existing Audit Stream
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        consumer_inputs: Inputs used to communicate with external service. Inputs could be url, a connection string, a tok...
+        consumer_type: Type of the consumer, i.e. splunk, azureEventHub, etc.
+        created_time: The time when the stream was created
+        display_name: Used to identify individual streams
+        id: Unique stream identifier
+        status: Status of the stream, Enabled, Disabled
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "consumerInputs": consumer_inputs,
+        "consumerType": consumer_type,
+        "createdTime": created_time,
+        "displayName": display_name,
+        "id": id,
+        "status": status,
+    }
+    url = build_url(client.organization, f"_apis/audit/streams", API_VERSION, base_host="auditservice.dev.azure.com")
+    response = client.request("PUT", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'consumerInputs'], API_VERSION)
+    return data
+
+
+async def update_stream_async(client, *, consumer_inputs: Optional[str] = None, consumer_type: Optional[str] = None, created_time: Optional[str] = None, display_name: Optional[str] = None, id: Optional[str] = None, status: Optional[str] = None) -> dict:
+    """Async variant of update_stream() for use with AsyncAdoClient."""
+    body = {
+        "consumerInputs": consumer_inputs,
+        "consumerType": consumer_type,
+        "createdTime": created_time,
+        "displayName": display_name,
+        "id": id,
+        "status": status,
+    }
+    url = build_url(client.organization, f"_apis/audit/streams", API_VERSION, base_host="auditservice.dev.azure.com")
+    response = await client.request("PUT", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'consumerInputs'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_stream", PAT)
-logger.info("Update existing Audit Stream")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "consumerInputs": args.consumer_inputs,
-    "consumerType": args.consumer_type,
-    "createdTime": args.created_time,
-    "displayName": args.display_name,
-    "id": args.id,
-    "status": args.status,
-}
+def main() -> None:
+    """Read env vars / flags, call update_stream() and print the result."""
+    organization, pat = get_common_env()
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/audit/streams", API_VERSION, base_host="auditservice.dev.azure.com")
-logger.info(f"PUT {url}")
+    parser = argparse.ArgumentParser(description="Update existing Audit Stream")
+    parser.add_argument("--consumer-inputs", required=False, help="Inputs used to communicate with external service. Inputs could be url, a connection string, a tok...")
+    parser.add_argument("--consumer-type", required=False, help="Type of the consumer, i.e. splunk, azureEventHub, etc.")
+    parser.add_argument("--created-time", required=False, help="The time when the stream was created")
+    parser.add_argument("--display-name", required=False, help="Used to identify individual streams")
+    parser.add_argument("--id", required=False, help="Unique stream identifier")
+    parser.add_argument("--status", required=False, help="Status of the stream, Enabled, Disabled")
+    args = parser.parse_args()
 
-response = execute_request("PUT", url, HEADERS, body=body)
+    logger = AdoLogger("update_stream", pat)
+    logger.info("Update existing Audit Stream")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_stream(client, consumer_inputs=args.consumer_inputs, consumer_type=args.consumer_type, created_time=args.created_time, display_name=args.display_name, id=args.id, status=args.status)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'consumerInputs'], API_VERSION)
+    print(f"Streams ID: {data.get('id', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Streams ID: {data.get("id", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
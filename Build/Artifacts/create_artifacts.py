@@ -11,73 +11,97 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/build/artifacts/cr
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-BUILD_ID = get_env_or_exit("BUILD_ID", "The ID of the build.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Associates an artifact with a build.")
-parser.add_argument("--id", required=False, help="The artifact ID.")
-parser.add_argument("--name", required=False, help="The name of the artifact.")
-parser.add_argument("--resource", required=False, help="The actual resource.")
-parser.add_argument("--source", required=False, help="The artifact source, which will be the ID of the job that produced this artifact. If an artifact ...")
-args = parser.parse_args()
+def create_artifacts(client, project: str, build_id: str, *, id: Optional[str] = None, name: Optional[str] = None, resource: Optional[str] = None, source: Optional[str] = None) -> dict:
+    """
+    Associates an artifact with a build.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        build_id: The ID of the build.
+        id: The artifact ID.
+        name: The name of the artifact.
+        resource: The actual resource.
+        source: The artifact source, which will be the ID of the job that produced this artifact. If an artifact ...
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "id": id,
+        "name": name,
+        "resource": resource,
+        "source": source,
+    }
+    url = build_url(client.organization, f"_apis/build/builds/{build_id}/artifacts", API_VERSION, project=project)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name'], API_VERSION)
+    return data
+
+
+async def create_artifacts_async(client, project: str, build_id: str, *, id: Optional[str] = None, name: Optional[str] = None, resource: Optional[str] = None, source: Optional[str] = None) -> dict:
+    """Async variant of create_artifacts() for use with AsyncAdoClient."""
+    body = {
+        "id": id,
+        "name": name,
+        "resource": resource,
+        "source": source,
+    }
+    url = build_url(client.organization, f"_apis/build/builds/{build_id}/artifacts", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_artifacts", PAT)
-logger.info("Associates an artifact with a build.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "id": args.id,
-    "name": args.name,
-    "resource": args.resource,
-    "source": args.source,
-}
+def main() -> None:
+    """Read env vars / flags, call create_artifacts() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    build_id = require_env("BUILD_ID", "The ID of the build.")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/build/builds/{BUILD_ID}/artifacts", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Associates an artifact with a build.")
+    parser.add_argument("--id", required=False, help="The artifact ID.")
+    parser.add_argument("--name", required=False, help="The name of the artifact.")
+    parser.add_argument("--resource", required=False, help="The actual resource.")
+    parser.add_argument("--source", required=False, help="The artifact source, which will be the ID of the job that produced this artifact. If an artifact ...")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_artifacts", pat)
+    logger.info("Associates an artifact with a build.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_artifacts(client, project, build_id, id=args.id, name=args.name, resource=args.resource, source=args.source)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'name'], API_VERSION)
+    print(f"Artifacts: {data.get('name', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Artifacts: {data.get("name", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,51 +10,85 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/build/attachments/get?view=azure-devops-rest-7.2
 """
 
-import json
+import argparse
 import os
 import sys
+from typing import BinaryIO, Union
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.async_http_client import astream_to
+from _shared.download import download_file
+from _shared.http_client import AdoClient, build_url
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-BUILD_ID = get_env_or_exit("BUILD_ID", "The ID of the build.")
-TIMELINE_ID = get_env_or_exit("TIMELINE_ID", "The ID of the timeline.")
-RECORD_ID = get_env_or_exit("RECORD_ID", "The ID of the timeline record.")
-TYPE = get_env_or_exit("TYPE", "The type of the attachment.")
-NAME = get_env_or_exit("NAME", "The name of the attachment.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_attachments", PAT)
-logger.info("Gets a specific attachment.")
+def get_attachments(client, project: str, build_id: str, timeline_id: str, record_id: str, type: str, name: str, *, destination: Union[str, BinaryIO]) -> int:
+    """
+    Gets a specific attachment.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        build_id: The ID of the build.
+        timeline_id: The ID of the timeline.
+        record_id: The ID of the timeline record.
+        type: The type of the attachment.
+        name: The name of the attachment.
+        destination: Output path or binary file (e.g. sys.stdout.buffer).
+
+    Returns:
+        Bytes written. A path destination is fetched in parallel ranged
+        segments and resumes after an interruption (see _shared.download).
+    """
+    url = build_url(client.organization, f"_apis/build/builds/{build_id}/{timeline_id}/{record_id}/attachments/{type}/{name}", API_VERSION, project=project)
+    return download_file(client, url, destination, accept="application/octet-stream")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/build/builds/{BUILD_ID}/{TIMELINE_ID}/{RECORD_ID}/attachments/{TYPE}/{NAME}", API_VERSION, project=PROJECT_ID)
-logger.info(f"GET {url}")
 
-response = execute_request("GET", url, HEADERS)
+async def get_attachments_async(client, project: str, build_id: str, timeline_id: str, record_id: str, type: str, name: str, *, destination: Union[str, BinaryIO]) -> int:
+    """Async variant of get_attachments() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/build/builds/{build_id}/{timeline_id}/{record_id}/attachments/{type}/{name}", API_VERSION, project=project)
+    response = await client.request("GET", url, stream=True, accept="application/octet-stream")
+    return await astream_to(response, destination)
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_attachments() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    build_id = require_env("BUILD_ID", "The ID of the build.")
+    timeline_id = require_env("TIMELINE_ID", "The ID of the timeline.")
+    record_id = require_env("RECORD_ID", "The ID of the timeline record.")
+    type = require_env("TYPE", "The type of the attachment.")
+    name = require_env("NAME", "The name of the attachment.")
+
+    parser = argparse.ArgumentParser(description="Gets a specific attachment.")
+    parser.add_argument("--output", help="Write the content to this file (default: stdout)")
+    args = parser.parse_args()
+
+    logger = AdoLogger("get_attachments", pat)
+    logger.info("Gets a specific attachment.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    written = get_attachments(client, project, build_id, timeline_id, record_id, type, name, destination=args.output or sys.stdout.buffer)
+    logger.info(f"Downloaded {written} bytes")
+    if args.output:
+        print(f"Saved {written} bytes to {args.output}")
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,48 +10,84 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/build/attachments/list?view=azure-devops-rest-7.2
 """
 
-import json
+import argparse
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-BUILD_ID = get_env_or_exit("BUILD_ID", "The ID of the build.")
-TYPE = get_env_or_exit("TYPE", "The type of attachment.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("list_attachments", PAT)
-logger.info("Gets the list of attachments of a specific type that are associated with a build.")
+def list_attachments(client, project: str, build_id: str, type: str) -> dict:
+    """
+    Gets the list of attachments of a specific type that are associated with a build.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/build/builds/{BUILD_ID}/attachments/{TYPE}", API_VERSION, project=PROJECT_ID)
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        build_id: The ID of the build.
+        type: The type of attachment.
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/build/builds/{build_id}/attachments/{type}", API_VERSION, project=project)
+    response = client.request("GET", url)
+    data = loads(response.content)
+    return data
+
+
+async def list_attachments_async(client, project: str, build_id: str, type: str) -> dict:
+    """Async variant of list_attachments() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/build/builds/{build_id}/attachments/{type}", API_VERSION, project=project)
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call list_attachments() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    build_id = require_env("BUILD_ID", "The ID of the build.")
+    type = require_env("TYPE", "The type of attachment.")
+
+    parser = argparse.ArgumentParser(description="Gets the list of attachments of a specific type that are associated with a build.")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("list_attachments", pat)
+    logger.info("Gets the list of attachments of a specific type that are associated with a build.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        items = items_of(list_attachments(client, project, build_id, type), "value")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    data = list_attachments(client, project, build_id, type)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -8,59 +8,28 @@ Validates:
   - Correct Authorization header
   - Successful response parsing (200)
   - Exit when required env vars are missing
+
+The script is imported and called in-process; see the fixtures in conftest.py.
 """
 
-import json
-import os
-import subprocess
-import sys
+import io
 from pathlib import Path
 
 import pytest
 import responses
 
+from _shared.errors import AdoAuthError, AdoNotFound
+from Build.Attachments.get_attachments import get_attachments, main
+
 FIXTURES = Path(__file__).parent / "fixtures"
-SCRIPT = str(Path(__file__).resolve().parents[1] / "get_attachments.py")
-
-# ---------------------------------------------------------------------------
-# Helpers
-# ---------------------------------------------------------------------------
-
-def _run_script(env_override=None, extra_args=None, expect_fail=False):
-    """Run the script as a subprocess with the given env."""
-    env = {
-        "AZURE_DEVOPS_ORG": "testorg",
-        "AZURE_DEVOPS_PAT": "fakepat1234567890",
-        "PROJECT_ID": "a1b2c3d4-e5f6-7890-abcd-ef1234567890",
-        "BUILD_ID": "test-value-build_id",
-        "TIMELINE_ID": "test-value-timeline_id",
-        "RECORD_ID": "test-value-record_id",
-        "TYPE": "test-value-type",
-        "NAME": "test-value-name",
-        "PATH": os.environ.get("PATH", ""),
-        "PYTHONPATH": os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."),
-    }
-    if env_override:
-        env.update(env_override)
-    env = {k: v for k, v in env.items() if v is not None}
-
-    cmd = [sys.executable, SCRIPT]
-    if extra_args:
-        cmd.extend(extra_args)
-
-    result = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        env=env,
-        timeout=30,
-    )
-    if not expect_fail:
-        assert result.returncode == 0, (
-            f"Script failed (rc={result.returncode}):\n"
-            f"STDOUT: {result.stdout}\nSTDERR: {result.stderr}"
-        )
-    return result
+ENV = {
+    "BUILD_ID": "test-value-build_id",
+    "TIMELINE_ID": "test-value-timeline_id",
+    "RECORD_ID": "test-value-record_id",
+    "TYPE": "test-value-type",
+    "NAME": "test-value-name",
+}
+CONTENT = b"test-content"
 
 
 class TestGetAttachmentsEnvValidation:
@@ -68,83 +37,59 @@ class TestGetAttachmentsEnvValidation:
 
     @pytest.mark.offline
     @pytest.mark.build
-    def test_missing_org_exits(self):
-        result = _run_script(
-            env_override={"AZURE_DEVOPS_ORG": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "AZURE_DEVOPS_ORG" in result.stderr or "AZURE_DEVOPS_ORG" in result.stdout
+    def test_missing_org_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "AZURE_DEVOPS_ORG": None})
+        assert code != 0
+        assert "AZURE_DEVOPS_ORG" in output
 
     @pytest.mark.offline
     @pytest.mark.build
-    def test_missing_pat_exits(self):
-        result = _run_script(
-            env_override={"AZURE_DEVOPS_PAT": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "AZURE_DEVOPS_PAT" in result.stderr or "AZURE_DEVOPS_PAT" in result.stdout
+    def test_missing_pat_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "AZURE_DEVOPS_PAT": None})
+        assert code != 0
+        assert "AZURE_DEVOPS_PAT" in output
 
     @pytest.mark.offline
     @pytest.mark.build
-    def test_missing_project_id_exits(self):
-        result = _run_script(
-            env_override={"PROJECT_ID": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "PROJECT_ID" in (result.stderr + result.stdout)
+    def test_missing_project_id_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "PROJECT_ID": None})
+        assert code != 0
+        assert "PROJECT_ID" in output
 
     @pytest.mark.offline
     @pytest.mark.build
-    def test_missing_build_id_exits(self):
-        result = _run_script(
-            env_override={"BUILD_ID": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "BUILD_ID" in result.stderr or "BUILD_ID" in result.stdout
+    def test_missing_build_id_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "BUILD_ID": None})
+        assert code != 0
+        assert "BUILD_ID" in output
 
     @pytest.mark.offline
     @pytest.mark.build
-    def test_missing_timeline_id_exits(self):
-        result = _run_script(
-            env_override={"TIMELINE_ID": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "TIMELINE_ID" in result.stderr or "TIMELINE_ID" in result.stdout
+    def test_missing_timeline_id_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "TIMELINE_ID": None})
+        assert code != 0
+        assert "TIMELINE_ID" in output
 
     @pytest.mark.offline
     @pytest.mark.build
-    def test_missing_record_id_exits(self):
-        result = _run_script(
-            env_override={"RECORD_ID": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "RECORD_ID" in result.stderr or "RECORD_ID" in result.stdout
+    def test_missing_record_id_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "RECORD_ID": None})
+        assert code != 0
+        assert "RECORD_ID" in output
 
     @pytest.mark.offline
     @pytest.mark.build
-    def test_missing_type_exits(self):
-        result = _run_script(
-            env_override={"TYPE": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "TYPE" in result.stderr or "TYPE" in result.stdout
+    def test_missing_type_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "TYPE": None})
+        assert code != 0
+        assert "TYPE" in output
 
     @pytest.mark.offline
     @pytest.mark.build
-    def test_missing_name_exits(self):
-        result = _run_script(
-            env_override={"NAME": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "NAME" in result.stderr or "NAME" in result.stdout
+    def test_missing_name_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "NAME": None})
+        assert code != 0
+        assert "NAME" in output
 
 
 class TestGetAttachmentsURLAndAuth:
@@ -153,56 +98,42 @@ class TestGetAttachmentsURLAndAuth:
     @pytest.mark.offline
     @pytest.mark.build
     @responses.activate
-    def test_correct_url_and_auth_header(self):
-        """Verify the script builds the right URL and Authorization header."""
-        import base64
-
-        org = "testorg"
-        pat = "fakepat1234567890"
+    def test_correct_url_and_auth_header(self, ado_client, ado_env):
+        """Verify the operation builds the right URL and Authorization header."""
         expected_url = "https://dev.azure.com/testorg/a1b2c3d4-e5f6-7890-abcd-ef1234567890/_apis/build/builds/test-value-build_id/test-value-timeline_id/test-value-record_id/attachments/test-value-type/test-value-name?api-version=7.2"
+        responses.add(responses.GET, expected_url, body=CONTENT, status=200)
 
-        fixture = json.loads((FIXTURES / "get_attachments_200.json").read_text())
-        responses.add(responses.GET, expected_url, json=fixture, status=200)
-
-        import requests as req
+        destination = io.BytesIO()
+        written = get_attachments(ado_client, ado_env["PROJECT_ID"], "test-value-build_id", "test-value-timeline_id", "test-value-record_id", "test-value-type", "test-value-name", destination=destination)
 
-        cred = base64.b64encode(f":{pat}".encode("ascii")).decode("ascii")
-        headers = {
-            "Authorization": f"Basic {cred}",
-            "Content-Type": "application/json",
-        }
-        resp = req.get(expected_url, headers=headers, timeout=30)
-
-        assert resp.status_code == 200
+        assert written == len(CONTENT)
+        assert destination.getvalue() == CONTENT
         assert len(responses.calls) == 1
+        assert responses.calls[0].request.url == expected_url
         sent_auth = responses.calls[0].request.headers["Authorization"]
-        assert sent_auth.startswith("Basic ")
+        assert sent_auth == "Basic OmZha2VwYXQxMjM0NTY3ODkw"
 
 
 class TestGetAttachmentsHTTPErrors:
-    """Validate behaviour on error status codes."""
+    """Validate the typed error raised for error status codes."""
 
     @pytest.mark.offline
     @pytest.mark.build
     @responses.activate
-    def test_401_unauthorized(self):
+    def test_401_unauthorized(self, ado_client, ado_env):
         url = "https://dev.azure.com/testorg/a1b2c3d4-e5f6-7890-abcd-ef1234567890/_apis/build/builds/test-value-build_id/test-value-timeline_id/test-value-record_id/attachments/test-value-type/test-value-name?api-version=7.2"
         responses.add(responses.GET, url, json={"message": "unauthorized"}, status=401)
 
-        import requests as req
-
-        resp = req.get(url, headers={"Authorization": "Basic fake"}, timeout=30)
-        assert resp.status_code == 401
+        with pytest.raises(AdoAuthError):
+            get_attachments(ado_client, ado_env["PROJECT_ID"], "test-value-build_id", "test-value-timeline_id", "test-value-record_id", "test-value-type", "test-value-name", destination=io.BytesIO())
 
     @pytest.mark.offline
     @pytest.mark.build
     @responses.activate
-    def test_404_not_found(self):
+    def test_404_not_found(self, ado_client, ado_env):
         url = "https://dev.azure.com/testorg/a1b2c3d4-e5f6-7890-abcd-ef1234567890/_apis/build/builds/test-value-build_id/test-value-timeline_id/test-value-record_id/attachments/test-value-type/test-value-name?api-version=7.2"
         responses.add(responses.GET, url, json={"message": "not_found"}, status=404)
 
-        import requests as req
-
-        resp = req.get(url, headers={"Authorization": "Basic fake"}, timeout=30)
-        assert resp.status_code == 404
+        with pytest.raises(AdoNotFound):
+            get_attachments(ado_client, ado_env["PROJECT_ID"], "test-value-build_id", "test-value-timeline_id", "test-value-record_id", "test-value-type", "test-value-name", destination=io.BytesIO())
 
@@ -10,47 +10,70 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/build/badge/get?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-DEFINITION_ID = get_env_or_exit("DEFINITION_ID", "The ID of the definition.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_badge", PAT)
-logger.info("This endpoint is deprecated.")
+def get_badge(client, project: str, definition_id: str) -> dict:
+    """
+    This endpoint is deprecated.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        definition_id: The ID of the definition.
+
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/public/build/definitions/{definition_id}/badge", API_VERSION, project=project)
+    response = client.request("GET", url)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/public/build/definitions/{DEFINITION_ID}/badge", API_VERSION, project=PROJECT_ID)
-logger.info(f"GET {url}")
 
-response = execute_request("GET", url, HEADERS)
+async def get_badge_async(client, project: str, definition_id: str) -> dict:
+    """Async variant of get_badge() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/public/build/definitions/{definition_id}/badge", API_VERSION, project=project)
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_badge() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    definition_id = require_env("DEFINITION_ID", "The ID of the definition.")
+
+    logger = AdoLogger("get_badge", pat)
+    logger.info("This endpoint is deprecated.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = get_badge(client, project, definition_id)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,74 +11,100 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/build/builds/updat
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-BUILD_ID = get_env_or_exit("BUILD_ID", "The ID of the build.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Updates a build.")
-parser.add_argument("--agent-specification", required=False, help="The agent specification for the build.")
-parser.add_argument("--append-commit-message-to-run-name", required=False, help="Append Commit Message To BuildNumber in UI.")
-parser.add_argument("--build-number", required=False, help="The build number/name of the build.")
-parser.add_argument("--build-number-revision", required=False, help="The build number revision.")
-parser.add_argument("--controller", required=False, help="The build controller. This is only set if the definition type is Xaml.")
-args = parser.parse_args()
+def update_build(client, project: str, build_id: str, *, agent_specification: Optional[str] = None, append_commit_message_to_run_name: Optional[str] = None, build_number: Optional[str] = None, build_number_revision: Optional[str] = None, controller: Optional[str] = None) -> dict:
+    """
+    Updates a build.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        build_id: The ID of the build.
+        agent_specification: The agent specification for the build.
+        append_commit_message_to_run_name: Append Commit Message To BuildNumber in UI.
+        build_number: The build number/name of the build.
+        build_number_revision: The build number revision.
+        controller: The build controller. This is only set if the definition type is Xaml.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "agentSpecification": agent_specification,
+        "appendCommitMessageToRunName": append_commit_message_to_run_name,
+        "buildNumber": build_number,
+        "buildNumberRevision": build_number_revision,
+        "controller": controller,
+    }
+    url = build_url(client.organization, f"_apis/build/builds/{build_id}", API_VERSION, project=project)
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'agentSpecification'], API_VERSION)
+    return data
+
+
+async def update_build_async(client, project: str, build_id: str, *, agent_specification: Optional[str] = None, append_commit_message_to_run_name: Optional[str] = None, build_number: Optional[str] = None, build_number_revision: Optional[str] = None, controller: Optional[str] = None) -> dict:
+    """Async variant of update_build() for use with AsyncAdoClient."""
+    body = {
+        "agentSpecification": agent_specification,
+        "appendCommitMessageToRunName": append_commit_message_to_run_name,
+        "buildNumber": build_number,
+        "buildNumberRevision": build_number_revision,
+        "controller": controller,
+    }
+    url = build_url(client.organization, f"_apis/build/builds/{build_id}", API_VERSION, project=project)
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'agentSpecification'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_build", PAT)
-logger.info("Updates a build.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "agentSpecification": args.agent_specification,
-    "appendCommitMessageToRunName": args.append_commit_message_to_run_name,
-    "buildNumber": args.build_number,
-    "buildNumberRevision": args.build_number_revision,
-    "controller": args.controller,
-}
+def main() -> None:
+    """Read env vars / flags, call update_build() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    build_id = require_env("BUILD_ID", "The ID of the build.")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/build/builds/{BUILD_ID}", API_VERSION, project=PROJECT_ID)
-logger.info(f"PATCH {url}")
+    parser = argparse.ArgumentParser(description="Updates a build.")
+    parser.add_argument("--agent-specification", required=False, help="The agent specification for the build.")
+    parser.add_argument("--append-commit-message-to-run-name", required=False, help="Append Commit Message To BuildNumber in UI.")
+    parser.add_argument("--build-number", required=False, help="The build number/name of the build.")
+    parser.add_argument("--build-number-revision", required=False, help="The build number revision.")
+    parser.add_argument("--controller", required=False, help="The build controller. This is only set if the definition type is Xaml.")
+    args = parser.parse_args()
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+    logger = AdoLogger("update_build", pat)
+    logger.info("Updates a build.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_build(client, project, build_id, agent_specification=args.agent_specification, append_commit_message_to_run_name=args.append_commit_message_to_run_name, build_number=args.build_number, build_number_revision=args.build_number_revision, controller=args.controller)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'agentSpecification'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
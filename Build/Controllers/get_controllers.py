@@ -10,51 +10,70 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/build/controllers/get?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-CONTROLLER_ID = get_env_or_exit("CONTROLLER_ID", "controllerId")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_controllers", PAT)
-logger.info("Gets a controller")
+def get_controllers(client, controller_id: str) -> dict:
+    """
+    Gets a controller
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/build/controllers/{CONTROLLER_ID}", API_VERSION)
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        controller_id: controllerId
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/build/controllers/{controller_id}", API_VERSION)
+    response = client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['createdDate', 'description'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['createdDate', 'description'], API_VERSION)
+async def get_controllers_async(client, controller_id: str) -> dict:
+    """Async variant of get_controllers() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/build/controllers/{controller_id}", API_VERSION)
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['createdDate', 'description'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_controllers() and print the result."""
+    organization, pat = get_common_env()
+    controller_id = require_env("CONTROLLER_ID", "controllerId")
+
+    logger = AdoLogger("get_controllers", pat)
+    logger.info("Gets a controller")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = get_controllers(client, controller_id)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
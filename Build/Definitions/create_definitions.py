@@ -11,75 +11,102 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/build/definitions/
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Creates a new definition.")
-parser.add_argument("--badge-enabled", required=False, help="Indicates whether badges are enabled for this definition.")
-parser.add_argument("--build-number-format", required=False, help="The build number format.")
-parser.add_argument("--comment", required=False, help="A save-time comment for the definition.")
-parser.add_argument("--demands", required=False, help="demands")
-parser.add_argument("--description", required=False, help="The description.")
-parser.add_argument("--drop-location", required=False, help="The drop location for the definition.")
-args = parser.parse_args()
+def create_definitions(client, project: str, *, badge_enabled: Optional[str] = None, build_number_format: Optional[str] = None, comment: Optional[str] = None, demands: Optional[str] = None, description: Optional[str] = None, drop_location: Optional[str] = None) -> dict:
+    """
+    Creates a new definition.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        badge_enabled: Indicates whether badges are enabled for this definition.
+        build_number_format: The build number format.
+        comment: A save-time comment for the definition.
+        demands: demands
+        description: The description.
+        drop_location: The drop location for the definition.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "badgeEnabled": badge_enabled,
+        "buildNumberFormat": build_number_format,
+        "comment": comment,
+        "demands": demands,
+        "description": description,
+        "dropLocation": drop_location,
+    }
+    url = build_url(client.organization, f"_apis/build/definitions", API_VERSION, project=project)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['badgeEnabled', 'buildNumberFormat'], API_VERSION)
+    return data
+
+
+async def create_definitions_async(client, project: str, *, badge_enabled: Optional[str] = None, build_number_format: Optional[str] = None, comment: Optional[str] = None, demands: Optional[str] = None, description: Optional[str] = None, drop_location: Optional[str] = None) -> dict:
+    """Async variant of create_definitions() for use with AsyncAdoClient."""
+    body = {
+        "badgeEnabled": badge_enabled,
+        "buildNumberFormat": build_number_format,
+        "comment": comment,
+        "demands": demands,
+        "description": description,
+        "dropLocation": drop_location,
+    }
+    url = build_url(client.organization, f"_apis/build/definitions", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['badgeEnabled', 'buildNumberFormat'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_definitions", PAT)
-logger.info("Creates a new definition.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "badgeEnabled": args.badge_enabled,
-    "buildNumberFormat": args.build_number_format,
-    "comment": args.comment,
-    "demands": args.demands,
-    "description": args.description,
-    "dropLocation": args.drop_location,
-}
+def main() -> None:
+    """Read env vars / flags, call create_definitions() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/build/definitions", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Creates a new definition.")
+    parser.add_argument("--badge-enabled", required=False, help="Indicates whether badges are enabled for this definition.")
+    parser.add_argument("--build-number-format", required=False, help="The build number format.")
+    parser.add_argument("--comment", required=False, help="A save-time comment for the definition.")
+    parser.add_argument("--demands", required=False, help="demands")
+    parser.add_argument("--description", required=False, help="The description.")
+    parser.add_argument("--drop-location", required=False, help="The drop location for the definition.")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_definitions", pat)
+    logger.info("Creates a new definition.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_definitions(client, project, badge_enabled=args.badge_enabled, build_number_format=args.build_number_format, comment=args.comment, demands=args.demands, description=args.description, drop_location=args.drop_location)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['badgeEnabled', 'buildNumberFormat'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
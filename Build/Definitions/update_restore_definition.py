@@ -10,53 +10,74 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/build/definitions/restore-definition?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-DEFINITION_ID = get_env_or_exit("DEFINITION_ID", "The identifier of the definition to restore.")
-DELETED = get_env_or_exit("DELETED", "When false, restores a deleted definition.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_restore_definition", PAT)
-logger.info("Restores a deleted definition")
+def update_restore_definition(client, project: str, definition_id: str, deleted: str) -> dict:
+    """
+    Restores a deleted definition
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/build/definitions/{DEFINITION_ID}", API_VERSION, project=PROJECT_ID)
-logger.info(f"PATCH {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        definition_id: The identifier of the definition to restore.
+        deleted: When false, restores a deleted definition.
 
-response = execute_request("PATCH", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/build/definitions/{definition_id}", API_VERSION, project=project)
+    response = client.request("PATCH", url)
+    data = loads(response.content)
+    version_guard(data, ['badgeEnabled', 'buildNumberFormat'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['badgeEnabled', 'buildNumberFormat'], API_VERSION)
+async def update_restore_definition_async(client, project: str, definition_id: str, deleted: str) -> dict:
+    """Async variant of update_restore_definition() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/build/definitions/{definition_id}", API_VERSION, project=project)
+    response = await client.request("PATCH", url)
+    data = loads(response.content)
+    version_guard(data, ['badgeEnabled', 'buildNumberFormat'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call update_restore_definition() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    definition_id = require_env("DEFINITION_ID", "The identifier of the definition to restore.")
+    deleted = require_env("DELETED", "When false, restores a deleted definition.")
+
+    logger = AdoLogger("update_restore_definition", pat)
+    logger.info("Restores a deleted definition")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = update_restore_definition(client, project, definition_id, deleted)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,75 +11,102 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/build/general-sett
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Updates pipeline general settings.")
-parser.add_argument("--audit-enforce-settable-var", required=False, help="If enabled, audit logs will be generated whenever someone queues a pipeline run and defines varia...")
-parser.add_argument("--builds-enabled-for-forks", required=False, help="Enable forked repositories to build pull requests.")
-parser.add_argument("--disable-classic-build-pipeline-creation", required=False, help="Disable classic build pipelines creation.")
-parser.add_argument("--disable-classic-pipeline-creation", required=False, help="Disable classic pipelines creation.")
-parser.add_argument("--disable-classic-release-pipeline-creation", required=False, help="Disable classic release pipelines creation.")
-parser.add_argument("--disable-implied-yaml-ci-trigger", required=False, help="Disable implied pipeline CI triggers if the trigger section in YAML is missing.")
-args = parser.parse_args()
+def update_general_settings(client, project: str, *, audit_enforce_settable_var: Optional[str] = None, builds_enabled_for_forks: Optional[str] = None, disable_classic_build_pipeline_creation: Optional[str] = None, disable_classic_pipeline_creation: Optional[str] = None, disable_classic_release_pipeline_creation: Optional[str] = None, disable_implied_yaml_ci_trigger: Optional[str] = None) -> dict:
+    """
+    Updates pipeline general settings.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        audit_enforce_settable_var: If enabled, audit logs will be generated whenever someone queues a pipeline run and defines varia...
+        builds_enabled_for_forks: Enable forked repositories to build pull requests.
+        disable_classic_build_pipeline_creation: Disable classic build pipelines creation.
+        disable_classic_pipeline_creation: Disable classic pipelines creation.
+        disable_classic_release_pipeline_creation: Disable classic release pipelines creation.
+        disable_implied_yaml_ci_trigger: Disable implied pipeline CI triggers if the trigger section in YAML is missing.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "auditEnforceSettableVar": audit_enforce_settable_var,
+        "buildsEnabledForForks": builds_enabled_for_forks,
+        "disableClassicBuildPipelineCreation": disable_classic_build_pipeline_creation,
+        "disableClassicPipelineCreation": disable_classic_pipeline_creation,
+        "disableClassicReleasePipelineCreation": disable_classic_release_pipeline_creation,
+        "disableImpliedYAMLCiTrigger": disable_implied_yaml_ci_trigger,
+    }
+    url = build_url(client.organization, f"_apis/build/generalsettings", API_VERSION, project=project)
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['auditEnforceSettableVar', 'buildsEnabledForForks'], API_VERSION)
+    return data
+
+
+async def update_general_settings_async(client, project: str, *, audit_enforce_settable_var: Optional[str] = None, builds_enabled_for_forks: Optional[str] = None, disable_classic_build_pipeline_creation: Optional[str] = None, disable_classic_pipeline_creation: Optional[str] = None, disable_classic_release_pipeline_creation: Optional[str] = None, disable_implied_yaml_ci_trigger: Optional[str] = None) -> dict:
+    """Async variant of update_general_settings() for use with AsyncAdoClient."""
+    body = {
+        "auditEnforceSettableVar": audit_enforce_settable_var,
+        "buildsEnabledForForks": builds_enabled_for_forks,
+        "disableClassicBuildPipelineCreation": disable_classic_build_pipeline_creation,
+        "disableClassicPipelineCreation": disable_classic_pipeline_creation,
+        "disableClassicReleasePipelineCreation": disable_classic_release_pipeline_creation,
+        "disableImpliedYAMLCiTrigger": disable_implied_yaml_ci_trigger,
+    }
+    url = build_url(client.organization, f"_apis/build/generalsettings", API_VERSION, project=project)
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['auditEnforceSettableVar', 'buildsEnabledForForks'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_general_settings", PAT)
-logger.info("Updates pipeline general settings.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "auditEnforceSettableVar": args.audit_enforce_settable_var,
-    "buildsEnabledForForks": args.builds_enabled_for_forks,
-    "disableClassicBuildPipelineCreation": args.disable_classic_build_pipeline_creation,
-    "disableClassicPipelineCreation": args.disable_classic_pipeline_creation,
-    "disableClassicReleasePipelineCreation": args.disable_classic_release_pipeline_creation,
-    "disableImpliedYAMLCiTrigger": args.disable_implied_yaml_ci_trigger,
-}
+def main() -> None:
+    """Read env vars / flags, call update_general_settings() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/build/generalsettings", API_VERSION, project=PROJECT_ID)
-logger.info(f"PATCH {url}")
+    parser = argparse.ArgumentParser(description="Updates pipeline general settings.")
+    parser.add_argument("--audit-enforce-settable-var", required=False, help="If enabled, audit logs will be generated whenever someone queues a pipeline run and defines varia...")
+    parser.add_argument("--builds-enabled-for-forks", required=False, help="Enable forked repositories to build pull requests.")
+    parser.add_argument("--disable-classic-build-pipeline-creation", required=False, help="Disable classic build pipelines creation.")
+    parser.add_argument("--disable-classic-pipeline-creation", required=False, help="Disable classic pipelines creation.")
+    parser.add_argument("--disable-classic-release-pipeline-creation", required=False, help="Disable classic release pipelines creation.")
+    parser.add_argument("--disable-implied-yaml-ci-trigger", required=False, help="Disable implied pipeline CI triggers if the trigger section in YAML is missing.")
+    args = parser.parse_args()
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+    logger = AdoLogger("update_general_settings", pat)
+    logger.info("Updates pipeline general settings.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_general_settings(client, project, audit_enforce_settable_var=args.audit_enforce_settable_var, builds_enabled_for_forks=args.builds_enabled_for_forks, disable_classic_build_pipeline_creation=args.disable_classic_build_pipeline_creation, disable_classic_pipeline_creation=args.disable_classic_pipeline_creation, disable_classic_release_pipeline_creation=args.disable_classic_release_pipeline_creation, disable_implied_yaml_ci_trigger=args.disable_implied_yaml_ci_trigger)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['auditEnforceSettableVar', 'buildsEnabledForForks'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
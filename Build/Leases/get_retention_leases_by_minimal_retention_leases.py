@@ -10,47 +10,82 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/build/leases/get-retention-leases-by-minimal-retention-leases?view=azure-devops-rest-7.2
 """
 
-import json
+import argparse
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-LEASES_TO_FETCH = get_env_or_exit("LEASES_TO_FETCH", "List of JSON-serialized MinimalRetentionLeases separated by '|'")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_retention_leases_by_minimal_retention_leases", PAT)
-logger.info("Returns any leases matching the specified MinimalRetentionLeases")
+def get_retention_leases_by_minimal_retention_leases(client, project: str, leases_to_fetch: str) -> dict:
+    """
+    Returns any leases matching the specified MinimalRetentionLeases
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/build/retention/leases", API_VERSION, project=PROJECT_ID)
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        leases_to_fetch: List of JSON-serialized MinimalRetentionLeases separated by '|'
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/build/retention/leases", API_VERSION, project=project)
+    response = client.request("GET", url)
+    data = loads(response.content)
+    return data
+
+
+async def get_retention_leases_by_minimal_retention_leases_async(client, project: str, leases_to_fetch: str) -> dict:
+    """Async variant of get_retention_leases_by_minimal_retention_leases() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/build/retention/leases", API_VERSION, project=project)
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_retention_leases_by_minimal_retention_leases() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    leases_to_fetch = require_env("LEASES_TO_FETCH", "List of JSON-serialized MinimalRetentionLeases separated by '|'")
+
+    parser = argparse.ArgumentParser(description="Returns any leases matching the specified MinimalRetentionLeases")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("get_retention_leases_by_minimal_retention_leases", pat)
+    logger.info("Returns any leases matching the specified MinimalRetentionLeases")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        items = items_of(get_retention_leases_by_minimal_retention_leases(client, project, leases_to_fetch), "value")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    data = get_retention_leases_by_minimal_retention_leases(client, project, leases_to_fetch)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
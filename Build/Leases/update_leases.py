@@ -11,68 +11,88 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/build/leases/updat
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-LEASE_ID = get_env_or_exit("LEASE_ID", "The ID of the lease to update.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Updates the duration or pipeline protection status of a retention lease.")
-parser.add_argument("--days-valid", required=False, help="The number of days to consider the lease valid. A retention lease valid for more than 100 years (...")
-parser.add_argument("--protect-pipeline", required=False, help="If set, this lease will also prevent the pipeline from being deleted while the lease is still valid.")
-args = parser.parse_args()
+def update_leases(client, project: str, lease_id: str, *, days_valid: Optional[str] = None, protect_pipeline: Optional[str] = None) -> dict:
+    """
+    Updates the duration or pipeline protection status of a retention lease.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        lease_id: The ID of the lease to update.
+        days_valid: The number of days to consider the lease valid. A retention lease valid for more than 100 years (...
+        protect_pipeline: If set, this lease will also prevent the pipeline from being deleted while the lease is still valid.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "daysValid": days_valid,
+        "protectPipeline": protect_pipeline,
+    }
+    url = build_url(client.organization, f"_apis/build/retention/leases/{lease_id}", API_VERSION, project=project)
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['createdOn', 'definitionId'], API_VERSION)
+    return data
+
+
+async def update_leases_async(client, project: str, lease_id: str, *, days_valid: Optional[str] = None, protect_pipeline: Optional[str] = None) -> dict:
+    """Async variant of update_leases() for use with AsyncAdoClient."""
+    body = {
+        "daysValid": days_valid,
+        "protectPipeline": protect_pipeline,
+    }
+    url = build_url(client.organization, f"_apis/build/retention/leases/{lease_id}", API_VERSION, project=project)
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['createdOn', 'definitionId'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_leases", PAT)
-logger.info("Updates the duration or pipeline protection status of a retention lease.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "daysValid": args.days_valid,
-    "protectPipeline": args.protect_pipeline,
-}
+def main() -> None:
+    """Read env vars / flags, call update_leases() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    lease_id = require_env("LEASE_ID", "The ID of the lease to update.")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/build/retention/leases/{LEASE_ID}", API_VERSION, project=PROJECT_ID)
-logger.info(f"PATCH {url}")
+    parser = argparse.ArgumentParser(description="Updates the duration or pipeline protection status of a retention lease.")
+    parser.add_argument("--days-valid", required=False, help="The number of days to consider the lease valid. A retention lease valid for more than 100 years (...")
+    parser.add_argument("--protect-pipeline", required=False, help="If set, this lease will also prevent the pipeline from being deleted while the lease is still valid.")
+    args = parser.parse_args()
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+    logger = AdoLogger("update_leases", pat)
+    logger.info("Updates the duration or pipeline protection status of a retention lease.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_leases(client, project, lease_id, days_valid=args.days_valid, protect_pipeline=args.protect_pipeline)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['createdOn', 'definitionId'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
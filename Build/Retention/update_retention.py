@@ -11,71 +11,94 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/build/retention/up
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Updates the project's retention settings.")
-parser.add_argument("--artifacts-retention", required=False, help="artifactsRetention")
-parser.add_argument("--pull-request-run-retention", required=False, help="pullRequestRunRetention")
-parser.add_argument("--retain-runs-per-protected-branch", required=False, help="retainRunsPerProtectedBranch")
-parser.add_argument("--run-retention", required=False, help="runRetention")
-args = parser.parse_args()
+def update_retention(client, project: str, *, artifacts_retention: Optional[str] = None, pull_request_run_retention: Optional[str] = None, retain_runs_per_protected_branch: Optional[str] = None, run_retention: Optional[str] = None) -> dict:
+    """
+    Updates the project's retention settings.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        artifacts_retention: artifactsRetention
+        pull_request_run_retention: pullRequestRunRetention
+        retain_runs_per_protected_branch: retainRunsPerProtectedBranch
+        run_retention: runRetention
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "artifactsRetention": artifacts_retention,
+        "pullRequestRunRetention": pull_request_run_retention,
+        "retainRunsPerProtectedBranch": retain_runs_per_protected_branch,
+        "runRetention": run_retention,
+    }
+    url = build_url(client.organization, f"_apis/build/retention", API_VERSION, project=project)
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['purgeArtifacts', 'purgePullRequestRuns'], API_VERSION)
+    return data
+
+
+async def update_retention_async(client, project: str, *, artifacts_retention: Optional[str] = None, pull_request_run_retention: Optional[str] = None, retain_runs_per_protected_branch: Optional[str] = None, run_retention: Optional[str] = None) -> dict:
+    """Async variant of update_retention() for use with AsyncAdoClient."""
+    body = {
+        "artifactsRetention": artifacts_retention,
+        "pullRequestRunRetention": pull_request_run_retention,
+        "retainRunsPerProtectedBranch": retain_runs_per_protected_branch,
+        "runRetention": run_retention,
+    }
+    url = build_url(client.organization, f"_apis/build/retention", API_VERSION, project=project)
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['purgeArtifacts', 'purgePullRequestRuns'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_retention", PAT)
-logger.info("Updates the project's retention settings.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "artifactsRetention": args.artifacts_retention,
-    "pullRequestRunRetention": args.pull_request_run_retention,
-    "retainRunsPerProtectedBranch": args.retain_runs_per_protected_branch,
-    "runRetention": args.run_retention,
-}
+def main() -> None:
+    """Read env vars / flags, call update_retention() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/build/retention", API_VERSION, project=PROJECT_ID)
-logger.info(f"PATCH {url}")
+    parser = argparse.ArgumentParser(description="Updates the project's retention settings.")
+    parser.add_argument("--artifacts-retention", required=False, help="artifactsRetention")
+    parser.add_argument("--pull-request-run-retention", required=False, help="pullRequestRunRetention")
+    parser.add_argument("--retain-runs-per-protected-branch", required=False, help="retainRunsPerProtectedBranch")
+    parser.add_argument("--run-retention", required=False, help="runRetention")
+    args = parser.parse_args()
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+    logger = AdoLogger("update_retention", pat)
+    logger.info("Updates the project's retention settings.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_retention(client, project, artifacts_retention=args.artifacts_retention, pull_request_run_retention=args.pull_request_run_retention, retain_runs_per_protected_branch=args.retain_runs_per_protected_branch, run_retention=args.run_retention)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['purgeArtifacts', 'purgePullRequestRuns'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,69 +11,90 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/build/settings/upd
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Updates the build settings.")
-parser.add_argument("--days-to-keep-deleted-builds-before-destroy", required=False, help="The number of days to keep records of deleted builds.")
-parser.add_argument("--default-retention-policy", required=False, help="The default retention policy.")
-parser.add_argument("--maximum-retention-policy", required=False, help="The maximum retention policy.")
-args = parser.parse_args()
+def update_settings(client, project: str, *, days_to_keep_deleted_builds_before_destroy: Optional[str] = None, default_retention_policy: Optional[str] = None, maximum_retention_policy: Optional[str] = None) -> dict:
+    """
+    Updates the build settings.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        days_to_keep_deleted_builds_before_destroy: The number of days to keep records of deleted builds.
+        default_retention_policy: The default retention policy.
+        maximum_retention_policy: The maximum retention policy.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "daysToKeepDeletedBuildsBeforeDestroy": days_to_keep_deleted_builds_before_destroy,
+        "defaultRetentionPolicy": default_retention_policy,
+        "maximumRetentionPolicy": maximum_retention_policy,
+    }
+    url = build_url(client.organization, f"_apis/build/settings", API_VERSION, project=project)
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['daysToKeepDeletedBuildsBeforeDestroy', 'defaultRetentionPolicy'], API_VERSION)
+    return data
+
+
+async def update_settings_async(client, project: str, *, days_to_keep_deleted_builds_before_destroy: Optional[str] = None, default_retention_policy: Optional[str] = None, maximum_retention_policy: Optional[str] = None) -> dict:
+    """Async variant of update_settings() for use with AsyncAdoClient."""
+    body = {
+        "daysToKeepDeletedBuildsBeforeDestroy": days_to_keep_deleted_builds_before_destroy,
+        "defaultRetentionPolicy": default_retention_policy,
+        "maximumRetentionPolicy": maximum_retention_policy,
+    }
+    url = build_url(client.organization, f"_apis/build/settings", API_VERSION, project=project)
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['daysToKeepDeletedBuildsBeforeDestroy', 'defaultRetentionPolicy'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_settings", PAT)
-logger.info("Updates the build settings.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "daysToKeepDeletedBuildsBeforeDestroy": args.days_to_keep_deleted_builds_before_destroy,
-    "defaultRetentionPolicy": args.default_retention_policy,
-    "maximumRetentionPolicy": args.maximum_retention_policy,
-}
+def main() -> None:
+    """Read env vars / flags, call update_settings() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/build/settings", API_VERSION, project=PROJECT_ID)
-logger.info(f"PATCH {url}")
+    parser = argparse.ArgumentParser(description="Updates the build settings.")
+    parser.add_argument("--days-to-keep-deleted-builds-before-destroy", required=False, help="The number of days to keep records of deleted builds.")
+    parser.add_argument("--default-retention-policy", required=False, help="The default retention policy.")
+    parser.add_argument("--maximum-retention-policy", required=False, help="The maximum retention policy.")
+    args = parser.parse_args()
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+    logger = AdoLogger("update_settings", pat)
+    logger.info("Updates the build settings.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_settings(client, project, days_to_keep_deleted_builds_before_destroy=args.days_to_keep_deleted_builds_before_destroy, default_retention_policy=args.default_retention_policy, maximum_retention_policy=args.maximum_retention_policy)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['daysToKeepDeletedBuildsBeforeDestroy', 'defaultRetentionPolicy'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
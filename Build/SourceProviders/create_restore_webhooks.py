@@ -10,47 +10,70 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/build/source-providers/restore-webhooks?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-PROVIDER_NAME = get_env_or_exit("PROVIDER_NAME", "The name of the source provider.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_restore_webhooks", PAT)
-logger.info("Recreates the webhooks for the specified triggers in the given source code repository.")
+def create_restore_webhooks(client, project: str, provider_name: str) -> dict:
+    """
+    Recreates the webhooks for the specified triggers in the given source code repository.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        provider_name: The name of the source provider.
+
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/sourceProviders/{provider_name}/webhooks", API_VERSION, project=project)
+    response = client.request("POST", url)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/sourceProviders/{PROVIDER_NAME}/webhooks", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
 
-response = execute_request("POST", url, HEADERS)
+async def create_restore_webhooks_async(client, project: str, provider_name: str) -> dict:
+    """Async variant of create_restore_webhooks() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/sourceProviders/{provider_name}/webhooks", API_VERSION, project=project)
+    response = await client.request("POST", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call create_restore_webhooks() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    provider_name = require_env("PROVIDER_NAME", "The name of the source provider.")
+
+    logger = AdoLogger("create_restore_webhooks", pat)
+    logger.info("Recreates the webhooks for the specified triggers in the given source code repository.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = create_restore_webhooks(client, project, provider_name)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,47 +10,76 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/build/source-providers/get-file-contents?view=azure-devops-rest-7.2
 """
 
-import json
+import argparse
 import os
 import sys
+from typing import BinaryIO, Union
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.async_http_client import astream_to
+from _shared.http_client import AdoClient, build_url, stream_to
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-PROVIDER_NAME = get_env_or_exit("PROVIDER_NAME", "The name of the source provider.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_file_contents", PAT)
-logger.info("Gets the contents of a file in the given source code repository.")
+def get_file_contents(client, project: str, provider_name: str, *, destination: Union[str, BinaryIO]) -> int:
+    """
+    Gets the contents of a file in the given source code repository.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        provider_name: The name of the source provider.
+        destination: Output path or binary file (e.g. sys.stdout.buffer).
+
+    Returns:
+        Bytes written; the text/plain body is streamed in constant memory.
+    """
+    url = build_url(client.organization, f"_apis/sourceProviders/{provider_name}/filecontents", API_VERSION, project=project)
+    response = client.request("GET", url, stream=True, accept="text/plain")
+    return stream_to(response, destination)
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/sourceProviders/{PROVIDER_NAME}/filecontents", API_VERSION, project=PROJECT_ID)
-logger.info(f"GET {url}")
 
-response = execute_request("GET", url, HEADERS)
+async def get_file_contents_async(client, project: str, provider_name: str, *, destination: Union[str, BinaryIO]) -> int:
+    """Async variant of get_file_contents() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/sourceProviders/{provider_name}/filecontents", API_VERSION, project=project)
+    response = await client.request("GET", url, stream=True, accept="text/plain")
+    return await astream_to(response, destination)
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_file_contents() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    provider_name = require_env("PROVIDER_NAME", "The name of the source provider.")
+
+    parser = argparse.ArgumentParser(description="Gets the contents of a file in the given source code repository.")
+    parser.add_argument("--output", help="Write the content to this file (default: stdout)")
+    args = parser.parse_args()
+
+    logger = AdoLogger("get_file_contents", pat)
+    logger.info("Gets the contents of a file in the given source code repository.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    written = get_file_contents(client, project, provider_name, destination=args.output or sys.stdout.buffer)
+    logger.info(f"Downloaded {written} bytes")
+    if args.output:
+        print(f"Saved {written} bytes to {args.output}")
+
+
+if __name__ == "__main__":
+    run_cli(main)
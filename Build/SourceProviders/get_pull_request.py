@@ -10,54 +10,75 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/build/source-providers/get-pull-request?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-PROVIDER_NAME = get_env_or_exit("PROVIDER_NAME", "The name of the source provider.")
-PULL_REQUEST_ID = get_env_or_exit("PULL_REQUEST_ID", "Vendor-specific id of the pull request.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_pull_request", PAT)
-logger.info("Gets a pull request object from source provider.")
+def get_pull_request(client, project: str, provider_name: str, pull_request_id: str) -> dict:
+    """
+    Gets a pull request object from source provider.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/sourceProviders/{PROVIDER_NAME}/pullrequests/{PULL_REQUEST_ID}", API_VERSION, project=PROJECT_ID)
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        provider_name: The name of the source provider.
+        pull_request_id: Vendor-specific id of the pull request.
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/sourceProviders/{provider_name}/pullrequests/{pull_request_id}", API_VERSION, project=project)
+    response = client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['id', 'author'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'author'], API_VERSION)
+async def get_pull_request_async(client, project: str, provider_name: str, pull_request_id: str) -> dict:
+    """Async variant of get_pull_request() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/sourceProviders/{provider_name}/pullrequests/{pull_request_id}", API_VERSION, project=project)
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['id', 'author'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(f"Source Providers ID: {data.get("id", "N/A")}")
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_pull_request() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    provider_name = require_env("PROVIDER_NAME", "The name of the source provider.")
+    pull_request_id = require_env("PULL_REQUEST_ID", "Vendor-specific id of the pull request.")
+
+    logger = AdoLogger("get_pull_request", pat)
+    logger.info("Gets a pull request object from source provider.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = get_pull_request(client, project, provider_name, pull_request_id)
+
+    print(f"Source Providers ID: {data.get('id', 'N/A')}")
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,66 +11,92 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/build/stages/updat
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-BUILD_ID = get_env_or_exit("BUILD_ID", "buildId")
-STAGE_REF_NAME = get_env_or_exit("STAGE_REF_NAME", "stageRefName")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Update a build stage")
-parser.add_argument("--force-retry-all-jobs", required=False, help="forceRetryAllJobs")
-parser.add_argument("--retry-dependencies", required=False, help="retryDependencies")
-parser.add_argument("--state", required=False, help="state")
-args = parser.parse_args()
+def update_stages(client, project: str, build_id: str, stage_ref_name: str, *, force_retry_all_jobs: Optional[str] = None, retry_dependencies: Optional[str] = None, state: Optional[str] = None) -> dict:
+    """
+    Update a build stage
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_stages", PAT)
-logger.info("Update a build stage")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        build_id: buildId
+        stage_ref_name: stageRefName
+        force_retry_all_jobs: forceRetryAllJobs
+        retry_dependencies: retryDependencies
+        state: state
 
-# ---------------------------------------------------------------------------
-# Request body
-# ---------------------------------------------------------------------------
-body = {
-    "forceRetryAllJobs": args.force_retry_all_jobs,
-    "retryDependencies": args.retry_dependencies,
-    "state": args.state,
-}
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "forceRetryAllJobs": force_retry_all_jobs,
+        "retryDependencies": retry_dependencies,
+        "state": state,
+    }
+    url = build_url(client.organization, f"_apis/build/builds/{build_id}/stages/{stage_ref_name}", API_VERSION, project=project)
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/build/builds/{BUILD_ID}/stages/{STAGE_REF_NAME}", API_VERSION, project=PROJECT_ID)
-logger.info(f"PATCH {url}")
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+async def update_stages_async(client, project: str, build_id: str, stage_ref_name: str, *, force_retry_all_jobs: Optional[str] = None, retry_dependencies: Optional[str] = None, state: Optional[str] = None) -> dict:
+    """Async variant of update_stages() for use with AsyncAdoClient."""
+    body = {
+        "forceRetryAllJobs": force_retry_all_jobs,
+        "retryDependencies": retry_dependencies,
+        "state": state,
+    }
+    url = build_url(client.organization, f"_apis/build/builds/{build_id}/stages/{stage_ref_name}", API_VERSION, project=project)
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call update_stages() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    build_id = require_env("BUILD_ID", "buildId")
+    stage_ref_name = require_env("STAGE_REF_NAME", "stageRefName")
+
+    parser = argparse.ArgumentParser(description="Update a build stage")
+    parser.add_argument("--force-retry-all-jobs", required=False, help="forceRetryAllJobs")
+    parser.add_argument("--retry-dependencies", required=False, help="retryDependencies")
+    parser.add_argument("--state", required=False, help="state")
+    args = parser.parse_args()
+
+    logger = AdoLogger("update_stages", pat)
+    logger.info("Update a build stage")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = update_stages(client, project, build_id, stage_ref_name, force_retry_all_jobs=args.force_retry_all_jobs, retry_dependencies=args.retry_dependencies, state=args.state)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,47 +10,70 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/build/status/get?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-DEFINITION = get_env_or_exit("DEFINITION", "Either the definition name with optional leading folder path, or the definition id.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_status", PAT)
-logger.info("<p>Gets the build status for a definition, optionally scoped to a specific branch, stage, job, and configuration.</p>...")
+def get_status(client, project: str, definition: str) -> dict:
+    """
+    <p>Gets the build status for a definition, optionally scoped to a specific branch, stage, job, and configuration.</p>...
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        definition: Either the definition name with optional leading folder path, or the definition id.
+
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/build/status/{definition}", API_VERSION, project=project)
+    response = client.request("GET", url)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/build/status/{DEFINITION}", API_VERSION, project=PROJECT_ID)
-logger.info(f"GET {url}")
 
-response = execute_request("GET", url, HEADERS)
+async def get_status_async(client, project: str, definition: str) -> dict:
+    """Async variant of get_status() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/build/status/{definition}", API_VERSION, project=project)
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_status() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    definition = require_env("DEFINITION", "Either the definition name with optional leading folder path, or the definition id.")
+
+    logger = AdoLogger("get_status", pat)
+    logger.info("<p>Gets the build status for a definition, optionally scoped to a specific branch, stage, job, and configuration.</p>...")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = get_status(client, project, definition)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,47 +10,82 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/build/tags/delete-tag?view=azure-devops-rest-7.2
 """
 
-import json
+import argparse
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-TAG = get_env_or_exit("TAG", "The tag to remove.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("delete_tag", PAT)
-logger.info("Removes a tag from builds, definitions, and from the tag store")
+def delete_tag(client, project: str, tag: str) -> dict:
+    """
+    Removes a tag from builds, definitions, and from the tag store
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/build/tags/{TAG}", API_VERSION, project=PROJECT_ID)
-logger.info(f"DELETE {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        tag: The tag to remove.
 
-response = execute_request("DELETE", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/build/tags/{tag}", API_VERSION, project=project)
+    response = client.request("DELETE", url)
+    data = loads(response.content)
+    return data
+
+
+async def delete_tag_async(client, project: str, tag: str) -> dict:
+    """Async variant of delete_tag() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/build/tags/{tag}", API_VERSION, project=project)
+    response = await client.request("DELETE", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call delete_tag() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    tag = require_env("TAG", "The tag to remove.")
+
+    parser = argparse.ArgumentParser(description="Removes a tag from builds, definitions, and from the tag store")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("delete_tag", pat)
+    logger.info("Removes a tag from builds, definitions, and from the tag store")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        items = items_of(delete_tag(client, project, tag), "value")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    data = delete_tag(client, project, tag)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
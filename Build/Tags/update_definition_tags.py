@@ -11,63 +11,94 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/build/tags/update-
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-DEFINITION_ID = get_env_or_exit("DEFINITION_ID", "The ID of the definition.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Adds/Removes tags from a definition.")
-parser.add_argument("--tags-to-add", required=False, help="tagsToAdd")
-parser.add_argument("--tags-to-remove", required=False, help="tagsToRemove")
-args = parser.parse_args()
+def update_definition_tags(client, project: str, definition_id: str, *, tags_to_add: Optional[str] = None, tags_to_remove: Optional[str] = None) -> dict:
+    """
+    Adds/Removes tags from a definition.
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_definition_tags", PAT)
-logger.info("Adds/Removes tags from a definition.")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        definition_id: The ID of the definition.
+        tags_to_add: tagsToAdd
+        tags_to_remove: tagsToRemove
 
-# ---------------------------------------------------------------------------
-# Request body
-# ---------------------------------------------------------------------------
-body = {
-    "tagsToAdd": args.tags_to_add,
-    "tagsToRemove": args.tags_to_remove,
-}
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "tagsToAdd": tags_to_add,
+        "tagsToRemove": tags_to_remove,
+    }
+    url = build_url(client.organization, f"_apis/build/definitions/{definition_id}/tags", API_VERSION, project=project)
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/build/definitions/{DEFINITION_ID}/tags", API_VERSION, project=PROJECT_ID)
-logger.info(f"PATCH {url}")
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+async def update_definition_tags_async(client, project: str, definition_id: str, *, tags_to_add: Optional[str] = None, tags_to_remove: Optional[str] = None) -> dict:
+    """Async variant of update_definition_tags() for use with AsyncAdoClient."""
+    body = {
+        "tagsToAdd": tags_to_add,
+        "tagsToRemove": tags_to_remove,
+    }
+    url = build_url(client.organization, f"_apis/build/definitions/{definition_id}/tags", API_VERSION, project=project)
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call update_definition_tags() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    definition_id = require_env("DEFINITION_ID", "The ID of the definition.")
+
+    parser = argparse.ArgumentParser(description="Adds/Removes tags from a definition.")
+    parser.add_argument("--tags-to-add", required=False, help="tagsToAdd")
+    parser.add_argument("--tags-to-remove", required=False, help="tagsToRemove")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("update_definition_tags", pat)
+    logger.info("Adds/Removes tags from a definition.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        items = items_of(update_definition_tags(client, project, definition_id, tags_to_add=args.tags_to_add, tags_to_remove=args.tags_to_remove), "value")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    data = update_definition_tags(client, project, definition_id, tags_to_add=args.tags_to_add, tags_to_remove=args.tags_to_remove)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,77 +11,105 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/build/templates/sa
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-TEMPLATE_ID = get_env_or_exit("TEMPLATE_ID", "The ID of the template.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Updates an existing build definition template.")
-parser.add_argument("--can-delete", required=False, help="Indicates whether the template can be deleted.")
-parser.add_argument("--category", required=False, help="The template category.")
-parser.add_argument("--default-hosted-queue", required=False, help="An optional hosted agent queue for the template to use by default.")
-parser.add_argument("--description", required=False, help="A description of the template.")
-parser.add_argument("--icons", required=False, help="icons")
-parser.add_argument("--icon-task-id", required=False, help="The ID of the task whose icon is used when showing this template in the UI.")
-args = parser.parse_args()
+def set_save_template(client, project: str, template_id: str, *, can_delete: Optional[str] = None, category: Optional[str] = None, default_hosted_queue: Optional[str] = None, description: Optional[str] = None, icons: Optional[str] = None, icon_task_id: Optional[str] = None) -> dict:
+    """
+    Updates an existing build definition template.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        template_id: The ID of the template.
+        can_delete: Indicates whether the template can be deleted.
+        category: The template category.
+        default_hosted_queue: An optional hosted agent queue for the template to use by default.
+        description: A description of the template.
+        icons: icons
+        icon_task_id: The ID of the task whose icon is used when showing this template in the UI.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "canDelete": can_delete,
+        "category": category,
+        "defaultHostedQueue": default_hosted_queue,
+        "description": description,
+        "icons": icons,
+        "iconTaskId": icon_task_id,
+    }
+    url = build_url(client.organization, f"_apis/build/definitions/templates/{template_id}", API_VERSION, project=project)
+    response = client.request("PUT", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name', 'canDelete'], API_VERSION)
+    return data
+
+
+async def set_save_template_async(client, project: str, template_id: str, *, can_delete: Optional[str] = None, category: Optional[str] = None, default_hosted_queue: Optional[str] = None, description: Optional[str] = None, icons: Optional[str] = None, icon_task_id: Optional[str] = None) -> dict:
+    """Async variant of set_save_template() for use with AsyncAdoClient."""
+    body = {
+        "canDelete": can_delete,
+        "category": category,
+        "defaultHostedQueue": default_hosted_queue,
+        "description": description,
+        "icons": icons,
+        "iconTaskId": icon_task_id,
+    }
+    url = build_url(client.organization, f"_apis/build/definitions/templates/{template_id}", API_VERSION, project=project)
+    response = await client.request("PUT", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name', 'canDelete'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("set_save_template", PAT)
-logger.info("Updates an existing build definition template.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "canDelete": args.can_delete,
-    "category": args.category,
-    "defaultHostedQueue": args.default_hosted_queue,
-    "description": args.description,
-    "icons": args.icons,
-    "iconTaskId": args.icon_task_id,
-}
+def main() -> None:
+    """Read env vars / flags, call set_save_template() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    template_id = require_env("TEMPLATE_ID", "The ID of the template.")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/build/definitions/templates/{TEMPLATE_ID}", API_VERSION, project=PROJECT_ID)
-logger.info(f"PUT {url}")
+    parser = argparse.ArgumentParser(description="Updates an existing build definition template.")
+    parser.add_argument("--can-delete", required=False, help="Indicates whether the template can be deleted.")
+    parser.add_argument("--category", required=False, help="The template category.")
+    parser.add_argument("--default-hosted-queue", required=False, help="An optional hosted agent queue for the template to use by default.")
+    parser.add_argument("--description", required=False, help="A description of the template.")
+    parser.add_argument("--icons", required=False, help="icons")
+    parser.add_argument("--icon-task-id", required=False, help="The ID of the task whose icon is used when showing this template in the UI.")
+    args = parser.parse_args()
 
-response = execute_request("PUT", url, HEADERS, body=body)
+    logger = AdoLogger("set_save_template", pat)
+    logger.info("Updates an existing build definition template.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = set_save_template(client, project, template_id, can_delete=args.can_delete, category=args.category, default_hosted_queue=args.default_hosted_queue, description=args.description, icons=args.icons, icon_task_id=args.icon_task_id)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'name', 'canDelete'], API_VERSION)
+    print(f"Templates: {data.get('name', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Templates: {data.get("name", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
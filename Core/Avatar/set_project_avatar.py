@@ -11,60 +11,80 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/core/avatar/set-pr
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "The ID or name of the project.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Sets the avatar for the project.")
-parser.add_argument("--image", required=False, help="The avatar image represented as a byte array.")
-args = parser.parse_args()
+def set_project_avatar(client, project_id: str, *, image: Optional[str] = None) -> dict:
+    """
+    Sets the avatar for the project.
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("set_project_avatar", PAT)
-logger.info("Sets the avatar for the project.")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project_id: The ID or name of the project.
+        image: The avatar image represented as a byte array.
 
-# ---------------------------------------------------------------------------
-# Request body
-# ---------------------------------------------------------------------------
-body = {
-    "image": args.image,
-}
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "image": image,
+    }
+    url = build_url(client.organization, f"_apis/projects/{project_id}/avatar", API_VERSION)
+    response = client.request("PUT", url, body=body)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/projects/{PROJECT_ID}/avatar", API_VERSION)
-logger.info(f"PUT {url}")
 
-response = execute_request("PUT", url, HEADERS, body=body)
+async def set_project_avatar_async(client, project_id: str, *, image: Optional[str] = None) -> dict:
+    """Async variant of set_project_avatar() for use with AsyncAdoClient."""
+    body = {
+        "image": image,
+    }
+    url = build_url(client.organization, f"_apis/projects/{project_id}/avatar", API_VERSION)
+    response = await client.request("PUT", url, body=body)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call set_project_avatar() and print the result."""
+    organization, pat = get_common_env()
+    project_id = require_env("PROJECT_ID", "The ID or name of the project.")
+
+    parser = argparse.ArgumentParser(description="Sets the avatar for the project.")
+    parser.add_argument("--image", required=False, help="The avatar image represented as a byte array.")
+    args = parser.parse_args()
+
+    logger = AdoLogger("set_project_avatar", pat)
+    logger.info("Sets the avatar for the project.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = set_project_avatar(client, project_id, image=args.image)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,51 +10,70 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/core/categorized-teams/get?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "The name or ID (GUID) of the team project containing the teams to retrieve.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_categorized_teams", PAT)
-logger.info("Gets list of user readable teams in a project and teams user is member of (excluded from readable list).")
+def get_categorized_teams(client, project_id: str) -> dict:
+    """
+    Gets list of user readable teams in a project and teams user is member of (excluded from readable list).
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/projects/{PROJECT_ID}/categorizedteams/", API_VERSION)
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project_id: The name or ID (GUID) of the team project containing the teams to retrieve.
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/projects/{project_id}/categorizedteams/", API_VERSION)
+    response = client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['myTeams', 'otherReadableTeams'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['myTeams', 'otherReadableTeams'], API_VERSION)
+async def get_categorized_teams_async(client, project_id: str) -> dict:
+    """Async variant of get_categorized_teams() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/projects/{project_id}/categorizedteams/", API_VERSION)
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['myTeams', 'otherReadableTeams'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_categorized_teams() and print the result."""
+    organization, pat = get_common_env()
+    project_id = require_env("PROJECT_ID", "The name or ID (GUID) of the team project containing the teams to retrieve.")
+
+    logger = AdoLogger("get_categorized_teams", pat)
+    logger.info("Gets list of user readable teams in a project and teams user is member of (excluded from readable list).")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = get_categorized_teams(client, project_id)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,67 +11,85 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/core/projects/crea
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Queues a project to be created.")
-parser.add_argument("--capabilities", required=False, help="Set of capabilities this project has (such as process template & version control).")
-parser.add_argument("--default-team", required=False, help="The shallow ref to the default team.")
-args = parser.parse_args()
+def create_projects(client, *, capabilities: Optional[str] = None, default_team: Optional[str] = None) -> dict:
+    """
+    Queues a project to be created.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        capabilities: Set of capabilities this project has (such as process template & version control).
+        default_team: The shallow ref to the default team.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "capabilities": capabilities,
+        "defaultTeam": default_team,
+    }
+    url = build_url(client.organization, f"_apis/projects", API_VERSION)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'pluginId'], API_VERSION)
+    return data
+
+
+async def create_projects_async(client, *, capabilities: Optional[str] = None, default_team: Optional[str] = None) -> dict:
+    """Async variant of create_projects() for use with AsyncAdoClient."""
+    body = {
+        "capabilities": capabilities,
+        "defaultTeam": default_team,
+    }
+    url = build_url(client.organization, f"_apis/projects", API_VERSION)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'pluginId'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_projects", PAT)
-logger.info("Queues a project to be created.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "capabilities": args.capabilities,
-    "defaultTeam": args.default_team,
-}
+def main() -> None:
+    """Read env vars / flags, call create_projects() and print the result."""
+    organization, pat = get_common_env()
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/projects", API_VERSION)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Queues a project to be created.")
+    parser.add_argument("--capabilities", required=False, help="Set of capabilities this project has (such as process template & version control).")
+    parser.add_argument("--default-team", required=False, help="The shallow ref to the default team.")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_projects", pat)
+    logger.info("Queues a project to be created.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_projects(client, capabilities=args.capabilities, default_team=args.default_team)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'pluginId'], API_VERSION)
+    print(f"Projects ID: {data.get('id', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Projects ID: {data.get("id", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,52 +10,71 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/core/projects/delete?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "The project id of the project to delete.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("delete_projects", PAT)
-logger.info("Queues a project to be deleted.")
+def delete_projects(client, project_id: str) -> dict:
+    """
+    Queues a project to be deleted.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/projects/{PROJECT_ID}", API_VERSION)
-logger.info(f"DELETE {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project_id: The project id of the project to delete.
 
-response = execute_request("DELETE", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/projects/{project_id}", API_VERSION)
+    response = client.request("DELETE", url)
+    data = loads(response.content)
+    version_guard(data, ['id', 'pluginId'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'pluginId'], API_VERSION)
+async def delete_projects_async(client, project_id: str) -> dict:
+    """Async variant of delete_projects() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/projects/{project_id}", API_VERSION)
+    response = await client.request("DELETE", url)
+    data = loads(response.content)
+    version_guard(data, ['id', 'pluginId'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(f"Projects ID: {data.get("id", "N/A")}")
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call delete_projects() and print the result."""
+    organization, pat = get_common_env()
+    project_id = require_env("PROJECT_ID", "The project id of the project to delete.")
+
+    logger = AdoLogger("delete_projects", pat)
+    logger.info("Queues a project to be deleted.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = delete_projects(client, project_id)
+
+    print(f"Projects ID: {data.get('id', 'N/A')}")
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
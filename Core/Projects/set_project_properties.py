@@ -10,46 +10,68 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/core/projects/set-project-properties?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "The team project ID.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("set_project_properties", PAT)
-logger.info("Create, update, and delete team project properties.")
+def set_project_properties(client, project_id: str) -> dict:
+    """
+    Create, update, and delete team project properties.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project_id: The team project ID.
+
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/projects/{project_id}/properties", API_VERSION)
+    response = client.request("PATCH", url)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/projects/{PROJECT_ID}/properties", API_VERSION)
-logger.info(f"PATCH {url}")
 
-response = execute_request("PATCH", url, HEADERS)
+async def set_project_properties_async(client, project_id: str) -> dict:
+    """Async variant of set_project_properties() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/projects/{project_id}/properties", API_VERSION)
+    response = await client.request("PATCH", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call set_project_properties() and print the result."""
+    organization, pat = get_common_env()
+    project_id = require_env("PROJECT_ID", "The team project ID.")
+
+    logger = AdoLogger("set_project_properties", pat)
+    logger.info("Create, update, and delete team project properties.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = set_project_properties(client, project_id)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -12,9 +12,6 @@ Validates:
 """
 
 import json
-import os
-import subprocess
-import sys
 from pathlib import Path
 
 import pytest
@@ -29,35 +26,9 @@ PROJECT_GUID = "a1b2c3d4-e5f6-7890-abcd-ef1234567890"
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _run_script(args=None, env_override=None, expect_fail=False):
-    """Run update_project.py as a subprocess with the given env and args."""
-    env = {
-        "AZURE_DEVOPS_ORG": "testorg",
-        "AZURE_DEVOPS_PAT": "fakepat1234567890",
-        "PROJECT_ID": PROJECT_GUID,
-        "PATH": os.environ.get("PATH", ""),
-    }
-    if env_override:
-        env.update(env_override)
-    env = {k: v for k, v in env.items() if v is not None}
-
-    cmd = [sys.executable, SCRIPT]
-    if args:
-        cmd.extend(args)
-
-    result = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        env=env,
-        timeout=30,
-    )
-    if not expect_fail:
-        assert result.returncode == 0, (
-            f"Script failed (rc={result.returncode}):\n"
-            f"STDOUT: {result.stdout}\nSTDERR: {result.stderr}"
-        )
-    return result
+ENV = {
+    "PROJECT_ID": PROJECT_GUID,
+}
 
 
 # ---------------------------------------------------------------------------
@@ -70,44 +41,32 @@ class TestUpdateProjectEnvValidation:
 
     @pytest.mark.offline
     @pytest.mark.core
-    def test_missing_org_exits(self):
-        result = _run_script(
-            args=["--description", "test"],
-            env_override={"AZURE_DEVOPS_ORG": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "AZURE_DEVOPS_ORG" in (result.stderr + result.stdout)
+    def test_missing_org_exits(self, run_main):
+        code, output = run_main(SCRIPT, env={**ENV, "AZURE_DEVOPS_ORG": None}, args=["--description", "test"])
+        assert code != 0
+        assert "AZURE_DEVOPS_ORG" in output
 
     @pytest.mark.offline
     @pytest.mark.core
-    def test_missing_pat_exits(self):
-        result = _run_script(
-            args=["--description", "test"],
-            env_override={"AZURE_DEVOPS_PAT": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "AZURE_DEVOPS_PAT" in (result.stderr + result.stdout)
+    def test_missing_pat_exits(self, run_main):
+        code, output = run_main(SCRIPT, env={**ENV, "AZURE_DEVOPS_PAT": None}, args=["--description", "test"])
+        assert code != 0
+        assert "AZURE_DEVOPS_PAT" in output
 
     @pytest.mark.offline
     @pytest.mark.core
-    def test_missing_project_id_exits(self):
-        result = _run_script(
-            args=["--description", "test"],
-            env_override={"PROJECT_ID": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "PROJECT_ID" in (result.stderr + result.stdout)
+    def test_missing_project_id_exits(self, run_main):
+        code, output = run_main(SCRIPT, env={**ENV, "PROJECT_ID": None}, args=["--description", "test"])
+        assert code != 0
+        assert "PROJECT_ID" in output
 
     @pytest.mark.offline
     @pytest.mark.core
-    def test_no_update_args_exits(self):
+    def test_no_update_args_exits(self, run_main):
         """Script should exit when no --name, --description, or --visibility given."""
-        result = _run_script(args=[], expect_fail=True)
-        assert result.returncode != 0
-        output = result.stderr + result.stdout
+        code, output = run_main(SCRIPT, env=ENV, args=[])
+        assert code != 0
+        output = output + output
         assert "name" in output.lower() or "description" in output.lower() or "visibility" in output.lower()
 
 
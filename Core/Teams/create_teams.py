@@ -11,72 +11,96 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/core/teams/create?
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "The name or ID (GUID) of the team project in which to create the team.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Create a team in a team project.")
-parser.add_argument("--description", required=False, help="Team description")
-parser.add_argument("--identity", required=False, help="Team identity.")
-parser.add_argument("--identity-url", required=False, help="Identity REST API Url to this team")
-parser.add_argument("--project-name", required=False, help="projectName")
-args = parser.parse_args()
+def create_teams(client, project_id: str, *, description: Optional[str] = None, identity: Optional[str] = None, identity_url: Optional[str] = None, project_name: Optional[str] = None) -> dict:
+    """
+    Create a team in a team project.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project_id: The name or ID (GUID) of the team project in which to create the team.
+        description: Team description
+        identity: Team identity.
+        identity_url: Identity REST API Url to this team
+        project_name: projectName
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "description": description,
+        "identity": identity,
+        "identityUrl": identity_url,
+        "projectId": project_id,
+        "projectName": project_name,
+    }
+    url = build_url(client.organization, f"_apis/projects/{project_id}/teams", API_VERSION)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['description', 'identity'], API_VERSION)
+    return data
+
+
+async def create_teams_async(client, project_id: str, *, description: Optional[str] = None, identity: Optional[str] = None, identity_url: Optional[str] = None, project_name: Optional[str] = None) -> dict:
+    """Async variant of create_teams() for use with AsyncAdoClient."""
+    body = {
+        "description": description,
+        "identity": identity,
+        "identityUrl": identity_url,
+        "projectId": project_id,
+        "projectName": project_name,
+    }
+    url = build_url(client.organization, f"_apis/projects/{project_id}/teams", API_VERSION)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['description', 'identity'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_teams", PAT)
-logger.info("Create a team in a team project.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "description": args.description,
-    "identity": args.identity,
-    "identityUrl": args.identity_url,
-    "projectId": PROJECT_ID,
-    "projectName": args.project_name,
-}
+def main() -> None:
+    """Read env vars / flags, call create_teams() and print the result."""
+    organization, pat = get_common_env()
+    project_id = require_env("PROJECT_ID", "The name or ID (GUID) of the team project in which to create the team.")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/projects/{PROJECT_ID}/teams", API_VERSION)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Create a team in a team project.")
+    parser.add_argument("--description", required=False, help="Team description")
+    parser.add_argument("--identity", required=False, help="Team identity.")
+    parser.add_argument("--identity-url", required=False, help="Identity REST API Url to this team")
+    parser.add_argument("--project-name", required=False, help="projectName")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_teams", pat)
+    logger.info("Create a team in a team project.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_teams(client, project_id, description=args.description, identity=args.identity, identity_url=args.identity_url, project_name=args.project_name)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['description', 'identity'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,47 +10,70 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/core/teams/delete?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "The name or ID (GUID) of the team project containing the team to delete.")
-TEAM_ID = get_env_or_exit("TEAM_ID", "The name or ID of the team to delete.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("delete_teams", PAT)
-logger.info("Delete a team.")
+def delete_teams(client, project_id: str, team_id: str) -> dict:
+    """
+    Delete a team.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project_id: The name or ID (GUID) of the team project containing the team to delete.
+        team_id: The name or ID of the team to delete.
+
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/projects/{project_id}/teams/{team_id}", API_VERSION)
+    response = client.request("DELETE", url)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/projects/{PROJECT_ID}/teams/{TEAM_ID}", API_VERSION)
-logger.info(f"DELETE {url}")
 
-response = execute_request("DELETE", url, HEADERS)
+async def delete_teams_async(client, project_id: str, team_id: str) -> dict:
+    """Async variant of delete_teams() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/projects/{project_id}/teams/{team_id}", API_VERSION)
+    response = await client.request("DELETE", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call delete_teams() and print the result."""
+    organization, pat = get_common_env()
+    project_id = require_env("PROJECT_ID", "The name or ID (GUID) of the team project containing the team to delete.")
+    team_id = require_env("TEAM_ID", "The name or ID of the team to delete.")
+
+    logger = AdoLogger("delete_teams", pat)
+    logger.info("Delete a team.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = delete_teams(client, project_id, team_id)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
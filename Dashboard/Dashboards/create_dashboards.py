@@ -11,75 +11,101 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/dashboard/dashboar
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-TEAM_ID = get_env_or_exit("TEAM_ID", "Team ID or team name")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Create the supplied dashboard.")
-parser.add_argument("--dashboard-scope", required=False, help="Entity to which the dashboard is scoped.")
-parser.add_argument("--description", required=False, help="Description of the dashboard.")
-parser.add_argument("--e-tag", required=False, help="Server defined version tracking value, used for edit collision detection.")
-parser.add_argument("--global-parameters-config", required=False, help="Dashboard Global Parameters Config")
-parser.add_argument("--group-id", required=False, help="ID of the group for a dashboard. For team-scoped dashboards, this is the unique identifier for th...")
-args = parser.parse_args()
+def create_dashboards(client, project: str, team: str, *, dashboard_scope: Optional[str] = None, description: Optional[str] = None, e_tag: Optional[str] = None, global_parameters_config: Optional[str] = None, group_id: Optional[str] = None) -> dict:
+    """
+    Create the supplied dashboard.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        team: Team ID or team name
+        dashboard_scope: Entity to which the dashboard is scoped.
+        description: Description of the dashboard.
+        e_tag: Server defined version tracking value, used for edit collision detection.
+        global_parameters_config: Dashboard Global Parameters Config
+        group_id: ID of the group for a dashboard. For team-scoped dashboards, this is the unique identifier for th...
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "dashboardScope": dashboard_scope,
+        "description": description,
+        "eTag": e_tag,
+        "globalParametersConfig": global_parameters_config,
+        "groupId": group_id,
+    }
+    url = build_url(client.organization, f"{team}/_apis/dashboard/dashboards", API_VERSION, project=project)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name'], API_VERSION)
+    return data
+
+
+async def create_dashboards_async(client, project: str, team: str, *, dashboard_scope: Optional[str] = None, description: Optional[str] = None, e_tag: Optional[str] = None, global_parameters_config: Optional[str] = None, group_id: Optional[str] = None) -> dict:
+    """Async variant of create_dashboards() for use with AsyncAdoClient."""
+    body = {
+        "dashboardScope": dashboard_scope,
+        "description": description,
+        "eTag": e_tag,
+        "globalParametersConfig": global_parameters_config,
+        "groupId": group_id,
+    }
+    url = build_url(client.organization, f"{team}/_apis/dashboard/dashboards", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_dashboards", PAT)
-logger.info("Create the supplied dashboard.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "dashboardScope": args.dashboard_scope,
-    "description": args.description,
-    "eTag": args.e_tag,
-    "globalParametersConfig": args.global_parameters_config,
-    "groupId": args.group_id,
-}
+def main() -> None:
+    """Read env vars / flags, call create_dashboards() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    team = require_env("TEAM_ID", "Team ID or team name")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"{TEAM_ID}/_apis/dashboard/dashboards", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Create the supplied dashboard.")
+    parser.add_argument("--dashboard-scope", required=False, help="Entity to which the dashboard is scoped.")
+    parser.add_argument("--description", required=False, help="Description of the dashboard.")
+    parser.add_argument("--e-tag", required=False, help="Server defined version tracking value, used for edit collision detection.")
+    parser.add_argument("--global-parameters-config", required=False, help="Dashboard Global Parameters Config")
+    parser.add_argument("--group-id", required=False, help="ID of the group for a dashboard. For team-scoped dashboards, this is the unique identifier for th...")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_dashboards", pat)
+    logger.info("Create the supplied dashboard.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_dashboards(client, project, team, dashboard_scope=args.dashboard_scope, description=args.description, e_tag=args.e_tag, global_parameters_config=args.global_parameters_config, group_id=args.group_id)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'name'], API_VERSION)
+    print(f"Dashboards ID: {data.get('id', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Dashboards ID: {data.get("id", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,48 +10,72 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/dashboard/dashboards/delete?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-DASHBOARD_ID = get_env_or_exit("DASHBOARD_ID", "ID of the dashboard to delete.")
-TEAM_ID = get_env_or_exit("TEAM_ID", "Team ID or team name")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("delete_dashboards", PAT)
-logger.info("Delete a dashboard given its ID.")
+def delete_dashboards(client, project: str, dashboard_id: str, team: str) -> dict:
+    """
+    Delete a dashboard given its ID.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        dashboard_id: ID of the dashboard to delete.
+        team: Team ID or team name
+
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"{team}/_apis/dashboard/dashboards/{dashboard_id}", API_VERSION, project=project)
+    response = client.request("DELETE", url)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"{TEAM_ID}/_apis/dashboard/dashboards/{DASHBOARD_ID}", API_VERSION, project=PROJECT_ID)
-logger.info(f"DELETE {url}")
 
-response = execute_request("DELETE", url, HEADERS)
+async def delete_dashboards_async(client, project: str, dashboard_id: str, team: str) -> dict:
+    """Async variant of delete_dashboards() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"{team}/_apis/dashboard/dashboards/{dashboard_id}", API_VERSION, project=project)
+    response = await client.request("DELETE", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call delete_dashboards() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    dashboard_id = require_env("DASHBOARD_ID", "ID of the dashboard to delete.")
+    team = require_env("TEAM_ID", "Team ID or team name")
+
+    logger = AdoLogger("delete_dashboards", pat)
+    logger.info("Delete a dashboard given its ID.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = delete_dashboards(client, project, dashboard_id, team)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
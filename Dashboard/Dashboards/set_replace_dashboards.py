@@ -11,72 +11,96 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/dashboard/dashboar
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-TEAM_ID = get_env_or_exit("TEAM_ID", "Team ID or team name")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Update the name and position of dashboards in the supplied group, and remove omitted dashboards.")
-parser.add_argument("--dashboard-entries", required=False, help="A list of Dashboards held by the Dashboard Group")
-parser.add_argument("--permission", required=False, help="Deprecated: The old permission model describing the level of permissions for the current team. Pr...")
-parser.add_argument("--team-dashboard-permission", required=False, help="A permissions bit mask describing the security permissions of the current team for dashboards. Wh...")
-parser.add_argument("--url", required=False, help="url")
-args = parser.parse_args()
+def set_replace_dashboards(client, project: str, team: str, *, dashboard_entries: Optional[str] = None, permission: Optional[str] = None, team_dashboard_permission: Optional[str] = None, url_value: Optional[str] = None) -> dict:
+    """
+    Update the name and position of dashboards in the supplied group, and remove omitted dashboards.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        team: Team ID or team name
+        dashboard_entries: A list of Dashboards held by the Dashboard Group
+        permission: Deprecated: The old permission model describing the level of permissions for the current team. Pr...
+        team_dashboard_permission: A permissions bit mask describing the security permissions of the current team for dashboards. Wh...
+        url_value: url
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "dashboardEntries": dashboard_entries,
+        "permission": permission,
+        "teamDashboardPermission": team_dashboard_permission,
+        "url": url_value,
+    }
+    url = build_url(client.organization, f"{team}/_apis/dashboard/dashboards", API_VERSION, project=project)
+    response = client.request("PUT", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['dashboardEntries', 'permission'], API_VERSION)
+    return data
+
+
+async def set_replace_dashboards_async(client, project: str, team: str, *, dashboard_entries: Optional[str] = None, permission: Optional[str] = None, team_dashboard_permission: Optional[str] = None, url_value: Optional[str] = None) -> dict:
+    """Async variant of set_replace_dashboards() for use with AsyncAdoClient."""
+    body = {
+        "dashboardEntries": dashboard_entries,
+        "permission": permission,
+        "teamDashboardPermission": team_dashboard_permission,
+        "url": url_value,
+    }
+    url = build_url(client.organization, f"{team}/_apis/dashboard/dashboards", API_VERSION, project=project)
+    response = await client.request("PUT", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['dashboardEntries', 'permission'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("set_replace_dashboards", PAT)
-logger.info("Update the name and position of dashboards in the supplied group, and remove omitted dashboards.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "dashboardEntries": args.dashboard_entries,
-    "permission": args.permission,
-    "teamDashboardPermission": args.team_dashboard_permission,
-    "url": args.url,
-}
+def main() -> None:
+    """Read env vars / flags, call set_replace_dashboards() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    team = require_env("TEAM_ID", "Team ID or team name")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"{TEAM_ID}/_apis/dashboard/dashboards", API_VERSION, project=PROJECT_ID)
-logger.info(f"PUT {url}")
+    parser = argparse.ArgumentParser(description="Update the name and position of dashboards in the supplied group, and remove omitted dashboards.")
+    parser.add_argument("--dashboard-entries", required=False, help="A list of Dashboards held by the Dashboard Group")
+    parser.add_argument("--permission", required=False, help="Deprecated: The old permission model describing the level of permissions for the current team. Pr...")
+    parser.add_argument("--team-dashboard-permission", required=False, help="A permissions bit mask describing the security permissions of the current team for dashboards. Wh...")
+    parser.add_argument("--url", required=False, help="url")
+    args = parser.parse_args()
 
-response = execute_request("PUT", url, HEADERS, body=body)
+    logger = AdoLogger("set_replace_dashboards", pat)
+    logger.info("Update the name and position of dashboards in the supplied group, and remove omitted dashboards.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = set_replace_dashboards(client, project, team, dashboard_entries=args.dashboard_entries, permission=args.permission, team_dashboard_permission=args.team_dashboard_permission, url_value=args.url)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['dashboardEntries', 'permission'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
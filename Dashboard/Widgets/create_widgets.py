@@ -11,75 +11,102 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/dashboard/widgets/
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-DASHBOARD_ID = get_env_or_exit("DASHBOARD_ID", "ID of dashboard the widget will be added to.")
-TEAM_ID = get_env_or_exit("TEAM_ID", "Team ID or team name")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Create a widget on the specified dashboard.")
-parser.add_argument("--allowed-sizes", required=False, help="Refers to the allowed sizes for the widget. This gets populated when user wants to configure the ...")
-parser.add_argument("--are-settings-blocked-for-user", required=False, help="Read-Only Property from Dashboard Service. Indicates if settings are blocked for the current user.")
-parser.add_argument("--artifact-id", required=False, help="Refers to unique identifier of a feature artifact. Used for pinning+unpinning a specific artifact.")
-parser.add_argument("--configuration-contribution-id", required=False, help="configurationContributionId")
-parser.add_argument("--configuration-contribution-relative-id", required=False, help="configurationContributionRelativeId")
-args = parser.parse_args()
+def create_widgets(client, project: str, dashboard_id: str, team: str, *, allowed_sizes: Optional[str] = None, are_settings_blocked_for_user: Optional[str] = None, artifact_id: Optional[str] = None, configuration_contribution_id: Optional[str] = None, configuration_contribution_relative_id: Optional[str] = None) -> dict:
+    """
+    Create a widget on the specified dashboard.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        dashboard_id: ID of dashboard the widget will be added to.
+        team: Team ID or team name
+        allowed_sizes: Refers to the allowed sizes for the widget. This gets populated when user wants to configure the ...
+        are_settings_blocked_for_user: Read-Only Property from Dashboard Service. Indicates if settings are blocked for the current user.
+        artifact_id: Refers to unique identifier of a feature artifact. Used for pinning+unpinning a specific artifact.
+        configuration_contribution_id: configurationContributionId
+        configuration_contribution_relative_id: configurationContributionRelativeId
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "allowedSizes": allowed_sizes,
+        "areSettingsBlockedForUser": are_settings_blocked_for_user,
+        "artifactId": artifact_id,
+        "configurationContributionId": configuration_contribution_id,
+        "configurationContributionRelativeId": configuration_contribution_relative_id,
+    }
+    url = build_url(client.organization, f"{team}/_apis/dashboard/dashboards/{dashboard_id}/widgets", API_VERSION, project=project)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name'], API_VERSION)
+    return data
+
+
+async def create_widgets_async(client, project: str, dashboard_id: str, team: str, *, allowed_sizes: Optional[str] = None, are_settings_blocked_for_user: Optional[str] = None, artifact_id: Optional[str] = None, configuration_contribution_id: Optional[str] = None, configuration_contribution_relative_id: Optional[str] = None) -> dict:
+    """Async variant of create_widgets() for use with AsyncAdoClient."""
+    body = {
+        "allowedSizes": allowed_sizes,
+        "areSettingsBlockedForUser": are_settings_blocked_for_user,
+        "artifactId": artifact_id,
+        "configurationContributionId": configuration_contribution_id,
+        "configurationContributionRelativeId": configuration_contribution_relative_id,
+    }
+    url = build_url(client.organization, f"{team}/_apis/dashboard/dashboards/{dashboard_id}/widgets", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_widgets", PAT)
-logger.info("Create a widget on the specified dashboard.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "allowedSizes": args.allowed_sizes,
-    "areSettingsBlockedForUser": args.are_settings_blocked_for_user,
-    "artifactId": args.artifact_id,
-    "configurationContributionId": args.configuration_contribution_id,
-    "configurationContributionRelativeId": args.configuration_contribution_relative_id,
-}
+def main() -> None:
+    """Read env vars / flags, call create_widgets() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    dashboard_id = require_env("DASHBOARD_ID", "ID of dashboard the widget will be added to.")
+    team = require_env("TEAM_ID", "Team ID or team name")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"{TEAM_ID}/_apis/dashboard/dashboards/{DASHBOARD_ID}/widgets", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Create a widget on the specified dashboard.")
+    parser.add_argument("--allowed-sizes", required=False, help="Refers to the allowed sizes for the widget. This gets populated when user wants to configure the ...")
+    parser.add_argument("--are-settings-blocked-for-user", required=False, help="Read-Only Property from Dashboard Service. Indicates if settings are blocked for the current user.")
+    parser.add_argument("--artifact-id", required=False, help="Refers to unique identifier of a feature artifact. Used for pinning+unpinning a specific artifact.")
+    parser.add_argument("--configuration-contribution-id", required=False, help="configurationContributionId")
+    parser.add_argument("--configuration-contribution-relative-id", required=False, help="configurationContributionRelativeId")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_widgets", pat)
+    logger.info("Create a widget on the specified dashboard.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_widgets(client, project, dashboard_id, team, allowed_sizes=args.allowed_sizes, are_settings_blocked_for_user=args.are_settings_blocked_for_user, artifact_id=args.artifact_id, configuration_contribution_id=args.configuration_contribution_id, configuration_contribution_relative_id=args.configuration_contribution_relative_id)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'name'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
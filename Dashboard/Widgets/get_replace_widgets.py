@@ -10,48 +10,84 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/dashboard/widgets/replace-widgets?view=azure-devops-rest-7.2
 """
 
-import json
+import argparse
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-DASHBOARD_ID = get_env_or_exit("DASHBOARD_ID", "ID of the Dashboard to modify.")
-TEAM_ID = get_env_or_exit("TEAM_ID", "Team ID or team name")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_replace_widgets", PAT)
-logger.info("Replace the widgets on specified dashboard with the supplied widgets.")
+def get_replace_widgets(client, project: str, dashboard_id: str, team: str) -> dict:
+    """
+    Replace the widgets on specified dashboard with the supplied widgets.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"{TEAM_ID}/_apis/dashboard/dashboards/{DASHBOARD_ID}/widgets", API_VERSION, project=PROJECT_ID)
-logger.info(f"PUT {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        dashboard_id: ID of the Dashboard to modify.
+        team: Team ID or team name
 
-response = execute_request("PUT", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"{team}/_apis/dashboard/dashboards/{dashboard_id}/widgets", API_VERSION, project=project)
+    response = client.request("PUT", url)
+    data = loads(response.content)
+    return data
+
+
+async def get_replace_widgets_async(client, project: str, dashboard_id: str, team: str) -> dict:
+    """Async variant of get_replace_widgets() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"{team}/_apis/dashboard/dashboards/{dashboard_id}/widgets", API_VERSION, project=project)
+    response = await client.request("PUT", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_replace_widgets() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    dashboard_id = require_env("DASHBOARD_ID", "ID of the Dashboard to modify.")
+    team = require_env("TEAM_ID", "Team ID or team name")
+
+    parser = argparse.ArgumentParser(description="Replace the widgets on specified dashboard with the supplied widgets.")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("get_replace_widgets", pat)
+    logger.info("Replace the widgets on specified dashboard with the supplied widgets.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        items = items_of(get_replace_widgets(client, project, dashboard_id, team), "value")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    data = get_replace_widgets(client, project, dashboard_id, team)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,51 +10,70 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/delegated-auth/registration-secret/rotate-secret?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-REGISTRATION_ID = get_env_or_exit("REGISTRATION_ID", "The registration id of the ADO OAuth App Registration")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("set_rotate_secret", PAT)
-logger.info("Rotate one of the two secrets for the ADO OAuth App Registration")
+def set_rotate_secret(client, registration_id: str) -> dict:
+    """
+    Rotate one of the two secrets for the ADO OAuth App Registration
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/delegatedauth/registrationsecret/{REGISTRATION_ID}", API_VERSION, base_host="vssps.dev.azure.com")
-logger.info(f"PUT {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        registration_id: The registration id of the ADO OAuth App Registration
 
-response = execute_request("PUT", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/delegatedauth/registrationsecret/{registration_id}", API_VERSION, base_host="vssps.dev.azure.com")
+    response = client.request("PUT", url)
+    data = loads(response.content)
+    version_guard(data, ['accessHash', 'alternativeSecret'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['accessHash', 'alternativeSecret'], API_VERSION)
+async def set_rotate_secret_async(client, registration_id: str) -> dict:
+    """Async variant of set_rotate_secret() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/delegatedauth/registrationsecret/{registration_id}", API_VERSION, base_host="vssps.dev.azure.com")
+    response = await client.request("PUT", url)
+    data = loads(response.content)
+    version_guard(data, ['accessHash', 'alternativeSecret'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call set_rotate_secret() and print the result."""
+    organization, pat = get_common_env()
+    registration_id = require_env("REGISTRATION_ID", "The registration id of the ADO OAuth App Registration")
+
+    logger = AdoLogger("set_rotate_secret", pat)
+    logger.info("Rotate one of the two secrets for the ADO OAuth App Registration")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = set_rotate_secret(client, registration_id)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
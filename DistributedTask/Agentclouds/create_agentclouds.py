@@ -11,75 +11,101 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/distributed-task/a
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Add for Agentclouds")
-parser.add_argument("--acquire-agent-endpoint", required=False, help="Gets or sets a AcquireAgentEndpoint using which a request can be made to acquire new agent")
-parser.add_argument("--acquisition-timeout", required=False, help="acquisitionTimeout")
-parser.add_argument("--agent-cloud-id", required=False, help="agentCloudId")
-parser.add_argument("--get-account-parallelism-endpoint", required=False, help="getAccountParallelismEndpoint")
-parser.add_argument("--get-agent-definition-endpoint", required=False, help="getAgentDefinitionEndpoint")
-parser.add_argument("--get-agent-request-status-endpoint", required=False, help="getAgentRequestStatusEndpoint")
-args = parser.parse_args()
+def create_agentclouds(client, *, acquire_agent_endpoint: Optional[str] = None, acquisition_timeout: Optional[str] = None, agent_cloud_id: Optional[str] = None, get_account_parallelism_endpoint: Optional[str] = None, get_agent_definition_endpoint: Optional[str] = None, get_agent_request_status_endpoint: Optional[str] = None) -> dict:
+    """
+    Add for Agentclouds
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        acquire_agent_endpoint: Gets or sets a AcquireAgentEndpoint using which a request can be made to acquire new agent
+        acquisition_timeout: acquisitionTimeout
+        agent_cloud_id: agentCloudId
+        get_account_parallelism_endpoint: getAccountParallelismEndpoint
+        get_agent_definition_endpoint: getAgentDefinitionEndpoint
+        get_agent_request_status_endpoint: getAgentRequestStatusEndpoint
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "acquireAgentEndpoint": acquire_agent_endpoint,
+        "acquisitionTimeout": acquisition_timeout,
+        "agentCloudId": agent_cloud_id,
+        "getAccountParallelismEndpoint": get_account_parallelism_endpoint,
+        "getAgentDefinitionEndpoint": get_agent_definition_endpoint,
+        "getAgentRequestStatusEndpoint": get_agent_request_status_endpoint,
+    }
+    url = build_url(client.organization, f"_apis/distributedtask/agentclouds", API_VERSION)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name', 'acquireAgentEndpoint'], API_VERSION)
+    return data
+
+
+async def create_agentclouds_async(client, *, acquire_agent_endpoint: Optional[str] = None, acquisition_timeout: Optional[str] = None, agent_cloud_id: Optional[str] = None, get_account_parallelism_endpoint: Optional[str] = None, get_agent_definition_endpoint: Optional[str] = None, get_agent_request_status_endpoint: Optional[str] = None) -> dict:
+    """Async variant of create_agentclouds() for use with AsyncAdoClient."""
+    body = {
+        "acquireAgentEndpoint": acquire_agent_endpoint,
+        "acquisitionTimeout": acquisition_timeout,
+        "agentCloudId": agent_cloud_id,
+        "getAccountParallelismEndpoint": get_account_parallelism_endpoint,
+        "getAgentDefinitionEndpoint": get_agent_definition_endpoint,
+        "getAgentRequestStatusEndpoint": get_agent_request_status_endpoint,
+    }
+    url = build_url(client.organization, f"_apis/distributedtask/agentclouds", API_VERSION)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name', 'acquireAgentEndpoint'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_agentclouds", PAT)
-logger.info("Add for Agentclouds")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "acquireAgentEndpoint": args.acquire_agent_endpoint,
-    "acquisitionTimeout": args.acquisition_timeout,
-    "agentCloudId": args.agent_cloud_id,
-    "getAccountParallelismEndpoint": args.get_account_parallelism_endpoint,
-    "getAgentDefinitionEndpoint": args.get_agent_definition_endpoint,
-    "getAgentRequestStatusEndpoint": args.get_agent_request_status_endpoint,
-}
+def main() -> None:
+    """Read env vars / flags, call create_agentclouds() and print the result."""
+    organization, pat = get_common_env()
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/distributedtask/agentclouds", API_VERSION)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Add for Agentclouds")
+    parser.add_argument("--acquire-agent-endpoint", required=False, help="Gets or sets a AcquireAgentEndpoint using which a request can be made to acquire new agent")
+    parser.add_argument("--acquisition-timeout", required=False, help="acquisitionTimeout")
+    parser.add_argument("--agent-cloud-id", required=False, help="agentCloudId")
+    parser.add_argument("--get-account-parallelism-endpoint", required=False, help="getAccountParallelismEndpoint")
+    parser.add_argument("--get-agent-definition-endpoint", required=False, help="getAgentDefinitionEndpoint")
+    parser.add_argument("--get-agent-request-status-endpoint", required=False, help="getAgentRequestStatusEndpoint")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_agentclouds", pat)
+    logger.info("Add for Agentclouds")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_agentclouds(client, acquire_agent_endpoint=args.acquire_agent_endpoint, acquisition_timeout=args.acquisition_timeout, agent_cloud_id=args.agent_cloud_id, get_account_parallelism_endpoint=args.get_account_parallelism_endpoint, get_agent_definition_endpoint=args.get_agent_definition_endpoint, get_agent_request_status_endpoint=args.get_agent_request_status_endpoint)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'name', 'acquireAgentEndpoint'], API_VERSION)
+    print(f"Agentclouds ID: {data.get('id', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Agentclouds ID: {data.get("id", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,52 +10,71 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/distributed-task/agentclouds/delete?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-AGENT_CLOUD_ID = get_env_or_exit("AGENT_CLOUD_ID", "agentCloudId")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("delete_agentclouds", PAT)
-logger.info("Delete for Agentclouds")
+def delete_agentclouds(client, agent_cloud_id: str) -> dict:
+    """
+    Delete for Agentclouds
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/distributedtask/agentclouds/{AGENT_CLOUD_ID}", API_VERSION)
-logger.info(f"DELETE {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        agent_cloud_id: agentCloudId
 
-response = execute_request("DELETE", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/distributedtask/agentclouds/{agent_cloud_id}", API_VERSION)
+    response = client.request("DELETE", url)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name', 'acquireAgentEndpoint'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'name', 'acquireAgentEndpoint'], API_VERSION)
+async def delete_agentclouds_async(client, agent_cloud_id: str) -> dict:
+    """Async variant of delete_agentclouds() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/distributedtask/agentclouds/{agent_cloud_id}", API_VERSION)
+    response = await client.request("DELETE", url)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name', 'acquireAgentEndpoint'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(f"Agentclouds ID: {data.get("id", "N/A")}")
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call delete_agentclouds() and print the result."""
+    organization, pat = get_common_env()
+    agent_cloud_id = require_env("AGENT_CLOUD_ID", "agentCloudId")
+
+    logger = AdoLogger("delete_agentclouds", pat)
+    logger.info("Delete for Agentclouds")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = delete_agentclouds(client, agent_cloud_id)
+
+    print(f"Agentclouds ID: {data.get('id', 'N/A')}")
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
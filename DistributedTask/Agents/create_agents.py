@@ -11,75 +11,102 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/distributed-task/a
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-POOL_ID = get_env_or_exit("POOL_ID", "The agent pool in which to add the agent")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Adds an agent to a pool.")
-parser.add_argument("--assigned-agent-cloud-request", required=False, help="The agent cloud request that's currently associated with this agent.")
-parser.add_argument("--assigned-request", required=False, help="The request which is currently assigned to this agent.")
-parser.add_argument("--authorization", required=False, help="Authorization information for this agent.")
-parser.add_argument("--created-on", required=False, help="Date on which this agent was created.")
-parser.add_argument("--last-completed-request", required=False, help="The last request which was completed by this agent.")
-parser.add_argument("--max-parallelism", required=False, help="Maximum job parallelism allowed for this agent.")
-args = parser.parse_args()
+def create_agents(client, pool_id: str, *, assigned_agent_cloud_request: Optional[str] = None, assigned_request: Optional[str] = None, authorization: Optional[str] = None, created_on: Optional[str] = None, last_completed_request: Optional[str] = None, max_parallelism: Optional[str] = None) -> dict:
+    """
+    Adds an agent to a pool.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        pool_id: The agent pool in which to add the agent
+        assigned_agent_cloud_request: The agent cloud request that's currently associated with this agent.
+        assigned_request: The request which is currently assigned to this agent.
+        authorization: Authorization information for this agent.
+        created_on: Date on which this agent was created.
+        last_completed_request: The last request which was completed by this agent.
+        max_parallelism: Maximum job parallelism allowed for this agent.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "assignedAgentCloudRequest": assigned_agent_cloud_request,
+        "assignedRequest": assigned_request,
+        "authorization": authorization,
+        "createdOn": created_on,
+        "lastCompletedRequest": last_completed_request,
+        "maxParallelism": max_parallelism,
+    }
+    url = build_url(client.organization, f"_apis/distributedtask/pools/{pool_id}/agents", API_VERSION)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['assignedAgentCloudRequest', 'assignedRequest'], API_VERSION)
+    return data
+
+
+async def create_agents_async(client, pool_id: str, *, assigned_agent_cloud_request: Optional[str] = None, assigned_request: Optional[str] = None, authorization: Optional[str] = None, created_on: Optional[str] = None, last_completed_request: Optional[str] = None, max_parallelism: Optional[str] = None) -> dict:
+    """Async variant of create_agents() for use with AsyncAdoClient."""
+    body = {
+        "assignedAgentCloudRequest": assigned_agent_cloud_request,
+        "assignedRequest": assigned_request,
+        "authorization": authorization,
+        "createdOn": created_on,
+        "lastCompletedRequest": last_completed_request,
+        "maxParallelism": max_parallelism,
+    }
+    url = build_url(client.organization, f"_apis/distributedtask/pools/{pool_id}/agents", API_VERSION)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['assignedAgentCloudRequest', 'assignedRequest'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_agents", PAT)
-logger.info("Adds an agent to a pool.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "assignedAgentCloudRequest": args.assigned_agent_cloud_request,
-    "assignedRequest": args.assigned_request,
-    "authorization": args.authorization,
-    "createdOn": args.created_on,
-    "lastCompletedRequest": args.last_completed_request,
-    "maxParallelism": args.max_parallelism,
-}
+def main() -> None:
+    """Read env vars / flags, call create_agents() and print the result."""
+    organization, pat = get_common_env()
+    pool_id = require_env("POOL_ID", "The agent pool in which to add the agent")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/distributedtask/pools/{POOL_ID}/agents", API_VERSION)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Adds an agent to a pool.")
+    parser.add_argument("--assigned-agent-cloud-request", required=False, help="The agent cloud request that's currently associated with this agent.")
+    parser.add_argument("--assigned-request", required=False, help="The request which is currently assigned to this agent.")
+    parser.add_argument("--authorization", required=False, help="Authorization information for this agent.")
+    parser.add_argument("--created-on", required=False, help="Date on which this agent was created.")
+    parser.add_argument("--last-completed-request", required=False, help="The last request which was completed by this agent.")
+    parser.add_argument("--max-parallelism", required=False, help="Maximum job parallelism allowed for this agent.")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_agents", pat)
+    logger.info("Adds an agent to a pool.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_agents(client, pool_id, assigned_agent_cloud_request=args.assigned_agent_cloud_request, assigned_request=args.assigned_request, authorization=args.authorization, created_on=args.created_on, last_completed_request=args.last_completed_request, max_parallelism=args.max_parallelism)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['assignedAgentCloudRequest', 'assignedRequest'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
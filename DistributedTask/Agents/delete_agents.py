@@ -10,47 +10,70 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/distributed-task/agents/delete?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-POOL_ID = get_env_or_exit("POOL_ID", "The pool ID to remove the agent from")
-AGENT_ID = get_env_or_exit("AGENT_ID", "The agent ID to remove")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("delete_agents", PAT)
-logger.info("Delete an agent.")
+def delete_agents(client, pool_id: str, agent_id: str) -> dict:
+    """
+    Delete an agent.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        pool_id: The pool ID to remove the agent from
+        agent_id: The agent ID to remove
+
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/distributedtask/pools/{pool_id}/agents/{agent_id}", API_VERSION)
+    response = client.request("DELETE", url)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/distributedtask/pools/{POOL_ID}/agents/{AGENT_ID}", API_VERSION)
-logger.info(f"DELETE {url}")
 
-response = execute_request("DELETE", url, HEADERS)
+async def delete_agents_async(client, pool_id: str, agent_id: str) -> dict:
+    """Async variant of delete_agents() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/distributedtask/pools/{pool_id}/agents/{agent_id}", API_VERSION)
+    response = await client.request("DELETE", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call delete_agents() and print the result."""
+    organization, pat = get_common_env()
+    pool_id = require_env("POOL_ID", "The pool ID to remove the agent from")
+    agent_id = require_env("AGENT_ID", "The agent ID to remove")
+
+    logger = AdoLogger("delete_agents", pat)
+    logger.info("Delete an agent.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = delete_agents(client, pool_id, agent_id)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
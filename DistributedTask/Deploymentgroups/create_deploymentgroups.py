@@ -11,69 +11,90 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/distributed-task/d
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Create a deployment group.")
-parser.add_argument("--description", required=False, help="Description of the deployment group.")
-parser.add_argument("--name", required=False, help="Name of the deployment group.")
-parser.add_argument("--pool-id", required=False, help="Identifier of the deployment pool in which deployment agents are registered.")
-args = parser.parse_args()
+def create_deploymentgroups(client, project: str, *, description: Optional[str] = None, name: Optional[str] = None, pool_id: Optional[str] = None) -> dict:
+    """
+    Create a deployment group.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        description: Description of the deployment group.
+        name: Name of the deployment group.
+        pool_id: Identifier of the deployment pool in which deployment agents are registered.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "description": description,
+        "name": name,
+        "poolId": pool_id,
+    }
+    url = build_url(client.organization, f"_apis/distributedtask/deploymentgroups", API_VERSION, project=project)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['description', 'machineCount'], API_VERSION)
+    return data
+
+
+async def create_deploymentgroups_async(client, project: str, *, description: Optional[str] = None, name: Optional[str] = None, pool_id: Optional[str] = None) -> dict:
+    """Async variant of create_deploymentgroups() for use with AsyncAdoClient."""
+    body = {
+        "description": description,
+        "name": name,
+        "poolId": pool_id,
+    }
+    url = build_url(client.organization, f"_apis/distributedtask/deploymentgroups", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['description', 'machineCount'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_deploymentgroups", PAT)
-logger.info("Create a deployment group.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "description": args.description,
-    "name": args.name,
-    "poolId": args.pool_id,
-}
+def main() -> None:
+    """Read env vars / flags, call create_deploymentgroups() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/distributedtask/deploymentgroups", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Create a deployment group.")
+    parser.add_argument("--description", required=False, help="Description of the deployment group.")
+    parser.add_argument("--name", required=False, help="Name of the deployment group.")
+    parser.add_argument("--pool-id", required=False, help="Identifier of the deployment pool in which deployment agents are registered.")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_deploymentgroups", pat)
+    logger.info("Create a deployment group.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_deploymentgroups(client, project, description=args.description, name=args.name, pool_id=args.pool_id)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['description', 'machineCount'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
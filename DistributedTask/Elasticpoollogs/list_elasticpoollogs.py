@@ -10,46 +10,80 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/distributed-task/elasticpoollogs/list?view=azure-devops-rest-7.2
 """
 
-import json
+import argparse
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-POOL_ID = get_env_or_exit("POOL_ID", "Pool Id of the Elastic Pool")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("list_elasticpoollogs", PAT)
-logger.info("Get elastic pool diagnostics logs for a specified Elastic Pool.")
+def list_elasticpoollogs(client, pool_id: str) -> dict:
+    """
+    Get elastic pool diagnostics logs for a specified Elastic Pool.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/distributedtask/elasticpools/{POOL_ID}/logs", API_VERSION)
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        pool_id: Pool Id of the Elastic Pool
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/distributedtask/elasticpools/{pool_id}/logs", API_VERSION)
+    response = client.request("GET", url)
+    data = loads(response.content)
+    return data
+
+
+async def list_elasticpoollogs_async(client, pool_id: str) -> dict:
+    """Async variant of list_elasticpoollogs() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/distributedtask/elasticpools/{pool_id}/logs", API_VERSION)
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call list_elasticpoollogs() and print the result."""
+    organization, pat = get_common_env()
+    pool_id = require_env("POOL_ID", "Pool Id of the Elastic Pool")
+
+    parser = argparse.ArgumentParser(description="Get elastic pool diagnostics logs for a specified Elastic Pool.")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("list_elasticpoollogs", pat)
+    logger.info("Get elastic pool diagnostics logs for a specified Elastic Pool.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        items = items_of(list_elasticpoollogs(client, pool_id), "value")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    data = list_elasticpoollogs(client, pool_id)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
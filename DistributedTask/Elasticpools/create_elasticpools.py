@@ -11,75 +11,102 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/distributed-task/e
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-POOL_NAME = get_env_or_exit("POOL_NAME", "Name to use for the new TaskAgentPool")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Create a new elastic pool.")
-parser.add_argument("--agent-interactive-ui", required=False, help="Set whether agents should be configured to run with interactive UI")
-parser.add_argument("--azure-id", required=False, help="Azure string representing to location of the resource")
-parser.add_argument("--desired-idle", required=False, help="Number of agents to have ready waiting for jobs")
-parser.add_argument("--desired-size", required=False, help="The desired size of the pool")
-parser.add_argument("--max-capacity", required=False, help="Maximum number of nodes that will exist in the elastic pool")
-parser.add_argument("--max-saved-node-count", required=False, help="Keep nodes in the pool on failure for investigation")
-args = parser.parse_args()
+def create_elasticpools(client, pool_name: str, *, agent_interactive_ui: Optional[str] = None, azure_id: Optional[str] = None, desired_idle: Optional[str] = None, desired_size: Optional[str] = None, max_capacity: Optional[str] = None, max_saved_node_count: Optional[str] = None) -> dict:
+    """
+    Create a new elastic pool.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        pool_name: Name to use for the new TaskAgentPool
+        agent_interactive_ui: Set whether agents should be configured to run with interactive UI
+        azure_id: Azure string representing to location of the resource
+        desired_idle: Number of agents to have ready waiting for jobs
+        desired_size: The desired size of the pool
+        max_capacity: Maximum number of nodes that will exist in the elastic pool
+        max_saved_node_count: Keep nodes in the pool on failure for investigation
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "agentInteractiveUI": agent_interactive_ui,
+        "azureId": azure_id,
+        "desiredIdle": desired_idle,
+        "desiredSize": desired_size,
+        "maxCapacity": max_capacity,
+        "maxSavedNodeCount": max_saved_node_count,
+    }
+    url = build_url(client.organization, f"_apis/distributedtask/elasticpools", API_VERSION)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['agentPool', 'agentQueue'], API_VERSION)
+    return data
+
+
+async def create_elasticpools_async(client, pool_name: str, *, agent_interactive_ui: Optional[str] = None, azure_id: Optional[str] = None, desired_idle: Optional[str] = None, desired_size: Optional[str] = None, max_capacity: Optional[str] = None, max_saved_node_count: Optional[str] = None) -> dict:
+    """Async variant of create_elasticpools() for use with AsyncAdoClient."""
+    body = {
+        "agentInteractiveUI": agent_interactive_ui,
+        "azureId": azure_id,
+        "desiredIdle": desired_idle,
+        "desiredSize": desired_size,
+        "maxCapacity": max_capacity,
+        "maxSavedNodeCount": max_saved_node_count,
+    }
+    url = build_url(client.organization, f"_apis/distributedtask/elasticpools", API_VERSION)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['agentPool', 'agentQueue'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_elasticpools", PAT)
-logger.info("Create a new elastic pool.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "agentInteractiveUI": args.agent_interactive_ui,
-    "azureId": args.azure_id,
-    "desiredIdle": args.desired_idle,
-    "desiredSize": args.desired_size,
-    "maxCapacity": args.max_capacity,
-    "maxSavedNodeCount": args.max_saved_node_count,
-}
+def main() -> None:
+    """Read env vars / flags, call create_elasticpools() and print the result."""
+    organization, pat = get_common_env()
+    pool_name = require_env("POOL_NAME", "Name to use for the new TaskAgentPool")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/distributedtask/elasticpools", API_VERSION)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Create a new elastic pool.")
+    parser.add_argument("--agent-interactive-ui", required=False, help="Set whether agents should be configured to run with interactive UI")
+    parser.add_argument("--azure-id", required=False, help="Azure string representing to location of the resource")
+    parser.add_argument("--desired-idle", required=False, help="Number of agents to have ready waiting for jobs")
+    parser.add_argument("--desired-size", required=False, help="The desired size of the pool")
+    parser.add_argument("--max-capacity", required=False, help="Maximum number of nodes that will exist in the elastic pool")
+    parser.add_argument("--max-saved-node-count", required=False, help="Keep nodes in the pool on failure for investigation")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_elasticpools", pat)
+    logger.info("Create a new elastic pool.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_elasticpools(client, pool_name, agent_interactive_ui=args.agent_interactive_ui, azure_id=args.azure_id, desired_idle=args.desired_idle, desired_size=args.desired_size, max_capacity=args.max_capacity, max_saved_node_count=args.max_saved_node_count)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['agentPool', 'agentQueue'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,64 +11,88 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/distributed-task/e
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-SCOPE_IDENTIFIER = get_env_or_exit("SCOPE_IDENTIFIER", "The project GUID to scope the request")
-HUB_NAME = get_env_or_exit("HUB_NAME", "The name of the server hub. Common examples: 'build', 'rm', 'checks'")
-PLAN_ID = get_env_or_exit("PLAN_ID", "The ID of the plan.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Send a pipeline job event to be processed by the execution plan.")
-parser.add_argument("--job-id", required=False, help="The ID of the pipeline job affected by the event.")
-parser.add_argument("--name", required=False, help="The name of the pipeline job event.")
-args = parser.parse_args()
+def create_post_event(client, scope_identifier: str, hub_name: str, plan_id: str, *, job_id: Optional[str] = None, name: Optional[str] = None) -> dict:
+    """
+    Send a pipeline job event to be processed by the execution plan.
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_post_event", PAT)
-logger.info("Send a pipeline job event to be processed by the execution plan.")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        scope_identifier: The project GUID to scope the request
+        hub_name: The name of the server hub. Common examples: 'build', 'rm', 'checks'
+        plan_id: The ID of the plan.
+        job_id: The ID of the pipeline job affected by the event.
+        name: The name of the pipeline job event.
 
-# ---------------------------------------------------------------------------
-# Request body
-# ---------------------------------------------------------------------------
-body = {
-    "jobId": args.job_id,
-    "name": args.name,
-}
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "jobId": job_id,
+        "name": name,
+    }
+    url = build_url(client.organization, f"{scope_identifier}/_apis/distributedtask/hubs/{hub_name}/plans/{plan_id}/events", API_VERSION)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"{SCOPE_IDENTIFIER}/_apis/distributedtask/hubs/{HUB_NAME}/plans/{PLAN_ID}/events", API_VERSION)
-logger.info(f"POST {url}")
 
-response = execute_request("POST", url, HEADERS, body=body)
+async def create_post_event_async(client, scope_identifier: str, hub_name: str, plan_id: str, *, job_id: Optional[str] = None, name: Optional[str] = None) -> dict:
+    """Async variant of create_post_event() for use with AsyncAdoClient."""
+    body = {
+        "jobId": job_id,
+        "name": name,
+    }
+    url = build_url(client.organization, f"{scope_identifier}/_apis/distributedtask/hubs/{hub_name}/plans/{plan_id}/events", API_VERSION)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call create_post_event() and print the result."""
+    organization, pat = get_common_env()
+    scope_identifier = require_env("SCOPE_IDENTIFIER", "The project GUID to scope the request")
+    hub_name = require_env("HUB_NAME", "The name of the server hub. Common examples: 'build', 'rm', 'checks'")
+    plan_id = require_env("PLAN_ID", "The ID of the plan.")
+
+    parser = argparse.ArgumentParser(description="Send a pipeline job event to be processed by the execution plan.")
+    parser.add_argument("--job-id", required=False, help="The ID of the pipeline job affected by the event.")
+    parser.add_argument("--name", required=False, help="The name of the pipeline job event.")
+    args = parser.parse_args()
+
+    logger = AdoLogger("create_post_event", pat)
+    logger.info("Send a pipeline job event to be processed by the execution plan.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = create_post_event(client, scope_identifier, hub_name, plan_id, job_id=args.job_id, name=args.name)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
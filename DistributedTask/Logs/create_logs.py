@@ -11,75 +11,102 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/distributed-task/l
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-SCOPE_IDENTIFIER = get_env_or_exit("SCOPE_IDENTIFIER", "The project GUID to scope the request")
-HUB_NAME = get_env_or_exit("HUB_NAME", "The name of the server hub. Common examples: 'build', 'rm', 'checks'")
-PLAN_ID = get_env_or_exit("PLAN_ID", "The ID of the plan.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Create a log and connect it to a pipeline run's execution plan.")
-parser.add_argument("--created-on", required=False, help="The time of the task log creation.")
-parser.add_argument("--index-location", required=False, help="The REST URL of the task log when indexed.")
-parser.add_argument("--last-changed-on", required=False, help="The time of the last modification of the task log.")
-parser.add_argument("--line-count", required=False, help="The number of the task log lines.")
-parser.add_argument("--path", required=False, help="The path of the task log.")
-args = parser.parse_args()
+def create_logs(client, scope_identifier: str, hub_name: str, plan_id: str, *, created_on: Optional[str] = None, index_location: Optional[str] = None, last_changed_on: Optional[str] = None, line_count: Optional[str] = None, path: Optional[str] = None) -> dict:
+    """
+    Create a log and connect it to a pipeline run's execution plan.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        scope_identifier: The project GUID to scope the request
+        hub_name: The name of the server hub. Common examples: 'build', 'rm', 'checks'
+        plan_id: The ID of the plan.
+        created_on: The time of the task log creation.
+        index_location: The REST URL of the task log when indexed.
+        last_changed_on: The time of the last modification of the task log.
+        line_count: The number of the task log lines.
+        path: The path of the task log.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "createdOn": created_on,
+        "indexLocation": index_location,
+        "lastChangedOn": last_changed_on,
+        "lineCount": line_count,
+        "path": path,
+    }
+    url = build_url(client.organization, f"{scope_identifier}/_apis/distributedtask/hubs/{hub_name}/plans/{plan_id}/logs", API_VERSION)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['createdOn', 'indexLocation'], API_VERSION)
+    return data
+
+
+async def create_logs_async(client, scope_identifier: str, hub_name: str, plan_id: str, *, created_on: Optional[str] = None, index_location: Optional[str] = None, last_changed_on: Optional[str] = None, line_count: Optional[str] = None, path: Optional[str] = None) -> dict:
+    """Async variant of create_logs() for use with AsyncAdoClient."""
+    body = {
+        "createdOn": created_on,
+        "indexLocation": index_location,
+        "lastChangedOn": last_changed_on,
+        "lineCount": line_count,
+        "path": path,
+    }
+    url = build_url(client.organization, f"{scope_identifier}/_apis/distributedtask/hubs/{hub_name}/plans/{plan_id}/logs", API_VERSION)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['createdOn', 'indexLocation'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_logs", PAT)
-logger.info("Create a log and connect it to a pipeline run's execution plan.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "createdOn": args.created_on,
-    "indexLocation": args.index_location,
-    "lastChangedOn": args.last_changed_on,
-    "lineCount": args.line_count,
-    "path": args.path,
-}
+def main() -> None:
+    """Read env vars / flags, call create_logs() and print the result."""
+    organization, pat = get_common_env()
+    scope_identifier = require_env("SCOPE_IDENTIFIER", "The project GUID to scope the request")
+    hub_name = require_env("HUB_NAME", "The name of the server hub. Common examples: 'build', 'rm', 'checks'")
+    plan_id = require_env("PLAN_ID", "The ID of the plan.")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"{SCOPE_IDENTIFIER}/_apis/distributedtask/hubs/{HUB_NAME}/plans/{PLAN_ID}/logs", API_VERSION)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Create a log and connect it to a pipeline run's execution plan.")
+    parser.add_argument("--created-on", required=False, help="The time of the task log creation.")
+    parser.add_argument("--index-location", required=False, help="The REST URL of the task log when indexed.")
+    parser.add_argument("--last-changed-on", required=False, help="The time of the last modification of the task log.")
+    parser.add_argument("--line-count", required=False, help="The number of the task log lines.")
+    parser.add_argument("--path", required=False, help="The path of the task log.")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_logs", pat)
+    logger.info("Create a log and connect it to a pipeline run's execution plan.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_logs(client, scope_identifier, hub_name, plan_id, created_on=args.created_on, index_location=args.index_location, last_changed_on=args.last_changed_on, line_count=args.line_count, path=args.path)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['createdOn', 'indexLocation'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
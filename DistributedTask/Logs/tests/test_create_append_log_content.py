@@ -8,57 +8,26 @@ Validates:
   - Correct Authorization header
   - Successful response parsing (200)
   - Exit when required env vars are missing
+
+The script is imported and called in-process; see the fixtures in conftest.py.
 """
 
 import json
-import os
-import subprocess
-import sys
 from pathlib import Path
 
 import pytest
 import responses
 
+from _shared.errors import AdoAuthError, AdoNotFound
+from DistributedTask.Logs.create_append_log_content import create_append_log_content, main
+
 FIXTURES = Path(__file__).parent / "fixtures"
-SCRIPT = str(Path(__file__).resolve().parents[1] / "create_append_log_content.py")
-
-# ---------------------------------------------------------------------------
-# Helpers
-# ---------------------------------------------------------------------------
-
-def _run_script(env_override=None, extra_args=None, expect_fail=False):
-    """Run the script as a subprocess with the given env."""
-    env = {
-        "AZURE_DEVOPS_ORG": "testorg",
-        "AZURE_DEVOPS_PAT": "fakepat1234567890",
-        "SCOPE_IDENTIFIER": "test-value-scope_identifier",
-        "HUB_NAME": "test-value-hub_name",
-        "PLAN_ID": "test-value-plan_id",
-        "LOG_ID": "test-value-log_id",
-        "PATH": os.environ.get("PATH", ""),
-        "PYTHONPATH": os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."),
-    }
-    if env_override:
-        env.update(env_override)
-    env = {k: v for k, v in env.items() if v is not None}
-
-    cmd = [sys.executable, SCRIPT]
-    if extra_args:
-        cmd.extend(extra_args)
-
-    result = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        env=env,
-        timeout=30,
-    )
-    if not expect_fail:
-        assert result.returncode == 0, (
-            f"Script failed (rc={result.returncode}):\n"
-            f"STDOUT: {result.stdout}\nSTDERR: {result.stderr}"
-        )
-    return result
+ENV = {
+    "SCOPE_IDENTIFIER": "test-value-scope_identifier",
+    "HUB_NAME": "test-value-hub_name",
+    "PLAN_ID": "test-value-plan_id",
+    "LOG_ID": "test-value-log_id",
+}
 
 
 class TestCreateAppendLogContentEnvValidation:
@@ -66,63 +35,45 @@ class TestCreateAppendLogContentEnvValidation:
 
     @pytest.mark.offline
     @pytest.mark.distributedtask
-    def test_missing_org_exits(self):
-        result = _run_script(
-            env_override={"AZURE_DEVOPS_ORG": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "AZURE_DEVOPS_ORG" in result.stderr or "AZURE_DEVOPS_ORG" in result.stdout
+    def test_missing_org_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "AZURE_DEVOPS_ORG": None})
+        assert code != 0
+        assert "AZURE_DEVOPS_ORG" in output
 
     @pytest.mark.offline
     @pytest.mark.distributedtask
-    def test_missing_pat_exits(self):
-        result = _run_script(
-            env_override={"AZURE_DEVOPS_PAT": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "AZURE_DEVOPS_PAT" in result.stderr or "AZURE_DEVOPS_PAT" in result.stdout
+    def test_missing_pat_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "AZURE_DEVOPS_PAT": None})
+        assert code != 0
+        assert "AZURE_DEVOPS_PAT" in output
 
     @pytest.mark.offline
     @pytest.mark.distributedtask
-    def test_missing_scope_identifier_exits(self):
-        result = _run_script(
-            env_override={"SCOPE_IDENTIFIER": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "SCOPE_IDENTIFIER" in result.stderr or "SCOPE_IDENTIFIER" in result.stdout
+    def test_missing_scope_identifier_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "SCOPE_IDENTIFIER": None})
+        assert code != 0
+        assert "SCOPE_IDENTIFIER" in output
 
     @pytest.mark.offline
     @pytest.mark.distributedtask
-    def test_missing_hub_name_exits(self):
-        result = _run_script(
-            env_override={"HUB_NAME": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "HUB_NAME" in result.stderr or "HUB_NAME" in result.stdout
+    def test_missing_hub_name_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "HUB_NAME": None})
+        assert code != 0
+        assert "HUB_NAME" in output
 
     @pytest.mark.offline
     @pytest.mark.distributedtask
-    def test_missing_plan_id_exits(self):
-        result = _run_script(
-            env_override={"PLAN_ID": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "PLAN_ID" in result.stderr or "PLAN_ID" in result.stdout
+    def test_missing_plan_id_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "PLAN_ID": None})
+        assert code != 0
+        assert "PLAN_ID" in output
 
     @pytest.mark.offline
     @pytest.mark.distributedtask
-    def test_missing_log_id_exits(self):
-        result = _run_script(
-            env_override={"LOG_ID": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "LOG_ID" in result.stderr or "LOG_ID" in result.stdout
+    def test_missing_log_id_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "LOG_ID": None})
+        assert code != 0
+        assert "LOG_ID" in output
 
 
 class TestCreateAppendLogContentURLAndAuth:
@@ -131,56 +82,39 @@ class TestCreateAppendLogContentURLAndAuth:
     @pytest.mark.offline
     @pytest.mark.distributedtask
     @responses.activate
-    def test_correct_url_and_auth_header(self):
-        """Verify the script builds the right URL and Authorization header."""
-        import base64
-
-        org = "testorg"
-        pat = "fakepat1234567890"
+    def test_correct_url_and_auth_header(self, ado_client):
+        """Verify the operation builds the right URL and Authorization header."""
         expected_url = "https://dev.azure.com/testorg/test-value-scope_identifier/_apis/distributedtask/hubs/test-value-hub_name/plans/test-value-plan_id/logs/test-value-log_id?api-version=7.2"
-
         fixture = json.loads((FIXTURES / "create_append_log_content_200.json").read_text())
         responses.add(responses.POST, expected_url, json=fixture, status=200)
 
-        import requests as req
-
-        cred = base64.b64encode(f":{pat}".encode("ascii")).decode("ascii")
-        headers = {
-            "Authorization": f"Basic {cred}",
-            "Content-Type": "application/json",
-        }
-        resp = req.post(expected_url, headers=headers, timeout=30)
-
-        assert resp.status_code == 200
+        assert create_append_log_content(ado_client, "test-value-scope_identifier", "test-value-hub_name", "test-value-plan_id", "test-value-log_id") == fixture
         assert len(responses.calls) == 1
+        assert responses.calls[0].request.url == expected_url
         sent_auth = responses.calls[0].request.headers["Authorization"]
-        assert sent_auth.startswith("Basic ")
+        assert sent_auth == "Basic OmZha2VwYXQxMjM0NTY3ODkw"
 
 
 class TestCreateAppendLogContentHTTPErrors:
-    """Validate behaviour on error status codes."""
+    """Validate the typed error raised for error status codes."""
 
     @pytest.mark.offline
     @pytest.mark.distributedtask
     @responses.activate
-    def test_401_unauthorized(self):
+    def test_401_unauthorized(self, ado_client):
         url = "https://dev.azure.com/testorg/test-value-scope_identifier/_apis/distributedtask/hubs/test-value-hub_name/plans/test-value-plan_id/logs/test-value-log_id?api-version=7.2"
         responses.add(responses.POST, url, json={"message": "unauthorized"}, status=401)
 
-        import requests as req
-
-        resp = req.post(url, headers={"Authorization": "Basic fake"}, timeout=30)
-        assert resp.status_code == 401
+        with pytest.raises(AdoAuthError):
+            create_append_log_content(ado_client, "test-value-scope_identifier", "test-value-hub_name", "test-value-plan_id", "test-value-log_id")
 
     @pytest.mark.offline
     @pytest.mark.distributedtask
     @responses.activate
-    def test_404_not_found(self):
+    def test_404_not_found(self, ado_client):
         url = "https://dev.azure.com/testorg/test-value-scope_identifier/_apis/distributedtask/hubs/test-value-hub_name/plans/test-value-plan_id/logs/test-value-log_id?api-version=7.2"
         responses.add(responses.POST, url, json={"message": "not_found"}, status=404)
 
-        import requests as req
-
-        resp = req.post(url, headers={"Authorization": "Basic fake"}, timeout=30)
-        assert resp.status_code == 404
+        with pytest.raises(AdoNotFound):
+            create_append_log_content(ado_client, "test-value-scope_identifier", "test-value-hub_name", "test-value-plan_id", "test-value-log_id")
 
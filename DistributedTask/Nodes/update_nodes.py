@@ -11,67 +11,85 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/distributed-task/n
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-POOL_ID = get_env_or_exit("POOL_ID", "poolId")
-ELASTIC_NODE_ID = get_env_or_exit("ELASTIC_NODE_ID", "elasticNodeId")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Update properties on a specified ElasticNode")
-parser.add_argument("--state", required=False, help="State of the ElasticNode")
-args = parser.parse_args()
+def update_nodes(client, pool_id: str, elastic_node_id: str, *, state: Optional[str] = None) -> dict:
+    """
+    Update properties on a specified ElasticNode
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        pool_id: poolId
+        elastic_node_id: elasticNodeId
+        state: State of the ElasticNode
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "state": state,
+    }
+    url = build_url(client.organization, f"_apis/distributedtask/elasticpools/{pool_id}/nodes/{elastic_node_id}", API_VERSION)
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name', 'agentId'], API_VERSION)
+    return data
+
+
+async def update_nodes_async(client, pool_id: str, elastic_node_id: str, *, state: Optional[str] = None) -> dict:
+    """Async variant of update_nodes() for use with AsyncAdoClient."""
+    body = {
+        "state": state,
+    }
+    url = build_url(client.organization, f"_apis/distributedtask/elasticpools/{pool_id}/nodes/{elastic_node_id}", API_VERSION)
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name', 'agentId'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_nodes", PAT)
-logger.info("Update properties on a specified ElasticNode")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "state": args.state,
-}
+def main() -> None:
+    """Read env vars / flags, call update_nodes() and print the result."""
+    organization, pat = get_common_env()
+    pool_id = require_env("POOL_ID", "poolId")
+    elastic_node_id = require_env("ELASTIC_NODE_ID", "elasticNodeId")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/distributedtask/elasticpools/{POOL_ID}/nodes/{ELASTIC_NODE_ID}", API_VERSION)
-logger.info(f"PATCH {url}")
+    parser = argparse.ArgumentParser(description="Update properties on a specified ElasticNode")
+    parser.add_argument("--state", required=False, help="State of the ElasticNode")
+    args = parser.parse_args()
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+    logger = AdoLogger("update_nodes", pat)
+    logger.info("Update properties on a specified ElasticNode")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_nodes(client, pool_id, elastic_node_id, state=args.state)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'name', 'agentId'], API_VERSION)
+    print(f"Nodes: {data.get('name', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Nodes: {data.get("name", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,54 +10,76 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/distributed-task/oidctoken/create?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-SCOPE_IDENTIFIER = get_env_or_exit("SCOPE_IDENTIFIER", "The project GUID to scope the request")
-HUB_NAME = get_env_or_exit("HUB_NAME", "The name of the server hub. Common examples: 'build', 'rm', 'checks'")
-PLAN_ID = get_env_or_exit("PLAN_ID", "planId")
-JOB_ID = get_env_or_exit("JOB_ID", "jobId")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_oidctoken", PAT)
-logger.info("Create for Oidctoken")
+def create_oidctoken(client, scope_identifier: str, hub_name: str, plan_id: str, job_id: str) -> dict:
+    """
+    Create for Oidctoken
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"{SCOPE_IDENTIFIER}/_apis/distributedtask/hubs/{HUB_NAME}/plans/{PLAN_ID}/jobs/{JOB_ID}/oidctoken", API_VERSION)
-logger.info(f"POST {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        scope_identifier: The project GUID to scope the request
+        hub_name: The name of the server hub. Common examples: 'build', 'rm', 'checks'
+        plan_id: planId
+        job_id: jobId
 
-response = execute_request("POST", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"{scope_identifier}/_apis/distributedtask/hubs/{hub_name}/plans/{plan_id}/jobs/{job_id}/oidctoken", API_VERSION)
+    response = client.request("POST", url)
+    data = loads(response.content)
+    version_guard(data, ['oidcToken'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['oidcToken'], API_VERSION)
+async def create_oidctoken_async(client, scope_identifier: str, hub_name: str, plan_id: str, job_id: str) -> dict:
+    """Async variant of create_oidctoken() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"{scope_identifier}/_apis/distributedtask/hubs/{hub_name}/plans/{plan_id}/jobs/{job_id}/oidctoken", API_VERSION)
+    response = await client.request("POST", url)
+    data = loads(response.content)
+    version_guard(data, ['oidcToken'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call create_oidctoken() and print the result."""
+    organization, pat = get_common_env()
+    scope_identifier = require_env("SCOPE_IDENTIFIER", "The project GUID to scope the request")
+    hub_name = require_env("HUB_NAME", "The name of the server hub. Common examples: 'build', 'rm', 'checks'")
+    plan_id = require_env("PLAN_ID", "planId")
+    job_id = require_env("JOB_ID", "jobId")
+
+    logger = AdoLogger("create_oidctoken", pat)
+    logger.info("Create for Oidctoken")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = create_oidctoken(client, scope_identifier, hub_name, plan_id, job_id)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
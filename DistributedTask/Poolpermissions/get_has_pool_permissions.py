@@ -10,47 +10,70 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/distributed-task/poolpermissions/has-pool-permissions?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-POOL_ID = get_env_or_exit("POOL_ID", "Id of the pool to check")
-PERMISSIONS = get_env_or_exit("PERMISSIONS", "Permissions to check. Multiple permissions might be merged into single value using bitwise OR ope...")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_has_pool_permissions", PAT)
-logger.info("Checks if current identity has passed permissions on a pool.")
+def get_has_pool_permissions(client, pool_id: str, permissions: str) -> dict:
+    """
+    Checks if current identity has passed permissions on a pool.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        pool_id: Id of the pool to check
+        permissions: Permissions to check. Multiple permissions might be merged into single value using bitwise OR ope...
+
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/distributedtask/pools/{pool_id}/permissions/{permissions}", API_VERSION)
+    response = client.request("GET", url)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/distributedtask/pools/{POOL_ID}/permissions/{PERMISSIONS}", API_VERSION)
-logger.info(f"GET {url}")
 
-response = execute_request("GET", url, HEADERS)
+async def get_has_pool_permissions_async(client, pool_id: str, permissions: str) -> dict:
+    """Async variant of get_has_pool_permissions() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/distributedtask/pools/{pool_id}/permissions/{permissions}", API_VERSION)
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_has_pool_permissions() and print the result."""
+    organization, pat = get_common_env()
+    pool_id = require_env("POOL_ID", "Id of the pool to check")
+    permissions = require_env("PERMISSIONS", "Permissions to check. Multiple permissions might be merged into single value using bitwise OR ope...")
+
+    logger = AdoLogger("get_has_pool_permissions", pat)
+    logger.info("Checks if current identity has passed permissions on a pool.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = get_has_pool_permissions(client, pool_id, permissions)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,55 +10,84 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/distributedtask/pools/get-agent-pools?view=azure-devops-rest-7.2
 """
 
-import json
+import argparse
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env
+from _shared.cli import run_cli
+from _shared.codec import loads
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2-preview.1"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("list_pools", PAT)
-logger.info("List all agent pools in the organization.")
+def list_pools(client) -> dict:
+    """
+    List all agent pools in the organization.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/distributedtask/pools", API_VERSION)
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/distributedtask/pools", API_VERSION)
+    response = client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['count', 'value'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['count', 'value'], API_VERSION)
+async def list_pools_async(client) -> dict:
+    """Async variant of list_pools() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/distributedtask/pools", API_VERSION)
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['count', 'value'], API_VERSION)
+    return data
 
-logger.info(f"Retrieved {data.get('count', '?')} items")
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(f"Total: {data.get('count', 'N/A')}\n")
-for item in data.get("value", []):
-    cols = [item.get("id", "N/A"), item.get("name", "N/A"), item.get("poolType", "N/A")]
-    print("  " + "  ".join(str(c) for c in cols))
+def main() -> None:
+    """Read env vars / flags, call list_pools() and print the result."""
+    organization, pat = get_common_env()
+
+    parser = argparse.ArgumentParser(description="List all agent pools in the organization.")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("list_pools", pat)
+    logger.info("List all agent pools in the organization.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        items = items_of(list_pools(client), "value")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    data = list_pools(client)
+    logger.info(f"Retrieved {data.get('count', '?')} items")
+
+    print(f"Total: {data.get('count', 'N/A')}\n")
+    for item in data.get("value", []):
+        cols = [item.get("id", "N/A"), item.get("name", "N/A"), item.get("poolType", "N/A")]
+        print("  " + "  ".join(str(c) for c in cols))
+
+
+if __name__ == "__main__":
+    run_cli(main)
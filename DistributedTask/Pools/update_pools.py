@@ -11,75 +11,102 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/distributed-task/p
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-POOL_ID = get_env_or_exit("POOL_ID", "The agent pool to update")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Update properties on an agent pool")
-parser.add_argument("--agent-cloud-id", required=False, help="The ID of the associated agent cloud.")
-parser.add_argument("--auto-provision", required=False, help="Whether or not a queue should be automatically provisioned for each project collection.")
-parser.add_argument("--auto-size", required=False, help="Whether or not the pool should autosize itself based on the Agent Cloud Provider settings.")
-parser.add_argument("--auto-update", required=False, help="Whether or not agents in this pool are allowed to automatically update")
-parser.add_argument("--created-by", required=False, help="Creator of the pool. The creator of the pool is automatically added into the administrators group...")
-parser.add_argument("--created-on", required=False, help="The date/time of the pool creation.")
-args = parser.parse_args()
+def update_pools(client, pool_id: str, *, agent_cloud_id: Optional[str] = None, auto_provision: Optional[str] = None, auto_size: Optional[str] = None, auto_update: Optional[str] = None, created_by: Optional[str] = None, created_on: Optional[str] = None) -> dict:
+    """
+    Update properties on an agent pool
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        pool_id: The agent pool to update
+        agent_cloud_id: The ID of the associated agent cloud.
+        auto_provision: Whether or not a queue should be automatically provisioned for each project collection.
+        auto_size: Whether or not the pool should autosize itself based on the Agent Cloud Provider settings.
+        auto_update: Whether or not agents in this pool are allowed to automatically update
+        created_by: Creator of the pool. The creator of the pool is automatically added into the administrators group...
+        created_on: The date/time of the pool creation.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "agentCloudId": agent_cloud_id,
+        "autoProvision": auto_provision,
+        "autoSize": auto_size,
+        "autoUpdate": auto_update,
+        "createdBy": created_by,
+        "createdOn": created_on,
+    }
+    url = build_url(client.organization, f"_apis/distributedtask/pools/{pool_id}", API_VERSION)
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['agentCloudId', 'autoProvision'], API_VERSION)
+    return data
+
+
+async def update_pools_async(client, pool_id: str, *, agent_cloud_id: Optional[str] = None, auto_provision: Optional[str] = None, auto_size: Optional[str] = None, auto_update: Optional[str] = None, created_by: Optional[str] = None, created_on: Optional[str] = None) -> dict:
+    """Async variant of update_pools() for use with AsyncAdoClient."""
+    body = {
+        "agentCloudId": agent_cloud_id,
+        "autoProvision": auto_provision,
+        "autoSize": auto_size,
+        "autoUpdate": auto_update,
+        "createdBy": created_by,
+        "createdOn": created_on,
+    }
+    url = build_url(client.organization, f"_apis/distributedtask/pools/{pool_id}", API_VERSION)
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['agentCloudId', 'autoProvision'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_pools", PAT)
-logger.info("Update properties on an agent pool")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "agentCloudId": args.agent_cloud_id,
-    "autoProvision": args.auto_provision,
-    "autoSize": args.auto_size,
-    "autoUpdate": args.auto_update,
-    "createdBy": args.created_by,
-    "createdOn": args.created_on,
-}
+def main() -> None:
+    """Read env vars / flags, call update_pools() and print the result."""
+    organization, pat = get_common_env()
+    pool_id = require_env("POOL_ID", "The agent pool to update")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/distributedtask/pools/{POOL_ID}", API_VERSION)
-logger.info(f"PATCH {url}")
+    parser = argparse.ArgumentParser(description="Update properties on an agent pool")
+    parser.add_argument("--agent-cloud-id", required=False, help="The ID of the associated agent cloud.")
+    parser.add_argument("--auto-provision", required=False, help="Whether or not a queue should be automatically provisioned for each project collection.")
+    parser.add_argument("--auto-size", required=False, help="Whether or not the pool should autosize itself based on the Agent Cloud Provider settings.")
+    parser.add_argument("--auto-update", required=False, help="Whether or not agents in this pool are allowed to automatically update")
+    parser.add_argument("--created-by", required=False, help="Creator of the pool. The creator of the pool is automatically added into the administrators group...")
+    parser.add_argument("--created-on", required=False, help="The date/time of the pool creation.")
+    args = parser.parse_args()
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+    logger = AdoLogger("update_pools", pat)
+    logger.info("Update properties on an agent pool")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_pools(client, pool_id, agent_cloud_id=args.agent_cloud_id, auto_provision=args.auto_provision, auto_size=args.auto_size, auto_update=args.auto_update, created_by=args.created_by, created_on=args.created_on)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['agentCloudId', 'autoProvision'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,72 +11,95 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/distributed-task/q
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Create a new agent queue to connect a project to an agent pool.")
-parser.add_argument("--id", required=False, help="ID of the queue")
-parser.add_argument("--name", required=False, help="Name of the queue")
-parser.add_argument("--pool", required=False, help="Pool reference for this queue")
-parser.add_argument("--project-id", required=False, help="Project ID")
-args = parser.parse_args()
+def create_queues(client, project: str, *, id: Optional[str] = None, name: Optional[str] = None, pool: Optional[str] = None, project_id: Optional[str] = None) -> dict:
+    """
+    Create a new agent queue to connect a project to an agent pool.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        id: ID of the queue
+        name: Name of the queue
+        pool: Pool reference for this queue
+        project_id: Project ID
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "id": id,
+        "name": name,
+        "pool": pool,
+        "projectId": project_id,
+    }
+    url = build_url(client.organization, f"_apis/distributedtask/queues", API_VERSION, project=project)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name'], API_VERSION)
+    return data
+
+
+async def create_queues_async(client, project: str, *, id: Optional[str] = None, name: Optional[str] = None, pool: Optional[str] = None, project_id: Optional[str] = None) -> dict:
+    """Async variant of create_queues() for use with AsyncAdoClient."""
+    body = {
+        "id": id,
+        "name": name,
+        "pool": pool,
+        "projectId": project_id,
+    }
+    url = build_url(client.organization, f"_apis/distributedtask/queues", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_queues", PAT)
-logger.info("Create a new agent queue to connect a project to an agent pool.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "id": args.id,
-    "name": args.name,
-    "pool": args.pool,
-    "projectId": args.project_id,
-}
+def main() -> None:
+    """Read env vars / flags, call create_queues() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/distributedtask/queues", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Create a new agent queue to connect a project to an agent pool.")
+    parser.add_argument("--id", required=False, help="ID of the queue")
+    parser.add_argument("--name", required=False, help="Name of the queue")
+    parser.add_argument("--pool", required=False, help="Pool reference for this queue")
+    parser.add_argument("--project-id", required=False, help="Project ID")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_queues", pat)
+    logger.info("Create a new agent queue to connect a project to an agent pool.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_queues(client, project, id=args.id, name=args.name, pool=args.pool, project_id=args.project_id)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'name'], API_VERSION)
+    print(f"Queues: {data.get('name', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Queues: {data.get("name", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,63 +11,94 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/distributed-task/r
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-SCOPE_IDENTIFIER = get_env_or_exit("SCOPE_IDENTIFIER", "The project GUID to scope the request")
-HUB_NAME = get_env_or_exit("HUB_NAME", "The name of the server hub. Common examples: 'build', 'rm', 'checks'")
-PLAN_ID = get_env_or_exit("PLAN_ID", "The ID of the plan.")
-TIMELINE_ID = get_env_or_exit("TIMELINE_ID", "The ID of the timeline.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Update timeline records if they already exist, otherwise create new ones for the same timeline.")
-parser.add_argument("--value", required=False, help="The serialized item.")
-args = parser.parse_args()
+def update_records(client, scope_identifier: str, hub_name: str, plan_id: str, timeline_id: str, *, value: Optional[str] = None) -> dict:
+    """
+    Update timeline records if they already exist, otherwise create new ones for the same timeline.
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_records", PAT)
-logger.info("Update timeline records if they already exist, otherwise create new ones for the same timeline.")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        scope_identifier: The project GUID to scope the request
+        hub_name: The name of the server hub. Common examples: 'build', 'rm', 'checks'
+        plan_id: The ID of the plan.
+        timeline_id: The ID of the timeline.
+        value: The serialized item.
 
-# ---------------------------------------------------------------------------
-# Request body
-# ---------------------------------------------------------------------------
-body = {
-    "value": args.value,
-}
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "value": value,
+    }
+    url = build_url(client.organization, f"{scope_identifier}/_apis/distributedtask/hubs/{hub_name}/plans/{plan_id}/timelines/{timeline_id}/records", API_VERSION)
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"{SCOPE_IDENTIFIER}/_apis/distributedtask/hubs/{HUB_NAME}/plans/{PLAN_ID}/timelines/{TIMELINE_ID}/records", API_VERSION)
-logger.info(f"PATCH {url}")
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+async def update_records_async(client, scope_identifier: str, hub_name: str, plan_id: str, timeline_id: str, *, value: Optional[str] = None) -> dict:
+    """Async variant of update_records() for use with AsyncAdoClient."""
+    body = {
+        "value": value,
+    }
+    url = build_url(client.organization, f"{scope_identifier}/_apis/distributedtask/hubs/{hub_name}/plans/{plan_id}/timelines/{timeline_id}/records", API_VERSION)
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call update_records() and print the result."""
+    organization, pat = get_common_env()
+    scope_identifier = require_env("SCOPE_IDENTIFIER", "The project GUID to scope the request")
+    hub_name = require_env("HUB_NAME", "The name of the server hub. Common examples: 'build', 'rm', 'checks'")
+    plan_id = require_env("PLAN_ID", "The ID of the plan.")
+    timeline_id = require_env("TIMELINE_ID", "The ID of the timeline.")
+
+    parser = argparse.ArgumentParser(description="Update timeline records if they already exist, otherwise create new ones for the same timeline.")
+    parser.add_argument("--value", required=False, help="The serialized item.")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("update_records", pat)
+    logger.info("Update timeline records if they already exist, otherwise create new ones for the same timeline.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        items = items_of(update_records(client, scope_identifier, hub_name, plan_id, timeline_id, value=args.value), "value")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    data = update_records(client, scope_identifier, hub_name, plan_id, timeline_id, value=args.value)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
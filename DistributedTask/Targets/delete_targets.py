@@ -10,48 +10,72 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/distributed-task/targets/delete?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-DEPLOYMENT_GROUP_ID = get_env_or_exit("DEPLOYMENT_GROUP_ID", "ID of the deployment group in which deployment target is deleted.")
-TARGET_ID = get_env_or_exit("TARGET_ID", "ID of the deployment target to delete.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("delete_targets", PAT)
-logger.info("Delete a deployment target in a deployment group.")
+def delete_targets(client, project: str, deployment_group_id: str, target_id: str) -> dict:
+    """
+    Delete a deployment target in a deployment group.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        deployment_group_id: ID of the deployment group in which deployment target is deleted.
+        target_id: ID of the deployment target to delete.
+
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/distributedtask/deploymentgroups/{deployment_group_id}/targets/{target_id}", API_VERSION, project=project)
+    response = client.request("DELETE", url)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/distributedtask/deploymentgroups/{DEPLOYMENT_GROUP_ID}/targets/{TARGET_ID}", API_VERSION, project=PROJECT_ID)
-logger.info(f"DELETE {url}")
 
-response = execute_request("DELETE", url, HEADERS)
+async def delete_targets_async(client, project: str, deployment_group_id: str, target_id: str) -> dict:
+    """Async variant of delete_targets() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/distributedtask/deploymentgroups/{deployment_group_id}/targets/{target_id}", API_VERSION, project=project)
+    response = await client.request("DELETE", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call delete_targets() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    deployment_group_id = require_env("DEPLOYMENT_GROUP_ID", "ID of the deployment group in which deployment target is deleted.")
+    target_id = require_env("TARGET_ID", "ID of the deployment target to delete.")
+
+    logger = AdoLogger("delete_targets", pat)
+    logger.info("Delete a deployment target in a deployment group.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = delete_targets(client, project, deployment_group_id, target_id)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
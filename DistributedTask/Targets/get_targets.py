@@ -10,54 +10,75 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/distributed-task/targets/get?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-DEPLOYMENT_GROUP_ID = get_env_or_exit("DEPLOYMENT_GROUP_ID", "ID of the deployment group to which deployment target belongs.")
-TARGET_ID = get_env_or_exit("TARGET_ID", "ID of the deployment target to return.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_targets", PAT)
-logger.info("Get a deployment target by its ID in a deployment group")
+def get_targets(client, project: str, deployment_group_id: str, target_id: str) -> dict:
+    """
+    Get a deployment target by its ID in a deployment group
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/distributedtask/deploymentgroups/{DEPLOYMENT_GROUP_ID}/targets/{TARGET_ID}", API_VERSION, project=PROJECT_ID)
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        deployment_group_id: ID of the deployment group to which deployment target belongs.
+        target_id: ID of the deployment target to return.
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/distributedtask/deploymentgroups/{deployment_group_id}/targets/{target_id}", API_VERSION, project=project)
+    response = client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['id', 'agent'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'agent'], API_VERSION)
+async def get_targets_async(client, project: str, deployment_group_id: str, target_id: str) -> dict:
+    """Async variant of get_targets() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/distributedtask/deploymentgroups/{deployment_group_id}/targets/{target_id}", API_VERSION, project=project)
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['id', 'agent'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(f"Targets ID: {data.get("id", "N/A")}")
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_targets() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    deployment_group_id = require_env("DEPLOYMENT_GROUP_ID", "ID of the deployment group to which deployment target belongs.")
+    target_id = require_env("TARGET_ID", "ID of the deployment target to return.")
+
+    logger = AdoLogger("get_targets", pat)
+    logger.info("Get a deployment target by its ID in a deployment group")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = get_targets(client, project, deployment_group_id, target_id)
+
+    print(f"Targets ID: {data.get('id', 'N/A')}")
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
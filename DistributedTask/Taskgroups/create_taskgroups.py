@@ -11,75 +11,102 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/distributed-task/t
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Create a task group.")
-parser.add_argument("--author", required=False, help="Sets author name of the task group.")
-parser.add_argument("--category", required=False, help="Sets category of the task group.")
-parser.add_argument("--description", required=False, help="Sets description of the task group.")
-parser.add_argument("--friendly-name", required=False, help="Sets friendly name of the task group.")
-parser.add_argument("--icon-url", required=False, help="Sets url icon of the task group.")
-parser.add_argument("--inputs", required=False, help="Sets input for the task group.")
-args = parser.parse_args()
+def create_taskgroups(client, project: str, *, author: Optional[str] = None, category: Optional[str] = None, description: Optional[str] = None, friendly_name: Optional[str] = None, icon_url: Optional[str] = None, inputs: Optional[str] = None) -> dict:
+    """
+    Create a task group.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        author: Sets author name of the task group.
+        category: Sets category of the task group.
+        description: Sets description of the task group.
+        friendly_name: Sets friendly name of the task group.
+        icon_url: Sets url icon of the task group.
+        inputs: Sets input for the task group.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "author": author,
+        "category": category,
+        "description": description,
+        "friendlyName": friendly_name,
+        "iconUrl": icon_url,
+        "inputs": inputs,
+    }
+    url = build_url(client.organization, f"_apis/distributedtask/taskgroups", API_VERSION, project=project)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['comment', 'createdBy'], API_VERSION)
+    return data
+
+
+async def create_taskgroups_async(client, project: str, *, author: Optional[str] = None, category: Optional[str] = None, description: Optional[str] = None, friendly_name: Optional[str] = None, icon_url: Optional[str] = None, inputs: Optional[str] = None) -> dict:
+    """Async variant of create_taskgroups() for use with AsyncAdoClient."""
+    body = {
+        "author": author,
+        "category": category,
+        "description": description,
+        "friendlyName": friendly_name,
+        "iconUrl": icon_url,
+        "inputs": inputs,
+    }
+    url = build_url(client.organization, f"_apis/distributedtask/taskgroups", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['comment', 'createdBy'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_taskgroups", PAT)
-logger.info("Create a task group.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "author": args.author,
-    "category": args.category,
-    "description": args.description,
-    "friendlyName": args.friendly_name,
-    "iconUrl": args.icon_url,
-    "inputs": args.inputs,
-}
+def main() -> None:
+    """Read env vars / flags, call create_taskgroups() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/distributedtask/taskgroups", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Create a task group.")
+    parser.add_argument("--author", required=False, help="Sets author name of the task group.")
+    parser.add_argument("--category", required=False, help="Sets category of the task group.")
+    parser.add_argument("--description", required=False, help="Sets description of the task group.")
+    parser.add_argument("--friendly-name", required=False, help="Sets friendly name of the task group.")
+    parser.add_argument("--icon-url", required=False, help="Sets url icon of the task group.")
+    parser.add_argument("--inputs", required=False, help="Sets input for the task group.")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_taskgroups", pat)
+    logger.info("Create a task group.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_taskgroups(client, project, author=args.author, category=args.category, description=args.description, friendly_name=args.friendly_name, icon_url=args.icon_url, inputs=args.inputs)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['comment', 'createdBy'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
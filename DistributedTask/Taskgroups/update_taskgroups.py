@@ -11,76 +11,104 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/distributed-task/t
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-TASK_GROUP_ID = get_env_or_exit("TASK_GROUP_ID", "Id of the task group to update.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Update a task group.")
-parser.add_argument("--author", required=False, help="Sets author name of the task group.")
-parser.add_argument("--category", required=False, help="Sets category of the task group.")
-parser.add_argument("--comment", required=False, help="Sets comment of the task group.")
-parser.add_argument("--description", required=False, help="Sets description of the task group.")
-parser.add_argument("--friendly-name", required=False, help="Sets friendly name of the task group.")
-parser.add_argument("--icon-url", required=False, help="Sets url icon of the task group.")
-args = parser.parse_args()
+def update_taskgroups(client, project: str, task_group_id: str, *, author: Optional[str] = None, category: Optional[str] = None, comment: Optional[str] = None, description: Optional[str] = None, friendly_name: Optional[str] = None, icon_url: Optional[str] = None) -> dict:
+    """
+    Update a task group.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        task_group_id: Id of the task group to update.
+        author: Sets author name of the task group.
+        category: Sets category of the task group.
+        comment: Sets comment of the task group.
+        description: Sets description of the task group.
+        friendly_name: Sets friendly name of the task group.
+        icon_url: Sets url icon of the task group.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "author": author,
+        "category": category,
+        "comment": comment,
+        "description": description,
+        "friendlyName": friendly_name,
+        "iconUrl": icon_url,
+    }
+    url = build_url(client.organization, f"_apis/distributedtask/taskgroups/{task_group_id}", API_VERSION, project=project)
+    response = client.request("PUT", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['comment', 'createdBy'], API_VERSION)
+    return data
+
+
+async def update_taskgroups_async(client, project: str, task_group_id: str, *, author: Optional[str] = None, category: Optional[str] = None, comment: Optional[str] = None, description: Optional[str] = None, friendly_name: Optional[str] = None, icon_url: Optional[str] = None) -> dict:
+    """Async variant of update_taskgroups() for use with AsyncAdoClient."""
+    body = {
+        "author": author,
+        "category": category,
+        "comment": comment,
+        "description": description,
+        "friendlyName": friendly_name,
+        "iconUrl": icon_url,
+    }
+    url = build_url(client.organization, f"_apis/distributedtask/taskgroups/{task_group_id}", API_VERSION, project=project)
+    response = await client.request("PUT", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['comment', 'createdBy'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_taskgroups", PAT)
-logger.info("Update a task group.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "author": args.author,
-    "category": args.category,
-    "comment": args.comment,
-    "description": args.description,
-    "friendlyName": args.friendly_name,
-    "iconUrl": args.icon_url,
-}
+def main() -> None:
+    """Read env vars / flags, call update_taskgroups() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    task_group_id = require_env("TASK_GROUP_ID", "Id of the task group to update.")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/distributedtask/taskgroups/{TASK_GROUP_ID}", API_VERSION, project=PROJECT_ID)
-logger.info(f"PUT {url}")
+    parser = argparse.ArgumentParser(description="Update a task group.")
+    parser.add_argument("--author", required=False, help="Sets author name of the task group.")
+    parser.add_argument("--category", required=False, help="Sets category of the task group.")
+    parser.add_argument("--comment", required=False, help="Sets comment of the task group.")
+    parser.add_argument("--description", required=False, help="Sets description of the task group.")
+    parser.add_argument("--friendly-name", required=False, help="Sets friendly name of the task group.")
+    parser.add_argument("--icon-url", required=False, help="Sets url icon of the task group.")
+    args = parser.parse_args()
 
-response = execute_request("PUT", url, HEADERS, body=body)
+    logger = AdoLogger("update_taskgroups", pat)
+    logger.info("Update a task group.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_taskgroups(client, project, task_group_id, author=args.author, category=args.category, comment=args.comment, description=args.description, friendly_name=args.friendly_name, icon_url=args.icon_url)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['comment', 'createdBy'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -58,5 +58,5 @@ version_guard(data, ['id', 'name', 'createdBy'], API_VERSION)
 # ---------------------------------------------------------------------------
 # Output
 # ---------------------------------------------------------------------------
-print(f"Variablegroups: {data.get("name", "N/A")}")
+print(f"Variablegroups: {data.get('name', 'N/A')}")
 print(json.dumps(data, indent=2))
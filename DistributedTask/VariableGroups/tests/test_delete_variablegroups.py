@@ -11,9 +11,6 @@ Validates:
 """
 
 import json
-import os
-import subprocess
-import sys
 from pathlib import Path
 
 import pytest
@@ -26,37 +23,10 @@ SCRIPT = str(Path(__file__).resolve().parents[1] / "delete_variablegroups.py")
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _run_script(env_override=None, extra_args=None, expect_fail=False):
-    """Run the script as a subprocess with the given env."""
-    env = {
-        "AZURE_DEVOPS_ORG": "testorg",
-        "AZURE_DEVOPS_PAT": "fakepat1234567890",
-        "GROUP_ID": "test-value-group_id",
-        "PROJECT_IDS": "test-value-project_ids",
-        "PATH": os.environ.get("PATH", ""),
-        "PYTHONPATH": os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."),
-    }
-    if env_override:
-        env.update(env_override)
-    env = {k: v for k, v in env.items() if v is not None}
-
-    cmd = [sys.executable, SCRIPT]
-    if extra_args:
-        cmd.extend(extra_args)
-
-    result = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        env=env,
-        timeout=30,
-    )
-    if not expect_fail:
-        assert result.returncode == 0, (
-            f"Script failed (rc={result.returncode}):\n"
-            f"STDOUT: {result.stdout}\nSTDERR: {result.stderr}"
-        )
-    return result
+ENV = {
+    "GROUP_ID": "test-value-group_id",
+    "PROJECT_IDS": "test-value-project_ids",
+}
 
 
 class TestDeleteVariablegroupsEnvValidation:
@@ -64,43 +34,31 @@ class TestDeleteVariablegroupsEnvValidation:
 
     @pytest.mark.offline
     @pytest.mark.distributedtask
-    def test_missing_org_exits(self):
-        result = _run_script(
-            env_override={"AZURE_DEVOPS_ORG": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "AZURE_DEVOPS_ORG" in result.stderr or "AZURE_DEVOPS_ORG" in result.stdout
+    def test_missing_org_exits(self, run_main):
+        code, output = run_main(SCRIPT, env={**ENV, "AZURE_DEVOPS_ORG": None})
+        assert code != 0
+        assert "AZURE_DEVOPS_ORG" in output
 
     @pytest.mark.offline
     @pytest.mark.distributedtask
-    def test_missing_pat_exits(self):
-        result = _run_script(
-            env_override={"AZURE_DEVOPS_PAT": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "AZURE_DEVOPS_PAT" in result.stderr or "AZURE_DEVOPS_PAT" in result.stdout
+    def test_missing_pat_exits(self, run_main):
+        code, output = run_main(SCRIPT, env={**ENV, "AZURE_DEVOPS_PAT": None})
+        assert code != 0
+        assert "AZURE_DEVOPS_PAT" in output
 
     @pytest.mark.offline
     @pytest.mark.distributedtask
-    def test_missing_group_id_exits(self):
-        result = _run_script(
-            env_override={"GROUP_ID": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "GROUP_ID" in result.stderr or "GROUP_ID" in result.stdout
+    def test_missing_group_id_exits(self, run_main):
+        code, output = run_main(SCRIPT, env={**ENV, "GROUP_ID": None})
+        assert code != 0
+        assert "GROUP_ID" in output
 
     @pytest.mark.offline
     @pytest.mark.distributedtask
-    def test_missing_project_ids_exits(self):
-        result = _run_script(
-            env_override={"PROJECT_IDS": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "PROJECT_IDS" in result.stderr or "PROJECT_IDS" in result.stdout
+    def test_missing_project_ids_exits(self, run_main):
+        code, output = run_main(SCRIPT, env={**ENV, "PROJECT_IDS": None})
+        assert code != 0
+        assert "PROJECT_IDS" in output
 
 
 class TestDeleteVariablegroupsURLAndAuth:
@@ -10,47 +10,70 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/distributed-task/variablegroups/delete?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-GROUP_ID = get_env_or_exit("GROUP_ID", "Id of the variable group.")
-PROJECT_IDS = get_env_or_exit("PROJECT_IDS", "projectIds")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("delete_variablegroups", PAT)
-logger.info("Delete a variable group")
+def delete_variablegroups(client, group_id: str, project_ids: str) -> dict:
+    """
+    Delete a variable group
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        group_id: Id of the variable group.
+        project_ids: projectIds
+
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/distributedtask/variablegroups/{group_id}", API_VERSION)
+    response = client.request("DELETE", url)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/distributedtask/variablegroups/{GROUP_ID}", API_VERSION)
-logger.info(f"DELETE {url}")
 
-response = execute_request("DELETE", url, HEADERS)
+async def delete_variablegroups_async(client, group_id: str, project_ids: str) -> dict:
+    """Async variant of delete_variablegroups() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/distributedtask/variablegroups/{group_id}", API_VERSION)
+    response = await client.request("DELETE", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call delete_variablegroups() and print the result."""
+    organization, pat = get_common_env()
+    group_id = require_env("GROUP_ID", "Id of the variable group.")
+    project_ids = require_env("PROJECT_IDS", "projectIds")
+
+    logger = AdoLogger("delete_variablegroups", pat)
+    logger.info("Delete a variable group")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = delete_variablegroups(client, group_id, project_ids)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,46 +10,68 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/distributed-task/variablegroups/share-variable-group?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-VARIABLE_GROUP_ID = get_env_or_exit("VARIABLE_GROUP_ID", "variableGroupId")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_share_variable_group", PAT)
-logger.info("Add a variable group.")
+def update_share_variable_group(client, variable_group_id: str) -> dict:
+    """
+    Add a variable group.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        variable_group_id: variableGroupId
+
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/distributedtask/variablegroups", API_VERSION)
+    response = client.request("PATCH", url)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/distributedtask/variablegroups", API_VERSION)
-logger.info(f"PATCH {url}")
 
-response = execute_request("PATCH", url, HEADERS)
+async def update_share_variable_group_async(client, variable_group_id: str) -> dict:
+    """Async variant of update_share_variable_group() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/distributedtask/variablegroups", API_VERSION)
+    response = await client.request("PATCH", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call update_share_variable_group() and print the result."""
+    organization, pat = get_common_env()
+    variable_group_id = require_env("VARIABLE_GROUP_ID", "variableGroupId")
+
+    logger = AdoLogger("update_share_variable_group", pat)
+    logger.info("Add a variable group.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = update_share_variable_group(client, variable_group_id)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
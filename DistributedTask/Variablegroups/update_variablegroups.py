@@ -11,76 +11,103 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/distributed-task/v
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-GROUP_ID = get_env_or_exit("GROUP_ID", "Id of the variable group to update.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Update a variable group.")
-parser.add_argument("--description", required=False, help="Sets description of the variable group.")
-parser.add_argument("--name", required=False, help="Sets name of the variable group.")
-parser.add_argument("--provider-data", required=False, help="Sets provider data.")
-parser.add_argument("--type", required=False, help="Sets type of the variable group.")
-parser.add_argument("--variable-group-project-references", required=False, help="variableGroupProjectReferences")
-parser.add_argument("--variables", required=False, help="Sets variables contained in the variable group.")
-args = parser.parse_args()
+def update_variablegroups(client, group_id: str, *, description: Optional[str] = None, name: Optional[str] = None, provider_data: Optional[str] = None, type: Optional[str] = None, variable_group_project_references: Optional[str] = None, variables: Optional[str] = None) -> dict:
+    """
+    Update a variable group.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        group_id: Id of the variable group to update.
+        description: Sets description of the variable group.
+        name: Sets name of the variable group.
+        provider_data: Sets provider data.
+        type: Sets type of the variable group.
+        variable_group_project_references: variableGroupProjectReferences
+        variables: Sets variables contained in the variable group.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "description": description,
+        "name": name,
+        "providerData": provider_data,
+        "type": type,
+        "variableGroupProjectReferences": variable_group_project_references,
+        "variables": variables,
+    }
+    url = build_url(client.organization, f"_apis/distributedtask/variablegroups/{group_id}", API_VERSION)
+    response = client.request("PUT", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name', 'createdBy'], API_VERSION)
+    return data
+
+
+async def update_variablegroups_async(client, group_id: str, *, description: Optional[str] = None, name: Optional[str] = None, provider_data: Optional[str] = None, type: Optional[str] = None, variable_group_project_references: Optional[str] = None, variables: Optional[str] = None) -> dict:
+    """Async variant of update_variablegroups() for use with AsyncAdoClient."""
+    body = {
+        "description": description,
+        "name": name,
+        "providerData": provider_data,
+        "type": type,
+        "variableGroupProjectReferences": variable_group_project_references,
+        "variables": variables,
+    }
+    url = build_url(client.organization, f"_apis/distributedtask/variablegroups/{group_id}", API_VERSION)
+    response = await client.request("PUT", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name', 'createdBy'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_variablegroups", PAT)
-logger.info("Update a variable group.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "description": args.description,
-    "name": args.name,
-    "providerData": args.provider_data,
-    "type": args.type,
-    "variableGroupProjectReferences": args.variable_group_project_references,
-    "variables": args.variables,
-}
+def main() -> None:
+    """Read env vars / flags, call update_variablegroups() and print the result."""
+    organization, pat = get_common_env()
+    group_id = require_env("GROUP_ID", "Id of the variable group to update.")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/distributedtask/variablegroups/{GROUP_ID}", API_VERSION)
-logger.info(f"PUT {url}")
+    parser = argparse.ArgumentParser(description="Update a variable group.")
+    parser.add_argument("--description", required=False, help="Sets description of the variable group.")
+    parser.add_argument("--name", required=False, help="Sets name of the variable group.")
+    parser.add_argument("--provider-data", required=False, help="Sets provider data.")
+    parser.add_argument("--type", required=False, help="Sets type of the variable group.")
+    parser.add_argument("--variable-group-project-references", required=False, help="variableGroupProjectReferences")
+    parser.add_argument("--variables", required=False, help="Sets variables contained in the variable group.")
+    args = parser.parse_args()
 
-response = execute_request("PUT", url, HEADERS, body=body)
+    logger = AdoLogger("update_variablegroups", pat)
+    logger.info("Update a variable group.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_variablegroups(client, group_id, description=args.description, name=args.name, provider_data=args.provider_data, type=args.type, variable_group_project_references=args.variable_group_project_references, variables=args.variables)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'name', 'createdBy'], API_VERSION)
+    print(f"Variablegroups: {data.get('name', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Variablegroups: {data.get("name", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
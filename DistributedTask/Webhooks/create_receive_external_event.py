@@ -10,46 +10,68 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/distributed-task/webhooks/receive-external-event?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-WEB_HOOK_ID = get_env_or_exit("WEB_HOOK_ID", "The WebHook Name property of the WebHook service connection")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_receive_external_event", PAT)
-logger.info("Triggers a pipeline run of pipelines which have a webhook resource defined with specified WebHook Name property of th...")
+def create_receive_external_event(client, web_hook_id: str) -> dict:
+    """
+    Triggers a pipeline run of pipelines which have a webhook resource defined with specified WebHook Name property of th...
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        web_hook_id: The WebHook Name property of the WebHook service connection
+
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/public/distributedtask/webhooks/{web_hook_id}", API_VERSION)
+    response = client.request("POST", url)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/public/distributedtask/webhooks/{WEB_HOOK_ID}", API_VERSION)
-logger.info(f"POST {url}")
 
-response = execute_request("POST", url, HEADERS)
+async def create_receive_external_event_async(client, web_hook_id: str) -> dict:
+    """Async variant of create_receive_external_event() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/public/distributedtask/webhooks/{web_hook_id}", API_VERSION)
+    response = await client.request("POST", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call create_receive_external_event() and print the result."""
+    organization, pat = get_common_env()
+    web_hook_id = require_env("WEB_HOOK_ID", "The WebHook Name property of the WebHook service connection")
+
+    logger = AdoLogger("create_receive_external_event", pat)
+    logger.info("Triggers a pipeline run of pipelines which have a webhook resource defined with specified WebHook Name property of th...")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = create_receive_external_event(client, web_hook_id)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,47 +10,70 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/environments/environmentaccesstoken/generate-environment-access-token?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-ENVIRONMENT_ID = get_env_or_exit("ENVIRONMENT_ID", "ID of the environment in which deployment targets are managed.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_generate_environment_access_token", PAT)
-logger.info("GET a PAT token for creating and deleting deployment targets in an environment.")
+def create_generate_environment_access_token(client, project: str, environment_id: str) -> dict:
+    """
+    GET a PAT token for creating and deleting deployment targets in an environment.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        environment_id: ID of the environment in which deployment targets are managed.
+
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/pipelines/environments/environmentaccesstoken/{environment_id}", API_VERSION, project=project)
+    response = client.request("POST", url)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/pipelines/environments/environmentaccesstoken/{ENVIRONMENT_ID}", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
 
-response = execute_request("POST", url, HEADERS)
+async def create_generate_environment_access_token_async(client, project: str, environment_id: str) -> dict:
+    """Async variant of create_generate_environment_access_token() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/pipelines/environments/environmentaccesstoken/{environment_id}", API_VERSION, project=project)
+    response = await client.request("POST", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call create_generate_environment_access_token() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    environment_id = require_env("ENVIRONMENT_ID", "ID of the environment in which deployment targets are managed.")
+
+    logger = AdoLogger("create_generate_environment_access_token", pat)
+    logger.info("GET a PAT token for creating and deleting deployment targets in an environment.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = create_generate_environment_access_token(client, project, environment_id)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
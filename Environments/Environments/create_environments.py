@@ -11,68 +11,87 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/environments/envir
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Create an environment.")
-parser.add_argument("--description", required=False, help="Description of the environment.")
-parser.add_argument("--name", required=False, help="Name of the environment.")
-args = parser.parse_args()
+def create_environments(client, project: str, *, description: Optional[str] = None, name: Optional[str] = None) -> dict:
+    """
+    Create an environment.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        description: Description of the environment.
+        name: Name of the environment.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "description": description,
+        "name": name,
+    }
+    url = build_url(client.organization, f"_apis/pipelines/environments", API_VERSION, project=project)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name', 'createdBy'], API_VERSION)
+    return data
+
+
+async def create_environments_async(client, project: str, *, description: Optional[str] = None, name: Optional[str] = None) -> dict:
+    """Async variant of create_environments() for use with AsyncAdoClient."""
+    body = {
+        "description": description,
+        "name": name,
+    }
+    url = build_url(client.organization, f"_apis/pipelines/environments", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name', 'createdBy'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_environments", PAT)
-logger.info("Create an environment.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "description": args.description,
-    "name": args.name,
-}
+def main() -> None:
+    """Read env vars / flags, call create_environments() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/pipelines/environments", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Create an environment.")
+    parser.add_argument("--description", required=False, help="Description of the environment.")
+    parser.add_argument("--name", required=False, help="Name of the environment.")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_environments", pat)
+    logger.info("Create an environment.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_environments(client, project, description=args.description, name=args.name)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'name', 'createdBy'], API_VERSION)
+    print(f"Environments: {data.get('name', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Environments: {data.get("name", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,66 +11,84 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/environments/kuber
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-ENVIRONMENT_ID = get_env_or_exit("ENVIRONMENT_ID", "environmentId")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Add for Kubernetes")
-parser.add_argument("--service-endpoint-id", required=False, help="serviceEndpointId")
-args = parser.parse_args()
+def create_kubernetes(client, project: str, environment_id: str, *, service_endpoint_id: Optional[str] = None) -> dict:
+    """
+    Add for Kubernetes
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        environment_id: environmentId
+        service_endpoint_id: serviceEndpointId
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "serviceEndpointId": service_endpoint_id,
+    }
+    url = build_url(client.organization, f"_apis/pipelines/environments/{environment_id}/providers/kubernetes", API_VERSION, project=project)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['clusterName', 'namespace'], API_VERSION)
+    return data
+
+
+async def create_kubernetes_async(client, project: str, environment_id: str, *, service_endpoint_id: Optional[str] = None) -> dict:
+    """Async variant of create_kubernetes() for use with AsyncAdoClient."""
+    body = {
+        "serviceEndpointId": service_endpoint_id,
+    }
+    url = build_url(client.organization, f"_apis/pipelines/environments/{environment_id}/providers/kubernetes", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['clusterName', 'namespace'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_kubernetes", PAT)
-logger.info("Add for Kubernetes")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "serviceEndpointId": args.service_endpoint_id,
-}
+def main() -> None:
+    """Read env vars / flags, call create_kubernetes() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    environment_id = require_env("ENVIRONMENT_ID", "environmentId")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/pipelines/environments/{ENVIRONMENT_ID}/providers/kubernetes", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Add for Kubernetes")
+    parser.add_argument("--service-endpoint-id", required=False, help="serviceEndpointId")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_kubernetes", pat)
+    logger.info("Add for Kubernetes")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_kubernetes(client, project, environment_id, service_endpoint_id=args.service_endpoint_id)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['clusterName', 'namespace'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
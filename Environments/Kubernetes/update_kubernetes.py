@@ -11,70 +11,92 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/environments/kuber
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-ENVIRONMENT_ID = get_env_or_exit("ENVIRONMENT_ID", "environmentId")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Update for Kubernetes")
-parser.add_argument("--authorization-parameters", required=False, help="authorizationParameters")
-parser.add_argument("--provider-type", required=False, help="Provider type (CustomProvider or AzureKubernetesServiceProvider) of the resource to be updated")
-parser.add_argument("--resource-id", required=False, help="resourceId")
-args = parser.parse_args()
+def update_kubernetes(client, project: str, environment_id: str, *, authorization_parameters: Optional[str] = None, provider_type: Optional[str] = None, resource_id: Optional[str] = None) -> dict:
+    """
+    Update for Kubernetes
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        environment_id: environmentId
+        authorization_parameters: authorizationParameters
+        provider_type: Provider type (CustomProvider or AzureKubernetesServiceProvider) of the resource to be updated
+        resource_id: resourceId
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "authorizationParameters": authorization_parameters,
+        "providerType": provider_type,
+        "resourceId": resource_id,
+    }
+    url = build_url(client.organization, f"_apis/pipelines/environments/{environment_id}/providers/kubernetes", API_VERSION, project=project)
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['clusterName', 'namespace'], API_VERSION)
+    return data
+
+
+async def update_kubernetes_async(client, project: str, environment_id: str, *, authorization_parameters: Optional[str] = None, provider_type: Optional[str] = None, resource_id: Optional[str] = None) -> dict:
+    """Async variant of update_kubernetes() for use with AsyncAdoClient."""
+    body = {
+        "authorizationParameters": authorization_parameters,
+        "providerType": provider_type,
+        "resourceId": resource_id,
+    }
+    url = build_url(client.organization, f"_apis/pipelines/environments/{environment_id}/providers/kubernetes", API_VERSION, project=project)
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['clusterName', 'namespace'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_kubernetes", PAT)
-logger.info("Update for Kubernetes")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "authorizationParameters": args.authorization_parameters,
-    "providerType": args.provider_type,
-    "resourceId": args.resource_id,
-}
+def main() -> None:
+    """Read env vars / flags, call update_kubernetes() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    environment_id = require_env("ENVIRONMENT_ID", "environmentId")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/pipelines/environments/{ENVIRONMENT_ID}/providers/kubernetes", API_VERSION, project=PROJECT_ID)
-logger.info(f"PATCH {url}")
+    parser = argparse.ArgumentParser(description="Update for Kubernetes")
+    parser.add_argument("--authorization-parameters", required=False, help="authorizationParameters")
+    parser.add_argument("--provider-type", required=False, help="Provider type (CustomProvider or AzureKubernetesServiceProvider) of the resource to be updated")
+    parser.add_argument("--resource-id", required=False, help="resourceId")
+    args = parser.parse_args()
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+    logger = AdoLogger("update_kubernetes", pat)
+    logger.info("Update for Kubernetes")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_kubernetes(client, project, environment_id, authorization_parameters=args.authorization_parameters, provider_type=args.provider_type, resource_id=args.resource_id)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['clusterName', 'namespace'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
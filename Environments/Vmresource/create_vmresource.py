@@ -11,66 +11,84 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/environments/vmres
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-ENVIRONMENT_ID = get_env_or_exit("ENVIRONMENT_ID", "Id of the Environment")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Add Virtual Machine Resource")
-parser.add_argument("--virtual-machine-resource", required=False, help="virtualMachineResource")
-args = parser.parse_args()
+def create_vmresource(client, project: str, environment_id: str, *, virtual_machine_resource: Optional[str] = None) -> dict:
+    """
+    Add Virtual Machine Resource
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        environment_id: Id of the Environment
+        virtual_machine_resource: virtualMachineResource
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "virtualMachineResource": virtual_machine_resource,
+    }
+    url = build_url(client.organization, f"_apis/pipelines/environments/{environment_id}/providers/virtualmachines", API_VERSION, project=project)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['agent'], API_VERSION)
+    return data
+
+
+async def create_vmresource_async(client, project: str, environment_id: str, *, virtual_machine_resource: Optional[str] = None) -> dict:
+    """Async variant of create_vmresource() for use with AsyncAdoClient."""
+    body = {
+        "virtualMachineResource": virtual_machine_resource,
+    }
+    url = build_url(client.organization, f"_apis/pipelines/environments/{environment_id}/providers/virtualmachines", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['agent'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_vmresource", PAT)
-logger.info("Add Virtual Machine Resource")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "virtualMachineResource": args.virtual_machine_resource,
-}
+def main() -> None:
+    """Read env vars / flags, call create_vmresource() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    environment_id = require_env("ENVIRONMENT_ID", "Id of the Environment")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/pipelines/environments/{ENVIRONMENT_ID}/providers/virtualmachines", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Add Virtual Machine Resource")
+    parser.add_argument("--virtual-machine-resource", required=False, help="virtualMachineResource")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_vmresource", pat)
+    logger.info("Add Virtual Machine Resource")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_vmresource(client, project, environment_id, virtual_machine_resource=args.virtual_machine_resource)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['agent'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,66 +11,84 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/environments/vmres
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-ENVIRONMENT_ID = get_env_or_exit("ENVIRONMENT_ID", "Id of the Environment")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Update Virtual Machine Resource")
-parser.add_argument("--agent", required=False, help="agent")
-args = parser.parse_args()
+def update_vmresource(client, project: str, environment_id: str, *, agent: Optional[str] = None) -> dict:
+    """
+    Update Virtual Machine Resource
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        environment_id: Id of the Environment
+        agent: agent
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "agent": agent,
+    }
+    url = build_url(client.organization, f"_apis/pipelines/environments/{environment_id}/providers/virtualmachines", API_VERSION, project=project)
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['agent'], API_VERSION)
+    return data
+
+
+async def update_vmresource_async(client, project: str, environment_id: str, *, agent: Optional[str] = None) -> dict:
+    """Async variant of update_vmresource() for use with AsyncAdoClient."""
+    body = {
+        "agent": agent,
+    }
+    url = build_url(client.organization, f"_apis/pipelines/environments/{environment_id}/providers/virtualmachines", API_VERSION, project=project)
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['agent'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_vmresource", PAT)
-logger.info("Update Virtual Machine Resource")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "agent": args.agent,
-}
+def main() -> None:
+    """Read env vars / flags, call update_vmresource() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    environment_id = require_env("ENVIRONMENT_ID", "Id of the Environment")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/pipelines/environments/{ENVIRONMENT_ID}/providers/virtualmachines", API_VERSION, project=PROJECT_ID)
-logger.info(f"PATCH {url}")
+    parser = argparse.ArgumentParser(description="Update Virtual Machine Resource")
+    parser.add_argument("--agent", required=False, help="agent")
+    args = parser.parse_args()
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+    logger = AdoLogger("update_vmresource", pat)
+    logger.info("Update Virtual Machine Resource")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_vmresource(client, project, environment_id, agent=args.agent)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['agent'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,52 +10,72 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/extension-management/installed-extensions/get?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PUBLISHER_NAME = get_env_or_exit("PUBLISHER_NAME", "Name of the publisher. Example: 'fabrikam'.")
-EXTENSION_NAME = get_env_or_exit("EXTENSION_NAME", "Name of the extension. Example: 'ops-tools'.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_installed_extensions", PAT)
-logger.info("Get an installed extension by its publisher and extension name.")
+def get_installed_extensions(client, publisher_name: str, extension_name: str) -> dict:
+    """
+    Get an installed extension by its publisher and extension name.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/extensionmanagement/installedextensionsbyname/{PUBLISHER_NAME}/{EXTENSION_NAME}", API_VERSION, base_host="extmgmt.dev.azure.com")
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        publisher_name: Name of the publisher. Example: 'fabrikam'.
+        extension_name: Name of the extension. Example: 'ops-tools'.
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/extensionmanagement/installedextensionsbyname/{publisher_name}/{extension_name}", API_VERSION, base_host="extmgmt.dev.azure.com")
+    response = client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['extensionId', 'extensionName'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['extensionId', 'extensionName'], API_VERSION)
+async def get_installed_extensions_async(client, publisher_name: str, extension_name: str) -> dict:
+    """Async variant of get_installed_extensions() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/extensionmanagement/installedextensionsbyname/{publisher_name}/{extension_name}", API_VERSION, base_host="extmgmt.dev.azure.com")
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['extensionId', 'extensionName'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_installed_extensions() and print the result."""
+    organization, pat = get_common_env()
+    publisher_name = require_env("PUBLISHER_NAME", "Name of the publisher. Example: 'fabrikam'.")
+    extension_name = require_env("EXTENSION_NAME", "Name of the extension. Example: 'ops-tools'.")
+
+    logger = AdoLogger("get_installed_extensions", pat)
+    logger.info("Get an installed extension by its publisher and extension name.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = get_installed_extensions(client, publisher_name, extension_name)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -8,55 +8,24 @@ Validates:
   - Correct Authorization header
   - Successful response parsing (200)
   - Exit when required env vars are missing
+
+The script is imported and called in-process; see the fixtures in conftest.py.
 """
 
 import json
-import os
-import subprocess
-import sys
 from pathlib import Path
 
 import pytest
 import responses
 
+from _shared.errors import AdoAuthError, AdoNotFound
+from ExtensionManagement.InstalledExtensions.delete_uninstall_extension_by_name import delete_uninstall_extension_by_name, main
+
 FIXTURES = Path(__file__).parent / "fixtures"
-SCRIPT = str(Path(__file__).resolve().parents[1] / "delete_uninstall_extension_by_name.py")
-
-# ---------------------------------------------------------------------------
-# Helpers
-# ---------------------------------------------------------------------------
-
-def _run_script(env_override=None, extra_args=None, expect_fail=False):
-    """Run the script as a subprocess with the given env."""
-    env = {
-        "AZURE_DEVOPS_ORG": "testorg",
-        "AZURE_DEVOPS_PAT": "fakepat1234567890",
-        "PUBLISHER_NAME": "test-value-publisher_name",
-        "EXTENSION_NAME": "test-value-extension_name",
-        "PATH": os.environ.get("PATH", ""),
-        "PYTHONPATH": os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."),
-    }
-    if env_override:
-        env.update(env_override)
-    env = {k: v for k, v in env.items() if v is not None}
-
-    cmd = [sys.executable, SCRIPT]
-    if extra_args:
-        cmd.extend(extra_args)
-
-    result = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        env=env,
-        timeout=30,
-    )
-    if not expect_fail:
-        assert result.returncode == 0, (
-            f"Script failed (rc={result.returncode}):\n"
-            f"STDOUT: {result.stdout}\nSTDERR: {result.stderr}"
-        )
-    return result
+ENV = {
+    "PUBLISHER_NAME": "test-value-publisher_name",
+    "EXTENSION_NAME": "test-value-extension_name",
+}
 
 
 class TestDeleteUninstallExtensionByNameEnvValidation:
@@ -64,43 +33,31 @@ class TestDeleteUninstallExtensionByNameEnvValidation:
 
     @pytest.mark.offline
     @pytest.mark.extensionmanagement
-    def test_missing_org_exits(self):
-        result = _run_script(
-            env_override={"AZURE_DEVOPS_ORG": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "AZURE_DEVOPS_ORG" in result.stderr or "AZURE_DEVOPS_ORG" in result.stdout
+    def test_missing_org_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "AZURE_DEVOPS_ORG": None})
+        assert code != 0
+        assert "AZURE_DEVOPS_ORG" in output
 
     @pytest.mark.offline
     @pytest.mark.extensionmanagement
-    def test_missing_pat_exits(self):
-        result = _run_script(
-            env_override={"AZURE_DEVOPS_PAT": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "AZURE_DEVOPS_PAT" in result.stderr or "AZURE_DEVOPS_PAT" in result.stdout
+    def test_missing_pat_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "AZURE_DEVOPS_PAT": None})
+        assert code != 0
+        assert "AZURE_DEVOPS_PAT" in output
 
     @pytest.mark.offline
     @pytest.mark.extensionmanagement
-    def test_missing_publisher_name_exits(self):
-        result = _run_script(
-            env_override={"PUBLISHER_NAME": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "PUBLISHER_NAME" in result.stderr or "PUBLISHER_NAME" in result.stdout
+    def test_missing_publisher_name_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "PUBLISHER_NAME": None})
+        assert code != 0
+        assert "PUBLISHER_NAME" in output
 
     @pytest.mark.offline
     @pytest.mark.extensionmanagement
-    def test_missing_extension_name_exits(self):
-        result = _run_script(
-            env_override={"EXTENSION_NAME": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "EXTENSION_NAME" in result.stderr or "EXTENSION_NAME" in result.stdout
+    def test_missing_extension_name_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "EXTENSION_NAME": None})
+        assert code != 0
+        assert "EXTENSION_NAME" in output
 
 
 class TestDeleteUninstallExtensionByNameURLAndAuth:
@@ -109,56 +66,39 @@ class TestDeleteUninstallExtensionByNameURLAndAuth:
     @pytest.mark.offline
     @pytest.mark.extensionmanagement
     @responses.activate
-    def test_correct_url_and_auth_header(self):
-        """Verify the script builds the right URL and Authorization header."""
-        import base64
-
-        org = "testorg"
-        pat = "fakepat1234567890"
+    def test_correct_url_and_auth_header(self, ado_client):
+        """Verify the operation builds the right URL and Authorization header."""
         expected_url = "https://extmgmt.dev.azure.com/testorg/_apis/extensionmanagement/installedextensionsbyname/test-value-publisher_name/test-value-extension_name?api-version=7.2"
-
         fixture = json.loads((FIXTURES / "delete_uninstall_extension_by_name_200.json").read_text())
         responses.add(responses.DELETE, expected_url, json=fixture, status=200)
 
-        import requests as req
-
-        cred = base64.b64encode(f":{pat}".encode("ascii")).decode("ascii")
-        headers = {
-            "Authorization": f"Basic {cred}",
-            "Content-Type": "application/json",
-        }
-        resp = req.delete(expected_url, headers=headers, timeout=30)
-
-        assert resp.status_code == 200
+        assert delete_uninstall_extension_by_name(ado_client, "test-value-publisher_name", "test-value-extension_name") == fixture
         assert len(responses.calls) == 1
+        assert responses.calls[0].request.url == expected_url
         sent_auth = responses.calls[0].request.headers["Authorization"]
-        assert sent_auth.startswith("Basic ")
+        assert sent_auth == "Basic OmZha2VwYXQxMjM0NTY3ODkw"
 
 
 class TestDeleteUninstallExtensionByNameHTTPErrors:
-    """Validate behaviour on error status codes."""
+    """Validate the typed error raised for error status codes."""
 
     @pytest.mark.offline
     @pytest.mark.extensionmanagement
     @responses.activate
-    def test_401_unauthorized(self):
+    def test_401_unauthorized(self, ado_client):
         url = "https://extmgmt.dev.azure.com/testorg/_apis/extensionmanagement/installedextensionsbyname/test-value-publisher_name/test-value-extension_name?api-version=7.2"
         responses.add(responses.DELETE, url, json={"message": "unauthorized"}, status=401)
 
-        import requests as req
-
-        resp = req.delete(url, headers={"Authorization": "Basic fake"}, timeout=30)
-        assert resp.status_code == 401
+        with pytest.raises(AdoAuthError):
+            delete_uninstall_extension_by_name(ado_client, "test-value-publisher_name", "test-value-extension_name")
 
     @pytest.mark.offline
     @pytest.mark.extensionmanagement
     @responses.activate
-    def test_404_not_found(self):
+    def test_404_not_found(self, ado_client):
         url = "https://extmgmt.dev.azure.com/testorg/_apis/extensionmanagement/installedextensionsbyname/test-value-publisher_name/test-value-extension_name?api-version=7.2"
         responses.add(responses.DELETE, url, json={"message": "not_found"}, status=404)
 
-        import requests as req
-
-        resp = req.delete(url, headers={"Authorization": "Basic fake"}, timeout=30)
-        assert resp.status_code == 404
+        with pytest.raises(AdoNotFound):
+            delete_uninstall_extension_by_name(ado_client, "test-value-publisher_name", "test-value-extension_name")
 
@@ -11,74 +11,100 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/extension-manageme
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Update an installed extension.")
-parser.add_argument("--extension-id", required=False, help="The friendly extension id for this extension - unique for a given publisher.")
-parser.add_argument("--extension-name", required=False, help="The display name of the extension.")
-parser.add_argument("--files", required=False, help="This is the set of files available from the extension.")
-parser.add_argument("--flags", required=False, help="Extension flags relevant to contribution consumers")
-parser.add_argument("--install-state", required=False, help="Information about this particular installation of the extension")
-parser.add_argument("--last-published", required=False, help="This represents the date/time the extensions was last updated in the gallery. This doesnt mean th...")
-args = parser.parse_args()
+def update_installed_extensions(client, *, extension_id: Optional[str] = None, extension_name: Optional[str] = None, files: Optional[str] = None, flags: Optional[str] = None, install_state: Optional[str] = None, last_published: Optional[str] = None) -> dict:
+    """
+    Update an installed extension.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        extension_id: The friendly extension id for this extension - unique for a given publisher.
+        extension_name: The display name of the extension.
+        files: This is the set of files available from the extension.
+        flags: Extension flags relevant to contribution consumers
+        install_state: Information about this particular installation of the extension
+        last_published: This represents the date/time the extensions was last updated in the gallery. This doesnt mean th...
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "extensionId": extension_id,
+        "extensionName": extension_name,
+        "files": files,
+        "flags": flags,
+        "installState": install_state,
+        "lastPublished": last_published,
+    }
+    url = build_url(client.organization, f"_apis/extensionmanagement/installedextensions", API_VERSION, base_host="extmgmt.dev.azure.com")
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['extensionId', 'extensionName'], API_VERSION)
+    return data
+
+
+async def update_installed_extensions_async(client, *, extension_id: Optional[str] = None, extension_name: Optional[str] = None, files: Optional[str] = None, flags: Optional[str] = None, install_state: Optional[str] = None, last_published: Optional[str] = None) -> dict:
+    """Async variant of update_installed_extensions() for use with AsyncAdoClient."""
+    body = {
+        "extensionId": extension_id,
+        "extensionName": extension_name,
+        "files": files,
+        "flags": flags,
+        "installState": install_state,
+        "lastPublished": last_published,
+    }
+    url = build_url(client.organization, f"_apis/extensionmanagement/installedextensions", API_VERSION, base_host="extmgmt.dev.azure.com")
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['extensionId', 'extensionName'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_installed_extensions", PAT)
-logger.info("Update an installed extension.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "extensionId": args.extension_id,
-    "extensionName": args.extension_name,
-    "files": args.files,
-    "flags": args.flags,
-    "installState": args.install_state,
-    "lastPublished": args.last_published,
-}
+def main() -> None:
+    """Read env vars / flags, call update_installed_extensions() and print the result."""
+    organization, pat = get_common_env()
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/extensionmanagement/installedextensions", API_VERSION, base_host="extmgmt.dev.azure.com")
-logger.info(f"PATCH {url}")
+    parser = argparse.ArgumentParser(description="Update an installed extension.")
+    parser.add_argument("--extension-id", required=False, help="The friendly extension id for this extension - unique for a given publisher.")
+    parser.add_argument("--extension-name", required=False, help="The display name of the extension.")
+    parser.add_argument("--files", required=False, help="This is the set of files available from the extension.")
+    parser.add_argument("--flags", required=False, help="Extension flags relevant to contribution consumers")
+    parser.add_argument("--install-state", required=False, help="Information about this particular installation of the extension")
+    parser.add_argument("--last-published", required=False, help="This represents the date/time the extensions was last updated in the gallery. This doesnt mean th...")
+    args = parser.parse_args()
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+    logger = AdoLogger("update_installed_extensions", pat)
+    logger.info("Update an installed extension.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_installed_extensions(client, extension_id=args.extension_id, extension_name=args.extension_name, files=args.files, flags=args.flags, install_state=args.install_state, last_published=args.last_published)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['extensionId', 'extensionName'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,72 +11,96 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/favorite/favorites
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Create Favorite for Favorites")
-parser.add_argument("--artifact-id", required=False, help="artifactId")
-parser.add_argument("--artifact-name", required=False, help="artifactName")
-parser.add_argument("--artifact-properties", required=False, help="artifactProperties")
-parser.add_argument("--artifact-scope", required=False, help="artifactScope")
-parser.add_argument("--artifact-type", required=False, help="artifactType")
-args = parser.parse_args()
+def create_favorite(client, *, artifact_id: Optional[str] = None, artifact_name: Optional[str] = None, artifact_properties: Optional[str] = None, artifact_scope: Optional[str] = None, artifact_type: Optional[str] = None) -> dict:
+    """
+    Create Favorite for Favorites
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        artifact_id: artifactId
+        artifact_name: artifactName
+        artifact_properties: artifactProperties
+        artifact_scope: artifactScope
+        artifact_type: artifactType
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "artifactId": artifact_id,
+        "artifactName": artifact_name,
+        "artifactProperties": artifact_properties,
+        "artifactScope": artifact_scope,
+        "artifactType": artifact_type,
+    }
+    url = build_url(client.organization, f"_apis/favorite/favorites", API_VERSION)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'artifactId'], API_VERSION)
+    return data
+
+
+async def create_favorite_async(client, *, artifact_id: Optional[str] = None, artifact_name: Optional[str] = None, artifact_properties: Optional[str] = None, artifact_scope: Optional[str] = None, artifact_type: Optional[str] = None) -> dict:
+    """Async variant of create_favorite() for use with AsyncAdoClient."""
+    body = {
+        "artifactId": artifact_id,
+        "artifactName": artifact_name,
+        "artifactProperties": artifact_properties,
+        "artifactScope": artifact_scope,
+        "artifactType": artifact_type,
+    }
+    url = build_url(client.organization, f"_apis/favorite/favorites", API_VERSION)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'artifactId'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_favorite", PAT)
-logger.info("Create Favorite for Favorites")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "artifactId": args.artifact_id,
-    "artifactName": args.artifact_name,
-    "artifactProperties": args.artifact_properties,
-    "artifactScope": args.artifact_scope,
-    "artifactType": args.artifact_type,
-}
+def main() -> None:
+    """Read env vars / flags, call create_favorite() and print the result."""
+    organization, pat = get_common_env()
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/favorite/favorites", API_VERSION)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Create Favorite for Favorites")
+    parser.add_argument("--artifact-id", required=False, help="artifactId")
+    parser.add_argument("--artifact-name", required=False, help="artifactName")
+    parser.add_argument("--artifact-properties", required=False, help="artifactProperties")
+    parser.add_argument("--artifact-scope", required=False, help="artifactScope")
+    parser.add_argument("--artifact-type", required=False, help="artifactType")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_favorite", pat)
+    logger.info("Create Favorite for Favorites")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_favorite(client, artifact_id=args.artifact_id, artifact_name=args.artifact_name, artifact_properties=args.artifact_properties, artifact_scope=args.artifact_scope, artifact_type=args.artifact_type)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'artifactId'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,53 +10,74 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/favorite/favorites/get-favorite-by-id?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-FAVORITE_ID = get_env_or_exit("FAVORITE_ID", "favoriteId")
-ARTIFACT_SCOPE_TYPE = get_env_or_exit("ARTIFACT_SCOPE_TYPE", "artifactScopeType")
-ARTIFACT_TYPE = get_env_or_exit("ARTIFACT_TYPE", "artifactType")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_favorite_by_id", PAT)
-logger.info("Get Favorite By Id for Favorites")
+def get_favorite_by_id(client, favorite_id: str, artifact_scope_type: str, artifact_type: str) -> dict:
+    """
+    Get Favorite By Id for Favorites
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/favorite/favorites/{FAVORITE_ID}", API_VERSION)
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        favorite_id: favoriteId
+        artifact_scope_type: artifactScopeType
+        artifact_type: artifactType
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/favorite/favorites/{favorite_id}", API_VERSION)
+    response = client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['id', 'artifactId'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'artifactId'], API_VERSION)
+async def get_favorite_by_id_async(client, favorite_id: str, artifact_scope_type: str, artifact_type: str) -> dict:
+    """Async variant of get_favorite_by_id() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/favorite/favorites/{favorite_id}", API_VERSION)
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['id', 'artifactId'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_favorite_by_id() and print the result."""
+    organization, pat = get_common_env()
+    favorite_id = require_env("FAVORITE_ID", "favoriteId")
+    artifact_scope_type = require_env("ARTIFACT_SCOPE_TYPE", "artifactScopeType")
+    artifact_type = require_env("ARTIFACT_TYPE", "artifactType")
+
+    logger = AdoLogger("get_favorite_by_id", pat)
+    logger.info("Get Favorite By Id for Favorites")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = get_favorite_by_id(client, favorite_id, artifact_scope_type, artifact_type)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
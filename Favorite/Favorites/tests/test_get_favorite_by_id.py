@@ -8,56 +8,25 @@ Validates:
   - Correct Authorization header
   - Successful response parsing (200)
   - Exit when required env vars are missing
+
+The script is imported and called in-process; see the fixtures in conftest.py.
 """
 
 import json
-import os
-import subprocess
-import sys
 from pathlib import Path
 
 import pytest
 import responses
 
+from _shared.errors import AdoAuthError, AdoNotFound
+from Favorite.Favorites.get_favorite_by_id import get_favorite_by_id, main
+
 FIXTURES = Path(__file__).parent / "fixtures"
-SCRIPT = str(Path(__file__).resolve().parents[1] / "get_favorite_by_id.py")
-
-# ---------------------------------------------------------------------------
-# Helpers
-# ---------------------------------------------------------------------------
-
-def _run_script(env_override=None, extra_args=None, expect_fail=False):
-    """Run the script as a subprocess with the given env."""
-    env = {
-        "AZURE_DEVOPS_ORG": "testorg",
-        "AZURE_DEVOPS_PAT": "fakepat1234567890",
-        "FAVORITE_ID": "test-value-favorite_id",
-        "ARTIFACT_SCOPE_TYPE": "test-value-artifact_scope_type",
-        "ARTIFACT_TYPE": "test-value-artifact_type",
-        "PATH": os.environ.get("PATH", ""),
-        "PYTHONPATH": os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."),
-    }
-    if env_override:
-        env.update(env_override)
-    env = {k: v for k, v in env.items() if v is not None}
-
-    cmd = [sys.executable, SCRIPT]
-    if extra_args:
-        cmd.extend(extra_args)
-
-    result = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        env=env,
-        timeout=30,
-    )
-    if not expect_fail:
-        assert result.returncode == 0, (
-            f"Script failed (rc={result.returncode}):\n"
-            f"STDOUT: {result.stdout}\nSTDERR: {result.stderr}"
-        )
-    return result
+ENV = {
+    "FAVORITE_ID": "test-value-favorite_id",
+    "ARTIFACT_SCOPE_TYPE": "test-value-artifact_scope_type",
+    "ARTIFACT_TYPE": "test-value-artifact_type",
+}
 
 
 class TestGetFavoriteByIdEnvValidation:
@@ -65,53 +34,38 @@ class TestGetFavoriteByIdEnvValidation:
 
     @pytest.mark.offline
     @pytest.mark.favorite
-    def test_missing_org_exits(self):
-        result = _run_script(
-            env_override={"AZURE_DEVOPS_ORG": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "AZURE_DEVOPS_ORG" in result.stderr or "AZURE_DEVOPS_ORG" in result.stdout
+    def test_missing_org_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "AZURE_DEVOPS_ORG": None})
+        assert code != 0
+        assert "AZURE_DEVOPS_ORG" in output
 
     @pytest.mark.offline
     @pytest.mark.favorite
-    def test_missing_pat_exits(self):
-        result = _run_script(
-            env_override={"AZURE_DEVOPS_PAT": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "AZURE_DEVOPS_PAT" in result.stderr or "AZURE_DEVOPS_PAT" in result.stdout
+    def test_missing_pat_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "AZURE_DEVOPS_PAT": None})
+        assert code != 0
+        assert "AZURE_DEVOPS_PAT" in output
 
     @pytest.mark.offline
     @pytest.mark.favorite
-    def test_missing_favorite_id_exits(self):
-        result = _run_script(
-            env_override={"FAVORITE_ID": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "FAVORITE_ID" in result.stderr or "FAVORITE_ID" in result.stdout
+    def test_missing_favorite_id_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "FAVORITE_ID": None})
+        assert code != 0
+        assert "FAVORITE_ID" in output
 
     @pytest.mark.offline
     @pytest.mark.favorite
-    def test_missing_artifact_scope_type_exits(self):
-        result = _run_script(
-            env_override={"ARTIFACT_SCOPE_TYPE": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "ARTIFACT_SCOPE_TYPE" in result.stderr or "ARTIFACT_SCOPE_TYPE" in result.stdout
+    def test_missing_artifact_scope_type_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "ARTIFACT_SCOPE_TYPE": None})
+        assert code != 0
+        assert "ARTIFACT_SCOPE_TYPE" in output
 
     @pytest.mark.offline
     @pytest.mark.favorite
-    def test_missing_artifact_type_exits(self):
-        result = _run_script(
-            env_override={"ARTIFACT_TYPE": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "ARTIFACT_TYPE" in result.stderr or "ARTIFACT_TYPE" in result.stdout
+    def test_missing_artifact_type_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "ARTIFACT_TYPE": None})
+        assert code != 0
+        assert "ARTIFACT_TYPE" in output
 
 
 class TestGetFavoriteByIdURLAndAuth:
@@ -120,56 +74,39 @@ class TestGetFavoriteByIdURLAndAuth:
     @pytest.mark.offline
     @pytest.mark.favorite
     @responses.activate
-    def test_correct_url_and_auth_header(self):
-        """Verify the script builds the right URL and Authorization header."""
-        import base64
-
-        org = "testorg"
-        pat = "fakepat1234567890"
+    def test_correct_url_and_auth_header(self, ado_client):
+        """Verify the operation builds the right URL and Authorization header."""
         expected_url = "https://dev.azure.com/testorg/_apis/favorite/favorites/test-value-favorite_id?api-version=7.2"
-
         fixture = json.loads((FIXTURES / "get_favorite_by_id_200.json").read_text())
         responses.add(responses.GET, expected_url, json=fixture, status=200)
 
-        import requests as req
-
-        cred = base64.b64encode(f":{pat}".encode("ascii")).decode("ascii")
-        headers = {
-            "Authorization": f"Basic {cred}",
-            "Content-Type": "application/json",
-        }
-        resp = req.get(expected_url, headers=headers, timeout=30)
-
-        assert resp.status_code == 200
+        assert get_favorite_by_id(ado_client, "test-value-favorite_id", "test-value-artifact_scope_type", "test-value-artifact_type") == fixture
         assert len(responses.calls) == 1
+        assert responses.calls[0].request.url == expected_url
         sent_auth = responses.calls[0].request.headers["Authorization"]
-        assert sent_auth.startswith("Basic ")
+        assert sent_auth == "Basic OmZha2VwYXQxMjM0NTY3ODkw"
 
 
 class TestGetFavoriteByIdHTTPErrors:
-    """Validate behaviour on error status codes."""
+    """Validate the typed error raised for error status codes."""
 
     @pytest.mark.offline
     @pytest.mark.favorite
     @responses.activate
-    def test_401_unauthorized(self):
+    def test_401_unauthorized(self, ado_client):
         url = "https://dev.azure.com/testorg/_apis/favorite/favorites/test-value-favorite_id?api-version=7.2"
         responses.add(responses.GET, url, json={"message": "unauthorized"}, status=401)
 
-        import requests as req
-
-        resp = req.get(url, headers={"Authorization": "Basic fake"}, timeout=30)
-        assert resp.status_code == 401
+        with pytest.raises(AdoAuthError):
+            get_favorite_by_id(ado_client, "test-value-favorite_id", "test-value-artifact_scope_type", "test-value-artifact_type")
 
     @pytest.mark.offline
     @pytest.mark.favorite
     @responses.activate
-    def test_404_not_found(self):
+    def test_404_not_found(self, ado_client):
         url = "https://dev.azure.com/testorg/_apis/favorite/favorites/test-value-favorite_id?api-version=7.2"
         responses.add(responses.GET, url, json={"message": "not_found"}, status=404)
 
-        import requests as req
-
-        resp = req.get(url, headers={"Authorization": "Basic fake"}, timeout=30)
-        assert resp.status_code == 404
+        with pytest.raises(AdoNotFound):
+            get_favorite_by_id(ado_client, "test-value-favorite_id", "test-value-artifact_scope_type", "test-value-artifact_type")
 
@@ -11,77 +11,105 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/git/annotated-tags
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-REPO_ID = get_env_or_exit("REPO_ID", "ID or name of the repository.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Create an annotated tag.")
-parser.add_argument("--message", required=False, help="The tagging Message")
-parser.add_argument("--name", required=False, help="The name of the annotated tag.")
-parser.add_argument("--object-id", required=False, help="The objectId (Sha1Id) of the tag.")
-parser.add_argument("--tagged-by", required=False, help="User info and date of tagging.")
-parser.add_argument("--tagged-object", required=False, help="Tagged git object.")
-parser.add_argument("--url", required=False, help="url")
-args = parser.parse_args()
+def create_annotated_tags(client, project: str, repository_id: str, *, message: Optional[str] = None, name: Optional[str] = None, object_id: Optional[str] = None, tagged_by: Optional[str] = None, tagged_object: Optional[str] = None, url_value: Optional[str] = None) -> dict:
+    """
+    Create an annotated tag.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        repository_id: ID or name of the repository.
+        message: The tagging Message
+        name: The name of the annotated tag.
+        object_id: The objectId (Sha1Id) of the tag.
+        tagged_by: User info and date of tagging.
+        tagged_object: Tagged git object.
+        url_value: url
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "message": message,
+        "name": name,
+        "objectId": object_id,
+        "taggedBy": tagged_by,
+        "taggedObject": tagged_object,
+        "url": url_value,
+    }
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/annotatedtags", API_VERSION, project=project)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['name', 'message'], API_VERSION)
+    return data
+
+
+async def create_annotated_tags_async(client, project: str, repository_id: str, *, message: Optional[str] = None, name: Optional[str] = None, object_id: Optional[str] = None, tagged_by: Optional[str] = None, tagged_object: Optional[str] = None, url_value: Optional[str] = None) -> dict:
+    """Async variant of create_annotated_tags() for use with AsyncAdoClient."""
+    body = {
+        "message": message,
+        "name": name,
+        "objectId": object_id,
+        "taggedBy": tagged_by,
+        "taggedObject": tagged_object,
+        "url": url_value,
+    }
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/annotatedtags", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['name', 'message'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_annotated_tags", PAT)
-logger.info("Create an annotated tag.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "message": args.message,
-    "name": args.name,
-    "objectId": args.object_id,
-    "taggedBy": args.tagged_by,
-    "taggedObject": args.tagged_object,
-    "url": args.url,
-}
+def main() -> None:
+    """Read env vars / flags, call create_annotated_tags() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    repository_id = require_env("REPO_ID", "ID or name of the repository.")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/git/repositories/{REPO_ID}/annotatedtags", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Create an annotated tag.")
+    parser.add_argument("--message", required=False, help="The tagging Message")
+    parser.add_argument("--name", required=False, help="The name of the annotated tag.")
+    parser.add_argument("--object-id", required=False, help="The objectId (Sha1Id) of the tag.")
+    parser.add_argument("--tagged-by", required=False, help="User info and date of tagging.")
+    parser.add_argument("--tagged-object", required=False, help="Tagged git object.")
+    parser.add_argument("--url", required=False, help="url")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_annotated_tags", pat)
+    logger.info("Create an annotated tag.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_annotated_tags(client, project, repository_id, message=args.message, name=args.name, object_id=args.object_id, tagged_by=args.tagged_by, tagged_object=args.tagged_object, url_value=args.url)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['name', 'message'], API_VERSION)
+    print(f"Annotated Tags: {data.get('name', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Annotated Tags: {data.get("name", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
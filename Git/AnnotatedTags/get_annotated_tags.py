@@ -10,54 +10,75 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/git/annotated-tags/get?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-REPO_ID = get_env_or_exit("REPO_ID", "ID or name of the repository.")
-OBJECT_ID = get_env_or_exit("OBJECT_ID", "ObjectId (Sha1Id) of tag to get.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_annotated_tags", PAT)
-logger.info("Get an annotated tag.")
+def get_annotated_tags(client, project: str, repository_id: str, object_id: str) -> dict:
+    """
+    Get an annotated tag.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/git/repositories/{REPO_ID}/annotatedtags/{OBJECT_ID}", API_VERSION, project=PROJECT_ID)
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        repository_id: ID or name of the repository.
+        object_id: ObjectId (Sha1Id) of tag to get.
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/annotatedtags/{object_id}", API_VERSION, project=project)
+    response = client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['name', 'message'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['name', 'message'], API_VERSION)
+async def get_annotated_tags_async(client, project: str, repository_id: str, object_id: str) -> dict:
+    """Async variant of get_annotated_tags() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/annotatedtags/{object_id}", API_VERSION, project=project)
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['name', 'message'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(f"Annotated Tags: {data.get("name", "N/A")}")
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_annotated_tags() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    repository_id = require_env("REPO_ID", "ID or name of the repository.")
+    object_id = require_env("OBJECT_ID", "ObjectId (Sha1Id) of tag to get.")
+
+    logger = AdoLogger("get_annotated_tags", pat)
+    logger.info("Get an annotated tag.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = get_annotated_tags(client, project, repository_id, object_id)
+
+    print(f"Annotated Tags: {data.get('name', 'N/A')}")
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
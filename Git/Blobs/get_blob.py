@@ -10,53 +10,74 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/git/blobs/get-blob?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-REPO_ID = get_env_or_exit("REPO_ID", "The name or ID of the repository.")
-SHA1 = get_env_or_exit("SHA1", "SHA1 hash of the file. You can get the SHA1 of a file using the 'Git/Items/Get Item' endpoint.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_blob", PAT)
-logger.info("Get a single blob.")
+def get_blob(client, project: str, repository_id: str, sha1: str) -> dict:
+    """
+    Get a single blob.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/git/repositories/{REPO_ID}/blobs/{SHA1}", API_VERSION, project=PROJECT_ID)
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        repository_id: The name or ID of the repository.
+        sha1: SHA1 hash of the file. You can get the SHA1 of a file using the 'Git/Items/Get Item' endpoint.
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/blobs/{sha1}", API_VERSION, project=project)
+    response = client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['objectId', 'size'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['objectId', 'size'], API_VERSION)
+async def get_blob_async(client, project: str, repository_id: str, sha1: str) -> dict:
+    """Async variant of get_blob() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/blobs/{sha1}", API_VERSION, project=project)
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['objectId', 'size'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_blob() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    repository_id = require_env("REPO_ID", "The name or ID of the repository.")
+    sha1 = require_env("SHA1", "SHA1 hash of the file. You can get the SHA1 of a file using the 'Git/Items/Get Item' endpoint.")
+
+    logger = AdoLogger("get_blob", pat)
+    logger.info("Get a single blob.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = get_blob(client, project, repository_id, sha1)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,47 +10,76 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/git/blobs/get-blobs-zip?view=azure-devops-rest-7.2
 """
 
-import json
+import argparse
 import os
 import sys
+from typing import BinaryIO, Union
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.async_http_client import astream_to
+from _shared.http_client import AdoClient, build_url, stream_to
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-REPO_ID = get_env_or_exit("REPO_ID", "The name or ID of the repository.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_blobs_zip", PAT)
-logger.info("Gets one or more blobs in a zip file download.")
+def get_blobs_zip(client, project: str, repository_id: str, *, destination: Union[str, BinaryIO]) -> int:
+    """
+    Gets one or more blobs in a zip file download.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        repository_id: The name or ID of the repository.
+        destination: Output path or binary file (e.g. sys.stdout.buffer).
+
+    Returns:
+        Bytes written; the application/zip body is streamed in constant memory.
+    """
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/blobs", API_VERSION, project=project)
+    response = client.request("POST", url, stream=True, accept="application/zip")
+    return stream_to(response, destination)
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/git/repositories/{REPO_ID}/blobs", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
 
-response = execute_request("POST", url, HEADERS)
+async def get_blobs_zip_async(client, project: str, repository_id: str, *, destination: Union[str, BinaryIO]) -> int:
+    """Async variant of get_blobs_zip() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/blobs", API_VERSION, project=project)
+    response = await client.request("POST", url, stream=True, accept="application/zip")
+    return await astream_to(response, destination)
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_blobs_zip() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    repository_id = require_env("REPO_ID", "The name or ID of the repository.")
+
+    parser = argparse.ArgumentParser(description="Gets one or more blobs in a zip file download.")
+    parser.add_argument("--output", help="Write the content to this file (default: stdout)")
+    args = parser.parse_args()
+
+    logger = AdoLogger("get_blobs_zip", pat)
+    logger.info("Gets one or more blobs in a zip file download.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    written = get_blobs_zip(client, project, repository_id, destination=args.output or sys.stdout.buffer)
+    logger.info(f"Downloaded {written} bytes")
+    if args.output:
+        print(f"Saved {written} bytes to {args.output}")
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,53 +10,74 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/git/cherry-picks/get-cherry-pick?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-CHERRY_PICK_ID = get_env_or_exit("CHERRY_PICK_ID", "ID of the cherry pick.")
-REPO_ID = get_env_or_exit("REPO_ID", "ID of the repository.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_cherry_pick", PAT)
-logger.info("Retrieve information about a cherry pick operation by cherry pick Id.")
+def get_cherry_pick(client, project: str, cherry_pick_id: str, repository_id: str) -> dict:
+    """
+    Retrieve information about a cherry pick operation by cherry pick Id.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/git/repositories/{REPO_ID}/cherryPicks/{CHERRY_PICK_ID}", API_VERSION, project=PROJECT_ID)
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        cherry_pick_id: ID of the cherry pick.
+        repository_id: ID of the repository.
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/cherryPicks/{cherry_pick_id}", API_VERSION, project=project)
+    response = client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['cherryPickId'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['cherryPickId'], API_VERSION)
+async def get_cherry_pick_async(client, project: str, cherry_pick_id: str, repository_id: str) -> dict:
+    """Async variant of get_cherry_pick() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/cherryPicks/{cherry_pick_id}", API_VERSION, project=project)
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['cherryPickId'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_cherry_pick() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    cherry_pick_id = require_env("CHERRY_PICK_ID", "ID of the cherry pick.")
+    repository_id = require_env("REPO_ID", "ID of the repository.")
+
+    logger = AdoLogger("get_cherry_pick", pat)
+    logger.info("Retrieve information about a cherry pick operation by cherry pick Id.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = get_cherry_pick(client, project, cherry_pick_id, repository_id)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,53 +10,74 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/git/cherry-picks/get-cherry-pick-for-ref-name?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-REPO_ID = get_env_or_exit("REPO_ID", "ID of the repository.")
-REF_NAME = get_env_or_exit("REF_NAME", "The GitAsyncRefOperationParameters generatedRefName used for the cherry pick operation.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_cherry_pick_for_ref_name", PAT)
-logger.info("Retrieve information about a cherry pick operation for a specific branch.")
+def get_cherry_pick_for_ref_name(client, project: str, repository_id: str, ref_name: str) -> dict:
+    """
+    Retrieve information about a cherry pick operation for a specific branch.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/git/repositories/{REPO_ID}/cherryPicks", API_VERSION, project=PROJECT_ID)
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        repository_id: ID of the repository.
+        ref_name: The GitAsyncRefOperationParameters generatedRefName used for the cherry pick operation.
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/cherryPicks", API_VERSION, project=project)
+    response = client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['cherryPickId'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['cherryPickId'], API_VERSION)
+async def get_cherry_pick_for_ref_name_async(client, project: str, repository_id: str, ref_name: str) -> dict:
+    """Async variant of get_cherry_pick_for_ref_name() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/cherryPicks", API_VERSION, project=project)
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['cherryPickId'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_cherry_pick_for_ref_name() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    repository_id = require_env("REPO_ID", "ID of the repository.")
+    ref_name = require_env("REF_NAME", "The GitAsyncRefOperationParameters generatedRefName used for the cherry pick operation.")
+
+    logger = AdoLogger("get_cherry_pick_for_ref_name", pat)
+    logger.info("Retrieve information about a cherry pick operation for a specific branch.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = get_cherry_pick_for_ref_name(client, project, repository_id, ref_name)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
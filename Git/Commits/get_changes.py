@@ -10,53 +10,74 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/git/commits/get-changes?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-COMMIT_ID = get_env_or_exit("COMMIT_ID", "The id of the commit.")
-REPO_ID = get_env_or_exit("REPO_ID", "The id or friendly name of the repository. To use the friendly name, projectId must also be speci...")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_changes", PAT)
-logger.info("Retrieve changes for a particular commit.")
+def get_changes(client, project: str, commit_id: str, repository_id: str) -> dict:
+    """
+    Retrieve changes for a particular commit.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/git/repositories/{REPO_ID}/commits/{COMMIT_ID}/changes", API_VERSION, project=PROJECT_ID)
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        commit_id: The id of the commit.
+        repository_id: The id or friendly name of the repository. To use the friendly name, projectId must also be speci...
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/commits/{commit_id}/changes", API_VERSION, project=project)
+    response = client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['changeCounts', 'changes'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['changeCounts', 'changes'], API_VERSION)
+async def get_changes_async(client, project: str, commit_id: str, repository_id: str) -> dict:
+    """Async variant of get_changes() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/commits/{commit_id}/changes", API_VERSION, project=project)
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['changeCounts', 'changes'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_changes() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    commit_id = require_env("COMMIT_ID", "The id of the commit.")
+    repository_id = require_env("REPO_ID", "The id or friendly name of the repository. To use the friendly name, projectId must also be speci...")
+
+    logger = AdoLogger("get_changes", pat)
+    logger.info("Retrieve changes for a particular commit.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = get_changes(client, project, commit_id, repository_id)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
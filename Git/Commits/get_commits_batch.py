@@ -11,71 +11,141 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/git/commits/get-co
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Iterator, Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
+from _shared.pagination import paginate
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-REPO_ID = get_env_or_exit("REPO_ID", "The name or ID of the repository.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Retrieve git commits for a project matching the search criteria")
-parser.add_argument("--skip", required=False, help="Number of entries to skip")
-parser.add_argument("--top", required=False, help="Maximum number of entries to retrieve")
-parser.add_argument("--author", required=False, help="Alias or display name of the author")
-parser.add_argument("--compare-version", required=False, help="Only applicable when ItemVersion specified. If provided, start walking history starting at this c...")
-parser.add_argument("--exclude-deletes", required=False, help="Only applies when an itemPath is specified. This determines whether to exclude delete entries of ...")
-parser.add_argument("--from-commit-id", required=False, help="If provided, a lower bound for filtering commits alphabetically")
-args = parser.parse_args()
+def get_commits_batch(client, project: str, repository_id: str, *, skip: Optional[str] = None, top: Optional[str] = None, author: Optional[str] = None, compare_version: Optional[str] = None, exclude_deletes: Optional[str] = None, from_commit_id: Optional[str] = None) -> dict:
+    """
+    Retrieve git commits for a project matching the search criteria
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_commits_batch", PAT)
-logger.info("Retrieve git commits for a project matching the search criteria")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        repository_id: The name or ID of the repository.
+        skip: Number of entries to skip
+        top: Maximum number of entries to retrieve
+        author: Alias or display name of the author
+        compare_version: Only applicable when ItemVersion specified. If provided, start walking history starting at this c...
+        exclude_deletes: Only applies when an itemPath is specified. This determines whether to exclude delete entries of ...
+        from_commit_id: If provided, a lower bound for filtering commits alphabetically
 
-# ---------------------------------------------------------------------------
-# Request body
-# ---------------------------------------------------------------------------
-body = {
-    "$skip": args.skip,
-    "$top": args.top,
-    "author": args.author,
-    "compareVersion": args.compare_version,
-    "excludeDeletes": args.exclude_deletes,
-    "fromCommitId": args.from_commit_id,
-}
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "$skip": skip,
+        "$top": top,
+        "author": author,
+        "compareVersion": compare_version,
+        "excludeDeletes": exclude_deletes,
+        "fromCommitId": from_commit_id,
+    }
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/commitsbatch", API_VERSION, project=project)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
+
+
+async def get_commits_batch_async(client, project: str, repository_id: str, *, skip: Optional[str] = None, top: Optional[str] = None, author: Optional[str] = None, compare_version: Optional[str] = None, exclude_deletes: Optional[str] = None, from_commit_id: Optional[str] = None) -> dict:
+    """Async variant of get_commits_batch() for use with AsyncAdoClient."""
+    body = {
+        "$skip": skip,
+        "$top": top,
+        "author": author,
+        "compareVersion": compare_version,
+        "excludeDeletes": exclude_deletes,
+        "fromCommitId": from_commit_id,
+    }
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/commitsbatch", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/git/repositories/{REPO_ID}/commitsbatch", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
 
-response = execute_request("POST", url, HEADERS, body=body)
+def iter_get_commits_batch(client, project: str, repository_id: str, *, skip: Optional[str] = None, top: Optional[str] = None, author: Optional[str] = None, compare_version: Optional[str] = None, exclude_deletes: Optional[str] = None, from_commit_id: Optional[str] = None, max_items: Optional[int] = None, prefetch: bool = False) -> Iterator[dict]:
+    """
+    Yield every item across all pages of get_commits_batch() (top_skip paging).
+
+    Takes the same arguments, plus:
+        max_items: Stop after this many items (default: all).
+        prefetch: Fetch the next page while the current one is consumed.
+    """
+    body = {
+        "$skip": skip,
+        "$top": top,
+        "author": author,
+        "compareVersion": compare_version,
+        "excludeDeletes": exclude_deletes,
+        "fromCommitId": from_commit_id,
+    }
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/commitsbatch", API_VERSION, project=project)
+    return paginate(client, "POST", url, "top_skip", body=body,
+                    max_items=max_items, prefetch=prefetch)
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_commits_batch() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    repository_id = require_env("REPO_ID", "The name or ID of the repository.")
+
+    parser = argparse.ArgumentParser(description="Retrieve git commits for a project matching the search criteria")
+    parser.add_argument("--skip", required=False, help="Number of entries to skip")
+    parser.add_argument("--top", required=False, help="Maximum number of entries to retrieve")
+    parser.add_argument("--author", required=False, help="Alias or display name of the author")
+    parser.add_argument("--compare-version", required=False, help="Only applicable when ItemVersion specified. If provided, start walking history starting at this c...")
+    parser.add_argument("--exclude-deletes", required=False, help="Only applies when an itemPath is specified. This determines whether to exclude delete entries of ...")
+    parser.add_argument("--from-commit-id", required=False, help="If provided, a lower bound for filtering commits alphabetically")
+    parser.add_argument("--all-pages", action="store_true", help="Follow pagination and return every item")
+    parser.add_argument("--max-items", type=int, help="Follow pagination up to this many items")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("get_commits_batch", pat)
+    logger.info("Retrieve git commits for a project matching the search criteria")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        if args.all_pages or args.max_items:
+            items = iter_get_commits_batch(client, project, repository_id, skip=args.skip, top=args.top, author=args.author, compare_version=args.compare_version, exclude_deletes=args.exclude_deletes, from_commit_id=args.from_commit_id, max_items=args.max_items, prefetch=True)
+        else:
+            items = items_of(get_commits_batch(client, project, repository_id, skip=args.skip, top=args.top, author=args.author, compare_version=args.compare_version, exclude_deletes=args.exclude_deletes, from_commit_id=args.from_commit_id), "value")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    if args.all_pages or args.max_items:
+        items = list(iter_get_commits_batch(client, project, repository_id, skip=args.skip, top=args.top, author=args.author, compare_version=args.compare_version, exclude_deletes=args.exclude_deletes, from_commit_id=args.from_commit_id, max_items=args.max_items, prefetch=True))
+        data = {"count": len(items), "value": items}
+    else:
+        data = get_commits_batch(client, project, repository_id, skip=args.skip, top=args.top, author=args.author, compare_version=args.compare_version, exclude_deletes=args.exclude_deletes, from_commit_id=args.from_commit_id)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,68 +11,88 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/git/forks/create-f
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-REPOSITORY_NAME_OR_ID = get_env_or_exit("REPOSITORY_NAME_OR_ID", "The name or ID of the repository.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Request that another repository's refs be fetched into this one.")
-parser.add_argument("--source", required=False, help="Fully-qualified identifier for the source repository.")
-parser.add_argument("--source-to-target-refs", required=False, help="If supplied, the set of ref mappings to use when performing a 'sync' or create. If missing, all r...")
-args = parser.parse_args()
+def create_fork_sync_request(client, project: str, repository_name_or_id: str, *, source: Optional[str] = None, source_to_target_refs: Optional[str] = None) -> dict:
+    """
+    Request that another repository's refs be fetched into this one.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        repository_name_or_id: The name or ID of the repository.
+        source: Fully-qualified identifier for the source repository.
+        source_to_target_refs: If supplied, the set of ref mappings to use when performing a 'sync' or create. If missing, all r...
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "source": source,
+        "sourceToTargetRefs": source_to_target_refs,
+    }
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_name_or_id}/forkSyncRequests", API_VERSION, project=project)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['detailedStatus', 'operationId'], API_VERSION)
+    return data
+
+
+async def create_fork_sync_request_async(client, project: str, repository_name_or_id: str, *, source: Optional[str] = None, source_to_target_refs: Optional[str] = None) -> dict:
+    """Async variant of create_fork_sync_request() for use with AsyncAdoClient."""
+    body = {
+        "source": source,
+        "sourceToTargetRefs": source_to_target_refs,
+    }
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_name_or_id}/forkSyncRequests", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['detailedStatus', 'operationId'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_fork_sync_request", PAT)
-logger.info("Request that another repository's refs be fetched into this one.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "source": args.source,
-    "sourceToTargetRefs": args.source_to_target_refs,
-}
+def main() -> None:
+    """Read env vars / flags, call create_fork_sync_request() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    repository_name_or_id = require_env("REPOSITORY_NAME_OR_ID", "The name or ID of the repository.")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/git/repositories/{REPOSITORY_NAME_OR_ID}/forkSyncRequests", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Request that another repository's refs be fetched into this one.")
+    parser.add_argument("--source", required=False, help="Fully-qualified identifier for the source repository.")
+    parser.add_argument("--source-to-target-refs", required=False, help="If supplied, the set of ref mappings to use when performing a 'sync' or create. If missing, all r...")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_fork_sync_request", pat)
+    logger.info("Request that another repository's refs be fetched into this one.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_fork_sync_request(client, project, repository_name_or_id, source=args.source, source_to_target_refs=args.source_to_target_refs)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['detailedStatus', 'operationId'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,53 +10,74 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/git/forks/get-fork-sync-request?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-REPOSITORY_NAME_OR_ID = get_env_or_exit("REPOSITORY_NAME_OR_ID", "The name or ID of the repository.")
-FORK_SYNC_OPERATION_ID = get_env_or_exit("FORK_SYNC_OPERATION_ID", "OperationId of the sync request.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_fork_sync_request", PAT)
-logger.info("Get a specific fork sync operation's details.")
+def get_fork_sync_request(client, project: str, repository_name_or_id: str, fork_sync_operation_id: str) -> dict:
+    """
+    Get a specific fork sync operation's details.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/git/repositories/{REPOSITORY_NAME_OR_ID}/forkSyncRequests/{FORK_SYNC_OPERATION_ID}", API_VERSION, project=PROJECT_ID)
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        repository_name_or_id: The name or ID of the repository.
+        fork_sync_operation_id: OperationId of the sync request.
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_name_or_id}/forkSyncRequests/{fork_sync_operation_id}", API_VERSION, project=project)
+    response = client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['detailedStatus', 'operationId'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['detailedStatus', 'operationId'], API_VERSION)
+async def get_fork_sync_request_async(client, project: str, repository_name_or_id: str, fork_sync_operation_id: str) -> dict:
+    """Async variant of get_fork_sync_request() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_name_or_id}/forkSyncRequests/{fork_sync_operation_id}", API_VERSION, project=project)
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['detailedStatus', 'operationId'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_fork_sync_request() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    repository_name_or_id = require_env("REPOSITORY_NAME_OR_ID", "The name or ID of the repository.")
+    fork_sync_operation_id = require_env("FORK_SYNC_OPERATION_ID", "OperationId of the sync request.")
+
+    logger = AdoLogger("get_fork_sync_request", pat)
+    logger.info("Get a specific fork sync operation's details.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = get_fork_sync_request(client, project, repository_name_or_id, fork_sync_operation_id)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
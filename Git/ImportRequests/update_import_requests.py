@@ -11,74 +11,100 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/git/import-request
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-REPO_ID = get_env_or_exit("REPO_ID", "The name or ID of the repository.")
-IMPORT_REQUEST_ID = get_env_or_exit("IMPORT_REQUEST_ID", "The unique identifier for the import request to update.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Retry or abandon a failed import request.")
-parser.add_argument("--detailed-status", required=False, help="Detailed status of the import, including the current step and an error message, if applicable.")
-parser.add_argument("--parameters", required=False, help="Parameters for creating the import request.")
-parser.add_argument("--repository", required=False, help="The target repository for this import.")
-parser.add_argument("--status", required=False, help="Current status of the import.")
-args = parser.parse_args()
+def update_import_requests(client, project: str, repository_id: str, import_request_id: str, *, detailed_status: Optional[str] = None, parameters: Optional[str] = None, repository: Optional[str] = None, status: Optional[str] = None) -> dict:
+    """
+    Retry or abandon a failed import request.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        repository_id: The name or ID of the repository.
+        import_request_id: The unique identifier for the import request to update.
+        detailed_status: Detailed status of the import, including the current step and an error message, if applicable.
+        parameters: Parameters for creating the import request.
+        repository: The target repository for this import.
+        status: Current status of the import.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "detailedStatus": detailed_status,
+        "importRequestId": import_request_id,
+        "parameters": parameters,
+        "repository": repository,
+        "status": status,
+    }
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/importRequests/{import_request_id}", API_VERSION, project=project)
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['detailedStatus', 'importRequestId'], API_VERSION)
+    return data
+
+
+async def update_import_requests_async(client, project: str, repository_id: str, import_request_id: str, *, detailed_status: Optional[str] = None, parameters: Optional[str] = None, repository: Optional[str] = None, status: Optional[str] = None) -> dict:
+    """Async variant of update_import_requests() for use with AsyncAdoClient."""
+    body = {
+        "detailedStatus": detailed_status,
+        "importRequestId": import_request_id,
+        "parameters": parameters,
+        "repository": repository,
+        "status": status,
+    }
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/importRequests/{import_request_id}", API_VERSION, project=project)
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['detailedStatus', 'importRequestId'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_import_requests", PAT)
-logger.info("Retry or abandon a failed import request.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "detailedStatus": args.detailed_status,
-    "importRequestId": IMPORT_REQUEST_ID,
-    "parameters": args.parameters,
-    "repository": args.repository,
-    "status": args.status,
-}
+def main() -> None:
+    """Read env vars / flags, call update_import_requests() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    repository_id = require_env("REPO_ID", "The name or ID of the repository.")
+    import_request_id = require_env("IMPORT_REQUEST_ID", "The unique identifier for the import request to update.")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/git/repositories/{REPO_ID}/importRequests/{IMPORT_REQUEST_ID}", API_VERSION, project=PROJECT_ID)
-logger.info(f"PATCH {url}")
+    parser = argparse.ArgumentParser(description="Retry or abandon a failed import request.")
+    parser.add_argument("--detailed-status", required=False, help="Detailed status of the import, including the current step and an error message, if applicable.")
+    parser.add_argument("--parameters", required=False, help="Parameters for creating the import request.")
+    parser.add_argument("--repository", required=False, help="The target repository for this import.")
+    parser.add_argument("--status", required=False, help="Current status of the import.")
+    args = parser.parse_args()
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+    logger = AdoLogger("update_import_requests", pat)
+    logger.info("Retry or abandon a failed import request.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_import_requests(client, project, repository_id, import_request_id, detailed_status=args.detailed_status, parameters=args.parameters, repository=args.repository, status=args.status)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['detailedStatus', 'importRequestId'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,67 +11,102 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/git/items/get-item
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-REPO_ID = get_env_or_exit("REPO_ID", "The name or ID of the repository")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Retrieves a batch of items in a repo / project for a given list of paths or a long path")
-parser.add_argument("--include-content-metadata", required=False, help="Whether to include metadata for all items")
-parser.add_argument("--include-links", required=False, help="Whether to include the _links field on the shallow references")
-parser.add_argument("--item-descriptors", required=False, help="Collection of items to fetch, including path, version, and recursion level")
-parser.add_argument("--latest-processed-change", required=False, help="Whether to include shallow ref to commit that last changed each item")
-args = parser.parse_args()
+def get_items_batch(client, project: str, repository_id: str, *, include_content_metadata: Optional[str] = None, include_links: Optional[str] = None, item_descriptors: Optional[str] = None, latest_processed_change: Optional[str] = None) -> dict:
+    """
+    Retrieves a batch of items in a repo / project for a given list of paths or a long path
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_items_batch", PAT)
-logger.info("Retrieves a batch of items in a repo / project for a given list of paths or a long path")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        repository_id: The name or ID of the repository
+        include_content_metadata: Whether to include metadata for all items
+        include_links: Whether to include the _links field on the shallow references
+        item_descriptors: Collection of items to fetch, including path, version, and recursion level
+        latest_processed_change: Whether to include shallow ref to commit that last changed each item
 
-# ---------------------------------------------------------------------------
-# Request body
-# ---------------------------------------------------------------------------
-body = {
-    "includeContentMetadata": args.include_content_metadata,
-    "includeLinks": args.include_links,
-    "itemDescriptors": args.item_descriptors,
-    "latestProcessedChange": args.latest_processed_change,
-}
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "includeContentMetadata": include_content_metadata,
+        "includeLinks": include_links,
+        "itemDescriptors": item_descriptors,
+        "latestProcessedChange": latest_processed_change,
+    }
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/itemsbatch", API_VERSION, project=project)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/git/repositories/{REPO_ID}/itemsbatch", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
 
-response = execute_request("POST", url, HEADERS, body=body)
+async def get_items_batch_async(client, project: str, repository_id: str, *, include_content_metadata: Optional[str] = None, include_links: Optional[str] = None, item_descriptors: Optional[str] = None, latest_processed_change: Optional[str] = None) -> dict:
+    """Async variant of get_items_batch() for use with AsyncAdoClient."""
+    body = {
+        "includeContentMetadata": include_content_metadata,
+        "includeLinks": include_links,
+        "itemDescriptors": item_descriptors,
+        "latestProcessedChange": latest_processed_change,
+    }
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/itemsbatch", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_items_batch() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    repository_id = require_env("REPO_ID", "The name or ID of the repository")
+
+    parser = argparse.ArgumentParser(description="Retrieves a batch of items in a repo / project for a given list of paths or a long path")
+    parser.add_argument("--include-content-metadata", required=False, help="Whether to include metadata for all items")
+    parser.add_argument("--include-links", required=False, help="Whether to include the _links field on the shallow references")
+    parser.add_argument("--item-descriptors", required=False, help="Collection of items to fetch, including path, version, and recursion level")
+    parser.add_argument("--latest-processed-change", required=False, help="Whether to include shallow ref to commit that last changed each item")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("get_items_batch", pat)
+    logger.info("Retrieves a batch of items in a repo / project for a given list of paths or a long path")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        items = items_of(get_items_batch(client, project, repository_id, include_content_metadata=args.include_content_metadata, include_links=args.include_links, item_descriptors=args.item_descriptors, latest_processed_change=args.latest_processed_change), "value")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    data = get_items_batch(client, project, repository_id, include_content_metadata=args.include_content_metadata, include_links=args.include_links, item_descriptors=args.item_descriptors, latest_processed_change=args.latest_processed_change)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,49 +10,86 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/git/merge-bases/list?view=azure-devops-rest-7.2
 """
 
-import json
+import argparse
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-REPOSITORY_NAME_OR_ID = get_env_or_exit("REPOSITORY_NAME_OR_ID", "ID or name of the local repository.")
-COMMIT_ID = get_env_or_exit("COMMIT_ID", "First commit, usually the tip of the target branch of the potential merge.")
-OTHER_COMMIT_ID = get_env_or_exit("OTHER_COMMIT_ID", "Other commit, usually the tip of the source branch of the potential merge.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("list_merge_bases", PAT)
-logger.info("Find the merge bases of two commits, optionally across forks.")
+def list_merge_bases(client, project: str, repository_name_or_id: str, commit_id: str, other_commit_id: str) -> dict:
+    """
+    Find the merge bases of two commits, optionally across forks.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/git/repositories/{REPOSITORY_NAME_OR_ID}/commits/{COMMIT_ID}/mergebases", API_VERSION, project=PROJECT_ID)
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        repository_name_or_id: ID or name of the local repository.
+        commit_id: First commit, usually the tip of the target branch of the potential merge.
+        other_commit_id: Other commit, usually the tip of the source branch of the potential merge.
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_name_or_id}/commits/{commit_id}/mergebases", API_VERSION, project=project)
+    response = client.request("GET", url)
+    data = loads(response.content)
+    return data
+
+
+async def list_merge_bases_async(client, project: str, repository_name_or_id: str, commit_id: str, other_commit_id: str) -> dict:
+    """Async variant of list_merge_bases() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_name_or_id}/commits/{commit_id}/mergebases", API_VERSION, project=project)
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call list_merge_bases() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    repository_name_or_id = require_env("REPOSITORY_NAME_OR_ID", "ID or name of the local repository.")
+    commit_id = require_env("COMMIT_ID", "First commit, usually the tip of the target branch of the potential merge.")
+    other_commit_id = require_env("OTHER_COMMIT_ID", "Other commit, usually the tip of the source branch of the potential merge.")
+
+    parser = argparse.ArgumentParser(description="Find the merge bases of two commits, optionally across forks.")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("list_merge_bases", pat)
+    logger.info("Find the merge bases of two commits, optionally across forks.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        items = items_of(list_merge_bases(client, project, repository_name_or_id, commit_id, other_commit_id), "value")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    data = list_merge_bases(client, project, repository_name_or_id, commit_id, other_commit_id)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
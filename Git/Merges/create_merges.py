@@ -11,68 +11,88 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/git/merges/create?
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-REPOSITORY_NAME_OR_ID = get_env_or_exit("REPOSITORY_NAME_OR_ID", "The name or ID of the repository.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Request a git merge operation.")
-parser.add_argument("--comment", required=False, help="Comment or message of the commit.")
-parser.add_argument("--parents", required=False, help="An enumeration of the parent commit IDs for the merge commit.")
-args = parser.parse_args()
+def create_merges(client, project: str, repository_name_or_id: str, *, comment: Optional[str] = None, parents: Optional[str] = None) -> dict:
+    """
+    Request a git merge operation.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        repository_name_or_id: The name or ID of the repository.
+        comment: Comment or message of the commit.
+        parents: An enumeration of the parent commit IDs for the merge commit.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "comment": comment,
+        "parents": parents,
+    }
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_name_or_id}/merges", API_VERSION, project=project)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['detailedStatus', 'mergeOperationId'], API_VERSION)
+    return data
+
+
+async def create_merges_async(client, project: str, repository_name_or_id: str, *, comment: Optional[str] = None, parents: Optional[str] = None) -> dict:
+    """Async variant of create_merges() for use with AsyncAdoClient."""
+    body = {
+        "comment": comment,
+        "parents": parents,
+    }
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_name_or_id}/merges", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['detailedStatus', 'mergeOperationId'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_merges", PAT)
-logger.info("Request a git merge operation.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "comment": args.comment,
-    "parents": args.parents,
-}
+def main() -> None:
+    """Read env vars / flags, call create_merges() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    repository_name_or_id = require_env("REPOSITORY_NAME_OR_ID", "The name or ID of the repository.")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/git/repositories/{REPOSITORY_NAME_OR_ID}/merges", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Request a git merge operation.")
+    parser.add_argument("--comment", required=False, help="Comment or message of the commit.")
+    parser.add_argument("--parents", required=False, help="An enumeration of the parent commit IDs for the merge commit.")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_merges", pat)
+    logger.info("Request a git merge operation.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_merges(client, project, repository_name_or_id, comment=args.comment, parents=args.parents)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['detailedStatus', 'mergeOperationId'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,49 +10,74 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/git/pull-request-attachments/delete?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-FILE_NAME = get_env_or_exit("FILE_NAME", "The name of the attachment to delete.")
-REPO_ID = get_env_or_exit("REPO_ID", "The repository ID of the pull request’s target branch.")
-PULL_REQUEST_ID = get_env_or_exit("PULL_REQUEST_ID", "ID of the pull request.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("delete_pull_request_attachments", PAT)
-logger.info("Delete a pull request attachment.")
+def delete_pull_request_attachments(client, project: str, file_name: str, repository_id: str, pull_request_id: str) -> dict:
+    """
+    Delete a pull request attachment.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        file_name: The name of the attachment to delete.
+        repository_id: The repository ID of the pull request’s target branch.
+        pull_request_id: ID of the pull request.
+
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/pullRequests/{pull_request_id}/attachments/{file_name}", API_VERSION, project=project)
+    response = client.request("DELETE", url)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/git/repositories/{REPO_ID}/pullRequests/{PULL_REQUEST_ID}/attachments/{FILE_NAME}", API_VERSION, project=PROJECT_ID)
-logger.info(f"DELETE {url}")
 
-response = execute_request("DELETE", url, HEADERS)
+async def delete_pull_request_attachments_async(client, project: str, file_name: str, repository_id: str, pull_request_id: str) -> dict:
+    """Async variant of delete_pull_request_attachments() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/pullRequests/{pull_request_id}/attachments/{file_name}", API_VERSION, project=project)
+    response = await client.request("DELETE", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call delete_pull_request_attachments() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    file_name = require_env("FILE_NAME", "The name of the attachment to delete.")
+    repository_id = require_env("REPO_ID", "The repository ID of the pull request’s target branch.")
+    pull_request_id = require_env("PULL_REQUEST_ID", "ID of the pull request.")
+
+    logger = AdoLogger("delete_pull_request_attachments", pat)
+    logger.info("Delete a pull request attachment.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = delete_pull_request_attachments(client, project, file_name, repository_id, pull_request_id)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
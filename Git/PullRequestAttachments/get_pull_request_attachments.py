@@ -10,49 +10,81 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/git/pull-request-attachments/get?view=azure-devops-rest-7.2
 """
 
-import json
+import argparse
 import os
 import sys
+from typing import BinaryIO, Union
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.async_http_client import astream_to
+from _shared.download import download_file
+from _shared.http_client import AdoClient, build_url
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-FILE_NAME = get_env_or_exit("FILE_NAME", "The name of the attachment.")
-REPO_ID = get_env_or_exit("REPO_ID", "The repository ID of the pull request’s target branch.")
-PULL_REQUEST_ID = get_env_or_exit("PULL_REQUEST_ID", "ID of the pull request.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_pull_request_attachments", PAT)
-logger.info("Get the file content of a pull request attachment.")
+def get_pull_request_attachments(client, project: str, file_name: str, repository_id: str, pull_request_id: str, *, destination: Union[str, BinaryIO]) -> int:
+    """
+    Get the file content of a pull request attachment.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        file_name: The name of the attachment.
+        repository_id: The repository ID of the pull request’s target branch.
+        pull_request_id: ID of the pull request.
+        destination: Output path or binary file (e.g. sys.stdout.buffer).
+
+    Returns:
+        Bytes written. A path destination is fetched in parallel ranged
+        segments and resumes after an interruption (see _shared.download).
+    """
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/pullRequests/{pull_request_id}/attachments/{file_name}", API_VERSION, project=project)
+    return download_file(client, url, destination, accept="application/octet-stream")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/git/repositories/{REPO_ID}/pullRequests/{PULL_REQUEST_ID}/attachments/{FILE_NAME}", API_VERSION, project=PROJECT_ID)
-logger.info(f"GET {url}")
 
-response = execute_request("GET", url, HEADERS)
+async def get_pull_request_attachments_async(client, project: str, file_name: str, repository_id: str, pull_request_id: str, *, destination: Union[str, BinaryIO]) -> int:
+    """Async variant of get_pull_request_attachments() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/pullRequests/{pull_request_id}/attachments/{file_name}", API_VERSION, project=project)
+    response = await client.request("GET", url, stream=True, accept="application/octet-stream")
+    return await astream_to(response, destination)
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_pull_request_attachments() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    file_name = require_env("FILE_NAME", "The name of the attachment.")
+    repository_id = require_env("REPO_ID", "The repository ID of the pull request’s target branch.")
+    pull_request_id = require_env("PULL_REQUEST_ID", "ID of the pull request.")
+
+    parser = argparse.ArgumentParser(description="Get the file content of a pull request attachment.")
+    parser.add_argument("--output", help="Write the content to this file (default: stdout)")
+    args = parser.parse_args()
+
+    logger = AdoLogger("get_pull_request_attachments", pat)
+    logger.info("Get the file content of a pull request attachment.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    written = get_pull_request_attachments(client, project, file_name, repository_id, pull_request_id, destination=args.output or sys.stdout.buffer)
+    logger.info(f"Downloaded {written} bytes")
+    if args.output:
+        print(f"Saved {written} bytes to {args.output}")
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,50 +10,76 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/git/pull-request-comment-likes/delete?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-REPO_ID = get_env_or_exit("REPO_ID", "The repository ID of the pull request's target branch.")
-PULL_REQUEST_ID = get_env_or_exit("PULL_REQUEST_ID", "ID of the pull request.")
-THREAD_ID = get_env_or_exit("THREAD_ID", "The ID of the thread that contains the comment.")
-COMMENT_ID = get_env_or_exit("COMMENT_ID", "The ID of the comment.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("delete_pull_request_comment_likes", PAT)
-logger.info("Delete a like on a comment.")
+def delete_pull_request_comment_likes(client, project: str, repository_id: str, pull_request_id: str, thread_id: str, comment_id: str) -> dict:
+    """
+    Delete a like on a comment.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        repository_id: The repository ID of the pull request's target branch.
+        pull_request_id: ID of the pull request.
+        thread_id: The ID of the thread that contains the comment.
+        comment_id: The ID of the comment.
+
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/pullRequests/{pull_request_id}/threads/{thread_id}/comments/{comment_id}/likes", API_VERSION, project=project)
+    response = client.request("DELETE", url)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/git/repositories/{REPO_ID}/pullRequests/{PULL_REQUEST_ID}/threads/{THREAD_ID}/comments/{COMMENT_ID}/likes", API_VERSION, project=PROJECT_ID)
-logger.info(f"DELETE {url}")
 
-response = execute_request("DELETE", url, HEADERS)
+async def delete_pull_request_comment_likes_async(client, project: str, repository_id: str, pull_request_id: str, thread_id: str, comment_id: str) -> dict:
+    """Async variant of delete_pull_request_comment_likes() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/pullRequests/{pull_request_id}/threads/{thread_id}/comments/{comment_id}/likes", API_VERSION, project=project)
+    response = await client.request("DELETE", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call delete_pull_request_comment_likes() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    repository_id = require_env("REPO_ID", "The repository ID of the pull request's target branch.")
+    pull_request_id = require_env("PULL_REQUEST_ID", "ID of the pull request.")
+    thread_id = require_env("THREAD_ID", "The ID of the thread that contains the comment.")
+    comment_id = require_env("COMMENT_ID", "The ID of the comment.")
+
+    logger = AdoLogger("delete_pull_request_comment_likes", pat)
+    logger.info("Delete a like on a comment.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = delete_pull_request_comment_likes(client, project, repository_id, pull_request_id, thread_id, comment_id)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,50 +10,88 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/git/pull-request-comment-likes/list?view=azure-devops-rest-7.2
 """
 
-import json
+import argparse
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-REPO_ID = get_env_or_exit("REPO_ID", "The repository ID of the pull request's target branch.")
-PULL_REQUEST_ID = get_env_or_exit("PULL_REQUEST_ID", "ID of the pull request.")
-THREAD_ID = get_env_or_exit("THREAD_ID", "The ID of the thread that contains the comment.")
-COMMENT_ID = get_env_or_exit("COMMENT_ID", "The ID of the comment.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("list_pull_request_comment_likes", PAT)
-logger.info("Get likes for a comment.")
+def list_pull_request_comment_likes(client, project: str, repository_id: str, pull_request_id: str, thread_id: str, comment_id: str) -> dict:
+    """
+    Get likes for a comment.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/git/repositories/{REPO_ID}/pullRequests/{PULL_REQUEST_ID}/threads/{THREAD_ID}/comments/{COMMENT_ID}/likes", API_VERSION, project=PROJECT_ID)
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        repository_id: The repository ID of the pull request's target branch.
+        pull_request_id: ID of the pull request.
+        thread_id: The ID of the thread that contains the comment.
+        comment_id: The ID of the comment.
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/pullRequests/{pull_request_id}/threads/{thread_id}/comments/{comment_id}/likes", API_VERSION, project=project)
+    response = client.request("GET", url)
+    data = loads(response.content)
+    return data
+
+
+async def list_pull_request_comment_likes_async(client, project: str, repository_id: str, pull_request_id: str, thread_id: str, comment_id: str) -> dict:
+    """Async variant of list_pull_request_comment_likes() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/pullRequests/{pull_request_id}/threads/{thread_id}/comments/{comment_id}/likes", API_VERSION, project=project)
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call list_pull_request_comment_likes() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    repository_id = require_env("REPO_ID", "The repository ID of the pull request's target branch.")
+    pull_request_id = require_env("PULL_REQUEST_ID", "ID of the pull request.")
+    thread_id = require_env("THREAD_ID", "The ID of the thread that contains the comment.")
+    comment_id = require_env("COMMENT_ID", "The ID of the comment.")
+
+    parser = argparse.ArgumentParser(description="Get likes for a comment.")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("list_pull_request_comment_likes", pat)
+    logger.info("Get likes for a comment.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        items = items_of(list_pull_request_comment_likes(client, project, repository_id, pull_request_id, thread_id, comment_id), "value")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    data = list_pull_request_comment_likes(client, project, repository_id, pull_request_id, thread_id, comment_id)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,54 +10,112 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/git/pull-request-iteration-changes/get?view=azure-devops-rest-7.2
 """
 
-import json
+import argparse
 import os
 import sys
+from typing import Iterator, Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
+from _shared.pagination import paginate
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-REPO_ID = get_env_or_exit("REPO_ID", "The repository ID of the pull request's target branch.")
-PULL_REQUEST_ID = get_env_or_exit("PULL_REQUEST_ID", "ID of the pull request.")
-ITERATION_ID = get_env_or_exit("ITERATION_ID", "ID of the pull request iteration. <br /> Iteration one is the head of the source branch at the ti...")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_pull_request_iteration_changes", PAT)
-logger.info("Retrieve the changes made in a pull request between two iterations.")
+def get_pull_request_iteration_changes(client, project: str, repository_id: str, pull_request_id: str, iteration_id: str) -> dict:
+    """
+    Retrieve the changes made in a pull request between two iterations.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/git/repositories/{REPO_ID}/pullRequests/{PULL_REQUEST_ID}/iterations/{ITERATION_ID}/changes", API_VERSION, project=PROJECT_ID)
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        repository_id: The repository ID of the pull request's target branch.
+        pull_request_id: ID of the pull request.
+        iteration_id: ID of the pull request iteration. <br /> Iteration one is the head of the source branch at the ti...
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/pullRequests/{pull_request_id}/iterations/{iteration_id}/changes", API_VERSION, project=project)
+    response = client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['changeEntries', 'nextSkip'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['changeEntries', 'nextSkip'], API_VERSION)
+async def get_pull_request_iteration_changes_async(client, project: str, repository_id: str, pull_request_id: str, iteration_id: str) -> dict:
+    """Async variant of get_pull_request_iteration_changes() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/pullRequests/{pull_request_id}/iterations/{iteration_id}/changes", API_VERSION, project=project)
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['changeEntries', 'nextSkip'], API_VERSION)
+    return data
+
+
+def iter_get_pull_request_iteration_changes(client, project: str, repository_id: str, pull_request_id: str, iteration_id: str, *, max_items: Optional[int] = None, prefetch: bool = False) -> Iterator[dict]:
+    """
+    Yield every item across all pages of get_pull_request_iteration_changes() (top_skip paging).
+
+    Takes the same arguments, plus:
+        max_items: Stop after this many items (default: all).
+        prefetch: Fetch the next page while the current one is consumed.
+    """
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/pullRequests/{pull_request_id}/iterations/{iteration_id}/changes", API_VERSION, project=project)
+    return paginate(client, "GET", url, "top_skip", list_key="changeEntries",
+                    max_items=max_items, prefetch=prefetch)
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_pull_request_iteration_changes() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    repository_id = require_env("REPO_ID", "The repository ID of the pull request's target branch.")
+    pull_request_id = require_env("PULL_REQUEST_ID", "ID of the pull request.")
+    iteration_id = require_env("ITERATION_ID", "ID of the pull request iteration. <br /> Iteration one is the head of the source branch at the ti...")
+
+    parser = argparse.ArgumentParser(description="Retrieve the changes made in a pull request between two iterations.")
+    parser.add_argument("--all-pages", action="store_true", help="Follow pagination and return every item")
+    parser.add_argument("--max-items", type=int, help="Follow pagination up to this many items")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("get_pull_request_iteration_changes", pat)
+    logger.info("Retrieve the changes made in a pull request between two iterations.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        if args.all_pages or args.max_items:
+            items = iter_get_pull_request_iteration_changes(client, project, repository_id, pull_request_id, iteration_id, max_items=args.max_items, prefetch=True)
+        else:
+            items = items_of(get_pull_request_iteration_changes(client, project, repository_id, pull_request_id, iteration_id), "changeEntries")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    if args.all_pages or args.max_items:
+        items = list(iter_get_pull_request_iteration_changes(client, project, repository_id, pull_request_id, iteration_id, max_items=args.max_items, prefetch=True))
+        data = {"count": len(items), "changeEntries": items}
+    else:
+        data = get_pull_request_iteration_changes(client, project, repository_id, pull_request_id, iteration_id)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
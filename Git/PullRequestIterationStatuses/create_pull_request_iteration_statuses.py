@@ -11,69 +11,90 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/git/pull-request-i
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-REPO_ID = get_env_or_exit("REPO_ID", "The repository ID of the pull request’s target branch.")
-PULL_REQUEST_ID = get_env_or_exit("PULL_REQUEST_ID", "ID of the pull request.")
-ITERATION_ID = get_env_or_exit("ITERATION_ID", "ID of the pull request iteration.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Create a pull request status on the iteration.")
-parser.add_argument("--properties", required=False, help="Custom properties of the status.")
-args = parser.parse_args()
+def create_pull_request_iteration_statuses(client, project: str, repository_id: str, pull_request_id: str, iteration_id: str, *, properties: Optional[str] = None) -> dict:
+    """
+    Create a pull request status on the iteration.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        repository_id: The repository ID of the pull request’s target branch.
+        pull_request_id: ID of the pull request.
+        iteration_id: ID of the pull request iteration.
+        properties: Custom properties of the status.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "iterationId": iteration_id,
+        "properties": properties,
+    }
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/pullRequests/{pull_request_id}/iterations/{iteration_id}/statuses", API_VERSION, project=project)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['iterationId', 'properties'], API_VERSION)
+    return data
+
+
+async def create_pull_request_iteration_statuses_async(client, project: str, repository_id: str, pull_request_id: str, iteration_id: str, *, properties: Optional[str] = None) -> dict:
+    """Async variant of create_pull_request_iteration_statuses() for use with AsyncAdoClient."""
+    body = {
+        "iterationId": iteration_id,
+        "properties": properties,
+    }
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/pullRequests/{pull_request_id}/iterations/{iteration_id}/statuses", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['iterationId', 'properties'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_pull_request_iteration_statuses", PAT)
-logger.info("Create a pull request status on the iteration.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "iterationId": ITERATION_ID,
-    "properties": args.properties,
-}
+def main() -> None:
+    """Read env vars / flags, call create_pull_request_iteration_statuses() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    repository_id = require_env("REPO_ID", "The repository ID of the pull request’s target branch.")
+    pull_request_id = require_env("PULL_REQUEST_ID", "ID of the pull request.")
+    iteration_id = require_env("ITERATION_ID", "ID of the pull request iteration.")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/git/repositories/{REPO_ID}/pullRequests/{PULL_REQUEST_ID}/iterations/{ITERATION_ID}/statuses", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Create a pull request status on the iteration.")
+    parser.add_argument("--properties", required=False, help="Custom properties of the status.")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_pull_request_iteration_statuses", pat)
+    logger.info("Create a pull request status on the iteration.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_pull_request_iteration_statuses(client, project, repository_id, pull_request_id, iteration_id, properties=args.properties)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['iterationId', 'properties'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
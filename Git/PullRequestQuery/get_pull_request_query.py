@@ -11,68 +11,88 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/git/pull-request-q
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-REPO_ID = get_env_or_exit("REPO_ID", "ID of the repository.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="This API is used to find what pull requests are related to a given commit.")
-parser.add_argument("--queries", required=False, help="The queries to perform.")
-parser.add_argument("--results", required=False, help="The results of the queries. This matches the QueryInputs list so Results[n] are the results of Qu...")
-args = parser.parse_args()
+def get_pull_request_query(client, project: str, repository_id: str, *, queries: Optional[str] = None, results: Optional[str] = None) -> dict:
+    """
+    This API is used to find what pull requests are related to a given commit.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        repository_id: ID of the repository.
+        queries: The queries to perform.
+        results: The results of the queries. This matches the QueryInputs list so Results[n] are the results of Qu...
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "queries": queries,
+        "results": results,
+    }
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/pullrequestquery", API_VERSION, project=project)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['queries', 'results'], API_VERSION)
+    return data
+
+
+async def get_pull_request_query_async(client, project: str, repository_id: str, *, queries: Optional[str] = None, results: Optional[str] = None) -> dict:
+    """Async variant of get_pull_request_query() for use with AsyncAdoClient."""
+    body = {
+        "queries": queries,
+        "results": results,
+    }
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/pullrequestquery", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['queries', 'results'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_pull_request_query", PAT)
-logger.info("This API is used to find what pull requests are related to a given commit.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "queries": args.queries,
-    "results": args.results,
-}
+def main() -> None:
+    """Read env vars / flags, call get_pull_request_query() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    repository_id = require_env("REPO_ID", "ID of the repository.")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/git/repositories/{REPO_ID}/pullrequestquery", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="This API is used to find what pull requests are related to a given commit.")
+    parser.add_argument("--queries", required=False, help="The queries to perform.")
+    parser.add_argument("--results", required=False, help="The results of the queries. This matches the QueryInputs list so Results[n] are the results of Qu...")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("get_pull_request_query", pat)
+    logger.info("This API is used to find what pull requests are related to a given commit.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = get_pull_request_query(client, project, repository_id, queries=args.queries, results=args.results)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['queries', 'results'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,78 +11,108 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/git/pull-request-r
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-REPO_ID = get_env_or_exit("REPO_ID", "The repository ID of the pull request's target branch.")
-PULL_REQUEST_ID = get_env_or_exit("PULL_REQUEST_ID", "ID of the pull request.")
-REVIEWER_ID = get_env_or_exit("REVIEWER_ID", "ID of the reviewer.")
-
-# ---------------------------------------------------------------------------
-# CLI arguments
-# ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Add a reviewer to a pull request or cast a vote.")
-parser.add_argument("--has-declined", required=False, help="Indicates if this reviewer has declined to review this pull request.")
-parser.add_argument("--is-flagged", required=False, help="Indicates if this reviewer is flagged for attention on this pull request.")
-parser.add_argument("--is-reapprove", required=False, help="Indicates if this approve vote should still be handled even though vote didn't change.")
-parser.add_argument("--is-required", required=False, help="Indicates if this is a required reviewer for this pull request. <br /> Branches can have policies...")
-parser.add_argument("--reviewer-url", required=False, help="URL to retrieve information about this identity")
-parser.add_argument("--vote", required=False, help="Vote on a pull request:<br /> 10 - approved 5 - approved with suggestions 0 - no vote -5 - waitin...")
-args = parser.parse_args()
-
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_pull_request_reviewer", PAT)
-logger.info("Add a reviewer to a pull request or cast a vote.")
-
-# ---------------------------------------------------------------------------
-# Request body
-# ---------------------------------------------------------------------------
-body = {
-    "hasDeclined": args.has_declined,
-    "isFlagged": args.is_flagged,
-    "isReapprove": args.is_reapprove,
-    "isRequired": args.is_required,
-    "reviewerUrl": args.reviewer_url,
-    "vote": args.vote,
-}
 
 # ---------------------------------------------------------------------------
-# API call
+# API
 # ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/git/repositories/{REPO_ID}/pullRequests/{PULL_REQUEST_ID}/reviewers/{REVIEWER_ID}", API_VERSION, project=PROJECT_ID)
-logger.info(f"PUT {url}")
-
-response = execute_request("PUT", url, HEADERS, body=body)
+def create_pull_request_reviewer(client, project: str, repository_id: str, pull_request_id: str, reviewer_id: str, *, has_declined: Optional[str] = None, is_flagged: Optional[str] = None, is_reapprove: Optional[str] = None, is_required: Optional[str] = None, reviewer_url: Optional[str] = None, vote: Optional[str] = None) -> dict:
+    """
+    Add a reviewer to a pull request or cast a vote.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        repository_id: The repository ID of the pull request's target branch.
+        pull_request_id: ID of the pull request.
+        reviewer_id: ID of the reviewer.
+        has_declined: Indicates if this reviewer has declined to review this pull request.
+        is_flagged: Indicates if this reviewer is flagged for attention on this pull request.
+        is_reapprove: Indicates if this approve vote should still be handled even though vote didn't change.
+        is_required: Indicates if this is a required reviewer for this pull request. <br /> Branches can have policies...
+        reviewer_url: URL to retrieve information about this identity
+        vote: Vote on a pull request:<br /> 10 - approved 5 - approved with suggestions 0 - no vote -5 - waitin...
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "hasDeclined": has_declined,
+        "isFlagged": is_flagged,
+        "isReapprove": is_reapprove,
+        "isRequired": is_required,
+        "reviewerUrl": reviewer_url,
+        "vote": vote,
+    }
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/pullRequests/{pull_request_id}/reviewers/{reviewer_id}", API_VERSION, project=project)
+    response = client.request("PUT", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['hasDeclined', 'isFlagged'], API_VERSION)
+    return data
+
+
+async def create_pull_request_reviewer_async(client, project: str, repository_id: str, pull_request_id: str, reviewer_id: str, *, has_declined: Optional[str] = None, is_flagged: Optional[str] = None, is_reapprove: Optional[str] = None, is_required: Optional[str] = None, reviewer_url: Optional[str] = None, vote: Optional[str] = None) -> dict:
+    """Async variant of create_pull_request_reviewer() for use with AsyncAdoClient."""
+    body = {
+        "hasDeclined": has_declined,
+        "isFlagged": is_flagged,
+        "isReapprove": is_reapprove,
+        "isRequired": is_required,
+        "reviewerUrl": reviewer_url,
+        "vote": vote,
+    }
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/pullRequests/{pull_request_id}/reviewers/{reviewer_id}", API_VERSION, project=project)
+    response = await client.request("PUT", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['hasDeclined', 'isFlagged'], API_VERSION)
+    return data
 
-data = response.json()
-
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['hasDeclined', 'isFlagged'], API_VERSION)
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call create_pull_request_reviewer() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    repository_id = require_env("REPO_ID", "The repository ID of the pull request's target branch.")
+    pull_request_id = require_env("PULL_REQUEST_ID", "ID of the pull request.")
+    reviewer_id = require_env("REVIEWER_ID", "ID of the reviewer.")
+
+    parser = argparse.ArgumentParser(description="Add a reviewer to a pull request or cast a vote.")
+    parser.add_argument("--has-declined", required=False, help="Indicates if this reviewer has declined to review this pull request.")
+    parser.add_argument("--is-flagged", required=False, help="Indicates if this reviewer is flagged for attention on this pull request.")
+    parser.add_argument("--is-reapprove", required=False, help="Indicates if this approve vote should still be handled even though vote didn't change.")
+    parser.add_argument("--is-required", required=False, help="Indicates if this is a required reviewer for this pull request. <br /> Branches can have policies...")
+    parser.add_argument("--reviewer-url", required=False, help="URL to retrieve information about this identity")
+    parser.add_argument("--vote", required=False, help="Vote on a pull request:<br /> 10 - approved 5 - approved with suggestions 0 - no vote -5 - waitin...")
+    args = parser.parse_args()
+
+    logger = AdoLogger("create_pull_request_reviewer", pat)
+    logger.info("Add a reviewer to a pull request or cast a vote.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = create_pull_request_reviewer(client, project, repository_id, pull_request_id, reviewer_id, has_declined=args.has_declined, is_flagged=args.is_flagged, is_reapprove=args.is_reapprove, is_required=args.is_required, reviewer_url=args.reviewer_url, vote=args.vote)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,64 +11,88 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/git/pull-request-s
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-REPO_ID = get_env_or_exit("REPO_ID", "ID of the git repository.")
-PULL_REQUEST_ID = get_env_or_exit("PULL_REQUEST_ID", "ID of the pull request.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Sends an e-mail notification about a specific pull request to a set of recipients")
-parser.add_argument("--message", required=False, help="Optional user note or message.")
-parser.add_argument("--receivers", required=False, help="Identities of users who will receive a share notification.")
-args = parser.parse_args()
+def create_share_pull_request(client, project: str, repository_id: str, pull_request_id: str, *, message: Optional[str] = None, receivers: Optional[str] = None) -> dict:
+    """
+    Sends an e-mail notification about a specific pull request to a set of recipients
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_share_pull_request", PAT)
-logger.info("Sends an e-mail notification about a specific pull request to a set of recipients")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        repository_id: ID of the git repository.
+        pull_request_id: ID of the pull request.
+        message: Optional user note or message.
+        receivers: Identities of users who will receive a share notification.
 
-# ---------------------------------------------------------------------------
-# Request body
-# ---------------------------------------------------------------------------
-body = {
-    "message": args.message,
-    "receivers": args.receivers,
-}
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "message": message,
+        "receivers": receivers,
+    }
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/pullRequests/{pull_request_id}/share", API_VERSION, project=project)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/git/repositories/{REPO_ID}/pullRequests/{PULL_REQUEST_ID}/share", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
 
-response = execute_request("POST", url, HEADERS, body=body)
+async def create_share_pull_request_async(client, project: str, repository_id: str, pull_request_id: str, *, message: Optional[str] = None, receivers: Optional[str] = None) -> dict:
+    """Async variant of create_share_pull_request() for use with AsyncAdoClient."""
+    body = {
+        "message": message,
+        "receivers": receivers,
+    }
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/pullRequests/{pull_request_id}/share", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call create_share_pull_request() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    repository_id = require_env("REPO_ID", "ID of the git repository.")
+    pull_request_id = require_env("PULL_REQUEST_ID", "ID of the pull request.")
+
+    parser = argparse.ArgumentParser(description="Sends an e-mail notification about a specific pull request to a set of recipients")
+    parser.add_argument("--message", required=False, help="Optional user note or message.")
+    parser.add_argument("--receivers", required=False, help="Identities of users who will receive a share notification.")
+    args = parser.parse_args()
+
+    logger = AdoLogger("create_share_pull_request", pat)
+    logger.info("Sends an e-mail notification about a specific pull request to a set of recipients")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = create_share_pull_request(client, project, repository_id, pull_request_id, message=args.message, receivers=args.receivers)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
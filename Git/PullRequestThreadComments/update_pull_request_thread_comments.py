@@ -11,78 +11,107 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/git/pull-request-t
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-REPO_ID = get_env_or_exit("REPO_ID", "The repository ID of the pull request's target branch.")
-PULL_REQUEST_ID = get_env_or_exit("PULL_REQUEST_ID", "ID of the pull request.")
-THREAD_ID = get_env_or_exit("THREAD_ID", "ID of the thread that the desired comment is in.")
-COMMENT_ID = get_env_or_exit("COMMENT_ID", "ID of the comment to update.")
-
-# ---------------------------------------------------------------------------
-# CLI arguments
-# ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Update a comment associated with a specific thread in a pull request.")
-parser.add_argument("--author", required=False, help="The author of the comment.")
-parser.add_argument("--comment-type", required=False, help="The comment type at the time of creation.")
-parser.add_argument("--content", required=False, help="The comment content.")
-parser.add_argument("--id", required=False, help="The comment ID. IDs start at 1 and are unique to a pull request.")
-parser.add_argument("--is-deleted", required=False, help="Whether or not this comment was soft-deleted.")
-args = parser.parse_args()
-
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_pull_request_thread_comments", PAT)
-logger.info("Update a comment associated with a specific thread in a pull request.")
-
-# ---------------------------------------------------------------------------
-# Request body
-# ---------------------------------------------------------------------------
-body = {
-    "author": args.author,
-    "commentType": args.comment_type,
-    "content": args.content,
-    "id": args.id,
-    "isDeleted": args.is_deleted,
-}
 
 # ---------------------------------------------------------------------------
-# API call
+# API
 # ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/git/repositories/{REPO_ID}/pullRequests/{PULL_REQUEST_ID}/threads/{THREAD_ID}/comments/{COMMENT_ID}", API_VERSION, project=PROJECT_ID)
-logger.info(f"PATCH {url}")
-
-response = execute_request("PATCH", url, HEADERS, body=body)
+def update_pull_request_thread_comments(client, project: str, repository_id: str, pull_request_id: str, thread_id: str, comment_id: str, *, author: Optional[str] = None, comment_type: Optional[str] = None, content: Optional[str] = None, id: Optional[str] = None, is_deleted: Optional[str] = None) -> dict:
+    """
+    Update a comment associated with a specific thread in a pull request.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        repository_id: The repository ID of the pull request's target branch.
+        pull_request_id: ID of the pull request.
+        thread_id: ID of the thread that the desired comment is in.
+        comment_id: ID of the comment to update.
+        author: The author of the comment.
+        comment_type: The comment type at the time of creation.
+        content: The comment content.
+        id: The comment ID. IDs start at 1 and are unique to a pull request.
+        is_deleted: Whether or not this comment was soft-deleted.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "author": author,
+        "commentType": comment_type,
+        "content": content,
+        "id": id,
+        "isDeleted": is_deleted,
+    }
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/pullRequests/{pull_request_id}/threads/{thread_id}/comments/{comment_id}", API_VERSION, project=project)
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'author'], API_VERSION)
+    return data
+
+
+async def update_pull_request_thread_comments_async(client, project: str, repository_id: str, pull_request_id: str, thread_id: str, comment_id: str, *, author: Optional[str] = None, comment_type: Optional[str] = None, content: Optional[str] = None, id: Optional[str] = None, is_deleted: Optional[str] = None) -> dict:
+    """Async variant of update_pull_request_thread_comments() for use with AsyncAdoClient."""
+    body = {
+        "author": author,
+        "commentType": comment_type,
+        "content": content,
+        "id": id,
+        "isDeleted": is_deleted,
+    }
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/pullRequests/{pull_request_id}/threads/{thread_id}/comments/{comment_id}", API_VERSION, project=project)
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'author'], API_VERSION)
+    return data
 
-data = response.json()
-
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'author'], API_VERSION)
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(f"Pull Request Thread Comments ID: {data.get("id", "N/A")}")
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call update_pull_request_thread_comments() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    repository_id = require_env("REPO_ID", "The repository ID of the pull request's target branch.")
+    pull_request_id = require_env("PULL_REQUEST_ID", "ID of the pull request.")
+    thread_id = require_env("THREAD_ID", "ID of the thread that the desired comment is in.")
+    comment_id = require_env("COMMENT_ID", "ID of the comment to update.")
+
+    parser = argparse.ArgumentParser(description="Update a comment associated with a specific thread in a pull request.")
+    parser.add_argument("--author", required=False, help="The author of the comment.")
+    parser.add_argument("--comment-type", required=False, help="The comment type at the time of creation.")
+    parser.add_argument("--content", required=False, help="The comment content.")
+    parser.add_argument("--id", required=False, help="The comment ID. IDs start at 1 and are unique to a pull request.")
+    parser.add_argument("--is-deleted", required=False, help="Whether or not this comment was soft-deleted.")
+    args = parser.parse_args()
+
+    logger = AdoLogger("update_pull_request_thread_comments", pat)
+    logger.info("Update a comment associated with a specific thread in a pull request.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = update_pull_request_thread_comments(client, project, repository_id, pull_request_id, thread_id, comment_id, author=args.author, comment_type=args.comment_type, content=args.content, id=args.id, is_deleted=args.is_deleted)
+
+    print(f"Pull Request Thread Comments ID: {data.get('id', 'N/A')}")
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
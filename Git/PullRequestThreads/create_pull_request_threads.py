@@ -11,67 +11,86 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/git/pull-request-t
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-REPO_ID = get_env_or_exit("REPO_ID", "Repository ID of the pull request's target branch.")
-PULL_REQUEST_ID = get_env_or_exit("PULL_REQUEST_ID", "ID of the pull request.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Create a thread in a pull request.")
-parser.add_argument("--pull-request-thread-context", required=False, help="Extended context information unique to pull requests")
-args = parser.parse_args()
+def create_pull_request_threads(client, project: str, repository_id: str, pull_request_id: str, *, pull_request_thread_context: Optional[str] = None) -> dict:
+    """
+    Create a thread in a pull request.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        repository_id: Repository ID of the pull request's target branch.
+        pull_request_id: ID of the pull request.
+        pull_request_thread_context: Extended context information unique to pull requests
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "pullRequestThreadContext": pull_request_thread_context,
+    }
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/pullRequests/{pull_request_id}/threads", API_VERSION, project=project)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['pullRequestThreadContext'], API_VERSION)
+    return data
+
+
+async def create_pull_request_threads_async(client, project: str, repository_id: str, pull_request_id: str, *, pull_request_thread_context: Optional[str] = None) -> dict:
+    """Async variant of create_pull_request_threads() for use with AsyncAdoClient."""
+    body = {
+        "pullRequestThreadContext": pull_request_thread_context,
+    }
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/pullRequests/{pull_request_id}/threads", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['pullRequestThreadContext'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_pull_request_threads", PAT)
-logger.info("Create a thread in a pull request.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "pullRequestThreadContext": args.pull_request_thread_context,
-}
+def main() -> None:
+    """Read env vars / flags, call create_pull_request_threads() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    repository_id = require_env("REPO_ID", "Repository ID of the pull request's target branch.")
+    pull_request_id = require_env("PULL_REQUEST_ID", "ID of the pull request.")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/git/repositories/{REPO_ID}/pullRequests/{PULL_REQUEST_ID}/threads", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Create a thread in a pull request.")
+    parser.add_argument("--pull-request-thread-context", required=False, help="Extended context information unique to pull requests")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_pull_request_threads", pat)
+    logger.info("Create a thread in a pull request.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_pull_request_threads(client, project, repository_id, pull_request_id, pull_request_thread_context=args.pull_request_thread_context)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['pullRequestThreadContext'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
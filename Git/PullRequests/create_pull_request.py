@@ -10,65 +10,89 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/git/pull-requests/create?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-REPO_ID = get_env_or_exit("REPO_ID", "Repository name or GUID")
-SOURCE_BRANCH = get_env_or_exit("SOURCE_BRANCH", "Source branch ref (e.g. refs/heads/feature)")
-TARGET_BRANCH = get_env_or_exit("TARGET_BRANCH", "Target branch ref (e.g. refs/heads/main)")
-PR_TITLE = get_env_or_exit("PR_TITLE", "Pull request title")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_pull_request", PAT)
-logger.info("Create a new pull request.")
+def create_pull_request(client, project: str, repository_id: str, source_branch: str, target_branch: str, pr_title: str) -> dict:
+    """
+    Create a new pull request.
 
-# ---------------------------------------------------------------------------
-# Request body
-# ---------------------------------------------------------------------------
-body = {
-    "sourceRefName": SOURCE_BRANCH,
-    "targetRefName": TARGET_BRANCH,
-    "title": PR_TITLE,
-}
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        repository_id: Repository name or GUID
+        source_branch: Source branch ref (e.g. refs/heads/feature)
+        target_branch: Target branch ref (e.g. refs/heads/main)
+        pr_title: Pull request title
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/git/repositories/{REPO_ID}/pullrequests", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "sourceRefName": source_branch,
+        "targetRefName": target_branch,
+        "title": pr_title,
+    }
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/pullrequests", API_VERSION, project=project)
+    response = client.request("POST", url, body=body, expected_status=201)
+    data = loads(response.content)
+    version_guard(data, ['pullRequestId', 'title'], API_VERSION)
+    return data
 
-response = execute_request("POST", url, HEADERS, body=body, expected_status=201)
 
-data = response.json()
+async def create_pull_request_async(client, project: str, repository_id: str, source_branch: str, target_branch: str, pr_title: str) -> dict:
+    """Async variant of create_pull_request() for use with AsyncAdoClient."""
+    body = {
+        "sourceRefName": source_branch,
+        "targetRefName": target_branch,
+        "title": pr_title,
+    }
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/pullrequests", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body, expected_status=201)
+    data = loads(response.content)
+    version_guard(data, ['pullRequestId', 'title'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['pullRequestId', 'title'], API_VERSION)
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(f"Pull request #{data.get("pullRequestId", "N/A")} created: {data.get("title", "N/A")}")
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call create_pull_request() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    repository_id = require_env("REPO_ID", "Repository name or GUID")
+    source_branch = require_env("SOURCE_BRANCH", "Source branch ref (e.g. refs/heads/feature)")
+    target_branch = require_env("TARGET_BRANCH", "Target branch ref (e.g. refs/heads/main)")
+    pr_title = require_env("PR_TITLE", "Pull request title")
+
+    logger = AdoLogger("create_pull_request", pat)
+    logger.info("Create a new pull request.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = create_pull_request(client, project, repository_id, source_branch, target_branch, pr_title)
+
+    print(f"Pull request #{data.get('pullRequestId', 'N/A')} created: {data.get('title', 'N/A')}")
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,74 +11,100 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/git/pull-requests/
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-REPO_ID = get_env_or_exit("REPO_ID", "The repository ID of the pull request's target branch.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Create a pull request.")
-parser.add_argument("--artifact-id", required=False, help="A string which uniquely identifies this pull request. To generate an artifact ID for a pull reque...")
-parser.add_argument("--auto-complete-set-by", required=False, help="If set, auto-complete is enabled for this pull request and this is the identity that enabled it.")
-parser.add_argument("--closed-by", required=False, help="The user who closed the pull request.")
-parser.add_argument("--closed-date", required=False, help="The date when the pull request was closed (completed, abandoned, or merged externally).")
-parser.add_argument("--code-review-id", required=False, help="The code review ID of the pull request. Used internally.")
-args = parser.parse_args()
+def create_pull_requests(client, project: str, repository_id: str, *, artifact_id: Optional[str] = None, auto_complete_set_by: Optional[str] = None, closed_by: Optional[str] = None, closed_date: Optional[str] = None, code_review_id: Optional[str] = None) -> dict:
+    """
+    Create a pull request.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        repository_id: The repository ID of the pull request's target branch.
+        artifact_id: A string which uniquely identifies this pull request. To generate an artifact ID for a pull reque...
+        auto_complete_set_by: If set, auto-complete is enabled for this pull request and this is the identity that enabled it.
+        closed_by: The user who closed the pull request.
+        closed_date: The date when the pull request was closed (completed, abandoned, or merged externally).
+        code_review_id: The code review ID of the pull request. Used internally.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "artifactId": artifact_id,
+        "autoCompleteSetBy": auto_complete_set_by,
+        "closedBy": closed_by,
+        "closedDate": closed_date,
+        "codeReviewId": code_review_id,
+    }
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/pullrequests", API_VERSION, project=project)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['artifactId', 'autoCompleteSetBy'], API_VERSION)
+    return data
+
+
+async def create_pull_requests_async(client, project: str, repository_id: str, *, artifact_id: Optional[str] = None, auto_complete_set_by: Optional[str] = None, closed_by: Optional[str] = None, closed_date: Optional[str] = None, code_review_id: Optional[str] = None) -> dict:
+    """Async variant of create_pull_requests() for use with AsyncAdoClient."""
+    body = {
+        "artifactId": artifact_id,
+        "autoCompleteSetBy": auto_complete_set_by,
+        "closedBy": closed_by,
+        "closedDate": closed_date,
+        "codeReviewId": code_review_id,
+    }
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/pullrequests", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['artifactId', 'autoCompleteSetBy'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_pull_requests", PAT)
-logger.info("Create a pull request.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "artifactId": args.artifact_id,
-    "autoCompleteSetBy": args.auto_complete_set_by,
-    "closedBy": args.closed_by,
-    "closedDate": args.closed_date,
-    "codeReviewId": args.code_review_id,
-}
+def main() -> None:
+    """Read env vars / flags, call create_pull_requests() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    repository_id = require_env("REPO_ID", "The repository ID of the pull request's target branch.")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/git/repositories/{REPO_ID}/pullrequests", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Create a pull request.")
+    parser.add_argument("--artifact-id", required=False, help="A string which uniquely identifies this pull request. To generate an artifact ID for a pull reque...")
+    parser.add_argument("--auto-complete-set-by", required=False, help="If set, auto-complete is enabled for this pull request and this is the identity that enabled it.")
+    parser.add_argument("--closed-by", required=False, help="The user who closed the pull request.")
+    parser.add_argument("--closed-date", required=False, help="The date when the pull request was closed (completed, abandoned, or merged externally).")
+    parser.add_argument("--code-review-id", required=False, help="The code review ID of the pull request. Used internally.")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_pull_requests", pat)
+    logger.info("Create a pull request.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_pull_requests(client, project, repository_id, artifact_id=args.artifact_id, auto_complete_set_by=args.auto_complete_set_by, closed_by=args.closed_by, closed_date=args.closed_date, code_review_id=args.code_review_id)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['artifactId', 'autoCompleteSetBy'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -8,58 +8,26 @@ Validates:
   - Correct Authorization header
   - Successful response parsing (201)
   - Exit when required env vars are missing
+
+The script is imported and called in-process; see the fixtures in conftest.py.
 """
 
 import json
-import os
-import subprocess
-import sys
 from pathlib import Path
 
 import pytest
 import responses
 
+from _shared.errors import AdoAuthError, AdoNotFound
+from Git.PullRequests.create_pull_request import create_pull_request, main
+
 FIXTURES = Path(__file__).parent / "fixtures"
-SCRIPT = str(Path(__file__).resolve().parents[1] / "create_pull_request.py")
-
-# ---------------------------------------------------------------------------
-# Helpers
-# ---------------------------------------------------------------------------
-
-def _run_script(env_override=None, extra_args=None, expect_fail=False):
-    """Run the script as a subprocess with the given env."""
-    env = {
-        "AZURE_DEVOPS_ORG": "testorg",
-        "AZURE_DEVOPS_PAT": "fakepat1234567890",
-        "PROJECT_ID": "a1b2c3d4-e5f6-7890-abcd-ef1234567890",
-        "REPO_ID": "test-value-repository_id",
-        "SOURCE_BRANCH": "test-value-source_branch",
-        "TARGET_BRANCH": "test-value-target_branch",
-        "PR_TITLE": "test-value-pr_title",
-        "PATH": os.environ.get("PATH", ""),
-        "PYTHONPATH": os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."),
-    }
-    if env_override:
-        env.update(env_override)
-    env = {k: v for k, v in env.items() if v is not None}
-
-    cmd = [sys.executable, SCRIPT]
-    if extra_args:
-        cmd.extend(extra_args)
-
-    result = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        env=env,
-        timeout=30,
-    )
-    if not expect_fail:
-        assert result.returncode == 0, (
-            f"Script failed (rc={result.returncode}):\n"
-            f"STDOUT: {result.stdout}\nSTDERR: {result.stderr}"
-        )
-    return result
+ENV = {
+    "REPO_ID": "test-value-repository_id",
+    "SOURCE_BRANCH": "test-value-source_branch",
+    "TARGET_BRANCH": "test-value-target_branch",
+    "PR_TITLE": "test-value-pr_title",
+}
 
 
 class TestCreatePullRequestEnvValidation:
@@ -67,73 +35,52 @@ class TestCreatePullRequestEnvValidation:
 
     @pytest.mark.offline
     @pytest.mark.git
-    def test_missing_org_exits(self):
-        result = _run_script(
-            env_override={"AZURE_DEVOPS_ORG": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "AZURE_DEVOPS_ORG" in result.stderr or "AZURE_DEVOPS_ORG" in result.stdout
+    def test_missing_org_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "AZURE_DEVOPS_ORG": None})
+        assert code != 0
+        assert "AZURE_DEVOPS_ORG" in output
 
     @pytest.mark.offline
     @pytest.mark.git
-    def test_missing_pat_exits(self):
-        result = _run_script(
-            env_override={"AZURE_DEVOPS_PAT": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "AZURE_DEVOPS_PAT" in result.stderr or "AZURE_DEVOPS_PAT" in result.stdout
+    def test_missing_pat_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "AZURE_DEVOPS_PAT": None})
+        assert code != 0
+        assert "AZURE_DEVOPS_PAT" in output
 
     @pytest.mark.offline
     @pytest.mark.git
-    def test_missing_project_id_exits(self):
-        result = _run_script(
-            env_override={"PROJECT_ID": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "PROJECT_ID" in (result.stderr + result.stdout)
+    def test_missing_project_id_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "PROJECT_ID": None})
+        assert code != 0
+        assert "PROJECT_ID" in output
 
     @pytest.mark.offline
     @pytest.mark.git
-    def test_missing_repository_id_exits(self):
-        result = _run_script(
-            env_override={"REPO_ID": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "REPO_ID" in result.stderr or "REPO_ID" in result.stdout
+    def test_missing_repository_id_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "REPO_ID": None})
+        assert code != 0
+        assert "REPO_ID" in output
 
     @pytest.mark.offline
     @pytest.mark.git
-    def test_missing_source_branch_exits(self):
-        result = _run_script(
-            env_override={"SOURCE_BRANCH": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "SOURCE_BRANCH" in result.stderr or "SOURCE_BRANCH" in result.stdout
+    def test_missing_source_branch_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "SOURCE_BRANCH": None})
+        assert code != 0
+        assert "SOURCE_BRANCH" in output
 
     @pytest.mark.offline
     @pytest.mark.git
-    def test_missing_target_branch_exits(self):
-        result = _run_script(
-            env_override={"TARGET_BRANCH": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "TARGET_BRANCH" in result.stderr or "TARGET_BRANCH" in result.stdout
+    def test_missing_target_branch_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "TARGET_BRANCH": None})
+        assert code != 0
+        assert "TARGET_BRANCH" in output
 
     @pytest.mark.offline
     @pytest.mark.git
-    def test_missing_pr_title_exits(self):
-        result = _run_script(
-            env_override={"PR_TITLE": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "PR_TITLE" in result.stderr or "PR_TITLE" in result.stdout
+    def test_missing_pr_title_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "PR_TITLE": None})
+        assert code != 0
+        assert "PR_TITLE" in output
 
 
 class TestCreatePullRequestURLAndAuth:
@@ -142,56 +89,39 @@ class TestCreatePullRequestURLAndAuth:
     @pytest.mark.offline
     @pytest.mark.git
     @responses.activate
-    def test_correct_url_and_auth_header(self):
-        """Verify the script builds the right URL and Authorization header."""
-        import base64
-
-        org = "testorg"
-        pat = "fakepat1234567890"
+    def test_correct_url_and_auth_header(self, ado_client, ado_env):
+        """Verify the operation builds the right URL and Authorization header."""
         expected_url = "https://dev.azure.com/testorg/a1b2c3d4-e5f6-7890-abcd-ef1234567890/_apis/git/repositories/test-value-repository_id/pullrequests?api-version=7.2"
-
         fixture = json.loads((FIXTURES / "create_pull_request_201.json").read_text())
         responses.add(responses.POST, expected_url, json=fixture, status=201)
 
-        import requests as req
-
-        cred = base64.b64encode(f":{pat}".encode("ascii")).decode("ascii")
-        headers = {
-            "Authorization": f"Basic {cred}",
-            "Content-Type": "application/json",
-        }
-        resp = req.post(expected_url, headers=headers, json={}, timeout=30)
-
-        assert resp.status_code == 201
+        assert create_pull_request(ado_client, ado_env["PROJECT_ID"], "test-value-repository_id", "test-value-source_branch", "test-value-target_branch", "test-value-pr_title") == fixture
         assert len(responses.calls) == 1
+        assert responses.calls[0].request.url == expected_url
         sent_auth = responses.calls[0].request.headers["Authorization"]
-        assert sent_auth.startswith("Basic ")
+        assert sent_auth == "Basic OmZha2VwYXQxMjM0NTY3ODkw"
 
 
 class TestCreatePullRequestHTTPErrors:
-    """Validate behaviour on error status codes."""
+    """Validate the typed error raised for error status codes."""
 
     @pytest.mark.offline
     @pytest.mark.git
     @responses.activate
-    def test_401_unauthorized(self):
+    def test_401_unauthorized(self, ado_client, ado_env):
         url = "https://dev.azure.com/testorg/a1b2c3d4-e5f6-7890-abcd-ef1234567890/_apis/git/repositories/test-value-repository_id/pullrequests?api-version=7.2"
         responses.add(responses.POST, url, json={"message": "unauthorized"}, status=401)
 
-        import requests as req
-
-        resp = req.post(url, headers={"Authorization": "Basic fake"}, json={}, timeout=30)
-        assert resp.status_code == 401
+        with pytest.raises(AdoAuthError):
+            create_pull_request(ado_client, ado_env["PROJECT_ID"], "test-value-repository_id", "test-value-source_branch", "test-value-target_branch", "test-value-pr_title")
 
     @pytest.mark.offline
     @pytest.mark.git
     @responses.activate
-    def test_404_not_found(self):
+    def test_404_not_found(self, ado_client, ado_env):
         url = "https://dev.azure.com/testorg/a1b2c3d4-e5f6-7890-abcd-ef1234567890/_apis/git/repositories/test-value-repository_id/pullrequests?api-version=7.2"
         responses.add(responses.POST, url, json={"message": "not_found"}, status=404)
 
-        import requests as req
-
-        resp = req.post(url, headers={"Authorization": "Basic fake"}, json={}, timeout=30)
-        assert resp.status_code == 404
+        with pytest.raises(AdoNotFound):
+            create_pull_request(ado_client, ado_env["PROJECT_ID"], "test-value-repository_id", "test-value-source_branch", "test-value-target_branch", "test-value-pr_title")
 
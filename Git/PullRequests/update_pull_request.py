@@ -10,54 +10,75 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/git/pull-requests/update?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-REPO_ID = get_env_or_exit("REPO_ID", "Repository name or GUID")
-PULL_REQUEST_ID = get_env_or_exit("PULL_REQUEST_ID", "Pull request ID (integer)")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_pull_request", PAT)
-logger.info("Update a pull request (title, description, status, etc.).")
+def update_pull_request(client, project: str, repository_id: str, pull_request_id: str) -> dict:
+    """
+    Update a pull request (title, description, status, etc.).
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/git/repositories/{REPO_ID}/pullrequests/{PULL_REQUEST_ID}", API_VERSION, project=PROJECT_ID)
-logger.info(f"PATCH {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        repository_id: Repository name or GUID
+        pull_request_id: Pull request ID (integer)
 
-response = execute_request("PATCH", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/pullrequests/{pull_request_id}", API_VERSION, project=project)
+    response = client.request("PATCH", url)
+    data = loads(response.content)
+    version_guard(data, ['pullRequestId', 'title'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['pullRequestId', 'title'], API_VERSION)
+async def update_pull_request_async(client, project: str, repository_id: str, pull_request_id: str) -> dict:
+    """Async variant of update_pull_request() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/pullrequests/{pull_request_id}", API_VERSION, project=project)
+    response = await client.request("PATCH", url)
+    data = loads(response.content)
+    version_guard(data, ['pullRequestId', 'title'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(f"PR #{data.get("pullRequestId", "N/A")} updated — status: {data.get("status", "N/A")}")
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call update_pull_request() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    repository_id = require_env("REPO_ID", "Repository name or GUID")
+    pull_request_id = require_env("PULL_REQUEST_ID", "Pull request ID (integer)")
+
+    logger = AdoLogger("update_pull_request", pat)
+    logger.info("Update a pull request (title, description, status, etc.).")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = update_pull_request(client, project, repository_id, pull_request_id)
+
+    print(f"PR #{data.get('pullRequestId', 'N/A')} updated — status: {data.get('status', 'N/A')}")
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,70 +11,92 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/git/pushes/create?
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-REPO_ID = get_env_or_exit("REPO_ID", "The name or ID of the repository.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Push changes to the repository.")
-parser.add_argument("--commits", required=False, help="commits")
-parser.add_argument("--ref-updates", required=False, help="refUpdates")
-parser.add_argument("--repository", required=False, help="repository")
-args = parser.parse_args()
+def create_pushes(client, project: str, repository_id: str, *, commits: Optional[str] = None, ref_updates: Optional[str] = None, repository: Optional[str] = None) -> dict:
+    """
+    Push changes to the repository.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        repository_id: The name or ID of the repository.
+        commits: commits
+        ref_updates: refUpdates
+        repository: repository
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "commits": commits,
+        "refUpdates": ref_updates,
+        "repository": repository,
+    }
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/pushes", API_VERSION, project=project)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['commits', 'refUpdates'], API_VERSION)
+    return data
+
+
+async def create_pushes_async(client, project: str, repository_id: str, *, commits: Optional[str] = None, ref_updates: Optional[str] = None, repository: Optional[str] = None) -> dict:
+    """Async variant of create_pushes() for use with AsyncAdoClient."""
+    body = {
+        "commits": commits,
+        "refUpdates": ref_updates,
+        "repository": repository,
+    }
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/pushes", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['commits', 'refUpdates'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_pushes", PAT)
-logger.info("Push changes to the repository.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "commits": args.commits,
-    "refUpdates": args.ref_updates,
-    "repository": args.repository,
-}
+def main() -> None:
+    """Read env vars / flags, call create_pushes() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    repository_id = require_env("REPO_ID", "The name or ID of the repository.")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/git/repositories/{REPO_ID}/pushes", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Push changes to the repository.")
+    parser.add_argument("--commits", required=False, help="commits")
+    parser.add_argument("--ref-updates", required=False, help="refUpdates")
+    parser.add_argument("--repository", required=False, help="repository")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_pushes", pat)
+    logger.info("Push changes to the repository.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_pushes(client, project, repository_id, commits=args.commits, ref_updates=args.ref_updates, repository=args.repository)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['commits', 'refUpdates'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
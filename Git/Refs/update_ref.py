@@ -11,75 +11,101 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/git/refs/update-re
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-REPO_ID = get_env_or_exit("REPO_ID", "The name or ID of the repository.")
-FILTER = get_env_or_exit("FILTER", "The name of the branch to lock/unlock")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Lock or Unlock a branch.")
-parser.add_argument("--is-locked", required=False, help="isLocked")
-parser.add_argument("--name", required=False, help="name")
-parser.add_argument("--new-object-id", required=False, help="newObjectId")
-parser.add_argument("--old-object-id", required=False, help="oldObjectId")
-args = parser.parse_args()
+def update_ref(client, project: str, repository_id: str, filter: str, *, is_locked: Optional[str] = None, name: Optional[str] = None, new_object_id: Optional[str] = None, old_object_id: Optional[str] = None) -> dict:
+    """
+    Lock or Unlock a branch.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        repository_id: The name or ID of the repository.
+        filter: The name of the branch to lock/unlock
+        is_locked: isLocked
+        name: name
+        new_object_id: newObjectId
+        old_object_id: oldObjectId
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "isLocked": is_locked,
+        "name": name,
+        "newObjectId": new_object_id,
+        "oldObjectId": old_object_id,
+        "repositoryId": repository_id,
+    }
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/refs", API_VERSION, project=project)
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['name', 'creator'], API_VERSION)
+    return data
+
+
+async def update_ref_async(client, project: str, repository_id: str, filter: str, *, is_locked: Optional[str] = None, name: Optional[str] = None, new_object_id: Optional[str] = None, old_object_id: Optional[str] = None) -> dict:
+    """Async variant of update_ref() for use with AsyncAdoClient."""
+    body = {
+        "isLocked": is_locked,
+        "name": name,
+        "newObjectId": new_object_id,
+        "oldObjectId": old_object_id,
+        "repositoryId": repository_id,
+    }
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/refs", API_VERSION, project=project)
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['name', 'creator'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_ref", PAT)
-logger.info("Lock or Unlock a branch.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "isLocked": args.is_locked,
-    "name": args.name,
-    "newObjectId": args.new_object_id,
-    "oldObjectId": args.old_object_id,
-    "repositoryId": REPO_ID,
-}
+def main() -> None:
+    """Read env vars / flags, call update_ref() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    repository_id = require_env("REPO_ID", "The name or ID of the repository.")
+    filter = require_env("FILTER", "The name of the branch to lock/unlock")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/git/repositories/{REPO_ID}/refs", API_VERSION, project=PROJECT_ID)
-logger.info(f"PATCH {url}")
+    parser = argparse.ArgumentParser(description="Lock or Unlock a branch.")
+    parser.add_argument("--is-locked", required=False, help="isLocked")
+    parser.add_argument("--name", required=False, help="name")
+    parser.add_argument("--new-object-id", required=False, help="newObjectId")
+    parser.add_argument("--old-object-id", required=False, help="oldObjectId")
+    args = parser.parse_args()
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+    logger = AdoLogger("update_ref", pat)
+    logger.info("Lock or Unlock a branch.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_ref(client, project, repository_id, filter, is_locked=args.is_locked, name=args.name, new_object_id=args.new_object_id, old_object_id=args.old_object_id)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['name', 'creator'], API_VERSION)
+    print(f"Refs: {data.get('name', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Refs: {data.get("name", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,74 +11,99 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/git/refs-favorites
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Creates a ref favorite")
-parser.add_argument("--id", required=False, help="id")
-parser.add_argument("--identity-id", required=False, help="identityId")
-parser.add_argument("--name", required=False, help="name")
-parser.add_argument("--repository-id", required=False, help="repositoryId")
-parser.add_argument("--type", required=False, help="type")
-args = parser.parse_args()
+def create_refs_favorites(client, project: str, *, id: Optional[str] = None, identity_id: Optional[str] = None, name: Optional[str] = None, repository_id: Optional[str] = None, type: Optional[str] = None) -> dict:
+    """
+    Creates a ref favorite
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        id: id
+        identity_id: identityId
+        name: name
+        repository_id: repositoryId
+        type: type
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "id": id,
+        "identityId": identity_id,
+        "name": name,
+        "repositoryId": repository_id,
+        "type": type,
+    }
+    url = build_url(client.organization, f"_apis/git/favorites/refs", API_VERSION, project=project)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name'], API_VERSION)
+    return data
+
+
+async def create_refs_favorites_async(client, project: str, *, id: Optional[str] = None, identity_id: Optional[str] = None, name: Optional[str] = None, repository_id: Optional[str] = None, type: Optional[str] = None) -> dict:
+    """Async variant of create_refs_favorites() for use with AsyncAdoClient."""
+    body = {
+        "id": id,
+        "identityId": identity_id,
+        "name": name,
+        "repositoryId": repository_id,
+        "type": type,
+    }
+    url = build_url(client.organization, f"_apis/git/favorites/refs", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_refs_favorites", PAT)
-logger.info("Creates a ref favorite")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "id": args.id,
-    "identityId": args.identity_id,
-    "name": args.name,
-    "repositoryId": args.repository_id,
-    "type": args.type,
-}
+def main() -> None:
+    """Read env vars / flags, call create_refs_favorites() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/git/favorites/refs", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Creates a ref favorite")
+    parser.add_argument("--id", required=False, help="id")
+    parser.add_argument("--identity-id", required=False, help="identityId")
+    parser.add_argument("--name", required=False, help="name")
+    parser.add_argument("--repository-id", required=False, help="repositoryId")
+    parser.add_argument("--type", required=False, help="type")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_refs_favorites", pat)
+    logger.info("Creates a ref favorite")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_refs_favorites(client, project, id=args.id, identity_id=args.identity_id, name=args.name, repository_id=args.repository_id, type=args.type)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'name'], API_VERSION)
+    print(f"Refs Favorites: {data.get('name', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Refs Favorites: {data.get("name", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
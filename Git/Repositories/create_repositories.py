@@ -11,70 +11,91 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/git/repositories/c
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Create a git repository in a team project.")
-parser.add_argument("--name", required=False, help="name")
-parser.add_argument("--parent-repository", required=False, help="parentRepository")
-parser.add_argument("--project", required=False, help="project")
-args = parser.parse_args()
+def create_repositories(client, project: str, *, name: Optional[str] = None, parent_repository: Optional[str] = None, project_value: Optional[str] = None) -> dict:
+    """
+    Create a git repository in a team project.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        name: name
+        parent_repository: parentRepository
+        project_value: project
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "name": name,
+        "parentRepository": parent_repository,
+        "project": project_value,
+    }
+    url = build_url(client.organization, f"_apis/git/repositories", API_VERSION, project=project)
+    response = client.request("POST", url, body=body, expected_status=201)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name'], API_VERSION)
+    return data
+
+
+async def create_repositories_async(client, project: str, *, name: Optional[str] = None, parent_repository: Optional[str] = None, project_value: Optional[str] = None) -> dict:
+    """Async variant of create_repositories() for use with AsyncAdoClient."""
+    body = {
+        "name": name,
+        "parentRepository": parent_repository,
+        "project": project_value,
+    }
+    url = build_url(client.organization, f"_apis/git/repositories", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body, expected_status=201)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_repositories", PAT)
-logger.info("Create a git repository in a team project.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "name": args.name,
-    "parentRepository": args.parent_repository,
-    "project": args.project,
-}
+def main() -> None:
+    """Read env vars / flags, call create_repositories() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/git/repositories", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Create a git repository in a team project.")
+    parser.add_argument("--name", required=False, help="name")
+    parser.add_argument("--parent-repository", required=False, help="parentRepository")
+    parser.add_argument("--project", required=False, help="project")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body, expected_status=201)
+    logger = AdoLogger("create_repositories", pat)
+    logger.info("Create a git repository in a team project.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_repositories(client, project, name=args.name, parent_repository=args.parent_repository, project_value=args.project)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'name'], API_VERSION)
+    print(f"Repositories: {data.get('name', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Repositories: {data.get("name", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
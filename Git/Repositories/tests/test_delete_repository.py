@@ -11,9 +11,6 @@ Validates:
 """
 
 import json
-import os
-import subprocess
-import sys
 from pathlib import Path
 
 import pytest
@@ -29,32 +26,10 @@ PROJECT_ID = "ProjectAlpha"
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _run_script(env_override=None, expect_fail=False):
-    """Run delete_repository.py as a subprocess with the given env."""
-    env = {
-        "AZURE_DEVOPS_ORG": "testorg",
-        "AZURE_DEVOPS_PAT": "fakepat1234567890",
-        "PROJECT_ID": PROJECT_ID,
-        "REPO_ID": REPO_GUID,
-        "PATH": os.environ.get("PATH", ""),
-    }
-    if env_override:
-        env.update(env_override)
-    env = {k: v for k, v in env.items() if v is not None}
-
-    result = subprocess.run(
-        [sys.executable, SCRIPT],
-        capture_output=True,
-        text=True,
-        env=env,
-        timeout=30,
-    )
-    if not expect_fail:
-        assert result.returncode == 0, (
-            f"Script failed (rc={result.returncode}):\n"
-            f"STDOUT: {result.stdout}\nSTDERR: {result.stderr}"
-        )
-    return result
+ENV = {
+    "PROJECT_ID": PROJECT_ID,
+    "REPO_ID": REPO_GUID,
+}
 
 
 # ---------------------------------------------------------------------------
@@ -67,31 +42,31 @@ class TestDeleteRepoEnvValidation:
 
     @pytest.mark.offline
     @pytest.mark.git
-    def test_missing_org_exits(self):
-        result = _run_script(env_override={"AZURE_DEVOPS_ORG": None}, expect_fail=True)
-        assert result.returncode != 0
-        assert "AZURE_DEVOPS_ORG" in (result.stderr + result.stdout)
+    def test_missing_org_exits(self, run_main):
+        code, output = run_main(SCRIPT, env={**ENV, "AZURE_DEVOPS_ORG": None})
+        assert code != 0
+        assert "AZURE_DEVOPS_ORG" in output
 
     @pytest.mark.offline
     @pytest.mark.git
-    def test_missing_pat_exits(self):
-        result = _run_script(env_override={"AZURE_DEVOPS_PAT": None}, expect_fail=True)
-        assert result.returncode != 0
-        assert "AZURE_DEVOPS_PAT" in (result.stderr + result.stdout)
+    def test_missing_pat_exits(self, run_main):
+        code, output = run_main(SCRIPT, env={**ENV, "AZURE_DEVOPS_PAT": None})
+        assert code != 0
+        assert "AZURE_DEVOPS_PAT" in output
 
     @pytest.mark.offline
     @pytest.mark.git
-    def test_missing_project_id_exits(self):
-        result = _run_script(env_override={"PROJECT_ID": None}, expect_fail=True)
-        assert result.returncode != 0
-        assert "PROJECT_ID" in (result.stderr + result.stdout)
+    def test_missing_project_id_exits(self, run_main):
+        code, output = run_main(SCRIPT, env={**ENV, "PROJECT_ID": None})
+        assert code != 0
+        assert "PROJECT_ID" in output
 
     @pytest.mark.offline
     @pytest.mark.git
-    def test_missing_repo_id_exits(self):
-        result = _run_script(env_override={"REPO_ID": None}, expect_fail=True)
-        assert result.returncode != 0
-        assert "REPO_ID" in (result.stderr + result.stdout)
+    def test_missing_repo_id_exits(self, run_main):
+        code, output = run_main(SCRIPT, env={**ENV, "REPO_ID": None})
+        assert code != 0
+        assert "REPO_ID" in output
 
 
 class TestDeleteRepoURLAndMethod:
@@ -11,75 +11,101 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/git/repositories/u
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-REPO_ID = get_env_or_exit("REPO_ID", "The ID of the repository.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Updates the Git repository with either a new repo name or a new default branch.")
-parser.add_argument("--creation-date", required=False, help="The timestamp when the repository was created.")
-parser.add_argument("--default-branch", required=False, help="defaultBranch")
-parser.add_argument("--id", required=False, help="id")
-parser.add_argument("--is-disabled", required=False, help="True if the repository is disabled. False otherwise.")
-parser.add_argument("--is-fork", required=False, help="True if the repository was created as a fork.")
-args = parser.parse_args()
+def update_repositories(client, project: str, repository_id: str, *, creation_date: Optional[str] = None, default_branch: Optional[str] = None, id: Optional[str] = None, is_disabled: Optional[str] = None, is_fork: Optional[str] = None) -> dict:
+    """
+    Updates the Git repository with either a new repo name or a new default branch.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        repository_id: The ID of the repository.
+        creation_date: The timestamp when the repository was created.
+        default_branch: defaultBranch
+        id: id
+        is_disabled: True if the repository is disabled. False otherwise.
+        is_fork: True if the repository was created as a fork.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "creationDate": creation_date,
+        "defaultBranch": default_branch,
+        "id": id,
+        "isDisabled": is_disabled,
+        "isFork": is_fork,
+    }
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}", API_VERSION, project=project)
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name'], API_VERSION)
+    return data
+
+
+async def update_repositories_async(client, project: str, repository_id: str, *, creation_date: Optional[str] = None, default_branch: Optional[str] = None, id: Optional[str] = None, is_disabled: Optional[str] = None, is_fork: Optional[str] = None) -> dict:
+    """Async variant of update_repositories() for use with AsyncAdoClient."""
+    body = {
+        "creationDate": creation_date,
+        "defaultBranch": default_branch,
+        "id": id,
+        "isDisabled": is_disabled,
+        "isFork": is_fork,
+    }
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}", API_VERSION, project=project)
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_repositories", PAT)
-logger.info("Updates the Git repository with either a new repo name or a new default branch.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "creationDate": args.creation_date,
-    "defaultBranch": args.default_branch,
-    "id": args.id,
-    "isDisabled": args.is_disabled,
-    "isFork": args.is_fork,
-}
+def main() -> None:
+    """Read env vars / flags, call update_repositories() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    repository_id = require_env("REPO_ID", "The ID of the repository.")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/git/repositories/{REPO_ID}", API_VERSION, project=PROJECT_ID)
-logger.info(f"PATCH {url}")
+    parser = argparse.ArgumentParser(description="Updates the Git repository with either a new repo name or a new default branch.")
+    parser.add_argument("--creation-date", required=False, help="The timestamp when the repository was created.")
+    parser.add_argument("--default-branch", required=False, help="defaultBranch")
+    parser.add_argument("--id", required=False, help="id")
+    parser.add_argument("--is-disabled", required=False, help="True if the repository is disabled. False otherwise.")
+    parser.add_argument("--is-fork", required=False, help="True if the repository was created as a fork.")
+    args = parser.parse_args()
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+    logger = AdoLogger("update_repositories", pat)
+    logger.info("Updates the Git repository with either a new repo name or a new default branch.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_repositories(client, project, repository_id, creation_date=args.creation_date, default_branch=args.default_branch, id=args.id, is_disabled=args.is_disabled, is_fork=args.is_fork)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'name'], API_VERSION)
+    print(f"Repositories: {data.get('name', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Repositories: {data.get("name", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
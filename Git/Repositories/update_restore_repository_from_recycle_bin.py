@@ -11,67 +11,85 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/git/repositories/r
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-REPO_ID = get_env_or_exit("REPO_ID", "The ID of the repository.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Recover a soft-deleted Git repository.")
-parser.add_argument("--deleted", required=False, help="Setting to false will undo earlier deletion and restore the repository.")
-args = parser.parse_args()
+def update_restore_repository_from_recycle_bin(client, project: str, repository_id: str, *, deleted: Optional[str] = None) -> dict:
+    """
+    Recover a soft-deleted Git repository.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        repository_id: The ID of the repository.
+        deleted: Setting to false will undo earlier deletion and restore the repository.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "deleted": deleted,
+    }
+    url = build_url(client.organization, f"_apis/git/recycleBin/repositories/{repository_id}", API_VERSION, project=project)
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name'], API_VERSION)
+    return data
+
+
+async def update_restore_repository_from_recycle_bin_async(client, project: str, repository_id: str, *, deleted: Optional[str] = None) -> dict:
+    """Async variant of update_restore_repository_from_recycle_bin() for use with AsyncAdoClient."""
+    body = {
+        "deleted": deleted,
+    }
+    url = build_url(client.organization, f"_apis/git/recycleBin/repositories/{repository_id}", API_VERSION, project=project)
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_restore_repository_from_recycle_bin", PAT)
-logger.info("Recover a soft-deleted Git repository.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "deleted": args.deleted,
-}
+def main() -> None:
+    """Read env vars / flags, call update_restore_repository_from_recycle_bin() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    repository_id = require_env("REPO_ID", "The ID of the repository.")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/git/recycleBin/repositories/{REPO_ID}", API_VERSION, project=PROJECT_ID)
-logger.info(f"PATCH {url}")
+    parser = argparse.ArgumentParser(description="Recover a soft-deleted Git repository.")
+    parser.add_argument("--deleted", required=False, help="Setting to false will undo earlier deletion and restore the repository.")
+    args = parser.parse_args()
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+    logger = AdoLogger("update_restore_repository_from_recycle_bin", pat)
+    logger.info("Recover a soft-deleted Git repository.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_restore_repository_from_recycle_bin(client, project, repository_id, deleted=args.deleted)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'name'], API_VERSION)
+    print(f"Repositories: {data.get('name', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Repositories: {data.get("name", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
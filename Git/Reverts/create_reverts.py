@@ -11,72 +11,96 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/git/reverts/create
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-REPO_ID = get_env_or_exit("REPO_ID", "ID of the repository.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Starts the operation to create a new branch which reverts changes introduced by either a specific commit or commits t...")
-parser.add_argument("--generated-ref-name", required=False, help="Proposed target branch name for the cherry pick or revert operation.")
-parser.add_argument("--onto-ref-name", required=False, help="The target branch for the cherry pick or revert operation.")
-parser.add_argument("--repository", required=False, help="The git repository for the cherry pick or revert operation.")
-parser.add_argument("--source", required=False, help="Details about the source of the cherry pick or revert operation (e.g. A pull request or a specifi...")
-args = parser.parse_args()
+def create_reverts(client, project: str, repository_id: str, *, generated_ref_name: Optional[str] = None, onto_ref_name: Optional[str] = None, repository: Optional[str] = None, source: Optional[str] = None) -> dict:
+    """
+    Starts the operation to create a new branch which reverts changes introduced by either a specific commit or commits t...
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        repository_id: ID of the repository.
+        generated_ref_name: Proposed target branch name for the cherry pick or revert operation.
+        onto_ref_name: The target branch for the cherry pick or revert operation.
+        repository: The git repository for the cherry pick or revert operation.
+        source: Details about the source of the cherry pick or revert operation (e.g. A pull request or a specifi...
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "generatedRefName": generated_ref_name,
+        "ontoRefName": onto_ref_name,
+        "repository": repository,
+        "source": source,
+    }
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/reverts", API_VERSION, project=project)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['revertId'], API_VERSION)
+    return data
+
+
+async def create_reverts_async(client, project: str, repository_id: str, *, generated_ref_name: Optional[str] = None, onto_ref_name: Optional[str] = None, repository: Optional[str] = None, source: Optional[str] = None) -> dict:
+    """Async variant of create_reverts() for use with AsyncAdoClient."""
+    body = {
+        "generatedRefName": generated_ref_name,
+        "ontoRefName": onto_ref_name,
+        "repository": repository,
+        "source": source,
+    }
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/reverts", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['revertId'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_reverts", PAT)
-logger.info("Starts the operation to create a new branch which reverts changes introduced by either a specific commit or commits t...")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "generatedRefName": args.generated_ref_name,
-    "ontoRefName": args.onto_ref_name,
-    "repository": args.repository,
-    "source": args.source,
-}
+def main() -> None:
+    """Read env vars / flags, call create_reverts() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    repository_id = require_env("REPO_ID", "ID of the repository.")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/git/repositories/{REPO_ID}/reverts", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Starts the operation to create a new branch which reverts changes introduced by either a specific commit or commits t...")
+    parser.add_argument("--generated-ref-name", required=False, help="Proposed target branch name for the cherry pick or revert operation.")
+    parser.add_argument("--onto-ref-name", required=False, help="The target branch for the cherry pick or revert operation.")
+    parser.add_argument("--repository", required=False, help="The git repository for the cherry pick or revert operation.")
+    parser.add_argument("--source", required=False, help="Details about the source of the cherry pick or revert operation (e.g. A pull request or a specifi...")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_reverts", pat)
+    logger.info("Starts the operation to create a new branch which reverts changes introduced by either a specific commit or commits t...")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_reverts(client, project, repository_id, generated_ref_name=args.generated_ref_name, onto_ref_name=args.onto_ref_name, repository=args.repository, source=args.source)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['revertId'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
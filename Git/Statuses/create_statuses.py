@@ -11,76 +11,103 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/git/statuses/creat
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-COMMIT_ID = get_env_or_exit("COMMIT_ID", "ID of the Git commit.")
-REPO_ID = get_env_or_exit("REPO_ID", "ID of the repository.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Create Git commit status.")
-parser.add_argument("--context", required=False, help="Context of the status.")
-parser.add_argument("--created-by", required=False, help="Identity that created the status.")
-parser.add_argument("--creation-date", required=False, help="Creation date and time of the status.")
-parser.add_argument("--description", required=False, help="Status description. Typically describes current state of the status.")
-parser.add_argument("--id", required=False, help="Status identifier.")
-args = parser.parse_args()
+def create_statuses(client, project: str, commit_id: str, repository_id: str, *, context: Optional[str] = None, created_by: Optional[str] = None, creation_date: Optional[str] = None, description: Optional[str] = None, id: Optional[str] = None) -> dict:
+    """
+    Create Git commit status.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        commit_id: ID of the Git commit.
+        repository_id: ID of the repository.
+        context: Context of the status.
+        created_by: Identity that created the status.
+        creation_date: Creation date and time of the status.
+        description: Status description. Typically describes current state of the status.
+        id: Status identifier.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "context": context,
+        "createdBy": created_by,
+        "creationDate": creation_date,
+        "description": description,
+        "id": id,
+    }
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/commits/{commit_id}/statuses", API_VERSION, project=project)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'context'], API_VERSION)
+    return data
+
+
+async def create_statuses_async(client, project: str, commit_id: str, repository_id: str, *, context: Optional[str] = None, created_by: Optional[str] = None, creation_date: Optional[str] = None, description: Optional[str] = None, id: Optional[str] = None) -> dict:
+    """Async variant of create_statuses() for use with AsyncAdoClient."""
+    body = {
+        "context": context,
+        "createdBy": created_by,
+        "creationDate": creation_date,
+        "description": description,
+        "id": id,
+    }
+    url = build_url(client.organization, f"_apis/git/repositories/{repository_id}/commits/{commit_id}/statuses", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'context'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_statuses", PAT)
-logger.info("Create Git commit status.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "context": args.context,
-    "createdBy": args.created_by,
-    "creationDate": args.creation_date,
-    "description": args.description,
-    "id": args.id,
-}
+def main() -> None:
+    """Read env vars / flags, call create_statuses() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    commit_id = require_env("COMMIT_ID", "ID of the Git commit.")
+    repository_id = require_env("REPO_ID", "ID of the repository.")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/git/repositories/{REPO_ID}/commits/{COMMIT_ID}/statuses", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Create Git commit status.")
+    parser.add_argument("--context", required=False, help="Context of the status.")
+    parser.add_argument("--created-by", required=False, help="Identity that created the status.")
+    parser.add_argument("--creation-date", required=False, help="Creation date and time of the status.")
+    parser.add_argument("--description", required=False, help="Status description. Typically describes current state of the status.")
+    parser.add_argument("--id", required=False, help="Status identifier.")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_statuses", pat)
+    logger.info("Create Git commit status.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_statuses(client, project, commit_id, repository_id, context=args.context, created_by=args.created_by, creation_date=args.creation_date, description=args.description, id=args.id)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'context'], API_VERSION)
+    print(f"Statuses ID: {data.get('id', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Statuses ID: {data.get("id", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,66 +11,92 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/graph/avatars/set-
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-SUBJECT_DESCRIPTOR = get_env_or_exit("SUBJECT_DESCRIPTOR", "subjectDescriptor")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Set Avatar for Avatars")
-parser.add_argument("--is-auto-generated", required=False, help="isAutoGenerated")
-parser.add_argument("--size", required=False, help="size")
-parser.add_argument("--time-stamp", required=False, help="timeStamp")
-parser.add_argument("--value", required=False, help="value")
-args = parser.parse_args()
+def set_avatar(client, subject_descriptor: str, *, is_auto_generated: Optional[str] = None, size: Optional[str] = None, time_stamp: Optional[str] = None, value: Optional[str] = None) -> dict:
+    """
+    Set Avatar for Avatars
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("set_avatar", PAT)
-logger.info("Set Avatar for Avatars")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        subject_descriptor: subjectDescriptor
+        is_auto_generated: isAutoGenerated
+        size: size
+        time_stamp: timeStamp
+        value: value
 
-# ---------------------------------------------------------------------------
-# Request body
-# ---------------------------------------------------------------------------
-body = {
-    "isAutoGenerated": args.is_auto_generated,
-    "size": args.size,
-    "timeStamp": args.time_stamp,
-    "value": args.value,
-}
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "isAutoGenerated": is_auto_generated,
+        "size": size,
+        "timeStamp": time_stamp,
+        "value": value,
+    }
+    url = build_url(client.organization, f"_apis/graph/Subjects/{subject_descriptor}/avatars", API_VERSION, base_host="vssps.dev.azure.com")
+    response = client.request("PUT", url, body=body)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/graph/Subjects/{SUBJECT_DESCRIPTOR}/avatars", API_VERSION, base_host="vssps.dev.azure.com")
-logger.info(f"PUT {url}")
 
-response = execute_request("PUT", url, HEADERS, body=body)
+async def set_avatar_async(client, subject_descriptor: str, *, is_auto_generated: Optional[str] = None, size: Optional[str] = None, time_stamp: Optional[str] = None, value: Optional[str] = None) -> dict:
+    """Async variant of set_avatar() for use with AsyncAdoClient."""
+    body = {
+        "isAutoGenerated": is_auto_generated,
+        "size": size,
+        "timeStamp": time_stamp,
+        "value": value,
+    }
+    url = build_url(client.organization, f"_apis/graph/Subjects/{subject_descriptor}/avatars", API_VERSION, base_host="vssps.dev.azure.com")
+    response = await client.request("PUT", url, body=body)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call set_avatar() and print the result."""
+    organization, pat = get_common_env()
+    subject_descriptor = require_env("SUBJECT_DESCRIPTOR", "subjectDescriptor")
+
+    parser = argparse.ArgumentParser(description="Set Avatar for Avatars")
+    parser.add_argument("--is-auto-generated", required=False, help="isAutoGenerated")
+    parser.add_argument("--size", required=False, help="size")
+    parser.add_argument("--time-stamp", required=False, help="timeStamp")
+    parser.add_argument("--value", required=False, help="value")
+    args = parser.parse_args()
+
+    logger = AdoLogger("set_avatar", pat)
+    logger.info("Set Avatar for Avatars")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = set_avatar(client, subject_descriptor, is_auto_generated=args.is_auto_generated, size=args.size, time_stamp=args.time_stamp, value=args.value)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
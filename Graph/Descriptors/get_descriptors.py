@@ -10,51 +10,82 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/graph/descriptors/get?view=azure-devops-rest-7.2
 """
 
-import json
+import argparse
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-STORAGE_KEY = get_env_or_exit("STORAGE_KEY", "Storage key of the subject (user, group, scope, etc.) to resolve")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_descriptors", PAT)
-logger.info("Resolve a storage key to a descriptor")
+def get_descriptors(client, storage_key: str) -> dict:
+    """
+    Resolve a storage key to a descriptor
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/graph/descriptors/{STORAGE_KEY}", API_VERSION, base_host="vssps.dev.azure.com")
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        storage_key: Storage key of the subject (user, group, scope, etc.) to resolve
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/graph/descriptors/{storage_key}", API_VERSION, base_host="vssps.dev.azure.com")
+    response = client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['value'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['value'], API_VERSION)
+async def get_descriptors_async(client, storage_key: str) -> dict:
+    """Async variant of get_descriptors() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/graph/descriptors/{storage_key}", API_VERSION, base_host="vssps.dev.azure.com")
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['value'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_descriptors() and print the result."""
+    organization, pat = get_common_env()
+    storage_key = require_env("STORAGE_KEY", "Storage key of the subject (user, group, scope, etc.) to resolve")
+
+    parser = argparse.ArgumentParser(description="Resolve a storage key to a descriptor")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("get_descriptors", pat)
+    logger.info("Resolve a storage key to a descriptor")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        items = items_of(get_descriptors(client, storage_key), "value")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    data = get_descriptors(client, storage_key)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,51 +10,70 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/graph/groups/update?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-GROUP_DESCRIPTOR = get_env_or_exit("GROUP_DESCRIPTOR", "The descriptor of the group to modify.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_groups", PAT)
-logger.info("Update the properties of an Azure DevOps group.")
+def update_groups(client, group_descriptor: str) -> dict:
+    """
+    Update the properties of an Azure DevOps group.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/graph/groups/{GROUP_DESCRIPTOR}", API_VERSION, base_host="vssps.dev.azure.com")
-logger.info(f"PATCH {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        group_descriptor: The descriptor of the group to modify.
 
-response = execute_request("PATCH", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/graph/groups/{group_descriptor}", API_VERSION, base_host="vssps.dev.azure.com")
+    response = client.request("PATCH", url)
+    data = loads(response.content)
+    version_guard(data, ['description'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['description'], API_VERSION)
+async def update_groups_async(client, group_descriptor: str) -> dict:
+    """Async variant of update_groups() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/graph/groups/{group_descriptor}", API_VERSION, base_host="vssps.dev.azure.com")
+    response = await client.request("PATCH", url)
+    data = loads(response.content)
+    version_guard(data, ['description'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call update_groups() and print the result."""
+    organization, pat = get_common_env()
+    group_descriptor = require_env("GROUP_DESCRIPTOR", "The descriptor of the group to modify.")
+
+    logger = AdoLogger("update_groups", pat)
+    logger.info("Update the properties of an Azure DevOps group.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = update_groups(client, group_descriptor)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
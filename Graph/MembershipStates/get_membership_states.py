@@ -10,51 +10,70 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/graph/membership-states/get?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-SUBJECT_DESCRIPTOR = get_env_or_exit("SUBJECT_DESCRIPTOR", "Descriptor of the subject (user, group, scope, etc.) to check state of")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_membership_states", PAT)
-logger.info("Check whether a subject is active or inactive.")
+def get_membership_states(client, subject_descriptor: str) -> dict:
+    """
+    Check whether a subject is active or inactive.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/graph/membershipstates/{SUBJECT_DESCRIPTOR}", API_VERSION, base_host="vssps.dev.azure.com")
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        subject_descriptor: Descriptor of the subject (user, group, scope, etc.) to check state of
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/graph/membershipstates/{subject_descriptor}", API_VERSION, base_host="vssps.dev.azure.com")
+    response = client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['active'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['active'], API_VERSION)
+async def get_membership_states_async(client, subject_descriptor: str) -> dict:
+    """Async variant of get_membership_states() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/graph/membershipstates/{subject_descriptor}", API_VERSION, base_host="vssps.dev.azure.com")
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['active'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_membership_states() and print the result."""
+    organization, pat = get_common_env()
+    subject_descriptor = require_env("SUBJECT_DESCRIPTOR", "Descriptor of the subject (user, group, scope, etc.) to check state of")
+
+    logger = AdoLogger("get_membership_states", pat)
+    logger.info("Check whether a subject is active or inactive.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = get_membership_states(client, subject_descriptor)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
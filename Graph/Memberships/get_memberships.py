@@ -10,52 +10,72 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/graph/memberships/get?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-SUBJECT_DESCRIPTOR = get_env_or_exit("SUBJECT_DESCRIPTOR", "A descriptor to the child subject in the relationship.")
-CONTAINER_DESCRIPTOR = get_env_or_exit("CONTAINER_DESCRIPTOR", "A descriptor to the container in the relationship.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_memberships", PAT)
-logger.info("Get a membership relationship between a container and subject.")
+def get_memberships(client, subject_descriptor: str, container_descriptor: str) -> dict:
+    """
+    Get a membership relationship between a container and subject.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/graph/memberships/{SUBJECT_DESCRIPTOR}/{CONTAINER_DESCRIPTOR}", API_VERSION, base_host="vssps.dev.azure.com")
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        subject_descriptor: A descriptor to the child subject in the relationship.
+        container_descriptor: A descriptor to the container in the relationship.
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/graph/memberships/{subject_descriptor}/{container_descriptor}", API_VERSION, base_host="vssps.dev.azure.com")
+    response = client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['containerDescriptor', 'memberDescriptor'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['containerDescriptor', 'memberDescriptor'], API_VERSION)
+async def get_memberships_async(client, subject_descriptor: str, container_descriptor: str) -> dict:
+    """Async variant of get_memberships() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/graph/memberships/{subject_descriptor}/{container_descriptor}", API_VERSION, base_host="vssps.dev.azure.com")
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['containerDescriptor', 'memberDescriptor'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_memberships() and print the result."""
+    organization, pat = get_common_env()
+    subject_descriptor = require_env("SUBJECT_DESCRIPTOR", "A descriptor to the child subject in the relationship.")
+    container_descriptor = require_env("CONTAINER_DESCRIPTOR", "A descriptor to the container in the relationship.")
+
+    logger = AdoLogger("get_memberships", pat)
+    logger.info("Get a membership relationship between a container and subject.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = get_memberships(client, subject_descriptor, container_descriptor)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,69 +11,98 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/graph/request-acce
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Request Access for Request Access")
-parser.add_argument("--first", required=False, help="Get the first child token of this token.")
-parser.add_argument("--has-values", required=False, help="Gets a value indicating whether this token has child tokens.")
-parser.add_argument("--item", required=False, help="item")
-parser.add_argument("--last", required=False, help="Get the last child token of this token.")
-parser.add_argument("--next", required=False, help="Gets the next sibling token of this node.")
-parser.add_argument("--parent", required=False, help="Gets or sets the parent.")
-args = parser.parse_args()
+def create_request_access(client, *, first: Optional[str] = None, has_values: Optional[str] = None, item: Optional[str] = None, last: Optional[str] = None, next: Optional[str] = None, parent: Optional[str] = None) -> dict:
+    """
+    Request Access for Request Access
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_request_access", PAT)
-logger.info("Request Access for Request Access")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        first: Get the first child token of this token.
+        has_values: Gets a value indicating whether this token has child tokens.
+        item: item
+        last: Get the last child token of this token.
+        next: Gets the next sibling token of this node.
+        parent: Gets or sets the parent.
 
-# ---------------------------------------------------------------------------
-# Request body
-# ---------------------------------------------------------------------------
-body = {
-    "first": args.first,
-    "hasValues": args.has_values,
-    "item": args.item,
-    "last": args.last,
-    "next": args.next,
-    "parent": args.parent,
-}
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "first": first,
+        "hasValues": has_values,
+        "item": item,
+        "last": last,
+        "next": next,
+        "parent": parent,
+    }
+    url = build_url(client.organization, f"_apis/graph/requestaccess", API_VERSION, base_host="vssps.dev.azure.com")
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/graph/requestaccess", API_VERSION, base_host="vssps.dev.azure.com")
-logger.info(f"POST {url}")
 
-response = execute_request("POST", url, HEADERS, body=body)
+async def create_request_access_async(client, *, first: Optional[str] = None, has_values: Optional[str] = None, item: Optional[str] = None, last: Optional[str] = None, next: Optional[str] = None, parent: Optional[str] = None) -> dict:
+    """Async variant of create_request_access() for use with AsyncAdoClient."""
+    body = {
+        "first": first,
+        "hasValues": has_values,
+        "item": item,
+        "last": last,
+        "next": next,
+        "parent": parent,
+    }
+    url = build_url(client.organization, f"_apis/graph/requestaccess", API_VERSION, base_host="vssps.dev.azure.com")
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call create_request_access() and print the result."""
+    organization, pat = get_common_env()
+
+    parser = argparse.ArgumentParser(description="Request Access for Request Access")
+    parser.add_argument("--first", required=False, help="Get the first child token of this token.")
+    parser.add_argument("--has-values", required=False, help="Gets a value indicating whether this token has child tokens.")
+    parser.add_argument("--item", required=False, help="item")
+    parser.add_argument("--last", required=False, help="Get the last child token of this token.")
+    parser.add_argument("--next", required=False, help="Gets the next sibling token of this node.")
+    parser.add_argument("--parent", required=False, help="Gets or sets the parent.")
+    args = parser.parse_args()
+
+    logger = AdoLogger("create_request_access", pat)
+    logger.info("Request Access for Request Access")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = create_request_access(client, first=args.first, has_values=args.has_values, item=args.item, last=args.last, next=args.next, parent=args.parent)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,59 +11,78 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/graph/subject-look
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Resolve descriptors to users, groups or scopes (Subjects) in a batch.")
-parser.add_argument("--lookup-keys", required=False, help="lookupKeys")
-args = parser.parse_args()
+def create_lookup_subjects(client, *, lookup_keys: Optional[str] = None) -> dict:
+    """
+    Resolve descriptors to users, groups or scopes (Subjects) in a batch.
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_lookup_subjects", PAT)
-logger.info("Resolve descriptors to users, groups or scopes (Subjects) in a batch.")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        lookup_keys: lookupKeys
 
-# ---------------------------------------------------------------------------
-# Request body
-# ---------------------------------------------------------------------------
-body = {
-    "lookupKeys": args.lookup_keys,
-}
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "lookupKeys": lookup_keys,
+    }
+    url = build_url(client.organization, f"_apis/graph/subjectlookup", API_VERSION, base_host="vssps.dev.azure.com")
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/graph/subjectlookup", API_VERSION, base_host="vssps.dev.azure.com")
-logger.info(f"POST {url}")
 
-response = execute_request("POST", url, HEADERS, body=body)
+async def create_lookup_subjects_async(client, *, lookup_keys: Optional[str] = None) -> dict:
+    """Async variant of create_lookup_subjects() for use with AsyncAdoClient."""
+    body = {
+        "lookupKeys": lookup_keys,
+    }
+    url = build_url(client.organization, f"_apis/graph/subjectlookup", API_VERSION, base_host="vssps.dev.azure.com")
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call create_lookup_subjects() and print the result."""
+    organization, pat = get_common_env()
+
+    parser = argparse.ArgumentParser(description="Resolve descriptors to users, groups or scopes (Subjects) in a batch.")
+    parser.add_argument("--lookup-keys", required=False, help="lookupKeys")
+    args = parser.parse_args()
+
+    logger = AdoLogger("create_lookup_subjects", pat)
+    logger.info("Resolve descriptors to users, groups or scopes (Subjects) in a batch.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = create_lookup_subjects(client, lookup_keys=args.lookup_keys)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,63 +11,94 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/graph/subject-quer
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Search for Azure Devops users, or/and groups.")
-parser.add_argument("--query", required=False, help="Search term to search for Azure Devops users or/and groups")
-parser.add_argument("--scope-descriptor", required=False, help="Optional parameter. Specify a non-default scope (collection, project) to search for users or grou...")
-parser.add_argument("--subject-kind", required=False, help="'User' or 'Group' can be specified, both or either")
-args = parser.parse_args()
+def query_subject_query(client, *, query: Optional[str] = None, scope_descriptor: Optional[str] = None, subject_kind: Optional[str] = None) -> dict:
+    """
+    Search for Azure Devops users, or/and groups.
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("query_subject_query", PAT)
-logger.info("Search for Azure Devops users, or/and groups.")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        query: Search term to search for Azure Devops users or/and groups
+        scope_descriptor: Optional parameter. Specify a non-default scope (collection, project) to search for users or grou...
+        subject_kind: 'User' or 'Group' can be specified, both or either
 
-# ---------------------------------------------------------------------------
-# Request body
-# ---------------------------------------------------------------------------
-body = {
-    "query": args.query,
-    "scopeDescriptor": args.scope_descriptor,
-    "subjectKind": args.subject_kind,
-}
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "query": query,
+        "scopeDescriptor": scope_descriptor,
+        "subjectKind": subject_kind,
+    }
+    url = build_url(client.organization, f"_apis/graph/subjectquery", API_VERSION, base_host="vssps.dev.azure.com")
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/graph/subjectquery", API_VERSION, base_host="vssps.dev.azure.com")
-logger.info(f"POST {url}")
 
-response = execute_request("POST", url, HEADERS, body=body)
+async def query_subject_query_async(client, *, query: Optional[str] = None, scope_descriptor: Optional[str] = None, subject_kind: Optional[str] = None) -> dict:
+    """Async variant of query_subject_query() for use with AsyncAdoClient."""
+    body = {
+        "query": query,
+        "scopeDescriptor": scope_descriptor,
+        "subjectKind": subject_kind,
+    }
+    url = build_url(client.organization, f"_apis/graph/subjectquery", API_VERSION, base_host="vssps.dev.azure.com")
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call query_subject_query() and print the result."""
+    organization, pat = get_common_env()
+
+    parser = argparse.ArgumentParser(description="Search for Azure Devops users, or/and groups.")
+    parser.add_argument("--query", required=False, help="Search term to search for Azure Devops users or/and groups")
+    parser.add_argument("--scope-descriptor", required=False, help="Optional parameter. Specify a non-default scope (collection, project) to search for users or grou...")
+    parser.add_argument("--subject-kind", required=False, help="'User' or 'Group' can be specified, both or either")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("query_subject_query", pat)
+    logger.info("Search for Azure Devops users, or/and groups.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        items = items_of(query_subject_query(client, query=args.query, scope_descriptor=args.scope_descriptor, subject_kind=args.subject_kind), "value")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    data = query_subject_query(client, query=args.query, scope_descriptor=args.scope_descriptor, subject_kind=args.subject_kind)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
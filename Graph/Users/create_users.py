@@ -11,59 +11,78 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/graph/users/create
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Materialize an existing AAD or MSA user into the ADO account.")
-parser.add_argument("--storage-key", required=False, help="Optional: If provided, we will use this identifier for the storage key of the created user")
-args = parser.parse_args()
+def create_users(client, *, storage_key: Optional[str] = None) -> dict:
+    """
+    Materialize an existing AAD or MSA user into the ADO account.
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_users", PAT)
-logger.info("Materialize an existing AAD or MSA user into the ADO account.")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        storage_key: Optional: If provided, we will use this identifier for the storage key of the created user
 
-# ---------------------------------------------------------------------------
-# Request body
-# ---------------------------------------------------------------------------
-body = {
-    "storageKey": args.storage_key,
-}
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "storageKey": storage_key,
+    }
+    url = build_url(client.organization, f"_apis/graph/users", API_VERSION, base_host="vssps.dev.azure.com")
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/graph/users", API_VERSION, base_host="vssps.dev.azure.com")
-logger.info(f"POST {url}")
 
-response = execute_request("POST", url, HEADERS, body=body)
+async def create_users_async(client, *, storage_key: Optional[str] = None) -> dict:
+    """Async variant of create_users() for use with AsyncAdoClient."""
+    body = {
+        "storageKey": storage_key,
+    }
+    url = build_url(client.organization, f"_apis/graph/users", API_VERSION, base_host="vssps.dev.azure.com")
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call create_users() and print the result."""
+    organization, pat = get_common_env()
+
+    parser = argparse.ArgumentParser(description="Materialize an existing AAD or MSA user into the ADO account.")
+    parser.add_argument("--storage-key", required=False, help="Optional: If provided, we will use this identifier for the storage key of the created user")
+    args = parser.parse_args()
+
+    logger = AdoLogger("create_users", pat)
+    logger.info("Materialize an existing AAD or MSA user into the ADO account.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = create_users(client, storage_key=args.storage_key)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
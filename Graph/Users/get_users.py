@@ -10,46 +10,68 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/graph/users/get?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-USER_DESCRIPTOR = get_env_or_exit("USER_DESCRIPTOR", "The descriptor of the desired user.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_users", PAT)
-logger.info("Get a user by its descriptor.")
+def get_users(client, user_descriptor: str) -> dict:
+    """
+    Get a user by its descriptor.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        user_descriptor: The descriptor of the desired user.
+
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/graph/users/{user_descriptor}", API_VERSION, base_host="vssps.dev.azure.com")
+    response = client.request("GET", url)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/graph/users/{USER_DESCRIPTOR}", API_VERSION, base_host="vssps.dev.azure.com")
-logger.info(f"GET {url}")
 
-response = execute_request("GET", url, HEADERS)
+async def get_users_async(client, user_descriptor: str) -> dict:
+    """Async variant of get_users() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/graph/users/{user_descriptor}", API_VERSION, base_host="vssps.dev.azure.com")
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_users() and print the result."""
+    organization, pat = get_common_env()
+    user_descriptor = require_env("USER_DESCRIPTOR", "The descriptor of the desired user.")
+
+    logger = AdoLogger("get_users", pat)
+    logger.info("Get a user by its descriptor.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = get_users(client, user_descriptor)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
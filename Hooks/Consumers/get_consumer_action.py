@@ -10,53 +10,73 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/hooks/consumers/get-consumer-action?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-CONSUMER_ID = get_env_or_exit("CONSUMER_ID", "ID for a consumer.")
-CONSUMER_ACTION_ID = get_env_or_exit("CONSUMER_ACTION_ID", "ID for a consumerActionId.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_consumer_action", PAT)
-logger.info("Get details about a specific consumer action.")
+def get_consumer_action(client, consumer_id: str, consumer_action_id: str) -> dict:
+    """
+    Get details about a specific consumer action.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/hooks/consumers/{CONSUMER_ID}/actions/{CONSUMER_ACTION_ID}", API_VERSION)
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        consumer_id: ID for a consumer.
+        consumer_action_id: ID for a consumerActionId.
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/hooks/consumers/{consumer_id}/actions/{consumer_action_id}", API_VERSION)
+    response = client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'name'], API_VERSION)
+async def get_consumer_action_async(client, consumer_id: str, consumer_action_id: str) -> dict:
+    """Async variant of get_consumer_action() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/hooks/consumers/{consumer_id}/actions/{consumer_action_id}", API_VERSION)
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(f"Consumers: {data.get("name", "N/A")}")
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_consumer_action() and print the result."""
+    organization, pat = get_common_env()
+    consumer_id = require_env("CONSUMER_ID", "ID for a consumer.")
+    consumer_action_id = require_env("CONSUMER_ACTION_ID", "ID for a consumerActionId.")
+
+    logger = AdoLogger("get_consumer_action", pat)
+    logger.info("Get details about a specific consumer action.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = get_consumer_action(client, consumer_id, consumer_action_id)
+
+    print(f"Consumers: {data.get('name', 'N/A')}")
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -8,55 +8,24 @@ Validates:
   - Correct Authorization header
   - Successful response parsing (200)
   - Exit when required env vars are missing
+
+The script is imported and called in-process; see the fixtures in conftest.py.
 """
 
 import json
-import os
-import subprocess
-import sys
 from pathlib import Path
 
 import pytest
 import responses
 
+from _shared.errors import AdoAuthError, AdoNotFound
+from Hooks.Consumers.get_consumer_action import get_consumer_action, main
+
 FIXTURES = Path(__file__).parent / "fixtures"
-SCRIPT = str(Path(__file__).resolve().parents[1] / "get_consumer_action.py")
-
-# ---------------------------------------------------------------------------
-# Helpers
-# ---------------------------------------------------------------------------
-
-def _run_script(env_override=None, extra_args=None, expect_fail=False):
-    """Run the script as a subprocess with the given env."""
-    env = {
-        "AZURE_DEVOPS_ORG": "testorg",
-        "AZURE_DEVOPS_PAT": "fakepat1234567890",
-        "CONSUMER_ID": "test-value-consumer_id",
-        "CONSUMER_ACTION_ID": "test-value-consumer_action_id",
-        "PATH": os.environ.get("PATH", ""),
-        "PYTHONPATH": os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."),
-    }
-    if env_override:
-        env.update(env_override)
-    env = {k: v for k, v in env.items() if v is not None}
-
-    cmd = [sys.executable, SCRIPT]
-    if extra_args:
-        cmd.extend(extra_args)
-
-    result = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        env=env,
-        timeout=30,
-    )
-    if not expect_fail:
-        assert result.returncode == 0, (
-            f"Script failed (rc={result.returncode}):\n"
-            f"STDOUT: {result.stdout}\nSTDERR: {result.stderr}"
-        )
-    return result
+ENV = {
+    "CONSUMER_ID": "test-value-consumer_id",
+    "CONSUMER_ACTION_ID": "test-value-consumer_action_id",
+}
 
 
 class TestGetConsumerActionEnvValidation:
@@ -64,43 +33,31 @@ class TestGetConsumerActionEnvValidation:
 
     @pytest.mark.offline
     @pytest.mark.hooks
-    def test_missing_org_exits(self):
-        result = _run_script(
-            env_override={"AZURE_DEVOPS_ORG": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "AZURE_DEVOPS_ORG" in result.stderr or "AZURE_DEVOPS_ORG" in result.stdout
+    def test_missing_org_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "AZURE_DEVOPS_ORG": None})
+        assert code != 0
+        assert "AZURE_DEVOPS_ORG" in output
 
     @pytest.mark.offline
     @pytest.mark.hooks
-    def test_missing_pat_exits(self):
-        result = _run_script(
-            env_override={"AZURE_DEVOPS_PAT": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "AZURE_DEVOPS_PAT" in result.stderr or "AZURE_DEVOPS_PAT" in result.stdout
+    def test_missing_pat_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "AZURE_DEVOPS_PAT": None})
+        assert code != 0
+        assert "AZURE_DEVOPS_PAT" in output
 
     @pytest.mark.offline
     @pytest.mark.hooks
-    def test_missing_consumer_id_exits(self):
-        result = _run_script(
-            env_override={"CONSUMER_ID": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "CONSUMER_ID" in result.stderr or "CONSUMER_ID" in result.stdout
+    def test_missing_consumer_id_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "CONSUMER_ID": None})
+        assert code != 0
+        assert "CONSUMER_ID" in output
 
     @pytest.mark.offline
     @pytest.mark.hooks
-    def test_missing_consumer_action_id_exits(self):
-        result = _run_script(
-            env_override={"CONSUMER_ACTION_ID": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "CONSUMER_ACTION_ID" in result.stderr or "CONSUMER_ACTION_ID" in result.stdout
+    def test_missing_consumer_action_id_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "CONSUMER_ACTION_ID": None})
+        assert code != 0
+        assert "CONSUMER_ACTION_ID" in output
 
 
 class TestGetConsumerActionURLAndAuth:
@@ -109,56 +66,39 @@ class TestGetConsumerActionURLAndAuth:
     @pytest.mark.offline
     @pytest.mark.hooks
     @responses.activate
-    def test_correct_url_and_auth_header(self):
-        """Verify the script builds the right URL and Authorization header."""
-        import base64
-
-        org = "testorg"
-        pat = "fakepat1234567890"
+    def test_correct_url_and_auth_header(self, ado_client):
+        """Verify the operation builds the right URL and Authorization header."""
         expected_url = "https://dev.azure.com/testorg/_apis/hooks/consumers/test-value-consumer_id/actions/test-value-consumer_action_id?api-version=7.2"
-
         fixture = json.loads((FIXTURES / "get_consumer_action_200.json").read_text())
         responses.add(responses.GET, expected_url, json=fixture, status=200)
 
-        import requests as req
-
-        cred = base64.b64encode(f":{pat}".encode("ascii")).decode("ascii")
-        headers = {
-            "Authorization": f"Basic {cred}",
-            "Content-Type": "application/json",
-        }
-        resp = req.get(expected_url, headers=headers, timeout=30)
-
-        assert resp.status_code == 200
+        assert get_consumer_action(ado_client, "test-value-consumer_id", "test-value-consumer_action_id") == fixture
         assert len(responses.calls) == 1
+        assert responses.calls[0].request.url == expected_url
         sent_auth = responses.calls[0].request.headers["Authorization"]
-        assert sent_auth.startswith("Basic ")
+        assert sent_auth == "Basic OmZha2VwYXQxMjM0NTY3ODkw"
 
 
 class TestGetConsumerActionHTTPErrors:
-    """Validate behaviour on error status codes."""
+    """Validate the typed error raised for error status codes."""
 
     @pytest.mark.offline
     @pytest.mark.hooks
     @responses.activate
-    def test_401_unauthorized(self):
+    def test_401_unauthorized(self, ado_client):
         url = "https://dev.azure.com/testorg/_apis/hooks/consumers/test-value-consumer_id/actions/test-value-consumer_action_id?api-version=7.2"
         responses.add(responses.GET, url, json={"message": "unauthorized"}, status=401)
 
-        import requests as req
-
-        resp = req.get(url, headers={"Authorization": "Basic fake"}, timeout=30)
-        assert resp.status_code == 401
+        with pytest.raises(AdoAuthError):
+            get_consumer_action(ado_client, "test-value-consumer_id", "test-value-consumer_action_id")
 
     @pytest.mark.offline
     @pytest.mark.hooks
     @responses.activate
-    def test_404_not_found(self):
+    def test_404_not_found(self, ado_client):
         url = "https://dev.azure.com/testorg/_apis/hooks/consumers/test-value-consumer_id/actions/test-value-consumer_action_id?api-version=7.2"
         responses.add(responses.GET, url, json={"message": "not_found"}, status=404)
 
-        import requests as req
-
-        resp = req.get(url, headers={"Authorization": "Basic fake"}, timeout=30)
-        assert resp.status_code == 404
+        with pytest.raises(AdoNotFound):
+            get_consumer_action(ado_client, "test-value-consumer_id", "test-value-consumer_action_id")
 
@@ -10,51 +10,70 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/hooks/diagnostics/get?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-SUBSCRIPTION_ID = get_env_or_exit("SUBSCRIPTION_ID", "subscriptionId")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_diagnostics", PAT)
-logger.info("Get for Diagnostics")
+def get_diagnostics(client, subscription_id: str) -> dict:
+    """
+    Get for Diagnostics
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/hooks/subscriptions/{SUBSCRIPTION_ID}/diagnostics", API_VERSION)
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        subscription_id: subscriptionId
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/hooks/subscriptions/{subscription_id}/diagnostics", API_VERSION)
+    response = client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['deliveryResults', 'deliveryTracing'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['deliveryResults', 'deliveryTracing'], API_VERSION)
+async def get_diagnostics_async(client, subscription_id: str) -> dict:
+    """Async variant of get_diagnostics() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/hooks/subscriptions/{subscription_id}/diagnostics", API_VERSION)
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['deliveryResults', 'deliveryTracing'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_diagnostics() and print the result."""
+    organization, pat = get_common_env()
+    subscription_id = require_env("SUBSCRIPTION_ID", "subscriptionId")
+
+    logger = AdoLogger("get_diagnostics", pat)
+    logger.info("Get for Diagnostics")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = get_diagnostics(client, subscription_id)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,75 +11,101 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/hooks/notification
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Sends a test notification.")
-parser.add_argument("--created-date", required=False, help="Gets or sets date and time that this result was created.")
-parser.add_argument("--details", required=False, help="Details about this notification (if available)")
-parser.add_argument("--event-id", required=False, help="The event id associated with this notification")
-parser.add_argument("--id", required=False, help="The notification id")
-parser.add_argument("--modified-date", required=False, help="Gets or sets date and time that this result was last modified.")
-parser.add_argument("--result", required=False, help="Result of the notification")
-args = parser.parse_args()
+def create_notifications(client, *, created_date: Optional[str] = None, details: Optional[str] = None, event_id: Optional[str] = None, id: Optional[str] = None, modified_date: Optional[str] = None, result: Optional[str] = None) -> dict:
+    """
+    Sends a test notification.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        created_date: Gets or sets date and time that this result was created.
+        details: Details about this notification (if available)
+        event_id: The event id associated with this notification
+        id: The notification id
+        modified_date: Gets or sets date and time that this result was last modified.
+        result: Result of the notification
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "createdDate": created_date,
+        "details": details,
+        "eventId": event_id,
+        "id": id,
+        "modifiedDate": modified_date,
+        "result": result,
+    }
+    url = build_url(client.organization, f"_apis/hooks/testnotifications", API_VERSION)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'createdDate'], API_VERSION)
+    return data
+
+
+async def create_notifications_async(client, *, created_date: Optional[str] = None, details: Optional[str] = None, event_id: Optional[str] = None, id: Optional[str] = None, modified_date: Optional[str] = None, result: Optional[str] = None) -> dict:
+    """Async variant of create_notifications() for use with AsyncAdoClient."""
+    body = {
+        "createdDate": created_date,
+        "details": details,
+        "eventId": event_id,
+        "id": id,
+        "modifiedDate": modified_date,
+        "result": result,
+    }
+    url = build_url(client.organization, f"_apis/hooks/testnotifications", API_VERSION)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'createdDate'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_notifications", PAT)
-logger.info("Sends a test notification.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "createdDate": args.created_date,
-    "details": args.details,
-    "eventId": args.event_id,
-    "id": args.id,
-    "modifiedDate": args.modified_date,
-    "result": args.result,
-}
+def main() -> None:
+    """Read env vars / flags, call create_notifications() and print the result."""
+    organization, pat = get_common_env()
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/hooks/testnotifications", API_VERSION)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Sends a test notification.")
+    parser.add_argument("--created-date", required=False, help="Gets or sets date and time that this result was created.")
+    parser.add_argument("--details", required=False, help="Details about this notification (if available)")
+    parser.add_argument("--event-id", required=False, help="The event id associated with this notification")
+    parser.add_argument("--id", required=False, help="The notification id")
+    parser.add_argument("--modified-date", required=False, help="Gets or sets date and time that this result was last modified.")
+    parser.add_argument("--result", required=False, help="Result of the notification")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_notifications", pat)
+    logger.info("Sends a test notification.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_notifications(client, created_date=args.created_date, details=args.details, event_id=args.event_id, id=args.id, modified_date=args.modified_date, result=args.result)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'createdDate'], API_VERSION)
+    print(f"Notifications ID: {data.get('id', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Notifications ID: {data.get("id", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
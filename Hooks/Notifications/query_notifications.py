@@ -11,74 +11,100 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/hooks/notification
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Query for notifications.")
-parser.add_argument("--associated-subscriptions", required=False, help="The subscriptions associated with the notifications returned from the query")
-parser.add_argument("--include-details", required=False, help="If true, we will return all notification history for the query provided; otherwise, the summary i...")
-parser.add_argument("--max-created-date", required=False, help="Optional maximum date at which the notification was created")
-parser.add_argument("--max-results", required=False, help="Optional maximum number of overall results to include")
-parser.add_argument("--max-results-per-subscription", required=False, help="Optional maximum number of results for each subscription. Only takes effect when a list of subscr...")
-parser.add_argument("--min-created-date", required=False, help="Optional minimum date at which the notification was created")
-args = parser.parse_args()
+def query_notifications(client, *, associated_subscriptions: Optional[str] = None, include_details: Optional[str] = None, max_created_date: Optional[str] = None, max_results: Optional[str] = None, max_results_per_subscription: Optional[str] = None, min_created_date: Optional[str] = None) -> dict:
+    """
+    Query for notifications.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        associated_subscriptions: The subscriptions associated with the notifications returned from the query
+        include_details: If true, we will return all notification history for the query provided; otherwise, the summary i...
+        max_created_date: Optional maximum date at which the notification was created
+        max_results: Optional maximum number of overall results to include
+        max_results_per_subscription: Optional maximum number of results for each subscription. Only takes effect when a list of subscr...
+        min_created_date: Optional minimum date at which the notification was created
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "associatedSubscriptions": associated_subscriptions,
+        "includeDetails": include_details,
+        "maxCreatedDate": max_created_date,
+        "maxResults": max_results,
+        "maxResultsPerSubscription": max_results_per_subscription,
+        "minCreatedDate": min_created_date,
+    }
+    url = build_url(client.organization, f"_apis/hooks/notificationsquery", API_VERSION)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['associatedSubscriptions', 'includeDetails'], API_VERSION)
+    return data
+
+
+async def query_notifications_async(client, *, associated_subscriptions: Optional[str] = None, include_details: Optional[str] = None, max_created_date: Optional[str] = None, max_results: Optional[str] = None, max_results_per_subscription: Optional[str] = None, min_created_date: Optional[str] = None) -> dict:
+    """Async variant of query_notifications() for use with AsyncAdoClient."""
+    body = {
+        "associatedSubscriptions": associated_subscriptions,
+        "includeDetails": include_details,
+        "maxCreatedDate": max_created_date,
+        "maxResults": max_results,
+        "maxResultsPerSubscription": max_results_per_subscription,
+        "minCreatedDate": min_created_date,
+    }
+    url = build_url(client.organization, f"_apis/hooks/notificationsquery", API_VERSION)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['associatedSubscriptions', 'includeDetails'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("query_notifications", PAT)
-logger.info("Query for notifications.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "associatedSubscriptions": args.associated_subscriptions,
-    "includeDetails": args.include_details,
-    "maxCreatedDate": args.max_created_date,
-    "maxResults": args.max_results,
-    "maxResultsPerSubscription": args.max_results_per_subscription,
-    "minCreatedDate": args.min_created_date,
-}
+def main() -> None:
+    """Read env vars / flags, call query_notifications() and print the result."""
+    organization, pat = get_common_env()
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/hooks/notificationsquery", API_VERSION)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Query for notifications.")
+    parser.add_argument("--associated-subscriptions", required=False, help="The subscriptions associated with the notifications returned from the query")
+    parser.add_argument("--include-details", required=False, help="If true, we will return all notification history for the query provided; otherwise, the summary i...")
+    parser.add_argument("--max-created-date", required=False, help="Optional maximum date at which the notification was created")
+    parser.add_argument("--max-results", required=False, help="Optional maximum number of overall results to include")
+    parser.add_argument("--max-results-per-subscription", required=False, help="Optional maximum number of results for each subscription. Only takes effect when a list of subscr...")
+    parser.add_argument("--min-created-date", required=False, help="Optional minimum date at which the notification was created")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("query_notifications", pat)
+    logger.info("Query for notifications.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = query_notifications(client, associated_subscriptions=args.associated_subscriptions, include_details=args.include_details, max_created_date=args.max_created_date, max_results=args.max_results, max_results_per_subscription=args.max_results_per_subscription, min_created_date=args.min_created_date)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['associatedSubscriptions', 'includeDetails'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
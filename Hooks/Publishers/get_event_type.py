@@ -10,53 +10,73 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/hooks/publishers/get-event-type?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PUBLISHER_ID = get_env_or_exit("PUBLISHER_ID", "ID for a publisher.")
-EVENT_TYPE_ID = get_env_or_exit("EVENT_TYPE_ID", "eventTypeId")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_event_type", PAT)
-logger.info("Get a specific event type.")
+def get_event_type(client, publisher_id: str, event_type_id: str) -> dict:
+    """
+    Get a specific event type.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/hooks/publishers/{PUBLISHER_ID}/eventtypes/{EVENT_TYPE_ID}", API_VERSION)
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        publisher_id: ID for a publisher.
+        event_type_id: eventTypeId
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/hooks/publishers/{publisher_id}/eventtypes/{event_type_id}", API_VERSION)
+    response = client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name', 'description'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'name', 'description'], API_VERSION)
+async def get_event_type_async(client, publisher_id: str, event_type_id: str) -> dict:
+    """Async variant of get_event_type() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/hooks/publishers/{publisher_id}/eventtypes/{event_type_id}", API_VERSION)
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name', 'description'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(f"Publishers: {data.get("name", "N/A")}")
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_event_type() and print the result."""
+    organization, pat = get_common_env()
+    publisher_id = require_env("PUBLISHER_ID", "ID for a publisher.")
+    event_type_id = require_env("EVENT_TYPE_ID", "eventTypeId")
+
+    logger = AdoLogger("get_event_type", pat)
+    logger.info("Get a specific event type.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = get_event_type(client, publisher_id, event_type_id)
+
+    print(f"Publishers: {data.get('name', 'N/A')}")
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,69 +11,90 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/hooks/publishers/q
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PUBLISHER_ID = get_env_or_exit("PUBLISHER_ID", "publisherId")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Query Input Values for Publishers")
-parser.add_argument("--current-values", required=False, help="currentValues")
-parser.add_argument("--input-values", required=False, help="The input values to return on input, and the result from the consumer on output.")
-parser.add_argument("--resource", required=False, help="Subscription containing information about the publisher/consumer and the current input values")
-args = parser.parse_args()
+def query_input_values(client, publisher_id: str, *, current_values: Optional[str] = None, input_values: Optional[str] = None, resource: Optional[str] = None) -> dict:
+    """
+    Query Input Values for Publishers
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        publisher_id: publisherId
+        current_values: currentValues
+        input_values: The input values to return on input, and the result from the consumer on output.
+        resource: Subscription containing information about the publisher/consumer and the current input values
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "currentValues": current_values,
+        "inputValues": input_values,
+        "resource": resource,
+    }
+    url = build_url(client.organization, f"_apis/hooks/publishers/{publisher_id}/inputValuesQuery", API_VERSION)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['currentValues', 'inputValues'], API_VERSION)
+    return data
+
+
+async def query_input_values_async(client, publisher_id: str, *, current_values: Optional[str] = None, input_values: Optional[str] = None, resource: Optional[str] = None) -> dict:
+    """Async variant of query_input_values() for use with AsyncAdoClient."""
+    body = {
+        "currentValues": current_values,
+        "inputValues": input_values,
+        "resource": resource,
+    }
+    url = build_url(client.organization, f"_apis/hooks/publishers/{publisher_id}/inputValuesQuery", API_VERSION)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['currentValues', 'inputValues'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("query_input_values", PAT)
-logger.info("Query Input Values for Publishers")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "currentValues": args.current_values,
-    "inputValues": args.input_values,
-    "resource": args.resource,
-}
+def main() -> None:
+    """Read env vars / flags, call query_input_values() and print the result."""
+    organization, pat = get_common_env()
+    publisher_id = require_env("PUBLISHER_ID", "publisherId")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/hooks/publishers/{PUBLISHER_ID}/inputValuesQuery", API_VERSION)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Query Input Values for Publishers")
+    parser.add_argument("--current-values", required=False, help="currentValues")
+    parser.add_argument("--input-values", required=False, help="The input values to return on input, and the result from the consumer on output.")
+    parser.add_argument("--resource", required=False, help="Subscription containing information about the publisher/consumer and the current input values")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("query_input_values", pat)
+    logger.info("Query Input Values for Publishers")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = query_input_values(client, publisher_id, current_values=args.current_values, input_values=args.input_values, resource=args.resource)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['currentValues', 'inputValues'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,68 +11,88 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/hooks/publishers/q
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Query for service hook publishers.")
-parser.add_argument("--publisher-ids", required=False, help="Optional list of publisher ids to restrict the results to")
-parser.add_argument("--publisher-inputs", required=False, help="Filter for publisher inputs")
-parser.add_argument("--results", required=False, help="Results from the query")
-args = parser.parse_args()
+def query_publishers(client, *, publisher_ids: Optional[str] = None, publisher_inputs: Optional[str] = None, results: Optional[str] = None) -> dict:
+    """
+    Query for service hook publishers.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        publisher_ids: Optional list of publisher ids to restrict the results to
+        publisher_inputs: Filter for publisher inputs
+        results: Results from the query
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "publisherIds": publisher_ids,
+        "publisherInputs": publisher_inputs,
+        "results": results,
+    }
+    url = build_url(client.organization, f"_apis/hooks/publishersquery", API_VERSION)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['publisherIds', 'publisherInputs'], API_VERSION)
+    return data
+
+
+async def query_publishers_async(client, *, publisher_ids: Optional[str] = None, publisher_inputs: Optional[str] = None, results: Optional[str] = None) -> dict:
+    """Async variant of query_publishers() for use with AsyncAdoClient."""
+    body = {
+        "publisherIds": publisher_ids,
+        "publisherInputs": publisher_inputs,
+        "results": results,
+    }
+    url = build_url(client.organization, f"_apis/hooks/publishersquery", API_VERSION)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['publisherIds', 'publisherInputs'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("query_publishers", PAT)
-logger.info("Query for service hook publishers.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "publisherIds": args.publisher_ids,
-    "publisherInputs": args.publisher_inputs,
-    "results": args.results,
-}
+def main() -> None:
+    """Read env vars / flags, call query_publishers() and print the result."""
+    organization, pat = get_common_env()
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/hooks/publishersquery", API_VERSION)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Query for service hook publishers.")
+    parser.add_argument("--publisher-ids", required=False, help="Optional list of publisher ids to restrict the results to")
+    parser.add_argument("--publisher-inputs", required=False, help="Filter for publisher inputs")
+    parser.add_argument("--results", required=False, help="Results from the query")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("query_publishers", pat)
+    logger.info("Query for service hook publishers.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = query_publishers(client, publisher_ids=args.publisher_ids, publisher_inputs=args.publisher_inputs, results=args.results)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['publisherIds', 'publisherInputs'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
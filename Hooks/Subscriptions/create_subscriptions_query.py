@@ -11,74 +11,100 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/hooks/subscription
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Query for service hook subscriptions.")
-parser.add_argument("--consumer-action-id", required=False, help="Optional consumer action id to restrict the results to (null for any)")
-parser.add_argument("--consumer-id", required=False, help="Optional consumer id to restrict the results to (null for any)")
-parser.add_argument("--consumer-input-filters", required=False, help="Filter for subscription consumer inputs")
-parser.add_argument("--event-type", required=False, help="Optional event type id to restrict the results to (null for any)")
-parser.add_argument("--publisher-id", required=False, help="Optional publisher id to restrict the results to (null for any)")
-parser.add_argument("--publisher-input-filters", required=False, help="Filter for subscription publisher inputs")
-args = parser.parse_args()
+def create_subscriptions_query(client, *, consumer_action_id: Optional[str] = None, consumer_id: Optional[str] = None, consumer_input_filters: Optional[str] = None, event_type: Optional[str] = None, publisher_id: Optional[str] = None, publisher_input_filters: Optional[str] = None) -> dict:
+    """
+    Query for service hook subscriptions.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        consumer_action_id: Optional consumer action id to restrict the results to (null for any)
+        consumer_id: Optional consumer id to restrict the results to (null for any)
+        consumer_input_filters: Filter for subscription consumer inputs
+        event_type: Optional event type id to restrict the results to (null for any)
+        publisher_id: Optional publisher id to restrict the results to (null for any)
+        publisher_input_filters: Filter for subscription publisher inputs
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "consumerActionId": consumer_action_id,
+        "consumerId": consumer_id,
+        "consumerInputFilters": consumer_input_filters,
+        "eventType": event_type,
+        "publisherId": publisher_id,
+        "publisherInputFilters": publisher_input_filters,
+    }
+    url = build_url(client.organization, f"_apis/hooks/subscriptionsquery", API_VERSION)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['consumerActionId', 'consumerId'], API_VERSION)
+    return data
+
+
+async def create_subscriptions_query_async(client, *, consumer_action_id: Optional[str] = None, consumer_id: Optional[str] = None, consumer_input_filters: Optional[str] = None, event_type: Optional[str] = None, publisher_id: Optional[str] = None, publisher_input_filters: Optional[str] = None) -> dict:
+    """Async variant of create_subscriptions_query() for use with AsyncAdoClient."""
+    body = {
+        "consumerActionId": consumer_action_id,
+        "consumerId": consumer_id,
+        "consumerInputFilters": consumer_input_filters,
+        "eventType": event_type,
+        "publisherId": publisher_id,
+        "publisherInputFilters": publisher_input_filters,
+    }
+    url = build_url(client.organization, f"_apis/hooks/subscriptionsquery", API_VERSION)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['consumerActionId', 'consumerId'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_subscriptions_query", PAT)
-logger.info("Query for service hook subscriptions.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "consumerActionId": args.consumer_action_id,
-    "consumerId": args.consumer_id,
-    "consumerInputFilters": args.consumer_input_filters,
-    "eventType": args.event_type,
-    "publisherId": args.publisher_id,
-    "publisherInputFilters": args.publisher_input_filters,
-}
+def main() -> None:
+    """Read env vars / flags, call create_subscriptions_query() and print the result."""
+    organization, pat = get_common_env()
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/hooks/subscriptionsquery", API_VERSION)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Query for service hook subscriptions.")
+    parser.add_argument("--consumer-action-id", required=False, help="Optional consumer action id to restrict the results to (null for any)")
+    parser.add_argument("--consumer-id", required=False, help="Optional consumer id to restrict the results to (null for any)")
+    parser.add_argument("--consumer-input-filters", required=False, help="Filter for subscription consumer inputs")
+    parser.add_argument("--event-type", required=False, help="Optional event type id to restrict the results to (null for any)")
+    parser.add_argument("--publisher-id", required=False, help="Optional publisher id to restrict the results to (null for any)")
+    parser.add_argument("--publisher-input-filters", required=False, help="Filter for subscription publisher inputs")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_subscriptions_query", pat)
+    logger.info("Query for service hook subscriptions.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_subscriptions_query(client, consumer_action_id=args.consumer_action_id, consumer_id=args.consumer_id, consumer_input_filters=args.consumer_input_filters, event_type=args.event_type, publisher_id=args.publisher_id, publisher_input_filters=args.publisher_input_filters)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['consumerActionId', 'consumerId'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
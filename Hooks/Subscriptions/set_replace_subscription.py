@@ -11,73 +11,98 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/hooks/subscription
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-SUBSCRIPTION_ID = get_env_or_exit("SUBSCRIPTION_ID", "subscriptionId")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Update a subscription.")
-parser.add_argument("--action-description", required=False, help="actionDescription")
-parser.add_argument("--consumer-action-id", required=False, help="consumerActionId")
-parser.add_argument("--consumer-id", required=False, help="consumerId")
-parser.add_argument("--consumer-inputs", required=False, help="Consumer input values")
-parser.add_argument("--created-by", required=False, help="createdBy")
-args = parser.parse_args()
+def set_replace_subscription(client, subscription_id: str, *, action_description: Optional[str] = None, consumer_action_id: Optional[str] = None, consumer_id: Optional[str] = None, consumer_inputs: Optional[str] = None, created_by: Optional[str] = None) -> dict:
+    """
+    Update a subscription.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        subscription_id: subscriptionId
+        action_description: actionDescription
+        consumer_action_id: consumerActionId
+        consumer_id: consumerId
+        consumer_inputs: Consumer input values
+        created_by: createdBy
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "actionDescription": action_description,
+        "consumerActionId": consumer_action_id,
+        "consumerId": consumer_id,
+        "consumerInputs": consumer_inputs,
+        "createdBy": created_by,
+    }
+    url = build_url(client.organization, f"_apis/hooks/subscriptions/{subscription_id}", API_VERSION)
+    response = client.request("PUT", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'actionDescription'], API_VERSION)
+    return data
+
+
+async def set_replace_subscription_async(client, subscription_id: str, *, action_description: Optional[str] = None, consumer_action_id: Optional[str] = None, consumer_id: Optional[str] = None, consumer_inputs: Optional[str] = None, created_by: Optional[str] = None) -> dict:
+    """Async variant of set_replace_subscription() for use with AsyncAdoClient."""
+    body = {
+        "actionDescription": action_description,
+        "consumerActionId": consumer_action_id,
+        "consumerId": consumer_id,
+        "consumerInputs": consumer_inputs,
+        "createdBy": created_by,
+    }
+    url = build_url(client.organization, f"_apis/hooks/subscriptions/{subscription_id}", API_VERSION)
+    response = await client.request("PUT", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'actionDescription'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("set_replace_subscription", PAT)
-logger.info("Update a subscription.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "actionDescription": args.action_description,
-    "consumerActionId": args.consumer_action_id,
-    "consumerId": args.consumer_id,
-    "consumerInputs": args.consumer_inputs,
-    "createdBy": args.created_by,
-}
+def main() -> None:
+    """Read env vars / flags, call set_replace_subscription() and print the result."""
+    organization, pat = get_common_env()
+    subscription_id = require_env("SUBSCRIPTION_ID", "subscriptionId")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/hooks/subscriptions/{SUBSCRIPTION_ID}", API_VERSION)
-logger.info(f"PUT {url}")
+    parser = argparse.ArgumentParser(description="Update a subscription.")
+    parser.add_argument("--action-description", required=False, help="actionDescription")
+    parser.add_argument("--consumer-action-id", required=False, help="consumerActionId")
+    parser.add_argument("--consumer-id", required=False, help="consumerId")
+    parser.add_argument("--consumer-inputs", required=False, help="Consumer input values")
+    parser.add_argument("--created-by", required=False, help="createdBy")
+    args = parser.parse_args()
 
-response = execute_request("PUT", url, HEADERS, body=body)
+    logger = AdoLogger("set_replace_subscription", pat)
+    logger.info("Update a subscription.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = set_replace_subscription(client, subscription_id, action_description=args.action_description, consumer_action_id=args.consumer_action_id, consumer_id=args.consumer_id, consumer_inputs=args.consumer_inputs, created_by=args.created_by)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'actionDescription'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
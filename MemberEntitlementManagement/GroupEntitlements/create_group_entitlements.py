@@ -11,74 +11,100 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/member-entitlement
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Create a group entitlement with license rule, extension rule.")
-parser.add_argument("--group", required=False, help="Member reference.")
-parser.add_argument("--id", required=False, help="The unique identifier which matches the Id of the GraphMember.")
-parser.add_argument("--last-executed", required=False, help="[Readonly] The last time the group licensing rule was executed (regardless of whether any changes...")
-parser.add_argument("--license-rule", required=False, help="License Rule.")
-parser.add_argument("--members", required=False, help="Group members. Only used when creating a new group.")
-parser.add_argument("--project-entitlements", required=False, help="Relation between a project and the member's effective permissions in that project.")
-args = parser.parse_args()
+def create_group_entitlements(client, *, group: Optional[str] = None, id: Optional[str] = None, last_executed: Optional[str] = None, license_rule: Optional[str] = None, members: Optional[str] = None, project_entitlements: Optional[str] = None) -> dict:
+    """
+    Create a group entitlement with license rule, extension rule.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        group: Member reference.
+        id: The unique identifier which matches the Id of the GraphMember.
+        last_executed: [Readonly] The last time the group licensing rule was executed (regardless of whether any changes...
+        license_rule: License Rule.
+        members: Group members. Only used when creating a new group.
+        project_entitlements: Relation between a project and the member's effective permissions in that project.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "group": group,
+        "id": id,
+        "lastExecuted": last_executed,
+        "licenseRule": license_rule,
+        "members": members,
+        "projectEntitlements": project_entitlements,
+    }
+    url = build_url(client.organization, f"_apis/groupentitlements", API_VERSION, base_host="vsaex.dev.azure.com")
+    response = client.request("POST", url, body=body, expected_status=201)
+    data = loads(response.content)
+    version_guard(data, ['completed', 'haveResultsSucceeded'], API_VERSION)
+    return data
+
+
+async def create_group_entitlements_async(client, *, group: Optional[str] = None, id: Optional[str] = None, last_executed: Optional[str] = None, license_rule: Optional[str] = None, members: Optional[str] = None, project_entitlements: Optional[str] = None) -> dict:
+    """Async variant of create_group_entitlements() for use with AsyncAdoClient."""
+    body = {
+        "group": group,
+        "id": id,
+        "lastExecuted": last_executed,
+        "licenseRule": license_rule,
+        "members": members,
+        "projectEntitlements": project_entitlements,
+    }
+    url = build_url(client.organization, f"_apis/groupentitlements", API_VERSION, base_host="vsaex.dev.azure.com")
+    response = await client.request("POST", url, body=body, expected_status=201)
+    data = loads(response.content)
+    version_guard(data, ['completed', 'haveResultsSucceeded'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_group_entitlements", PAT)
-logger.info("Create a group entitlement with license rule, extension rule.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "group": args.group,
-    "id": args.id,
-    "lastExecuted": args.last_executed,
-    "licenseRule": args.license_rule,
-    "members": args.members,
-    "projectEntitlements": args.project_entitlements,
-}
+def main() -> None:
+    """Read env vars / flags, call create_group_entitlements() and print the result."""
+    organization, pat = get_common_env()
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/groupentitlements", API_VERSION, base_host="vsaex.dev.azure.com")
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Create a group entitlement with license rule, extension rule.")
+    parser.add_argument("--group", required=False, help="Member reference.")
+    parser.add_argument("--id", required=False, help="The unique identifier which matches the Id of the GraphMember.")
+    parser.add_argument("--last-executed", required=False, help="[Readonly] The last time the group licensing rule was executed (regardless of whether any changes...")
+    parser.add_argument("--license-rule", required=False, help="License Rule.")
+    parser.add_argument("--members", required=False, help="Group members. Only used when creating a new group.")
+    parser.add_argument("--project-entitlements", required=False, help="Relation between a project and the member's effective permissions in that project.")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body, expected_status=201)
+    logger = AdoLogger("create_group_entitlements", pat)
+    logger.info("Create a group entitlement with license rule, extension rule.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_group_entitlements(client, group=args.group, id=args.id, last_executed=args.last_executed, license_rule=args.license_rule, members=args.members, project_entitlements=args.project_entitlements)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['completed', 'haveResultsSucceeded'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,47 +10,70 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/member-entitlement-management/members/add?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-GROUP_ID = get_env_or_exit("GROUP_ID", "Id of the Group.")
-MEMBER_ID = get_env_or_exit("MEMBER_ID", "Id of the member to add.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_members", PAT)
-logger.info("Add a member to a Group.")
+def create_members(client, group_id: str, member_id: str) -> dict:
+    """
+    Add a member to a Group.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        group_id: Id of the Group.
+        member_id: Id of the member to add.
+
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/GroupEntitlements/{group_id}/members/{member_id}", API_VERSION, base_host="vsaex.dev.azure.com")
+    response = client.request("PUT", url)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/GroupEntitlements/{GROUP_ID}/members/{MEMBER_ID}", API_VERSION, base_host="vsaex.dev.azure.com")
-logger.info(f"PUT {url}")
 
-response = execute_request("PUT", url, HEADERS)
+async def create_members_async(client, group_id: str, member_id: str) -> dict:
+    """Async variant of create_members() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/GroupEntitlements/{group_id}/members/{member_id}", API_VERSION, base_host="vsaex.dev.azure.com")
+    response = await client.request("PUT", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call create_members() and print the result."""
+    organization, pat = get_common_env()
+    group_id = require_env("GROUP_ID", "Id of the Group.")
+    member_id = require_env("MEMBER_ID", "Id of the member to add.")
+
+    logger = AdoLogger("create_members", pat)
+    logger.info("Add a member to a Group.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = create_members(client, group_id, member_id)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
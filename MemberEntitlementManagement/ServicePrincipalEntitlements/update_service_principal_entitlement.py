@@ -10,51 +10,70 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/member-entitlement-management/service-principal-entitlements/update-service-principal-entitlement?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-SERVICE_PRINCIPAL_ID = get_env_or_exit("SERVICE_PRINCIPAL_ID", "ID of the service principal.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_service_principal_entitlement", PAT)
-logger.info("Edit the entitlements (License, Extensions, Projects, Teams etc) for a service principal.")
+def update_service_principal_entitlement(client, service_principal_id: str) -> dict:
+    """
+    Edit the entitlements (License, Extensions, Projects, Teams etc) for a service principal.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/serviceprincipalentitlements/{SERVICE_PRINCIPAL_ID}", API_VERSION, base_host="vsaex.dev.azure.com")
-logger.info(f"PATCH {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        service_principal_id: ID of the service principal.
 
-response = execute_request("PATCH", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/serviceprincipalentitlements/{service_principal_id}", API_VERSION, base_host="vsaex.dev.azure.com")
+    response = client.request("PATCH", url)
+    data = loads(response.content)
+    version_guard(data, ['operationResults'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['operationResults'], API_VERSION)
+async def update_service_principal_entitlement_async(client, service_principal_id: str) -> dict:
+    """Async variant of update_service_principal_entitlement() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/serviceprincipalentitlements/{service_principal_id}", API_VERSION, base_host="vsaex.dev.azure.com")
+    response = await client.request("PATCH", url)
+    data = loads(response.content)
+    version_guard(data, ['operationResults'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call update_service_principal_entitlement() and print the result."""
+    organization, pat = get_common_env()
+    service_principal_id = require_env("SERVICE_PRINCIPAL_ID", "ID of the service principal.")
+
+    logger = AdoLogger("update_service_principal_entitlement", pat)
+    logger.info("Edit the entitlements (License, Extensions, Projects, Teams etc) for a service principal.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = update_service_principal_entitlement(client, service_principal_id)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
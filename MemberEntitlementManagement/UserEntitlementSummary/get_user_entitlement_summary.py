@@ -10,50 +10,68 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/member-entitlement-management/user-entitlement-summary/get?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_user_entitlement_summary", PAT)
-logger.info("Get summary of Licenses, Extension, Projects, Groups and their assignments in the collection.")
+def get_user_entitlement_summary(client) -> dict:
+    """
+    Get summary of Licenses, Extension, Projects, Groups and their assignments in the collection.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/userentitlementsummary", API_VERSION, base_host="vsaex.dev.azure.com")
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/userentitlementsummary", API_VERSION, base_host="vsaex.dev.azure.com")
+    response = client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['availableAccessLevels', 'defaultAccessLevel'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['availableAccessLevels', 'defaultAccessLevel'], API_VERSION)
+async def get_user_entitlement_summary_async(client) -> dict:
+    """Async variant of get_user_entitlement_summary() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/userentitlementsummary", API_VERSION, base_host="vsaex.dev.azure.com")
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['availableAccessLevels', 'defaultAccessLevel'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_user_entitlement_summary() and print the result."""
+    organization, pat = get_common_env()
+
+    logger = AdoLogger("get_user_entitlement_summary", pat)
+    logger.info("Get summary of Licenses, Extension, Projects, Groups and their assignments in the collection.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = get_user_entitlement_summary(client)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,47 +10,82 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/notification/diagnostic-logs/list?view=azure-devops-rest-7.2
 """
 
-import json
+import argparse
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-SOURCE = get_env_or_exit("SOURCE", "ID specifying which type of logs to check diagnostics for.")
-ENTRY_ID = get_env_or_exit("ENTRY_ID", "The ID of the specific log to query for.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("list_diagnostic_logs", PAT)
-logger.info("Get a list of diagnostic logs for this service.")
+def list_diagnostic_logs(client, source: str, entry_id: str) -> dict:
+    """
+    Get a list of diagnostic logs for this service.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/notification/diagnosticlogs/{SOURCE}/entries/{ENTRY_ID}", API_VERSION, base_host="dev.azure.com")
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        source: ID specifying which type of logs to check diagnostics for.
+        entry_id: The ID of the specific log to query for.
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/notification/diagnosticlogs/{source}/entries/{entry_id}", API_VERSION)
+    response = client.request("GET", url)
+    data = loads(response.content)
+    return data
+
+
+async def list_diagnostic_logs_async(client, source: str, entry_id: str) -> dict:
+    """Async variant of list_diagnostic_logs() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/notification/diagnosticlogs/{source}/entries/{entry_id}", API_VERSION)
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call list_diagnostic_logs() and print the result."""
+    organization, pat = get_common_env()
+    source = require_env("SOURCE", "ID specifying which type of logs to check diagnostics for.")
+    entry_id = require_env("ENTRY_ID", "The ID of the specific log to query for.")
+
+    parser = argparse.ArgumentParser(description="Get a list of diagnostic logs for this service.")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("list_diagnostic_logs", pat)
+    logger.info("Get a list of diagnostic logs for this service.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        items = items_of(list_diagnostic_logs(client, source, entry_id), "value")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    data = list_diagnostic_logs(client, source, entry_id)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
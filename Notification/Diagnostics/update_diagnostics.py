@@ -11,69 +11,90 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/notification/diagn
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-SUBSCRIPTION_ID = get_env_or_exit("SUBSCRIPTION_ID", "The id of the notifications subscription.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Update the diagnostics settings for a subscription.")
-parser.add_argument("--delivery-results", required=False, help="Diagnostics settings for retaining delivery results. Used for Service Hooks subscriptions.")
-parser.add_argument("--delivery-tracing", required=False, help="Diagnostics settings for troubleshooting notification delivery.")
-parser.add_argument("--evaluation-tracing", required=False, help="Diagnostics settings for troubleshooting event matching.")
-args = parser.parse_args()
+def update_diagnostics(client, subscription_id: str, *, delivery_results: Optional[str] = None, delivery_tracing: Optional[str] = None, evaluation_tracing: Optional[str] = None) -> dict:
+    """
+    Update the diagnostics settings for a subscription.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        subscription_id: The id of the notifications subscription.
+        delivery_results: Diagnostics settings for retaining delivery results. Used for Service Hooks subscriptions.
+        delivery_tracing: Diagnostics settings for troubleshooting notification delivery.
+        evaluation_tracing: Diagnostics settings for troubleshooting event matching.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "deliveryResults": delivery_results,
+        "deliveryTracing": delivery_tracing,
+        "evaluationTracing": evaluation_tracing,
+    }
+    url = build_url(client.organization, f"_apis/notification/subscriptions/{subscription_id}/diagnostics", API_VERSION)
+    response = client.request("PUT", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['deliveryResults', 'deliveryTracing'], API_VERSION)
+    return data
+
+
+async def update_diagnostics_async(client, subscription_id: str, *, delivery_results: Optional[str] = None, delivery_tracing: Optional[str] = None, evaluation_tracing: Optional[str] = None) -> dict:
+    """Async variant of update_diagnostics() for use with AsyncAdoClient."""
+    body = {
+        "deliveryResults": delivery_results,
+        "deliveryTracing": delivery_tracing,
+        "evaluationTracing": evaluation_tracing,
+    }
+    url = build_url(client.organization, f"_apis/notification/subscriptions/{subscription_id}/diagnostics", API_VERSION)
+    response = await client.request("PUT", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['deliveryResults', 'deliveryTracing'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_diagnostics", PAT)
-logger.info("Update the diagnostics settings for a subscription.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "deliveryResults": args.delivery_results,
-    "deliveryTracing": args.delivery_tracing,
-    "evaluationTracing": args.evaluation_tracing,
-}
+def main() -> None:
+    """Read env vars / flags, call update_diagnostics() and print the result."""
+    organization, pat = get_common_env()
+    subscription_id = require_env("SUBSCRIPTION_ID", "The id of the notifications subscription.")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/notification/subscriptions/{SUBSCRIPTION_ID}/diagnostics", API_VERSION, base_host="dev.azure.com")
-logger.info(f"PUT {url}")
+    parser = argparse.ArgumentParser(description="Update the diagnostics settings for a subscription.")
+    parser.add_argument("--delivery-results", required=False, help="Diagnostics settings for retaining delivery results. Used for Service Hooks subscriptions.")
+    parser.add_argument("--delivery-tracing", required=False, help="Diagnostics settings for troubleshooting notification delivery.")
+    parser.add_argument("--evaluation-tracing", required=False, help="Diagnostics settings for troubleshooting event matching.")
+    args = parser.parse_args()
 
-response = execute_request("PUT", url, HEADERS, body=body)
+    logger = AdoLogger("update_diagnostics", pat)
+    logger.info("Update the diagnostics settings for a subscription.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_diagnostics(client, subscription_id, delivery_results=args.delivery_results, delivery_tracing=args.delivery_tracing, evaluation_tracing=args.evaluation_tracing)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['deliveryResults', 'deliveryTracing'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,64 +11,80 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/notification/setti
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Update for Settings")
-parser.add_argument("--default-group-delivery-preference", required=False, help="defaultGroupDeliveryPreference")
-args = parser.parse_args()
+def update_settings(client, *, default_group_delivery_preference: Optional[str] = None) -> dict:
+    """
+    Update for Settings
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        default_group_delivery_preference: defaultGroupDeliveryPreference
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "defaultGroupDeliveryPreference": default_group_delivery_preference,
+    }
+    url = build_url(client.organization, f"_apis/notification/settings", API_VERSION)
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['defaultGroupDeliveryPreference'], API_VERSION)
+    return data
+
+
+async def update_settings_async(client, *, default_group_delivery_preference: Optional[str] = None) -> dict:
+    """Async variant of update_settings() for use with AsyncAdoClient."""
+    body = {
+        "defaultGroupDeliveryPreference": default_group_delivery_preference,
+    }
+    url = build_url(client.organization, f"_apis/notification/settings", API_VERSION)
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['defaultGroupDeliveryPreference'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_settings", PAT)
-logger.info("Update for Settings")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "defaultGroupDeliveryPreference": args.default_group_delivery_preference,
-}
+def main() -> None:
+    """Read env vars / flags, call update_settings() and print the result."""
+    organization, pat = get_common_env()
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/notification/settings", API_VERSION, base_host="dev.azure.com")
-logger.info(f"PATCH {url}")
+    parser = argparse.ArgumentParser(description="Update for Settings")
+    parser.add_argument("--default-group-delivery-preference", required=False, help="defaultGroupDeliveryPreference")
+    args = parser.parse_args()
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+    logger = AdoLogger("update_settings", pat)
+    logger.info("Update for Settings")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_settings(client, default_group_delivery_preference=args.default_group_delivery_preference)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['defaultGroupDeliveryPreference'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
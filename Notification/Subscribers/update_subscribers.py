@@ -11,68 +11,87 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/notification/subsc
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-SUBSCRIBER_ID = get_env_or_exit("SUBSCRIBER_ID", "ID of the user or group.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Update delivery preferences of a notifications subscriber.")
-parser.add_argument("--delivery-preference", required=False, help="New delivery preference for the subscriber (indicates how the subscriber should be notified).")
-parser.add_argument("--preferred-email-address", required=False, help="New preferred email address for the subscriber. Specify an empty string to clear the current addr...")
-args = parser.parse_args()
+def update_subscribers(client, subscriber_id: str, *, delivery_preference: Optional[str] = None, preferred_email_address: Optional[str] = None) -> dict:
+    """
+    Update delivery preferences of a notifications subscriber.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        subscriber_id: ID of the user or group.
+        delivery_preference: New delivery preference for the subscriber (indicates how the subscriber should be notified).
+        preferred_email_address: New preferred email address for the subscriber. Specify an empty string to clear the current addr...
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "deliveryPreference": delivery_preference,
+        "preferredEmailAddress": preferred_email_address,
+    }
+    url = build_url(client.organization, f"_apis/notification/subscribers/{subscriber_id}", API_VERSION)
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'deliveryPreference'], API_VERSION)
+    return data
+
+
+async def update_subscribers_async(client, subscriber_id: str, *, delivery_preference: Optional[str] = None, preferred_email_address: Optional[str] = None) -> dict:
+    """Async variant of update_subscribers() for use with AsyncAdoClient."""
+    body = {
+        "deliveryPreference": delivery_preference,
+        "preferredEmailAddress": preferred_email_address,
+    }
+    url = build_url(client.organization, f"_apis/notification/subscribers/{subscriber_id}", API_VERSION)
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'deliveryPreference'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_subscribers", PAT)
-logger.info("Update delivery preferences of a notifications subscriber.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "deliveryPreference": args.delivery_preference,
-    "preferredEmailAddress": args.preferred_email_address,
-}
+def main() -> None:
+    """Read env vars / flags, call update_subscribers() and print the result."""
+    organization, pat = get_common_env()
+    subscriber_id = require_env("SUBSCRIBER_ID", "ID of the user or group.")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/notification/subscribers/{SUBSCRIBER_ID}", API_VERSION, base_host="dev.azure.com")
-logger.info(f"PATCH {url}")
+    parser = argparse.ArgumentParser(description="Update delivery preferences of a notifications subscriber.")
+    parser.add_argument("--delivery-preference", required=False, help="New delivery preference for the subscriber (indicates how the subscriber should be notified).")
+    parser.add_argument("--preferred-email-address", required=False, help="New preferred email address for the subscriber. Specify an empty string to clear the current addr...")
+    args = parser.parse_args()
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+    logger = AdoLogger("update_subscribers", pat)
+    logger.info("Update delivery preferences of a notifications subscriber.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_subscribers(client, subscriber_id, delivery_preference=args.delivery_preference, preferred_email_address=args.preferred_email_address)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'deliveryPreference'], API_VERSION)
+    print(f"Subscribers ID: {data.get('id', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Subscribers ID: {data.get("id", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
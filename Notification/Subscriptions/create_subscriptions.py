@@ -11,72 +11,96 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/notification/subsc
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Create a new subscription.")
-parser.add_argument("--channel", required=False, help="Channel for delivering notifications triggered by the new subscription.")
-parser.add_argument("--description", required=False, help="Brief description for the new subscription. Typically describes filter criteria which helps ident...")
-parser.add_argument("--filter", required=False, help="Matching criteria for the new subscription. ExpressionFilter")
-parser.add_argument("--scope", required=False, help="The container in which events must be published from in order to be matched by the new subscripti...")
-parser.add_argument("--subscriber", required=False, help="User or group that will receive notifications for events matching the subscription's filter crite...")
-args = parser.parse_args()
+def create_subscriptions(client, *, channel: Optional[str] = None, description: Optional[str] = None, filter: Optional[str] = None, scope: Optional[str] = None, subscriber: Optional[str] = None) -> dict:
+    """
+    Create a new subscription.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        channel: Channel for delivering notifications triggered by the new subscription.
+        description: Brief description for the new subscription. Typically describes filter criteria which helps ident...
+        filter: Matching criteria for the new subscription. ExpressionFilter
+        scope: The container in which events must be published from in order to be matched by the new subscripti...
+        subscriber: User or group that will receive notifications for events matching the subscription's filter crite...
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "channel": channel,
+        "description": description,
+        "filter": filter,
+        "scope": scope,
+        "subscriber": subscriber,
+    }
+    url = build_url(client.organization, f"_apis/notification/subscriptions", API_VERSION)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'adminSettings'], API_VERSION)
+    return data
+
+
+async def create_subscriptions_async(client, *, channel: Optional[str] = None, description: Optional[str] = None, filter: Optional[str] = None, scope: Optional[str] = None, subscriber: Optional[str] = None) -> dict:
+    """Async variant of create_subscriptions() for use with AsyncAdoClient."""
+    body = {
+        "channel": channel,
+        "description": description,
+        "filter": filter,
+        "scope": scope,
+        "subscriber": subscriber,
+    }
+    url = build_url(client.organization, f"_apis/notification/subscriptions", API_VERSION)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'adminSettings'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_subscriptions", PAT)
-logger.info("Create a new subscription.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "channel": args.channel,
-    "description": args.description,
-    "filter": args.filter,
-    "scope": args.scope,
-    "subscriber": args.subscriber,
-}
+def main() -> None:
+    """Read env vars / flags, call create_subscriptions() and print the result."""
+    organization, pat = get_common_env()
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/notification/subscriptions", API_VERSION, base_host="dev.azure.com")
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Create a new subscription.")
+    parser.add_argument("--channel", required=False, help="Channel for delivering notifications triggered by the new subscription.")
+    parser.add_argument("--description", required=False, help="Brief description for the new subscription. Typically describes filter criteria which helps ident...")
+    parser.add_argument("--filter", required=False, help="Matching criteria for the new subscription. ExpressionFilter")
+    parser.add_argument("--scope", required=False, help="The container in which events must be published from in order to be matched by the new subscripti...")
+    parser.add_argument("--subscriber", required=False, help="User or group that will receive notifications for events matching the subscription's filter crite...")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_subscriptions", pat)
+    logger.info("Create a new subscription.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_subscriptions(client, channel=args.channel, description=args.description, filter=args.filter, scope=args.scope, subscriber=args.subscriber)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'adminSettings'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
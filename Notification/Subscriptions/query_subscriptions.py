@@ -11,61 +11,90 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/notification/subsc
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Query for subscriptions.")
-parser.add_argument("--conditions", required=False, help="One or more conditions to query on. If more than 2 conditions are specified, the combined results...")
-parser.add_argument("--query-flags", required=False, help="Flags the refine the types of subscriptions that will be returned from the query.")
-args = parser.parse_args()
+def query_subscriptions(client, *, conditions: Optional[str] = None, query_flags: Optional[str] = None) -> dict:
+    """
+    Query for subscriptions.
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("query_subscriptions", PAT)
-logger.info("Query for subscriptions.")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        conditions: One or more conditions to query on. If more than 2 conditions are specified, the combined results...
+        query_flags: Flags the refine the types of subscriptions that will be returned from the query.
 
-# ---------------------------------------------------------------------------
-# Request body
-# ---------------------------------------------------------------------------
-body = {
-    "conditions": args.conditions,
-    "queryFlags": args.query_flags,
-}
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "conditions": conditions,
+        "queryFlags": query_flags,
+    }
+    url = build_url(client.organization, f"_apis/notification/subscriptionquery", API_VERSION)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/notification/subscriptionquery", API_VERSION, base_host="dev.azure.com")
-logger.info(f"POST {url}")
 
-response = execute_request("POST", url, HEADERS, body=body)
+async def query_subscriptions_async(client, *, conditions: Optional[str] = None, query_flags: Optional[str] = None) -> dict:
+    """Async variant of query_subscriptions() for use with AsyncAdoClient."""
+    body = {
+        "conditions": conditions,
+        "queryFlags": query_flags,
+    }
+    url = build_url(client.organization, f"_apis/notification/subscriptionquery", API_VERSION)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call query_subscriptions() and print the result."""
+    organization, pat = get_common_env()
+
+    parser = argparse.ArgumentParser(description="Query for subscriptions.")
+    parser.add_argument("--conditions", required=False, help="One or more conditions to query on. If more than 2 conditions are specified, the combined results...")
+    parser.add_argument("--query-flags", required=False, help="Flags the refine the types of subscriptions that will be returned from the query.")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("query_subscriptions", pat)
+    logger.info("Query for subscriptions.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        items = items_of(query_subscriptions(client, conditions=args.conditions, query_flags=args.query_flags), "value")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    data = query_subscriptions(client, conditions=args.conditions, query_flags=args.query_flags)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,66 +11,84 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/notification/subsc
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-SUBSCRIPTION_ID = get_env_or_exit("SUBSCRIPTION_ID", "subscriptionId")
-USER_ID = get_env_or_exit("USER_ID", "ID of the user")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Update the specified user's settings for the specified subscription.")
-parser.add_argument("--opted-out", required=False, help="Indicates whether the user will receive notifications for the associated group subscription.")
-args = parser.parse_args()
+def update_subscription_user_settings(client, subscription_id: str, user_id: str, *, opted_out: Optional[str] = None) -> dict:
+    """
+    Update the specified user's settings for the specified subscription.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        subscription_id: subscriptionId
+        user_id: ID of the user
+        opted_out: Indicates whether the user will receive notifications for the associated group subscription.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "optedOut": opted_out,
+    }
+    url = build_url(client.organization, f"_apis/notification/Subscriptions/{subscription_id}/usersettings/{user_id}", API_VERSION)
+    response = client.request("PUT", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['optedOut'], API_VERSION)
+    return data
+
+
+async def update_subscription_user_settings_async(client, subscription_id: str, user_id: str, *, opted_out: Optional[str] = None) -> dict:
+    """Async variant of update_subscription_user_settings() for use with AsyncAdoClient."""
+    body = {
+        "optedOut": opted_out,
+    }
+    url = build_url(client.organization, f"_apis/notification/Subscriptions/{subscription_id}/usersettings/{user_id}", API_VERSION)
+    response = await client.request("PUT", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['optedOut'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_subscription_user_settings", PAT)
-logger.info("Update the specified user's settings for the specified subscription.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "optedOut": args.opted_out,
-}
+def main() -> None:
+    """Read env vars / flags, call update_subscription_user_settings() and print the result."""
+    organization, pat = get_common_env()
+    subscription_id = require_env("SUBSCRIPTION_ID", "subscriptionId")
+    user_id = require_env("USER_ID", "ID of the user")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/notification/Subscriptions/{SUBSCRIPTION_ID}/usersettings/{USER_ID}", API_VERSION, base_host="dev.azure.com")
-logger.info(f"PUT {url}")
+    parser = argparse.ArgumentParser(description="Update the specified user's settings for the specified subscription.")
+    parser.add_argument("--opted-out", required=False, help="Indicates whether the user will receive notifications for the associated group subscription.")
+    args = parser.parse_args()
 
-response = execute_request("PUT", url, HEADERS, body=body)
+    logger = AdoLogger("update_subscription_user_settings", pat)
+    logger.info("Update the specified user's settings for the specified subscription.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_subscription_user_settings(client, subscription_id, user_id, opted_out=args.opted_out)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['optedOut'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
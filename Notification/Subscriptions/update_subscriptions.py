@@ -11,75 +11,102 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/notification/subsc
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-SUBSCRIPTION_ID = get_env_or_exit("SUBSCRIPTION_ID", "subscriptionId")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Update an existing subscription.")
-parser.add_argument("--admin-settings", required=False, help="Admin-managed settings for the subscription. Only applies to subscriptions where the subscriber i...")
-parser.add_argument("--channel", required=False, help="Channel for delivering notifications triggered by the subscription.")
-parser.add_argument("--description", required=False, help="Updated description for the subscription. Typically describes filter criteria which helps identit...")
-parser.add_argument("--filter", required=False, help="Matching criteria for the subscription. ExpressionFilter")
-parser.add_argument("--scope", required=False, help="The container in which events must be published from in order to be matched by the new subscripti...")
-parser.add_argument("--status", required=False, help="Updated status for the subscription. Typically used to enable or disable a subscription.")
-args = parser.parse_args()
+def update_subscriptions(client, subscription_id: str, *, admin_settings: Optional[str] = None, channel: Optional[str] = None, description: Optional[str] = None, filter: Optional[str] = None, scope: Optional[str] = None, status: Optional[str] = None) -> dict:
+    """
+    Update an existing subscription.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        subscription_id: subscriptionId
+        admin_settings: Admin-managed settings for the subscription. Only applies to subscriptions where the subscriber i...
+        channel: Channel for delivering notifications triggered by the subscription.
+        description: Updated description for the subscription. Typically describes filter criteria which helps identit...
+        filter: Matching criteria for the subscription. ExpressionFilter
+        scope: The container in which events must be published from in order to be matched by the new subscripti...
+        status: Updated status for the subscription. Typically used to enable or disable a subscription.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "adminSettings": admin_settings,
+        "channel": channel,
+        "description": description,
+        "filter": filter,
+        "scope": scope,
+        "status": status,
+    }
+    url = build_url(client.organization, f"_apis/notification/subscriptions/{subscription_id}", API_VERSION)
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'adminSettings'], API_VERSION)
+    return data
+
+
+async def update_subscriptions_async(client, subscription_id: str, *, admin_settings: Optional[str] = None, channel: Optional[str] = None, description: Optional[str] = None, filter: Optional[str] = None, scope: Optional[str] = None, status: Optional[str] = None) -> dict:
+    """Async variant of update_subscriptions() for use with AsyncAdoClient."""
+    body = {
+        "adminSettings": admin_settings,
+        "channel": channel,
+        "description": description,
+        "filter": filter,
+        "scope": scope,
+        "status": status,
+    }
+    url = build_url(client.organization, f"_apis/notification/subscriptions/{subscription_id}", API_VERSION)
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'adminSettings'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_subscriptions", PAT)
-logger.info("Update an existing subscription.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "adminSettings": args.admin_settings,
-    "channel": args.channel,
-    "description": args.description,
-    "filter": args.filter,
-    "scope": args.scope,
-    "status": args.status,
-}
+def main() -> None:
+    """Read env vars / flags, call update_subscriptions() and print the result."""
+    organization, pat = get_common_env()
+    subscription_id = require_env("SUBSCRIPTION_ID", "subscriptionId")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/notification/subscriptions/{SUBSCRIPTION_ID}", API_VERSION, base_host="dev.azure.com")
-logger.info(f"PATCH {url}")
+    parser = argparse.ArgumentParser(description="Update an existing subscription.")
+    parser.add_argument("--admin-settings", required=False, help="Admin-managed settings for the subscription. Only applies to subscriptions where the subscriber i...")
+    parser.add_argument("--channel", required=False, help="Channel for delivering notifications triggered by the subscription.")
+    parser.add_argument("--description", required=False, help="Updated description for the subscription. Typically describes filter criteria which helps identit...")
+    parser.add_argument("--filter", required=False, help="Matching criteria for the subscription. ExpressionFilter")
+    parser.add_argument("--scope", required=False, help="The container in which events must be published from in order to be matched by the new subscripti...")
+    parser.add_argument("--status", required=False, help="Updated status for the subscription. Typically used to enable or disable a subscription.")
+    args = parser.parse_args()
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+    logger = AdoLogger("update_subscriptions", pat)
+    logger.info("Update an existing subscription.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_subscriptions(client, subscription_id, admin_settings=args.admin_settings, channel=args.channel, description=args.description, filter=args.filter, scope=args.scope, status=args.status)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'adminSettings'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
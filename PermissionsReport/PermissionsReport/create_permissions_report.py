@@ -11,68 +11,88 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/permissions-report
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Request a permissions report to be created asyncronously")
-parser.add_argument("--descriptors", required=False, help="List of groups and users to fetch permissions on. An empty list will fetch all groups and users i...")
-parser.add_argument("--report-name", required=False, help="Name of the report to create, make it unique")
-parser.add_argument("--resources", required=False, help="List of resources to fetch permisions on")
-args = parser.parse_args()
+def create_permissions_report(client, *, descriptors: Optional[str] = None, report_name: Optional[str] = None, resources: Optional[str] = None) -> dict:
+    """
+    Request a permissions report to be created asyncronously
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        descriptors: List of groups and users to fetch permissions on. An empty list will fetch all groups and users i...
+        report_name: Name of the report to create, make it unique
+        resources: List of resources to fetch permisions on
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "descriptors": descriptors,
+        "reportName": report_name,
+        "resources": resources,
+    }
+    url = build_url(client.organization, f"_apis/permissionsreport", API_VERSION)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['links'], API_VERSION)
+    return data
+
+
+async def create_permissions_report_async(client, *, descriptors: Optional[str] = None, report_name: Optional[str] = None, resources: Optional[str] = None) -> dict:
+    """Async variant of create_permissions_report() for use with AsyncAdoClient."""
+    body = {
+        "descriptors": descriptors,
+        "reportName": report_name,
+        "resources": resources,
+    }
+    url = build_url(client.organization, f"_apis/permissionsreport", API_VERSION)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['links'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_permissions_report", PAT)
-logger.info("Request a permissions report to be created asyncronously")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "descriptors": args.descriptors,
-    "reportName": args.report_name,
-    "resources": args.resources,
-}
+def main() -> None:
+    """Read env vars / flags, call create_permissions_report() and print the result."""
+    organization, pat = get_common_env()
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/permissionsreport", API_VERSION)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Request a permissions report to be created asyncronously")
+    parser.add_argument("--descriptors", required=False, help="List of groups and users to fetch permissions on. An empty list will fetch all groups and users i...")
+    parser.add_argument("--report-name", required=False, help="Name of the report to create, make it unique")
+    parser.add_argument("--resources", required=False, help="List of resources to fetch permisions on")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_permissions_report", pat)
+    logger.info("Request a permissions report to be created asyncronously")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_permissions_report(client, descriptors=args.descriptors, report_name=args.report_name, resources=args.resources)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['links'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
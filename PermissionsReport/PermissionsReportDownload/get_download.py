@@ -10,46 +10,75 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/permissions-report/permissions-report-download/download?view=azure-devops-rest-7.2
 """
 
-import json
+import argparse
 import os
 import sys
+from typing import BinaryIO, Union
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.async_http_client import astream_to
+from _shared.download import download_file
+from _shared.http_client import AdoClient, build_url
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-RESOURCE_ID = get_env_or_exit("RESOURCE_ID", "The ID (GUID) of the permissions report")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_download", PAT)
-logger.info("Download the json results of a permissions report")
+def get_download(client, id: str, *, destination: Union[str, BinaryIO]) -> int:
+    """
+    Download the json results of a permissions report
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        id: The ID (GUID) of the permissions report
+        destination: Output path or binary file (e.g. sys.stdout.buffer).
+
+    Returns:
+        Bytes written. A path destination is fetched in parallel ranged
+        segments and resumes after an interruption (see _shared.download).
+    """
+    url = build_url(client.organization, f"_apis/permissionsreport/{id}/download", API_VERSION)
+    return download_file(client, url, destination, accept="application/octet-stream")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/permissionsreport/{RESOURCE_ID}/download", API_VERSION)
-logger.info(f"GET {url}")
 
-response = execute_request("GET", url, HEADERS)
+async def get_download_async(client, id: str, *, destination: Union[str, BinaryIO]) -> int:
+    """Async variant of get_download() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/permissionsreport/{id}/download", API_VERSION)
+    response = await client.request("GET", url, stream=True, accept="application/octet-stream")
+    return await astream_to(response, destination)
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_download() and print the result."""
+    organization, pat = get_common_env()
+    id = require_env("RESOURCE_ID", "The ID (GUID) of the permissions report")
+
+    parser = argparse.ArgumentParser(description="Download the json results of a permissions report")
+    parser.add_argument("--output", help="Write the content to this file (default: stdout)")
+    args = parser.parse_args()
+
+    logger = AdoLogger("get_download", pat)
+    logger.info("Download the json results of a permissions report")
+    client = AdoClient(organization, pat, logger=logger)
+
+    written = get_download(client, id, destination=args.output or sys.stdout.buffer)
+    logger.info(f"Downloaded {written} bytes")
+    if args.output:
+        print(f"Saved {written} bytes to {args.output}")
+
+
+if __name__ == "__main__":
+    run_cli(main)
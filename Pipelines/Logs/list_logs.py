@@ -10,53 +10,74 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/pipelines/logs/list?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-PIPELINE_ID = get_env_or_exit("PIPELINE_ID", "ID of the pipeline.")
-RUN_ID = get_env_or_exit("RUN_ID", "ID of the run of that pipeline.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("list_logs", PAT)
-logger.info("Get a list of logs from a pipeline run.")
+def list_logs(client, project: str, pipeline_id: str, run_id: str) -> dict:
+    """
+    Get a list of logs from a pipeline run.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/pipelines/{PIPELINE_ID}/runs/{RUN_ID}/logs", API_VERSION, project=PROJECT_ID)
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        pipeline_id: ID of the pipeline.
+        run_id: ID of the run of that pipeline.
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/pipelines/{pipeline_id}/runs/{run_id}/logs", API_VERSION, project=project)
+    response = client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['logs', 'signedContent'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['logs', 'signedContent'], API_VERSION)
+async def list_logs_async(client, project: str, pipeline_id: str, run_id: str) -> dict:
+    """Async variant of list_logs() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/pipelines/{pipeline_id}/runs/{run_id}/logs", API_VERSION, project=project)
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['logs', 'signedContent'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call list_logs() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    pipeline_id = require_env("PIPELINE_ID", "ID of the pipeline.")
+    run_id = require_env("RUN_ID", "ID of the run of that pipeline.")
+
+    logger = AdoLogger("list_logs", pat)
+    logger.info("Get a list of logs from a pipeline run.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = list_logs(client, project, pipeline_id, run_id)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,69 +11,90 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/pipelines/pipeline
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Create a pipeline.")
-parser.add_argument("--configuration", required=False, help="Configuration parameters of the pipeline.")
-parser.add_argument("--folder", required=False, help="Folder of the pipeline.")
-parser.add_argument("--name", required=False, help="Name of the pipeline.")
-args = parser.parse_args()
+def create_pipelines(client, project: str, *, configuration: Optional[str] = None, folder: Optional[str] = None, name: Optional[str] = None) -> dict:
+    """
+    Create a pipeline.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        configuration: Configuration parameters of the pipeline.
+        folder: Folder of the pipeline.
+        name: Name of the pipeline.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "configuration": configuration,
+        "folder": folder,
+        "name": name,
+    }
+    url = build_url(client.organization, f"_apis/pipelines", API_VERSION, project=project)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['configuration', 'url'], API_VERSION)
+    return data
+
+
+async def create_pipelines_async(client, project: str, *, configuration: Optional[str] = None, folder: Optional[str] = None, name: Optional[str] = None) -> dict:
+    """Async variant of create_pipelines() for use with AsyncAdoClient."""
+    body = {
+        "configuration": configuration,
+        "folder": folder,
+        "name": name,
+    }
+    url = build_url(client.organization, f"_apis/pipelines", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['configuration', 'url'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_pipelines", PAT)
-logger.info("Create a pipeline.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "configuration": args.configuration,
-    "folder": args.folder,
-    "name": args.name,
-}
+def main() -> None:
+    """Read env vars / flags, call create_pipelines() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/pipelines", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Create a pipeline.")
+    parser.add_argument("--configuration", required=False, help="Configuration parameters of the pipeline.")
+    parser.add_argument("--folder", required=False, help="Folder of the pipeline.")
+    parser.add_argument("--name", required=False, help="Name of the pipeline.")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_pipelines", pat)
+    logger.info("Create a pipeline.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_pipelines(client, project, configuration=args.configuration, folder=args.folder, name=args.name)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['configuration', 'url'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -58,5 +58,5 @@ version_guard(data, ['id', 'state'], API_VERSION)
 # ---------------------------------------------------------------------------
 # Output
 # ---------------------------------------------------------------------------
-print(f"Pipeline run {data.get("id", "N/A")} queued — state: {data.get("state", "N/A")}")
+print(f"Pipeline run {data.get('id', 'N/A')} queued — state: {data.get('state', 'N/A')}")
 print(json.dumps(data, indent=2))
@@ -11,76 +11,104 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/pipelines/runs/run
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-PIPELINE_ID = get_env_or_exit("PIPELINE_ID", "The pipeline ID.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Runs a pipeline.")
-parser.add_argument("--preview-run", required=False, help="If true, don't actually create a new run. Instead, return the final YAML document after parsing t...")
-parser.add_argument("--resources", required=False, help="The resources the run requires.")
-parser.add_argument("--stages-to-skip", required=False, help="stagesToSkip")
-parser.add_argument("--template-parameters", required=False, help="templateParameters")
-parser.add_argument("--variables", required=False, help="variables")
-parser.add_argument("--yaml-override", required=False, help="If you use the preview run option, you may optionally supply different YAML. This allows you to p...")
-args = parser.parse_args()
+def run_pipeline(client, project: str, pipeline_id: str, *, preview_run: Optional[str] = None, resources: Optional[str] = None, stages_to_skip: Optional[str] = None, template_parameters: Optional[str] = None, variables: Optional[str] = None, yaml_override: Optional[str] = None) -> dict:
+    """
+    Runs a pipeline.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        pipeline_id: The pipeline ID.
+        preview_run: If true, don't actually create a new run. Instead, return the final YAML document after parsing t...
+        resources: The resources the run requires.
+        stages_to_skip: stagesToSkip
+        template_parameters: templateParameters
+        variables: variables
+        yaml_override: If you use the preview run option, you may optionally supply different YAML. This allows you to p...
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "previewRun": preview_run,
+        "resources": resources,
+        "stagesToSkip": stages_to_skip,
+        "templateParameters": template_parameters,
+        "variables": variables,
+        "yamlOverride": yaml_override,
+    }
+    url = build_url(client.organization, f"_apis/pipelines/{pipeline_id}/runs", API_VERSION, project=project)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['createdDate', 'finalYaml'], API_VERSION)
+    return data
+
+
+async def run_pipeline_async(client, project: str, pipeline_id: str, *, preview_run: Optional[str] = None, resources: Optional[str] = None, stages_to_skip: Optional[str] = None, template_parameters: Optional[str] = None, variables: Optional[str] = None, yaml_override: Optional[str] = None) -> dict:
+    """Async variant of run_pipeline() for use with AsyncAdoClient."""
+    body = {
+        "previewRun": preview_run,
+        "resources": resources,
+        "stagesToSkip": stages_to_skip,
+        "templateParameters": template_parameters,
+        "variables": variables,
+        "yamlOverride": yaml_override,
+    }
+    url = build_url(client.organization, f"_apis/pipelines/{pipeline_id}/runs", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['createdDate', 'finalYaml'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("run_pipeline", PAT)
-logger.info("Runs a pipeline.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "previewRun": args.preview_run,
-    "resources": args.resources,
-    "stagesToSkip": args.stages_to_skip,
-    "templateParameters": args.template_parameters,
-    "variables": args.variables,
-    "yamlOverride": args.yaml_override,
-}
+def main() -> None:
+    """Read env vars / flags, call run_pipeline() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    pipeline_id = require_env("PIPELINE_ID", "The pipeline ID.")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/pipelines/{PIPELINE_ID}/runs", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Runs a pipeline.")
+    parser.add_argument("--preview-run", required=False, help="If true, don't actually create a new run. Instead, return the final YAML document after parsing t...")
+    parser.add_argument("--resources", required=False, help="The resources the run requires.")
+    parser.add_argument("--stages-to-skip", required=False, help="stagesToSkip")
+    parser.add_argument("--template-parameters", required=False, help="templateParameters")
+    parser.add_argument("--variables", required=False, help="variables")
+    parser.add_argument("--yaml-override", required=False, help="If you use the preview run option, you may optionally supply different YAML. This allows you to p...")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("run_pipeline", pat)
+    logger.info("Runs a pipeline.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = run_pipeline(client, project, pipeline_id, preview_run=args.preview_run, resources=args.resources, stages_to_skip=args.stages_to_skip, template_parameters=args.template_parameters, variables=args.variables, yaml_override=args.yaml_override)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['createdDate', 'finalYaml'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,73 +11,98 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/policy/configurati
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Create a policy configuration of a given policy type.")
-parser.add_argument("--created-by", required=False, help="A reference to the identity that created the policy.")
-parser.add_argument("--created-date", required=False, help="The date and time when the policy was created.")
-parser.add_argument("--is-blocking", required=False, help="Indicates whether the policy is blocking.")
-parser.add_argument("--is-deleted", required=False, help="Indicates whether the policy has been (soft) deleted.")
-parser.add_argument("--is-enabled", required=False, help="Indicates whether the policy is enabled.")
-args = parser.parse_args()
+def create_configurations(client, project: str, *, created_by: Optional[str] = None, created_date: Optional[str] = None, is_blocking: Optional[str] = None, is_deleted: Optional[str] = None, is_enabled: Optional[str] = None) -> dict:
+    """
+    Create a policy configuration of a given policy type.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        created_by: A reference to the identity that created the policy.
+        created_date: The date and time when the policy was created.
+        is_blocking: Indicates whether the policy is blocking.
+        is_deleted: Indicates whether the policy has been (soft) deleted.
+        is_enabled: Indicates whether the policy is enabled.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "createdBy": created_by,
+        "createdDate": created_date,
+        "isBlocking": is_blocking,
+        "isDeleted": is_deleted,
+        "isEnabled": is_enabled,
+    }
+    url = build_url(client.organization, f"_apis/policy/configurations", API_VERSION, project=project)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['createdBy', 'createdDate'], API_VERSION)
+    return data
+
+
+async def create_configurations_async(client, project: str, *, created_by: Optional[str] = None, created_date: Optional[str] = None, is_blocking: Optional[str] = None, is_deleted: Optional[str] = None, is_enabled: Optional[str] = None) -> dict:
+    """Async variant of create_configurations() for use with AsyncAdoClient."""
+    body = {
+        "createdBy": created_by,
+        "createdDate": created_date,
+        "isBlocking": is_blocking,
+        "isDeleted": is_deleted,
+        "isEnabled": is_enabled,
+    }
+    url = build_url(client.organization, f"_apis/policy/configurations", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['createdBy', 'createdDate'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_configurations", PAT)
-logger.info("Create a policy configuration of a given policy type.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "createdBy": args.created_by,
-    "createdDate": args.created_date,
-    "isBlocking": args.is_blocking,
-    "isDeleted": args.is_deleted,
-    "isEnabled": args.is_enabled,
-}
+def main() -> None:
+    """Read env vars / flags, call create_configurations() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/policy/configurations", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Create a policy configuration of a given policy type.")
+    parser.add_argument("--created-by", required=False, help="A reference to the identity that created the policy.")
+    parser.add_argument("--created-date", required=False, help="The date and time when the policy was created.")
+    parser.add_argument("--is-blocking", required=False, help="Indicates whether the policy is blocking.")
+    parser.add_argument("--is-deleted", required=False, help="Indicates whether the policy has been (soft) deleted.")
+    parser.add_argument("--is-enabled", required=False, help="Indicates whether the policy is enabled.")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_configurations", pat)
+    logger.info("Create a policy configuration of a given policy type.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_configurations(client, project, created_by=args.created_by, created_date=args.created_date, is_blocking=args.is_blocking, is_deleted=args.is_deleted, is_enabled=args.is_enabled)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['createdBy', 'createdDate'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,52 +10,64 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/policy/configurations/delete?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-CONFIGURATION_ID = get_env_or_exit("CONFIGURATION_ID", "ID of the policy configuration to delete.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("delete_configurations", PAT)
-logger.info("Delete a policy configuration by its ID.")
+def delete_configurations(client, project: str, configuration_id: str) -> None:
+    """
+    Delete a policy configuration by its ID.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/policy/configurations/{CONFIGURATION_ID}", API_VERSION, project=PROJECT_ID)
-logger.info(f"DELETE {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        configuration_id: ID of the policy configuration to delete.
+    """
+    url = build_url(client.organization, f"_apis/policy/configurations/{configuration_id}", API_VERSION, project=project)
+    client.request("DELETE", url, expected_status=204)
+    return None
+
+
+async def delete_configurations_async(client, project: str, configuration_id: str) -> None:
+    """Async variant of delete_configurations() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/policy/configurations/{configuration_id}", API_VERSION, project=project)
+    await client.request("DELETE", url, expected_status=204)
+    return None
 
-response = execute_request("DELETE", url, HEADERS, expected_status=204)
 
 # ---------------------------------------------------------------------------
-# Output — DELETE returns 204 No Content on success
+# CLI
 # ---------------------------------------------------------------------------
-if response.status_code == 204:
+def main() -> None:
+    """Read env vars / flags, call delete_configurations() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    configuration_id = require_env("CONFIGURATION_ID", "ID of the policy configuration to delete.")
+
+    logger = AdoLogger("delete_configurations", pat)
+    logger.info("Delete a policy configuration by its ID.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    delete_configurations(client, project, configuration_id)
     logger.info("Configurations operation completed successfully.")
     print("Configurations operation completed successfully.")
-else:
-    logger.error(f"Unexpected status code: {response.status_code}")
-    print(f"Unexpected status code: {response.status_code}", file=sys.stderr)
-    if response.text:
-        print(response.text)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,53 +10,74 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/policy/revisions/get?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-CONFIGURATION_ID = get_env_or_exit("CONFIGURATION_ID", "The policy configuration ID.")
-REVISION_ID = get_env_or_exit("REVISION_ID", "The revision ID.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_revisions", PAT)
-logger.info("Retrieve a specific revision of a given policy by ID.")
+def get_revisions(client, project: str, configuration_id: str, revision_id: str) -> dict:
+    """
+    Retrieve a specific revision of a given policy by ID.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/policy/configurations/{CONFIGURATION_ID}/revisions/{REVISION_ID}", API_VERSION, project=PROJECT_ID)
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        configuration_id: The policy configuration ID.
+        revision_id: The revision ID.
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/policy/configurations/{configuration_id}/revisions/{revision_id}", API_VERSION, project=project)
+    response = client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['createdBy', 'createdDate'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['createdBy', 'createdDate'], API_VERSION)
+async def get_revisions_async(client, project: str, configuration_id: str, revision_id: str) -> dict:
+    """Async variant of get_revisions() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/policy/configurations/{configuration_id}/revisions/{revision_id}", API_VERSION, project=project)
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['createdBy', 'createdDate'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_revisions() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    configuration_id = require_env("CONFIGURATION_ID", "The policy configuration ID.")
+    revision_id = require_env("REVISION_ID", "The revision ID.")
+
+    logger = AdoLogger("get_revisions", pat)
+    logger.info("Retrieve a specific revision of a given policy by ID.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = get_revisions(client, project, configuration_id, revision_id)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,51 +10,69 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/processadmin/processes/import-process-template?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_import_process_template", PAT)
-logger.info("Imports a process from zip file.")
+def create_import_process_template(client) -> dict:
+    """
+    Imports a process from zip file.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/work/processadmin/processes/import", API_VERSION)
-logger.info(f"POST {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
 
-response = execute_request("POST", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/work/processadmin/processes/import", API_VERSION)
+    response = client.request("POST", url)
+    data = loads(response.content)
+    version_guard(data, ['id', 'checkExistenceResult'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'checkExistenceResult'], API_VERSION)
+async def create_import_process_template_async(client) -> dict:
+    """Async variant of create_import_process_template() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/work/processadmin/processes/import", API_VERSION)
+    response = await client.request("POST", url)
+    data = loads(response.content)
+    version_guard(data, ['id', 'checkExistenceResult'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(f"Processes ID: {data.get("id", "N/A")}")
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call create_import_process_template() and print the result."""
+    organization, pat = get_common_env()
+
+    logger = AdoLogger("create_import_process_template", pat)
+    logger.info("Imports a process from zip file.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = create_import_process_template(client)
+
+    print(f"Processes ID: {data.get('id', 'N/A')}")
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
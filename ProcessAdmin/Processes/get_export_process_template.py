@@ -10,46 +10,75 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/processadmin/processes/export-process-template?view=azure-devops-rest-7.2
 """
 
-import json
+import argparse
 import os
 import sys
+from typing import BinaryIO, Union
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.async_http_client import astream_to
+from _shared.download import download_file
+from _shared.http_client import AdoClient, build_url
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-RESOURCE_ID = get_env_or_exit("RESOURCE_ID", "The ID of the process")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_export_process_template", PAT)
-logger.info("Returns requested process template.")
+def get_export_process_template(client, id: str, *, destination: Union[str, BinaryIO]) -> int:
+    """
+    Returns requested process template.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        id: The ID of the process
+        destination: Output path or binary file (e.g. sys.stdout.buffer).
+
+    Returns:
+        Bytes written. A path destination is fetched in parallel ranged
+        segments and resumes after an interruption (see _shared.download).
+    """
+    url = build_url(client.organization, f"_apis/work/processadmin/processes/export/{id}", API_VERSION)
+    return download_file(client, url, destination, accept="application/zip")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/work/processadmin/processes/export/{RESOURCE_ID}", API_VERSION)
-logger.info(f"GET {url}")
 
-response = execute_request("GET", url, HEADERS)
+async def get_export_process_template_async(client, id: str, *, destination: Union[str, BinaryIO]) -> int:
+    """Async variant of get_export_process_template() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/work/processadmin/processes/export/{id}", API_VERSION)
+    response = await client.request("GET", url, stream=True, accept="application/zip")
+    return await astream_to(response, destination)
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_export_process_template() and print the result."""
+    organization, pat = get_common_env()
+    id = require_env("RESOURCE_ID", "The ID of the process")
+
+    parser = argparse.ArgumentParser(description="Returns requested process template.")
+    parser.add_argument("--output", help="Write the content to this file (default: stdout)")
+    args = parser.parse_args()
+
+    logger = AdoLogger("get_export_process_template", pat)
+    logger.info("Returns requested process template.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    written = get_export_process_template(client, id, destination=args.output or sys.stdout.buffer)
+    logger.info(f"Downloaded {written} bytes")
+    if args.output:
+        print(f"Saved {written} bytes to {args.output}")
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,52 +10,71 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/processadmin/processes/import-process-template-status?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-RESOURCE_ID = get_env_or_exit("RESOURCE_ID", "The ID of the promote job operation")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_import_process_template_status", PAT)
-logger.info("Tells whether promote has completed for the specified promote job ID.")
+def get_import_process_template_status(client, id: str) -> dict:
+    """
+    Tells whether promote has completed for the specified promote job ID.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/work/processadmin/processes/status/{RESOURCE_ID}", API_VERSION)
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        id: The ID of the promote job operation
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/work/processadmin/processes/status/{id}", API_VERSION)
+    response = client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['id', 'complete'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'complete'], API_VERSION)
+async def get_import_process_template_status_async(client, id: str) -> dict:
+    """Async variant of get_import_process_template_status() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/work/processadmin/processes/status/{id}", API_VERSION)
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['id', 'complete'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(f"Processes ID: {data.get("id", "N/A")}")
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_import_process_template_status() and print the result."""
+    organization, pat = get_common_env()
+    id = require_env("RESOURCE_ID", "The ID of the promote job operation")
+
+    logger = AdoLogger("get_import_process_template_status", pat)
+    logger.info("Tells whether promote has completed for the specified promote job ID.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = get_import_process_template_status(client, id)
+
+    print(f"Processes ID: {data.get('id', 'N/A')}")
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,78 +11,107 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/process-definition
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "4.1"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROCESS_ID = get_env_or_exit("PROCESS_ID", "The ID of the process")
-WIT_REF_NAME = get_env_or_exit("WIT_REF_NAME", "The reference name of the work item type")
-GROUP_ID = get_env_or_exit("GROUP_ID", "The ID of the group to add the control to")
-
-# ---------------------------------------------------------------------------
-# CLI arguments
-# ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Creates a control in a group")
-parser.add_argument("--contribution", required=False, help="Contribution for the control.")
-parser.add_argument("--control-type", required=False, help="Type of the control.")
-parser.add_argument("--height", required=False, help="Height of the control, for html controls.")
-parser.add_argument("--id", required=False, help="The id for the layout node.")
-parser.add_argument("--inherited", required=False, help="A value indicating whether this layout node has been inherited from a parent layout. This is expe...")
-parser.add_argument("--is-contribution", required=False, help="A value indicating if the layout node is contribution or not.")
-args = parser.parse_args()
-
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_add", PAT)
-logger.info("Creates a control in a group")
-
-# ---------------------------------------------------------------------------
-# Request body
-# ---------------------------------------------------------------------------
-body = {
-    "contribution": args.contribution,
-    "controlType": args.control_type,
-    "height": args.height,
-    "id": args.id,
-    "inherited": args.inherited,
-    "isContribution": args.is_contribution,
-}
 
 # ---------------------------------------------------------------------------
-# API call
+# API
 # ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/work/processdefinitions/{PROCESS_ID}/workItemTypes/{WIT_REF_NAME}/layout/groups/{GROUP_ID}/controls", API_VERSION)
-logger.info(f"POST {url}")
-
-response = execute_request("POST", url, HEADERS, body=body)
+def create_add(client, process_id: str, wit_ref_name: str, group_id: str, *, contribution: Optional[str] = None, control_type: Optional[str] = None, height: Optional[str] = None, id: Optional[str] = None, inherited: Optional[str] = None, is_contribution: Optional[str] = None) -> dict:
+    """
+    Creates a control in a group
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        process_id: The ID of the process
+        wit_ref_name: The reference name of the work item type
+        group_id: The ID of the group to add the control to
+        contribution: Contribution for the control.
+        control_type: Type of the control.
+        height: Height of the control, for html controls.
+        id: The id for the layout node.
+        inherited: A value indicating whether this layout node has been inherited from a parent layout. This is expe...
+        is_contribution: A value indicating if the layout node is contribution or not.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "contribution": contribution,
+        "controlType": control_type,
+        "height": height,
+        "id": id,
+        "inherited": inherited,
+        "isContribution": is_contribution,
+    }
+    url = build_url(client.organization, f"_apis/work/processdefinitions/{process_id}/workItemTypes/{wit_ref_name}/layout/groups/{group_id}/controls", API_VERSION)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'contribution'], API_VERSION)
+    return data
+
+
+async def create_add_async(client, process_id: str, wit_ref_name: str, group_id: str, *, contribution: Optional[str] = None, control_type: Optional[str] = None, height: Optional[str] = None, id: Optional[str] = None, inherited: Optional[str] = None, is_contribution: Optional[str] = None) -> dict:
+    """Async variant of create_add() for use with AsyncAdoClient."""
+    body = {
+        "contribution": contribution,
+        "controlType": control_type,
+        "height": height,
+        "id": id,
+        "inherited": inherited,
+        "isContribution": is_contribution,
+    }
+    url = build_url(client.organization, f"_apis/work/processdefinitions/{process_id}/workItemTypes/{wit_ref_name}/layout/groups/{group_id}/controls", API_VERSION)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'contribution'], API_VERSION)
+    return data
 
-data = response.json()
-
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'contribution'], API_VERSION)
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(f"Add ID: {data.get("id", "N/A")}")
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call create_add() and print the result."""
+    organization, pat = get_common_env()
+    process_id = require_env("PROCESS_ID", "The ID of the process")
+    wit_ref_name = require_env("WIT_REF_NAME", "The reference name of the work item type")
+    group_id = require_env("GROUP_ID", "The ID of the group to add the control to")
+
+    parser = argparse.ArgumentParser(description="Creates a control in a group")
+    parser.add_argument("--contribution", required=False, help="Contribution for the control.")
+    parser.add_argument("--control-type", required=False, help="Type of the control.")
+    parser.add_argument("--height", required=False, help="Height of the control, for html controls.")
+    parser.add_argument("--id", required=False, help="The id for the layout node.")
+    parser.add_argument("--inherited", required=False, help="A value indicating whether this layout node has been inherited from a parent layout. This is expe...")
+    parser.add_argument("--is-contribution", required=False, help="A value indicating if the layout node is contribution or not.")
+    args = parser.parse_args()
+
+    logger = AdoLogger("create_add", pat)
+    logger.info("Creates a control in a group")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = create_add(client, process_id, wit_ref_name, group_id, contribution=args.contribution, control_type=args.control_type, height=args.height, id=args.id, inherited=args.inherited, is_contribution=args.is_contribution)
+
+    print(f"Add ID: {data.get('id', 'N/A')}")
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
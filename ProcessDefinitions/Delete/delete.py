@@ -10,47 +10,70 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/process-definitions/delete/delete?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "4.1"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROCESS_ID = get_env_or_exit("PROCESS_ID", "The ID of the process")
-BEHAVIOR_ID = get_env_or_exit("BEHAVIOR_ID", "The ID of the behavior")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("delete", PAT)
-logger.info("Removes a behavior in the process.")
+def delete(client, process_id: str, behavior_id: str) -> dict:
+    """
+    Removes a behavior in the process.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        process_id: The ID of the process
+        behavior_id: The ID of the behavior
+
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/work/processdefinitions/{process_id}/behaviors/{behavior_id}", API_VERSION)
+    response = client.request("DELETE", url)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/work/processdefinitions/{PROCESS_ID}/behaviors/{BEHAVIOR_ID}", API_VERSION)
-logger.info(f"DELETE {url}")
 
-response = execute_request("DELETE", url, HEADERS)
+async def delete_async(client, process_id: str, behavior_id: str) -> dict:
+    """Async variant of delete() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/work/processdefinitions/{process_id}/behaviors/{behavior_id}", API_VERSION)
+    response = await client.request("DELETE", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call delete() and print the result."""
+    organization, pat = get_common_env()
+    process_id = require_env("PROCESS_ID", "The ID of the process")
+    behavior_id = require_env("BEHAVIOR_ID", "The ID of the behavior")
+
+    logger = AdoLogger("delete", pat)
+    logger.info("Removes a behavior in the process.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = delete(client, process_id, behavior_id)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
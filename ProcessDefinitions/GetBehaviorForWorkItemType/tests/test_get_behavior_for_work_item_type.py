@@ -8,56 +8,25 @@ Validates:
   - Correct Authorization header
   - Successful response parsing (200)
   - Exit when required env vars are missing
+
+The script is imported and called in-process; see the fixtures in conftest.py.
 """
 
 import json
-import os
-import subprocess
-import sys
 from pathlib import Path
 
 import pytest
 import responses
 
+from _shared.errors import AdoAuthError, AdoNotFound
+from ProcessDefinitions.GetBehaviorForWorkItemType.get_behavior_for_work_item_type import get_behavior_for_work_item_type, main
+
 FIXTURES = Path(__file__).parent / "fixtures"
-SCRIPT = str(Path(__file__).resolve().parents[1] / "get_behavior_for_work_item_type.py")
-
-# ---------------------------------------------------------------------------
-# Helpers
-# ---------------------------------------------------------------------------
-
-def _run_script(env_override=None, extra_args=None, expect_fail=False):
-    """Run the script as a subprocess with the given env."""
-    env = {
-        "AZURE_DEVOPS_ORG": "testorg",
-        "AZURE_DEVOPS_PAT": "fakepat1234567890",
-        "PROCESS_ID": "test-value-process_id",
-        "WIT_REF_NAME_FOR_BEHAVIORS": "test-value-wit_ref_name_for_behaviors",
-        "BEHAVIOR_REF_NAME": "test-value-behavior_ref_name",
-        "PATH": os.environ.get("PATH", ""),
-        "PYTHONPATH": os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."),
-    }
-    if env_override:
-        env.update(env_override)
-    env = {k: v for k, v in env.items() if v is not None}
-
-    cmd = [sys.executable, SCRIPT]
-    if extra_args:
-        cmd.extend(extra_args)
-
-    result = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        env=env,
-        timeout=30,
-    )
-    if not expect_fail:
-        assert result.returncode == 0, (
-            f"Script failed (rc={result.returncode}):\n"
-            f"STDOUT: {result.stdout}\nSTDERR: {result.stderr}"
-        )
-    return result
+ENV = {
+    "PROCESS_ID": "test-value-process_id",
+    "WIT_REF_NAME_FOR_BEHAVIORS": "test-value-wit_ref_name_for_behaviors",
+    "BEHAVIOR_REF_NAME": "test-value-behavior_ref_name",
+}
 
 
 class TestGetBehaviorForWorkItemTypeEnvValidation:
@@ -65,53 +34,38 @@ class TestGetBehaviorForWorkItemTypeEnvValidation:
 
     @pytest.mark.offline
     @pytest.mark.processdefinitions
-    def test_missing_org_exits(self):
-        result = _run_script(
-            env_override={"AZURE_DEVOPS_ORG": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "AZURE_DEVOPS_ORG" in result.stderr or "AZURE_DEVOPS_ORG" in result.stdout
+    def test_missing_org_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "AZURE_DEVOPS_ORG": None})
+        assert code != 0
+        assert "AZURE_DEVOPS_ORG" in output
 
     @pytest.mark.offline
     @pytest.mark.processdefinitions
-    def test_missing_pat_exits(self):
-        result = _run_script(
-            env_override={"AZURE_DEVOPS_PAT": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "AZURE_DEVOPS_PAT" in result.stderr or "AZURE_DEVOPS_PAT" in result.stdout
+    def test_missing_pat_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "AZURE_DEVOPS_PAT": None})
+        assert code != 0
+        assert "AZURE_DEVOPS_PAT" in output
 
     @pytest.mark.offline
     @pytest.mark.processdefinitions
-    def test_missing_process_id_exits(self):
-        result = _run_script(
-            env_override={"PROCESS_ID": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "PROCESS_ID" in result.stderr or "PROCESS_ID" in result.stdout
+    def test_missing_process_id_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "PROCESS_ID": None})
+        assert code != 0
+        assert "PROCESS_ID" in output
 
     @pytest.mark.offline
     @pytest.mark.processdefinitions
-    def test_missing_wit_ref_name_for_behaviors_exits(self):
-        result = _run_script(
-            env_override={"WIT_REF_NAME_FOR_BEHAVIORS": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "WIT_REF_NAME_FOR_BEHAVIORS" in result.stderr or "WIT_REF_NAME_FOR_BEHAVIORS" in result.stdout
+    def test_missing_wit_ref_name_for_behaviors_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "WIT_REF_NAME_FOR_BEHAVIORS": None})
+        assert code != 0
+        assert "WIT_REF_NAME_FOR_BEHAVIORS" in output
 
     @pytest.mark.offline
     @pytest.mark.processdefinitions
-    def test_missing_behavior_ref_name_exits(self):
-        result = _run_script(
-            env_override={"BEHAVIOR_REF_NAME": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "BEHAVIOR_REF_NAME" in result.stderr or "BEHAVIOR_REF_NAME" in result.stdout
+    def test_missing_behavior_ref_name_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "BEHAVIOR_REF_NAME": None})
+        assert code != 0
+        assert "BEHAVIOR_REF_NAME" in output
 
 
 class TestGetBehaviorForWorkItemTypeURLAndAuth:
@@ -120,56 +74,39 @@ class TestGetBehaviorForWorkItemTypeURLAndAuth:
     @pytest.mark.offline
     @pytest.mark.processdefinitions
     @responses.activate
-    def test_correct_url_and_auth_header(self):
-        """Verify the script builds the right URL and Authorization header."""
-        import base64
-
-        org = "testorg"
-        pat = "fakepat1234567890"
+    def test_correct_url_and_auth_header(self, ado_client):
+        """Verify the operation builds the right URL and Authorization header."""
         expected_url = "https://dev.azure.com/testorg/_apis/work/processdefinitions/test-value-process_id/workitemtypes/test-value-wit_ref_name_for_behaviors/behaviors/test-value-behavior_ref_name?api-version=4.1"
-
         fixture = json.loads((FIXTURES / "get_behavior_for_work_item_type_200.json").read_text())
         responses.add(responses.GET, expected_url, json=fixture, status=200)
 
-        import requests as req
-
-        cred = base64.b64encode(f":{pat}".encode("ascii")).decode("ascii")
-        headers = {
-            "Authorization": f"Basic {cred}",
-            "Content-Type": "application/json",
-        }
-        resp = req.get(expected_url, headers=headers, timeout=30)
-
-        assert resp.status_code == 200
+        assert get_behavior_for_work_item_type(ado_client, "test-value-process_id", "test-value-wit_ref_name_for_behaviors", "test-value-behavior_ref_name") == fixture
         assert len(responses.calls) == 1
+        assert responses.calls[0].request.url == expected_url
         sent_auth = responses.calls[0].request.headers["Authorization"]
-        assert sent_auth.startswith("Basic ")
+        assert sent_auth == "Basic OmZha2VwYXQxMjM0NTY3ODkw"
 
 
 class TestGetBehaviorForWorkItemTypeHTTPErrors:
-    """Validate behaviour on error status codes."""
+    """Validate the typed error raised for error status codes."""
 
     @pytest.mark.offline
     @pytest.mark.processdefinitions
     @responses.activate
-    def test_401_unauthorized(self):
+    def test_401_unauthorized(self, ado_client):
         url = "https://dev.azure.com/testorg/_apis/work/processdefinitions/test-value-process_id/workitemtypes/test-value-wit_ref_name_for_behaviors/behaviors/test-value-behavior_ref_name?api-version=4.1"
         responses.add(responses.GET, url, json={"message": "unauthorized"}, status=401)
 
-        import requests as req
-
-        resp = req.get(url, headers={"Authorization": "Basic fake"}, timeout=30)
-        assert resp.status_code == 401
+        with pytest.raises(AdoAuthError):
+            get_behavior_for_work_item_type(ado_client, "test-value-process_id", "test-value-wit_ref_name_for_behaviors", "test-value-behavior_ref_name")
 
     @pytest.mark.offline
     @pytest.mark.processdefinitions
     @responses.activate
-    def test_404_not_found(self):
+    def test_404_not_found(self, ado_client):
         url = "https://dev.azure.com/testorg/_apis/work/processdefinitions/test-value-process_id/workitemtypes/test-value-wit_ref_name_for_behaviors/behaviors/test-value-behavior_ref_name?api-version=4.1"
         responses.add(responses.GET, url, json={"message": "not_found"}, status=404)
 
-        import requests as req
-
-        resp = req.get(url, headers={"Authorization": "Basic fake"}, timeout=30)
-        assert resp.status_code == 404
+        with pytest.raises(AdoNotFound):
+            get_behavior_for_work_item_type(ado_client, "test-value-process_id", "test-value-wit_ref_name_for_behaviors", "test-value-behavior_ref_name")
 
@@ -10,47 +10,82 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/process-definitions/get-behaviors-for-work-item-type/get-behaviors-for-work-item-type?view=azure-devops-rest-7.2
 """
 
-import json
+import argparse
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "4.1"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROCESS_ID = get_env_or_exit("PROCESS_ID", "The ID of the process")
-WIT_REF_NAME_FOR_BEHAVIORS = get_env_or_exit("WIT_REF_NAME_FOR_BEHAVIORS", "Work item type reference name for the behavior")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_behaviors_for_work_item_type", PAT)
-logger.info("Returns a list of all behaviors for the work item type of the process.")
+def get_behaviors_for_work_item_type(client, process_id: str, wit_ref_name_for_behaviors: str) -> dict:
+    """
+    Returns a list of all behaviors for the work item type of the process.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/work/processdefinitions/{PROCESS_ID}/workitemtypes/{WIT_REF_NAME_FOR_BEHAVIORS}/behaviors", API_VERSION)
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        process_id: The ID of the process
+        wit_ref_name_for_behaviors: Work item type reference name for the behavior
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/work/processdefinitions/{process_id}/workitemtypes/{wit_ref_name_for_behaviors}/behaviors", API_VERSION)
+    response = client.request("GET", url)
+    data = loads(response.content)
+    return data
+
+
+async def get_behaviors_for_work_item_type_async(client, process_id: str, wit_ref_name_for_behaviors: str) -> dict:
+    """Async variant of get_behaviors_for_work_item_type() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/work/processdefinitions/{process_id}/workitemtypes/{wit_ref_name_for_behaviors}/behaviors", API_VERSION)
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_behaviors_for_work_item_type() and print the result."""
+    organization, pat = get_common_env()
+    process_id = require_env("PROCESS_ID", "The ID of the process")
+    wit_ref_name_for_behaviors = require_env("WIT_REF_NAME_FOR_BEHAVIORS", "Work item type reference name for the behavior")
+
+    parser = argparse.ArgumentParser(description="Returns a list of all behaviors for the work item type of the process.")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("get_behaviors_for_work_item_type", pat)
+    logger.info("Returns a list of all behaviors for the work item type of the process.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        items = items_of(get_behaviors_for_work_item_type(client, process_id, wit_ref_name_for_behaviors), "value")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    data = get_behaviors_for_work_item_type(client, process_id, wit_ref_name_for_behaviors)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
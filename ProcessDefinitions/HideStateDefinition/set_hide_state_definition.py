@@ -11,68 +11,87 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/process-definition
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "4.1"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROCESS_ID = get_env_or_exit("PROCESS_ID", "The ID of the process")
-WIT_REF_NAME = get_env_or_exit("WIT_REF_NAME", "The reference name of the work item type")
-STATE_ID = get_env_or_exit("STATE_ID", "The ID of the state")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Hides a state definition in the work item type of the process.")
-parser.add_argument("--hidden", required=False, help="hidden")
-args = parser.parse_args()
+def set_hide_state_definition(client, process_id: str, wit_ref_name: str, state_id: str, *, hidden: Optional[str] = None) -> dict:
+    """
+    Hides a state definition in the work item type of the process.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        process_id: The ID of the process
+        wit_ref_name: The reference name of the work item type
+        state_id: The ID of the state
+        hidden: hidden
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "hidden": hidden,
+    }
+    url = build_url(client.organization, f"_apis/work/processdefinitions/{process_id}/workItemTypes/{wit_ref_name}/states/{state_id}", API_VERSION)
+    response = client.request("PUT", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name', 'color'], API_VERSION)
+    return data
+
+
+async def set_hide_state_definition_async(client, process_id: str, wit_ref_name: str, state_id: str, *, hidden: Optional[str] = None) -> dict:
+    """Async variant of set_hide_state_definition() for use with AsyncAdoClient."""
+    body = {
+        "hidden": hidden,
+    }
+    url = build_url(client.organization, f"_apis/work/processdefinitions/{process_id}/workItemTypes/{wit_ref_name}/states/{state_id}", API_VERSION)
+    response = await client.request("PUT", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name', 'color'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("set_hide_state_definition", PAT)
-logger.info("Hides a state definition in the work item type of the process.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "hidden": args.hidden,
-}
+def main() -> None:
+    """Read env vars / flags, call set_hide_state_definition() and print the result."""
+    organization, pat = get_common_env()
+    process_id = require_env("PROCESS_ID", "The ID of the process")
+    wit_ref_name = require_env("WIT_REF_NAME", "The reference name of the work item type")
+    state_id = require_env("STATE_ID", "The ID of the state")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/work/processdefinitions/{PROCESS_ID}/workItemTypes/{WIT_REF_NAME}/states/{STATE_ID}", API_VERSION)
-logger.info(f"PUT {url}")
+    parser = argparse.ArgumentParser(description="Hides a state definition in the work item type of the process.")
+    parser.add_argument("--hidden", required=False, help="hidden")
+    args = parser.parse_args()
 
-response = execute_request("PUT", url, HEADERS, body=body)
+    logger = AdoLogger("set_hide_state_definition", pat)
+    logger.info("Hides a state definition in the work item type of the process.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = set_hide_state_definition(client, process_id, wit_ref_name, state_id, hidden=args.hidden)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'name', 'color'], API_VERSION)
+    print(f"Hide State Definition: {data.get('name', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Hide State Definition: {data.get("name", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,50 +10,76 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/process-definitions/remove-group/remove-group?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "4.1"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROCESS_ID = get_env_or_exit("PROCESS_ID", "The ID of the process")
-WIT_REF_NAME = get_env_or_exit("WIT_REF_NAME", "The reference name of the work item type")
-PAGE_ID = get_env_or_exit("PAGE_ID", "The ID of the page the group is in")
-SECTION_ID = get_env_or_exit("SECTION_ID", "The ID of the section to the group is in")
-GROUP_ID = get_env_or_exit("GROUP_ID", "The ID of the group")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("delete_group", PAT)
-logger.info("Removes a group from the work item form")
+def delete_group(client, process_id: str, wit_ref_name: str, page_id: str, section_id: str, group_id: str) -> dict:
+    """
+    Removes a group from the work item form
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        process_id: The ID of the process
+        wit_ref_name: The reference name of the work item type
+        page_id: The ID of the page the group is in
+        section_id: The ID of the section to the group is in
+        group_id: The ID of the group
+
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/work/processdefinitions/{process_id}/workItemTypes/{wit_ref_name}/layout/pages/{page_id}/sections/{section_id}/groups/{group_id}", API_VERSION)
+    response = client.request("DELETE", url)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/work/processdefinitions/{PROCESS_ID}/workItemTypes/{WIT_REF_NAME}/layout/pages/{PAGE_ID}/sections/{SECTION_ID}/groups/{GROUP_ID}", API_VERSION)
-logger.info(f"DELETE {url}")
 
-response = execute_request("DELETE", url, HEADERS)
+async def delete_group_async(client, process_id: str, wit_ref_name: str, page_id: str, section_id: str, group_id: str) -> dict:
+    """Async variant of delete_group() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/work/processdefinitions/{process_id}/workItemTypes/{wit_ref_name}/layout/pages/{page_id}/sections/{section_id}/groups/{group_id}", API_VERSION)
+    response = await client.request("DELETE", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call delete_group() and print the result."""
+    organization, pat = get_common_env()
+    process_id = require_env("PROCESS_ID", "The ID of the process")
+    wit_ref_name = require_env("WIT_REF_NAME", "The reference name of the work item type")
+    page_id = require_env("PAGE_ID", "The ID of the page the group is in")
+    section_id = require_env("SECTION_ID", "The ID of the section to the group is in")
+    group_id = require_env("GROUP_ID", "The ID of the group")
+
+    logger = AdoLogger("delete_group", pat)
+    logger.info("Removes a group from the work item form")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = delete_group(client, process_id, wit_ref_name, page_id, section_id, group_id)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
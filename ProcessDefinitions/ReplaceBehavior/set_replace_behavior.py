@@ -11,69 +11,89 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/process-definition
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "4.1"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROCESS_ID = get_env_or_exit("PROCESS_ID", "The ID of the process")
-BEHAVIOR_ID = get_env_or_exit("BEHAVIOR_ID", "The ID of the behavior")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Replaces a behavior in the process.")
-parser.add_argument("--color", required=False, help="Color")
-parser.add_argument("--name", required=False, help="Behavior Name")
-args = parser.parse_args()
+def set_replace_behavior(client, process_id: str, behavior_id: str, *, color: Optional[str] = None, name: Optional[str] = None) -> dict:
+    """
+    Replaces a behavior in the process.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        process_id: The ID of the process
+        behavior_id: The ID of the behavior
+        color: Color
+        name: Behavior Name
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "color": color,
+        "name": name,
+    }
+    url = build_url(client.organization, f"_apis/work/processdefinitions/{process_id}/behaviors/{behavior_id}", API_VERSION)
+    response = client.request("PUT", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name', 'abstract'], API_VERSION)
+    return data
+
+
+async def set_replace_behavior_async(client, process_id: str, behavior_id: str, *, color: Optional[str] = None, name: Optional[str] = None) -> dict:
+    """Async variant of set_replace_behavior() for use with AsyncAdoClient."""
+    body = {
+        "color": color,
+        "name": name,
+    }
+    url = build_url(client.organization, f"_apis/work/processdefinitions/{process_id}/behaviors/{behavior_id}", API_VERSION)
+    response = await client.request("PUT", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name', 'abstract'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("set_replace_behavior", PAT)
-logger.info("Replaces a behavior in the process.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "color": args.color,
-    "name": args.name,
-}
+def main() -> None:
+    """Read env vars / flags, call set_replace_behavior() and print the result."""
+    organization, pat = get_common_env()
+    process_id = require_env("PROCESS_ID", "The ID of the process")
+    behavior_id = require_env("BEHAVIOR_ID", "The ID of the behavior")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/work/processdefinitions/{PROCESS_ID}/behaviors/{BEHAVIOR_ID}", API_VERSION)
-logger.info(f"PUT {url}")
+    parser = argparse.ArgumentParser(description="Replaces a behavior in the process.")
+    parser.add_argument("--color", required=False, help="Color")
+    parser.add_argument("--name", required=False, help="Behavior Name")
+    args = parser.parse_args()
 
-response = execute_request("PUT", url, HEADERS, body=body)
+    logger = AdoLogger("set_replace_behavior", pat)
+    logger.info("Replaces a behavior in the process.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = set_replace_behavior(client, process_id, behavior_id, color=args.color, name=args.name)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'name', 'abstract'], API_VERSION)
+    print(f"Replace Behavior: {data.get('name', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Replace Behavior: {data.get("name", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
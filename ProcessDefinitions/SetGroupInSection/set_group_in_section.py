@@ -11,81 +11,113 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/process-definition
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "4.1"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROCESS_ID = get_env_or_exit("PROCESS_ID", "The ID of the process")
-WIT_REF_NAME = get_env_or_exit("WIT_REF_NAME", "The reference name of the work item type")
-PAGE_ID = get_env_or_exit("PAGE_ID", "The ID of the page the group is in")
-SECTION_ID = get_env_or_exit("SECTION_ID", "The ID of the section the group is in")
-GROUP_ID = get_env_or_exit("GROUP_ID", "The ID of the group")
-REMOVE_FROM_SECTION_ID = get_env_or_exit("REMOVE_FROM_SECTION_ID", "ID of the section to remove the group from")
-
-# ---------------------------------------------------------------------------
-# CLI arguments
-# ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Moves a group to a different section")
-parser.add_argument("--contribution", required=False, help="Contribution for the group.")
-parser.add_argument("--controls", required=False, help="Controls to be put in the group.")
-parser.add_argument("--height", required=False, help="The height for the contribution.")
-parser.add_argument("--id", required=False, help="The id for the layout node.")
-parser.add_argument("--inherited", required=False, help="A value indicating whether this layout node has been inherited from a parent layout. This is expe...")
-parser.add_argument("--is-contribution", required=False, help="A value indicating if the layout node is contribution are not.")
-args = parser.parse_args()
-
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("set_group_in_section", PAT)
-logger.info("Moves a group to a different section")
-
-# ---------------------------------------------------------------------------
-# Request body
-# ---------------------------------------------------------------------------
-body = {
-    "contribution": args.contribution,
-    "controls": args.controls,
-    "height": args.height,
-    "id": args.id,
-    "inherited": args.inherited,
-    "isContribution": args.is_contribution,
-}
 
 # ---------------------------------------------------------------------------
-# API call
+# API
 # ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/work/processdefinitions/{PROCESS_ID}/workItemTypes/{WIT_REF_NAME}/layout/pages/{PAGE_ID}/sections/{SECTION_ID}/groups/{GROUP_ID}", API_VERSION)
-logger.info(f"PUT {url}")
-
-response = execute_request("PUT", url, HEADERS, body=body)
+def set_group_in_section(client, process_id: str, wit_ref_name: str, page_id: str, section_id: str, group_id: str, remove_from_section_id: str, *, contribution: Optional[str] = None, controls: Optional[str] = None, height: Optional[str] = None, id: Optional[str] = None, inherited: Optional[str] = None, is_contribution: Optional[str] = None) -> dict:
+    """
+    Moves a group to a different section
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        process_id: The ID of the process
+        wit_ref_name: The reference name of the work item type
+        page_id: The ID of the page the group is in
+        section_id: The ID of the section the group is in
+        group_id: The ID of the group
+        remove_from_section_id: ID of the section to remove the group from
+        contribution: Contribution for the group.
+        controls: Controls to be put in the group.
+        height: The height for the contribution.
+        id: The id for the layout node.
+        inherited: A value indicating whether this layout node has been inherited from a parent layout. This is expe...
+        is_contribution: A value indicating if the layout node is contribution are not.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "contribution": contribution,
+        "controls": controls,
+        "height": height,
+        "id": id,
+        "inherited": inherited,
+        "isContribution": is_contribution,
+    }
+    url = build_url(client.organization, f"_apis/work/processdefinitions/{process_id}/workItemTypes/{wit_ref_name}/layout/pages/{page_id}/sections/{section_id}/groups/{group_id}", API_VERSION)
+    response = client.request("PUT", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'contribution'], API_VERSION)
+    return data
+
+
+async def set_group_in_section_async(client, process_id: str, wit_ref_name: str, page_id: str, section_id: str, group_id: str, remove_from_section_id: str, *, contribution: Optional[str] = None, controls: Optional[str] = None, height: Optional[str] = None, id: Optional[str] = None, inherited: Optional[str] = None, is_contribution: Optional[str] = None) -> dict:
+    """Async variant of set_group_in_section() for use with AsyncAdoClient."""
+    body = {
+        "contribution": contribution,
+        "controls": controls,
+        "height": height,
+        "id": id,
+        "inherited": inherited,
+        "isContribution": is_contribution,
+    }
+    url = build_url(client.organization, f"_apis/work/processdefinitions/{process_id}/workItemTypes/{wit_ref_name}/layout/pages/{page_id}/sections/{section_id}/groups/{group_id}", API_VERSION)
+    response = await client.request("PUT", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'contribution'], API_VERSION)
+    return data
 
-data = response.json()
-
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'contribution'], API_VERSION)
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(f"Set Group In Section ID: {data.get("id", "N/A")}")
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call set_group_in_section() and print the result."""
+    organization, pat = get_common_env()
+    process_id = require_env("PROCESS_ID", "The ID of the process")
+    wit_ref_name = require_env("WIT_REF_NAME", "The reference name of the work item type")
+    page_id = require_env("PAGE_ID", "The ID of the page the group is in")
+    section_id = require_env("SECTION_ID", "The ID of the section the group is in")
+    group_id = require_env("GROUP_ID", "The ID of the group")
+    remove_from_section_id = require_env("REMOVE_FROM_SECTION_ID", "ID of the section to remove the group from")
+
+    parser = argparse.ArgumentParser(description="Moves a group to a different section")
+    parser.add_argument("--contribution", required=False, help="Contribution for the group.")
+    parser.add_argument("--controls", required=False, help="Controls to be put in the group.")
+    parser.add_argument("--height", required=False, help="The height for the contribution.")
+    parser.add_argument("--id", required=False, help="The id for the layout node.")
+    parser.add_argument("--inherited", required=False, help="A value indicating whether this layout node has been inherited from a parent layout. This is expe...")
+    parser.add_argument("--is-contribution", required=False, help="A value indicating if the layout node is contribution are not.")
+    args = parser.parse_args()
+
+    logger = AdoLogger("set_group_in_section", pat)
+    logger.info("Moves a group to a different section")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = set_group_in_section(client, process_id, wit_ref_name, page_id, section_id, group_id, remove_from_section_id, contribution=args.contribution, controls=args.controls, height=args.height, id=args.id, inherited=args.inherited, is_contribution=args.is_contribution)
+
+    print(f"Set Group In Section ID: {data.get('id', 'N/A')}")
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,68 +11,87 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/process-definition
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "4.1"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROCESS_ID = get_env_or_exit("PROCESS_ID", "The ID of the process")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Updates a given field in the process.")
-parser.add_argument("--description", required=False, help="description")
-parser.add_argument("--id", required=False, help="id")
-args = parser.parse_args()
+def update(client, process_id: str, *, description: Optional[str] = None, id: Optional[str] = None) -> dict:
+    """
+    Updates a given field in the process.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        process_id: The ID of the process
+        description: description
+        id: id
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "description": description,
+        "id": id,
+    }
+    url = build_url(client.organization, f"_apis/work/processdefinitions/{process_id}/fields", API_VERSION)
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name', 'description'], API_VERSION)
+    return data
+
+
+async def update_async(client, process_id: str, *, description: Optional[str] = None, id: Optional[str] = None) -> dict:
+    """Async variant of update() for use with AsyncAdoClient."""
+    body = {
+        "description": description,
+        "id": id,
+    }
+    url = build_url(client.organization, f"_apis/work/processdefinitions/{process_id}/fields", API_VERSION)
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name', 'description'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update", PAT)
-logger.info("Updates a given field in the process.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "description": args.description,
-    "id": args.id,
-}
+def main() -> None:
+    """Read env vars / flags, call update() and print the result."""
+    organization, pat = get_common_env()
+    process_id = require_env("PROCESS_ID", "The ID of the process")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/work/processdefinitions/{PROCESS_ID}/fields", API_VERSION)
-logger.info(f"PATCH {url}")
+    parser = argparse.ArgumentParser(description="Updates a given field in the process.")
+    parser.add_argument("--description", required=False, help="description")
+    parser.add_argument("--id", required=False, help="id")
+    args = parser.parse_args()
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+    logger = AdoLogger("update", pat)
+    logger.info("Updates a given field in the process.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update(client, process_id, description=args.description, id=args.id)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'name', 'description'], API_VERSION)
+    print(f"Update: {data.get('name', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Update: {data.get("name", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,70 +11,92 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/process-definition
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "4.1"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROCESS_ID = get_env_or_exit("PROCESS_ID", "The ID of the process")
-WIT_REF_NAME_FOR_BEHAVIORS = get_env_or_exit("WIT_REF_NAME_FOR_BEHAVIORS", "Work item type reference name for the behavior")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Updates a behavior for the work item type of the process.")
-parser.add_argument("--behavior", required=False, help="behavior")
-parser.add_argument("--is-default", required=False, help="isDefault")
-parser.add_argument("--url", required=False, help="url")
-args = parser.parse_args()
+def update_behavior_to_work_item_type(client, process_id: str, wit_ref_name_for_behaviors: str, *, behavior: Optional[str] = None, is_default: Optional[str] = None, url_value: Optional[str] = None) -> dict:
+    """
+    Updates a behavior for the work item type of the process.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        process_id: The ID of the process
+        wit_ref_name_for_behaviors: Work item type reference name for the behavior
+        behavior: behavior
+        is_default: isDefault
+        url_value: url
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "behavior": behavior,
+        "isDefault": is_default,
+        "url": url_value,
+    }
+    url = build_url(client.organization, f"_apis/work/processdefinitions/{process_id}/workitemtypes/{wit_ref_name_for_behaviors}/behaviors", API_VERSION)
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['behavior', 'isDefault'], API_VERSION)
+    return data
+
+
+async def update_behavior_to_work_item_type_async(client, process_id: str, wit_ref_name_for_behaviors: str, *, behavior: Optional[str] = None, is_default: Optional[str] = None, url_value: Optional[str] = None) -> dict:
+    """Async variant of update_behavior_to_work_item_type() for use with AsyncAdoClient."""
+    body = {
+        "behavior": behavior,
+        "isDefault": is_default,
+        "url": url_value,
+    }
+    url = build_url(client.organization, f"_apis/work/processdefinitions/{process_id}/workitemtypes/{wit_ref_name_for_behaviors}/behaviors", API_VERSION)
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['behavior', 'isDefault'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_behavior_to_work_item_type", PAT)
-logger.info("Updates a behavior for the work item type of the process.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "behavior": args.behavior,
-    "isDefault": args.is_default,
-    "url": args.url,
-}
+def main() -> None:
+    """Read env vars / flags, call update_behavior_to_work_item_type() and print the result."""
+    organization, pat = get_common_env()
+    process_id = require_env("PROCESS_ID", "The ID of the process")
+    wit_ref_name_for_behaviors = require_env("WIT_REF_NAME_FOR_BEHAVIORS", "Work item type reference name for the behavior")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/work/processdefinitions/{PROCESS_ID}/workitemtypes/{WIT_REF_NAME_FOR_BEHAVIORS}/behaviors", API_VERSION)
-logger.info(f"PATCH {url}")
+    parser = argparse.ArgumentParser(description="Updates a behavior for the work item type of the process.")
+    parser.add_argument("--behavior", required=False, help="behavior")
+    parser.add_argument("--is-default", required=False, help="isDefault")
+    parser.add_argument("--url", required=False, help="url")
+    args = parser.parse_args()
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+    logger = AdoLogger("update_behavior_to_work_item_type", pat)
+    logger.info("Updates a behavior for the work item type of the process.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_behavior_to_work_item_type(client, process_id, wit_ref_name_for_behaviors, behavior=args.behavior, is_default=args.is_default, url_value=args.url)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['behavior', 'isDefault'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
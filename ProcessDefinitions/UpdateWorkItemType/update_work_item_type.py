@@ -11,73 +11,97 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/process-definition
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "4.1"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROCESS_ID = get_env_or_exit("PROCESS_ID", "The ID of the process")
-WIT_REF_NAME = get_env_or_exit("WIT_REF_NAME", "The reference name of the work item type")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Updates a work item type of the process.")
-parser.add_argument("--color", required=False, help="Color of the work item type")
-parser.add_argument("--description", required=False, help="Description of the work item type")
-parser.add_argument("--icon", required=False, help="Icon of the work item type")
-parser.add_argument("--is-disabled", required=False, help="Is the workitem type to be disabled")
-args = parser.parse_args()
+def update_work_item_type(client, process_id: str, wit_ref_name: str, *, color: Optional[str] = None, description: Optional[str] = None, icon: Optional[str] = None, is_disabled: Optional[str] = None) -> dict:
+    """
+    Updates a work item type of the process.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        process_id: The ID of the process
+        wit_ref_name: The reference name of the work item type
+        color: Color of the work item type
+        description: Description of the work item type
+        icon: Icon of the work item type
+        is_disabled: Is the workitem type to be disabled
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "color": color,
+        "description": description,
+        "icon": icon,
+        "isDisabled": is_disabled,
+    }
+    url = build_url(client.organization, f"_apis/work/processdefinitions/{process_id}/workitemtypes/{wit_ref_name}", API_VERSION)
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name', 'behaviors'], API_VERSION)
+    return data
+
+
+async def update_work_item_type_async(client, process_id: str, wit_ref_name: str, *, color: Optional[str] = None, description: Optional[str] = None, icon: Optional[str] = None, is_disabled: Optional[str] = None) -> dict:
+    """Async variant of update_work_item_type() for use with AsyncAdoClient."""
+    body = {
+        "color": color,
+        "description": description,
+        "icon": icon,
+        "isDisabled": is_disabled,
+    }
+    url = build_url(client.organization, f"_apis/work/processdefinitions/{process_id}/workitemtypes/{wit_ref_name}", API_VERSION)
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name', 'behaviors'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_work_item_type", PAT)
-logger.info("Updates a work item type of the process.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "color": args.color,
-    "description": args.description,
-    "icon": args.icon,
-    "isDisabled": args.is_disabled,
-}
+def main() -> None:
+    """Read env vars / flags, call update_work_item_type() and print the result."""
+    organization, pat = get_common_env()
+    process_id = require_env("PROCESS_ID", "The ID of the process")
+    wit_ref_name = require_env("WIT_REF_NAME", "The reference name of the work item type")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/work/processdefinitions/{PROCESS_ID}/workitemtypes/{WIT_REF_NAME}", API_VERSION)
-logger.info(f"PATCH {url}")
+    parser = argparse.ArgumentParser(description="Updates a work item type of the process.")
+    parser.add_argument("--color", required=False, help="Color of the work item type")
+    parser.add_argument("--description", required=False, help="Description of the work item type")
+    parser.add_argument("--icon", required=False, help="Icon of the work item type")
+    parser.add_argument("--is-disabled", required=False, help="Is the workitem type to be disabled")
+    args = parser.parse_args()
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+    logger = AdoLogger("update_work_item_type", pat)
+    logger.info("Updates a work item type of the process.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_work_item_type(client, process_id, wit_ref_name, color=args.color, description=args.description, icon=args.icon, is_disabled=args.is_disabled)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'name', 'behaviors'], API_VERSION)
+    print(f"Update Work Item Type ID: {data.get('id', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Update Work Item Type ID: {data.get("id", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,72 +11,95 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/processes/behavior
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROCESS_ID = get_env_or_exit("PROCESS_ID", "The ID of the process")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Creates a single behavior in the given process.")
-parser.add_argument("--color", required=False, help="Color.")
-parser.add_argument("--inherits", required=False, help="Parent behavior id.")
-parser.add_argument("--name", required=False, help="Name of the behavior.")
-parser.add_argument("--reference-name", required=False, help="ReferenceName is optional, if not specified will be auto-generated.")
-args = parser.parse_args()
+def create_behaviors(client, process_id: str, *, color: Optional[str] = None, inherits: Optional[str] = None, name: Optional[str] = None, reference_name: Optional[str] = None) -> dict:
+    """
+    Creates a single behavior in the given process.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        process_id: The ID of the process
+        color: Color.
+        inherits: Parent behavior id.
+        name: Name of the behavior.
+        reference_name: ReferenceName is optional, if not specified will be auto-generated.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "color": color,
+        "inherits": inherits,
+        "name": name,
+        "referenceName": reference_name,
+    }
+    url = build_url(client.organization, f"_apis/work/processes/{process_id}/behaviors", API_VERSION)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['name', 'color'], API_VERSION)
+    return data
+
+
+async def create_behaviors_async(client, process_id: str, *, color: Optional[str] = None, inherits: Optional[str] = None, name: Optional[str] = None, reference_name: Optional[str] = None) -> dict:
+    """Async variant of create_behaviors() for use with AsyncAdoClient."""
+    body = {
+        "color": color,
+        "inherits": inherits,
+        "name": name,
+        "referenceName": reference_name,
+    }
+    url = build_url(client.organization, f"_apis/work/processes/{process_id}/behaviors", API_VERSION)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['name', 'color'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_behaviors", PAT)
-logger.info("Creates a single behavior in the given process.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "color": args.color,
-    "inherits": args.inherits,
-    "name": args.name,
-    "referenceName": args.reference_name,
-}
+def main() -> None:
+    """Read env vars / flags, call create_behaviors() and print the result."""
+    organization, pat = get_common_env()
+    process_id = require_env("PROCESS_ID", "The ID of the process")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/work/processes/{PROCESS_ID}/behaviors", API_VERSION)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Creates a single behavior in the given process.")
+    parser.add_argument("--color", required=False, help="Color.")
+    parser.add_argument("--inherits", required=False, help="Parent behavior id.")
+    parser.add_argument("--name", required=False, help="Name of the behavior.")
+    parser.add_argument("--reference-name", required=False, help="ReferenceName is optional, if not specified will be auto-generated.")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_behaviors", pat)
+    logger.info("Creates a single behavior in the given process.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_behaviors(client, process_id, color=args.color, inherits=args.inherits, name=args.name, reference_name=args.reference_name)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['name', 'color'], API_VERSION)
+    print(f"Behaviors: {data.get('name', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Behaviors: {data.get("name", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,77 +11,105 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/processes/fields/a
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROCESS_ID = get_env_or_exit("PROCESS_ID", "The ID of the process.")
-WIT_REF_NAME = get_env_or_exit("WIT_REF_NAME", "The reference name of the work item type.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Adds a field to a work item type.")
-parser.add_argument("--allowed-values", required=False, help="The list of field allowed values.")
-parser.add_argument("--allow-groups", required=False, help="Allow setting field value to a group identity. Only applies to identity fields.")
-parser.add_argument("--default-value", required=False, help="The default value of the field.")
-parser.add_argument("--read-only", required=False, help="If true the field cannot be edited.")
-parser.add_argument("--reference-name", required=False, help="Reference name of the field.")
-parser.add_argument("--required", required=False, help="If true the field cannot be empty.")
-args = parser.parse_args()
+def create_fields(client, process_id: str, wit_ref_name: str, *, allowed_values: Optional[str] = None, allow_groups: Optional[str] = None, default_value: Optional[str] = None, read_only: Optional[str] = None, reference_name: Optional[str] = None, required: Optional[str] = None) -> dict:
+    """
+    Adds a field to a work item type.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        process_id: The ID of the process.
+        wit_ref_name: The reference name of the work item type.
+        allowed_values: The list of field allowed values.
+        allow_groups: Allow setting field value to a group identity. Only applies to identity fields.
+        default_value: The default value of the field.
+        read_only: If true the field cannot be edited.
+        reference_name: Reference name of the field.
+        required: If true the field cannot be empty.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "allowedValues": allowed_values,
+        "allowGroups": allow_groups,
+        "defaultValue": default_value,
+        "readOnly": read_only,
+        "referenceName": reference_name,
+        "required": required,
+    }
+    url = build_url(client.organization, f"_apis/work/processes/{process_id}/workItemTypes/{wit_ref_name}/fields", API_VERSION)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['name', 'allowedValues'], API_VERSION)
+    return data
+
+
+async def create_fields_async(client, process_id: str, wit_ref_name: str, *, allowed_values: Optional[str] = None, allow_groups: Optional[str] = None, default_value: Optional[str] = None, read_only: Optional[str] = None, reference_name: Optional[str] = None, required: Optional[str] = None) -> dict:
+    """Async variant of create_fields() for use with AsyncAdoClient."""
+    body = {
+        "allowedValues": allowed_values,
+        "allowGroups": allow_groups,
+        "defaultValue": default_value,
+        "readOnly": read_only,
+        "referenceName": reference_name,
+        "required": required,
+    }
+    url = build_url(client.organization, f"_apis/work/processes/{process_id}/workItemTypes/{wit_ref_name}/fields", API_VERSION)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['name', 'allowedValues'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_fields", PAT)
-logger.info("Adds a field to a work item type.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "allowedValues": args.allowed_values,
-    "allowGroups": args.allow_groups,
-    "defaultValue": args.default_value,
-    "readOnly": args.read_only,
-    "referenceName": args.reference_name,
-    "required": args.required,
-}
+def main() -> None:
+    """Read env vars / flags, call create_fields() and print the result."""
+    organization, pat = get_common_env()
+    process_id = require_env("PROCESS_ID", "The ID of the process.")
+    wit_ref_name = require_env("WIT_REF_NAME", "The reference name of the work item type.")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/work/processes/{PROCESS_ID}/workItemTypes/{WIT_REF_NAME}/fields", API_VERSION)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Adds a field to a work item type.")
+    parser.add_argument("--allowed-values", required=False, help="The list of field allowed values.")
+    parser.add_argument("--allow-groups", required=False, help="Allow setting field value to a group identity. Only applies to identity fields.")
+    parser.add_argument("--default-value", required=False, help="The default value of the field.")
+    parser.add_argument("--read-only", required=False, help="If true the field cannot be edited.")
+    parser.add_argument("--reference-name", required=False, help="Reference name of the field.")
+    parser.add_argument("--required", required=False, help="If true the field cannot be empty.")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_fields", pat)
+    logger.info("Adds a field to a work item type.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_fields(client, process_id, wit_ref_name, allowed_values=args.allowed_values, allow_groups=args.allow_groups, default_value=args.default_value, read_only=args.read_only, reference_name=args.reference_name, required=args.required)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['name', 'allowedValues'], API_VERSION)
+    print(f"Fields: {data.get('name', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Fields: {data.get("name", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,46 +10,68 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/processes/lists/delete?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-LIST_ID = get_env_or_exit("LIST_ID", "The ID of the list")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("delete_lists", PAT)
-logger.info("Removes a picklist.")
+def delete_lists(client, list_id: str) -> dict:
+    """
+    Removes a picklist.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        list_id: The ID of the list
+
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/work/processes/lists/{list_id}", API_VERSION)
+    response = client.request("DELETE", url)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/work/processes/lists/{LIST_ID}", API_VERSION)
-logger.info(f"DELETE {url}")
 
-response = execute_request("DELETE", url, HEADERS)
+async def delete_lists_async(client, list_id: str) -> dict:
+    """Async variant of delete_lists() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/work/processes/lists/{list_id}", API_VERSION)
+    response = await client.request("DELETE", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call delete_lists() and print the result."""
+    organization, pat = get_common_env()
+    list_id = require_env("LIST_ID", "The ID of the list")
+
+    logger = AdoLogger("delete_lists", pat)
+    logger.info("Removes a picklist.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = delete_lists(client, list_id)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,65 +11,82 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/processes/lists/up
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-LIST_ID = get_env_or_exit("LIST_ID", "The ID of the list")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Updates a list.")
-parser.add_argument("--items", required=False, help="A list of PicklistItemModel.")
-args = parser.parse_args()
+def update_lists(client, list_id: str, *, items: Optional[str] = None) -> dict:
+    """
+    Updates a list.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        list_id: The ID of the list
+        items: A list of PicklistItemModel.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "items": items,
+    }
+    url = build_url(client.organization, f"_apis/work/processes/lists/{list_id}", API_VERSION)
+    response = client.request("PUT", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['items'], API_VERSION)
+    return data
+
+
+async def update_lists_async(client, list_id: str, *, items: Optional[str] = None) -> dict:
+    """Async variant of update_lists() for use with AsyncAdoClient."""
+    body = {
+        "items": items,
+    }
+    url = build_url(client.organization, f"_apis/work/processes/lists/{list_id}", API_VERSION)
+    response = await client.request("PUT", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['items'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_lists", PAT)
-logger.info("Updates a list.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "items": args.items,
-}
+def main() -> None:
+    """Read env vars / flags, call update_lists() and print the result."""
+    organization, pat = get_common_env()
+    list_id = require_env("LIST_ID", "The ID of the list")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/work/processes/lists/{LIST_ID}", API_VERSION)
-logger.info(f"PUT {url}")
+    parser = argparse.ArgumentParser(description="Updates a list.")
+    parser.add_argument("--items", required=False, help="A list of PicklistItemModel.")
+    args = parser.parse_args()
 
-response = execute_request("PUT", url, HEADERS, body=body)
+    logger = AdoLogger("update_lists", pat)
+    logger.info("Updates a list.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_lists(client, list_id, items=args.items)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['items'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
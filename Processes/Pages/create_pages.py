@@ -11,77 +11,105 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/processes/pages/ad
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROCESS_ID = get_env_or_exit("PROCESS_ID", "The ID of the process.")
-WIT_REF_NAME = get_env_or_exit("WIT_REF_NAME", "The reference name of the work item type.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Adds a page to the work item form.")
-parser.add_argument("--contribution", required=False, help="Contribution for the page.")
-parser.add_argument("--id", required=False, help="The id for the layout node.")
-parser.add_argument("--inherited", required=False, help="A value indicating whether this layout node has been inherited from a parent layout. This is expe...")
-parser.add_argument("--is-contribution", required=False, help="A value indicating if the layout node is contribution are not.")
-parser.add_argument("--label", required=False, help="The label for the page.")
-parser.add_argument("--locked", required=False, help="A value indicating whether any user operations are permitted on this page and the contents of thi...")
-args = parser.parse_args()
+def create_pages(client, process_id: str, wit_ref_name: str, *, contribution: Optional[str] = None, id: Optional[str] = None, inherited: Optional[str] = None, is_contribution: Optional[str] = None, label: Optional[str] = None, locked: Optional[str] = None) -> dict:
+    """
+    Adds a page to the work item form.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        process_id: The ID of the process.
+        wit_ref_name: The reference name of the work item type.
+        contribution: Contribution for the page.
+        id: The id for the layout node.
+        inherited: A value indicating whether this layout node has been inherited from a parent layout. This is expe...
+        is_contribution: A value indicating if the layout node is contribution are not.
+        label: The label for the page.
+        locked: A value indicating whether any user operations are permitted on this page and the contents of thi...
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "contribution": contribution,
+        "id": id,
+        "inherited": inherited,
+        "isContribution": is_contribution,
+        "label": label,
+        "locked": locked,
+    }
+    url = build_url(client.organization, f"_apis/work/processes/{process_id}/workItemTypes/{wit_ref_name}/layout/pages", API_VERSION)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'contribution'], API_VERSION)
+    return data
+
+
+async def create_pages_async(client, process_id: str, wit_ref_name: str, *, contribution: Optional[str] = None, id: Optional[str] = None, inherited: Optional[str] = None, is_contribution: Optional[str] = None, label: Optional[str] = None, locked: Optional[str] = None) -> dict:
+    """Async variant of create_pages() for use with AsyncAdoClient."""
+    body = {
+        "contribution": contribution,
+        "id": id,
+        "inherited": inherited,
+        "isContribution": is_contribution,
+        "label": label,
+        "locked": locked,
+    }
+    url = build_url(client.organization, f"_apis/work/processes/{process_id}/workItemTypes/{wit_ref_name}/layout/pages", API_VERSION)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'contribution'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_pages", PAT)
-logger.info("Adds a page to the work item form.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "contribution": args.contribution,
-    "id": args.id,
-    "inherited": args.inherited,
-    "isContribution": args.is_contribution,
-    "label": args.label,
-    "locked": args.locked,
-}
+def main() -> None:
+    """Read env vars / flags, call create_pages() and print the result."""
+    organization, pat = get_common_env()
+    process_id = require_env("PROCESS_ID", "The ID of the process.")
+    wit_ref_name = require_env("WIT_REF_NAME", "The reference name of the work item type.")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/work/processes/{PROCESS_ID}/workItemTypes/{WIT_REF_NAME}/layout/pages", API_VERSION)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Adds a page to the work item form.")
+    parser.add_argument("--contribution", required=False, help="Contribution for the page.")
+    parser.add_argument("--id", required=False, help="The id for the layout node.")
+    parser.add_argument("--inherited", required=False, help="A value indicating whether this layout node has been inherited from a parent layout. This is expe...")
+    parser.add_argument("--is-contribution", required=False, help="A value indicating if the layout node is contribution are not.")
+    parser.add_argument("--label", required=False, help="The label for the page.")
+    parser.add_argument("--locked", required=False, help="A value indicating whether any user operations are permitted on this page and the contents of thi...")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_pages", pat)
+    logger.info("Adds a page to the work item form.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_pages(client, process_id, wit_ref_name, contribution=args.contribution, id=args.id, inherited=args.inherited, is_contribution=args.is_contribution, label=args.label, locked=args.locked)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'contribution'], API_VERSION)
+    print(f"Pages ID: {data.get('id', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Pages ID: {data.get("id", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,71 +11,93 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/processes/processe
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Creates a process.")
-parser.add_argument("--description", required=False, help="Description of the process")
-parser.add_argument("--name", required=False, help="Name of the process")
-parser.add_argument("--parent-process-type-id", required=False, help="The ID of the parent process")
-parser.add_argument("--reference-name", required=False, help="Reference name of process being created. If not specified, server will assign a unique reference ...")
-args = parser.parse_args()
+def create_processes(client, *, description: Optional[str] = None, name: Optional[str] = None, parent_process_type_id: Optional[str] = None, reference_name: Optional[str] = None) -> dict:
+    """
+    Creates a process.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        description: Description of the process
+        name: Name of the process
+        parent_process_type_id: The ID of the parent process
+        reference_name: Reference name of process being created. If not specified, server will assign a unique reference ...
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "description": description,
+        "name": name,
+        "parentProcessTypeId": parent_process_type_id,
+        "referenceName": reference_name,
+    }
+    url = build_url(client.organization, f"_apis/work/processes", API_VERSION)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['name', 'customizationType'], API_VERSION)
+    return data
+
+
+async def create_processes_async(client, *, description: Optional[str] = None, name: Optional[str] = None, parent_process_type_id: Optional[str] = None, reference_name: Optional[str] = None) -> dict:
+    """Async variant of create_processes() for use with AsyncAdoClient."""
+    body = {
+        "description": description,
+        "name": name,
+        "parentProcessTypeId": parent_process_type_id,
+        "referenceName": reference_name,
+    }
+    url = build_url(client.organization, f"_apis/work/processes", API_VERSION)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['name', 'customizationType'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_processes", PAT)
-logger.info("Creates a process.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "description": args.description,
-    "name": args.name,
-    "parentProcessTypeId": args.parent_process_type_id,
-    "referenceName": args.reference_name,
-}
+def main() -> None:
+    """Read env vars / flags, call create_processes() and print the result."""
+    organization, pat = get_common_env()
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/work/processes", API_VERSION)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Creates a process.")
+    parser.add_argument("--description", required=False, help="Description of the process")
+    parser.add_argument("--name", required=False, help="Name of the process")
+    parser.add_argument("--parent-process-type-id", required=False, help="The ID of the parent process")
+    parser.add_argument("--reference-name", required=False, help="Reference name of process being created. If not specified, server will assign a unique reference ...")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_processes", pat)
+    logger.info("Creates a process.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_processes(client, description=args.description, name=args.name, parent_process_type_id=args.parent_process_type_id, reference_name=args.reference_name)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['name', 'customizationType'], API_VERSION)
+    print(f"Processes: {data.get('name', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Processes: {data.get("name", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
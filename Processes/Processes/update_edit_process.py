@@ -11,72 +11,95 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/processes/processe
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROCESS_TYPE_ID = get_env_or_exit("PROCESS_TYPE_ID", "processTypeId")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Edit a process of a specific ID.")
-parser.add_argument("--description", required=False, help="New description of the process")
-parser.add_argument("--is-default", required=False, help="If true new projects will use this process by default")
-parser.add_argument("--is-enabled", required=False, help="If false the process will be disabled and cannot be used to create projects")
-parser.add_argument("--name", required=False, help="New name of the process")
-args = parser.parse_args()
+def update_edit_process(client, process_type_id: str, *, description: Optional[str] = None, is_default: Optional[str] = None, is_enabled: Optional[str] = None, name: Optional[str] = None) -> dict:
+    """
+    Edit a process of a specific ID.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        process_type_id: processTypeId
+        description: New description of the process
+        is_default: If true new projects will use this process by default
+        is_enabled: If false the process will be disabled and cannot be used to create projects
+        name: New name of the process
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "description": description,
+        "isDefault": is_default,
+        "isEnabled": is_enabled,
+        "name": name,
+    }
+    url = build_url(client.organization, f"_apis/work/processes/{process_type_id}", API_VERSION)
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['name', 'customizationType'], API_VERSION)
+    return data
+
+
+async def update_edit_process_async(client, process_type_id: str, *, description: Optional[str] = None, is_default: Optional[str] = None, is_enabled: Optional[str] = None, name: Optional[str] = None) -> dict:
+    """Async variant of update_edit_process() for use with AsyncAdoClient."""
+    body = {
+        "description": description,
+        "isDefault": is_default,
+        "isEnabled": is_enabled,
+        "name": name,
+    }
+    url = build_url(client.organization, f"_apis/work/processes/{process_type_id}", API_VERSION)
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['name', 'customizationType'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_edit_process", PAT)
-logger.info("Edit a process of a specific ID.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "description": args.description,
-    "isDefault": args.is_default,
-    "isEnabled": args.is_enabled,
-    "name": args.name,
-}
+def main() -> None:
+    """Read env vars / flags, call update_edit_process() and print the result."""
+    organization, pat = get_common_env()
+    process_type_id = require_env("PROCESS_TYPE_ID", "processTypeId")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/work/processes/{PROCESS_TYPE_ID}", API_VERSION)
-logger.info(f"PATCH {url}")
+    parser = argparse.ArgumentParser(description="Edit a process of a specific ID.")
+    parser.add_argument("--description", required=False, help="New description of the process")
+    parser.add_argument("--is-default", required=False, help="If true new projects will use this process by default")
+    parser.add_argument("--is-enabled", required=False, help="If false the process will be disabled and cannot be used to create projects")
+    parser.add_argument("--name", required=False, help="New name of the process")
+    args = parser.parse_args()
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+    logger = AdoLogger("update_edit_process", pat)
+    logger.info("Edit a process of a specific ID.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_edit_process(client, process_type_id, description=args.description, is_default=args.is_default, is_enabled=args.is_enabled, name=args.name)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['name', 'customizationType'], API_VERSION)
+    print(f"Processes: {data.get('name', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Processes: {data.get("name", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,73 +11,97 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/processes/rules/ad
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROCESS_ID = get_env_or_exit("PROCESS_ID", "The ID of the process")
-WIT_REF_NAME = get_env_or_exit("WIT_REF_NAME", "The reference name of the work item type")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Adds a rule to work item type in the process.")
-parser.add_argument("--actions", required=False, help="List of actions to take when the rule is triggered.")
-parser.add_argument("--conditions", required=False, help="List of conditions when the rule should be triggered.")
-parser.add_argument("--is-disabled", required=False, help="Indicates if the rule is disabled.")
-parser.add_argument("--name", required=False, help="Name for the rule.")
-args = parser.parse_args()
+def create_rules(client, process_id: str, wit_ref_name: str, *, actions: Optional[str] = None, conditions: Optional[str] = None, is_disabled: Optional[str] = None, name: Optional[str] = None) -> dict:
+    """
+    Adds a rule to work item type in the process.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        process_id: The ID of the process
+        wit_ref_name: The reference name of the work item type
+        actions: List of actions to take when the rule is triggered.
+        conditions: List of conditions when the rule should be triggered.
+        is_disabled: Indicates if the rule is disabled.
+        name: Name for the rule.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "actions": actions,
+        "conditions": conditions,
+        "isDisabled": is_disabled,
+        "name": name,
+    }
+    url = build_url(client.organization, f"_apis/work/processes/{process_id}/workItemTypes/{wit_ref_name}/rules", API_VERSION)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'customizationType'], API_VERSION)
+    return data
+
+
+async def create_rules_async(client, process_id: str, wit_ref_name: str, *, actions: Optional[str] = None, conditions: Optional[str] = None, is_disabled: Optional[str] = None, name: Optional[str] = None) -> dict:
+    """Async variant of create_rules() for use with AsyncAdoClient."""
+    body = {
+        "actions": actions,
+        "conditions": conditions,
+        "isDisabled": is_disabled,
+        "name": name,
+    }
+    url = build_url(client.organization, f"_apis/work/processes/{process_id}/workItemTypes/{wit_ref_name}/rules", API_VERSION)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'customizationType'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_rules", PAT)
-logger.info("Adds a rule to work item type in the process.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "actions": args.actions,
-    "conditions": args.conditions,
-    "isDisabled": args.is_disabled,
-    "name": args.name,
-}
+def main() -> None:
+    """Read env vars / flags, call create_rules() and print the result."""
+    organization, pat = get_common_env()
+    process_id = require_env("PROCESS_ID", "The ID of the process")
+    wit_ref_name = require_env("WIT_REF_NAME", "The reference name of the work item type")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/work/processes/{PROCESS_ID}/workItemTypes/{WIT_REF_NAME}/rules", API_VERSION)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Adds a rule to work item type in the process.")
+    parser.add_argument("--actions", required=False, help="List of actions to take when the rule is triggered.")
+    parser.add_argument("--conditions", required=False, help="List of conditions when the rule should be triggered.")
+    parser.add_argument("--is-disabled", required=False, help="Indicates if the rule is disabled.")
+    parser.add_argument("--name", required=False, help="Name for the rule.")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_rules", pat)
+    logger.info("Adds a rule to work item type in the process.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_rules(client, process_id, wit_ref_name, actions=args.actions, conditions=args.conditions, is_disabled=args.is_disabled, name=args.name)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'customizationType'], API_VERSION)
+    print(f"Rules ID: {data.get('id', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Rules ID: {data.get("id", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
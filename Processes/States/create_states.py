@@ -11,73 +11,97 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/processes/states/c
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROCESS_ID = get_env_or_exit("PROCESS_ID", "The ID of the process")
-WIT_REF_NAME = get_env_or_exit("WIT_REF_NAME", "The reference name of the work item type")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Creates a state definition in the work item type of the process.")
-parser.add_argument("--color", required=False, help="Color of the state")
-parser.add_argument("--name", required=False, help="Name of the state")
-parser.add_argument("--order", required=False, help="Order in which state should appear")
-parser.add_argument("--state-category", required=False, help="Category of the state")
-args = parser.parse_args()
+def create_states(client, process_id: str, wit_ref_name: str, *, color: Optional[str] = None, name: Optional[str] = None, order: Optional[str] = None, state_category: Optional[str] = None) -> dict:
+    """
+    Creates a state definition in the work item type of the process.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        process_id: The ID of the process
+        wit_ref_name: The reference name of the work item type
+        color: Color of the state
+        name: Name of the state
+        order: Order in which state should appear
+        state_category: Category of the state
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "color": color,
+        "name": name,
+        "order": order,
+        "stateCategory": state_category,
+    }
+    url = build_url(client.organization, f"_apis/work/processes/{process_id}/workItemTypes/{wit_ref_name}/states", API_VERSION)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name', 'color'], API_VERSION)
+    return data
+
+
+async def create_states_async(client, process_id: str, wit_ref_name: str, *, color: Optional[str] = None, name: Optional[str] = None, order: Optional[str] = None, state_category: Optional[str] = None) -> dict:
+    """Async variant of create_states() for use with AsyncAdoClient."""
+    body = {
+        "color": color,
+        "name": name,
+        "order": order,
+        "stateCategory": state_category,
+    }
+    url = build_url(client.organization, f"_apis/work/processes/{process_id}/workItemTypes/{wit_ref_name}/states", API_VERSION)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name', 'color'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_states", PAT)
-logger.info("Creates a state definition in the work item type of the process.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "color": args.color,
-    "name": args.name,
-    "order": args.order,
-    "stateCategory": args.state_category,
-}
+def main() -> None:
+    """Read env vars / flags, call create_states() and print the result."""
+    organization, pat = get_common_env()
+    process_id = require_env("PROCESS_ID", "The ID of the process")
+    wit_ref_name = require_env("WIT_REF_NAME", "The reference name of the work item type")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/work/processes/{PROCESS_ID}/workItemTypes/{WIT_REF_NAME}/states", API_VERSION)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Creates a state definition in the work item type of the process.")
+    parser.add_argument("--color", required=False, help="Color of the state")
+    parser.add_argument("--name", required=False, help="Name of the state")
+    parser.add_argument("--order", required=False, help="Order in which state should appear")
+    parser.add_argument("--state-category", required=False, help="Category of the state")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_states", pat)
+    logger.info("Creates a state definition in the work item type of the process.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_states(client, process_id, wit_ref_name, color=args.color, name=args.name, order=args.order, state_category=args.state_category)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'name', 'color'], API_VERSION)
+    print(f"States: {data.get('name', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"States: {data.get("name", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,75 +11,102 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/processes/work-ite
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROCESS_ID = get_env_or_exit("PROCESS_ID", "The ID of the process on which to create work item type.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Creates a work item type in the process.")
-parser.add_argument("--color", required=False, help="Color hexadecimal code to represent the work item type")
-parser.add_argument("--description", required=False, help="Description of the work item type")
-parser.add_argument("--icon", required=False, help="Icon to represent the work item type")
-parser.add_argument("--inherits-from", required=False, help="Parent work item type for work item type")
-parser.add_argument("--is-disabled", required=False, help="True if the work item type need to be disabled")
-parser.add_argument("--name", required=False, help="Name of work item type")
-args = parser.parse_args()
+def create_work_item_types(client, process_id: str, *, color: Optional[str] = None, description: Optional[str] = None, icon: Optional[str] = None, inherits_from: Optional[str] = None, is_disabled: Optional[str] = None, name: Optional[str] = None) -> dict:
+    """
+    Creates a work item type in the process.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        process_id: The ID of the process on which to create work item type.
+        color: Color hexadecimal code to represent the work item type
+        description: Description of the work item type
+        icon: Icon to represent the work item type
+        inherits_from: Parent work item type for work item type
+        is_disabled: True if the work item type need to be disabled
+        name: Name of work item type
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "color": color,
+        "description": description,
+        "icon": icon,
+        "inheritsFrom": inherits_from,
+        "isDisabled": is_disabled,
+        "name": name,
+    }
+    url = build_url(client.organization, f"_apis/work/processes/{process_id}/workitemtypes", API_VERSION)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['name', 'behaviors'], API_VERSION)
+    return data
+
+
+async def create_work_item_types_async(client, process_id: str, *, color: Optional[str] = None, description: Optional[str] = None, icon: Optional[str] = None, inherits_from: Optional[str] = None, is_disabled: Optional[str] = None, name: Optional[str] = None) -> dict:
+    """Async variant of create_work_item_types() for use with AsyncAdoClient."""
+    body = {
+        "color": color,
+        "description": description,
+        "icon": icon,
+        "inheritsFrom": inherits_from,
+        "isDisabled": is_disabled,
+        "name": name,
+    }
+    url = build_url(client.organization, f"_apis/work/processes/{process_id}/workitemtypes", API_VERSION)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['name', 'behaviors'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_work_item_types", PAT)
-logger.info("Creates a work item type in the process.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "color": args.color,
-    "description": args.description,
-    "icon": args.icon,
-    "inheritsFrom": args.inherits_from,
-    "isDisabled": args.is_disabled,
-    "name": args.name,
-}
+def main() -> None:
+    """Read env vars / flags, call create_work_item_types() and print the result."""
+    organization, pat = get_common_env()
+    process_id = require_env("PROCESS_ID", "The ID of the process on which to create work item type.")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/work/processes/{PROCESS_ID}/workitemtypes", API_VERSION)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Creates a work item type in the process.")
+    parser.add_argument("--color", required=False, help="Color hexadecimal code to represent the work item type")
+    parser.add_argument("--description", required=False, help="Description of the work item type")
+    parser.add_argument("--icon", required=False, help="Icon to represent the work item type")
+    parser.add_argument("--inherits-from", required=False, help="Parent work item type for work item type")
+    parser.add_argument("--is-disabled", required=False, help="True if the work item type need to be disabled")
+    parser.add_argument("--name", required=False, help="Name of work item type")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_work_item_types", pat)
+    logger.info("Creates a work item type in the process.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_work_item_types(client, process_id, color=args.color, description=args.description, icon=args.icon, inherits_from=args.inherits_from, is_disabled=args.is_disabled, name=args.name)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['name', 'behaviors'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
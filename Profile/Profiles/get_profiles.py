@@ -10,52 +10,71 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/profile/profiles/get?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-RESOURCE_ID = get_env_or_exit("RESOURCE_ID", "The ID of the target user profile within the same organization, or 'me' to get the profile of the...")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_profiles", PAT)
-logger.info("Gets a user profile.")
+def get_profiles(client, id: str) -> dict:
+    """
+    Gets a user profile.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/profile/profiles/{RESOURCE_ID}", API_VERSION, base_host="app.vssps.visualstudio.com")
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        id: The ID of the target user profile within the same organization, or 'me' to get the profile of the...
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/profile/profiles/{id}", API_VERSION, base_host="app.vssps.visualstudio.com")
+    response = client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['id', 'applicationContainer'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'applicationContainer'], API_VERSION)
+async def get_profiles_async(client, id: str) -> dict:
+    """Async variant of get_profiles() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/profile/profiles/{id}", API_VERSION, base_host="app.vssps.visualstudio.com")
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['id', 'applicationContainer'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(f"Profiles ID: {data.get("id", "N/A")}")
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_profiles() and print the result."""
+    organization, pat = get_common_env()
+    id = require_env("RESOURCE_ID", "The ID of the target user profile within the same organization, or 'me' to get the profile of the...")
+
+    logger = AdoLogger("get_profiles", pat)
+    logger.info("Gets a user profile.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = get_profiles(client, id)
+
+    print(f"Profiles ID: {data.get('id', 'N/A')}")
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
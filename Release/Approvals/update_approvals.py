@@ -11,77 +11,105 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/release/approvals/
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-APPROVAL_ID = get_env_or_exit("APPROVAL_ID", "Id of the approval.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Update status of an approval")
-parser.add_argument("--approval-type", required=False, help="Gets or sets the type of approval.")
-parser.add_argument("--approved-by", required=False, help="Gets the identity who approved.")
-parser.add_argument("--approver", required=False, help="Gets or sets the identity who should approve.")
-parser.add_argument("--attempt", required=False, help="Gets or sets attempt which specifies as which deployment attempt it belongs.")
-parser.add_argument("--comments", required=False, help="Gets or sets comments for approval.")
-parser.add_argument("--created-on", required=False, help="Gets date on which it got created.")
-args = parser.parse_args()
+def update_approvals(client, project: str, approval_id: str, *, approval_type: Optional[str] = None, approved_by: Optional[str] = None, approver: Optional[str] = None, attempt: Optional[str] = None, comments: Optional[str] = None, created_on: Optional[str] = None) -> dict:
+    """
+    Update status of an approval
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        approval_id: Id of the approval.
+        approval_type: Gets or sets the type of approval.
+        approved_by: Gets the identity who approved.
+        approver: Gets or sets the identity who should approve.
+        attempt: Gets or sets attempt which specifies as which deployment attempt it belongs.
+        comments: Gets or sets comments for approval.
+        created_on: Gets date on which it got created.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "approvalType": approval_type,
+        "approvedBy": approved_by,
+        "approver": approver,
+        "attempt": attempt,
+        "comments": comments,
+        "createdOn": created_on,
+    }
+    url = build_url(client.organization, f"_apis/release/approvals/{approval_id}", API_VERSION, project=project, base_host="vsrm.dev.azure.com")
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'approvalType'], API_VERSION)
+    return data
+
+
+async def update_approvals_async(client, project: str, approval_id: str, *, approval_type: Optional[str] = None, approved_by: Optional[str] = None, approver: Optional[str] = None, attempt: Optional[str] = None, comments: Optional[str] = None, created_on: Optional[str] = None) -> dict:
+    """Async variant of update_approvals() for use with AsyncAdoClient."""
+    body = {
+        "approvalType": approval_type,
+        "approvedBy": approved_by,
+        "approver": approver,
+        "attempt": attempt,
+        "comments": comments,
+        "createdOn": created_on,
+    }
+    url = build_url(client.organization, f"_apis/release/approvals/{approval_id}", API_VERSION, project=project, base_host="vsrm.dev.azure.com")
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'approvalType'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_approvals", PAT)
-logger.info("Update status of an approval")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "approvalType": args.approval_type,
-    "approvedBy": args.approved_by,
-    "approver": args.approver,
-    "attempt": args.attempt,
-    "comments": args.comments,
-    "createdOn": args.created_on,
-}
+def main() -> None:
+    """Read env vars / flags, call update_approvals() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    approval_id = require_env("APPROVAL_ID", "Id of the approval.")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/release/approvals/{APPROVAL_ID}", API_VERSION, project=PROJECT_ID, base_host="vsrm.dev.azure.com")
-logger.info(f"PATCH {url}")
+    parser = argparse.ArgumentParser(description="Update status of an approval")
+    parser.add_argument("--approval-type", required=False, help="Gets or sets the type of approval.")
+    parser.add_argument("--approved-by", required=False, help="Gets the identity who approved.")
+    parser.add_argument("--approver", required=False, help="Gets or sets the identity who should approve.")
+    parser.add_argument("--attempt", required=False, help="Gets or sets attempt which specifies as which deployment attempt it belongs.")
+    parser.add_argument("--comments", required=False, help="Gets or sets comments for approval.")
+    parser.add_argument("--created-on", required=False, help="Gets date on which it got created.")
+    args = parser.parse_args()
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+    logger = AdoLogger("update_approvals", pat)
+    logger.info("Update status of an approval")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_approvals(client, project, approval_id, approval_type=args.approval_type, approved_by=args.approved_by, approver=args.approver, attempt=args.attempt, comments=args.comments, created_on=args.created_on)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'approvalType'], API_VERSION)
+    print(f"Approvals ID: {data.get('id', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Approvals ID: {data.get("id", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
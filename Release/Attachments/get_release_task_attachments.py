@@ -10,51 +10,90 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/release/attachments/get-release-task-attachments?view=azure-devops-rest-7.2
 """
 
-import json
+import argparse
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-RELEASE_ID = get_env_or_exit("RELEASE_ID", "Id of the release.")
-ENVIRONMENT_ID = get_env_or_exit("ENVIRONMENT_ID", "Id of the release environment.")
-ATTEMPT_ID = get_env_or_exit("ATTEMPT_ID", "Attempt number of deployment.")
-PLAN_ID = get_env_or_exit("PLAN_ID", "Plan Id of the deploy phase.")
-TYPE = get_env_or_exit("TYPE", "Type of the attachment.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_release_task_attachments", PAT)
-logger.info("Get the release task attachments.")
+def get_release_task_attachments(client, project: str, release_id: str, environment_id: str, attempt_id: str, plan_id: str, type: str) -> dict:
+    """
+    Get the release task attachments.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/release/releases/{RELEASE_ID}/environments/{ENVIRONMENT_ID}/attempts/{ATTEMPT_ID}/plan/{PLAN_ID}/attachments/{TYPE}", API_VERSION, project=PROJECT_ID, base_host="vsrm.dev.azure.com")
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        release_id: Id of the release.
+        environment_id: Id of the release environment.
+        attempt_id: Attempt number of deployment.
+        plan_id: Plan Id of the deploy phase.
+        type: Type of the attachment.
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/release/releases/{release_id}/environments/{environment_id}/attempts/{attempt_id}/plan/{plan_id}/attachments/{type}", API_VERSION, project=project, base_host="vsrm.dev.azure.com")
+    response = client.request("GET", url)
+    data = loads(response.content)
+    return data
+
+
+async def get_release_task_attachments_async(client, project: str, release_id: str, environment_id: str, attempt_id: str, plan_id: str, type: str) -> dict:
+    """Async variant of get_release_task_attachments() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/release/releases/{release_id}/environments/{environment_id}/attempts/{attempt_id}/plan/{plan_id}/attachments/{type}", API_VERSION, project=project, base_host="vsrm.dev.azure.com")
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_release_task_attachments() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    release_id = require_env("RELEASE_ID", "Id of the release.")
+    environment_id = require_env("ENVIRONMENT_ID", "Id of the release environment.")
+    attempt_id = require_env("ATTEMPT_ID", "Attempt number of deployment.")
+    plan_id = require_env("PLAN_ID", "Plan Id of the deploy phase.")
+    type = require_env("TYPE", "Type of the attachment.")
+
+    parser = argparse.ArgumentParser(description="Get the release task attachments.")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("get_release_task_attachments", pat)
+    logger.info("Get the release task attachments.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        items = items_of(get_release_task_attachments(client, project, release_id, environment_id, attempt_id, plan_id, type), "value")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    data = get_release_task_attachments(client, project, release_id, environment_id, attempt_id, plan_id, type)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,53 +10,89 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/release/attachments/get-task-attachment-content?view=azure-devops-rest-7.2
 """
 
-import json
+import argparse
 import os
 import sys
+from typing import BinaryIO, Union
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.async_http_client import astream_to
+from _shared.download import download_file
+from _shared.http_client import AdoClient, build_url
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-RELEASE_ID = get_env_or_exit("RELEASE_ID", "Id of the release.")
-ENVIRONMENT_ID = get_env_or_exit("ENVIRONMENT_ID", "Id of the release environment.")
-ATTEMPT_ID = get_env_or_exit("ATTEMPT_ID", "Attempt number of deployment.")
-TIMELINE_ID = get_env_or_exit("TIMELINE_ID", "Timeline Id of the task.")
-RECORD_ID = get_env_or_exit("RECORD_ID", "Record Id of attachment.")
-TYPE = get_env_or_exit("TYPE", "Type of the attachment.")
-NAME = get_env_or_exit("NAME", "Name of the attachment.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_task_attachment_content", PAT)
-logger.info("GetTaskAttachmentContent API is deprecated.")
+def get_task_attachment_content(client, project: str, release_id: str, environment_id: str, attempt_id: str, timeline_id: str, record_id: str, type: str, name: str, *, destination: Union[str, BinaryIO]) -> int:
+    """
+    GetTaskAttachmentContent API is deprecated.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        release_id: Id of the release.
+        environment_id: Id of the release environment.
+        attempt_id: Attempt number of deployment.
+        timeline_id: Timeline Id of the task.
+        record_id: Record Id of attachment.
+        type: Type of the attachment.
+        name: Name of the attachment.
+        destination: Output path or binary file (e.g. sys.stdout.buffer).
+
+    Returns:
+        Bytes written. A path destination is fetched in parallel ranged
+        segments and resumes after an interruption (see _shared.download).
+    """
+    url = build_url(client.organization, f"_apis/release/releases/{release_id}/environments/{environment_id}/attempts/{attempt_id}/timelines/{timeline_id}/records/{record_id}/attachments/{type}/{name}", API_VERSION, project=project, base_host="vsrm.dev.azure.com")
+    return download_file(client, url, destination, accept="application/octet-stream")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/release/releases/{RELEASE_ID}/environments/{ENVIRONMENT_ID}/attempts/{ATTEMPT_ID}/timelines/{TIMELINE_ID}/records/{RECORD_ID}/attachments/{TYPE}/{NAME}", API_VERSION, project=PROJECT_ID, base_host="vsrm.dev.azure.com")
-logger.info(f"GET {url}")
 
-response = execute_request("GET", url, HEADERS)
+async def get_task_attachment_content_async(client, project: str, release_id: str, environment_id: str, attempt_id: str, timeline_id: str, record_id: str, type: str, name: str, *, destination: Union[str, BinaryIO]) -> int:
+    """Async variant of get_task_attachment_content() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/release/releases/{release_id}/environments/{environment_id}/attempts/{attempt_id}/timelines/{timeline_id}/records/{record_id}/attachments/{type}/{name}", API_VERSION, project=project, base_host="vsrm.dev.azure.com")
+    response = await client.request("GET", url, stream=True, accept="application/octet-stream")
+    return await astream_to(response, destination)
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_task_attachment_content() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    release_id = require_env("RELEASE_ID", "Id of the release.")
+    environment_id = require_env("ENVIRONMENT_ID", "Id of the release environment.")
+    attempt_id = require_env("ATTEMPT_ID", "Attempt number of deployment.")
+    timeline_id = require_env("TIMELINE_ID", "Timeline Id of the task.")
+    record_id = require_env("RECORD_ID", "Record Id of attachment.")
+    type = require_env("TYPE", "Type of the attachment.")
+    name = require_env("NAME", "Name of the attachment.")
+
+    parser = argparse.ArgumentParser(description="GetTaskAttachmentContent API is deprecated.")
+    parser.add_argument("--output", help="Write the content to this file (default: stdout)")
+    args = parser.parse_args()
+
+    logger = AdoLogger("get_task_attachment_content", pat)
+    logger.info("GetTaskAttachmentContent API is deprecated.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    written = get_task_attachment_content(client, project, release_id, environment_id, attempt_id, timeline_id, record_id, type, name, destination=args.output or sys.stdout.buffer)
+    logger.info(f"Downloaded {written} bytes")
+    if args.output:
+        print(f"Saved {written} bytes to {args.output}")
+
+
+if __name__ == "__main__":
+    run_cli(main)
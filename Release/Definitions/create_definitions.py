@@ -11,75 +11,102 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/release/definition
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Create a release definition")
-parser.add_argument("--artifacts", required=False, help="Gets or sets the list of artifacts.")
-parser.add_argument("--comment", required=False, help="Gets or sets comment.")
-parser.add_argument("--created-by", required=False, help="Gets or sets the identity who created.")
-parser.add_argument("--created-on", required=False, help="Gets date on which it got created.")
-parser.add_argument("--description", required=False, help="Gets or sets the description.")
-parser.add_argument("--environments", required=False, help="Gets or sets the list of environments.")
-args = parser.parse_args()
+def create_definitions(client, project: str, *, artifacts: Optional[str] = None, comment: Optional[str] = None, created_by: Optional[str] = None, created_on: Optional[str] = None, description: Optional[str] = None, environments: Optional[str] = None) -> dict:
+    """
+    Create a release definition
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        artifacts: Gets or sets the list of artifacts.
+        comment: Gets or sets comment.
+        created_by: Gets or sets the identity who created.
+        created_on: Gets date on which it got created.
+        description: Gets or sets the description.
+        environments: Gets or sets the list of environments.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "artifacts": artifacts,
+        "comment": comment,
+        "createdBy": created_by,
+        "createdOn": created_on,
+        "description": description,
+        "environments": environments,
+    }
+    url = build_url(client.organization, f"_apis/release/definitions", API_VERSION, project=project, base_host="vsrm.dev.azure.com")
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['artifacts', 'comment'], API_VERSION)
+    return data
+
+
+async def create_definitions_async(client, project: str, *, artifacts: Optional[str] = None, comment: Optional[str] = None, created_by: Optional[str] = None, created_on: Optional[str] = None, description: Optional[str] = None, environments: Optional[str] = None) -> dict:
+    """Async variant of create_definitions() for use with AsyncAdoClient."""
+    body = {
+        "artifacts": artifacts,
+        "comment": comment,
+        "createdBy": created_by,
+        "createdOn": created_on,
+        "description": description,
+        "environments": environments,
+    }
+    url = build_url(client.organization, f"_apis/release/definitions", API_VERSION, project=project, base_host="vsrm.dev.azure.com")
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['artifacts', 'comment'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_definitions", PAT)
-logger.info("Create a release definition")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "artifacts": args.artifacts,
-    "comment": args.comment,
-    "createdBy": args.created_by,
-    "createdOn": args.created_on,
-    "description": args.description,
-    "environments": args.environments,
-}
+def main() -> None:
+    """Read env vars / flags, call create_definitions() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/release/definitions", API_VERSION, project=PROJECT_ID, base_host="vsrm.dev.azure.com")
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Create a release definition")
+    parser.add_argument("--artifacts", required=False, help="Gets or sets the list of artifacts.")
+    parser.add_argument("--comment", required=False, help="Gets or sets comment.")
+    parser.add_argument("--created-by", required=False, help="Gets or sets the identity who created.")
+    parser.add_argument("--created-on", required=False, help="Gets date on which it got created.")
+    parser.add_argument("--description", required=False, help="Gets or sets the description.")
+    parser.add_argument("--environments", required=False, help="Gets or sets the list of environments.")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_definitions", pat)
+    logger.info("Create a release definition")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_definitions(client, project, artifacts=args.artifacts, comment=args.comment, created_by=args.created_by, created_on=args.created_on, description=args.description, environments=args.environments)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['artifacts', 'comment'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
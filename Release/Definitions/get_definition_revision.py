@@ -10,48 +10,78 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/release/definitions/get-definition-revision?view=azure-devops-rest-7.2
 """
 
-import json
+import argparse
 import os
 import sys
+from typing import BinaryIO, Union
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.async_http_client import astream_to
+from _shared.http_client import AdoClient, build_url, stream_to
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-DEFINITION_ID = get_env_or_exit("DEFINITION_ID", "Id of the definition.")
-REVISION = get_env_or_exit("REVISION", "Id of the revision.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_definition_revision", PAT)
-logger.info("Get release definition for a given definitionId and revision")
+def get_definition_revision(client, project: str, definition_id: str, revision: str, *, destination: Union[str, BinaryIO]) -> int:
+    """
+    Get release definition for a given definitionId and revision
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        definition_id: Id of the definition.
+        revision: Id of the revision.
+        destination: Output path or binary file (e.g. sys.stdout.buffer).
+
+    Returns:
+        Bytes written; the text/plain body is streamed in constant memory.
+    """
+    url = build_url(client.organization, f"_apis/Release/definitions/{definition_id}/revisions/{revision}", API_VERSION, project=project, base_host="vsrm.dev.azure.com")
+    response = client.request("GET", url, stream=True, accept="text/plain")
+    return stream_to(response, destination)
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/Release/definitions/{DEFINITION_ID}/revisions/{REVISION}", API_VERSION, project=PROJECT_ID, base_host="vsrm.dev.azure.com")
-logger.info(f"GET {url}")
 
-response = execute_request("GET", url, HEADERS)
+async def get_definition_revision_async(client, project: str, definition_id: str, revision: str, *, destination: Union[str, BinaryIO]) -> int:
+    """Async variant of get_definition_revision() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/Release/definitions/{definition_id}/revisions/{revision}", API_VERSION, project=project, base_host="vsrm.dev.azure.com")
+    response = await client.request("GET", url, stream=True, accept="text/plain")
+    return await astream_to(response, destination)
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_definition_revision() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    definition_id = require_env("DEFINITION_ID", "Id of the definition.")
+    revision = require_env("REVISION", "Id of the revision.")
+
+    parser = argparse.ArgumentParser(description="Get release definition for a given definitionId and revision")
+    parser.add_argument("--output", help="Write the content to this file (default: stdout)")
+    args = parser.parse_args()
+
+    logger = AdoLogger("get_definition_revision", pat)
+    logger.info("Get release definition for a given definitionId and revision")
+    client = AdoClient(organization, pat, logger=logger)
+
+    written = get_definition_revision(client, project, definition_id, revision, destination=args.output or sys.stdout.buffer)
+    logger.info(f"Downloaded {written} bytes")
+    if args.output:
+        print(f"Saved {written} bytes to {args.output}")
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,75 +11,102 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/release/folders/up
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-PATH = get_env_or_exit("PATH", "Path of the folder to update.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Updates an existing folder at given existing path.")
-parser.add_argument("--created-by", required=False, help="Identity who created this folder.")
-parser.add_argument("--created-on", required=False, help="Time when this folder created.")
-parser.add_argument("--description", required=False, help="Description of the folder.")
-parser.add_argument("--last-changed-by", required=False, help="Identity who last changed this folder.")
-parser.add_argument("--last-changed-date", required=False, help="Time when this folder last changed.")
-args = parser.parse_args()
+def update_folders(client, project: str, path: str, *, created_by: Optional[str] = None, created_on: Optional[str] = None, description: Optional[str] = None, last_changed_by: Optional[str] = None, last_changed_date: Optional[str] = None) -> dict:
+    """
+    Updates an existing folder at given existing path.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        path: Path of the folder to update.
+        created_by: Identity who created this folder.
+        created_on: Time when this folder created.
+        description: Description of the folder.
+        last_changed_by: Identity who last changed this folder.
+        last_changed_date: Time when this folder last changed.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "createdBy": created_by,
+        "createdOn": created_on,
+        "description": description,
+        "lastChangedBy": last_changed_by,
+        "lastChangedDate": last_changed_date,
+        "path": path,
+    }
+    url = build_url(client.organization, f"_apis/release/folders/{path}", API_VERSION, project=project, base_host="vsrm.dev.azure.com")
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['createdBy', 'createdOn'], API_VERSION)
+    return data
+
+
+async def update_folders_async(client, project: str, path: str, *, created_by: Optional[str] = None, created_on: Optional[str] = None, description: Optional[str] = None, last_changed_by: Optional[str] = None, last_changed_date: Optional[str] = None) -> dict:
+    """Async variant of update_folders() for use with AsyncAdoClient."""
+    body = {
+        "createdBy": created_by,
+        "createdOn": created_on,
+        "description": description,
+        "lastChangedBy": last_changed_by,
+        "lastChangedDate": last_changed_date,
+        "path": path,
+    }
+    url = build_url(client.organization, f"_apis/release/folders/{path}", API_VERSION, project=project, base_host="vsrm.dev.azure.com")
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['createdBy', 'createdOn'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_folders", PAT)
-logger.info("Updates an existing folder at given existing path.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "createdBy": args.created_by,
-    "createdOn": args.created_on,
-    "description": args.description,
-    "lastChangedBy": args.last_changed_by,
-    "lastChangedDate": args.last_changed_date,
-    "path": PATH,
-}
+def main() -> None:
+    """Read env vars / flags, call update_folders() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    path = require_env("PATH", "Path of the folder to update.")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/release/folders/{PATH}", API_VERSION, project=PROJECT_ID, base_host="vsrm.dev.azure.com")
-logger.info(f"PATCH {url}")
+    parser = argparse.ArgumentParser(description="Updates an existing folder at given existing path.")
+    parser.add_argument("--created-by", required=False, help="Identity who created this folder.")
+    parser.add_argument("--created-on", required=False, help="Time when this folder created.")
+    parser.add_argument("--description", required=False, help="Description of the folder.")
+    parser.add_argument("--last-changed-by", required=False, help="Identity who last changed this folder.")
+    parser.add_argument("--last-changed-date", required=False, help="Time when this folder last changed.")
+    args = parser.parse_args()
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+    logger = AdoLogger("update_folders", pat)
+    logger.info("Updates an existing folder at given existing path.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_folders(client, project, path, created_by=args.created_by, created_on=args.created_on, description=args.description, last_changed_by=args.last_changed_by, last_changed_date=args.last_changed_date)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['createdBy', 'createdOn'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
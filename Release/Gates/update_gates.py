@@ -11,69 +11,89 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/release/gates/upda
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-GATE_STEP_ID = get_env_or_exit("GATE_STEP_ID", "Gate step Id.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Updates the gate for a deployment.")
-parser.add_argument("--comment", required=False, help="Comment.")
-parser.add_argument("--gates-to-ignore", required=False, help="Name of gate to be ignored.")
-args = parser.parse_args()
+def update_gates(client, project: str, gate_step_id: str, *, comment: Optional[str] = None, gates_to_ignore: Optional[str] = None) -> dict:
+    """
+    Updates the gate for a deployment.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        gate_step_id: Gate step Id.
+        comment: Comment.
+        gates_to_ignore: Name of gate to be ignored.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "comment": comment,
+        "gatesToIgnore": gates_to_ignore,
+    }
+    url = build_url(client.organization, f"_apis/release/gates/{gate_step_id}", API_VERSION, project=project, base_host="vsrm.dev.azure.com")
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'deploymentJobs'], API_VERSION)
+    return data
+
+
+async def update_gates_async(client, project: str, gate_step_id: str, *, comment: Optional[str] = None, gates_to_ignore: Optional[str] = None) -> dict:
+    """Async variant of update_gates() for use with AsyncAdoClient."""
+    body = {
+        "comment": comment,
+        "gatesToIgnore": gates_to_ignore,
+    }
+    url = build_url(client.organization, f"_apis/release/gates/{gate_step_id}", API_VERSION, project=project, base_host="vsrm.dev.azure.com")
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'deploymentJobs'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_gates", PAT)
-logger.info("Updates the gate for a deployment.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "comment": args.comment,
-    "gatesToIgnore": args.gates_to_ignore,
-}
+def main() -> None:
+    """Read env vars / flags, call update_gates() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    gate_step_id = require_env("GATE_STEP_ID", "Gate step Id.")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/release/gates/{GATE_STEP_ID}", API_VERSION, project=PROJECT_ID, base_host="vsrm.dev.azure.com")
-logger.info(f"PATCH {url}")
+    parser = argparse.ArgumentParser(description="Updates the gate for a deployment.")
+    parser.add_argument("--comment", required=False, help="Comment.")
+    parser.add_argument("--gates-to-ignore", required=False, help="Name of gate to be ignored.")
+    args = parser.parse_args()
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+    logger = AdoLogger("update_gates", pat)
+    logger.info("Updates the gate for a deployment.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_gates(client, project, gate_step_id, comment=args.comment, gates_to_ignore=args.gates_to_ignore)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'deploymentJobs'], API_VERSION)
+    print(f"Gates ID: {data.get('id', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Gates ID: {data.get("id", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
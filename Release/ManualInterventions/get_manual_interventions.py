@@ -10,54 +10,75 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/release/manual-interventions/get?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-RELEASE_ID = get_env_or_exit("RELEASE_ID", "Id of the release.")
-MANUAL_INTERVENTION_ID = get_env_or_exit("MANUAL_INTERVENTION_ID", "Id of the manual intervention.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_manual_interventions", PAT)
-logger.info("Get manual intervention for a given release and manual intervention id.")
+def get_manual_interventions(client, project: str, release_id: str, manual_intervention_id: str) -> dict:
+    """
+    Get manual intervention for a given release and manual intervention id.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/Release/releases/{RELEASE_ID}/manualinterventions/{MANUAL_INTERVENTION_ID}", API_VERSION, project=PROJECT_ID, base_host="vsrm.dev.azure.com")
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        release_id: Id of the release.
+        manual_intervention_id: Id of the manual intervention.
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/Release/releases/{release_id}/manualinterventions/{manual_intervention_id}", API_VERSION, project=project, base_host="vsrm.dev.azure.com")
+    response = client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name', 'approver'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'name', 'approver'], API_VERSION)
+async def get_manual_interventions_async(client, project: str, release_id: str, manual_intervention_id: str) -> dict:
+    """Async variant of get_manual_interventions() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/Release/releases/{release_id}/manualinterventions/{manual_intervention_id}", API_VERSION, project=project, base_host="vsrm.dev.azure.com")
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name', 'approver'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(f"Manual Interventions: {data.get("name", "N/A")}")
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_manual_interventions() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    release_id = require_env("RELEASE_ID", "Id of the release.")
+    manual_intervention_id = require_env("MANUAL_INTERVENTION_ID", "Id of the manual intervention.")
+
+    logger = AdoLogger("get_manual_interventions", pat)
+    logger.info("Get manual intervention for a given release and manual intervention id.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = get_manual_interventions(client, project, release_id, manual_intervention_id)
+
+    print(f"Manual Interventions: {data.get('name', 'N/A')}")
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,70 +11,91 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/release/manual-int
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-RELEASE_ID = get_env_or_exit("RELEASE_ID", "Id of the release.")
-MANUAL_INTERVENTION_ID = get_env_or_exit("MANUAL_INTERVENTION_ID", "Id of the manual intervention.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Update manual intervention.")
-parser.add_argument("--comment", required=False, help="Sets the comment for manual intervention update.")
-parser.add_argument("--status", required=False, help="Sets the status of the manual intervention.")
-args = parser.parse_args()
+def update_manual_interventions(client, project: str, release_id: str, manual_intervention_id: str, *, comment: Optional[str] = None, status: Optional[str] = None) -> dict:
+    """
+    Update manual intervention.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        release_id: Id of the release.
+        manual_intervention_id: Id of the manual intervention.
+        comment: Sets the comment for manual intervention update.
+        status: Sets the status of the manual intervention.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "comment": comment,
+        "status": status,
+    }
+    url = build_url(client.organization, f"_apis/Release/releases/{release_id}/manualinterventions/{manual_intervention_id}", API_VERSION, project=project, base_host="vsrm.dev.azure.com")
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name', 'approver'], API_VERSION)
+    return data
+
+
+async def update_manual_interventions_async(client, project: str, release_id: str, manual_intervention_id: str, *, comment: Optional[str] = None, status: Optional[str] = None) -> dict:
+    """Async variant of update_manual_interventions() for use with AsyncAdoClient."""
+    body = {
+        "comment": comment,
+        "status": status,
+    }
+    url = build_url(client.organization, f"_apis/Release/releases/{release_id}/manualinterventions/{manual_intervention_id}", API_VERSION, project=project, base_host="vsrm.dev.azure.com")
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name', 'approver'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_manual_interventions", PAT)
-logger.info("Update manual intervention.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "comment": args.comment,
-    "status": args.status,
-}
+def main() -> None:
+    """Read env vars / flags, call update_manual_interventions() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    release_id = require_env("RELEASE_ID", "Id of the release.")
+    manual_intervention_id = require_env("MANUAL_INTERVENTION_ID", "Id of the manual intervention.")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/Release/releases/{RELEASE_ID}/manualinterventions/{MANUAL_INTERVENTION_ID}", API_VERSION, project=PROJECT_ID, base_host="vsrm.dev.azure.com")
-logger.info(f"PATCH {url}")
+    parser = argparse.ArgumentParser(description="Update manual intervention.")
+    parser.add_argument("--comment", required=False, help="Sets the comment for manual intervention update.")
+    parser.add_argument("--status", required=False, help="Sets the status of the manual intervention.")
+    args = parser.parse_args()
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+    logger = AdoLogger("update_manual_interventions", pat)
+    logger.info("Update manual intervention.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_manual_interventions(client, project, release_id, manual_intervention_id, comment=args.comment, status=args.status)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'name', 'approver'], API_VERSION)
+    print(f"Manual Interventions: {data.get('name', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Manual Interventions: {data.get("name", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
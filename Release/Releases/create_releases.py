@@ -11,75 +11,102 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/release/releases/c
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Create a release.")
-parser.add_argument("--artifacts", required=False, help="Sets list of artifact to create a release.")
-parser.add_argument("--definition-id", required=False, help="Sets definition Id to create a release.")
-parser.add_argument("--description", required=False, help="Sets description to create a release.")
-parser.add_argument("--environments-metadata", required=False, help="Sets list of environments meta data.")
-parser.add_argument("--is-draft", required=False, help="Sets 'true' to create release in draft mode, 'false' otherwise.")
-parser.add_argument("--manual-environments", required=False, help="Sets list of environments to manual as condition.")
-args = parser.parse_args()
+def create_releases(client, project: str, *, artifacts: Optional[str] = None, definition_id: Optional[str] = None, description: Optional[str] = None, environments_metadata: Optional[str] = None, is_draft: Optional[str] = None, manual_environments: Optional[str] = None) -> dict:
+    """
+    Create a release.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        artifacts: Sets list of artifact to create a release.
+        definition_id: Sets definition Id to create a release.
+        description: Sets description to create a release.
+        environments_metadata: Sets list of environments meta data.
+        is_draft: Sets 'true' to create release in draft mode, 'false' otherwise.
+        manual_environments: Sets list of environments to manual as condition.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "artifacts": artifacts,
+        "definitionId": definition_id,
+        "description": description,
+        "environmentsMetadata": environments_metadata,
+        "isDraft": is_draft,
+        "manualEnvironments": manual_environments,
+    }
+    url = build_url(client.organization, f"_apis/release/releases", API_VERSION, project=project, base_host="vsrm.dev.azure.com")
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name'], API_VERSION)
+    return data
+
+
+async def create_releases_async(client, project: str, *, artifacts: Optional[str] = None, definition_id: Optional[str] = None, description: Optional[str] = None, environments_metadata: Optional[str] = None, is_draft: Optional[str] = None, manual_environments: Optional[str] = None) -> dict:
+    """Async variant of create_releases() for use with AsyncAdoClient."""
+    body = {
+        "artifacts": artifacts,
+        "definitionId": definition_id,
+        "description": description,
+        "environmentsMetadata": environments_metadata,
+        "isDraft": is_draft,
+        "manualEnvironments": manual_environments,
+    }
+    url = build_url(client.organization, f"_apis/release/releases", API_VERSION, project=project, base_host="vsrm.dev.azure.com")
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_releases", PAT)
-logger.info("Create a release.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "artifacts": args.artifacts,
-    "definitionId": args.definition_id,
-    "description": args.description,
-    "environmentsMetadata": args.environments_metadata,
-    "isDraft": args.is_draft,
-    "manualEnvironments": args.manual_environments,
-}
+def main() -> None:
+    """Read env vars / flags, call create_releases() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/release/releases", API_VERSION, project=PROJECT_ID, base_host="vsrm.dev.azure.com")
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Create a release.")
+    parser.add_argument("--artifacts", required=False, help="Sets list of artifact to create a release.")
+    parser.add_argument("--definition-id", required=False, help="Sets definition Id to create a release.")
+    parser.add_argument("--description", required=False, help="Sets description to create a release.")
+    parser.add_argument("--environments-metadata", required=False, help="Sets list of environments meta data.")
+    parser.add_argument("--is-draft", required=False, help="Sets 'true' to create release in draft mode, 'false' otherwise.")
+    parser.add_argument("--manual-environments", required=False, help="Sets list of environments to manual as condition.")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_releases", pat)
+    logger.info("Create a release.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_releases(client, project, artifacts=args.artifacts, definition_id=args.definition_id, description=args.description, environments_metadata=args.environments_metadata, is_draft=args.is_draft, manual_environments=args.manual_environments)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'name'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,50 +10,82 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/release/releases/get-task-log?view=azure-devops-rest-7.2
 """
 
-import json
+import argparse
 import os
 import sys
+from typing import BinaryIO, Union
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.async_http_client import astream_to
+from _shared.http_client import AdoClient, build_url, stream_to
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-RELEASE_ID = get_env_or_exit("RELEASE_ID", "Id of the release.")
-ENVIRONMENT_ID = get_env_or_exit("ENVIRONMENT_ID", "Id of release environment.")
-RELEASE_DEPLOY_PHASE_ID = get_env_or_exit("RELEASE_DEPLOY_PHASE_ID", "Release deploy phase Id.")
-TASK_ID = get_env_or_exit("TASK_ID", "ReleaseTask Id for the log.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_task_log", PAT)
-logger.info("Gets the task log of a release as a plain text file.")
+def get_task_log(client, project: str, release_id: str, environment_id: str, release_deploy_phase_id: str, task_id: str, *, destination: Union[str, BinaryIO]) -> int:
+    """
+    Gets the task log of a release as a plain text file.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        release_id: Id of the release.
+        environment_id: Id of release environment.
+        release_deploy_phase_id: Release deploy phase Id.
+        task_id: ReleaseTask Id for the log.
+        destination: Output path or binary file (e.g. sys.stdout.buffer).
+
+    Returns:
+        Bytes written; the text/plain body is streamed in constant memory.
+    """
+    url = build_url(client.organization, f"_apis/release/releases/{release_id}/environments/{environment_id}/deployPhases/{release_deploy_phase_id}/tasks/{task_id}/logs", API_VERSION, project=project, base_host="vsrm.dev.azure.com")
+    response = client.request("GET", url, stream=True, accept="text/plain")
+    return stream_to(response, destination)
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/release/releases/{RELEASE_ID}/environments/{ENVIRONMENT_ID}/deployPhases/{RELEASE_DEPLOY_PHASE_ID}/tasks/{TASK_ID}/logs", API_VERSION, project=PROJECT_ID, base_host="vsrm.dev.azure.com")
-logger.info(f"GET {url}")
 
-response = execute_request("GET", url, HEADERS)
+async def get_task_log_async(client, project: str, release_id: str, environment_id: str, release_deploy_phase_id: str, task_id: str, *, destination: Union[str, BinaryIO]) -> int:
+    """Async variant of get_task_log() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/release/releases/{release_id}/environments/{environment_id}/deployPhases/{release_deploy_phase_id}/tasks/{task_id}/logs", API_VERSION, project=project, base_host="vsrm.dev.azure.com")
+    response = await client.request("GET", url, stream=True, accept="text/plain")
+    return await astream_to(response, destination)
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_task_log() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    release_id = require_env("RELEASE_ID", "Id of the release.")
+    environment_id = require_env("ENVIRONMENT_ID", "Id of release environment.")
+    release_deploy_phase_id = require_env("RELEASE_DEPLOY_PHASE_ID", "Release deploy phase Id.")
+    task_id = require_env("TASK_ID", "ReleaseTask Id for the log.")
+
+    parser = argparse.ArgumentParser(description="Gets the task log of a release as a plain text file.")
+    parser.add_argument("--output", help="Write the content to this file (default: stdout)")
+    args = parser.parse_args()
+
+    logger = AdoLogger("get_task_log", pat)
+    logger.info("Gets the task log of a release as a plain text file.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    written = get_task_log(client, project, release_id, environment_id, release_deploy_phase_id, task_id, destination=args.output or sys.stdout.buffer)
+    logger.info(f"Downloaded {written} bytes")
+    if args.output:
+        print(f"Saved {written} bytes to {args.output}")
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,74 +11,100 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/release/releases/u
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-RELEASE_ID = get_env_or_exit("RELEASE_ID", "Id of the release to update.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Update a complete release object.")
-parser.add_argument("--artifacts", required=False, help="Gets or sets the list of artifacts.")
-parser.add_argument("--comment", required=False, help="Gets or sets comment.")
-parser.add_argument("--created-by", required=False, help="Gets or sets the identity who created.")
-parser.add_argument("--created-for", required=False, help="Gets or sets the identity for whom release was created.")
-parser.add_argument("--created-on", required=False, help="Gets date on which it got created.")
-args = parser.parse_args()
+def update_release(client, project: str, release_id: str, *, artifacts: Optional[str] = None, comment: Optional[str] = None, created_by: Optional[str] = None, created_for: Optional[str] = None, created_on: Optional[str] = None) -> dict:
+    """
+    Update a complete release object.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        release_id: Id of the release to update.
+        artifacts: Gets or sets the list of artifacts.
+        comment: Gets or sets comment.
+        created_by: Gets or sets the identity who created.
+        created_for: Gets or sets the identity for whom release was created.
+        created_on: Gets date on which it got created.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "artifacts": artifacts,
+        "comment": comment,
+        "createdBy": created_by,
+        "createdFor": created_for,
+        "createdOn": created_on,
+    }
+    url = build_url(client.organization, f"_apis/release/releases/{release_id}", API_VERSION, project=project, base_host="vsrm.dev.azure.com")
+    response = client.request("PUT", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name'], API_VERSION)
+    return data
+
+
+async def update_release_async(client, project: str, release_id: str, *, artifacts: Optional[str] = None, comment: Optional[str] = None, created_by: Optional[str] = None, created_for: Optional[str] = None, created_on: Optional[str] = None) -> dict:
+    """Async variant of update_release() for use with AsyncAdoClient."""
+    body = {
+        "artifacts": artifacts,
+        "comment": comment,
+        "createdBy": created_by,
+        "createdFor": created_for,
+        "createdOn": created_on,
+    }
+    url = build_url(client.organization, f"_apis/release/releases/{release_id}", API_VERSION, project=project, base_host="vsrm.dev.azure.com")
+    response = await client.request("PUT", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_release", PAT)
-logger.info("Update a complete release object.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "artifacts": args.artifacts,
-    "comment": args.comment,
-    "createdBy": args.created_by,
-    "createdFor": args.created_for,
-    "createdOn": args.created_on,
-}
+def main() -> None:
+    """Read env vars / flags, call update_release() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    release_id = require_env("RELEASE_ID", "Id of the release to update.")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/release/releases/{RELEASE_ID}", API_VERSION, project=PROJECT_ID, base_host="vsrm.dev.azure.com")
-logger.info(f"PUT {url}")
+    parser = argparse.ArgumentParser(description="Update a complete release object.")
+    parser.add_argument("--artifacts", required=False, help="Gets or sets the list of artifacts.")
+    parser.add_argument("--comment", required=False, help="Gets or sets comment.")
+    parser.add_argument("--created-by", required=False, help="Gets or sets the identity who created.")
+    parser.add_argument("--created-for", required=False, help="Gets or sets the identity for whom release was created.")
+    parser.add_argument("--created-on", required=False, help="Gets date on which it got created.")
+    args = parser.parse_args()
 
-response = execute_request("PUT", url, HEADERS, body=body)
+    logger = AdoLogger("update_release", pat)
+    logger.info("Update a complete release object.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_release(client, project, release_id, artifacts=args.artifacts, comment=args.comment, created_by=args.created_by, created_for=args.created_for, created_on=args.created_on)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'name'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,74 +11,99 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/release/releases/u
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-RELEASE_ID = get_env_or_exit("RELEASE_ID", "Id of the release.")
-ENVIRONMENT_ID = get_env_or_exit("ENVIRONMENT_ID", "Id of release environment.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Update the status of a release environment")
-parser.add_argument("--comment", required=False, help="Gets or sets comment.")
-parser.add_argument("--scheduled-deployment-time", required=False, help="Gets or sets scheduled deployment time.")
-parser.add_argument("--status", required=False, help="Gets or sets status of environment.")
-parser.add_argument("--variables", required=False, help="Sets list of environment variables to be overridden at deployment time.")
-args = parser.parse_args()
+def update_release_environment(client, project: str, release_id: str, environment_id: str, *, comment: Optional[str] = None, scheduled_deployment_time: Optional[str] = None, status: Optional[str] = None, variables: Optional[str] = None) -> dict:
+    """
+    Update the status of a release environment
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        release_id: Id of the release.
+        environment_id: Id of release environment.
+        comment: Gets or sets comment.
+        scheduled_deployment_time: Gets or sets scheduled deployment time.
+        status: Gets or sets status of environment.
+        variables: Sets list of environment variables to be overridden at deployment time.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "comment": comment,
+        "scheduledDeploymentTime": scheduled_deployment_time,
+        "status": status,
+        "variables": variables,
+    }
+    url = build_url(client.organization, f"_apis/Release/releases/{release_id}/environments/{environment_id}", API_VERSION, project=project, base_host="vsrm.dev.azure.com")
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name', 'conditions'], API_VERSION)
+    return data
+
+
+async def update_release_environment_async(client, project: str, release_id: str, environment_id: str, *, comment: Optional[str] = None, scheduled_deployment_time: Optional[str] = None, status: Optional[str] = None, variables: Optional[str] = None) -> dict:
+    """Async variant of update_release_environment() for use with AsyncAdoClient."""
+    body = {
+        "comment": comment,
+        "scheduledDeploymentTime": scheduled_deployment_time,
+        "status": status,
+        "variables": variables,
+    }
+    url = build_url(client.organization, f"_apis/Release/releases/{release_id}/environments/{environment_id}", API_VERSION, project=project, base_host="vsrm.dev.azure.com")
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name', 'conditions'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_release_environment", PAT)
-logger.info("Update the status of a release environment")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "comment": args.comment,
-    "scheduledDeploymentTime": args.scheduled_deployment_time,
-    "status": args.status,
-    "variables": args.variables,
-}
+def main() -> None:
+    """Read env vars / flags, call update_release_environment() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    release_id = require_env("RELEASE_ID", "Id of the release.")
+    environment_id = require_env("ENVIRONMENT_ID", "Id of release environment.")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/Release/releases/{RELEASE_ID}/environments/{ENVIRONMENT_ID}", API_VERSION, project=PROJECT_ID, base_host="vsrm.dev.azure.com")
-logger.info(f"PATCH {url}")
+    parser = argparse.ArgumentParser(description="Update the status of a release environment")
+    parser.add_argument("--comment", required=False, help="Gets or sets comment.")
+    parser.add_argument("--scheduled-deployment-time", required=False, help="Gets or sets scheduled deployment time.")
+    parser.add_argument("--status", required=False, help="Gets or sets status of environment.")
+    parser.add_argument("--variables", required=False, help="Sets list of environment variables to be overridden at deployment time.")
+    args = parser.parse_args()
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+    logger = AdoLogger("update_release_environment", pat)
+    logger.info("Update the status of a release environment")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_release_environment(client, project, release_id, environment_id, comment=args.comment, scheduled_deployment_time=args.scheduled_deployment_time, status=args.status, variables=args.variables)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'name', 'conditions'], API_VERSION)
+    print(f"Releases ID: {data.get('id', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Releases ID: {data.get("id", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
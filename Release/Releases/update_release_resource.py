@@ -11,74 +11,100 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/release/releases/u
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-RELEASE_ID = get_env_or_exit("RELEASE_ID", "Id of the release to update.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Update few properties of a release.")
-parser.add_argument("--comment", required=False, help="Sets comment for release.")
-parser.add_argument("--keep-forever", required=False, help="Set 'true' to exclude the release from retention policies.")
-parser.add_argument("--manual-environments", required=False, help="Sets list of manual environments.")
-parser.add_argument("--name", required=False, help="Sets name of the release.")
-parser.add_argument("--status", required=False, help="Sets status of the release.")
-args = parser.parse_args()
+def update_release_resource(client, project: str, release_id: str, *, comment: Optional[str] = None, keep_forever: Optional[str] = None, manual_environments: Optional[str] = None, name: Optional[str] = None, status: Optional[str] = None) -> dict:
+    """
+    Update few properties of a release.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        release_id: Id of the release to update.
+        comment: Sets comment for release.
+        keep_forever: Set 'true' to exclude the release from retention policies.
+        manual_environments: Sets list of manual environments.
+        name: Sets name of the release.
+        status: Sets status of the release.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "comment": comment,
+        "keepForever": keep_forever,
+        "manualEnvironments": manual_environments,
+        "name": name,
+        "status": status,
+    }
+    url = build_url(client.organization, f"_apis/release/releases/{release_id}", API_VERSION, project=project, base_host="vsrm.dev.azure.com")
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name'], API_VERSION)
+    return data
+
+
+async def update_release_resource_async(client, project: str, release_id: str, *, comment: Optional[str] = None, keep_forever: Optional[str] = None, manual_environments: Optional[str] = None, name: Optional[str] = None, status: Optional[str] = None) -> dict:
+    """Async variant of update_release_resource() for use with AsyncAdoClient."""
+    body = {
+        "comment": comment,
+        "keepForever": keep_forever,
+        "manualEnvironments": manual_environments,
+        "name": name,
+        "status": status,
+    }
+    url = build_url(client.organization, f"_apis/release/releases/{release_id}", API_VERSION, project=project, base_host="vsrm.dev.azure.com")
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_release_resource", PAT)
-logger.info("Update few properties of a release.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "comment": args.comment,
-    "keepForever": args.keep_forever,
-    "manualEnvironments": args.manual_environments,
-    "name": args.name,
-    "status": args.status,
-}
+def main() -> None:
+    """Read env vars / flags, call update_release_resource() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    release_id = require_env("RELEASE_ID", "Id of the release to update.")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/release/releases/{RELEASE_ID}", API_VERSION, project=PROJECT_ID, base_host="vsrm.dev.azure.com")
-logger.info(f"PATCH {url}")
+    parser = argparse.ArgumentParser(description="Update few properties of a release.")
+    parser.add_argument("--comment", required=False, help="Sets comment for release.")
+    parser.add_argument("--keep-forever", required=False, help="Set 'true' to exclude the release from retention policies.")
+    parser.add_argument("--manual-environments", required=False, help="Sets list of manual environments.")
+    parser.add_argument("--name", required=False, help="Sets name of the release.")
+    parser.add_argument("--status", required=False, help="Sets status of the release.")
+    args = parser.parse_args()
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+    logger = AdoLogger("update_release_resource", pat)
+    logger.info("Update few properties of a release.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_release_resource(client, project, release_id, comment=args.comment, keep_forever=args.keep_forever, manual_environments=args.manual_environments, name=args.name, status=args.status)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'name'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,45 +10,66 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/resource-usage/team-project-collection/list?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.1"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("list_team_project_collection", PAT)
-logger.info("List for Team Project Collection")
+def list_team_project_collection(client) -> dict:
+    """
+    List for Team Project Collection
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/resourceusage", API_VERSION)
+    response = client.request("GET", url)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/resourceusage", API_VERSION)
-logger.info(f"GET {url}")
 
-response = execute_request("GET", url, HEADERS)
+async def list_team_project_collection_async(client) -> dict:
+    """Async variant of list_team_project_collection() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/resourceusage", API_VERSION)
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call list_team_project_collection() and print the result."""
+    organization, pat = get_common_env()
+
+    logger = AdoLogger("list_team_project_collection", pat)
+    logger.info("List for Team Project Collection")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = list_team_project_collection(client)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,67 +11,91 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/search/code-search
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Provides a set of results for the search text.")
-parser.add_argument("--include-snippet", required=False, help="Flag to opt for including matched code snippet in the result. Default behavior is false.")
-args = parser.parse_args()
+def query_fetch_code_search_results(client, project: str, *, include_snippet: Optional[str] = None) -> dict:
+    """
+    Provides a set of results for the search text.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        include_snippet: Flag to opt for including matched code snippet in the result. Default behavior is false.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "includeSnippet": include_snippet,
+    }
+    url = build_url(client.organization, f"_apis/search/codesearchresults", API_VERSION, project=project, base_host="almsearch.dev.azure.com")
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['count', 'results'], API_VERSION)
+    return data
+
+
+async def query_fetch_code_search_results_async(client, project: str, *, include_snippet: Optional[str] = None) -> dict:
+    """Async variant of query_fetch_code_search_results() for use with AsyncAdoClient."""
+    body = {
+        "includeSnippet": include_snippet,
+    }
+    url = build_url(client.organization, f"_apis/search/codesearchresults", API_VERSION, project=project, base_host="almsearch.dev.azure.com")
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['count', 'results'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("query_fetch_code_search_results", PAT)
-logger.info("Provides a set of results for the search text.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "includeSnippet": args.include_snippet,
-}
+def main() -> None:
+    """Read env vars / flags, call query_fetch_code_search_results() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/search/codesearchresults", API_VERSION, project=PROJECT_ID, base_host="almsearch.dev.azure.com")
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Provides a set of results for the search text.")
+    parser.add_argument("--include-snippet", required=False, help="Flag to opt for including matched code snippet in the result. Default behavior is false.")
+    add_format_arguments(parser)
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("query_fetch_code_search_results", pat)
+    logger.info("Provides a set of results for the search text.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    if args.format:
+        items = items_of(query_fetch_code_search_results(client, project, include_snippet=args.include_snippet), "value")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['count', 'results'], API_VERSION)
+    data = query_fetch_code_search_results(client, project, include_snippet=args.include_snippet)
+    logger.info(f"Retrieved {data.get('count', '?')} items")
 
-logger.info(f"Retrieved {data.get('count', '?')} items")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,46 +10,68 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/security/access-control-entries/remove-access-control-entries?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-SECURITY_NAMESPACE_ID = get_env_or_exit("SECURITY_NAMESPACE_ID", "Security namespace identifier.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("delete_access_control_entries", PAT)
-logger.info("Remove the specified ACEs from the ACL belonging to the specified token.")
+def delete_access_control_entries(client, security_namespace_id: str) -> dict:
+    """
+    Remove the specified ACEs from the ACL belonging to the specified token.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        security_namespace_id: Security namespace identifier.
+
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/accesscontrolentries/{security_namespace_id}", API_VERSION)
+    response = client.request("DELETE", url)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/accesscontrolentries/{SECURITY_NAMESPACE_ID}", API_VERSION)
-logger.info(f"DELETE {url}")
 
-response = execute_request("DELETE", url, HEADERS)
+async def delete_access_control_entries_async(client, security_namespace_id: str) -> dict:
+    """Async variant of delete_access_control_entries() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/accesscontrolentries/{security_namespace_id}", API_VERSION)
+    response = await client.request("DELETE", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call delete_access_control_entries() and print the result."""
+    organization, pat = get_common_env()
+    security_namespace_id = require_env("SECURITY_NAMESPACE_ID", "Security namespace identifier.")
+
+    logger = AdoLogger("delete_access_control_entries", pat)
+    logger.info("Remove the specified ACEs from the ACL belonging to the specified token.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = delete_access_control_entries(client, security_namespace_id)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
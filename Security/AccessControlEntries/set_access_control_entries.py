@@ -11,62 +11,92 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/security/access-co
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-SECURITY_NAMESPACE_ID = get_env_or_exit("SECURITY_NAMESPACE_ID", "Security namespace identifier.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Add or update ACEs in the ACL for the provided token.")
-parser.add_argument("--item", required=False, help="item")
-parser.add_argument("--type", required=False, help="Gets the node type for this JToken.")
-args = parser.parse_args()
+def set_access_control_entries(client, security_namespace_id: str, *, item: Optional[str] = None, type: Optional[str] = None) -> dict:
+    """
+    Add or update ACEs in the ACL for the provided token.
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("set_access_control_entries", PAT)
-logger.info("Add or update ACEs in the ACL for the provided token.")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        security_namespace_id: Security namespace identifier.
+        item: item
+        type: Gets the node type for this JToken.
 
-# ---------------------------------------------------------------------------
-# Request body
-# ---------------------------------------------------------------------------
-body = {
-    "item": args.item,
-    "type": args.type,
-}
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "item": item,
+        "type": type,
+    }
+    url = build_url(client.organization, f"_apis/accesscontrolentries/{security_namespace_id}", API_VERSION)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/accesscontrolentries/{SECURITY_NAMESPACE_ID}", API_VERSION)
-logger.info(f"POST {url}")
 
-response = execute_request("POST", url, HEADERS, body=body)
+async def set_access_control_entries_async(client, security_namespace_id: str, *, item: Optional[str] = None, type: Optional[str] = None) -> dict:
+    """Async variant of set_access_control_entries() for use with AsyncAdoClient."""
+    body = {
+        "item": item,
+        "type": type,
+    }
+    url = build_url(client.organization, f"_apis/accesscontrolentries/{security_namespace_id}", API_VERSION)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call set_access_control_entries() and print the result."""
+    organization, pat = get_common_env()
+    security_namespace_id = require_env("SECURITY_NAMESPACE_ID", "Security namespace identifier.")
+
+    parser = argparse.ArgumentParser(description="Add or update ACEs in the ACL for the provided token.")
+    parser.add_argument("--item", required=False, help="item")
+    parser.add_argument("--type", required=False, help="Gets the node type for this JToken.")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("set_access_control_entries", pat)
+    logger.info("Add or update ACEs in the ACL for the provided token.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        items = items_of(set_access_control_entries(client, security_namespace_id, item=args.item, type=args.type), "value")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    data = set_access_control_entries(client, security_namespace_id, item=args.item, type=args.type)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
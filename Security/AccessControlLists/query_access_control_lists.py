@@ -10,46 +10,80 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/security/access-control-lists/query?view=azure-devops-rest-7.2
 """
 
-import json
+import argparse
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-SECURITY_NAMESPACE_ID = get_env_or_exit("SECURITY_NAMESPACE_ID", "Security namespace identifier.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("query_access_control_lists", PAT)
-logger.info("Return a list of access control lists for the specified security namespace and token.")
+def query_access_control_lists(client, security_namespace_id: str) -> dict:
+    """
+    Return a list of access control lists for the specified security namespace and token.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/accesscontrollists/{SECURITY_NAMESPACE_ID}", API_VERSION)
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        security_namespace_id: Security namespace identifier.
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/accesscontrollists/{security_namespace_id}", API_VERSION)
+    response = client.request("GET", url)
+    data = loads(response.content)
+    return data
+
+
+async def query_access_control_lists_async(client, security_namespace_id: str) -> dict:
+    """Async variant of query_access_control_lists() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/accesscontrollists/{security_namespace_id}", API_VERSION)
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call query_access_control_lists() and print the result."""
+    organization, pat = get_common_env()
+    security_namespace_id = require_env("SECURITY_NAMESPACE_ID", "Security namespace identifier.")
+
+    parser = argparse.ArgumentParser(description="Return a list of access control lists for the specified security namespace and token.")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("query_access_control_lists", pat)
+    logger.info("Return a list of access control lists for the specified security namespace and token.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        items = items_of(query_access_control_lists(client, security_namespace_id), "value")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    data = query_access_control_lists(client, security_namespace_id)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
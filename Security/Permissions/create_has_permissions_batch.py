@@ -11,66 +11,84 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/security/permissio
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Evaluates multiple permissions for the calling user.")
-parser.add_argument("--always-allow-administrators", required=False, help="True if members of the Administrators group should always pass the security check.")
-parser.add_argument("--evaluations", required=False, help="Array of permission evaluations to evaluate.")
-args = parser.parse_args()
+def create_has_permissions_batch(client, *, always_allow_administrators: Optional[str] = None, evaluations: Optional[str] = None) -> dict:
+    """
+    Evaluates multiple permissions for the calling user.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        always_allow_administrators: True if members of the Administrators group should always pass the security check.
+        evaluations: Array of permission evaluations to evaluate.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "alwaysAllowAdministrators": always_allow_administrators,
+        "evaluations": evaluations,
+    }
+    url = build_url(client.organization, f"_apis/security/permissionevaluationbatch", API_VERSION)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['alwaysAllowAdministrators', 'evaluations'], API_VERSION)
+    return data
+
+
+async def create_has_permissions_batch_async(client, *, always_allow_administrators: Optional[str] = None, evaluations: Optional[str] = None) -> dict:
+    """Async variant of create_has_permissions_batch() for use with AsyncAdoClient."""
+    body = {
+        "alwaysAllowAdministrators": always_allow_administrators,
+        "evaluations": evaluations,
+    }
+    url = build_url(client.organization, f"_apis/security/permissionevaluationbatch", API_VERSION)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['alwaysAllowAdministrators', 'evaluations'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_has_permissions_batch", PAT)
-logger.info("Evaluates multiple permissions for the calling user.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "alwaysAllowAdministrators": args.always_allow_administrators,
-    "evaluations": args.evaluations,
-}
+def main() -> None:
+    """Read env vars / flags, call create_has_permissions_batch() and print the result."""
+    organization, pat = get_common_env()
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/security/permissionevaluationbatch", API_VERSION)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Evaluates multiple permissions for the calling user.")
+    parser.add_argument("--always-allow-administrators", required=False, help="True if members of the Administrators group should always pass the security check.")
+    parser.add_argument("--evaluations", required=False, help="Array of permission evaluations to evaluate.")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_has_permissions_batch", pat)
+    logger.info("Evaluates multiple permissions for the calling user.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_has_permissions_batch(client, always_allow_administrators=args.always_allow_administrators, evaluations=args.evaluations)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['alwaysAllowAdministrators', 'evaluations'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,53 +10,74 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/security/permissions/remove-permission?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-SECURITY_NAMESPACE_ID = get_env_or_exit("SECURITY_NAMESPACE_ID", "Security namespace identifier.")
-DESCRIPTOR = get_env_or_exit("DESCRIPTOR", "Identity descriptor of the user to remove permissions for.")
-PERMISSIONS = get_env_or_exit("PERMISSIONS", "Permissions to remove.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("delete_permission", PAT)
-logger.info("Removes the specified permissions on a security token for a user or group.")
+def delete_permission(client, security_namespace_id: str, descriptor: str, permissions: str) -> dict:
+    """
+    Removes the specified permissions on a security token for a user or group.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/permissions/{SECURITY_NAMESPACE_ID}/{PERMISSIONS}", API_VERSION)
-logger.info(f"DELETE {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        security_namespace_id: Security namespace identifier.
+        descriptor: Identity descriptor of the user to remove permissions for.
+        permissions: Permissions to remove.
 
-response = execute_request("DELETE", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/permissions/{security_namespace_id}/{permissions}", API_VERSION)
+    response = client.request("DELETE", url)
+    data = loads(response.content)
+    version_guard(data, ['allow', 'deny'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['allow', 'deny'], API_VERSION)
+async def delete_permission_async(client, security_namespace_id: str, descriptor: str, permissions: str) -> dict:
+    """Async variant of delete_permission() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/permissions/{security_namespace_id}/{permissions}", API_VERSION)
+    response = await client.request("DELETE", url)
+    data = loads(response.content)
+    version_guard(data, ['allow', 'deny'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call delete_permission() and print the result."""
+    organization, pat = get_common_env()
+    security_namespace_id = require_env("SECURITY_NAMESPACE_ID", "Security namespace identifier.")
+    descriptor = require_env("DESCRIPTOR", "Identity descriptor of the user to remove permissions for.")
+    permissions = require_env("PERMISSIONS", "Permissions to remove.")
+
+    logger = AdoLogger("delete_permission", pat)
+    logger.info("Removes the specified permissions on a security token for a user or group.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = delete_permission(client, security_namespace_id, descriptor, permissions)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
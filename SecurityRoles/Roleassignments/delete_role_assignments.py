@@ -10,47 +10,70 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/security-roles/roleassignments/remove-role-assignments?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-SCOPE_ID = get_env_or_exit("SCOPE_ID", "scopeId")
-RESOURCE_ID = get_env_or_exit("RESOURCE_ID", "resourceId")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("delete_role_assignments", PAT)
-logger.info("Remove Role Assignments for Roleassignments")
+def delete_role_assignments(client, scope_id: str, resource_id: str) -> dict:
+    """
+    Remove Role Assignments for Roleassignments
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        scope_id: scopeId
+        resource_id: resourceId
+
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/securityroles/scopes/{scope_id}/roleassignments/resources/{resource_id}", API_VERSION)
+    response = client.request("PATCH", url)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/securityroles/scopes/{SCOPE_ID}/roleassignments/resources/{RESOURCE_ID}", API_VERSION)
-logger.info(f"PATCH {url}")
 
-response = execute_request("PATCH", url, HEADERS)
+async def delete_role_assignments_async(client, scope_id: str, resource_id: str) -> dict:
+    """Async variant of delete_role_assignments() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/securityroles/scopes/{scope_id}/roleassignments/resources/{resource_id}", API_VERSION)
+    response = await client.request("PATCH", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call delete_role_assignments() and print the result."""
+    organization, pat = get_common_env()
+    scope_id = require_env("SCOPE_ID", "scopeId")
+    resource_id = require_env("RESOURCE_ID", "resourceId")
+
+    logger = AdoLogger("delete_role_assignments", pat)
+    logger.info("Remove Role Assignments for Roleassignments")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = delete_role_assignments(client, scope_id, resource_id)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
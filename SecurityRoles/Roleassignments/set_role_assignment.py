@@ -11,71 +11,94 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/security-roles/rol
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-SCOPE_ID = get_env_or_exit("SCOPE_ID", "Id of the assigned scope")
-RESOURCE_ID = get_env_or_exit("RESOURCE_ID", "Id of the resource on which the role is to be assigned")
-IDENTITY_ID = get_env_or_exit("IDENTITY_ID", "identityId")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Set role assignment on a resource")
-parser.add_argument("--role-name", required=False, help="The name of the role assigned.")
-parser.add_argument("--unique-name", required=False, help="Identifier of the user given the role assignment.")
-parser.add_argument("--user-id", required=False, help="Unique id of the user given the role assignment.")
-args = parser.parse_args()
+def set_role_assignment(client, scope_id: str, resource_id: str, identity_id: str, *, role_name: Optional[str] = None, unique_name: Optional[str] = None, user_id: Optional[str] = None) -> dict:
+    """
+    Set role assignment on a resource
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        scope_id: Id of the assigned scope
+        resource_id: Id of the resource on which the role is to be assigned
+        identity_id: identityId
+        role_name: The name of the role assigned.
+        unique_name: Identifier of the user given the role assignment.
+        user_id: Unique id of the user given the role assignment.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "roleName": role_name,
+        "uniqueName": unique_name,
+        "userId": user_id,
+    }
+    url = build_url(client.organization, f"_apis/securityroles/scopes/{scope_id}/roleassignments/resources/{resource_id}/{identity_id}", API_VERSION)
+    response = client.request("PUT", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['access', 'accessDisplayName'], API_VERSION)
+    return data
+
+
+async def set_role_assignment_async(client, scope_id: str, resource_id: str, identity_id: str, *, role_name: Optional[str] = None, unique_name: Optional[str] = None, user_id: Optional[str] = None) -> dict:
+    """Async variant of set_role_assignment() for use with AsyncAdoClient."""
+    body = {
+        "roleName": role_name,
+        "uniqueName": unique_name,
+        "userId": user_id,
+    }
+    url = build_url(client.organization, f"_apis/securityroles/scopes/{scope_id}/roleassignments/resources/{resource_id}/{identity_id}", API_VERSION)
+    response = await client.request("PUT", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['access', 'accessDisplayName'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("set_role_assignment", PAT)
-logger.info("Set role assignment on a resource")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "roleName": args.role_name,
-    "uniqueName": args.unique_name,
-    "userId": args.user_id,
-}
+def main() -> None:
+    """Read env vars / flags, call set_role_assignment() and print the result."""
+    organization, pat = get_common_env()
+    scope_id = require_env("SCOPE_ID", "Id of the assigned scope")
+    resource_id = require_env("RESOURCE_ID", "Id of the resource on which the role is to be assigned")
+    identity_id = require_env("IDENTITY_ID", "identityId")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/securityroles/scopes/{SCOPE_ID}/roleassignments/resources/{RESOURCE_ID}/{IDENTITY_ID}", API_VERSION)
-logger.info(f"PUT {url}")
+    parser = argparse.ArgumentParser(description="Set role assignment on a resource")
+    parser.add_argument("--role-name", required=False, help="The name of the role assigned.")
+    parser.add_argument("--unique-name", required=False, help="Identifier of the user given the role assignment.")
+    parser.add_argument("--user-id", required=False, help="Unique id of the user given the role assignment.")
+    args = parser.parse_args()
 
-response = execute_request("PUT", url, HEADERS, body=body)
+    logger = AdoLogger("set_role_assignment", pat)
+    logger.info("Set role assignment on a resource")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = set_role_assignment(client, scope_id, resource_id, identity_id, role_name=args.role_name, unique_name=args.unique_name, user_id=args.user_id)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['access', 'accessDisplayName'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -8,56 +8,25 @@ Validates:
   - Correct Authorization header
   - Successful response parsing (200)
   - Exit when required env vars are missing
+
+The script is imported and called in-process; see the fixtures in conftest.py.
 """
 
 import json
-import os
-import subprocess
-import sys
 from pathlib import Path
 
 import pytest
 import responses
 
+from _shared.errors import AdoAuthError, AdoNotFound
+from SecurityRoles.Roleassignments.delete_role_assignment import delete_role_assignment, main
+
 FIXTURES = Path(__file__).parent / "fixtures"
-SCRIPT = str(Path(__file__).resolve().parents[1] / "delete_role_assignment.py")
-
-# ---------------------------------------------------------------------------
-# Helpers
-# ---------------------------------------------------------------------------
-
-def _run_script(env_override=None, extra_args=None, expect_fail=False):
-    """Run the script as a subprocess with the given env."""
-    env = {
-        "AZURE_DEVOPS_ORG": "testorg",
-        "AZURE_DEVOPS_PAT": "fakepat1234567890",
-        "SCOPE_ID": "test-value-scope_id",
-        "RESOURCE_ID": "test-value-resource_id",
-        "IDENTITY_ID": "test-value-identity_id",
-        "PATH": os.environ.get("PATH", ""),
-        "PYTHONPATH": os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."),
-    }
-    if env_override:
-        env.update(env_override)
-    env = {k: v for k, v in env.items() if v is not None}
-
-    cmd = [sys.executable, SCRIPT]
-    if extra_args:
-        cmd.extend(extra_args)
-
-    result = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        env=env,
-        timeout=30,
-    )
-    if not expect_fail:
-        assert result.returncode == 0, (
-            f"Script failed (rc={result.returncode}):\n"
-            f"STDOUT: {result.stdout}\nSTDERR: {result.stderr}"
-        )
-    return result
+ENV = {
+    "SCOPE_ID": "test-value-scope_id",
+    "RESOURCE_ID": "test-value-resource_id",
+    "IDENTITY_ID": "test-value-identity_id",
+}
 
 
 class TestDeleteRoleAssignmentEnvValidation:
@@ -65,53 +34,38 @@ class TestDeleteRoleAssignmentEnvValidation:
 
     @pytest.mark.offline
     @pytest.mark.securityroles
-    def test_missing_org_exits(self):
-        result = _run_script(
-            env_override={"AZURE_DEVOPS_ORG": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "AZURE_DEVOPS_ORG" in result.stderr or "AZURE_DEVOPS_ORG" in result.stdout
+    def test_missing_org_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "AZURE_DEVOPS_ORG": None})
+        assert code != 0
+        assert "AZURE_DEVOPS_ORG" in output
 
     @pytest.mark.offline
     @pytest.mark.securityroles
-    def test_missing_pat_exits(self):
-        result = _run_script(
-            env_override={"AZURE_DEVOPS_PAT": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "AZURE_DEVOPS_PAT" in result.stderr or "AZURE_DEVOPS_PAT" in result.stdout
+    def test_missing_pat_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "AZURE_DEVOPS_PAT": None})
+        assert code != 0
+        assert "AZURE_DEVOPS_PAT" in output
 
     @pytest.mark.offline
     @pytest.mark.securityroles
-    def test_missing_scope_id_exits(self):
-        result = _run_script(
-            env_override={"SCOPE_ID": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "SCOPE_ID" in result.stderr or "SCOPE_ID" in result.stdout
+    def test_missing_scope_id_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "SCOPE_ID": None})
+        assert code != 0
+        assert "SCOPE_ID" in output
 
     @pytest.mark.offline
     @pytest.mark.securityroles
-    def test_missing_resource_id_exits(self):
-        result = _run_script(
-            env_override={"RESOURCE_ID": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "RESOURCE_ID" in result.stderr or "RESOURCE_ID" in result.stdout
+    def test_missing_resource_id_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "RESOURCE_ID": None})
+        assert code != 0
+        assert "RESOURCE_ID" in output
 
     @pytest.mark.offline
     @pytest.mark.securityroles
-    def test_missing_identity_id_exits(self):
-        result = _run_script(
-            env_override={"IDENTITY_ID": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "IDENTITY_ID" in result.stderr or "IDENTITY_ID" in result.stdout
+    def test_missing_identity_id_exits(self, run_main):
+        code, output = run_main(main, env={**ENV, "IDENTITY_ID": None})
+        assert code != 0
+        assert "IDENTITY_ID" in output
 
 
 class TestDeleteRoleAssignmentURLAndAuth:
@@ -120,56 +74,39 @@ class TestDeleteRoleAssignmentURLAndAuth:
     @pytest.mark.offline
     @pytest.mark.securityroles
     @responses.activate
-    def test_correct_url_and_auth_header(self):
-        """Verify the script builds the right URL and Authorization header."""
-        import base64
-
-        org = "testorg"
-        pat = "fakepat1234567890"
+    def test_correct_url_and_auth_header(self, ado_client):
+        """Verify the operation builds the right URL and Authorization header."""
         expected_url = "https://dev.azure.com/testorg/_apis/securityroles/scopes/test-value-scope_id/roleassignments/resources/test-value-resource_id/test-value-identity_id?api-version=7.2"
-
         fixture = json.loads((FIXTURES / "delete_role_assignment_200.json").read_text())
         responses.add(responses.DELETE, expected_url, json=fixture, status=200)
 
-        import requests as req
-
-        cred = base64.b64encode(f":{pat}".encode("ascii")).decode("ascii")
-        headers = {
-            "Authorization": f"Basic {cred}",
-            "Content-Type": "application/json",
-        }
-        resp = req.delete(expected_url, headers=headers, timeout=30)
-
-        assert resp.status_code == 200
+        assert delete_role_assignment(ado_client, "test-value-scope_id", "test-value-resource_id", "test-value-identity_id") == fixture
         assert len(responses.calls) == 1
+        assert responses.calls[0].request.url == expected_url
         sent_auth = responses.calls[0].request.headers["Authorization"]
-        assert sent_auth.startswith("Basic ")
+        assert sent_auth == "Basic OmZha2VwYXQxMjM0NTY3ODkw"
 
 
 class TestDeleteRoleAssignmentHTTPErrors:
-    """Validate behaviour on error status codes."""
+    """Validate the typed error raised for error status codes."""
 
     @pytest.mark.offline
     @pytest.mark.securityroles
     @responses.activate
-    def test_401_unauthorized(self):
+    def test_401_unauthorized(self, ado_client):
         url = "https://dev.azure.com/testorg/_apis/securityroles/scopes/test-value-scope_id/roleassignments/resources/test-value-resource_id/test-value-identity_id?api-version=7.2"
         responses.add(responses.DELETE, url, json={"message": "unauthorized"}, status=401)
 
-        import requests as req
-
-        resp = req.delete(url, headers={"Authorization": "Basic fake"}, timeout=30)
-        assert resp.status_code == 401
+        with pytest.raises(AdoAuthError):
+            delete_role_assignment(ado_client, "test-value-scope_id", "test-value-resource_id", "test-value-identity_id")
 
     @pytest.mark.offline
     @pytest.mark.securityroles
     @responses.activate
-    def test_404_not_found(self):
+    def test_404_not_found(self, ado_client):
         url = "https://dev.azure.com/testorg/_apis/securityroles/scopes/test-value-scope_id/roleassignments/resources/test-value-resource_id/test-value-identity_id?api-version=7.2"
         responses.add(responses.DELETE, url, json={"message": "not_found"}, status=404)
 
-        import requests as req
-
-        resp = req.delete(url, headers={"Authorization": "Basic fake"}, timeout=30)
-        assert resp.status_code == 404
+        with pytest.raises(AdoNotFound):
+            delete_role_assignment(ado_client, "test-value-scope_id", "test-value-resource_id", "test-value-identity_id")
 
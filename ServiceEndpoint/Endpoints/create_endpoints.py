@@ -11,75 +11,101 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/service-endpoint/e
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Creates a new service endpoint")
-parser.add_argument("--administrators-group", required=False, help="This is a deprecated field.")
-parser.add_argument("--authorization", required=False, help="Gets or sets the authorization data for talking to the endpoint.")
-parser.add_argument("--created-by", required=False, help="Gets or sets the identity reference for the user who created the Service endpoint.")
-parser.add_argument("--creation-date", required=False, help="Gets or sets the date, when the Service endpoint has been created.")
-parser.add_argument("--data", required=False, help="data")
-parser.add_argument("--description", required=False, help="Gets or sets the description of endpoint.")
-args = parser.parse_args()
+def create_endpoints(client, *, administrators_group: Optional[str] = None, authorization: Optional[str] = None, created_by: Optional[str] = None, creation_date: Optional[str] = None, data_value: Optional[str] = None, description: Optional[str] = None) -> dict:
+    """
+    Creates a new service endpoint
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        administrators_group: This is a deprecated field.
+        authorization: Gets or sets the authorization data for talking to the endpoint.
+        created_by: Gets or sets the identity reference for the user who created the Service endpoint.
+        creation_date: Gets or sets the date, when the Service endpoint has been created.
+        data_value: data
+        description: Gets or sets the description of endpoint.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "administratorsGroup": administrators_group,
+        "authorization": authorization,
+        "createdBy": created_by,
+        "creationDate": creation_date,
+        "data": data_value,
+        "description": description,
+    }
+    url = build_url(client.organization, f"_apis/serviceendpoint/endpoints", API_VERSION)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name', 'administratorsGroup'], API_VERSION)
+    return data
+
+
+async def create_endpoints_async(client, *, administrators_group: Optional[str] = None, authorization: Optional[str] = None, created_by: Optional[str] = None, creation_date: Optional[str] = None, data_value: Optional[str] = None, description: Optional[str] = None) -> dict:
+    """Async variant of create_endpoints() for use with AsyncAdoClient."""
+    body = {
+        "administratorsGroup": administrators_group,
+        "authorization": authorization,
+        "createdBy": created_by,
+        "creationDate": creation_date,
+        "data": data_value,
+        "description": description,
+    }
+    url = build_url(client.organization, f"_apis/serviceendpoint/endpoints", API_VERSION)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name', 'administratorsGroup'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_endpoints", PAT)
-logger.info("Creates a new service endpoint")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "administratorsGroup": args.administrators_group,
-    "authorization": args.authorization,
-    "createdBy": args.created_by,
-    "creationDate": args.creation_date,
-    "data": args.data,
-    "description": args.description,
-}
+def main() -> None:
+    """Read env vars / flags, call create_endpoints() and print the result."""
+    organization, pat = get_common_env()
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/serviceendpoint/endpoints", API_VERSION)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Creates a new service endpoint")
+    parser.add_argument("--administrators-group", required=False, help="This is a deprecated field.")
+    parser.add_argument("--authorization", required=False, help="Gets or sets the authorization data for talking to the endpoint.")
+    parser.add_argument("--created-by", required=False, help="Gets or sets the identity reference for the user who created the Service endpoint.")
+    parser.add_argument("--creation-date", required=False, help="Gets or sets the date, when the Service endpoint has been created.")
+    parser.add_argument("--data", required=False, help="data")
+    parser.add_argument("--description", required=False, help="Gets or sets the description of endpoint.")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_endpoints", pat)
+    logger.info("Creates a new service endpoint")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_endpoints(client, administrators_group=args.administrators_group, authorization=args.authorization, created_by=args.created_by, creation_date=args.creation_date, data_value=args.data, description=args.description)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'name', 'administratorsGroup'], API_VERSION)
+    print(f"Endpoints ID: {data.get('id', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Endpoints ID: {data.get("id", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
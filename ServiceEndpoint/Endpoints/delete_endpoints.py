@@ -10,47 +10,70 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/service-endpoint/endpoints/delete?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-ENDPOINT_ID = get_env_or_exit("ENDPOINT_ID", "Endpoint Id of endpoint to delete")
-PROJECT_IDS = get_env_or_exit("PROJECT_IDS", "project Ids from which endpoint needs to be deleted")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("delete_endpoints", PAT)
-logger.info("Delete a service endpoint")
+def delete_endpoints(client, endpoint_id: str, project_ids: str) -> dict:
+    """
+    Delete a service endpoint
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        endpoint_id: Endpoint Id of endpoint to delete
+        project_ids: project Ids from which endpoint needs to be deleted
+
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/serviceendpoint/endpoints/{endpoint_id}", API_VERSION)
+    response = client.request("DELETE", url)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/serviceendpoint/endpoints/{ENDPOINT_ID}", API_VERSION)
-logger.info(f"DELETE {url}")
 
-response = execute_request("DELETE", url, HEADERS)
+async def delete_endpoints_async(client, endpoint_id: str, project_ids: str) -> dict:
+    """Async variant of delete_endpoints() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/serviceendpoint/endpoints/{endpoint_id}", API_VERSION)
+    response = await client.request("DELETE", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call delete_endpoints() and print the result."""
+    organization, pat = get_common_env()
+    endpoint_id = require_env("ENDPOINT_ID", "Endpoint Id of endpoint to delete")
+    project_ids = require_env("PROJECT_IDS", "project Ids from which endpoint needs to be deleted")
+
+    logger = AdoLogger("delete_endpoints", pat)
+    logger.info("Delete a service endpoint")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = delete_endpoints(client, endpoint_id, project_ids)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
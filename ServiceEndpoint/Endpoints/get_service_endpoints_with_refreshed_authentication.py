@@ -10,47 +10,82 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/service-endpoint/endpoints/get-service-endpoints-with-refreshed-authentication?view=azure-devops-rest-7.2
 """
 
-import json
+import argparse
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-ENDPOINT_IDS = get_env_or_exit("ENDPOINT_IDS", "Ids of the service endpoints.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_service_endpoints_with_refreshed_authentication", PAT)
-logger.info("Gets the service endpoints and patch new authorization parameters")
+def get_service_endpoints_with_refreshed_authentication(client, project: str, endpoint_ids: str) -> dict:
+    """
+    Gets the service endpoints and patch new authorization parameters
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/serviceendpoint/endpoints", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        endpoint_ids: Ids of the service endpoints.
 
-response = execute_request("POST", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/serviceendpoint/endpoints", API_VERSION, project=project)
+    response = client.request("POST", url)
+    data = loads(response.content)
+    return data
+
+
+async def get_service_endpoints_with_refreshed_authentication_async(client, project: str, endpoint_ids: str) -> dict:
+    """Async variant of get_service_endpoints_with_refreshed_authentication() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/serviceendpoint/endpoints", API_VERSION, project=project)
+    response = await client.request("POST", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_service_endpoints_with_refreshed_authentication() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    endpoint_ids = require_env("ENDPOINT_IDS", "Ids of the service endpoints.")
+
+    parser = argparse.ArgumentParser(description="Gets the service endpoints and patch new authorization parameters")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("get_service_endpoints_with_refreshed_authentication", pat)
+    logger.info("Gets the service endpoints and patch new authorization parameters")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        items = items_of(get_service_endpoints_with_refreshed_authentication(client, project, endpoint_ids), "value")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    data = get_service_endpoints_with_refreshed_authentication(client, project, endpoint_ids)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
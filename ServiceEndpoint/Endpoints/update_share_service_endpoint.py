@@ -10,46 +10,68 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/service-endpoint/endpoints/share-service-endpoint?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-ENDPOINT_ID = get_env_or_exit("ENDPOINT_ID", "Endpoint Id of the endpoint to share")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_share_service_endpoint", PAT)
-logger.info("Share service endpoint across projects")
+def update_share_service_endpoint(client, endpoint_id: str) -> dict:
+    """
+    Share service endpoint across projects
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        endpoint_id: Endpoint Id of the endpoint to share
+
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/serviceendpoint/endpoints/{endpoint_id}", API_VERSION)
+    response = client.request("PATCH", url)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/serviceendpoint/endpoints/{ENDPOINT_ID}", API_VERSION)
-logger.info(f"PATCH {url}")
 
-response = execute_request("PATCH", url, HEADERS)
+async def update_share_service_endpoint_async(client, endpoint_id: str) -> dict:
+    """Async variant of update_share_service_endpoint() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/serviceendpoint/endpoints/{endpoint_id}", API_VERSION)
+    response = await client.request("PATCH", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call update_share_service_endpoint() and print the result."""
+    organization, pat = get_common_env()
+    endpoint_id = require_env("ENDPOINT_ID", "Endpoint Id of the endpoint to share")
+
+    logger = AdoLogger("update_share_service_endpoint", pat)
+    logger.info("Share service endpoint across projects")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = update_share_service_endpoint(client, endpoint_id)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,46 +10,75 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/symbol/client/get?view=azure-devops-rest-7.2
 """
 
-import json
+import argparse
 import os
 import sys
+from typing import BinaryIO, Union
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.async_http_client import astream_to
+from _shared.download import download_file
+from _shared.http_client import AdoClient, build_url
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-CLIENT_TYPE = get_env_or_exit("CLIENT_TYPE", "Either 'EXE' for a zip file containing a Windows symbol client (a.k.a. symbol.exe) along with dep...")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_client", PAT)
-logger.info("Get the client package.")
+def get_client(client, client_type: str, *, destination: Union[str, BinaryIO]) -> int:
+    """
+    Get the client package.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        client_type: Either 'EXE' for a zip file containing a Windows symbol client (a.k.a. symbol.exe) along with dep...
+        destination: Output path or binary file (e.g. sys.stdout.buffer).
+
+    Returns:
+        Bytes written. A path destination is fetched in parallel ranged
+        segments and resumes after an interruption (see _shared.download).
+    """
+    url = build_url(client.organization, f"_apis/symbol/client/{client_type}", API_VERSION, base_host="artifacts.dev.azure.com")
+    return download_file(client, url, destination, accept="application/octet-stream")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/symbol/client/{CLIENT_TYPE}", API_VERSION, base_host="artifacts.dev.azure.com")
-logger.info(f"GET {url}")
 
-response = execute_request("GET", url, HEADERS)
+async def get_client_async(client, client_type: str, *, destination: Union[str, BinaryIO]) -> int:
+    """Async variant of get_client() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/symbol/client/{client_type}", API_VERSION, base_host="artifacts.dev.azure.com")
+    response = await client.request("GET", url, stream=True, accept="application/octet-stream")
+    return await astream_to(response, destination)
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_client() and print the result."""
+    organization, pat = get_common_env()
+    client_type = require_env("CLIENT_TYPE", "Either 'EXE' for a zip file containing a Windows symbol client (a.k.a. symbol.exe) along with dep...")
+
+    parser = argparse.ArgumentParser(description="Get the client package.")
+    parser.add_argument("--output", help="Write the content to this file (default: stdout)")
+    args = parser.parse_args()
+
+    logger = AdoLogger("get_client", pat)
+    logger.info("Get the client package.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    written = get_client(client, client_type, destination=args.output or sys.stdout.buffer)
+    logger.info(f"Downloaded {written} bytes")
+    if args.output:
+        print(f"Saved {written} bytes to {args.output}")
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,47 +10,77 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/symbol/contents/get?view=azure-devops-rest-7.2
 """
 
-import json
+import argparse
 import os
 import sys
+from typing import BinaryIO, Union
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.async_http_client import astream_to
+from _shared.download import download_file
+from _shared.http_client import AdoClient, build_url
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-REQUEST_ID = get_env_or_exit("REQUEST_ID", "The symbol request identifier.")
-DEBUG_ENTRY_ID = get_env_or_exit("DEBUG_ENTRY_ID", "The debug entry identifier.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_contents", PAT)
-logger.info("Get a stitched debug entry for a symbol request as specified by symbol request identifier and debug entry identifier.")
+def get_contents(client, request_id: str, debug_entry_id: str, *, destination: Union[str, BinaryIO]) -> int:
+    """
+    Get a stitched debug entry for a symbol request as specified by symbol request identifier and debug entry identifier.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        request_id: The symbol request identifier.
+        debug_entry_id: The debug entry identifier.
+        destination: Output path or binary file (e.g. sys.stdout.buffer).
+
+    Returns:
+        Bytes written. A path destination is fetched in parallel ranged
+        segments and resumes after an interruption (see _shared.download).
+    """
+    url = build_url(client.organization, f"_apis/symbol/requests/{request_id}/contents/{debug_entry_id}", API_VERSION, base_host="artifacts.dev.azure.com")
+    return download_file(client, url, destination, accept="application/octet-stream")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/symbol/requests/{REQUEST_ID}/contents/{DEBUG_ENTRY_ID}", API_VERSION, base_host="artifacts.dev.azure.com")
-logger.info(f"GET {url}")
 
-response = execute_request("GET", url, HEADERS)
+async def get_contents_async(client, request_id: str, debug_entry_id: str, *, destination: Union[str, BinaryIO]) -> int:
+    """Async variant of get_contents() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/symbol/requests/{request_id}/contents/{debug_entry_id}", API_VERSION, base_host="artifacts.dev.azure.com")
+    response = await client.request("GET", url, stream=True, accept="application/octet-stream")
+    return await astream_to(response, destination)
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_contents() and print the result."""
+    organization, pat = get_common_env()
+    request_id = require_env("REQUEST_ID", "The symbol request identifier.")
+    debug_entry_id = require_env("DEBUG_ENTRY_ID", "The debug entry identifier.")
+
+    parser = argparse.ArgumentParser(description="Get a stitched debug entry for a symbol request as specified by symbol request identifier and debug entry identifier.")
+    parser.add_argument("--output", help="Write the content to this file (default: stdout)")
+    args = parser.parse_args()
+
+    logger = AdoLogger("get_contents", pat)
+    logger.info("Get a stitched debug entry for a symbol request as specified by symbol request identifier and debug entry identifier.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    written = get_contents(client, request_id, debug_entry_id, destination=args.output or sys.stdout.buffer)
+    logger.info(f"Downloaded {written} bytes")
+    if args.output:
+        print(f"Saved {written} bytes to {args.output}")
+
+
+if __name__ == "__main__":
+    run_cli(main)
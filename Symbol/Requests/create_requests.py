@@ -11,75 +11,101 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/symbol/requests/cr
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Create a new symbol request.")
-parser.add_argument("--description", required=False, help="An optional human-facing description.")
-parser.add_argument("--domain-id", required=False, help="The Domain Id where this request lives. This property should not be null.")
-parser.add_argument("--expiration-date", required=False, help="An optional expiration date for the request. The request will become inaccessible and get deleted...")
-parser.add_argument("--is-chunked", required=False, help="Indicates if request should be chunk dedup")
-parser.add_argument("--key", required=False, help="Date of the last change to the symbol request.")
-parser.add_argument("--last-operation-date", required=False, help="Date of the last change to the symbol request.")
-args = parser.parse_args()
+def create_requests(client, *, description: Optional[str] = None, domain_id: Optional[str] = None, expiration_date: Optional[str] = None, is_chunked: Optional[str] = None, key: Optional[str] = None, last_operation_date: Optional[str] = None) -> dict:
+    """
+    Create a new symbol request.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        description: An optional human-facing description.
+        domain_id: The Domain Id where this request lives. This property should not be null.
+        expiration_date: An optional expiration date for the request. The request will become inaccessible and get deleted...
+        is_chunked: Indicates if request should be chunk dedup
+        key: Date of the last change to the symbol request.
+        last_operation_date: Date of the last change to the symbol request.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "description": description,
+        "domainId": domain_id,
+        "expirationDate": expiration_date,
+        "isChunked": is_chunked,
+        "key": key,
+        "lastOperationDate": last_operation_date,
+    }
+    url = build_url(client.organization, f"_apis/symbol/requests", API_VERSION, base_host="artifacts.dev.azure.com")
+    response = client.request("POST", url, body=body, expected_status=201)
+    data = loads(response.content)
+    version_guard(data, ['name', 'description'], API_VERSION)
+    return data
+
+
+async def create_requests_async(client, *, description: Optional[str] = None, domain_id: Optional[str] = None, expiration_date: Optional[str] = None, is_chunked: Optional[str] = None, key: Optional[str] = None, last_operation_date: Optional[str] = None) -> dict:
+    """Async variant of create_requests() for use with AsyncAdoClient."""
+    body = {
+        "description": description,
+        "domainId": domain_id,
+        "expirationDate": expiration_date,
+        "isChunked": is_chunked,
+        "key": key,
+        "lastOperationDate": last_operation_date,
+    }
+    url = build_url(client.organization, f"_apis/symbol/requests", API_VERSION, base_host="artifacts.dev.azure.com")
+    response = await client.request("POST", url, body=body, expected_status=201)
+    data = loads(response.content)
+    version_guard(data, ['name', 'description'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_requests", PAT)
-logger.info("Create a new symbol request.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "description": args.description,
-    "domainId": args.domain_id,
-    "expirationDate": args.expiration_date,
-    "isChunked": args.is_chunked,
-    "key": args.key,
-    "lastOperationDate": args.last_operation_date,
-}
+def main() -> None:
+    """Read env vars / flags, call create_requests() and print the result."""
+    organization, pat = get_common_env()
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/symbol/requests", API_VERSION, base_host="artifacts.dev.azure.com")
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Create a new symbol request.")
+    parser.add_argument("--description", required=False, help="An optional human-facing description.")
+    parser.add_argument("--domain-id", required=False, help="The Domain Id where this request lives. This property should not be null.")
+    parser.add_argument("--expiration-date", required=False, help="An optional expiration date for the request. The request will become inaccessible and get deleted...")
+    parser.add_argument("--is-chunked", required=False, help="Indicates if request should be chunk dedup")
+    parser.add_argument("--key", required=False, help="Date of the last change to the symbol request.")
+    parser.add_argument("--last-operation-date", required=False, help="Date of the last change to the symbol request.")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body, expected_status=201)
+    logger = AdoLogger("create_requests", pat)
+    logger.info("Create a new symbol request.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_requests(client, description=args.description, domain_id=args.domain_id, expiration_date=args.expiration_date, is_chunked=args.is_chunked, key=args.key, last_operation_date=args.last_operation_date)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['name', 'description'], API_VERSION)
+    print(f"Requests: {data.get('name', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Requests: {data.get("name", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
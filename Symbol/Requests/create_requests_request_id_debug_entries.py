@@ -11,65 +11,98 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/symbol/requests/cr
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-REQUEST_ID = get_env_or_exit("REQUEST_ID", "The symbol request identifier.")
-COLLECTION = get_env_or_exit("COLLECTION", "A valid debug entry collection name. Must be 'debugentries'.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Create debug entries for a symbol request as specified by its identifier.")
-parser.add_argument("--create-behavior", required=False, help="Defines what to do when a debug entry in the batch already exists.")
-parser.add_argument("--debug-entries", required=False, help="The debug entries.")
-parser.add_argument("--proof-nodes", required=False, help="Serialized Proof nodes, used to verify uploads on server side for Chunk Dedup DebugEntry")
-args = parser.parse_args()
+def create_requests_request_id_debug_entries(client, request_id: str, collection: str, *, create_behavior: Optional[str] = None, debug_entries: Optional[str] = None, proof_nodes: Optional[str] = None) -> dict:
+    """
+    Create debug entries for a symbol request as specified by its identifier.
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_requests_request_id_debug_entries", PAT)
-logger.info("Create debug entries for a symbol request as specified by its identifier.")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        request_id: The symbol request identifier.
+        collection: A valid debug entry collection name. Must be 'debugentries'.
+        create_behavior: Defines what to do when a debug entry in the batch already exists.
+        debug_entries: The debug entries.
+        proof_nodes: Serialized Proof nodes, used to verify uploads on server side for Chunk Dedup DebugEntry
 
-# ---------------------------------------------------------------------------
-# Request body
-# ---------------------------------------------------------------------------
-body = {
-    "createBehavior": args.create_behavior,
-    "debugEntries": args.debug_entries,
-    "proofNodes": args.proof_nodes,
-}
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "createBehavior": create_behavior,
+        "debugEntries": debug_entries,
+        "proofNodes": proof_nodes,
+    }
+    url = build_url(client.organization, f"_apis/symbol/requests/{request_id}", API_VERSION, base_host="artifacts.dev.azure.com")
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/symbol/requests/{REQUEST_ID}", API_VERSION, base_host="artifacts.dev.azure.com")
-logger.info(f"POST {url}")
 
-response = execute_request("POST", url, HEADERS, body=body)
+async def create_requests_request_id_debug_entries_async(client, request_id: str, collection: str, *, create_behavior: Optional[str] = None, debug_entries: Optional[str] = None, proof_nodes: Optional[str] = None) -> dict:
+    """Async variant of create_requests_request_id_debug_entries() for use with AsyncAdoClient."""
+    body = {
+        "createBehavior": create_behavior,
+        "debugEntries": debug_entries,
+        "proofNodes": proof_nodes,
+    }
+    url = build_url(client.organization, f"_apis/symbol/requests/{request_id}", API_VERSION, base_host="artifacts.dev.azure.com")
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call create_requests_request_id_debug_entries() and print the result."""
+    organization, pat = get_common_env()
+    request_id = require_env("REQUEST_ID", "The symbol request identifier.")
+    collection = require_env("COLLECTION", "A valid debug entry collection name. Must be 'debugentries'.")
+
+    parser = argparse.ArgumentParser(description="Create debug entries for a symbol request as specified by its identifier.")
+    parser.add_argument("--create-behavior", required=False, help="Defines what to do when a debug entry in the batch already exists.")
+    parser.add_argument("--debug-entries", required=False, help="The debug entries.")
+    parser.add_argument("--proof-nodes", required=False, help="Serialized Proof nodes, used to verify uploads on server side for Chunk Dedup DebugEntry")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("create_requests_request_id_debug_entries", pat)
+    logger.info("Create debug entries for a symbol request as specified by its identifier.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        items = items_of(create_requests_request_id_debug_entries(client, request_id, collection, create_behavior=args.create_behavior, debug_entries=args.debug_entries, proof_nodes=args.proof_nodes), "value")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    data = create_requests_request_id_debug_entries(client, request_id, collection, create_behavior=args.create_behavior, debug_entries=args.debug_entries, proof_nodes=args.proof_nodes)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,46 +10,68 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/symbol/requests/delete-requests-request-name?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-REQUEST_NAME = get_env_or_exit("REQUEST_NAME", "The symbol request name.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("delete_requests_request_name", PAT)
-logger.info("Delete a symbol request by request name.")
+def delete_requests_request_name(client, request_name: str) -> dict:
+    """
+    Delete a symbol request by request name.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        request_name: The symbol request name.
+
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/symbol/requests", API_VERSION, base_host="artifacts.dev.azure.com")
+    response = client.request("DELETE", url)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/symbol/requests", API_VERSION, base_host="artifacts.dev.azure.com")
-logger.info(f"DELETE {url}")
 
-response = execute_request("DELETE", url, HEADERS)
+async def delete_requests_request_name_async(client, request_name: str) -> dict:
+    """Async variant of delete_requests_request_name() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/symbol/requests", API_VERSION, base_host="artifacts.dev.azure.com")
+    response = await client.request("DELETE", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call delete_requests_request_name() and print the result."""
+    organization, pat = get_common_env()
+    request_name = require_env("REQUEST_NAME", "The symbol request name.")
+
+    logger = AdoLogger("delete_requests_request_name", pat)
+    logger.info("Delete a symbol request by request name.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = delete_requests_request_name(client, request_name)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
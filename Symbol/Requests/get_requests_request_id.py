@@ -10,52 +10,71 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/symbol/requests/get-requests-request-id?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-REQUEST_ID = get_env_or_exit("REQUEST_ID", "The symbol request identifier.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_requests_request_id", PAT)
-logger.info("Get a symbol request by request identifier.")
+def get_requests_request_id(client, request_id: str) -> dict:
+    """
+    Get a symbol request by request identifier.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/symbol/requests/{REQUEST_ID}", API_VERSION, base_host="artifacts.dev.azure.com")
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        request_id: The symbol request identifier.
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/symbol/requests/{request_id}", API_VERSION, base_host="artifacts.dev.azure.com")
+    response = client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['name', 'description'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['name', 'description'], API_VERSION)
+async def get_requests_request_id_async(client, request_id: str) -> dict:
+    """Async variant of get_requests_request_id() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/symbol/requests/{request_id}", API_VERSION, base_host="artifacts.dev.azure.com")
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['name', 'description'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(f"Requests: {data.get("name", "N/A")}")
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_requests_request_id() and print the result."""
+    organization, pat = get_common_env()
+    request_id = require_env("REQUEST_ID", "The symbol request identifier.")
+
+    logger = AdoLogger("get_requests_request_id", pat)
+    logger.info("Get a symbol request by request identifier.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = get_requests_request_id(client, request_id)
+
+    print(f"Requests: {data.get('name', 'N/A')}")
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,46 +10,68 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/symbol/symsrv/get?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-DEBUG_ENTRY_CLIENT_KEY = get_env_or_exit("DEBUG_ENTRY_CLIENT_KEY", "A 'client key' used by both ends of Microsoft's symbol protocol to identify a debug entry. The se...")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_symsrv", PAT)
-logger.info("Given a client key, returns the best matched debug entry.")
+def get_symsrv(client, debug_entry_client_key: str) -> dict:
+    """
+    Given a client key, returns the best matched debug entry.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        debug_entry_client_key: A 'client key' used by both ends of Microsoft's symbol protocol to identify a debug entry. The se...
+
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/symbol/symsrv/{debug_entry_client_key}", API_VERSION, base_host="artifacts.dev.azure.com")
+    response = client.request("GET", url)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/symbol/symsrv/{DEBUG_ENTRY_CLIENT_KEY}", API_VERSION, base_host="artifacts.dev.azure.com")
-logger.info(f"GET {url}")
 
-response = execute_request("GET", url, HEADERS)
+async def get_symsrv_async(client, debug_entry_client_key: str) -> dict:
+    """Async variant of get_symsrv() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/symbol/symsrv/{debug_entry_client_key}", API_VERSION, base_host="artifacts.dev.azure.com")
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_symsrv() and print the result."""
+    organization, pat = get_common_env()
+    debug_entry_client_key = require_env("DEBUG_ENTRY_CLIENT_KEY", "A 'client key' used by both ends of Microsoft's symbol protocol to identify a debug entry. The se...")
+
+    logger = AdoLogger("get_symsrv", pat)
+    logger.info("Given a client key, returns the best matched debug entry.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = get_symsrv(client, debug_entry_client_key)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,75 +11,102 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/tfvc/changesets/cr
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Create a new changeset.")
-parser.add_argument("--account-id", required=False, help="Changeset Account Id also known as Organization Id.")
-parser.add_argument("--changes", required=False, help="List of associated changes.")
-parser.add_argument("--checkin-notes", required=False, help="List of Checkin Notes for the changeset.")
-parser.add_argument("--collection-id", required=False, help="Changeset collection Id.")
-parser.add_argument("--has-more-changes", required=False, help="True if more changes are available.")
-parser.add_argument("--policy-override", required=False, help="Policy Override for the changeset.")
-args = parser.parse_args()
+def create_changesets(client, project: str, *, account_id: Optional[str] = None, changes: Optional[str] = None, checkin_notes: Optional[str] = None, collection_id: Optional[str] = None, has_more_changes: Optional[str] = None, policy_override: Optional[str] = None) -> dict:
+    """
+    Create a new changeset.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        account_id: Changeset Account Id also known as Organization Id.
+        changes: List of associated changes.
+        checkin_notes: List of Checkin Notes for the changeset.
+        collection_id: Changeset collection Id.
+        has_more_changes: True if more changes are available.
+        policy_override: Policy Override for the changeset.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "accountId": account_id,
+        "changes": changes,
+        "checkinNotes": checkin_notes,
+        "collectionId": collection_id,
+        "hasMoreChanges": has_more_changes,
+        "policyOverride": policy_override,
+    }
+    url = build_url(client.organization, f"_apis/tfvc/changesets", API_VERSION, project=project)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['author', 'changesetId'], API_VERSION)
+    return data
+
+
+async def create_changesets_async(client, project: str, *, account_id: Optional[str] = None, changes: Optional[str] = None, checkin_notes: Optional[str] = None, collection_id: Optional[str] = None, has_more_changes: Optional[str] = None, policy_override: Optional[str] = None) -> dict:
+    """Async variant of create_changesets() for use with AsyncAdoClient."""
+    body = {
+        "accountId": account_id,
+        "changes": changes,
+        "checkinNotes": checkin_notes,
+        "collectionId": collection_id,
+        "hasMoreChanges": has_more_changes,
+        "policyOverride": policy_override,
+    }
+    url = build_url(client.organization, f"_apis/tfvc/changesets", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['author', 'changesetId'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_changesets", PAT)
-logger.info("Create a new changeset.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "accountId": args.account_id,
-    "changes": args.changes,
-    "checkinNotes": args.checkin_notes,
-    "collectionId": args.collection_id,
-    "hasMoreChanges": args.has_more_changes,
-    "policyOverride": args.policy_override,
-}
+def main() -> None:
+    """Read env vars / flags, call create_changesets() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/tfvc/changesets", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Create a new changeset.")
+    parser.add_argument("--account-id", required=False, help="Changeset Account Id also known as Organization Id.")
+    parser.add_argument("--changes", required=False, help="List of associated changes.")
+    parser.add_argument("--checkin-notes", required=False, help="List of Checkin Notes for the changeset.")
+    parser.add_argument("--collection-id", required=False, help="Changeset collection Id.")
+    parser.add_argument("--has-more-changes", required=False, help="True if more changes are available.")
+    parser.add_argument("--policy-override", required=False, help="Policy Override for the changeset.")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_changesets", pat)
+    logger.info("Create a new changeset.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_changesets(client, project, account_id=args.account_id, changes=args.changes, checkin_notes=args.checkin_notes, collection_id=args.collection_id, has_more_changes=args.has_more_changes, policy_override=args.policy_override)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['author', 'changesetId'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
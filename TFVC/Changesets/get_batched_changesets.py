@@ -11,63 +11,94 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/tfvc/changesets/ge
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Returns changesets for a given list of changeset Ids.")
-parser.add_argument("--changeset-ids", required=False, help="List of changeset Ids.")
-parser.add_argument("--comment-length", required=False, help="Max length of the comment.")
-parser.add_argument("--include-links", required=False, help="Whether to include the _links field on the shallow references")
-args = parser.parse_args()
+def get_batched_changesets(client, *, changeset_ids: Optional[str] = None, comment_length: Optional[str] = None, include_links: Optional[str] = None) -> dict:
+    """
+    Returns changesets for a given list of changeset Ids.
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_batched_changesets", PAT)
-logger.info("Returns changesets for a given list of changeset Ids.")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        changeset_ids: List of changeset Ids.
+        comment_length: Max length of the comment.
+        include_links: Whether to include the _links field on the shallow references
 
-# ---------------------------------------------------------------------------
-# Request body
-# ---------------------------------------------------------------------------
-body = {
-    "changesetIds": args.changeset_ids,
-    "commentLength": args.comment_length,
-    "includeLinks": args.include_links,
-}
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "changesetIds": changeset_ids,
+        "commentLength": comment_length,
+        "includeLinks": include_links,
+    }
+    url = build_url(client.organization, f"_apis/tfvc/changesetsbatch", API_VERSION)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/tfvc/changesetsbatch", API_VERSION)
-logger.info(f"POST {url}")
 
-response = execute_request("POST", url, HEADERS, body=body)
+async def get_batched_changesets_async(client, *, changeset_ids: Optional[str] = None, comment_length: Optional[str] = None, include_links: Optional[str] = None) -> dict:
+    """Async variant of get_batched_changesets() for use with AsyncAdoClient."""
+    body = {
+        "changesetIds": changeset_ids,
+        "commentLength": comment_length,
+        "includeLinks": include_links,
+    }
+    url = build_url(client.organization, f"_apis/tfvc/changesetsbatch", API_VERSION)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_batched_changesets() and print the result."""
+    organization, pat = get_common_env()
+
+    parser = argparse.ArgumentParser(description="Returns changesets for a given list of changeset Ids.")
+    parser.add_argument("--changeset-ids", required=False, help="List of changeset Ids.")
+    parser.add_argument("--comment-length", required=False, help="Max length of the comment.")
+    parser.add_argument("--include-links", required=False, help="Whether to include the _links field on the shallow references")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("get_batched_changesets", pat)
+    logger.info("Returns changesets for a given list of changeset Ids.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        items = items_of(get_batched_changesets(client, changeset_ids=args.changeset_ids, comment_length=args.comment_length, include_links=args.include_links), "value")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    data = get_batched_changesets(client, changeset_ids=args.changeset_ids, comment_length=args.comment_length, include_links=args.include_links)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,64 +11,96 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/tfvc/items/get-ite
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Post for retrieving a set of items given a list of paths or a long path.")
-parser.add_argument("--include-content-metadata", required=False, help="If true, include metadata about the file type")
-parser.add_argument("--include-links", required=False, help="Whether to include the _links field on the shallow references")
-parser.add_argument("--item-descriptors", required=False, help="itemDescriptors")
-args = parser.parse_args()
+def get_items_batch(client, project: str, *, include_content_metadata: Optional[str] = None, include_links: Optional[str] = None, item_descriptors: Optional[str] = None) -> dict:
+    """
+    Post for retrieving a set of items given a list of paths or a long path.
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_items_batch", PAT)
-logger.info("Post for retrieving a set of items given a list of paths or a long path.")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        include_content_metadata: If true, include metadata about the file type
+        include_links: Whether to include the _links field on the shallow references
+        item_descriptors: itemDescriptors
 
-# ---------------------------------------------------------------------------
-# Request body
-# ---------------------------------------------------------------------------
-body = {
-    "includeContentMetadata": args.include_content_metadata,
-    "includeLinks": args.include_links,
-    "itemDescriptors": args.item_descriptors,
-}
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "includeContentMetadata": include_content_metadata,
+        "includeLinks": include_links,
+        "itemDescriptors": item_descriptors,
+    }
+    url = build_url(client.organization, f"_apis/tfvc/itembatch", API_VERSION, project=project)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/tfvc/itembatch", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
 
-response = execute_request("POST", url, HEADERS, body=body)
+async def get_items_batch_async(client, project: str, *, include_content_metadata: Optional[str] = None, include_links: Optional[str] = None, item_descriptors: Optional[str] = None) -> dict:
+    """Async variant of get_items_batch() for use with AsyncAdoClient."""
+    body = {
+        "includeContentMetadata": include_content_metadata,
+        "includeLinks": include_links,
+        "itemDescriptors": item_descriptors,
+    }
+    url = build_url(client.organization, f"_apis/tfvc/itembatch", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_items_batch() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+
+    parser = argparse.ArgumentParser(description="Post for retrieving a set of items given a list of paths or a long path.")
+    parser.add_argument("--include-content-metadata", required=False, help="If true, include metadata about the file type")
+    parser.add_argument("--include-links", required=False, help="Whether to include the _links field on the shallow references")
+    parser.add_argument("--item-descriptors", required=False, help="itemDescriptors")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("get_items_batch", pat)
+    logger.info("Post for retrieving a set of items given a list of paths or a long path.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        items = items_of(get_items_batch(client, project, include_content_metadata=args.include_content_metadata, include_links=args.include_links, item_descriptors=args.item_descriptors), "value")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    data = get_items_batch(client, project, include_content_metadata=args.include_content_metadata, include_links=args.include_links, item_descriptors=args.item_descriptors)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,48 +10,84 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/test/attachments/get-test-result-attachments?view=azure-devops-rest-7.2
 """
 
-import json
+import argparse
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-RUN_ID = get_env_or_exit("RUN_ID", "ID of the test run that contains the result.")
-TEST_CASE_RESULT_ID = get_env_or_exit("TEST_CASE_RESULT_ID", "ID of the test result.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_test_result_attachments", PAT)
-logger.info("Get list of test result attachments reference.")
+def get_test_result_attachments(client, project: str, run_id: str, test_case_result_id: str) -> dict:
+    """
+    Get list of test result attachments reference.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/test/Runs/{RUN_ID}/Results/{TEST_CASE_RESULT_ID}/attachments", API_VERSION, project=PROJECT_ID)
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        run_id: ID of the test run that contains the result.
+        test_case_result_id: ID of the test result.
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/test/Runs/{run_id}/Results/{test_case_result_id}/attachments", API_VERSION, project=project)
+    response = client.request("GET", url)
+    data = loads(response.content)
+    return data
+
+
+async def get_test_result_attachments_async(client, project: str, run_id: str, test_case_result_id: str) -> dict:
+    """Async variant of get_test_result_attachments() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/test/Runs/{run_id}/Results/{test_case_result_id}/attachments", API_VERSION, project=project)
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_test_result_attachments() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    run_id = require_env("RUN_ID", "ID of the test run that contains the result.")
+    test_case_result_id = require_env("TEST_CASE_RESULT_ID", "ID of the test result.")
+
+    parser = argparse.ArgumentParser(description="Get list of test result attachments reference.")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("get_test_result_attachments", pat)
+    logger.info("Get list of test result attachments reference.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        items = items_of(get_test_result_attachments(client, project, run_id, test_case_result_id), "value")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    data = get_test_result_attachments(client, project, run_id, test_case_result_id)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,55 +10,77 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/test/iterations/get?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-RUN_ID = get_env_or_exit("RUN_ID", "ID of the test run that contains the result.")
-TEST_CASE_RESULT_ID = get_env_or_exit("TEST_CASE_RESULT_ID", "ID of the test result that contains the iterations.")
-ITERATION_ID = get_env_or_exit("ITERATION_ID", "Id of the test results Iteration.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_iterations", PAT)
-logger.info("Get iteration for a result")
+def get_iterations(client, project: str, run_id: str, test_case_result_id: str, iteration_id: str) -> dict:
+    """
+    Get iteration for a result
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/test/Runs/{RUN_ID}/Results/{TEST_CASE_RESULT_ID}/iterations/{ITERATION_ID}", API_VERSION, project=PROJECT_ID)
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        run_id: ID of the test run that contains the result.
+        test_case_result_id: ID of the test result that contains the iterations.
+        iteration_id: Id of the test results Iteration.
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/test/Runs/{run_id}/Results/{test_case_result_id}/iterations/{iteration_id}", API_VERSION, project=project)
+    response = client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['id', 'actionResults'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'actionResults'], API_VERSION)
+async def get_iterations_async(client, project: str, run_id: str, test_case_result_id: str, iteration_id: str) -> dict:
+    """Async variant of get_iterations() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/test/Runs/{run_id}/Results/{test_case_result_id}/iterations/{iteration_id}", API_VERSION, project=project)
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['id', 'actionResults'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(f"Iterations ID: {data.get("id", "N/A")}")
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_iterations() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    run_id = require_env("RUN_ID", "ID of the test run that contains the result.")
+    test_case_result_id = require_env("TEST_CASE_RESULT_ID", "ID of the test result that contains the iterations.")
+    iteration_id = require_env("ITERATION_ID", "Id of the test results Iteration.")
+
+    logger = AdoLogger("get_iterations", pat)
+    logger.info("Get iteration for a result")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = get_iterations(client, project, run_id, test_case_result_id, iteration_id)
+
+    print(f"Iterations ID: {data.get('id', 'N/A')}")
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
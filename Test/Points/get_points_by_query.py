@@ -11,71 +11,94 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/test/points/get-po
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Get test points using query.")
-parser.add_argument("--order-by", required=False, help="Order by results.")
-parser.add_argument("--points", required=False, help="List of test points")
-parser.add_argument("--points-filter", required=False, help="Filter")
-parser.add_argument("--wit-fields", required=False, help="List of workitem fields to get.")
-args = parser.parse_args()
+def get_points_by_query(client, project: str, *, order_by: Optional[str] = None, points: Optional[str] = None, points_filter: Optional[str] = None, wit_fields: Optional[str] = None) -> dict:
+    """
+    Get test points using query.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        order_by: Order by results.
+        points: List of test points
+        points_filter: Filter
+        wit_fields: List of workitem fields to get.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "orderBy": order_by,
+        "points": points,
+        "pointsFilter": points_filter,
+        "witFields": wit_fields,
+    }
+    url = build_url(client.organization, f"_apis/test/points", API_VERSION, project=project)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['orderBy', 'points'], API_VERSION)
+    return data
+
+
+async def get_points_by_query_async(client, project: str, *, order_by: Optional[str] = None, points: Optional[str] = None, points_filter: Optional[str] = None, wit_fields: Optional[str] = None) -> dict:
+    """Async variant of get_points_by_query() for use with AsyncAdoClient."""
+    body = {
+        "orderBy": order_by,
+        "points": points,
+        "pointsFilter": points_filter,
+        "witFields": wit_fields,
+    }
+    url = build_url(client.organization, f"_apis/test/points", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['orderBy', 'points'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_points_by_query", PAT)
-logger.info("Get test points using query.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "orderBy": args.order_by,
-    "points": args.points,
-    "pointsFilter": args.points_filter,
-    "witFields": args.wit_fields,
-}
+def main() -> None:
+    """Read env vars / flags, call get_points_by_query() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/test/points", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Get test points using query.")
+    parser.add_argument("--order-by", required=False, help="Order by results.")
+    parser.add_argument("--points", required=False, help="List of test points")
+    parser.add_argument("--points-filter", required=False, help="Filter")
+    parser.add_argument("--wit-fields", required=False, help="List of workitem fields to get.")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("get_points_by_query", pat)
+    logger.info("Get test points using query.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = get_points_by_query(client, project, order_by=args.order_by, points=args.points, points_filter=args.points_filter, wit_fields=args.wit_fields)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['orderBy', 'points'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
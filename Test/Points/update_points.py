@@ -11,67 +11,102 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/test/points/update
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-PLAN_ID = get_env_or_exit("PLAN_ID", "ID of the test plan.")
-SUITE_ID = get_env_or_exit("SUITE_ID", "ID of the suite that contains the points.")
-POINT_IDS = get_env_or_exit("POINT_IDS", "ID of the test point to get. Use a comma-separated list of IDs to update multiple test points.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Update test points.")
-parser.add_argument("--outcome", required=False, help="Outcome to update.")
-parser.add_argument("--reset-to-active", required=False, help="Reset test point to active.")
-parser.add_argument("--tester", required=False, help="Tester to update. Type IdentityRef.")
-args = parser.parse_args()
+def update_points(client, project: str, plan_id: str, suite_id: str, point_ids: str, *, outcome: Optional[str] = None, reset_to_active: Optional[str] = None, tester: Optional[str] = None) -> dict:
+    """
+    Update test points.
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_points", PAT)
-logger.info("Update test points.")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        plan_id: ID of the test plan.
+        suite_id: ID of the suite that contains the points.
+        point_ids: ID of the test point to get. Use a comma-separated list of IDs to update multiple test points.
+        outcome: Outcome to update.
+        reset_to_active: Reset test point to active.
+        tester: Tester to update. Type IdentityRef.
 
-# ---------------------------------------------------------------------------
-# Request body
-# ---------------------------------------------------------------------------
-body = {
-    "outcome": args.outcome,
-    "resetToActive": args.reset_to_active,
-    "tester": args.tester,
-}
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "outcome": outcome,
+        "resetToActive": reset_to_active,
+        "tester": tester,
+    }
+    url = build_url(client.organization, f"_apis/test/Plans/{plan_id}/Suites/{suite_id}/points/{point_ids}", API_VERSION, project=project)
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/test/Plans/{PLAN_ID}/Suites/{SUITE_ID}/points/{POINT_IDS}", API_VERSION, project=PROJECT_ID)
-logger.info(f"PATCH {url}")
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+async def update_points_async(client, project: str, plan_id: str, suite_id: str, point_ids: str, *, outcome: Optional[str] = None, reset_to_active: Optional[str] = None, tester: Optional[str] = None) -> dict:
+    """Async variant of update_points() for use with AsyncAdoClient."""
+    body = {
+        "outcome": outcome,
+        "resetToActive": reset_to_active,
+        "tester": tester,
+    }
+    url = build_url(client.organization, f"_apis/test/Plans/{plan_id}/Suites/{suite_id}/points/{point_ids}", API_VERSION, project=project)
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call update_points() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    plan_id = require_env("PLAN_ID", "ID of the test plan.")
+    suite_id = require_env("SUITE_ID", "ID of the suite that contains the points.")
+    point_ids = require_env("POINT_IDS", "ID of the test point to get. Use a comma-separated list of IDs to update multiple test points.")
+
+    parser = argparse.ArgumentParser(description="Update test points.")
+    parser.add_argument("--outcome", required=False, help="Outcome to update.")
+    parser.add_argument("--reset-to-active", required=False, help="Reset test point to active.")
+    parser.add_argument("--tester", required=False, help="Tester to update. Type IdentityRef.")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("update_points", pat)
+    logger.info("Update test points.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        items = items_of(update_points(client, project, plan_id, suite_id, point_ids, outcome=args.outcome, reset_to_active=args.reset_to_active, tester=args.tester), "value")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    data = update_points(client, project, plan_id, suite_id, point_ids, outcome=args.outcome, reset_to_active=args.reset_to_active, tester=args.tester)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,71 +11,94 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/test/result-retent
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Update test result retention settings")
-parser.add_argument("--automated-results-retention-duration", required=False, help="Automated test result retention duration in days")
-parser.add_argument("--last-updated-by", required=False, help="Last Updated by identity")
-parser.add_argument("--last-updated-date", required=False, help="Last updated date")
-parser.add_argument("--manual-results-retention-duration", required=False, help="Manual test result retention duration in days")
-args = parser.parse_args()
+def update_result_retention_settings(client, project: str, *, automated_results_retention_duration: Optional[str] = None, last_updated_by: Optional[str] = None, last_updated_date: Optional[str] = None, manual_results_retention_duration: Optional[str] = None) -> dict:
+    """
+    Update test result retention settings
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        automated_results_retention_duration: Automated test result retention duration in days
+        last_updated_by: Last Updated by identity
+        last_updated_date: Last updated date
+        manual_results_retention_duration: Manual test result retention duration in days
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "automatedResultsRetentionDuration": automated_results_retention_duration,
+        "lastUpdatedBy": last_updated_by,
+        "lastUpdatedDate": last_updated_date,
+        "manualResultsRetentionDuration": manual_results_retention_duration,
+    }
+    url = build_url(client.organization, f"_apis/test/resultretentionsettings", API_VERSION, project=project)
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['automatedResultsRetentionDuration', 'lastUpdatedBy'], API_VERSION)
+    return data
+
+
+async def update_result_retention_settings_async(client, project: str, *, automated_results_retention_duration: Optional[str] = None, last_updated_by: Optional[str] = None, last_updated_date: Optional[str] = None, manual_results_retention_duration: Optional[str] = None) -> dict:
+    """Async variant of update_result_retention_settings() for use with AsyncAdoClient."""
+    body = {
+        "automatedResultsRetentionDuration": automated_results_retention_duration,
+        "lastUpdatedBy": last_updated_by,
+        "lastUpdatedDate": last_updated_date,
+        "manualResultsRetentionDuration": manual_results_retention_duration,
+    }
+    url = build_url(client.organization, f"_apis/test/resultretentionsettings", API_VERSION, project=project)
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['automatedResultsRetentionDuration', 'lastUpdatedBy'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_result_retention_settings", PAT)
-logger.info("Update test result retention settings")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "automatedResultsRetentionDuration": args.automated_results_retention_duration,
-    "lastUpdatedBy": args.last_updated_by,
-    "lastUpdatedDate": args.last_updated_date,
-    "manualResultsRetentionDuration": args.manual_results_retention_duration,
-}
+def main() -> None:
+    """Read env vars / flags, call update_result_retention_settings() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/test/resultretentionsettings", API_VERSION, project=PROJECT_ID)
-logger.info(f"PATCH {url}")
+    parser = argparse.ArgumentParser(description="Update test result retention settings")
+    parser.add_argument("--automated-results-retention-duration", required=False, help="Automated test result retention duration in days")
+    parser.add_argument("--last-updated-by", required=False, help="Last Updated by identity")
+    parser.add_argument("--last-updated-date", required=False, help="Last updated date")
+    parser.add_argument("--manual-results-retention-duration", required=False, help="Manual test result retention duration in days")
+    args = parser.parse_args()
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+    logger = AdoLogger("update_result_retention_settings", pat)
+    logger.info("Update test result retention settings")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_result_retention_settings(client, project, automated_results_retention_duration=args.automated_results_retention_duration, last_updated_by=args.last_updated_by, last_updated_date=args.last_updated_date, manual_results_retention_duration=args.manual_results_retention_duration)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['automatedResultsRetentionDuration', 'lastUpdatedBy'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
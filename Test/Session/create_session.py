@@ -11,77 +11,105 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/test/session/creat
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-TEAM_ID = get_env_or_exit("TEAM_ID", "Team ID or team name")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Create a test session")
-parser.add_argument("--area", required=False, help="Area path of the test session")
-parser.add_argument("--comment", required=False, help="Comments in the test session")
-parser.add_argument("--end-date", required=False, help="Duration of the session")
-parser.add_argument("--id", required=False, help="Id of the test session")
-parser.add_argument("--last-updated-by", required=False, help="Last Updated By Reference")
-parser.add_argument("--last-updated-date", required=False, help="Last updated date")
-args = parser.parse_args()
+def create_session(client, project: str, team: str, *, area: Optional[str] = None, comment: Optional[str] = None, end_date: Optional[str] = None, id: Optional[str] = None, last_updated_by: Optional[str] = None, last_updated_date: Optional[str] = None) -> dict:
+    """
+    Create a test session
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        team: Team ID or team name
+        area: Area path of the test session
+        comment: Comments in the test session
+        end_date: Duration of the session
+        id: Id of the test session
+        last_updated_by: Last Updated By Reference
+        last_updated_date: Last updated date
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "area": area,
+        "comment": comment,
+        "endDate": end_date,
+        "id": id,
+        "lastUpdatedBy": last_updated_by,
+        "lastUpdatedDate": last_updated_date,
+    }
+    url = build_url(client.organization, f"{team}/_apis/test/session", API_VERSION, project=project)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'area'], API_VERSION)
+    return data
+
+
+async def create_session_async(client, project: str, team: str, *, area: Optional[str] = None, comment: Optional[str] = None, end_date: Optional[str] = None, id: Optional[str] = None, last_updated_by: Optional[str] = None, last_updated_date: Optional[str] = None) -> dict:
+    """Async variant of create_session() for use with AsyncAdoClient."""
+    body = {
+        "area": area,
+        "comment": comment,
+        "endDate": end_date,
+        "id": id,
+        "lastUpdatedBy": last_updated_by,
+        "lastUpdatedDate": last_updated_date,
+    }
+    url = build_url(client.organization, f"{team}/_apis/test/session", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'area'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_session", PAT)
-logger.info("Create a test session")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "area": args.area,
-    "comment": args.comment,
-    "endDate": args.end_date,
-    "id": args.id,
-    "lastUpdatedBy": args.last_updated_by,
-    "lastUpdatedDate": args.last_updated_date,
-}
+def main() -> None:
+    """Read env vars / flags, call create_session() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    team = require_env("TEAM_ID", "Team ID or team name")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"{TEAM_ID}/_apis/test/session", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Create a test session")
+    parser.add_argument("--area", required=False, help="Area path of the test session")
+    parser.add_argument("--comment", required=False, help="Comments in the test session")
+    parser.add_argument("--end-date", required=False, help="Duration of the session")
+    parser.add_argument("--id", required=False, help="Id of the test session")
+    parser.add_argument("--last-updated-by", required=False, help="Last Updated By Reference")
+    parser.add_argument("--last-updated-date", required=False, help="Last updated date")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_session", pat)
+    logger.info("Create a test session")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_session(client, project, team, area=args.area, comment=args.comment, end_date=args.end_date, id=args.id, last_updated_by=args.last_updated_by, last_updated_date=args.last_updated_date)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'area'], API_VERSION)
+    print(f"Session ID: {data.get('id', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Session ID: {data.get("id", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
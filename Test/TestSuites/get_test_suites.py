@@ -10,54 +10,76 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/test/test--suites/get?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-PLAN_ID = get_env_or_exit("PLAN_ID", "ID of the test plan that contains the suites.")
-SUITE_ID = get_env_or_exit("SUITE_ID", "ID of the suite that contains the test case.")
-TEST_CASE_IDS = get_env_or_exit("TEST_CASE_IDS", "ID of the test case to get.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_test_suites", PAT)
-logger.info("Get a specific test case in a test suite with test case id.")
+def get_test_suites(client, project: str, plan_id: str, suite_id: str, test_case_ids: str) -> dict:
+    """
+    Get a specific test case in a test suite with test case id.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/test/Plans/{PLAN_ID}/suites/{SUITE_ID}/testcases/{TEST_CASE_IDS}", API_VERSION, project=PROJECT_ID)
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        plan_id: ID of the test plan that contains the suites.
+        suite_id: ID of the suite that contains the test case.
+        test_case_ids: ID of the test case to get.
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/test/Plans/{plan_id}/suites/{suite_id}/testcases/{test_case_ids}", API_VERSION, project=project)
+    response = client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['pointAssignments', 'testCase'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['pointAssignments', 'testCase'], API_VERSION)
+async def get_test_suites_async(client, project: str, plan_id: str, suite_id: str, test_case_ids: str) -> dict:
+    """Async variant of get_test_suites() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/test/Plans/{plan_id}/suites/{suite_id}/testcases/{test_case_ids}", API_VERSION, project=project)
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['pointAssignments', 'testCase'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_test_suites() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    plan_id = require_env("PLAN_ID", "ID of the test plan that contains the suites.")
+    suite_id = require_env("SUITE_ID", "ID of the suite that contains the test case.")
+    test_case_ids = require_env("TEST_CASE_IDS", "ID of the test case to get.")
+
+    logger = AdoLogger("get_test_suites", pat)
+    logger.info("Get a specific test case in a test suite with test case id.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = get_test_suites(client, project, plan_id, suite_id, test_case_ids)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,75 +11,101 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/test-plan/configur
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-TEST_CONFIGUARTION_ID = get_env_or_exit("TEST_CONFIGUARTION_ID", "ID of the test configuration to update.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Update a test configuration by its ID.")
-parser.add_argument("--description", required=False, help="Description of the configuration")
-parser.add_argument("--is-default", required=False, help="Is the configuration a default for the test plans")
-parser.add_argument("--name", required=False, help="Name of the configuration")
-parser.add_argument("--state", required=False, help="State of the configuration")
-parser.add_argument("--values", required=False, help="Dictionary of Test Variable, Selected Value")
-args = parser.parse_args()
+def update_configurations(client, project: str, test_configuartion_id: str, *, description: Optional[str] = None, is_default: Optional[str] = None, name: Optional[str] = None, state: Optional[str] = None, values: Optional[str] = None) -> dict:
+    """
+    Update a test configuration by its ID.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        test_configuartion_id: ID of the test configuration to update.
+        description: Description of the configuration
+        is_default: Is the configuration a default for the test plans
+        name: Name of the configuration
+        state: State of the configuration
+        values: Dictionary of Test Variable, Selected Value
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "description": description,
+        "isDefault": is_default,
+        "name": name,
+        "state": state,
+        "values": values,
+    }
+    url = build_url(client.organization, f"_apis/testplan/configurations", API_VERSION, project=project)
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'project'], API_VERSION)
+    return data
+
+
+async def update_configurations_async(client, project: str, test_configuartion_id: str, *, description: Optional[str] = None, is_default: Optional[str] = None, name: Optional[str] = None, state: Optional[str] = None, values: Optional[str] = None) -> dict:
+    """Async variant of update_configurations() for use with AsyncAdoClient."""
+    body = {
+        "description": description,
+        "isDefault": is_default,
+        "name": name,
+        "state": state,
+        "values": values,
+    }
+    url = build_url(client.organization, f"_apis/testplan/configurations", API_VERSION, project=project)
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'project'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_configurations", PAT)
-logger.info("Update a test configuration by its ID.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "description": args.description,
-    "isDefault": args.is_default,
-    "name": args.name,
-    "state": args.state,
-    "values": args.values,
-}
+def main() -> None:
+    """Read env vars / flags, call update_configurations() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    test_configuartion_id = require_env("TEST_CONFIGUARTION_ID", "ID of the test configuration to update.")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/testplan/configurations", API_VERSION, project=PROJECT_ID)
-logger.info(f"PATCH {url}")
+    parser = argparse.ArgumentParser(description="Update a test configuration by its ID.")
+    parser.add_argument("--description", required=False, help="Description of the configuration")
+    parser.add_argument("--is-default", required=False, help="Is the configuration a default for the test plans")
+    parser.add_argument("--name", required=False, help="Name of the configuration")
+    parser.add_argument("--state", required=False, help="State of the configuration")
+    parser.add_argument("--values", required=False, help="Dictionary of Test Variable, Selected Value")
+    args = parser.parse_args()
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+    logger = AdoLogger("update_configurations", pat)
+    logger.info("Update a test configuration by its ID.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_configurations(client, project, test_configuartion_id, description=args.description, is_default=args.is_default, name=args.name, state=args.state, values=args.values)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'project'], API_VERSION)
+    print(f"Configurations ID: {data.get('id', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Configurations ID: {data.get("id", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,48 +10,84 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/test-plan/suite-test-case/add?view=azure-devops-rest-7.2
 """
 
-import json
+import argparse
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-PLAN_ID = get_env_or_exit("PLAN_ID", "ID of the test plan to which test cases are to be added.")
-SUITE_ID = get_env_or_exit("SUITE_ID", "ID of the test suite to which test cases are to be added.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_suite_test_case", PAT)
-logger.info("Add test cases to a suite with specified configurations")
+def create_suite_test_case(client, project: str, plan_id: str, suite_id: str) -> dict:
+    """
+    Add test cases to a suite with specified configurations
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/testplan/Plans/{PLAN_ID}/Suites/{SUITE_ID}/TestCase", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        plan_id: ID of the test plan to which test cases are to be added.
+        suite_id: ID of the test suite to which test cases are to be added.
 
-response = execute_request("POST", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/testplan/Plans/{plan_id}/Suites/{suite_id}/TestCase", API_VERSION, project=project)
+    response = client.request("POST", url)
+    data = loads(response.content)
+    return data
+
+
+async def create_suite_test_case_async(client, project: str, plan_id: str, suite_id: str) -> dict:
+    """Async variant of create_suite_test_case() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/testplan/Plans/{plan_id}/Suites/{suite_id}/TestCase", API_VERSION, project=project)
+    response = await client.request("POST", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call create_suite_test_case() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    plan_id = require_env("PLAN_ID", "ID of the test plan to which test cases are to be added.")
+    suite_id = require_env("SUITE_ID", "ID of the test suite to which test cases are to be added.")
+
+    parser = argparse.ArgumentParser(description="Add test cases to a suite with specified configurations")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("create_suite_test_case", pat)
+    logger.info("Add test cases to a suite with specified configurations")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        items = items_of(create_suite_test_case(client, project, plan_id, suite_id), "value")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    data = create_suite_test_case(client, project, plan_id, suite_id)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,49 +10,74 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/test-plan/suite-test-case/remove-test-cases-list-from-suite?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-PLAN_ID = get_env_or_exit("PLAN_ID", "ID of the test plan from which test cases are to be removed.")
-SUITE_ID = get_env_or_exit("SUITE_ID", "ID of the test suite from which test cases are to be removed.")
-TEST_IDS = get_env_or_exit("TEST_IDS", "Comma separated string of Test Case Ids to be removed.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("list_test_cases_list_from_suite", PAT)
-logger.info("Removes test cases from a suite based on the list of test case Ids provided.")
+def list_test_cases_list_from_suite(client, project: str, plan_id: str, suite_id: str, test_ids: str) -> dict:
+    """
+    Removes test cases from a suite based on the list of test case Ids provided.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        plan_id: ID of the test plan from which test cases are to be removed.
+        suite_id: ID of the test suite from which test cases are to be removed.
+        test_ids: Comma separated string of Test Case Ids to be removed.
+
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/testplan/Plans/{plan_id}/Suites/{suite_id}/TestCase", API_VERSION, project=project)
+    response = client.request("DELETE", url)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/testplan/Plans/{PLAN_ID}/Suites/{SUITE_ID}/TestCase", API_VERSION, project=PROJECT_ID)
-logger.info(f"DELETE {url}")
 
-response = execute_request("DELETE", url, HEADERS)
+async def list_test_cases_list_from_suite_async(client, project: str, plan_id: str, suite_id: str, test_ids: str) -> dict:
+    """Async variant of list_test_cases_list_from_suite() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/testplan/Plans/{plan_id}/Suites/{suite_id}/TestCase", API_VERSION, project=project)
+    response = await client.request("DELETE", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call list_test_cases_list_from_suite() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    plan_id = require_env("PLAN_ID", "ID of the test plan from which test cases are to be removed.")
+    suite_id = require_env("SUITE_ID", "ID of the test suite from which test cases are to be removed.")
+    test_ids = require_env("TEST_IDS", "Comma separated string of Test Case Ids to be removed.")
+
+    logger = AdoLogger("list_test_cases_list_from_suite", pat)
+    logger.info("Removes test cases from a suite based on the list of test case Ids provided.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = list_test_cases_list_from_suite(client, project, plan_id, suite_id, test_ids)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
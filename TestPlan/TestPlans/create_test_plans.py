@@ -11,76 +11,103 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/test-plan/test--pl
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Create a test plan.")
-parser.add_argument("--actual-test-result-settings", required=False, help="Actual Test Result Settings for the test plan.")
-parser.add_argument("--area-path", required=False, help="Area of the test plan.")
-parser.add_argument("--build-definition", required=False, help="The Build Definition that generates a build associated with this test plan.")
-parser.add_argument("--build-id", required=False, help="Build to be tested.")
-parser.add_argument("--description", required=False, help="Description of the test plan.")
-parser.add_argument("--end-date", required=False, help="End date for the test plan.")
-args = parser.parse_args()
+def create_test_plans(client, project: str, *, actual_test_result_settings: Optional[str] = None, area_path: Optional[str] = None, build_definition: Optional[str] = None, build_id: Optional[str] = None, description: Optional[str] = None, end_date: Optional[str] = None) -> dict:
+    """
+    Create a test plan.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        actual_test_result_settings: Actual Test Result Settings for the test plan.
+        area_path: Area of the test plan.
+        build_definition: The Build Definition that generates a build associated with this test plan.
+        build_id: Build to be tested.
+        description: Description of the test plan.
+        end_date: End date for the test plan.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "actualTestResultSettings": actual_test_result_settings,
+        "areaPath": area_path,
+        "buildDefinition": build_definition,
+        "buildId": build_id,
+        "description": description,
+        "endDate": end_date,
+    }
+    url = build_url(client.organization, f"_apis/testplan/plans", API_VERSION, project=project)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'previousBuildId'], API_VERSION)
+    return data
+
+
+async def create_test_plans_async(client, project: str, *, actual_test_result_settings: Optional[str] = None, area_path: Optional[str] = None, build_definition: Optional[str] = None, build_id: Optional[str] = None, description: Optional[str] = None, end_date: Optional[str] = None) -> dict:
+    """Async variant of create_test_plans() for use with AsyncAdoClient."""
+    body = {
+        "actualTestResultSettings": actual_test_result_settings,
+        "areaPath": area_path,
+        "buildDefinition": build_definition,
+        "buildId": build_id,
+        "description": description,
+        "endDate": end_date,
+    }
+    url = build_url(client.organization, f"_apis/testplan/plans", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'previousBuildId'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_test_plans", PAT)
-logger.info("Create a test plan.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "actualTestResultSettings": args.actual_test_result_settings,
-    "areaPath": args.area_path,
-    "buildDefinition": args.build_definition,
-    "buildId": args.build_id,
-    "description": args.description,
-    "endDate": args.end_date,
-}
+def main() -> None:
+    """Read env vars / flags, call create_test_plans() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/testplan/plans", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Create a test plan.")
+    parser.add_argument("--actual-test-result-settings", required=False, help="Actual Test Result Settings for the test plan.")
+    parser.add_argument("--area-path", required=False, help="Area of the test plan.")
+    parser.add_argument("--build-definition", required=False, help="The Build Definition that generates a build associated with this test plan.")
+    parser.add_argument("--build-id", required=False, help="Build to be tested.")
+    parser.add_argument("--description", required=False, help="Description of the test plan.")
+    parser.add_argument("--end-date", required=False, help="End date for the test plan.")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_test_plans", pat)
+    logger.info("Create a test plan.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_test_plans(client, project, actual_test_result_settings=args.actual_test_result_settings, area_path=args.area_path, build_definition=args.build_definition, build_id=args.build_id, description=args.description, end_date=args.end_date)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'previousBuildId'], API_VERSION)
+    print(f"Test  Plans ID: {data.get('id', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Test  Plans ID: {data.get("id", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
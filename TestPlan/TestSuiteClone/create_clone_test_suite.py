@@ -11,69 +11,90 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/test-plan/test-sui
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Clone test suite")
-parser.add_argument("--clone-options", required=False, help="Test Plan Clone create parameters")
-parser.add_argument("--destination-test-suite", required=False, help="Information about destination Test Suite")
-parser.add_argument("--source-test-suite", required=False, help="Information about source Test Suite")
-args = parser.parse_args()
+def create_clone_test_suite(client, project: str, *, clone_options: Optional[str] = None, destination_test_suite: Optional[str] = None, source_test_suite: Optional[str] = None) -> dict:
+    """
+    Clone test suite
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        clone_options: Test Plan Clone create parameters
+        destination_test_suite: Information about destination Test Suite
+        source_test_suite: Information about source Test Suite
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "cloneOptions": clone_options,
+        "destinationTestSuite": destination_test_suite,
+        "sourceTestSuite": source_test_suite,
+    }
+    url = build_url(client.organization, f"_apis/testplan/Suites/CloneOperation", API_VERSION, project=project)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['clonedTestSuite', 'cloneOperationResponse'], API_VERSION)
+    return data
+
+
+async def create_clone_test_suite_async(client, project: str, *, clone_options: Optional[str] = None, destination_test_suite: Optional[str] = None, source_test_suite: Optional[str] = None) -> dict:
+    """Async variant of create_clone_test_suite() for use with AsyncAdoClient."""
+    body = {
+        "cloneOptions": clone_options,
+        "destinationTestSuite": destination_test_suite,
+        "sourceTestSuite": source_test_suite,
+    }
+    url = build_url(client.organization, f"_apis/testplan/Suites/CloneOperation", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['clonedTestSuite', 'cloneOperationResponse'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_clone_test_suite", PAT)
-logger.info("Clone test suite")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "cloneOptions": args.clone_options,
-    "destinationTestSuite": args.destination_test_suite,
-    "sourceTestSuite": args.source_test_suite,
-}
+def main() -> None:
+    """Read env vars / flags, call create_clone_test_suite() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/testplan/Suites/CloneOperation", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Clone test suite")
+    parser.add_argument("--clone-options", required=False, help="Test Plan Clone create parameters")
+    parser.add_argument("--destination-test-suite", required=False, help="Information about destination Test Suite")
+    parser.add_argument("--source-test-suite", required=False, help="Information about source Test Suite")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_clone_test_suite", pat)
+    logger.info("Clone test suite")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_clone_test_suite(client, project, clone_options=args.clone_options, destination_test_suite=args.destination_test_suite, source_test_suite=args.source_test_suite)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['clonedTestSuite', 'cloneOperationResponse'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,52 +10,72 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/test-plan/test-suite-clone/get?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-CLONE_OPERATION_ID = get_env_or_exit("CLONE_OPERATION_ID", "Operation ID returned when we queue a clone operation")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_test_suite_clone", PAT)
-logger.info("Get clone information.")
+def get_test_suite_clone(client, project: str, clone_operation_id: str) -> dict:
+    """
+    Get clone information.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/testplan/Suites/CloneOperation/{CLONE_OPERATION_ID}", API_VERSION, project=PROJECT_ID)
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        clone_operation_id: Operation ID returned when we queue a clone operation
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/testplan/Suites/CloneOperation/{clone_operation_id}", API_VERSION, project=project)
+    response = client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['clonedTestSuite', 'cloneOperationResponse'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['clonedTestSuite', 'cloneOperationResponse'], API_VERSION)
+async def get_test_suite_clone_async(client, project: str, clone_operation_id: str) -> dict:
+    """Async variant of get_test_suite_clone() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/testplan/Suites/CloneOperation/{clone_operation_id}", API_VERSION, project=project)
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['clonedTestSuite', 'cloneOperationResponse'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_test_suite_clone() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    clone_operation_id = require_env("CLONE_OPERATION_ID", "Operation ID returned when we queue a clone operation")
+
+    logger = AdoLogger("get_test_suite_clone", pat)
+    logger.info("Get clone information.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = get_test_suite_clone(client, project, clone_operation_id)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
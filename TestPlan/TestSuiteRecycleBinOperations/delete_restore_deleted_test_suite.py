@@ -11,61 +11,82 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/test-plan/test--su
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-SUITE_ID = get_env_or_exit("SUITE_ID", "The ID of the test suite to restore")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Restores the deleted test suite")
-parser.add_argument("--is-deleted", required=False, help="Indicates whether the deleted test plan/suite should be restored.")
-args = parser.parse_args()
+def delete_restore_deleted_test_suite(client, project: str, suite_id: str, *, is_deleted: Optional[str] = None) -> dict:
+    """
+    Restores the deleted test suite
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("delete_restore_deleted_test_suite", PAT)
-logger.info("Restores the deleted test suite")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        suite_id: The ID of the test suite to restore
+        is_deleted: Indicates whether the deleted test plan/suite should be restored.
 
-# ---------------------------------------------------------------------------
-# Request body
-# ---------------------------------------------------------------------------
-body = {
-    "isDeleted": args.is_deleted,
-}
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "isDeleted": is_deleted,
+    }
+    url = build_url(client.organization, f"_apis/testplan/recycleBin/testsuite/{suite_id}", API_VERSION, project=project)
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/testplan/recycleBin/testsuite/{SUITE_ID}", API_VERSION, project=PROJECT_ID)
-logger.info(f"PATCH {url}")
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+async def delete_restore_deleted_test_suite_async(client, project: str, suite_id: str, *, is_deleted: Optional[str] = None) -> dict:
+    """Async variant of delete_restore_deleted_test_suite() for use with AsyncAdoClient."""
+    body = {
+        "isDeleted": is_deleted,
+    }
+    url = build_url(client.organization, f"_apis/testplan/recycleBin/testsuite/{suite_id}", API_VERSION, project=project)
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call delete_restore_deleted_test_suite() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    suite_id = require_env("SUITE_ID", "The ID of the test suite to restore")
+
+    parser = argparse.ArgumentParser(description="Restores the deleted test suite")
+    parser.add_argument("--is-deleted", required=False, help="Indicates whether the deleted test plan/suite should be restored.")
+    args = parser.parse_args()
+
+    logger = AdoLogger("delete_restore_deleted_test_suite", pat)
+    logger.info("Restores the deleted test suite")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = delete_restore_deleted_test_suite(client, project, suite_id, is_deleted=args.is_deleted)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
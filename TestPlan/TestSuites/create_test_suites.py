@@ -11,69 +11,89 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/test-plan/test--su
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-PLAN_ID = get_env_or_exit("PLAN_ID", "ID of the test plan that contains the suites.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Create test suite.")
-parser.add_argument("--requirement-id", required=False, help="Test suite requirement id.")
-parser.add_argument("--suite-type", required=False, help="Test suite type.")
-args = parser.parse_args()
+def create_test_suites(client, project: str, plan_id: str, *, requirement_id: Optional[str] = None, suite_type: Optional[str] = None) -> dict:
+    """
+    Create test suite.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        plan_id: ID of the test plan that contains the suites.
+        requirement_id: Test suite requirement id.
+        suite_type: Test suite type.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "requirementId": requirement_id,
+        "suiteType": suite_type,
+    }
+    url = build_url(client.organization, f"_apis/testplan/Plans/{plan_id}/suites", API_VERSION, project=project)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'children'], API_VERSION)
+    return data
+
+
+async def create_test_suites_async(client, project: str, plan_id: str, *, requirement_id: Optional[str] = None, suite_type: Optional[str] = None) -> dict:
+    """Async variant of create_test_suites() for use with AsyncAdoClient."""
+    body = {
+        "requirementId": requirement_id,
+        "suiteType": suite_type,
+    }
+    url = build_url(client.organization, f"_apis/testplan/Plans/{plan_id}/suites", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'children'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_test_suites", PAT)
-logger.info("Create test suite.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "requirementId": args.requirement_id,
-    "suiteType": args.suite_type,
-}
+def main() -> None:
+    """Read env vars / flags, call create_test_suites() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    plan_id = require_env("PLAN_ID", "ID of the test plan that contains the suites.")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/testplan/Plans/{PLAN_ID}/suites", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Create test suite.")
+    parser.add_argument("--requirement-id", required=False, help="Test suite requirement id.")
+    parser.add_argument("--suite-type", required=False, help="Test suite type.")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_test_suites", pat)
+    logger.info("Create test suite.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_test_suites(client, project, plan_id, requirement_id=args.requirement_id, suite_type=args.suite_type)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'children'], API_VERSION)
+    print(f"Test  Suites ID: {data.get('id', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Test  Suites ID: {data.get("id", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,46 +10,80 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/test-plan/test--suites/get-suites-by-test-case-id?view=azure-devops-rest-7.2
 """
 
-import json
+import argparse
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-TEST_CASE_ID = get_env_or_exit("TEST_CASE_ID", "ID of the test case for which suites need to be fetched.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_suites_by_test_case_id", PAT)
-logger.info("Find the list of all test suites in which a given test case is present.")
+def get_suites_by_test_case_id(client, test_case_id: str) -> dict:
+    """
+    Find the list of all test suites in which a given test case is present.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/testplan/suites", API_VERSION)
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        test_case_id: ID of the test case for which suites need to be fetched.
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/testplan/suites", API_VERSION)
+    response = client.request("GET", url)
+    data = loads(response.content)
+    return data
+
+
+async def get_suites_by_test_case_id_async(client, test_case_id: str) -> dict:
+    """Async variant of get_suites_by_test_case_id() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/testplan/suites", API_VERSION)
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_suites_by_test_case_id() and print the result."""
+    organization, pat = get_common_env()
+    test_case_id = require_env("TEST_CASE_ID", "ID of the test case for which suites need to be fetched.")
+
+    parser = argparse.ArgumentParser(description="Find the list of all test suites in which a given test case is present.")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("get_suites_by_test_case_id", pat)
+    logger.info("Find the list of all test suites in which a given test case is present.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        items = items_of(get_suites_by_test_case_id(client, test_case_id), "value")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    data = get_suites_by_test_case_id(client, test_case_id)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
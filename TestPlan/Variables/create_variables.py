@@ -11,70 +11,91 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/test-plan/variable
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Create a test variable.")
-parser.add_argument("--description", required=False, help="Description of the test variable")
-parser.add_argument("--name", required=False, help="Name of the test variable")
-parser.add_argument("--values", required=False, help="List of allowed values")
-args = parser.parse_args()
+def create_variables(client, project: str, *, description: Optional[str] = None, name: Optional[str] = None, values: Optional[str] = None) -> dict:
+    """
+    Create a test variable.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        description: Description of the test variable
+        name: Name of the test variable
+        values: List of allowed values
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "description": description,
+        "name": name,
+        "values": values,
+    }
+    url = build_url(client.organization, f"_apis/testplan/variables", API_VERSION, project=project)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'project'], API_VERSION)
+    return data
+
+
+async def create_variables_async(client, project: str, *, description: Optional[str] = None, name: Optional[str] = None, values: Optional[str] = None) -> dict:
+    """Async variant of create_variables() for use with AsyncAdoClient."""
+    body = {
+        "description": description,
+        "name": name,
+        "values": values,
+    }
+    url = build_url(client.organization, f"_apis/testplan/variables", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'project'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_variables", PAT)
-logger.info("Create a test variable.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "description": args.description,
-    "name": args.name,
-    "values": args.values,
-}
+def main() -> None:
+    """Read env vars / flags, call create_variables() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/testplan/variables", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Create a test variable.")
+    parser.add_argument("--description", required=False, help="Description of the test variable")
+    parser.add_argument("--name", required=False, help="Name of the test variable")
+    parser.add_argument("--values", required=False, help="List of allowed values")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_variables", pat)
+    logger.info("Create a test variable.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_variables(client, project, description=args.description, name=args.name, values=args.values)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'project'], API_VERSION)
+    print(f"Variables ID: {data.get('id', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Variables ID: {data.get("id", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,71 +11,93 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/test-plan/variable
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-TEST_VARIABLE_ID = get_env_or_exit("TEST_VARIABLE_ID", "ID of the test variable to update.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Update a test variable by its ID.")
-parser.add_argument("--description", required=False, help="Description of the test variable")
-parser.add_argument("--name", required=False, help="Name of the test variable")
-parser.add_argument("--values", required=False, help="List of allowed values")
-args = parser.parse_args()
+def update_variables(client, project: str, test_variable_id: str, *, description: Optional[str] = None, name: Optional[str] = None, values: Optional[str] = None) -> dict:
+    """
+    Update a test variable by its ID.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        test_variable_id: ID of the test variable to update.
+        description: Description of the test variable
+        name: Name of the test variable
+        values: List of allowed values
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "description": description,
+        "name": name,
+        "values": values,
+    }
+    url = build_url(client.organization, f"_apis/testplan/variables/{test_variable_id}", API_VERSION, project=project)
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'project'], API_VERSION)
+    return data
+
+
+async def update_variables_async(client, project: str, test_variable_id: str, *, description: Optional[str] = None, name: Optional[str] = None, values: Optional[str] = None) -> dict:
+    """Async variant of update_variables() for use with AsyncAdoClient."""
+    body = {
+        "description": description,
+        "name": name,
+        "values": values,
+    }
+    url = build_url(client.organization, f"_apis/testplan/variables/{test_variable_id}", API_VERSION, project=project)
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'project'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_variables", PAT)
-logger.info("Update a test variable by its ID.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "description": args.description,
-    "name": args.name,
-    "values": args.values,
-}
+def main() -> None:
+    """Read env vars / flags, call update_variables() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    test_variable_id = require_env("TEST_VARIABLE_ID", "ID of the test variable to update.")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/testplan/variables/{TEST_VARIABLE_ID}", API_VERSION, project=PROJECT_ID)
-logger.info(f"PATCH {url}")
+    parser = argparse.ArgumentParser(description="Update a test variable by its ID.")
+    parser.add_argument("--description", required=False, help="Description of the test variable")
+    parser.add_argument("--name", required=False, help="Name of the test variable")
+    parser.add_argument("--values", required=False, help="List of allowed values")
+    args = parser.parse_args()
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+    logger = AdoLogger("update_variables", pat)
+    logger.info("Update a test variable by its ID.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_variables(client, project, test_variable_id, description=args.description, name=args.name, values=args.values)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'project'], API_VERSION)
+    print(f"Variables ID: {data.get('id', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Variables ID: {data.get("id", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,74 +11,99 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/test-results/attac
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-RUN_ID = get_env_or_exit("RUN_ID", "runId")
-TEST_CASE_RESULT_ID = get_env_or_exit("TEST_CASE_RESULT_ID", "testCaseResultId")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Create Test Result Attachment for Attachments")
-parser.add_argument("--attachment-type", required=False, help="Attachment type By Default it will be GeneralAttachment. It can be one of the following type. { G...")
-parser.add_argument("--comment", required=False, help="Comment associated with attachment")
-parser.add_argument("--file-name", required=False, help="Attachment filename")
-parser.add_argument("--stream", required=False, help="Base64 encoded file stream")
-args = parser.parse_args()
+def create_test_result_attachment(client, project: str, run_id: str, test_case_result_id: str, *, attachment_type: Optional[str] = None, comment: Optional[str] = None, file_name: Optional[str] = None, stream: Optional[str] = None) -> dict:
+    """
+    Create Test Result Attachment for Attachments
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        run_id: runId
+        test_case_result_id: testCaseResultId
+        attachment_type: Attachment type By Default it will be GeneralAttachment. It can be one of the following type. { G...
+        comment: Comment associated with attachment
+        file_name: Attachment filename
+        stream: Base64 encoded file stream
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "attachmentType": attachment_type,
+        "comment": comment,
+        "fileName": file_name,
+        "stream": stream,
+    }
+    url = build_url(client.organization, f"_apis/testresults/runs/{run_id}/results/{test_case_result_id}/attachments", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'url'], API_VERSION)
+    return data
+
+
+async def create_test_result_attachment_async(client, project: str, run_id: str, test_case_result_id: str, *, attachment_type: Optional[str] = None, comment: Optional[str] = None, file_name: Optional[str] = None, stream: Optional[str] = None) -> dict:
+    """Async variant of create_test_result_attachment() for use with AsyncAdoClient."""
+    body = {
+        "attachmentType": attachment_type,
+        "comment": comment,
+        "fileName": file_name,
+        "stream": stream,
+    }
+    url = build_url(client.organization, f"_apis/testresults/runs/{run_id}/results/{test_case_result_id}/attachments", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'url'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_test_result_attachment", PAT)
-logger.info("Create Test Result Attachment for Attachments")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "attachmentType": args.attachment_type,
-    "comment": args.comment,
-    "fileName": args.file_name,
-    "stream": args.stream,
-}
+def main() -> None:
+    """Read env vars / flags, call create_test_result_attachment() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    run_id = require_env("RUN_ID", "runId")
+    test_case_result_id = require_env("TEST_CASE_RESULT_ID", "testCaseResultId")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/testresults/runs/{RUN_ID}/results/{TEST_CASE_RESULT_ID}/attachments", API_VERSION, project=PROJECT_ID, base_host="vstmr.dev.azure.com")
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Create Test Result Attachment for Attachments")
+    parser.add_argument("--attachment-type", required=False, help="Attachment type By Default it will be GeneralAttachment. It can be one of the following type. { G...")
+    parser.add_argument("--comment", required=False, help="Comment associated with attachment")
+    parser.add_argument("--file-name", required=False, help="Attachment filename")
+    parser.add_argument("--stream", required=False, help="Base64 encoded file stream")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_test_result_attachment", pat)
+    logger.info("Create Test Result Attachment for Attachments")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_test_result_attachment(client, project, run_id, test_case_result_id, attachment_type=args.attachment_type, comment=args.comment, file_name=args.file_name, stream=args.stream)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'url'], API_VERSION)
+    print(f"Attachments ID: {data.get('id', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Attachments ID: {data.get("id", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
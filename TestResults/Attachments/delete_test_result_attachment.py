@@ -10,49 +10,74 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/test-results/attachments/delete-test-result-attachment?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-RUN_ID = get_env_or_exit("RUN_ID", "runId")
-TEST_CASE_RESULT_ID = get_env_or_exit("TEST_CASE_RESULT_ID", "testCaseResultId")
-ATTACHMENT_ID = get_env_or_exit("ATTACHMENT_ID", "attachmentId")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("delete_test_result_attachment", PAT)
-logger.info("Delete Test Result Attachment for Attachments")
+def delete_test_result_attachment(client, project: str, run_id: str, test_case_result_id: str, attachment_id: str) -> dict:
+    """
+    Delete Test Result Attachment for Attachments
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        run_id: runId
+        test_case_result_id: testCaseResultId
+        attachment_id: attachmentId
+
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/testresults/runs/{run_id}/results/{test_case_result_id}/attachments/{attachment_id}", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    response = client.request("DELETE", url)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/testresults/runs/{RUN_ID}/results/{TEST_CASE_RESULT_ID}/attachments/{ATTACHMENT_ID}", API_VERSION, project=PROJECT_ID, base_host="vstmr.dev.azure.com")
-logger.info(f"DELETE {url}")
 
-response = execute_request("DELETE", url, HEADERS)
+async def delete_test_result_attachment_async(client, project: str, run_id: str, test_case_result_id: str, attachment_id: str) -> dict:
+    """Async variant of delete_test_result_attachment() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/testresults/runs/{run_id}/results/{test_case_result_id}/attachments/{attachment_id}", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    response = await client.request("DELETE", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call delete_test_result_attachment() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    run_id = require_env("RUN_ID", "runId")
+    test_case_result_id = require_env("TEST_CASE_RESULT_ID", "testCaseResultId")
+    attachment_id = require_env("ATTACHMENT_ID", "attachmentId")
+
+    logger = AdoLogger("delete_test_result_attachment", pat)
+    logger.info("Delete Test Result Attachment for Attachments")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = delete_test_result_attachment(client, project, run_id, test_case_result_id, attachment_id)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,49 +10,81 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/test-results/attachments/get-test-result-attachment-zip?view=azure-devops-rest-7.2
 """
 
-import json
+import argparse
 import os
 import sys
+from typing import BinaryIO, Union
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.async_http_client import astream_to
+from _shared.download import download_file
+from _shared.http_client import AdoClient, build_url
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-RUN_ID = get_env_or_exit("RUN_ID", "runId")
-TEST_CASE_RESULT_ID = get_env_or_exit("TEST_CASE_RESULT_ID", "testCaseResultId")
-ATTACHMENT_ID = get_env_or_exit("ATTACHMENT_ID", "attachmentId")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_test_result_attachment_zip", PAT)
-logger.info("Returns a test result attachment")
+def get_test_result_attachment_zip(client, project: str, run_id: str, test_case_result_id: str, attachment_id: str, *, destination: Union[str, BinaryIO]) -> int:
+    """
+    Returns a test result attachment
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        run_id: runId
+        test_case_result_id: testCaseResultId
+        attachment_id: attachmentId
+        destination: Output path or binary file (e.g. sys.stdout.buffer).
+
+    Returns:
+        Bytes written. A path destination is fetched in parallel ranged
+        segments and resumes after an interruption (see _shared.download).
+    """
+    url = build_url(client.organization, f"_apis/testresults/runs/{run_id}/results/{test_case_result_id}/attachments/{attachment_id}", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    return download_file(client, url, destination, accept="application/octet-stream")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/testresults/runs/{RUN_ID}/results/{TEST_CASE_RESULT_ID}/attachments/{ATTACHMENT_ID}", API_VERSION, project=PROJECT_ID, base_host="vstmr.dev.azure.com")
-logger.info(f"GET {url}")
 
-response = execute_request("GET", url, HEADERS)
+async def get_test_result_attachment_zip_async(client, project: str, run_id: str, test_case_result_id: str, attachment_id: str, *, destination: Union[str, BinaryIO]) -> int:
+    """Async variant of get_test_result_attachment_zip() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/testresults/runs/{run_id}/results/{test_case_result_id}/attachments/{attachment_id}", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    response = await client.request("GET", url, stream=True, accept="application/octet-stream")
+    return await astream_to(response, destination)
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_test_result_attachment_zip() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    run_id = require_env("RUN_ID", "runId")
+    test_case_result_id = require_env("TEST_CASE_RESULT_ID", "testCaseResultId")
+    attachment_id = require_env("ATTACHMENT_ID", "attachmentId")
+
+    parser = argparse.ArgumentParser(description="Returns a test result attachment")
+    parser.add_argument("--output", help="Write the content to this file (default: stdout)")
+    args = parser.parse_args()
+
+    logger = AdoLogger("get_test_result_attachment_zip", pat)
+    logger.info("Returns a test result attachment")
+    client = AdoClient(organization, pat, logger=logger)
+
+    written = get_test_result_attachment_zip(client, project, run_id, test_case_result_id, attachment_id, destination=args.output or sys.stdout.buffer)
+    logger.info(f"Downloaded {written} bytes")
+    if args.output:
+        print(f"Saved {written} bytes to {args.output}")
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,65 +11,90 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/test-results/codec
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-BUILD_ID = get_env_or_exit("BUILD_ID", "buildId")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="http://(tfsserver):8080/tfs/DefaultCollection/_apis/test/CodeCoverage?buildId=10 Request: Json of code coverage summary")
-parser.add_argument("--build-flavor", required=False, help="Flavor of build for which data is retrieved/published")
-parser.add_argument("--build-platform", required=False, help="Platform of build for which data is retrieved/published")
-parser.add_argument("--coverage-stats", required=False, help="List of coverage data for the build")
-args = parser.parse_args()
+def update_codecoverage(client, project: str, build_id: str, *, build_flavor: Optional[str] = None, build_platform: Optional[str] = None, coverage_stats: Optional[str] = None) -> dict:
+    """
+    http://(tfsserver):8080/tfs/DefaultCollection/_apis/test/CodeCoverage?buildId=10 Request: Json of code coverage summary
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_codecoverage", PAT)
-logger.info("http://(tfsserver):8080/tfs/DefaultCollection/_apis/test/CodeCoverage?buildId=10 Request: Json of code coverage summary")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        build_id: buildId
+        build_flavor: Flavor of build for which data is retrieved/published
+        build_platform: Platform of build for which data is retrieved/published
+        coverage_stats: List of coverage data for the build
 
-# ---------------------------------------------------------------------------
-# Request body
-# ---------------------------------------------------------------------------
-body = {
-    "buildFlavor": args.build_flavor,
-    "buildPlatform": args.build_platform,
-    "coverageStats": args.coverage_stats,
-}
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "buildFlavor": build_flavor,
+        "buildPlatform": build_platform,
+        "coverageStats": coverage_stats,
+    }
+    url = build_url(client.organization, f"_apis/testresults/codecoverage", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/testresults/codecoverage", API_VERSION, project=PROJECT_ID, base_host="vstmr.dev.azure.com")
-logger.info(f"POST {url}")
 
-response = execute_request("POST", url, HEADERS, body=body)
+async def update_codecoverage_async(client, project: str, build_id: str, *, build_flavor: Optional[str] = None, build_platform: Optional[str] = None, coverage_stats: Optional[str] = None) -> dict:
+    """Async variant of update_codecoverage() for use with AsyncAdoClient."""
+    body = {
+        "buildFlavor": build_flavor,
+        "buildPlatform": build_platform,
+        "coverageStats": coverage_stats,
+    }
+    url = build_url(client.organization, f"_apis/testresults/codecoverage", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call update_codecoverage() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    build_id = require_env("BUILD_ID", "buildId")
+
+    parser = argparse.ArgumentParser(description="http://(tfsserver):8080/tfs/DefaultCollection/_apis/test/CodeCoverage?buildId=10 Request: Json of code coverage summary")
+    parser.add_argument("--build-flavor", required=False, help="Flavor of build for which data is retrieved/published")
+    parser.add_argument("--build-platform", required=False, help="Platform of build for which data is retrieved/published")
+    parser.add_argument("--coverage-stats", required=False, help="List of coverage data for the build")
+    args = parser.parse_args()
+
+    logger = AdoLogger("update_codecoverage", pat)
+    logger.info("http://(tfsserver):8080/tfs/DefaultCollection/_apis/test/CodeCoverage?buildId=10 Request: Json of code coverage summary")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = update_codecoverage(client, project, build_id, build_flavor=args.build_flavor, build_platform=args.build_platform, coverage_stats=args.coverage_stats)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,47 +10,70 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/test-results/extensionfields/delete?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-TEST_EXTENSION_FIELD_ID = get_env_or_exit("TEST_EXTENSION_FIELD_ID", "Custom test field id which has to be deleted.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("delete_extensionfields", PAT)
-logger.info("Returns details of the custom test field for the specified testExtensionFieldId.")
+def delete_extensionfields(client, project: str, test_extension_field_id: str) -> dict:
+    """
+    Returns details of the custom test field for the specified testExtensionFieldId.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        test_extension_field_id: Custom test field id which has to be deleted.
+
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/testresults/extensionfields/{test_extension_field_id}", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    response = client.request("DELETE", url)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/testresults/extensionfields/{TEST_EXTENSION_FIELD_ID}", API_VERSION, project=PROJECT_ID, base_host="vstmr.dev.azure.com")
-logger.info(f"DELETE {url}")
 
-response = execute_request("DELETE", url, HEADERS)
+async def delete_extensionfields_async(client, project: str, test_extension_field_id: str) -> dict:
+    """Async variant of delete_extensionfields() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/testresults/extensionfields/{test_extension_field_id}", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    response = await client.request("DELETE", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call delete_extensionfields() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    test_extension_field_id = require_env("TEST_EXTENSION_FIELD_ID", "Custom test field id which has to be deleted.")
+
+    logger = AdoLogger("delete_extensionfields", pat)
+    logger.info("Returns details of the custom test field for the specified testExtensionFieldId.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = delete_extensionfields(client, project, test_extension_field_id)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,67 +11,86 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/test-results/exten
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Returns details of the custom test field which is updated.")
-parser.add_argument("--field-id", required=False, help="Custom test field id which is to be updated.")
-parser.add_argument("--field-name", required=False, help="The name of custom field cannot be longer than 50 characters(spaces, numbers, and special charact...")
-args = parser.parse_args()
+def update_extensionfields(client, project: str, *, field_id: Optional[str] = None, field_name: Optional[str] = None) -> dict:
+    """
+    Returns details of the custom test field which is updated.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        field_id: Custom test field id which is to be updated.
+        field_name: The name of custom field cannot be longer than 50 characters(spaces, numbers, and special charact...
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "fieldId": field_id,
+        "fieldName": field_name,
+    }
+    url = build_url(client.organization, f"_apis/testresults/extensionfields", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['fieldId', 'fieldName'], API_VERSION)
+    return data
+
+
+async def update_extensionfields_async(client, project: str, *, field_id: Optional[str] = None, field_name: Optional[str] = None) -> dict:
+    """Async variant of update_extensionfields() for use with AsyncAdoClient."""
+    body = {
+        "fieldId": field_id,
+        "fieldName": field_name,
+    }
+    url = build_url(client.organization, f"_apis/testresults/extensionfields", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['fieldId', 'fieldName'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_extensionfields", PAT)
-logger.info("Returns details of the custom test field which is updated.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "fieldId": args.field_id,
-    "fieldName": args.field_name,
-}
+def main() -> None:
+    """Read env vars / flags, call update_extensionfields() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/testresults/extensionfields", API_VERSION, project=PROJECT_ID, base_host="vstmr.dev.azure.com")
-logger.info(f"PATCH {url}")
+    parser = argparse.ArgumentParser(description="Returns details of the custom test field which is updated.")
+    parser.add_argument("--field-id", required=False, help="Custom test field id which is to be updated.")
+    parser.add_argument("--field-name", required=False, help="The name of custom field cannot be longer than 50 characters(spaces, numbers, and special charact...")
+    args = parser.parse_args()
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+    logger = AdoLogger("update_extensionfields", pat)
+    logger.info("Returns details of the custom test field which is updated.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_extensionfields(client, project, field_id=args.field_id, field_name=args.field_name)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['fieldId', 'fieldName'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
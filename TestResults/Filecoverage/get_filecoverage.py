@@ -11,68 +11,97 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/test-results/filec
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import BinaryIO, Optional, Union
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.async_http_client import astream_to
+from _shared.http_client import AdoClient, build_url, stream_to
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Get file coverage for the specified file")
-parser.add_argument("--file-path", required=False, help="filePath")
-parser.add_argument("--pull-request-base-iteration-id", required=False, help="pullRequestBaseIterationId")
-parser.add_argument("--pull-request-id", required=False, help="pullRequestId")
-parser.add_argument("--pull-request-iteration-id", required=False, help="pullRequestIterationId")
-parser.add_argument("--repo-id", required=False, help="repoId")
-args = parser.parse_args()
+def get_filecoverage(client, project: str, *, file_path: Optional[str] = None, pull_request_base_iteration_id: Optional[str] = None, pull_request_id: Optional[str] = None, pull_request_iteration_id: Optional[str] = None, repo_id: Optional[str] = None, destination: Union[str, BinaryIO]) -> int:
+    """
+    Get file coverage for the specified file
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_filecoverage", PAT)
-logger.info("Get file coverage for the specified file")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        file_path: filePath
+        pull_request_base_iteration_id: pullRequestBaseIterationId
+        pull_request_id: pullRequestId
+        pull_request_iteration_id: pullRequestIterationId
+        repo_id: repoId
+        destination: Output path or binary file (e.g. sys.stdout.buffer).
 
-# ---------------------------------------------------------------------------
-# Request body
-# ---------------------------------------------------------------------------
-body = {
-    "filePath": args.file_path,
-    "pullRequestBaseIterationId": args.pull_request_base_iteration_id,
-    "pullRequestId": args.pull_request_id,
-    "pullRequestIterationId": args.pull_request_iteration_id,
-    "repoId": args.repo_id,
-}
+    Returns:
+        Bytes written; the text/plain body is streamed in constant memory.
+    """
+    body = {
+        "filePath": file_path,
+        "pullRequestBaseIterationId": pull_request_base_iteration_id,
+        "pullRequestId": pull_request_id,
+        "pullRequestIterationId": pull_request_iteration_id,
+        "repoId": repo_id,
+    }
+    url = build_url(client.organization, f"_apis/testresults/codecoverage/filecoverage", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    response = client.request("POST", url, body=body, stream=True, accept="text/plain")
+    return stream_to(response, destination)
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/testresults/codecoverage/filecoverage", API_VERSION, project=PROJECT_ID, base_host="vstmr.dev.azure.com")
-logger.info(f"POST {url}")
 
-response = execute_request("POST", url, HEADERS, body=body)
+async def get_filecoverage_async(client, project: str, *, file_path: Optional[str] = None, pull_request_base_iteration_id: Optional[str] = None, pull_request_id: Optional[str] = None, pull_request_iteration_id: Optional[str] = None, repo_id: Optional[str] = None, destination: Union[str, BinaryIO]) -> int:
+    """Async variant of get_filecoverage() for use with AsyncAdoClient."""
+    body = {
+        "filePath": file_path,
+        "pullRequestBaseIterationId": pull_request_base_iteration_id,
+        "pullRequestId": pull_request_id,
+        "pullRequestIterationId": pull_request_iteration_id,
+        "repoId": repo_id,
+    }
+    url = build_url(client.organization, f"_apis/testresults/codecoverage/filecoverage", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    response = await client.request("POST", url, body=body, stream=True, accept="text/plain")
+    return await astream_to(response, destination)
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_filecoverage() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+
+    parser = argparse.ArgumentParser(description="Get file coverage for the specified file")
+    parser.add_argument("--file-path", required=False, help="filePath")
+    parser.add_argument("--pull-request-base-iteration-id", required=False, help="pullRequestBaseIterationId")
+    parser.add_argument("--pull-request-id", required=False, help="pullRequestId")
+    parser.add_argument("--pull-request-iteration-id", required=False, help="pullRequestIterationId")
+    parser.add_argument("--repo-id", required=False, help="repoId")
+    parser.add_argument("--output", help="Write the content to this file (default: stdout)")
+    args = parser.parse_args()
+
+    logger = AdoLogger("get_filecoverage", pat)
+    logger.info("Get file coverage for the specified file")
+    client = AdoClient(organization, pat, logger=logger)
+
+    written = get_filecoverage(client, project, file_path=args.file_path, pull_request_base_iteration_id=args.pull_request_base_iteration_id, pull_request_id=args.pull_request_id, pull_request_iteration_id=args.pull_request_iteration_id, repo_id=args.repo_id, destination=args.output or sys.stdout.buffer)
+    logger.info(f"Downloaded {written} bytes")
+    if args.output:
+        print(f"Saved {written} bytes to {args.output}")
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,75 +11,102 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/test-results/histo
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Query for History")
-parser.add_argument("--automated-test-name", required=False, help="automatedTestName")
-parser.add_argument("--branch", required=False, help="branch")
-parser.add_argument("--executed-in", required=False, help="executedIn")
-parser.add_argument("--group-by", required=False, help="groupBy")
-parser.add_argument("--max-complete-date", required=False, help="maxCompleteDate")
-parser.add_argument("--results-count", required=False, help="resultsCount")
-args = parser.parse_args()
+def query_history(client, project: str, *, automated_test_name: Optional[str] = None, branch: Optional[str] = None, executed_in: Optional[str] = None, group_by: Optional[str] = None, max_complete_date: Optional[str] = None, results_count: Optional[str] = None) -> dict:
+    """
+    Query for History
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        automated_test_name: automatedTestName
+        branch: branch
+        executed_in: executedIn
+        group_by: groupBy
+        max_complete_date: maxCompleteDate
+        results_count: resultsCount
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "automatedTestName": automated_test_name,
+        "branch": branch,
+        "executedIn": executed_in,
+        "groupBy": group_by,
+        "maxCompleteDate": max_complete_date,
+        "resultsCount": results_count,
+    }
+    url = build_url(client.organization, f"_apis/testresults/results/history", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['groupByField', 'resultsForGroup'], API_VERSION)
+    return data
+
+
+async def query_history_async(client, project: str, *, automated_test_name: Optional[str] = None, branch: Optional[str] = None, executed_in: Optional[str] = None, group_by: Optional[str] = None, max_complete_date: Optional[str] = None, results_count: Optional[str] = None) -> dict:
+    """Async variant of query_history() for use with AsyncAdoClient."""
+    body = {
+        "automatedTestName": automated_test_name,
+        "branch": branch,
+        "executedIn": executed_in,
+        "groupBy": group_by,
+        "maxCompleteDate": max_complete_date,
+        "resultsCount": results_count,
+    }
+    url = build_url(client.organization, f"_apis/testresults/results/history", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['groupByField', 'resultsForGroup'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("query_history", PAT)
-logger.info("Query for History")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "automatedTestName": args.automated_test_name,
-    "branch": args.branch,
-    "executedIn": args.executed_in,
-    "groupBy": args.group_by,
-    "maxCompleteDate": args.max_complete_date,
-    "resultsCount": args.results_count,
-}
+def main() -> None:
+    """Read env vars / flags, call query_history() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/testresults/results/history", API_VERSION, project=PROJECT_ID, base_host="vstmr.dev.azure.com")
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Query for History")
+    parser.add_argument("--automated-test-name", required=False, help="automatedTestName")
+    parser.add_argument("--branch", required=False, help="branch")
+    parser.add_argument("--executed-in", required=False, help="executedIn")
+    parser.add_argument("--group-by", required=False, help="groupBy")
+    parser.add_argument("--max-complete-date", required=False, help="maxCompleteDate")
+    parser.add_argument("--results-count", required=False, help="resultsCount")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("query_history", pat)
+    logger.info("Query for History")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = query_history(client, project, automated_test_name=args.automated_test_name, branch=args.branch, executed_in=args.executed_in, group_by=args.group_by, max_complete_date=args.max_complete_date, results_count=args.results_count)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['groupByField', 'resultsForGroup'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
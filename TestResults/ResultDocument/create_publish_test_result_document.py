@@ -11,68 +11,88 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/test-results/resul
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-RUN_ID = get_env_or_exit("RUN_ID", "runId")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Publish Test Result Document for Result Document")
-parser.add_argument("--operation-reference", required=False, help="operationReference")
-parser.add_argument("--payload", required=False, help="payload")
-args = parser.parse_args()
+def create_publish_test_result_document(client, project: str, run_id: str, *, operation_reference: Optional[str] = None, payload: Optional[str] = None) -> dict:
+    """
+    Publish Test Result Document for Result Document
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        run_id: runId
+        operation_reference: operationReference
+        payload: payload
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "operationReference": operation_reference,
+        "payload": payload,
+    }
+    url = build_url(client.organization, f"_apis/testresults/runs/{run_id}/resultdocument", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['operationReference', 'payload'], API_VERSION)
+    return data
+
+
+async def create_publish_test_result_document_async(client, project: str, run_id: str, *, operation_reference: Optional[str] = None, payload: Optional[str] = None) -> dict:
+    """Async variant of create_publish_test_result_document() for use with AsyncAdoClient."""
+    body = {
+        "operationReference": operation_reference,
+        "payload": payload,
+    }
+    url = build_url(client.organization, f"_apis/testresults/runs/{run_id}/resultdocument", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['operationReference', 'payload'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_publish_test_result_document", PAT)
-logger.info("Publish Test Result Document for Result Document")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "operationReference": args.operation_reference,
-    "payload": args.payload,
-}
+def main() -> None:
+    """Read env vars / flags, call create_publish_test_result_document() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    run_id = require_env("RUN_ID", "runId")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/testresults/runs/{RUN_ID}/resultdocument", API_VERSION, project=PROJECT_ID, base_host="vstmr.dev.azure.com")
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Publish Test Result Document for Result Document")
+    parser.add_argument("--operation-reference", required=False, help="operationReference")
+    parser.add_argument("--payload", required=False, help="payload")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_publish_test_result_document", pat)
+    logger.info("Publish Test Result Document for Result Document")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_publish_test_result_document(client, project, run_id, operation_reference=args.operation_reference, payload=args.payload)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['operationReference', 'payload'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,66 +11,84 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/test-results/resul
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-TEST_CASE_REFERENCE_ID = get_env_or_exit("TEST_CASE_REFERENCE_ID", "TestCaseReference Id of Test Result to be updated.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Update properties of test result meta data")
-parser.add_argument("--flaky-identifiers", required=False, help="List of Flaky Identifiers")
-args = parser.parse_args()
+def update_result_meta_data(client, project: str, test_case_reference_id: str, *, flaky_identifiers: Optional[str] = None) -> dict:
+    """
+    Update properties of test result meta data
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        test_case_reference_id: TestCaseReference Id of Test Result to be updated.
+        flaky_identifiers: List of Flaky Identifiers
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "flakyIdentifiers": flaky_identifiers,
+    }
+    url = build_url(client.organization, f"_apis/testresults/results/resultmetadata/{test_case_reference_id}", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['automatedTestName', 'automatedTestStorage'], API_VERSION)
+    return data
+
+
+async def update_result_meta_data_async(client, project: str, test_case_reference_id: str, *, flaky_identifiers: Optional[str] = None) -> dict:
+    """Async variant of update_result_meta_data() for use with AsyncAdoClient."""
+    body = {
+        "flakyIdentifiers": flaky_identifiers,
+    }
+    url = build_url(client.organization, f"_apis/testresults/results/resultmetadata/{test_case_reference_id}", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['automatedTestName', 'automatedTestStorage'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_result_meta_data", PAT)
-logger.info("Update properties of test result meta data")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "flakyIdentifiers": args.flaky_identifiers,
-}
+def main() -> None:
+    """Read env vars / flags, call update_result_meta_data() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    test_case_reference_id = require_env("TEST_CASE_REFERENCE_ID", "TestCaseReference Id of Test Result to be updated.")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/testresults/results/resultmetadata/{TEST_CASE_REFERENCE_ID}", API_VERSION, project=PROJECT_ID, base_host="vstmr.dev.azure.com")
-logger.info(f"PATCH {url}")
+    parser = argparse.ArgumentParser(description="Update properties of test result meta data")
+    parser.add_argument("--flaky-identifiers", required=False, help="List of Flaky Identifiers")
+    args = parser.parse_args()
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+    logger = AdoLogger("update_result_meta_data", pat)
+    logger.info("Update properties of test result meta data")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_result_meta_data(client, project, test_case_reference_id, flaky_identifiers=args.flaky_identifiers)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['automatedTestName', 'automatedTestStorage'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,70 +11,108 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/test-results/resul
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Query for Result Trend By Build")
-parser.add_argument("--branch-names", required=False, help="branchNames")
-parser.add_argument("--build-count", required=False, help="buildCount")
-parser.add_argument("--definition-ids", required=False, help="definitionIds")
-parser.add_argument("--env-definition-ids", required=False, help="envDefinitionIds")
-parser.add_argument("--max-complete-date", required=False, help="maxCompleteDate")
-parser.add_argument("--publish-context", required=False, help="publishContext")
-args = parser.parse_args()
+def query_result_trend_by_build(client, project: str, *, branch_names: Optional[str] = None, build_count: Optional[str] = None, definition_ids: Optional[str] = None, env_definition_ids: Optional[str] = None, max_complete_date: Optional[str] = None, publish_context: Optional[str] = None) -> dict:
+    """
+    Query for Result Trend By Build
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("query_result_trend_by_build", PAT)
-logger.info("Query for Result Trend By Build")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        branch_names: branchNames
+        build_count: buildCount
+        definition_ids: definitionIds
+        env_definition_ids: envDefinitionIds
+        max_complete_date: maxCompleteDate
+        publish_context: publishContext
 
-# ---------------------------------------------------------------------------
-# Request body
-# ---------------------------------------------------------------------------
-body = {
-    "branchNames": args.branch_names,
-    "buildCount": args.build_count,
-    "definitionIds": args.definition_ids,
-    "envDefinitionIds": args.env_definition_ids,
-    "maxCompleteDate": args.max_complete_date,
-    "publishContext": args.publish_context,
-}
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "branchNames": branch_names,
+        "buildCount": build_count,
+        "definitionIds": definition_ids,
+        "envDefinitionIds": env_definition_ids,
+        "maxCompleteDate": max_complete_date,
+        "publishContext": publish_context,
+    }
+    url = build_url(client.organization, f"_apis/testresults/resulttrendbybuild", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/testresults/resulttrendbybuild", API_VERSION, project=PROJECT_ID, base_host="vstmr.dev.azure.com")
-logger.info(f"POST {url}")
 
-response = execute_request("POST", url, HEADERS, body=body)
+async def query_result_trend_by_build_async(client, project: str, *, branch_names: Optional[str] = None, build_count: Optional[str] = None, definition_ids: Optional[str] = None, env_definition_ids: Optional[str] = None, max_complete_date: Optional[str] = None, publish_context: Optional[str] = None) -> dict:
+    """Async variant of query_result_trend_by_build() for use with AsyncAdoClient."""
+    body = {
+        "branchNames": branch_names,
+        "buildCount": build_count,
+        "definitionIds": definition_ids,
+        "envDefinitionIds": env_definition_ids,
+        "maxCompleteDate": max_complete_date,
+        "publishContext": publish_context,
+    }
+    url = build_url(client.organization, f"_apis/testresults/resulttrendbybuild", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call query_result_trend_by_build() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+
+    parser = argparse.ArgumentParser(description="Query for Result Trend By Build")
+    parser.add_argument("--branch-names", required=False, help="branchNames")
+    parser.add_argument("--build-count", required=False, help="buildCount")
+    parser.add_argument("--definition-ids", required=False, help="definitionIds")
+    parser.add_argument("--env-definition-ids", required=False, help="envDefinitionIds")
+    parser.add_argument("--max-complete-date", required=False, help="maxCompleteDate")
+    parser.add_argument("--publish-context", required=False, help="publishContext")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("query_result_trend_by_build", pat)
+    logger.info("Query for Result Trend By Build")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        items = items_of(query_result_trend_by_build(client, project, branch_names=args.branch_names, build_count=args.build_count, definition_ids=args.definition_ids, env_definition_ids=args.env_definition_ids, max_complete_date=args.max_complete_date, publish_context=args.publish_context), "value")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    data = query_result_trend_by_build(client, project, branch_names=args.branch_names, build_count=args.build_count, definition_ids=args.definition_ids, env_definition_ids=args.env_definition_ids, max_complete_date=args.max_complete_date, publish_context=args.publish_context)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,53 +10,74 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/test-results/resultdetailsbyrelease/get?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-RELEASE_ID = get_env_or_exit("RELEASE_ID", "releaseId")
-RELEASE_ENV_ID = get_env_or_exit("RELEASE_ENV_ID", "releaseEnvId")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_resultdetailsbyrelease", PAT)
-logger.info("Get for Resultdetailsbyrelease")
+def get_resultdetailsbyrelease(client, project: str, release_id: str, release_env_id: str) -> dict:
+    """
+    Get for Resultdetailsbyrelease
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/testresults/resultdetailsbyrelease", API_VERSION, project=PROJECT_ID, base_host="vstmr.dev.azure.com")
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        release_id: releaseId
+        release_env_id: releaseEnvId
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/testresults/resultdetailsbyrelease", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    response = client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['groupByField', 'resultsForGroup'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['groupByField', 'resultsForGroup'], API_VERSION)
+async def get_resultdetailsbyrelease_async(client, project: str, release_id: str, release_env_id: str) -> dict:
+    """Async variant of get_resultdetailsbyrelease() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/testresults/resultdetailsbyrelease", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['groupByField', 'resultsForGroup'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_resultdetailsbyrelease() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    release_id = require_env("RELEASE_ID", "releaseId")
+    release_env_id = require_env("RELEASE_ENV_ID", "releaseEnvId")
+
+    logger = AdoLogger("get_resultdetailsbyrelease", pat)
+    logger.info("Get for Resultdetailsbyrelease")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = get_resultdetailsbyrelease(client, project, release_id, release_env_id)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
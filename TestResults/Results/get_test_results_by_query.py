@@ -11,69 +11,90 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/test-results/resul
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Get Test Results By Query for Results")
-parser.add_argument("--fields", required=False, help="fields")
-parser.add_argument("--results", required=False, help="results")
-parser.add_argument("--results-filter", required=False, help="resultsFilter")
-args = parser.parse_args()
+def get_test_results_by_query(client, project: str, *, fields: Optional[str] = None, results: Optional[str] = None, results_filter: Optional[str] = None) -> dict:
+    """
+    Get Test Results By Query for Results
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        fields: fields
+        results: results
+        results_filter: resultsFilter
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "fields": fields,
+        "results": results,
+        "resultsFilter": results_filter,
+    }
+    url = build_url(client.organization, f"_apis/testresults/results", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['fields', 'results'], API_VERSION)
+    return data
+
+
+async def get_test_results_by_query_async(client, project: str, *, fields: Optional[str] = None, results: Optional[str] = None, results_filter: Optional[str] = None) -> dict:
+    """Async variant of get_test_results_by_query() for use with AsyncAdoClient."""
+    body = {
+        "fields": fields,
+        "results": results,
+        "resultsFilter": results_filter,
+    }
+    url = build_url(client.organization, f"_apis/testresults/results", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['fields', 'results'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_test_results_by_query", PAT)
-logger.info("Get Test Results By Query for Results")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "fields": args.fields,
-    "results": args.results,
-    "resultsFilter": args.results_filter,
-}
+def main() -> None:
+    """Read env vars / flags, call get_test_results_by_query() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/testresults/results", API_VERSION, project=PROJECT_ID, base_host="vstmr.dev.azure.com")
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Get Test Results By Query for Results")
+    parser.add_argument("--fields", required=False, help="fields")
+    parser.add_argument("--results", required=False, help="results")
+    parser.add_argument("--results-filter", required=False, help="resultsFilter")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("get_test_results_by_query", pat)
+    logger.info("Get Test Results By Query for Results")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = get_test_results_by_query(client, project, fields=args.fields, results=args.results, results_filter=args.results_filter)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['fields', 'results'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,60 +11,114 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/test-results/resul
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Iterator, Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
+from _shared.pagination import paginate
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Get Test Results By Query Wiql for Results")
-parser.add_argument("--query", required=False, help="query")
-args = parser.parse_args()
+def get_test_results_by_query_wiql(client, project: str, *, query: Optional[str] = None) -> dict:
+    """
+    Get Test Results By Query Wiql for Results
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_test_results_by_query_wiql", PAT)
-logger.info("Get Test Results By Query Wiql for Results")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        query: query
 
-# ---------------------------------------------------------------------------
-# Request body
-# ---------------------------------------------------------------------------
-body = {
-    "query": args.query,
-}
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "query": query,
+    }
+    url = build_url(client.organization, f"_apis/testresults/results/query", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
+
+
+async def get_test_results_by_query_wiql_async(client, project: str, *, query: Optional[str] = None) -> dict:
+    """Async variant of get_test_results_by_query_wiql() for use with AsyncAdoClient."""
+    body = {
+        "query": query,
+    }
+    url = build_url(client.organization, f"_apis/testresults/results/query", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/testresults/results/query", API_VERSION, project=PROJECT_ID, base_host="vstmr.dev.azure.com")
-logger.info(f"POST {url}")
 
-response = execute_request("POST", url, HEADERS, body=body)
+def iter_get_test_results_by_query_wiql(client, project: str, *, query: Optional[str] = None, max_items: Optional[int] = None, prefetch: bool = False) -> Iterator[dict]:
+    """
+    Yield every item across all pages of get_test_results_by_query_wiql() (top_skip paging).
+
+    Takes the same arguments, plus:
+        max_items: Stop after this many items (default: all).
+        prefetch: Fetch the next page while the current one is consumed.
+    """
+    body = {
+        "query": query,
+    }
+    url = build_url(client.organization, f"_apis/testresults/results/query", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    return paginate(client, "POST", url, "top_skip", body=body,
+                    max_items=max_items, prefetch=prefetch)
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_test_results_by_query_wiql() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+
+    parser = argparse.ArgumentParser(description="Get Test Results By Query Wiql for Results")
+    parser.add_argument("--query", required=False, help="query")
+    parser.add_argument("--all-pages", action="store_true", help="Follow pagination and return every item")
+    parser.add_argument("--max-items", type=int, help="Follow pagination up to this many items")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("get_test_results_by_query_wiql", pat)
+    logger.info("Get Test Results By Query Wiql for Results")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        if args.all_pages or args.max_items:
+            items = iter_get_test_results_by_query_wiql(client, project, query=args.query, max_items=args.max_items, prefetch=True)
+        else:
+            items = items_of(get_test_results_by_query_wiql(client, project, query=args.query), "value")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    if args.all_pages or args.max_items:
+        items = list(iter_get_test_results_by_query_wiql(client, project, query=args.query, max_items=args.max_items, prefetch=True))
+        data = {"count": len(items), "value": items}
+    else:
+        data = get_test_results_by_query_wiql(client, project, query=args.query)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,66 +11,100 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/test-results/resul
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Query for Resultsummarybyrequirement")
-parser.add_argument("--build", required=False, help="build")
-parser.add_argument("--context-type", required=False, help="contextType")
-parser.add_argument("--pipeline-reference", required=False, help="pipelineReference")
-parser.add_argument("--release", required=False, help="release")
-args = parser.parse_args()
+def query_resultsummarybyrequirement(client, project: str, *, build: Optional[str] = None, context_type: Optional[str] = None, pipeline_reference: Optional[str] = None, release: Optional[str] = None) -> dict:
+    """
+    Query for Resultsummarybyrequirement
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("query_resultsummarybyrequirement", PAT)
-logger.info("Query for Resultsummarybyrequirement")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        build: build
+        context_type: contextType
+        pipeline_reference: pipelineReference
+        release: release
 
-# ---------------------------------------------------------------------------
-# Request body
-# ---------------------------------------------------------------------------
-body = {
-    "build": args.build,
-    "contextType": args.context_type,
-    "pipelineReference": args.pipeline_reference,
-    "release": args.release,
-}
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "build": build,
+        "contextType": context_type,
+        "pipelineReference": pipeline_reference,
+        "release": release,
+    }
+    url = build_url(client.organization, f"_apis/testresults/resultsummarybyrequirement", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/testresults/resultsummarybyrequirement", API_VERSION, project=PROJECT_ID, base_host="vstmr.dev.azure.com")
-logger.info(f"POST {url}")
 
-response = execute_request("POST", url, HEADERS, body=body)
+async def query_resultsummarybyrequirement_async(client, project: str, *, build: Optional[str] = None, context_type: Optional[str] = None, pipeline_reference: Optional[str] = None, release: Optional[str] = None) -> dict:
+    """Async variant of query_resultsummarybyrequirement() for use with AsyncAdoClient."""
+    body = {
+        "build": build,
+        "contextType": context_type,
+        "pipelineReference": pipeline_reference,
+        "release": release,
+    }
+    url = build_url(client.organization, f"_apis/testresults/resultsummarybyrequirement", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call query_resultsummarybyrequirement() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+
+    parser = argparse.ArgumentParser(description="Query for Resultsummarybyrequirement")
+    parser.add_argument("--build", required=False, help="build")
+    parser.add_argument("--context-type", required=False, help="contextType")
+    parser.add_argument("--pipeline-reference", required=False, help="pipelineReference")
+    parser.add_argument("--release", required=False, help="release")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("query_resultsummarybyrequirement", pat)
+    logger.info("Query for Resultsummarybyrequirement")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        items = items_of(query_resultsummarybyrequirement(client, project, build=args.build, context_type=args.context_type, pipeline_reference=args.pipeline_reference, release=args.release), "value")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    data = query_resultsummarybyrequirement(client, project, build=args.build, context_type=args.context_type, pipeline_reference=args.pipeline_reference, release=args.release)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
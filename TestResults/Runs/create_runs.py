@@ -11,75 +11,102 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/test-results/runs/
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Create for Runs")
-parser.add_argument("--automated", required=False, help="true if test run is automated, false otherwise. By default it will be false.")
-parser.add_argument("--build", required=False, help="An abstracted reference to the build that it belongs.")
-parser.add_argument("--build-drop-location", required=False, help="Drop location of the build used for test run.")
-parser.add_argument("--build-flavor", required=False, help="Flavor of the build used for test run. (E.g: Release, Debug)")
-parser.add_argument("--build-platform", required=False, help="Platform of the build used for test run. (E.g.: x86, amd64)")
-parser.add_argument("--build-reference", required=False, help="BuildReference of the test run.")
-args = parser.parse_args()
+def create_runs(client, project: str, *, automated: Optional[str] = None, build: Optional[str] = None, build_drop_location: Optional[str] = None, build_flavor: Optional[str] = None, build_platform: Optional[str] = None, build_reference: Optional[str] = None) -> dict:
+    """
+    Create for Runs
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        automated: true if test run is automated, false otherwise. By default it will be false.
+        build: An abstracted reference to the build that it belongs.
+        build_drop_location: Drop location of the build used for test run.
+        build_flavor: Flavor of the build used for test run. (E.g: Release, Debug)
+        build_platform: Platform of the build used for test run. (E.g.: x86, amd64)
+        build_reference: BuildReference of the test run.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "automated": automated,
+        "build": build,
+        "buildDropLocation": build_drop_location,
+        "buildFlavor": build_flavor,
+        "buildPlatform": build_platform,
+        "buildReference": build_reference,
+    }
+    url = build_url(client.organization, f"_apis/testresults/runs", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name', 'build'], API_VERSION)
+    return data
+
+
+async def create_runs_async(client, project: str, *, automated: Optional[str] = None, build: Optional[str] = None, build_drop_location: Optional[str] = None, build_flavor: Optional[str] = None, build_platform: Optional[str] = None, build_reference: Optional[str] = None) -> dict:
+    """Async variant of create_runs() for use with AsyncAdoClient."""
+    body = {
+        "automated": automated,
+        "build": build,
+        "buildDropLocation": build_drop_location,
+        "buildFlavor": build_flavor,
+        "buildPlatform": build_platform,
+        "buildReference": build_reference,
+    }
+    url = build_url(client.organization, f"_apis/testresults/runs", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name', 'build'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_runs", PAT)
-logger.info("Create for Runs")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "automated": args.automated,
-    "build": args.build,
-    "buildDropLocation": args.build_drop_location,
-    "buildFlavor": args.build_flavor,
-    "buildPlatform": args.build_platform,
-    "buildReference": args.build_reference,
-}
+def main() -> None:
+    """Read env vars / flags, call create_runs() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/testresults/runs", API_VERSION, project=PROJECT_ID, base_host="vstmr.dev.azure.com")
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Create for Runs")
+    parser.add_argument("--automated", required=False, help="true if test run is automated, false otherwise. By default it will be false.")
+    parser.add_argument("--build", required=False, help="An abstracted reference to the build that it belongs.")
+    parser.add_argument("--build-drop-location", required=False, help="Drop location of the build used for test run.")
+    parser.add_argument("--build-flavor", required=False, help="Flavor of the build used for test run. (E.g: Release, Debug)")
+    parser.add_argument("--build-platform", required=False, help="Platform of the build used for test run. (E.g.: x86, amd64)")
+    parser.add_argument("--build-reference", required=False, help="BuildReference of the test run.")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_runs", pat)
+    logger.info("Create for Runs")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_runs(client, project, automated=args.automated, build=args.build, build_drop_location=args.build_drop_location, build_flavor=args.build_flavor, build_platform=args.build_platform, build_reference=args.build_reference)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'name', 'build'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
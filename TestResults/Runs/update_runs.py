@@ -11,76 +11,104 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/test-results/runs/
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-RUN_ID = get_env_or_exit("RUN_ID", "runId")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Update for Runs")
-parser.add_argument("--build", required=False, help="An abstracted reference to the build that it belongs.")
-parser.add_argument("--build-drop-location", required=False, help="Drop location of the build used for test run.")
-parser.add_argument("--build-flavor", required=False, help="Flavor of the build used for test run. (E.g: Release, Debug)")
-parser.add_argument("--build-platform", required=False, help="Platform of the build used for test run. (E.g.: x86, amd64)")
-parser.add_argument("--comment", required=False, help="Comments entered by those analyzing the run.")
-parser.add_argument("--completed-date", required=False, help="Completed date time of the run.")
-args = parser.parse_args()
+def update_runs(client, project: str, run_id: str, *, build: Optional[str] = None, build_drop_location: Optional[str] = None, build_flavor: Optional[str] = None, build_platform: Optional[str] = None, comment: Optional[str] = None, completed_date: Optional[str] = None) -> dict:
+    """
+    Update for Runs
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        run_id: runId
+        build: An abstracted reference to the build that it belongs.
+        build_drop_location: Drop location of the build used for test run.
+        build_flavor: Flavor of the build used for test run. (E.g: Release, Debug)
+        build_platform: Platform of the build used for test run. (E.g.: x86, amd64)
+        comment: Comments entered by those analyzing the run.
+        completed_date: Completed date time of the run.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "build": build,
+        "buildDropLocation": build_drop_location,
+        "buildFlavor": build_flavor,
+        "buildPlatform": build_platform,
+        "comment": comment,
+        "completedDate": completed_date,
+    }
+    url = build_url(client.organization, f"_apis/testresults/runs/{run_id}", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name', 'build'], API_VERSION)
+    return data
+
+
+async def update_runs_async(client, project: str, run_id: str, *, build: Optional[str] = None, build_drop_location: Optional[str] = None, build_flavor: Optional[str] = None, build_platform: Optional[str] = None, comment: Optional[str] = None, completed_date: Optional[str] = None) -> dict:
+    """Async variant of update_runs() for use with AsyncAdoClient."""
+    body = {
+        "build": build,
+        "buildDropLocation": build_drop_location,
+        "buildFlavor": build_flavor,
+        "buildPlatform": build_platform,
+        "comment": comment,
+        "completedDate": completed_date,
+    }
+    url = build_url(client.organization, f"_apis/testresults/runs/{run_id}", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name', 'build'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_runs", PAT)
-logger.info("Update for Runs")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "build": args.build,
-    "buildDropLocation": args.build_drop_location,
-    "buildFlavor": args.build_flavor,
-    "buildPlatform": args.build_platform,
-    "comment": args.comment,
-    "completedDate": args.completed_date,
-}
+def main() -> None:
+    """Read env vars / flags, call update_runs() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    run_id = require_env("RUN_ID", "runId")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/testresults/runs/{RUN_ID}", API_VERSION, project=PROJECT_ID, base_host="vstmr.dev.azure.com")
-logger.info(f"PATCH {url}")
+    parser = argparse.ArgumentParser(description="Update for Runs")
+    parser.add_argument("--build", required=False, help="An abstracted reference to the build that it belongs.")
+    parser.add_argument("--build-drop-location", required=False, help="Drop location of the build used for test run.")
+    parser.add_argument("--build-flavor", required=False, help="Flavor of the build used for test run. (E.g: Release, Debug)")
+    parser.add_argument("--build-platform", required=False, help="Platform of the build used for test run. (E.g.: x86, amd64)")
+    parser.add_argument("--comment", required=False, help="Comments entered by those analyzing the run.")
+    parser.add_argument("--completed-date", required=False, help="Completed date time of the run.")
+    args = parser.parse_args()
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+    logger = AdoLogger("update_runs", pat)
+    logger.info("Update for Runs")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_runs(client, project, run_id, build=args.build, build_drop_location=args.build_drop_location, build_flavor=args.build_flavor, build_platform=args.build_platform, comment=args.comment, completed_date=args.completed_date)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'name', 'build'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
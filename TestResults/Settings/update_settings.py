@@ -11,69 +11,90 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/test-results/setti
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Update project settings of test results")
-parser.add_argument("--advanced-flaky-detection-settings", required=False, help="Advanced system flaky detection settings Contains parameter configurations for failure rate, pass...")
-parser.add_argument("--flaky-settings", required=False, help="FlakySettings defines Flaky Settings Data.")
-parser.add_argument("--new-test-result-logging-settings", required=False, help="NewTestResultLoggingSettings defines the setting for logging new test results")
-args = parser.parse_args()
+def update_settings(client, project: str, *, advanced_flaky_detection_settings: Optional[str] = None, flaky_settings: Optional[str] = None, new_test_result_logging_settings: Optional[str] = None) -> dict:
+    """
+    Update project settings of test results
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        advanced_flaky_detection_settings: Advanced system flaky detection settings Contains parameter configurations for failure rate, pass...
+        flaky_settings: FlakySettings defines Flaky Settings Data.
+        new_test_result_logging_settings: NewTestResultLoggingSettings defines the setting for logging new test results
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "advancedFlakyDetectionSettings": advanced_flaky_detection_settings,
+        "flakySettings": flaky_settings,
+        "newTestResultLoggingSettings": new_test_result_logging_settings,
+    }
+    url = build_url(client.organization, f"_apis/testresults/settings", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['advancedFlakyDetectionSettings', 'flakySettings'], API_VERSION)
+    return data
+
+
+async def update_settings_async(client, project: str, *, advanced_flaky_detection_settings: Optional[str] = None, flaky_settings: Optional[str] = None, new_test_result_logging_settings: Optional[str] = None) -> dict:
+    """Async variant of update_settings() for use with AsyncAdoClient."""
+    body = {
+        "advancedFlakyDetectionSettings": advanced_flaky_detection_settings,
+        "flakySettings": flaky_settings,
+        "newTestResultLoggingSettings": new_test_result_logging_settings,
+    }
+    url = build_url(client.organization, f"_apis/testresults/settings", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['advancedFlakyDetectionSettings', 'flakySettings'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_settings", PAT)
-logger.info("Update project settings of test results")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "advancedFlakyDetectionSettings": args.advanced_flaky_detection_settings,
-    "flakySettings": args.flaky_settings,
-    "newTestResultLoggingSettings": args.new_test_result_logging_settings,
-}
+def main() -> None:
+    """Read env vars / flags, call update_settings() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/testresults/settings", API_VERSION, project=PROJECT_ID, base_host="vstmr.dev.azure.com")
-logger.info(f"PATCH {url}")
+    parser = argparse.ArgumentParser(description="Update project settings of test results")
+    parser.add_argument("--advanced-flaky-detection-settings", required=False, help="Advanced system flaky detection settings Contains parameter configurations for failure rate, pass...")
+    parser.add_argument("--flaky-settings", required=False, help="FlakySettings defines Flaky Settings Data.")
+    parser.add_argument("--new-test-result-logging-settings", required=False, help="NewTestResultLoggingSettings defines the setting for logging new test results")
+    args = parser.parse_args()
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+    logger = AdoLogger("update_settings", pat)
+    logger.info("Update project settings of test results")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_settings(client, project, advanced_flaky_detection_settings=args.advanced_flaky_detection_settings, flaky_settings=args.flaky_settings, new_test_result_logging_settings=args.new_test_result_logging_settings)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['advancedFlakyDetectionSettings', 'flakySettings'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
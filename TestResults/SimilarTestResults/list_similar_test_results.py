@@ -10,49 +10,86 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/test-results/similar-test-results/list?view=azure-devops-rest-7.2
 """
 
-import json
+import argparse
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-RUN_ID = get_env_or_exit("RUN_ID", "id of test run")
-TEST_RESULT_ID = get_env_or_exit("TEST_RESULT_ID", "id of test result inside a test run")
-TEST_SUB_RESULT_ID = get_env_or_exit("TEST_SUB_RESULT_ID", "id of subresult inside a test result")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("list_similar_test_results", PAT)
-logger.info("Gets the list of results whose failure matches with the provided one.")
+def list_similar_test_results(client, project: str, run_id: str, test_result_id: str, test_sub_result_id: str) -> dict:
+    """
+    Gets the list of results whose failure matches with the provided one.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/testresults/runs/{RUN_ID}/results/{TEST_RESULT_ID}/similartestresults", API_VERSION, project=PROJECT_ID, base_host="vstmr.dev.azure.com")
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        run_id: id of test run
+        test_result_id: id of test result inside a test run
+        test_sub_result_id: id of subresult inside a test result
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/testresults/runs/{run_id}/results/{test_result_id}/similartestresults", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    response = client.request("GET", url)
+    data = loads(response.content)
+    return data
+
+
+async def list_similar_test_results_async(client, project: str, run_id: str, test_result_id: str, test_sub_result_id: str) -> dict:
+    """Async variant of list_similar_test_results() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/testresults/runs/{run_id}/results/{test_result_id}/similartestresults", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call list_similar_test_results() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    run_id = require_env("RUN_ID", "id of test run")
+    test_result_id = require_env("TEST_RESULT_ID", "id of test result inside a test run")
+    test_sub_result_id = require_env("TEST_SUB_RESULT_ID", "id of subresult inside a test result")
+
+    parser = argparse.ArgumentParser(description="Gets the list of results whose failure matches with the provided one.")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("list_similar_test_results", pat)
+    logger.info("Gets the list of results whose failure matches with the provided one.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        items = items_of(list_similar_test_results(client, project, run_id, test_result_id, test_sub_result_id), "value")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    data = list_similar_test_results(client, project, run_id, test_result_id, test_sub_result_id)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
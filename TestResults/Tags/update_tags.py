@@ -11,61 +11,90 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/test-results/tags/
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-RUN_ID = get_env_or_exit("RUN_ID", "RunId of the run")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Update tags of a run, Tags can be Added and Deleted")
-parser.add_argument("--tags", required=False, help="tags")
-args = parser.parse_args()
+def update_tags(client, project: str, run_id: str, *, tags: Optional[str] = None) -> dict:
+    """
+    Update tags of a run, Tags can be Added and Deleted
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_tags", PAT)
-logger.info("Update tags of a run, Tags can be Added and Deleted")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        run_id: RunId of the run
+        tags: tags
 
-# ---------------------------------------------------------------------------
-# Request body
-# ---------------------------------------------------------------------------
-body = {
-    "tags": args.tags,
-}
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "tags": tags,
+    }
+    url = build_url(client.organization, f"_apis/testresults/runs/{run_id}/tags", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/testresults/runs/{RUN_ID}/tags", API_VERSION, project=PROJECT_ID, base_host="vstmr.dev.azure.com")
-logger.info(f"PATCH {url}")
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+async def update_tags_async(client, project: str, run_id: str, *, tags: Optional[str] = None) -> dict:
+    """Async variant of update_tags() for use with AsyncAdoClient."""
+    body = {
+        "tags": tags,
+    }
+    url = build_url(client.organization, f"_apis/testresults/runs/{run_id}/tags", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call update_tags() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    run_id = require_env("RUN_ID", "RunId of the run")
+
+    parser = argparse.ArgumentParser(description="Update tags of a run, Tags can be Added and Deleted")
+    parser.add_argument("--tags", required=False, help="tags")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("update_tags", pat)
+    logger.info("Update tags of a run, Tags can be Added and Deleted")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        items = items_of(update_tags(client, project, run_id, tags=args.tags), "value")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    data = update_tags(client, project, run_id, tags=args.tags)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,75 +11,141 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/test-results/test-
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Iterator, Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
+from _shared.pagination import paginate
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-
-# ---------------------------------------------------------------------------
-# CLI arguments
-# ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Get history of a test method using TestHistoryQuery")
-parser.add_argument("--automated-test-name", required=False, help="Automated test name of the TestCase.")
-parser.add_argument("--branch", required=False, help="Results to be get for a particular branches.")
-parser.add_argument("--build-definition-id", required=False, help="Get the results history only for this BuildDefinitionId. This to get used in query GroupBy should...")
-parser.add_argument("--continuation-token", required=False, help="It will be filled by server. If not null means there are some results still to be get, and we nee...")
-parser.add_argument("--group-by", required=False, help="Group the result on the basis of TestResultGroupBy. This can be Branch, Environment or null(if re...")
-parser.add_argument("--max-complete-date", required=False, help="History to get between time interval MaxCompleteDate and (MaxCompleteDate - TrendDays). Default i...")
-args = parser.parse_args()
-
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("query_test_history", PAT)
-logger.info("Get history of a test method using TestHistoryQuery")
-
-# ---------------------------------------------------------------------------
-# Request body
-# ---------------------------------------------------------------------------
-body = {
-    "automatedTestName": args.automated_test_name,
-    "branch": args.branch,
-    "buildDefinitionId": args.build_definition_id,
-    "continuationToken": args.continuation_token,
-    "groupBy": args.group_by,
-    "maxCompleteDate": args.max_complete_date,
-}
 
 # ---------------------------------------------------------------------------
-# API call
+# API
 # ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/testresults/results/testhistory", API_VERSION, project=PROJECT_ID, base_host="vstmr.dev.azure.com")
-logger.info(f"POST {url}")
-
-response = execute_request("POST", url, HEADERS, body=body)
+def query_test_history(client, project: str, *, automated_test_name: Optional[str] = None, branch: Optional[str] = None, build_definition_id: Optional[str] = None, continuation_token: Optional[str] = None, group_by: Optional[str] = None, max_complete_date: Optional[str] = None) -> dict:
+    """
+    Get history of a test method using TestHistoryQuery
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        automated_test_name: Automated test name of the TestCase.
+        branch: Results to be get for a particular branches.
+        build_definition_id: Get the results history only for this BuildDefinitionId. This to get used in query GroupBy should...
+        continuation_token: It will be filled by server. If not null means there are some results still to be get, and we nee...
+        group_by: Group the result on the basis of TestResultGroupBy. This can be Branch, Environment or null(if re...
+        max_complete_date: History to get between time interval MaxCompleteDate and (MaxCompleteDate - TrendDays). Default i...
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "automatedTestName": automated_test_name,
+        "branch": branch,
+        "buildDefinitionId": build_definition_id,
+        "continuationToken": continuation_token,
+        "groupBy": group_by,
+        "maxCompleteDate": max_complete_date,
+    }
+    url = build_url(client.organization, f"_apis/testresults/results/testhistory", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['automatedTestName', 'branch'], API_VERSION)
+    return data
+
+
+async def query_test_history_async(client, project: str, *, automated_test_name: Optional[str] = None, branch: Optional[str] = None, build_definition_id: Optional[str] = None, continuation_token: Optional[str] = None, group_by: Optional[str] = None, max_complete_date: Optional[str] = None) -> dict:
+    """Async variant of query_test_history() for use with AsyncAdoClient."""
+    body = {
+        "automatedTestName": automated_test_name,
+        "branch": branch,
+        "buildDefinitionId": build_definition_id,
+        "continuationToken": continuation_token,
+        "groupBy": group_by,
+        "maxCompleteDate": max_complete_date,
+    }
+    url = build_url(client.organization, f"_apis/testresults/results/testhistory", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['automatedTestName', 'branch'], API_VERSION)
+    return data
+
+
+def iter_query_test_history(client, project: str, *, automated_test_name: Optional[str] = None, branch: Optional[str] = None, build_definition_id: Optional[str] = None, continuation_token: Optional[str] = None, group_by: Optional[str] = None, max_complete_date: Optional[str] = None, max_items: Optional[int] = None, prefetch: bool = False) -> Iterator[dict]:
+    """
+    Yield every item across all pages of query_test_history() (continuation_body paging).
+
+    Takes the same arguments, plus:
+        max_items: Stop after this many items (default: all).
+        prefetch: Fetch the next page while the current one is consumed.
+    """
+    body = {
+        "automatedTestName": automated_test_name,
+        "branch": branch,
+        "buildDefinitionId": build_definition_id,
+        "continuationToken": continuation_token,
+        "groupBy": group_by,
+        "maxCompleteDate": max_complete_date,
+    }
+    url = build_url(client.organization, f"_apis/testresults/results/testhistory", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    return paginate(client, "POST", url, "continuation_body", body=body, list_key="resultsForGroup",
+                    max_items=max_items, prefetch=prefetch)
 
-data = response.json()
-
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['automatedTestName', 'branch'], API_VERSION)
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call query_test_history() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+
+    parser = argparse.ArgumentParser(description="Get history of a test method using TestHistoryQuery")
+    parser.add_argument("--automated-test-name", required=False, help="Automated test name of the TestCase.")
+    parser.add_argument("--branch", required=False, help="Results to be get for a particular branches.")
+    parser.add_argument("--build-definition-id", required=False, help="Get the results history only for this BuildDefinitionId. This to get used in query GroupBy should...")
+    parser.add_argument("--continuation-token", required=False, help="It will be filled by server. If not null means there are some results still to be get, and we nee...")
+    parser.add_argument("--group-by", required=False, help="Group the result on the basis of TestResultGroupBy. This can be Branch, Environment or null(if re...")
+    parser.add_argument("--max-complete-date", required=False, help="History to get between time interval MaxCompleteDate and (MaxCompleteDate - TrendDays). Default i...")
+    parser.add_argument("--all-pages", action="store_true", help="Follow pagination and return every item")
+    parser.add_argument("--max-items", type=int, help="Follow pagination up to this many items")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("query_test_history", pat)
+    logger.info("Get history of a test method using TestHistoryQuery")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        if args.all_pages or args.max_items:
+            items = iter_query_test_history(client, project, automated_test_name=args.automated_test_name, branch=args.branch, build_definition_id=args.build_definition_id, continuation_token=args.continuation_token, group_by=args.group_by, max_complete_date=args.max_complete_date, max_items=args.max_items, prefetch=True)
+        else:
+            items = items_of(query_test_history(client, project, automated_test_name=args.automated_test_name, branch=args.branch, build_definition_id=args.build_definition_id, continuation_token=args.continuation_token, group_by=args.group_by, max_complete_date=args.max_complete_date), "resultsForGroup")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    if args.all_pages or args.max_items:
+        items = list(iter_query_test_history(client, project, automated_test_name=args.automated_test_name, branch=args.branch, build_definition_id=args.build_definition_id, continuation_token=args.continuation_token, group_by=args.group_by, max_complete_date=args.max_complete_date, max_items=args.max_items, prefetch=True))
+        data = {"count": len(items), "resultsForGroup": items}
+    else:
+        data = query_test_history(client, project, automated_test_name=args.automated_test_name, branch=args.branch, build_definition_id=args.build_definition_id, continuation_token=args.continuation_token, group_by=args.group_by, max_complete_date=args.max_complete_date)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,67 +11,94 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/test-results/testa
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-BUILD_ID = get_env_or_exit("BUILD_ID", "BuildId")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Creates an attachment in the LogStore for the specified buildId.")
-parser.add_argument("--attachment-type", required=False, help="Attachment type By Default it will be GeneralAttachment. It can be one of the following type. { G...")
-parser.add_argument("--comment", required=False, help="Comment associated with attachment")
-parser.add_argument("--file-name", required=False, help="Attachment filename")
-parser.add_argument("--stream", required=False, help="Base64 encoded file stream")
-args = parser.parse_args()
+def create_build_attachment_in_log_store(client, project: str, build_id: str, *, attachment_type: Optional[str] = None, comment: Optional[str] = None, file_name: Optional[str] = None, stream: Optional[str] = None) -> dict:
+    """
+    Creates an attachment in the LogStore for the specified buildId.
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_build_attachment_in_log_store", PAT)
-logger.info("Creates an attachment in the LogStore for the specified buildId.")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        build_id: BuildId
+        attachment_type: Attachment type By Default it will be GeneralAttachment. It can be one of the following type. { G...
+        comment: Comment associated with attachment
+        file_name: Attachment filename
+        stream: Base64 encoded file stream
 
-# ---------------------------------------------------------------------------
-# Request body
-# ---------------------------------------------------------------------------
-body = {
-    "attachmentType": args.attachment_type,
-    "comment": args.comment,
-    "fileName": args.file_name,
-    "stream": args.stream,
-}
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "attachmentType": attachment_type,
+        "comment": comment,
+        "fileName": file_name,
+        "stream": stream,
+    }
+    url = build_url(client.organization, f"_apis/testresults/uploadbuildattachments/{build_id}", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/testresults/uploadbuildattachments/{BUILD_ID}", API_VERSION, project=PROJECT_ID, base_host="vstmr.dev.azure.com")
-logger.info(f"POST {url}")
 
-response = execute_request("POST", url, HEADERS, body=body)
+async def create_build_attachment_in_log_store_async(client, project: str, build_id: str, *, attachment_type: Optional[str] = None, comment: Optional[str] = None, file_name: Optional[str] = None, stream: Optional[str] = None) -> dict:
+    """Async variant of create_build_attachment_in_log_store() for use with AsyncAdoClient."""
+    body = {
+        "attachmentType": attachment_type,
+        "comment": comment,
+        "fileName": file_name,
+        "stream": stream,
+    }
+    url = build_url(client.organization, f"_apis/testresults/uploadbuildattachments/{build_id}", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call create_build_attachment_in_log_store() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    build_id = require_env("BUILD_ID", "BuildId")
+
+    parser = argparse.ArgumentParser(description="Creates an attachment in the LogStore for the specified buildId.")
+    parser.add_argument("--attachment-type", required=False, help="Attachment type By Default it will be GeneralAttachment. It can be one of the following type. { G...")
+    parser.add_argument("--comment", required=False, help="Comment associated with attachment")
+    parser.add_argument("--file-name", required=False, help="Attachment filename")
+    parser.add_argument("--stream", required=False, help="Base64 encoded file stream")
+    args = parser.parse_args()
+
+    logger = AdoLogger("create_build_attachment_in_log_store", pat)
+    logger.info("Creates an attachment in the LogStore for the specified buildId.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = create_build_attachment_in_log_store(client, project, build_id, attachment_type=args.attachment_type, comment=args.comment, file_name=args.file_name, stream=args.stream)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
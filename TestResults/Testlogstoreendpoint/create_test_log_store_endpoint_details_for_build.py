@@ -10,53 +10,74 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/test-results/testlogstoreendpoint/test-log-store-endpoint-details-for-build?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-BUILD_ID = get_env_or_exit("BUILD_ID", "Id of the build to get")
-TEST_LOG_STORE_OPERATION_TYPE = get_env_or_exit("TEST_LOG_STORE_OPERATION_TYPE", "Type of operation to perform using sas uri")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_test_log_store_endpoint_details_for_build", PAT)
-logger.info("Create and Get sas uri of the build container")
+def create_test_log_store_endpoint_details_for_build(client, project: str, build_id: str, test_log_store_operation_type: str) -> dict:
+    """
+    Create and Get sas uri of the build container
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/testresults/testlogstoreendpoint", API_VERSION, project=PROJECT_ID, base_host="vstmr.dev.azure.com")
-logger.info(f"POST {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        build_id: Id of the build to get
+        test_log_store_operation_type: Type of operation to perform using sas uri
 
-response = execute_request("POST", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/testresults/testlogstoreendpoint", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    response = client.request("POST", url)
+    data = loads(response.content)
+    version_guard(data, ['endpointSASUri', 'endpointType'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['endpointSASUri', 'endpointType'], API_VERSION)
+async def create_test_log_store_endpoint_details_for_build_async(client, project: str, build_id: str, test_log_store_operation_type: str) -> dict:
+    """Async variant of create_test_log_store_endpoint_details_for_build() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/testresults/testlogstoreendpoint", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    response = await client.request("POST", url)
+    data = loads(response.content)
+    version_guard(data, ['endpointSASUri', 'endpointType'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call create_test_log_store_endpoint_details_for_build() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    build_id = require_env("BUILD_ID", "Id of the build to get")
+    test_log_store_operation_type = require_env("TEST_LOG_STORE_OPERATION_TYPE", "Type of operation to perform using sas uri")
+
+    logger = AdoLogger("create_test_log_store_endpoint_details_for_build", pat)
+    logger.info("Create and Get sas uri of the build container")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = create_test_log_store_endpoint_details_for_build(client, project, build_id, test_log_store_operation_type)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,56 +10,80 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/test-results/testlogstoreendpoint/test-log-store-endpoint-details-for-result?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-RUN_ID = get_env_or_exit("RUN_ID", "Id of the test run that contains the result")
-RESULT_ID = get_env_or_exit("RESULT_ID", "Id of the test results that contains sub result")
-SUB_RESULT_ID = get_env_or_exit("SUB_RESULT_ID", "Id of the test sub result whose file sas uri is needed")
-FILE_PATH = get_env_or_exit("FILE_PATH", "file path inside the sub result for which sas uri is needed")
-TYPE = get_env_or_exit("TYPE", "Type of the file for download")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_test_log_store_endpoint_details_for_result", PAT)
-logger.info("Create empty file for a result and Get Sas uri for the file")
+def create_test_log_store_endpoint_details_for_result(client, project: str, run_id: str, result_id: str, sub_result_id: str, file_path: str, type: str) -> dict:
+    """
+    Create empty file for a result and Get Sas uri for the file
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/testresults/runs/{RUN_ID}/results/{RESULT_ID}/testlogstoreendpoint", API_VERSION, project=PROJECT_ID, base_host="vstmr.dev.azure.com")
-logger.info(f"POST {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        run_id: Id of the test run that contains the result
+        result_id: Id of the test results that contains sub result
+        sub_result_id: Id of the test sub result whose file sas uri is needed
+        file_path: file path inside the sub result for which sas uri is needed
+        type: Type of the file for download
 
-response = execute_request("POST", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/testresults/runs/{run_id}/results/{result_id}/testlogstoreendpoint", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    response = client.request("POST", url)
+    data = loads(response.content)
+    version_guard(data, ['endpointSASUri', 'endpointType'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['endpointSASUri', 'endpointType'], API_VERSION)
+async def create_test_log_store_endpoint_details_for_result_async(client, project: str, run_id: str, result_id: str, sub_result_id: str, file_path: str, type: str) -> dict:
+    """Async variant of create_test_log_store_endpoint_details_for_result() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/testresults/runs/{run_id}/results/{result_id}/testlogstoreendpoint", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    response = await client.request("POST", url)
+    data = loads(response.content)
+    version_guard(data, ['endpointSASUri', 'endpointType'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call create_test_log_store_endpoint_details_for_result() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    run_id = require_env("RUN_ID", "Id of the test run that contains the result")
+    result_id = require_env("RESULT_ID", "Id of the test results that contains sub result")
+    sub_result_id = require_env("SUB_RESULT_ID", "Id of the test sub result whose file sas uri is needed")
+    file_path = require_env("FILE_PATH", "file path inside the sub result for which sas uri is needed")
+    type = require_env("TYPE", "Type of the file for download")
+
+    logger = AdoLogger("create_test_log_store_endpoint_details_for_result", pat)
+    logger.info("Create empty file for a result and Get Sas uri for the file")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = create_test_log_store_endpoint_details_for_result(client, project, run_id, result_id, sub_result_id, file_path, type)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
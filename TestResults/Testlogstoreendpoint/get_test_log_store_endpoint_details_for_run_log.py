@@ -10,54 +10,76 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/test-results/testlogstoreendpoint/get-test-log-store-endpoint-details-for-run-log?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-RUN_ID = get_env_or_exit("RUN_ID", "Id of the test run whose file has to be downloaded")
-TYPE = get_env_or_exit("TYPE", "type of the file")
-FILE_PATH = get_env_or_exit("FILE_PATH", "filePath for which sas uri is needed")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_test_log_store_endpoint_details_for_run_log", PAT)
-logger.info("Get SAS Uri of a test run attachment")
+def get_test_log_store_endpoint_details_for_run_log(client, project: str, run_id: str, type: str, file_path: str) -> dict:
+    """
+    Get SAS Uri of a test run attachment
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/testresults/runs/{RUN_ID}/testlogstoreendpoint", API_VERSION, project=PROJECT_ID, base_host="vstmr.dev.azure.com")
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        run_id: Id of the test run whose file has to be downloaded
+        type: type of the file
+        file_path: filePath for which sas uri is needed
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/testresults/runs/{run_id}/testlogstoreendpoint", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    response = client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['endpointSASUri', 'endpointType'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['endpointSASUri', 'endpointType'], API_VERSION)
+async def get_test_log_store_endpoint_details_for_run_log_async(client, project: str, run_id: str, type: str, file_path: str) -> dict:
+    """Async variant of get_test_log_store_endpoint_details_for_run_log() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/testresults/runs/{run_id}/testlogstoreendpoint", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['endpointSASUri', 'endpointType'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_test_log_store_endpoint_details_for_run_log() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    run_id = require_env("RUN_ID", "Id of the test run whose file has to be downloaded")
+    type = require_env("TYPE", "type of the file")
+    file_path = require_env("FILE_PATH", "filePath for which sas uri is needed")
+
+    logger = AdoLogger("get_test_log_store_endpoint_details_for_run_log", pat)
+    logger.info("Get SAS Uri of a test run attachment")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = get_test_log_store_endpoint_details_for_run_log(client, project, run_id, type, file_path)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,70 +11,100 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/test-results/tests
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Create for Testsettings")
-parser.add_argument("--area-path", required=False, help="Area path required to create test settings")
-parser.add_argument("--description", required=False, help="Description of the test settings. Used in create test settings.")
-parser.add_argument("--is-public", required=False, help="Indicates if the tests settings is public or private.Used in create test settings.")
-parser.add_argument("--machine-roles", required=False, help="Xml string of machine roles. Used in create test settings.")
-parser.add_argument("--test-settings-content", required=False, help="Test settings content.")
-parser.add_argument("--test-settings-id", required=False, help="Test settings id.")
-args = parser.parse_args()
+def create_testsettings(client, project: str, *, area_path: Optional[str] = None, description: Optional[str] = None, is_public: Optional[str] = None, machine_roles: Optional[str] = None, test_settings_content: Optional[str] = None, test_settings_id: Optional[str] = None) -> dict:
+    """
+    Create for Testsettings
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_testsettings", PAT)
-logger.info("Create for Testsettings")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        area_path: Area path required to create test settings
+        description: Description of the test settings. Used in create test settings.
+        is_public: Indicates if the tests settings is public or private.Used in create test settings.
+        machine_roles: Xml string of machine roles. Used in create test settings.
+        test_settings_content: Test settings content.
+        test_settings_id: Test settings id.
 
-# ---------------------------------------------------------------------------
-# Request body
-# ---------------------------------------------------------------------------
-body = {
-    "areaPath": args.area_path,
-    "description": args.description,
-    "isPublic": args.is_public,
-    "machineRoles": args.machine_roles,
-    "testSettingsContent": args.test_settings_content,
-    "testSettingsId": args.test_settings_id,
-}
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "areaPath": area_path,
+        "description": description,
+        "isPublic": is_public,
+        "machineRoles": machine_roles,
+        "testSettingsContent": test_settings_content,
+        "testSettingsId": test_settings_id,
+    }
+    url = build_url(client.organization, f"_apis/testresults/testsettings", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/testresults/testsettings", API_VERSION, project=PROJECT_ID, base_host="vstmr.dev.azure.com")
-logger.info(f"POST {url}")
 
-response = execute_request("POST", url, HEADERS, body=body)
+async def create_testsettings_async(client, project: str, *, area_path: Optional[str] = None, description: Optional[str] = None, is_public: Optional[str] = None, machine_roles: Optional[str] = None, test_settings_content: Optional[str] = None, test_settings_id: Optional[str] = None) -> dict:
+    """Async variant of create_testsettings() for use with AsyncAdoClient."""
+    body = {
+        "areaPath": area_path,
+        "description": description,
+        "isPublic": is_public,
+        "machineRoles": machine_roles,
+        "testSettingsContent": test_settings_content,
+        "testSettingsId": test_settings_id,
+    }
+    url = build_url(client.organization, f"_apis/testresults/testsettings", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call create_testsettings() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+
+    parser = argparse.ArgumentParser(description="Create for Testsettings")
+    parser.add_argument("--area-path", required=False, help="Area path required to create test settings")
+    parser.add_argument("--description", required=False, help="Description of the test settings. Used in create test settings.")
+    parser.add_argument("--is-public", required=False, help="Indicates if the tests settings is public or private.Used in create test settings.")
+    parser.add_argument("--machine-roles", required=False, help="Xml string of machine roles. Used in create test settings.")
+    parser.add_argument("--test-settings-content", required=False, help="Test settings content.")
+    parser.add_argument("--test-settings-id", required=False, help="Test settings id.")
+    args = parser.parse_args()
+
+    logger = AdoLogger("create_testsettings", pat)
+    logger.info("Create for Testsettings")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = create_testsettings(client, project, area_path=args.area_path, description=args.description, is_public=args.is_public, machine_roles=args.machine_roles, test_settings_content=args.test_settings_content, test_settings_id=args.test_settings_id)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,69 +11,90 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/test-results/worki
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Add for Workitems")
-parser.add_argument("--executed-in", required=False, help="executedIn")
-parser.add_argument("--tests", required=False, help="tests")
-parser.add_argument("--work-item", required=False, help="workItem")
-args = parser.parse_args()
+def create_workitems(client, project: str, *, executed_in: Optional[str] = None, tests: Optional[str] = None, work_item: Optional[str] = None) -> dict:
+    """
+    Add for Workitems
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        executed_in: executedIn
+        tests: tests
+        work_item: workItem
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "executedIn": executed_in,
+        "tests": tests,
+        "workItem": work_item,
+    }
+    url = build_url(client.organization, f"_apis/testresults/testmethods/workitems", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['executedIn', 'tests'], API_VERSION)
+    return data
+
+
+async def create_workitems_async(client, project: str, *, executed_in: Optional[str] = None, tests: Optional[str] = None, work_item: Optional[str] = None) -> dict:
+    """Async variant of create_workitems() for use with AsyncAdoClient."""
+    body = {
+        "executedIn": executed_in,
+        "tests": tests,
+        "workItem": work_item,
+    }
+    url = build_url(client.organization, f"_apis/testresults/testmethods/workitems", API_VERSION, project=project, base_host="vstmr.dev.azure.com")
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['executedIn', 'tests'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_workitems", PAT)
-logger.info("Add for Workitems")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "executedIn": args.executed_in,
-    "tests": args.tests,
-    "workItem": args.work_item,
-}
+def main() -> None:
+    """Read env vars / flags, call create_workitems() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/testresults/testmethods/workitems", API_VERSION, project=PROJECT_ID, base_host="vstmr.dev.azure.com")
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Add for Workitems")
+    parser.add_argument("--executed-in", required=False, help="executedIn")
+    parser.add_argument("--tests", required=False, help="tests")
+    parser.add_argument("--work-item", required=False, help="workItem")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_workitems", pat)
+    logger.info("Add for Workitems")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_workitems(client, project, executed_in=args.executed_in, tests=args.tests, work_item=args.work_item)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['executedIn', 'tests'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
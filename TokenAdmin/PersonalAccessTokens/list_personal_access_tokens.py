@@ -10,53 +10,108 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/token-admin/personal-access-tokens/list?view=azure-devops-rest-7.2
 """
 
-import json
+import argparse
 import os
 import sys
+from typing import Iterator, Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
+from _shared.pagination import paginate
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-SUBJECT_DESCRIPTOR = get_env_or_exit("SUBJECT_DESCRIPTOR", "The descriptor of the target user.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("list_personal_access_tokens", PAT)
-logger.info("Lists of all the session token details of the personal access tokens (PATs) for a particular user.")
+def list_personal_access_tokens(client, subject_descriptor: str) -> dict:
+    """
+    Lists of all the session token details of the personal access tokens (PATs) for a particular user.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/tokenadmin/personalaccesstokens/{SUBJECT_DESCRIPTOR}", API_VERSION, base_host="vssps.dev.azure.com")
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        subject_descriptor: The descriptor of the target user.
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/tokenadmin/personalaccesstokens/{subject_descriptor}", API_VERSION, base_host="vssps.dev.azure.com")
+    response = client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['value', 'continuationToken'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['value', 'continuationToken'], API_VERSION)
+async def list_personal_access_tokens_async(client, subject_descriptor: str) -> dict:
+    """Async variant of list_personal_access_tokens() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/tokenadmin/personalaccesstokens/{subject_descriptor}", API_VERSION, base_host="vssps.dev.azure.com")
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['value', 'continuationToken'], API_VERSION)
+    return data
+
+
+def iter_list_personal_access_tokens(client, subject_descriptor: str, *, max_items: Optional[int] = None, prefetch: bool = False) -> Iterator[dict]:
+    """
+    Yield every item across all pages of list_personal_access_tokens() (continuation paging).
+
+    Takes the same arguments, plus:
+        max_items: Stop after this many items (default: all).
+        prefetch: Fetch the next page while the current one is consumed.
+    """
+    url = build_url(client.organization, f"_apis/tokenadmin/personalaccesstokens/{subject_descriptor}", API_VERSION, base_host="vssps.dev.azure.com")
+    return paginate(client, "GET", url, "continuation",
+                    max_items=max_items, prefetch=prefetch)
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-for item in data.get("value", []):
-    cols = [item.get("accessId", "N/A"), item.get("alternateToken", "N/A"), item.get("authorizationId", "N/A"), item.get("claims", "N/A")]
-    print("  " + "  ".join(str(c) for c in cols))
+def main() -> None:
+    """Read env vars / flags, call list_personal_access_tokens() and print the result."""
+    organization, pat = get_common_env()
+    subject_descriptor = require_env("SUBJECT_DESCRIPTOR", "The descriptor of the target user.")
+
+    parser = argparse.ArgumentParser(description="Lists of all the session token details of the personal access tokens (PATs) for a particular user.")
+    parser.add_argument("--all-pages", action="store_true", help="Follow pagination and return every item")
+    parser.add_argument("--max-items", type=int, help="Follow pagination up to this many items")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("list_personal_access_tokens", pat)
+    logger.info("Lists of all the session token details of the personal access tokens (PATs) for a particular user.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        if args.all_pages or args.max_items:
+            items = iter_list_personal_access_tokens(client, subject_descriptor, max_items=args.max_items, prefetch=True)
+        else:
+            items = items_of(list_personal_access_tokens(client, subject_descriptor), "value")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    if args.all_pages or args.max_items:
+        items = list(iter_list_personal_access_tokens(client, subject_descriptor, max_items=args.max_items, prefetch=True))
+        data = {"count": len(items), "value": items}
+    else:
+        data = list_personal_access_tokens(client, subject_descriptor)
+
+    for item in data.get("value", []):
+        cols = [item.get("accessId", "N/A"), item.get("alternateToken", "N/A"), item.get("authorizationId", "N/A"), item.get("claims", "N/A")]
+        print("  " + "  ".join(str(c) for c in cols))
+
+
+if __name__ == "__main__":
+    run_cli(main)
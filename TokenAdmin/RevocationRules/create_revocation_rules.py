@@ -11,61 +11,82 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/token-admin/revoca
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Creates a revocation rule to prevent the further usage of any OAuth authorizations that were created before the curre...")
-parser.add_argument("--created-before", required=False, help="A datetime cutoff. Tokens created before this time will be rejected. This is an optional paramete...")
-parser.add_argument("--scopes", required=False, help="A string containing a space-delimited list of OAuth scopes. A token matching any one of the scope...")
-args = parser.parse_args()
+def create_revocation_rules(client, *, created_before: Optional[str] = None, scopes: Optional[str] = None) -> dict:
+    """
+    Creates a revocation rule to prevent the further usage of any OAuth authorizations that were created before the curre...
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_revocation_rules", PAT)
-logger.info("Creates a revocation rule to prevent the further usage of any OAuth authorizations that were created before the curre...")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        created_before: A datetime cutoff. Tokens created before this time will be rejected. This is an optional paramete...
+        scopes: A string containing a space-delimited list of OAuth scopes. A token matching any one of the scope...
 
-# ---------------------------------------------------------------------------
-# Request body
-# ---------------------------------------------------------------------------
-body = {
-    "createdBefore": args.created_before,
-    "scopes": args.scopes,
-}
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "createdBefore": created_before,
+        "scopes": scopes,
+    }
+    url = build_url(client.organization, f"_apis/tokenadmin/revocationrules", API_VERSION, base_host="vssps.dev.azure.com")
+    response = client.request("POST", url, body=body, expected_status=201)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/tokenadmin/revocationrules", API_VERSION, base_host="vssps.dev.azure.com")
-logger.info(f"POST {url}")
 
-response = execute_request("POST", url, HEADERS, body=body, expected_status=201)
+async def create_revocation_rules_async(client, *, created_before: Optional[str] = None, scopes: Optional[str] = None) -> dict:
+    """Async variant of create_revocation_rules() for use with AsyncAdoClient."""
+    body = {
+        "createdBefore": created_before,
+        "scopes": scopes,
+    }
+    url = build_url(client.organization, f"_apis/tokenadmin/revocationrules", API_VERSION, base_host="vssps.dev.azure.com")
+    response = await client.request("POST", url, body=body, expected_status=201)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call create_revocation_rules() and print the result."""
+    organization, pat = get_common_env()
+
+    parser = argparse.ArgumentParser(description="Creates a revocation rule to prevent the further usage of any OAuth authorizations that were created before the curre...")
+    parser.add_argument("--created-before", required=False, help="A datetime cutoff. Tokens created before this time will be rejected. This is an optional paramete...")
+    parser.add_argument("--scopes", required=False, help="A string containing a space-delimited list of OAuth scopes. A token matching any one of the scope...")
+    args = parser.parse_args()
+
+    logger = AdoLogger("create_revocation_rules", pat)
+    logger.info("Creates a revocation rule to prevent the further usage of any OAuth authorizations that were created before the curre...")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = create_revocation_rules(client, created_before=args.created_before, scopes=args.scopes)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
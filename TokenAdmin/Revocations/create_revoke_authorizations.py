@@ -10,50 +10,60 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/token-admin/revocations/revoke-authorizations?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env
+from _shared.cli import run_cli
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_revoke_authorizations", PAT)
-logger.info("Revokes the listed OAuth authorizations.")
+def create_revoke_authorizations(client) -> None:
+    """
+    Revokes the listed OAuth authorizations.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/tokenadmin/revocations", API_VERSION, base_host="vssps.dev.azure.com")
-logger.info(f"POST {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+    """
+    url = build_url(client.organization, f"_apis/tokenadmin/revocations", API_VERSION, base_host="vssps.dev.azure.com")
+    client.request("POST", url, expected_status=204)
+    return None
+
+
+async def create_revoke_authorizations_async(client) -> None:
+    """Async variant of create_revoke_authorizations() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/tokenadmin/revocations", API_VERSION, base_host="vssps.dev.azure.com")
+    await client.request("POST", url, expected_status=204)
+    return None
 
-response = execute_request("POST", url, HEADERS, expected_status=204)
 
 # ---------------------------------------------------------------------------
-# Output — DELETE returns 204 No Content on success
+# CLI
 # ---------------------------------------------------------------------------
-if response.status_code == 204:
+def main() -> None:
+    """Read env vars / flags, call create_revoke_authorizations() and print the result."""
+    organization, pat = get_common_env()
+
+    logger = AdoLogger("create_revoke_authorizations", pat)
+    logger.info("Revokes the listed OAuth authorizations.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    create_revoke_authorizations(client)
     logger.info("Revocations operation completed successfully.")
     print("Revocations operation completed successfully.")
-else:
-    logger.error(f"Unexpected status code: {response.status_code}")
-    print(f"Unexpected status code: {response.status_code}", file=sys.stderr)
-    if response.text:
-        print(response.text)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,45 +10,66 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/token-administration/list/list?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "5.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("list", PAT)
-logger.info("Revokes the listed OAuth authorizations.")
+def list(client) -> dict:
+    """
+    Revokes the listed OAuth authorizations.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/tokenadministration/tokenlistglobalidentities", API_VERSION)
+    response = client.request("POST", url)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/tokenadministration/tokenlistglobalidentities", API_VERSION)
-logger.info(f"POST {url}")
 
-response = execute_request("POST", url, HEADERS)
+async def list_async(client) -> dict:
+    """Async variant of list() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/tokenadministration/tokenlistglobalidentities", API_VERSION)
+    response = await client.request("POST", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call list() and print the result."""
+    organization, pat = get_common_env()
+
+    logger = AdoLogger("list", pat)
+    logger.info("Revokes the listed OAuth authorizations.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = list(client)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,67 +11,78 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/token-administrati
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "5.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-HOST_ID = get_env_or_exit("HOST_ID", "Host Id to display on the notification page to manage tokens.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Revokes the listed OAuth authorizations.")
-parser.add_argument("--audience", required=False, help="A list of audience (target accounts) to limit the revocations to")
-parser.add_argument("--authorization-ids", required=False, help="A list of authorization ID of the OAuth authorization to revoke.")
-args = parser.parse_args()
+def create_revoke_authorizations(client, host_id: str, *, audience: Optional[str] = None, authorization_ids: Optional[str] = None) -> None:
+    """
+    Revokes the listed OAuth authorizations.
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_revoke_authorizations", PAT)
-logger.info("Revokes the listed OAuth authorizations.")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        host_id: Host Id to display on the notification page to manage tokens.
+        audience: A list of audience (target accounts) to limit the revocations to
+        authorization_ids: A list of authorization ID of the OAuth authorization to revoke.
+    """
+    body = {
+        "audience": audience,
+        "authorizationIds": authorization_ids,
+    }
+    url = build_url(client.organization, f"_apis/tokenadministration/tokenrevocations", API_VERSION)
+    client.request("POST", url, body=body, expected_status=204)
+    return None
 
-# ---------------------------------------------------------------------------
-# Request body
-# ---------------------------------------------------------------------------
-body = {
-    "audience": args.audience,
-    "authorizationIds": args.authorization_ids,
-}
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/tokenadministration/tokenrevocations", API_VERSION)
-logger.info(f"POST {url}")
+async def create_revoke_authorizations_async(client, host_id: str, *, audience: Optional[str] = None, authorization_ids: Optional[str] = None) -> None:
+    """Async variant of create_revoke_authorizations() for use with AsyncAdoClient."""
+    body = {
+        "audience": audience,
+        "authorizationIds": authorization_ids,
+    }
+    url = build_url(client.organization, f"_apis/tokenadministration/tokenrevocations", API_VERSION)
+    await client.request("POST", url, body=body, expected_status=204)
+    return None
 
-response = execute_request("POST", url, HEADERS, body=body, expected_status=204)
 
 # ---------------------------------------------------------------------------
-# Output — DELETE returns 204 No Content on success
+# CLI
 # ---------------------------------------------------------------------------
-if response.status_code == 204:
+def main() -> None:
+    """Read env vars / flags, call create_revoke_authorizations() and print the result."""
+    organization, pat = get_common_env()
+    host_id = require_env("HOST_ID", "Host Id to display on the notification page to manage tokens.")
+
+    parser = argparse.ArgumentParser(description="Revokes the listed OAuth authorizations.")
+    parser.add_argument("--audience", required=False, help="A list of audience (target accounts) to limit the revocations to")
+    parser.add_argument("--authorization-ids", required=False, help="A list of authorization ID of the OAuth authorization to revoke.")
+    args = parser.parse_args()
+
+    logger = AdoLogger("create_revoke_authorizations", pat)
+    logger.info("Revokes the listed OAuth authorizations.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    create_revoke_authorizations(client, host_id, audience=args.audience, authorization_ids=args.authorization_ids)
     logger.info("Revoke Authorizations operation completed successfully.")
     print("Revoke Authorizations operation completed successfully.")
-else:
-    logger.error(f"Unexpected status code: {response.status_code}")
-    print(f"Unexpected status code: {response.status_code}", file=sys.stderr)
-    if response.text:
-        print(response.text)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,70 +11,92 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/tokens/pats/create
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Creates a new personal access token (PAT) for the requesting user.")
-parser.add_argument("--all-orgs", required=False, help="True, if this personal access token (PAT) is for all of the user's accessible organizations. Fals...")
-parser.add_argument("--display-name", required=False, help="The token name")
-parser.add_argument("--scope", required=False, help="The token scopes for accessing Azure DevOps resources")
-parser.add_argument("--valid-to", required=False, help="The token expiration date. If the 'Enforce maximum personal access token lifespan' policy is enab...")
-args = parser.parse_args()
+def create_pats(client, *, all_orgs: Optional[str] = None, display_name: Optional[str] = None, scope: Optional[str] = None, valid_to: Optional[str] = None) -> dict:
+    """
+    Creates a new personal access token (PAT) for the requesting user.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        all_orgs: True, if this personal access token (PAT) is for all of the user's accessible organizations. Fals...
+        display_name: The token name
+        scope: The token scopes for accessing Azure DevOps resources
+        valid_to: The token expiration date. If the 'Enforce maximum personal access token lifespan' policy is enab...
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "allOrgs": all_orgs,
+        "displayName": display_name,
+        "scope": scope,
+        "validTo": valid_to,
+    }
+    url = build_url(client.organization, f"_apis/tokens/pats", API_VERSION, base_host="vssps.dev.azure.com")
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['patToken', 'patTokenError'], API_VERSION)
+    return data
+
+
+async def create_pats_async(client, *, all_orgs: Optional[str] = None, display_name: Optional[str] = None, scope: Optional[str] = None, valid_to: Optional[str] = None) -> dict:
+    """Async variant of create_pats() for use with AsyncAdoClient."""
+    body = {
+        "allOrgs": all_orgs,
+        "displayName": display_name,
+        "scope": scope,
+        "validTo": valid_to,
+    }
+    url = build_url(client.organization, f"_apis/tokens/pats", API_VERSION, base_host="vssps.dev.azure.com")
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['patToken', 'patTokenError'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_pats", PAT)
-logger.info("Creates a new personal access token (PAT) for the requesting user.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "allOrgs": args.all_orgs,
-    "displayName": args.display_name,
-    "scope": args.scope,
-    "validTo": args.valid_to,
-}
+def main() -> None:
+    """Read env vars / flags, call create_pats() and print the result."""
+    organization, pat = get_common_env()
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/tokens/pats", API_VERSION, base_host="vssps.dev.azure.com")
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Creates a new personal access token (PAT) for the requesting user.")
+    parser.add_argument("--all-orgs", required=False, help="True, if this personal access token (PAT) is for all of the user's accessible organizations. Fals...")
+    parser.add_argument("--display-name", required=False, help="The token name")
+    parser.add_argument("--scope", required=False, help="The token scopes for accessing Azure DevOps resources")
+    parser.add_argument("--valid-to", required=False, help="The token expiration date. If the 'Enforce maximum personal access token lifespan' policy is enab...")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_pats", pat)
+    logger.info("Creates a new personal access token (PAT) for the requesting user.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_pats(client, all_orgs=args.all_orgs, display_name=args.display_name, scope=args.scope, valid_to=args.valid_to)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['patToken', 'patTokenError'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
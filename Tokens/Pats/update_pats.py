@@ -11,72 +11,96 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/tokens/pats/update
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Updates an existing personal access token (PAT) with the new parameters.")
-parser.add_argument("--all-orgs", required=False, help="(Optional) True if this personal access token (PAT) is for all of the user's accessible organizat...")
-parser.add_argument("--authorization-id", required=False, help="The authorizationId identifying a single, unique personal access token (PAT)")
-parser.add_argument("--display-name", required=False, help="(Optional) The token name")
-parser.add_argument("--scope", required=False, help="(Optional) The token scopes for accessing Azure DevOps resources")
-parser.add_argument("--valid-to", required=False, help="(Optional) The token expiration date. If the 'Enforce maximum personal access token lifespan' pol...")
-args = parser.parse_args()
+def update_pats(client, *, all_orgs: Optional[str] = None, authorization_id: Optional[str] = None, display_name: Optional[str] = None, scope: Optional[str] = None, valid_to: Optional[str] = None) -> dict:
+    """
+    Updates an existing personal access token (PAT) with the new parameters.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        all_orgs: (Optional) True if this personal access token (PAT) is for all of the user's accessible organizat...
+        authorization_id: The authorizationId identifying a single, unique personal access token (PAT)
+        display_name: (Optional) The token name
+        scope: (Optional) The token scopes for accessing Azure DevOps resources
+        valid_to: (Optional) The token expiration date. If the 'Enforce maximum personal access token lifespan' pol...
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "allOrgs": all_orgs,
+        "authorizationId": authorization_id,
+        "displayName": display_name,
+        "scope": scope,
+        "validTo": valid_to,
+    }
+    url = build_url(client.organization, f"_apis/tokens/pats", API_VERSION, base_host="vssps.dev.azure.com")
+    response = client.request("PUT", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['patToken', 'patTokenError'], API_VERSION)
+    return data
+
+
+async def update_pats_async(client, *, all_orgs: Optional[str] = None, authorization_id: Optional[str] = None, display_name: Optional[str] = None, scope: Optional[str] = None, valid_to: Optional[str] = None) -> dict:
+    """Async variant of update_pats() for use with AsyncAdoClient."""
+    body = {
+        "allOrgs": all_orgs,
+        "authorizationId": authorization_id,
+        "displayName": display_name,
+        "scope": scope,
+        "validTo": valid_to,
+    }
+    url = build_url(client.organization, f"_apis/tokens/pats", API_VERSION, base_host="vssps.dev.azure.com")
+    response = await client.request("PUT", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['patToken', 'patTokenError'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_pats", PAT)
-logger.info("Updates an existing personal access token (PAT) with the new parameters.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "allOrgs": args.all_orgs,
-    "authorizationId": args.authorization_id,
-    "displayName": args.display_name,
-    "scope": args.scope,
-    "validTo": args.valid_to,
-}
+def main() -> None:
+    """Read env vars / flags, call update_pats() and print the result."""
+    organization, pat = get_common_env()
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/tokens/pats", API_VERSION, base_host="vssps.dev.azure.com")
-logger.info(f"PUT {url}")
+    parser = argparse.ArgumentParser(description="Updates an existing personal access token (PAT) with the new parameters.")
+    parser.add_argument("--all-orgs", required=False, help="(Optional) True if this personal access token (PAT) is for all of the user's accessible organizat...")
+    parser.add_argument("--authorization-id", required=False, help="The authorizationId identifying a single, unique personal access token (PAT)")
+    parser.add_argument("--display-name", required=False, help="(Optional) The token name")
+    parser.add_argument("--scope", required=False, help="(Optional) The token scopes for accessing Azure DevOps resources")
+    parser.add_argument("--valid-to", required=False, help="(Optional) The token expiration date. If the 'Enforce maximum personal access token lifespan' pol...")
+    args = parser.parse_args()
 
-response = execute_request("PUT", url, HEADERS, body=body)
+    logger = AdoLogger("update_pats", pat)
+    logger.info("Updates an existing personal access token (PAT) with the new parameters.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_pats(client, all_orgs=args.all_orgs, authorization_id=args.authorization_id, display_name=args.display_name, scope=args.scope, valid_to=args.valid_to)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['patToken', 'patTokenError'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,54 +10,75 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/wiki/attachments/create?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-WIKI_IDENTIFIER = get_env_or_exit("WIKI_IDENTIFIER", "Wiki ID or wiki name.")
-NAME = get_env_or_exit("NAME", "Wiki attachment name.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_attachments", PAT)
-logger.info("Creates an attachment in the wiki.")
+def create_attachments(client, project: str, wiki_identifier: str, name: str) -> dict:
+    """
+    Creates an attachment in the wiki.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/wiki/wikis/{WIKI_IDENTIFIER}/attachments", API_VERSION, project=PROJECT_ID)
-logger.info(f"PUT {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        wiki_identifier: Wiki ID or wiki name.
+        name: Wiki attachment name.
 
-response = execute_request("PUT", url, HEADERS, expected_status=201)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/wiki/wikis/{wiki_identifier}/attachments", API_VERSION, project=project)
+    response = client.request("PUT", url, expected_status=201)
+    data = loads(response.content)
+    version_guard(data, ['name', 'path'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['name', 'path'], API_VERSION)
+async def create_attachments_async(client, project: str, wiki_identifier: str, name: str) -> dict:
+    """Async variant of create_attachments() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/wiki/wikis/{wiki_identifier}/attachments", API_VERSION, project=project)
+    response = await client.request("PUT", url, expected_status=201)
+    data = loads(response.content)
+    version_guard(data, ['name', 'path'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(f"Attachments: {data.get("name", "N/A")}")
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call create_attachments() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    wiki_identifier = require_env("WIKI_IDENTIFIER", "Wiki ID or wiki name.")
+    name = require_env("NAME", "Wiki attachment name.")
+
+    logger = AdoLogger("create_attachments", pat)
+    logger.info("Creates an attachment in the wiki.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = create_attachments(client, project, wiki_identifier, name)
+
+    print(f"Attachments: {data.get('name', 'N/A')}")
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
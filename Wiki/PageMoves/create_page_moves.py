@@ -11,70 +11,92 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/wiki/page-moves/cr
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-WIKI_IDENTIFIER = get_env_or_exit("WIKI_IDENTIFIER", "Wiki ID or wiki name.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Creates a page move operation that updates the path and order of the page as provided in the parameters.")
-parser.add_argument("--new-order", required=False, help="New order of the wiki page.")
-parser.add_argument("--new-path", required=False, help="New path of the wiki page.")
-parser.add_argument("--path", required=False, help="Current path of the wiki page.")
-args = parser.parse_args()
+def create_page_moves(client, project: str, wiki_identifier: str, *, new_order: Optional[str] = None, new_path: Optional[str] = None, path: Optional[str] = None) -> dict:
+    """
+    Creates a page move operation that updates the path and order of the page as provided in the parameters.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        wiki_identifier: Wiki ID or wiki name.
+        new_order: New order of the wiki page.
+        new_path: New path of the wiki page.
+        path: Current path of the wiki page.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "newOrder": new_order,
+        "newPath": new_path,
+        "path": path,
+    }
+    url = build_url(client.organization, f"_apis/wiki/wikis/{wiki_identifier}/pagemoves", API_VERSION, project=project)
+    response = client.request("POST", url, body=body, expected_status=201)
+    data = loads(response.content)
+    version_guard(data, ['page'], API_VERSION)
+    return data
+
+
+async def create_page_moves_async(client, project: str, wiki_identifier: str, *, new_order: Optional[str] = None, new_path: Optional[str] = None, path: Optional[str] = None) -> dict:
+    """Async variant of create_page_moves() for use with AsyncAdoClient."""
+    body = {
+        "newOrder": new_order,
+        "newPath": new_path,
+        "path": path,
+    }
+    url = build_url(client.organization, f"_apis/wiki/wikis/{wiki_identifier}/pagemoves", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body, expected_status=201)
+    data = loads(response.content)
+    version_guard(data, ['page'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_page_moves", PAT)
-logger.info("Creates a page move operation that updates the path and order of the page as provided in the parameters.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "newOrder": args.new_order,
-    "newPath": args.new_path,
-    "path": args.path,
-}
+def main() -> None:
+    """Read env vars / flags, call create_page_moves() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    wiki_identifier = require_env("WIKI_IDENTIFIER", "Wiki ID or wiki name.")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/wiki/wikis/{WIKI_IDENTIFIER}/pagemoves", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Creates a page move operation that updates the path and order of the page as provided in the parameters.")
+    parser.add_argument("--new-order", required=False, help="New order of the wiki page.")
+    parser.add_argument("--new-path", required=False, help="New path of the wiki page.")
+    parser.add_argument("--path", required=False, help="Current path of the wiki page.")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body, expected_status=201)
+    logger = AdoLogger("create_page_moves", pat)
+    logger.info("Creates a page move operation that updates the path and order of the page as provided in the parameters.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_page_moves(client, project, wiki_identifier, new_order=args.new_order, new_path=args.new_path, path=args.path)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['page'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
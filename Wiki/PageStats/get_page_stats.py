@@ -10,54 +10,75 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/wiki/page-stats/get?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-WIKI_IDENTIFIER = get_env_or_exit("WIKI_IDENTIFIER", "Wiki ID or wiki name.")
-PAGE_ID = get_env_or_exit("PAGE_ID", "Wiki page ID.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_page_stats", PAT)
-logger.info("Returns page detail corresponding to Page ID.")
+def get_page_stats(client, project: str, wiki_identifier: str, page_id: str) -> dict:
+    """
+    Returns page detail corresponding to Page ID.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/wiki/wikis/{WIKI_IDENTIFIER}/pages/{PAGE_ID}/stats", API_VERSION, project=PROJECT_ID)
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        wiki_identifier: Wiki ID or wiki name.
+        page_id: Wiki page ID.
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/wiki/wikis/{wiki_identifier}/pages/{page_id}/stats", API_VERSION, project=project)
+    response = client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['id', 'path'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'path'], API_VERSION)
+async def get_page_stats_async(client, project: str, wiki_identifier: str, page_id: str) -> dict:
+    """Async variant of get_page_stats() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/wiki/wikis/{wiki_identifier}/pages/{page_id}/stats", API_VERSION, project=project)
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['id', 'path'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(f"Page Stats ID: {data.get("id", "N/A")}")
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_page_stats() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    wiki_identifier = require_env("WIKI_IDENTIFIER", "Wiki ID or wiki name.")
+    page_id = require_env("PAGE_ID", "Wiki page ID.")
+
+    logger = AdoLogger("get_page_stats", pat)
+    logger.info("Returns page detail corresponding to Page ID.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = get_page_stats(client, project, wiki_identifier, page_id)
+
+    print(f"Page Stats ID: {data.get('id', 'N/A')}")
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
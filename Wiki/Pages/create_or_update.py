@@ -11,68 +11,87 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/wiki/pages/create-
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-WIKI_IDENTIFIER = get_env_or_exit("WIKI_IDENTIFIER", "Wiki ID or wiki name.")
-PATH = get_env_or_exit("PATH", "Wiki page path.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Creates or edits a wiki page.")
-parser.add_argument("--content", required=False, help="Content of the wiki page.")
-args = parser.parse_args()
+def create_or_update(client, project: str, wiki_identifier: str, path: str, *, content: Optional[str] = None) -> dict:
+    """
+    Creates or edits a wiki page.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        wiki_identifier: Wiki ID or wiki name.
+        path: Wiki page path.
+        content: Content of the wiki page.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "content": content,
+    }
+    url = build_url(client.organization, f"_apis/wiki/wikis/{wiki_identifier}/pages", API_VERSION, project=project)
+    response = client.request("PUT", url, body=body, expected_status=201)
+    data = loads(response.content)
+    version_guard(data, ['id', 'gitItemPath'], API_VERSION)
+    return data
+
+
+async def create_or_update_async(client, project: str, wiki_identifier: str, path: str, *, content: Optional[str] = None) -> dict:
+    """Async variant of create_or_update() for use with AsyncAdoClient."""
+    body = {
+        "content": content,
+    }
+    url = build_url(client.organization, f"_apis/wiki/wikis/{wiki_identifier}/pages", API_VERSION, project=project)
+    response = await client.request("PUT", url, body=body, expected_status=201)
+    data = loads(response.content)
+    version_guard(data, ['id', 'gitItemPath'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_or_update", PAT)
-logger.info("Creates or edits a wiki page.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "content": args.content,
-}
+def main() -> None:
+    """Read env vars / flags, call create_or_update() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    wiki_identifier = require_env("WIKI_IDENTIFIER", "Wiki ID or wiki name.")
+    path = require_env("PATH", "Wiki page path.")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/wiki/wikis/{WIKI_IDENTIFIER}/pages", API_VERSION, project=PROJECT_ID)
-logger.info(f"PUT {url}")
+    parser = argparse.ArgumentParser(description="Creates or edits a wiki page.")
+    parser.add_argument("--content", required=False, help="Content of the wiki page.")
+    args = parser.parse_args()
 
-response = execute_request("PUT", url, HEADERS, body=body, expected_status=201)
+    logger = AdoLogger("create_or_update", pat)
+    logger.info("Creates or edits a wiki page.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_or_update(client, project, wiki_identifier, path, content=args.content)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'gitItemPath'], API_VERSION)
+    print(f"Pages ID: {data.get('id', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Pages ID: {data.get("id", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
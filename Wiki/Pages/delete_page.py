@@ -10,54 +10,75 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/wiki/pages/delete-page?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-WIKI_IDENTIFIER = get_env_or_exit("WIKI_IDENTIFIER", "Wiki ID or wiki name.")
-PATH = get_env_or_exit("PATH", "Wiki page path.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("delete_page", PAT)
-logger.info("Deletes a wiki page.")
+def delete_page(client, project: str, wiki_identifier: str, path: str) -> dict:
+    """
+    Deletes a wiki page.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/wiki/wikis/{WIKI_IDENTIFIER}/pages", API_VERSION, project=PROJECT_ID)
-logger.info(f"DELETE {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        wiki_identifier: Wiki ID or wiki name.
+        path: Wiki page path.
 
-response = execute_request("DELETE", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/wiki/wikis/{wiki_identifier}/pages", API_VERSION, project=project)
+    response = client.request("DELETE", url)
+    data = loads(response.content)
+    version_guard(data, ['id', 'gitItemPath'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'gitItemPath'], API_VERSION)
+async def delete_page_async(client, project: str, wiki_identifier: str, path: str) -> dict:
+    """Async variant of delete_page() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/wiki/wikis/{wiki_identifier}/pages", API_VERSION, project=project)
+    response = await client.request("DELETE", url)
+    data = loads(response.content)
+    version_guard(data, ['id', 'gitItemPath'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(f"Pages ID: {data.get("id", "N/A")}")
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call delete_page() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    wiki_identifier = require_env("WIKI_IDENTIFIER", "Wiki ID or wiki name.")
+    path = require_env("PATH", "Wiki page path.")
+
+    logger = AdoLogger("delete_page", pat)
+    logger.info("Deletes a wiki page.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = delete_page(client, project, wiki_identifier, path)
+
+    print(f"Pages ID: {data.get('id', 'N/A')}")
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,65 +11,126 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/wiki/pages-batch/g
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Iterator, Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
+from _shared.pagination import paginate
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-WIKI_IDENTIFIER = get_env_or_exit("WIKI_IDENTIFIER", "Wiki ID or wiki name.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Returns pageable list of Wiki Pages")
-parser.add_argument("--continuation-token", required=False, help="If the list of page data returned is not complete, a continuation token to query next batch of pa...")
-parser.add_argument("--page-views-for-days", required=False, help="last N days from the current day for which page views is to be returned. It's inclusive of curren...")
-parser.add_argument("--top", required=False, help="Total count of pages on a wiki to return.")
-args = parser.parse_args()
+def get_pages_batch(client, project: str, wiki_identifier: str, *, continuation_token: Optional[str] = None, page_views_for_days: Optional[str] = None, top: Optional[str] = None) -> dict:
+    """
+    Returns pageable list of Wiki Pages
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_pages_batch", PAT)
-logger.info("Returns pageable list of Wiki Pages")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        wiki_identifier: Wiki ID or wiki name.
+        continuation_token: If the list of page data returned is not complete, a continuation token to query next batch of pa...
+        page_views_for_days: last N days from the current day for which page views is to be returned. It's inclusive of curren...
+        top: Total count of pages on a wiki to return.
 
-# ---------------------------------------------------------------------------
-# Request body
-# ---------------------------------------------------------------------------
-body = {
-    "continuationToken": args.continuation_token,
-    "pageViewsForDays": args.page_views_for_days,
-    "top": args.top,
-}
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "continuationToken": continuation_token,
+        "pageViewsForDays": page_views_for_days,
+        "top": top,
+    }
+    url = build_url(client.organization, f"_apis/wiki/wikis/{wiki_identifier}/pagesbatch", API_VERSION, project=project)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
+
+
+async def get_pages_batch_async(client, project: str, wiki_identifier: str, *, continuation_token: Optional[str] = None, page_views_for_days: Optional[str] = None, top: Optional[str] = None) -> dict:
+    """Async variant of get_pages_batch() for use with AsyncAdoClient."""
+    body = {
+        "continuationToken": continuation_token,
+        "pageViewsForDays": page_views_for_days,
+        "top": top,
+    }
+    url = build_url(client.organization, f"_apis/wiki/wikis/{wiki_identifier}/pagesbatch", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/wiki/wikis/{WIKI_IDENTIFIER}/pagesbatch", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
 
-response = execute_request("POST", url, HEADERS, body=body)
+def iter_get_pages_batch(client, project: str, wiki_identifier: str, *, continuation_token: Optional[str] = None, page_views_for_days: Optional[str] = None, top: Optional[str] = None, max_items: Optional[int] = None, prefetch: bool = False) -> Iterator[dict]:
+    """
+    Yield every item across all pages of get_pages_batch() (continuation_body paging).
+
+    Takes the same arguments, plus:
+        max_items: Stop after this many items (default: all).
+        prefetch: Fetch the next page while the current one is consumed.
+    """
+    body = {
+        "continuationToken": continuation_token,
+        "pageViewsForDays": page_views_for_days,
+        "top": top,
+    }
+    url = build_url(client.organization, f"_apis/wiki/wikis/{wiki_identifier}/pagesbatch", API_VERSION, project=project)
+    return paginate(client, "POST", url, "continuation_body", body=body,
+                    max_items=max_items, prefetch=prefetch)
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_pages_batch() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    wiki_identifier = require_env("WIKI_IDENTIFIER", "Wiki ID or wiki name.")
+
+    parser = argparse.ArgumentParser(description="Returns pageable list of Wiki Pages")
+    parser.add_argument("--continuation-token", required=False, help="If the list of page data returned is not complete, a continuation token to query next batch of pa...")
+    parser.add_argument("--page-views-for-days", required=False, help="last N days from the current day for which page views is to be returned. It's inclusive of curren...")
+    parser.add_argument("--top", required=False, help="Total count of pages on a wiki to return.")
+    parser.add_argument("--all-pages", action="store_true", help="Follow pagination and return every item")
+    parser.add_argument("--max-items", type=int, help="Follow pagination up to this many items")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("get_pages_batch", pat)
+    logger.info("Returns pageable list of Wiki Pages")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        if args.all_pages or args.max_items:
+            items = iter_get_pages_batch(client, project, wiki_identifier, continuation_token=args.continuation_token, page_views_for_days=args.page_views_for_days, top=args.top, max_items=args.max_items, prefetch=True)
+        else:
+            items = items_of(get_pages_batch(client, project, wiki_identifier, continuation_token=args.continuation_token, page_views_for_days=args.page_views_for_days, top=args.top), "value")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    if args.all_pages or args.max_items:
+        items = list(iter_get_pages_batch(client, project, wiki_identifier, continuation_token=args.continuation_token, page_views_for_days=args.page_views_for_days, top=args.top, max_items=args.max_items, prefetch=True))
+        data = {"count": len(items), "value": items}
+    else:
+        data = get_pages_batch(client, project, wiki_identifier, continuation_token=args.continuation_token, page_views_for_days=args.page_views_for_days, top=args.top)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
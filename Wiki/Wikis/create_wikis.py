@@ -11,66 +11,83 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/wiki/wikis/create?
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Creates the wiki resource.")
-parser.add_argument("--version", required=False, help="Version of the wiki. Not required for ProjectWiki type.")
-args = parser.parse_args()
+def create_wikis(client, project: str, *, version: Optional[str] = None) -> dict:
+    """
+    Creates the wiki resource.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        version: Version of the wiki. Not required for ProjectWiki type.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "version": version,
+    }
+    url = build_url(client.organization, f"_apis/wiki/wikis", API_VERSION, project=project)
+    response = client.request("POST", url, body=body, expected_status=201)
+    data = loads(response.content)
+    version_guard(data, ['id', 'isDisabled'], API_VERSION)
+    return data
+
+
+async def create_wikis_async(client, project: str, *, version: Optional[str] = None) -> dict:
+    """Async variant of create_wikis() for use with AsyncAdoClient."""
+    body = {
+        "version": version,
+    }
+    url = build_url(client.organization, f"_apis/wiki/wikis", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body, expected_status=201)
+    data = loads(response.content)
+    version_guard(data, ['id', 'isDisabled'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_wikis", PAT)
-logger.info("Creates the wiki resource.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "version": args.version,
-}
+def main() -> None:
+    """Read env vars / flags, call create_wikis() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/wiki/wikis", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Creates the wiki resource.")
+    parser.add_argument("--version", required=False, help="Version of the wiki. Not required for ProjectWiki type.")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body, expected_status=201)
+    logger = AdoLogger("create_wikis", pat)
+    logger.info("Creates the wiki resource.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_wikis(client, project, version=args.version)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'isDisabled'], API_VERSION)
+    print(f"Wikis ID: {data.get('id', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Wikis ID: {data.get("id", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,69 +11,89 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/wiki/wikis/update?
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-WIKI_IDENTIFIER = get_env_or_exit("WIKI_IDENTIFIER", "Wiki ID or wiki name.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Updates the wiki corresponding to the wiki ID or wiki name provided using the update parameters.")
-parser.add_argument("--name", required=False, help="Name for wiki.")
-parser.add_argument("--versions", required=False, help="Versions of the wiki.")
-args = parser.parse_args()
+def update_wikis(client, project: str, wiki_identifier: str, *, name: Optional[str] = None, versions: Optional[str] = None) -> dict:
+    """
+    Updates the wiki corresponding to the wiki ID or wiki name provided using the update parameters.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        wiki_identifier: Wiki ID or wiki name.
+        name: Name for wiki.
+        versions: Versions of the wiki.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "name": name,
+        "versions": versions,
+    }
+    url = build_url(client.organization, f"_apis/wiki/wikis/{wiki_identifier}", API_VERSION, project=project)
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'isDisabled'], API_VERSION)
+    return data
+
+
+async def update_wikis_async(client, project: str, wiki_identifier: str, *, name: Optional[str] = None, versions: Optional[str] = None) -> dict:
+    """Async variant of update_wikis() for use with AsyncAdoClient."""
+    body = {
+        "name": name,
+        "versions": versions,
+    }
+    url = build_url(client.organization, f"_apis/wiki/wikis/{wiki_identifier}", API_VERSION, project=project)
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'isDisabled'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_wikis", PAT)
-logger.info("Updates the wiki corresponding to the wiki ID or wiki name provided using the update parameters.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "name": args.name,
-    "versions": args.versions,
-}
+def main() -> None:
+    """Read env vars / flags, call update_wikis() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    wiki_identifier = require_env("WIKI_IDENTIFIER", "Wiki ID or wiki name.")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/wiki/wikis/{WIKI_IDENTIFIER}", API_VERSION, project=PROJECT_ID)
-logger.info(f"PATCH {url}")
+    parser = argparse.ArgumentParser(description="Updates the wiki corresponding to the wiki ID or wiki name provided using the update parameters.")
+    parser.add_argument("--name", required=False, help="Name for wiki.")
+    parser.add_argument("--versions", required=False, help="Versions of the wiki.")
+    args = parser.parse_args()
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+    logger = AdoLogger("update_wikis", pat)
+    logger.info("Updates the wiki corresponding to the wiki ID or wiki name provided using the update parameters.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_wikis(client, project, wiki_identifier, name=args.name, versions=args.versions)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'isDisabled'], API_VERSION)
+    print(f"Wikis ID: {data.get('id', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Wikis ID: {data.get("id", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,49 +10,86 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/work/boardparents/list?view=azure-devops-rest-7.2
 """
 
-import json
+import argparse
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-CHILD_BACKLOG_CONTEXT_CATEGORY_REF_NAME = get_env_or_exit("CHILD_BACKLOG_CONTEXT_CATEGORY_REF_NAME", "childBacklogContextCategoryRefName")
-WORKITEM_IDS = get_env_or_exit("WORKITEM_IDS", "workitemIds")
-TEAM_ID = get_env_or_exit("TEAM_ID", "Team ID or team name")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("list_boardparents", PAT)
-logger.info("Returns the list of parent field filter model for the given list of workitem ids")
+def list_boardparents(client, project: str, child_backlog_context_category_ref_name: str, workitem_ids: str, team: str) -> dict:
+    """
+    Returns the list of parent field filter model for the given list of workitem ids
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"{TEAM_ID}/_apis/work/boards/boardparents", API_VERSION, project=PROJECT_ID)
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        child_backlog_context_category_ref_name: childBacklogContextCategoryRefName
+        workitem_ids: workitemIds
+        team: Team ID or team name
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"{team}/_apis/work/boards/boardparents", API_VERSION, project=project)
+    response = client.request("GET", url)
+    data = loads(response.content)
+    return data
+
+
+async def list_boardparents_async(client, project: str, child_backlog_context_category_ref_name: str, workitem_ids: str, team: str) -> dict:
+    """Async variant of list_boardparents() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"{team}/_apis/work/boards/boardparents", API_VERSION, project=project)
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call list_boardparents() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    child_backlog_context_category_ref_name = require_env("CHILD_BACKLOG_CONTEXT_CATEGORY_REF_NAME", "childBacklogContextCategoryRefName")
+    workitem_ids = require_env("WORKITEM_IDS", "workitemIds")
+    team = require_env("TEAM_ID", "Team ID or team name")
+
+    parser = argparse.ArgumentParser(description="Returns the list of parent field filter model for the given list of workitem ids")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("list_boardparents", pat)
+    logger.info("Returns the list of parent field filter model for the given list of workitem ids")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        items = items_of(list_boardparents(client, project, child_backlog_context_category_ref_name, workitem_ids, team), "value")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    data = list_boardparents(client, project, child_backlog_context_category_ref_name, workitem_ids, team)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
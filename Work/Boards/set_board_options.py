@@ -10,48 +10,72 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/work/boards/set-board-options?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-RESOURCE_ID = get_env_or_exit("RESOURCE_ID", "identifier for board, either category plural name (Eg:'Stories') or guid")
-TEAM_ID = get_env_or_exit("TEAM_ID", "Team ID or team name")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("set_board_options", PAT)
-logger.info("Update board options")
+def set_board_options(client, project: str, id: str, team: str) -> dict:
+    """
+    Update board options
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        id: identifier for board, either category plural name (Eg:'Stories') or guid
+        team: Team ID or team name
+
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"{team}/_apis/work/boards/{id}", API_VERSION, project=project)
+    response = client.request("PUT", url)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"{TEAM_ID}/_apis/work/boards/{RESOURCE_ID}", API_VERSION, project=PROJECT_ID)
-logger.info(f"PUT {url}")
 
-response = execute_request("PUT", url, HEADERS)
+async def set_board_options_async(client, project: str, id: str, team: str) -> dict:
+    """Async variant of set_board_options() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"{team}/_apis/work/boards/{id}", API_VERSION, project=project)
+    response = await client.request("PUT", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call set_board_options() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    id = require_env("RESOURCE_ID", "identifier for board, either category plural name (Eg:'Stories') or guid")
+    team = require_env("TEAM_ID", "Team ID or team name")
+
+    logger = AdoLogger("set_board_options", pat)
+    logger.info("Update board options")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = set_board_options(client, project, id, team)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
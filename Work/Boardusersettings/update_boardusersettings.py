@@ -10,53 +10,74 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/work/boardusersettings/update?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-BOARD = get_env_or_exit("BOARD", "board")
-TEAM_ID = get_env_or_exit("TEAM_ID", "Team ID or team name")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_boardusersettings", PAT)
-logger.info("Update board user settings for the board id We don't want stakeholders to update board settings (currently just autor...")
+def update_boardusersettings(client, project: str, board: str, team: str) -> dict:
+    """
+    Update board user settings for the board id We don't want stakeholders to update board settings (currently just autor...
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"{TEAM_ID}/_apis/work/boards/{BOARD}/boardusersettings", API_VERSION, project=PROJECT_ID)
-logger.info(f"PATCH {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        board: board
+        team: Team ID or team name
 
-response = execute_request("PATCH", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"{team}/_apis/work/boards/{board}/boardusersettings", API_VERSION, project=project)
+    response = client.request("PATCH", url)
+    data = loads(response.content)
+    version_guard(data, ['autoRefreshState'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['autoRefreshState'], API_VERSION)
+async def update_boardusersettings_async(client, project: str, board: str, team: str) -> dict:
+    """Async variant of update_boardusersettings() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"{team}/_apis/work/boards/{board}/boardusersettings", API_VERSION, project=project)
+    response = await client.request("PATCH", url)
+    data = loads(response.content)
+    version_guard(data, ['autoRefreshState'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call update_boardusersettings() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    board = require_env("BOARD", "board")
+    team = require_env("TEAM_ID", "Team ID or team name")
+
+    logger = AdoLogger("update_boardusersettings", pat)
+    logger.info("Update board user settings for the board id We don't want stakeholders to update board settings (currently just autor...")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = update_boardusersettings(client, project, board, team)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,54 +10,76 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/work/capacities/get-capacity-with-identity-ref?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-ITERATION_ID = get_env_or_exit("ITERATION_ID", "ID of the iteration")
-TEAM_MEMBER_ID = get_env_or_exit("TEAM_MEMBER_ID", "ID of the team member")
-TEAM_ID = get_env_or_exit("TEAM_ID", "Team ID or team name")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_capacity_with_identity_ref", PAT)
-logger.info("Get a team member's capacity")
+def get_capacity_with_identity_ref(client, project: str, iteration_id: str, team_member_id: str, team: str) -> dict:
+    """
+    Get a team member's capacity
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"{TEAM_ID}/_apis/work/teamsettings/iterations/{ITERATION_ID}/capacities/{TEAM_MEMBER_ID}", API_VERSION, project=PROJECT_ID)
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        iteration_id: ID of the iteration
+        team_member_id: ID of the team member
+        team: Team ID or team name
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"{team}/_apis/work/teamsettings/iterations/{iteration_id}/capacities/{team_member_id}", API_VERSION, project=project)
+    response = client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['teamMember'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['teamMember'], API_VERSION)
+async def get_capacity_with_identity_ref_async(client, project: str, iteration_id: str, team_member_id: str, team: str) -> dict:
+    """Async variant of get_capacity_with_identity_ref() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"{team}/_apis/work/teamsettings/iterations/{iteration_id}/capacities/{team_member_id}", API_VERSION, project=project)
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['teamMember'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_capacity_with_identity_ref() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    iteration_id = require_env("ITERATION_ID", "ID of the iteration")
+    team_member_id = require_env("TEAM_MEMBER_ID", "ID of the team member")
+    team = require_env("TEAM_ID", "Team ID or team name")
+
+    logger = AdoLogger("get_capacity_with_identity_ref", pat)
+    logger.info("Get a team member's capacity")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = get_capacity_with_identity_ref(client, project, iteration_id, team_member_id, team)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,48 +10,84 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/work/capacities/replace-capacities-with-identity-ref?view=azure-devops-rest-7.2
 """
 
-import json
+import argparse
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-ITERATION_ID = get_env_or_exit("ITERATION_ID", "ID of the iteration")
-TEAM_ID = get_env_or_exit("TEAM_ID", "Team ID or team name")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("set_replace_capacities_with_identity_ref", PAT)
-logger.info("Replace a team's capacity")
+def set_replace_capacities_with_identity_ref(client, project: str, iteration_id: str, team: str) -> dict:
+    """
+    Replace a team's capacity
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"{TEAM_ID}/_apis/work/teamsettings/iterations/{ITERATION_ID}/capacities", API_VERSION, project=PROJECT_ID)
-logger.info(f"PUT {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        iteration_id: ID of the iteration
+        team: Team ID or team name
 
-response = execute_request("PUT", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"{team}/_apis/work/teamsettings/iterations/{iteration_id}/capacities", API_VERSION, project=project)
+    response = client.request("PUT", url)
+    data = loads(response.content)
+    return data
+
+
+async def set_replace_capacities_with_identity_ref_async(client, project: str, iteration_id: str, team: str) -> dict:
+    """Async variant of set_replace_capacities_with_identity_ref() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"{team}/_apis/work/teamsettings/iterations/{iteration_id}/capacities", API_VERSION, project=project)
+    response = await client.request("PUT", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call set_replace_capacities_with_identity_ref() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    iteration_id = require_env("ITERATION_ID", "ID of the iteration")
+    team = require_env("TEAM_ID", "Team ID or team name")
+
+    parser = argparse.ArgumentParser(description="Replace a team's capacity")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("set_replace_capacities_with_identity_ref", pat)
+    logger.info("Replace a team's capacity")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        items = items_of(set_replace_capacities_with_identity_ref(client, project, iteration_id, team), "value")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    data = set_replace_capacities_with_identity_ref(client, project, iteration_id, team)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
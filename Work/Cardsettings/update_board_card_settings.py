@@ -11,67 +11,86 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/work/cardsettings/
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-BOARD = get_env_or_exit("BOARD", "board")
-TEAM_ID = get_env_or_exit("TEAM_ID", "Team ID or team name")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Update board card settings for the board id or board by name")
-parser.add_argument("--cards", required=False, help="cards")
-args = parser.parse_args()
+def update_board_card_settings(client, project: str, board: str, team: str, *, cards: Optional[str] = None) -> dict:
+    """
+    Update board card settings for the board id or board by name
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        board: board
+        team: Team ID or team name
+        cards: cards
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "cards": cards,
+    }
+    url = build_url(client.organization, f"{team}/_apis/work/boards/{board}/cardsettings", API_VERSION, project=project)
+    response = client.request("PUT", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['cards'], API_VERSION)
+    return data
+
+
+async def update_board_card_settings_async(client, project: str, board: str, team: str, *, cards: Optional[str] = None) -> dict:
+    """Async variant of update_board_card_settings() for use with AsyncAdoClient."""
+    body = {
+        "cards": cards,
+    }
+    url = build_url(client.organization, f"{team}/_apis/work/boards/{board}/cardsettings", API_VERSION, project=project)
+    response = await client.request("PUT", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['cards'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_board_card_settings", PAT)
-logger.info("Update board card settings for the board id or board by name")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "cards": args.cards,
-}
+def main() -> None:
+    """Read env vars / flags, call update_board_card_settings() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    board = require_env("BOARD", "board")
+    team = require_env("TEAM_ID", "Team ID or team name")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"{TEAM_ID}/_apis/work/boards/{BOARD}/cardsettings", API_VERSION, project=PROJECT_ID)
-logger.info(f"PUT {url}")
+    parser = argparse.ArgumentParser(description="Update board card settings for the board id or board by name")
+    parser.add_argument("--cards", required=False, help="cards")
+    args = parser.parse_args()
 
-response = execute_request("PUT", url, HEADERS, body=body)
+    logger = AdoLogger("update_board_card_settings", pat)
+    logger.info("Update board card settings for the board id or board by name")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_board_card_settings(client, project, board, team, cards=args.cards)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['cards'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,49 +10,74 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/work/chartimages/get-iteration-chart-image?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-TEAM_ID = get_env_or_exit("TEAM_ID", "Team ID or team name")
-ITERATION_ID = get_env_or_exit("ITERATION_ID", "ID of the iteration.")
-NAME = get_env_or_exit("NAME", "The chart name. e.g. Burndown.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_iteration_chart_image", PAT)
-logger.info("Get an iteration chart image.")
+def get_iteration_chart_image(client, project: str, team: str, iteration_id: str, name: str) -> dict:
+    """
+    Get an iteration chart image.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        team: Team ID or team name
+        iteration_id: ID of the iteration.
+        name: The chart name. e.g. Burndown.
+
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"{team}/_apis/work/iterations/{iteration_id}/chartimages/{name}", API_VERSION, project=project)
+    response = client.request("GET", url)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"{TEAM_ID}/_apis/work/iterations/{ITERATION_ID}/chartimages/{NAME}", API_VERSION, project=PROJECT_ID)
-logger.info(f"GET {url}")
 
-response = execute_request("GET", url, HEADERS)
+async def get_iteration_chart_image_async(client, project: str, team: str, iteration_id: str, name: str) -> dict:
+    """Async variant of get_iteration_chart_image() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"{team}/_apis/work/iterations/{iteration_id}/chartimages/{name}", API_VERSION, project=project)
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_iteration_chart_image() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    team = require_env("TEAM_ID", "Team ID or team name")
+    iteration_id = require_env("ITERATION_ID", "ID of the iteration.")
+    name = require_env("NAME", "The chart name. e.g. Burndown.")
+
+    logger = AdoLogger("get_iteration_chart_image", pat)
+    logger.info("Get an iteration chart image.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = get_iteration_chart_image(client, project, team, iteration_id, name)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,68 +11,88 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/work/charts/update
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-BOARD = get_env_or_exit("BOARD", "Identifier for board, either board's backlog level name (Eg:'Stories') or Id")
-NAME = get_env_or_exit("NAME", "The chart name")
-TEAM_ID = get_env_or_exit("TEAM_ID", "Team ID or team name")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Update a board chart")
-parser.add_argument("--settings", required=False, help="The settings for the resource")
-args = parser.parse_args()
+def update_charts(client, project: str, board: str, name: str, team: str, *, settings: Optional[str] = None) -> dict:
+    """
+    Update a board chart
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        board: Identifier for board, either board's backlog level name (Eg:'Stories') or Id
+        name: The chart name
+        team: Team ID or team name
+        settings: The settings for the resource
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "settings": settings,
+    }
+    url = build_url(client.organization, f"{team}/_apis/work/boards/{board}/charts/{name}", API_VERSION, project=project)
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['settings'], API_VERSION)
+    return data
+
+
+async def update_charts_async(client, project: str, board: str, name: str, team: str, *, settings: Optional[str] = None) -> dict:
+    """Async variant of update_charts() for use with AsyncAdoClient."""
+    body = {
+        "settings": settings,
+    }
+    url = build_url(client.organization, f"{team}/_apis/work/boards/{board}/charts/{name}", API_VERSION, project=project)
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['settings'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_charts", PAT)
-logger.info("Update a board chart")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "settings": args.settings,
-}
+def main() -> None:
+    """Read env vars / flags, call update_charts() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    board = require_env("BOARD", "Identifier for board, either board's backlog level name (Eg:'Stories') or Id")
+    name = require_env("NAME", "The chart name")
+    team = require_env("TEAM_ID", "Team ID or team name")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"{TEAM_ID}/_apis/work/boards/{BOARD}/charts/{NAME}", API_VERSION, project=PROJECT_ID)
-logger.info(f"PATCH {url}")
+    parser = argparse.ArgumentParser(description="Update a board chart")
+    parser.add_argument("--settings", required=False, help="The settings for the resource")
+    args = parser.parse_args()
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+    logger = AdoLogger("update_charts", pat)
+    logger.info("Update a board chart")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_charts(client, project, board, name, team, settings=args.settings)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['settings'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
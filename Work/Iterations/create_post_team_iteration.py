@@ -11,73 +11,97 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/work/iterations/po
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-TEAM_ID = get_env_or_exit("TEAM_ID", "Team ID or team name")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Add an iteration to the team")
-parser.add_argument("--attributes", required=False, help="Attributes of the iteration such as start and end date.")
-parser.add_argument("--id", required=False, help="Id of the iteration.")
-parser.add_argument("--name", required=False, help="Name of the iteration.")
-parser.add_argument("--path", required=False, help="Relative path of the iteration.")
-args = parser.parse_args()
+def create_post_team_iteration(client, project: str, team: str, *, attributes: Optional[str] = None, id: Optional[str] = None, name: Optional[str] = None, path: Optional[str] = None) -> dict:
+    """
+    Add an iteration to the team
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        team: Team ID or team name
+        attributes: Attributes of the iteration such as start and end date.
+        id: Id of the iteration.
+        name: Name of the iteration.
+        path: Relative path of the iteration.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "attributes": attributes,
+        "id": id,
+        "name": name,
+        "path": path,
+    }
+    url = build_url(client.organization, f"{team}/_apis/work/teamsettings/iterations", API_VERSION, project=project)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name', 'attributes'], API_VERSION)
+    return data
+
+
+async def create_post_team_iteration_async(client, project: str, team: str, *, attributes: Optional[str] = None, id: Optional[str] = None, name: Optional[str] = None, path: Optional[str] = None) -> dict:
+    """Async variant of create_post_team_iteration() for use with AsyncAdoClient."""
+    body = {
+        "attributes": attributes,
+        "id": id,
+        "name": name,
+        "path": path,
+    }
+    url = build_url(client.organization, f"{team}/_apis/work/teamsettings/iterations", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name', 'attributes'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_post_team_iteration", PAT)
-logger.info("Add an iteration to the team")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "attributes": args.attributes,
-    "id": args.id,
-    "name": args.name,
-    "path": args.path,
-}
+def main() -> None:
+    """Read env vars / flags, call create_post_team_iteration() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    team = require_env("TEAM_ID", "Team ID or team name")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"{TEAM_ID}/_apis/work/teamsettings/iterations", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Add an iteration to the team")
+    parser.add_argument("--attributes", required=False, help="Attributes of the iteration such as start and end date.")
+    parser.add_argument("--id", required=False, help="Id of the iteration.")
+    parser.add_argument("--name", required=False, help="Name of the iteration.")
+    parser.add_argument("--path", required=False, help="Relative path of the iteration.")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_post_team_iteration", pat)
+    logger.info("Add an iteration to the team")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_post_team_iteration(client, project, team, attributes=args.attributes, id=args.id, name=args.name, path=args.path)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'name', 'attributes'], API_VERSION)
+    print(f"Iterations: {data.get('name', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Iterations: {data.get("name", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
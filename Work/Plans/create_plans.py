@@ -11,72 +11,95 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/work/plans/create?
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Add a new plan for the team")
-parser.add_argument("--description", required=False, help="Description of the plan")
-parser.add_argument("--name", required=False, help="Name of the plan to create.")
-parser.add_argument("--properties", required=False, help="Plan properties.")
-parser.add_argument("--type", required=False, help="Type of plan to create.")
-args = parser.parse_args()
+def create_plans(client, project: str, *, description: Optional[str] = None, name: Optional[str] = None, properties: Optional[str] = None, type: Optional[str] = None) -> dict:
+    """
+    Add a new plan for the team
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        description: Description of the plan
+        name: Name of the plan to create.
+        properties: Plan properties.
+        type: Type of plan to create.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "description": description,
+        "name": name,
+        "properties": properties,
+        "type": type,
+    }
+    url = build_url(client.organization, f"_apis/work/plans", API_VERSION, project=project)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name', 'createdByIdentity'], API_VERSION)
+    return data
+
+
+async def create_plans_async(client, project: str, *, description: Optional[str] = None, name: Optional[str] = None, properties: Optional[str] = None, type: Optional[str] = None) -> dict:
+    """Async variant of create_plans() for use with AsyncAdoClient."""
+    body = {
+        "description": description,
+        "name": name,
+        "properties": properties,
+        "type": type,
+    }
+    url = build_url(client.organization, f"_apis/work/plans", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name', 'createdByIdentity'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_plans", PAT)
-logger.info("Add a new plan for the team")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "description": args.description,
-    "name": args.name,
-    "properties": args.properties,
-    "type": args.type,
-}
+def main() -> None:
+    """Read env vars / flags, call create_plans() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/work/plans", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Add a new plan for the team")
+    parser.add_argument("--description", required=False, help="Description of the plan")
+    parser.add_argument("--name", required=False, help="Name of the plan to create.")
+    parser.add_argument("--properties", required=False, help="Plan properties.")
+    parser.add_argument("--type", required=False, help="Type of plan to create.")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_plans", pat)
+    logger.info("Add a new plan for the team")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_plans(client, project, description=args.description, name=args.name, properties=args.properties, type=args.type)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'name', 'createdByIdentity'], API_VERSION)
+    print(f"Plans: {data.get('name', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Plans: {data.get("name", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,63 +11,86 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/work/taskboard-wor
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-TEAM_ID = get_env_or_exit("TEAM_ID", "Team ID or team name")
-ITERATION_ID = get_env_or_exit("ITERATION_ID", "iterationId")
-WORK_ITEM_ID = get_env_or_exit("WORK_ITEM_ID", "workItemId")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Update for Taskboard Work Items")
-parser.add_argument("--new-column", required=False, help="newColumn")
-args = parser.parse_args()
+def update_taskboard_work_items(client, project: str, team: str, iteration_id: str, work_item_id: str, *, new_column: Optional[str] = None) -> dict:
+    """
+    Update for Taskboard Work Items
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_taskboard_work_items", PAT)
-logger.info("Update for Taskboard Work Items")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        team: Team ID or team name
+        iteration_id: iterationId
+        work_item_id: workItemId
+        new_column: newColumn
 
-# ---------------------------------------------------------------------------
-# Request body
-# ---------------------------------------------------------------------------
-body = {
-    "newColumn": args.new_column,
-}
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "newColumn": new_column,
+    }
+    url = build_url(client.organization, f"{team}/_apis/work/taskboardworkitems/{iteration_id}/{work_item_id}", API_VERSION, project=project)
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"{TEAM_ID}/_apis/work/taskboardworkitems/{ITERATION_ID}/{WORK_ITEM_ID}", API_VERSION, project=PROJECT_ID)
-logger.info(f"PATCH {url}")
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+async def update_taskboard_work_items_async(client, project: str, team: str, iteration_id: str, work_item_id: str, *, new_column: Optional[str] = None) -> dict:
+    """Async variant of update_taskboard_work_items() for use with AsyncAdoClient."""
+    body = {
+        "newColumn": new_column,
+    }
+    url = build_url(client.organization, f"{team}/_apis/work/taskboardworkitems/{iteration_id}/{work_item_id}", API_VERSION, project=project)
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call update_taskboard_work_items() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    team = require_env("TEAM_ID", "Team ID or team name")
+    iteration_id = require_env("ITERATION_ID", "iterationId")
+    work_item_id = require_env("WORK_ITEM_ID", "workItemId")
+
+    parser = argparse.ArgumentParser(description="Update for Taskboard Work Items")
+    parser.add_argument("--new-column", required=False, help="newColumn")
+    args = parser.parse_args()
+
+    logger = AdoLogger("update_taskboard_work_items", pat)
+    logger.info("Update for Taskboard Work Items")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = update_taskboard_work_items(client, project, team, iteration_id, work_item_id, new_column=args.new_column)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,67 +11,86 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/work/teamdaysoff/u
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-ITERATION_ID = get_env_or_exit("ITERATION_ID", "ID of the iteration")
-TEAM_ID = get_env_or_exit("TEAM_ID", "Team ID or team name")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Set a team's days off for an iteration")
-parser.add_argument("--days-off", required=False, help="daysOff")
-args = parser.parse_args()
+def update_teamdaysoff(client, project: str, iteration_id: str, team: str, *, days_off: Optional[str] = None) -> dict:
+    """
+    Set a team's days off for an iteration
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        iteration_id: ID of the iteration
+        team: Team ID or team name
+        days_off: daysOff
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "daysOff": days_off,
+    }
+    url = build_url(client.organization, f"{team}/_apis/work/teamsettings/iterations/{iteration_id}/teamdaysoff", API_VERSION, project=project)
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['daysOff'], API_VERSION)
+    return data
+
+
+async def update_teamdaysoff_async(client, project: str, iteration_id: str, team: str, *, days_off: Optional[str] = None) -> dict:
+    """Async variant of update_teamdaysoff() for use with AsyncAdoClient."""
+    body = {
+        "daysOff": days_off,
+    }
+    url = build_url(client.organization, f"{team}/_apis/work/teamsettings/iterations/{iteration_id}/teamdaysoff", API_VERSION, project=project)
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['daysOff'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_teamdaysoff", PAT)
-logger.info("Set a team's days off for an iteration")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "daysOff": args.days_off,
-}
+def main() -> None:
+    """Read env vars / flags, call update_teamdaysoff() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    iteration_id = require_env("ITERATION_ID", "ID of the iteration")
+    team = require_env("TEAM_ID", "Team ID or team name")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"{TEAM_ID}/_apis/work/teamsettings/iterations/{ITERATION_ID}/teamdaysoff", API_VERSION, project=PROJECT_ID)
-logger.info(f"PATCH {url}")
+    parser = argparse.ArgumentParser(description="Set a team's days off for an iteration")
+    parser.add_argument("--days-off", required=False, help="daysOff")
+    args = parser.parse_args()
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+    logger = AdoLogger("update_teamdaysoff", pat)
+    logger.info("Set a team's days off for an iteration")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_teamdaysoff(client, project, iteration_id, team, days_off=args.days_off)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['daysOff'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,68 +11,88 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/work/teamfieldvalu
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-TEAM_ID = get_env_or_exit("TEAM_ID", "Team ID or team name")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Update team field values")
-parser.add_argument("--default-value", required=False, help="defaultValue")
-parser.add_argument("--values", required=False, help="values")
-args = parser.parse_args()
+def update_teamfieldvalues(client, project: str, team: str, *, default_value: Optional[str] = None, values: Optional[str] = None) -> dict:
+    """
+    Update team field values
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        team: Team ID or team name
+        default_value: defaultValue
+        values: values
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "defaultValue": default_value,
+        "values": values,
+    }
+    url = build_url(client.organization, f"{team}/_apis/work/teamsettings/teamfieldvalues", API_VERSION, project=project)
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['defaultValue', 'field'], API_VERSION)
+    return data
+
+
+async def update_teamfieldvalues_async(client, project: str, team: str, *, default_value: Optional[str] = None, values: Optional[str] = None) -> dict:
+    """Async variant of update_teamfieldvalues() for use with AsyncAdoClient."""
+    body = {
+        "defaultValue": default_value,
+        "values": values,
+    }
+    url = build_url(client.organization, f"{team}/_apis/work/teamsettings/teamfieldvalues", API_VERSION, project=project)
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['defaultValue', 'field'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_teamfieldvalues", PAT)
-logger.info("Update team field values")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "defaultValue": args.default_value,
-    "values": args.values,
-}
+def main() -> None:
+    """Read env vars / flags, call update_teamfieldvalues() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    team = require_env("TEAM_ID", "Team ID or team name")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"{TEAM_ID}/_apis/work/teamsettings/teamfieldvalues", API_VERSION, project=PROJECT_ID)
-logger.info(f"PATCH {url}")
+    parser = argparse.ArgumentParser(description="Update team field values")
+    parser.add_argument("--default-value", required=False, help="defaultValue")
+    parser.add_argument("--values", required=False, help="values")
+    args = parser.parse_args()
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+    logger = AdoLogger("update_teamfieldvalues", pat)
+    logger.info("Update team field values")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_teamfieldvalues(client, project, team, default_value=args.default_value, values=args.values)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['defaultValue', 'field'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
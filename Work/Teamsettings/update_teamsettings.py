@@ -11,76 +11,104 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/work/teamsettings/
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-TEAM_ID = get_env_or_exit("TEAM_ID", "Team ID or team name")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Update a team's settings")
-parser.add_argument("--backlog-iteration", required=False, help="backlogIteration")
-parser.add_argument("--backlog-visibilities", required=False, help="backlogVisibilities")
-parser.add_argument("--bugs-behavior", required=False, help="bugsBehavior")
-parser.add_argument("--default-iteration", required=False, help="defaultIteration")
-parser.add_argument("--default-iteration-macro", required=False, help="defaultIterationMacro")
-parser.add_argument("--working-days", required=False, help="workingDays")
-args = parser.parse_args()
+def update_teamsettings(client, project: str, team: str, *, backlog_iteration: Optional[str] = None, backlog_visibilities: Optional[str] = None, bugs_behavior: Optional[str] = None, default_iteration: Optional[str] = None, default_iteration_macro: Optional[str] = None, working_days: Optional[str] = None) -> dict:
+    """
+    Update a team's settings
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        team: Team ID or team name
+        backlog_iteration: backlogIteration
+        backlog_visibilities: backlogVisibilities
+        bugs_behavior: bugsBehavior
+        default_iteration: defaultIteration
+        default_iteration_macro: defaultIterationMacro
+        working_days: workingDays
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "backlogIteration": backlog_iteration,
+        "backlogVisibilities": backlog_visibilities,
+        "bugsBehavior": bugs_behavior,
+        "defaultIteration": default_iteration,
+        "defaultIterationMacro": default_iteration_macro,
+        "workingDays": working_days,
+    }
+    url = build_url(client.organization, f"{team}/_apis/work/teamsettings", API_VERSION, project=project)
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['backlogIteration', 'backlogVisibilities'], API_VERSION)
+    return data
+
+
+async def update_teamsettings_async(client, project: str, team: str, *, backlog_iteration: Optional[str] = None, backlog_visibilities: Optional[str] = None, bugs_behavior: Optional[str] = None, default_iteration: Optional[str] = None, default_iteration_macro: Optional[str] = None, working_days: Optional[str] = None) -> dict:
+    """Async variant of update_teamsettings() for use with AsyncAdoClient."""
+    body = {
+        "backlogIteration": backlog_iteration,
+        "backlogVisibilities": backlog_visibilities,
+        "bugsBehavior": bugs_behavior,
+        "defaultIteration": default_iteration,
+        "defaultIterationMacro": default_iteration_macro,
+        "workingDays": working_days,
+    }
+    url = build_url(client.organization, f"{team}/_apis/work/teamsettings", API_VERSION, project=project)
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['backlogIteration', 'backlogVisibilities'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_teamsettings", PAT)
-logger.info("Update a team's settings")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "backlogIteration": args.backlog_iteration,
-    "backlogVisibilities": args.backlog_visibilities,
-    "bugsBehavior": args.bugs_behavior,
-    "defaultIteration": args.default_iteration,
-    "defaultIterationMacro": args.default_iteration_macro,
-    "workingDays": args.working_days,
-}
+def main() -> None:
+    """Read env vars / flags, call update_teamsettings() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    team = require_env("TEAM_ID", "Team ID or team name")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"{TEAM_ID}/_apis/work/teamsettings", API_VERSION, project=PROJECT_ID)
-logger.info(f"PATCH {url}")
+    parser = argparse.ArgumentParser(description="Update a team's settings")
+    parser.add_argument("--backlog-iteration", required=False, help="backlogIteration")
+    parser.add_argument("--backlog-visibilities", required=False, help="backlogVisibilities")
+    parser.add_argument("--bugs-behavior", required=False, help="bugsBehavior")
+    parser.add_argument("--default-iteration", required=False, help="defaultIteration")
+    parser.add_argument("--default-iteration-macro", required=False, help="defaultIterationMacro")
+    parser.add_argument("--working-days", required=False, help="workingDays")
+    args = parser.parse_args()
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+    logger = AdoLogger("update_teamsettings", pat)
+    logger.info("Update a team's settings")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_teamsettings(client, project, team, backlog_iteration=args.backlog_iteration, backlog_visibilities=args.backlog_visibilities, bugs_behavior=args.bugs_behavior, default_iteration=args.default_iteration, default_iteration_macro=args.default_iteration_macro, working_days=args.working_days)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['backlogIteration', 'backlogVisibilities'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
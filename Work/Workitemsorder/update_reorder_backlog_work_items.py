@@ -11,69 +11,106 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/work/workitemsorde
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-TEAM_ID = get_env_or_exit("TEAM_ID", "Team ID or team name")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Reorder Product Backlog/Boards Work Items")
-parser.add_argument("--ids", required=False, help="IDs of the work items to be reordered. Must be valid WorkItem Ids.")
-parser.add_argument("--iteration-path", required=False, help="IterationPath for reorder operation. This is only used when we reorder from the Iteration Backlog")
-parser.add_argument("--next-id", required=False, help="ID of the work item that should be after the reordered items. Can use 0 to specify the end of the...")
-parser.add_argument("--parent-id", required=False, help="Parent ID for all of the work items involved in this operation. Can use 0 to indicate the items d...")
-parser.add_argument("--previous-id", required=False, help="ID of the work item that should be before the reordered items. Can use 0 to specify the beginning...")
-args = parser.parse_args()
+def update_reorder_backlog_work_items(client, project: str, team: str, *, ids: Optional[str] = None, iteration_path: Optional[str] = None, next_id: Optional[str] = None, parent_id: Optional[str] = None, previous_id: Optional[str] = None) -> dict:
+    """
+    Reorder Product Backlog/Boards Work Items
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_reorder_backlog_work_items", PAT)
-logger.info("Reorder Product Backlog/Boards Work Items")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        team: Team ID or team name
+        ids: IDs of the work items to be reordered. Must be valid WorkItem Ids.
+        iteration_path: IterationPath for reorder operation. This is only used when we reorder from the Iteration Backlog
+        next_id: ID of the work item that should be after the reordered items. Can use 0 to specify the end of the...
+        parent_id: Parent ID for all of the work items involved in this operation. Can use 0 to indicate the items d...
+        previous_id: ID of the work item that should be before the reordered items. Can use 0 to specify the beginning...
 
-# ---------------------------------------------------------------------------
-# Request body
-# ---------------------------------------------------------------------------
-body = {
-    "ids": args.ids,
-    "iterationPath": args.iteration_path,
-    "nextId": args.next_id,
-    "parentId": args.parent_id,
-    "previousId": args.previous_id,
-}
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "ids": ids,
+        "iterationPath": iteration_path,
+        "nextId": next_id,
+        "parentId": parent_id,
+        "previousId": previous_id,
+    }
+    url = build_url(client.organization, f"{team}/_apis/work/workitemsorder", API_VERSION, project=project)
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"{TEAM_ID}/_apis/work/workitemsorder", API_VERSION, project=PROJECT_ID)
-logger.info(f"PATCH {url}")
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+async def update_reorder_backlog_work_items_async(client, project: str, team: str, *, ids: Optional[str] = None, iteration_path: Optional[str] = None, next_id: Optional[str] = None, parent_id: Optional[str] = None, previous_id: Optional[str] = None) -> dict:
+    """Async variant of update_reorder_backlog_work_items() for use with AsyncAdoClient."""
+    body = {
+        "ids": ids,
+        "iterationPath": iteration_path,
+        "nextId": next_id,
+        "parentId": parent_id,
+        "previousId": previous_id,
+    }
+    url = build_url(client.organization, f"{team}/_apis/work/workitemsorder", API_VERSION, project=project)
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call update_reorder_backlog_work_items() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    team = require_env("TEAM_ID", "Team ID or team name")
+
+    parser = argparse.ArgumentParser(description="Reorder Product Backlog/Boards Work Items")
+    parser.add_argument("--ids", required=False, help="IDs of the work items to be reordered. Must be valid WorkItem Ids.")
+    parser.add_argument("--iteration-path", required=False, help="IterationPath for reorder operation. This is only used when we reorder from the Iteration Backlog")
+    parser.add_argument("--next-id", required=False, help="ID of the work item that should be after the reordered items. Can use 0 to specify the end of the...")
+    parser.add_argument("--parent-id", required=False, help="Parent ID for all of the work items involved in this operation. Can use 0 to indicate the items d...")
+    parser.add_argument("--previous-id", required=False, help="ID of the work item that should be before the reordered items. Can use 0 to specify the beginning...")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("update_reorder_backlog_work_items", pat)
+    logger.info("Reorder Product Backlog/Boards Work Items")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        items = items_of(update_reorder_backlog_work_items(client, project, team, ids=args.ids, iteration_path=args.iteration_path, next_id=args.next_id, parent_id=args.parent_id, previous_id=args.previous_id), "value")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    data = update_reorder_backlog_work_items(client, project, team, ids=args.ids, iteration_path=args.iteration_path, next_id=args.next_id, parent_id=args.parent_id, previous_id=args.previous_id)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,65 +11,82 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/wit/artifact-uri-q
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Queries work items linked to a given list of artifact URI.")
-parser.add_argument("--artifact-uris", required=False, help="List of artifact URIs to use for querying work items.")
-args = parser.parse_args()
+def query_artifact_uri_query(client, project: str, *, artifact_uris: Optional[str] = None) -> dict:
+    """
+    Queries work items linked to a given list of artifact URI.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        artifact_uris: List of artifact URIs to use for querying work items.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "artifactUris": artifact_uris,
+    }
+    url = build_url(client.organization, f"_apis/wit/artifacturiquery", API_VERSION, project=project)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['artifactUrisQueryResult'], API_VERSION)
+    return data
+
+
+async def query_artifact_uri_query_async(client, project: str, *, artifact_uris: Optional[str] = None) -> dict:
+    """Async variant of query_artifact_uri_query() for use with AsyncAdoClient."""
+    body = {
+        "artifactUris": artifact_uris,
+    }
+    url = build_url(client.organization, f"_apis/wit/artifacturiquery", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['artifactUrisQueryResult'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("query_artifact_uri_query", PAT)
-logger.info("Queries work items linked to a given list of artifact URI.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "artifactUris": args.artifact_uris,
-}
+def main() -> None:
+    """Read env vars / flags, call query_artifact_uri_query() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/wit/artifacturiquery", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Queries work items linked to a given list of artifact URI.")
+    parser.add_argument("--artifact-uris", required=False, help="List of artifact URIs to use for querying work items.")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("query_artifact_uri_query", pat)
+    logger.info("Queries work items linked to a given list of artifact URI.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = query_artifact_uri_query(client, project, artifact_uris=args.artifact_uris)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['artifactUrisQueryResult'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
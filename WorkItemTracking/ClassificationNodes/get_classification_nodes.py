@@ -10,54 +10,75 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/wit/classification-nodes/get?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-STRUCTURE_GROUP = get_env_or_exit("STRUCTURE_GROUP", "Structure group of the classification node, area or iteration.")
-PATH = get_env_or_exit("PATH", "Path of the classification node.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_classification_nodes", PAT)
-logger.info("Gets the classification node for a given node path.")
+def get_classification_nodes(client, project: str, structure_group: str, path: str) -> dict:
+    """
+    Gets the classification node for a given node path.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/wit/classificationnodes/{STRUCTURE_GROUP}/{PATH}", API_VERSION, project=PROJECT_ID)
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        structure_group: Structure group of the classification node, area or iteration.
+        path: Path of the classification node.
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/wit/classificationnodes/{structure_group}/{path}", API_VERSION, project=project)
+    response = client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name', 'attributes'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'name', 'attributes'], API_VERSION)
+async def get_classification_nodes_async(client, project: str, structure_group: str, path: str) -> dict:
+    """Async variant of get_classification_nodes() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/wit/classificationnodes/{structure_group}/{path}", API_VERSION, project=project)
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name', 'attributes'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(f"Classification Nodes: {data.get("name", "N/A")}")
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_classification_nodes() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    structure_group = require_env("STRUCTURE_GROUP", "Structure group of the classification node, area or iteration.")
+    path = require_env("PATH", "Path of the classification node.")
+
+    logger = AdoLogger("get_classification_nodes", pat)
+    logger.info("Gets the classification node for a given node path.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = get_classification_nodes(client, project, structure_group, path)
+
+    print(f"Classification Nodes: {data.get('name', 'N/A')}")
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,78 +11,107 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/wit/classification
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-STRUCTURE_GROUP = get_env_or_exit("STRUCTURE_GROUP", "Structure group of the classification node, area or iteration.")
-PATH = get_env_or_exit("PATH", "Path of the classification node.")
-
-# ---------------------------------------------------------------------------
-# CLI arguments
-# ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Update an existing classification node.")
-parser.add_argument("--attributes", required=False, help="Dictionary that has node attributes like start/finish date for iteration nodes.")
-parser.add_argument("--children", required=False, help="List of child nodes fetched.")
-parser.add_argument("--has-children", required=False, help="Flag that indicates if the classification node has any child nodes.")
-parser.add_argument("--id", required=False, help="Integer ID of the classification node.")
-parser.add_argument("--identifier", required=False, help="GUID ID of the classification node.")
-parser.add_argument("--name", required=False, help="Name of the classification node.")
-args = parser.parse_args()
-
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_classification_nodes", PAT)
-logger.info("Update an existing classification node.")
-
-# ---------------------------------------------------------------------------
-# Request body
-# ---------------------------------------------------------------------------
-body = {
-    "attributes": args.attributes,
-    "children": args.children,
-    "hasChildren": args.has_children,
-    "id": args.id,
-    "identifier": args.identifier,
-    "name": args.name,
-}
 
 # ---------------------------------------------------------------------------
-# API call
+# API
 # ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/wit/classificationnodes/{STRUCTURE_GROUP}/{PATH}", API_VERSION, project=PROJECT_ID)
-logger.info(f"PATCH {url}")
-
-response = execute_request("PATCH", url, HEADERS, body=body)
+def update_classification_nodes(client, project: str, structure_group: str, path: str, *, attributes: Optional[str] = None, children: Optional[str] = None, has_children: Optional[str] = None, id: Optional[str] = None, identifier: Optional[str] = None, name: Optional[str] = None) -> dict:
+    """
+    Update an existing classification node.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        structure_group: Structure group of the classification node, area or iteration.
+        path: Path of the classification node.
+        attributes: Dictionary that has node attributes like start/finish date for iteration nodes.
+        children: List of child nodes fetched.
+        has_children: Flag that indicates if the classification node has any child nodes.
+        id: Integer ID of the classification node.
+        identifier: GUID ID of the classification node.
+        name: Name of the classification node.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "attributes": attributes,
+        "children": children,
+        "hasChildren": has_children,
+        "id": id,
+        "identifier": identifier,
+        "name": name,
+    }
+    url = build_url(client.organization, f"_apis/wit/classificationnodes/{structure_group}/{path}", API_VERSION, project=project)
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name', 'attributes'], API_VERSION)
+    return data
+
+
+async def update_classification_nodes_async(client, project: str, structure_group: str, path: str, *, attributes: Optional[str] = None, children: Optional[str] = None, has_children: Optional[str] = None, id: Optional[str] = None, identifier: Optional[str] = None, name: Optional[str] = None) -> dict:
+    """Async variant of update_classification_nodes() for use with AsyncAdoClient."""
+    body = {
+        "attributes": attributes,
+        "children": children,
+        "hasChildren": has_children,
+        "id": id,
+        "identifier": identifier,
+        "name": name,
+    }
+    url = build_url(client.organization, f"_apis/wit/classificationnodes/{structure_group}/{path}", API_VERSION, project=project)
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name', 'attributes'], API_VERSION)
+    return data
 
-data = response.json()
-
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'name', 'attributes'], API_VERSION)
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(f"Classification Nodes: {data.get("name", "N/A")}")
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call update_classification_nodes() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    structure_group = require_env("STRUCTURE_GROUP", "Structure group of the classification node, area or iteration.")
+    path = require_env("PATH", "Path of the classification node.")
+
+    parser = argparse.ArgumentParser(description="Update an existing classification node.")
+    parser.add_argument("--attributes", required=False, help="Dictionary that has node attributes like start/finish date for iteration nodes.")
+    parser.add_argument("--children", required=False, help="List of child nodes fetched.")
+    parser.add_argument("--has-children", required=False, help="Flag that indicates if the classification node has any child nodes.")
+    parser.add_argument("--id", required=False, help="Integer ID of the classification node.")
+    parser.add_argument("--identifier", required=False, help="GUID ID of the classification node.")
+    parser.add_argument("--name", required=False, help="Name of the classification node.")
+    args = parser.parse_args()
+
+    logger = AdoLogger("update_classification_nodes", pat)
+    logger.info("Update an existing classification node.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = update_classification_nodes(client, project, structure_group, path, attributes=args.attributes, children=args.children, has_children=args.has_children, id=args.id, identifier=args.identifier, name=args.name)
+
+    print(f"Classification Nodes: {data.get('name', 'N/A')}")
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,49 +10,110 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/wit/comment-reactions-engaged-users/list?view=azure-devops-rest-7.2
 """
 
-import json
+import argparse
 import os
 import sys
+from typing import Iterator, Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
+from _shared.pagination import paginate
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-WORK_ITEM_ID = get_env_or_exit("WORK_ITEM_ID", "WorkItem ID.")
-COMMENT_ID = get_env_or_exit("COMMENT_ID", "Comment ID.")
-REACTION_TYPE = get_env_or_exit("REACTION_TYPE", "Type of the reaction.")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("list_comment_reactions_engaged_users", PAT)
-logger.info("Get users who reacted on the comment.")
+def list_comment_reactions_engaged_users(client, project: str, work_item_id: str, comment_id: str, reaction_type: str) -> dict:
+    """
+    Get users who reacted on the comment.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/wit/workItems/{WORK_ITEM_ID}/comments/{COMMENT_ID}/reactions/{REACTION_TYPE}/users", API_VERSION, project=PROJECT_ID)
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        work_item_id: WorkItem ID.
+        comment_id: Comment ID.
+        reaction_type: Type of the reaction.
+
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/wit/workItems/{work_item_id}/comments/{comment_id}/reactions/{reaction_type}/users", API_VERSION, project=project)
+    response = client.request("GET", url)
+    data = loads(response.content)
+    return data
+
+
+async def list_comment_reactions_engaged_users_async(client, project: str, work_item_id: str, comment_id: str, reaction_type: str) -> dict:
+    """Async variant of list_comment_reactions_engaged_users() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/wit/workItems/{work_item_id}/comments/{comment_id}/reactions/{reaction_type}/users", API_VERSION, project=project)
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    return data
+
+
+def iter_list_comment_reactions_engaged_users(client, project: str, work_item_id: str, comment_id: str, reaction_type: str, *, max_items: Optional[int] = None, prefetch: bool = False) -> Iterator[dict]:
+    """
+    Yield every item across all pages of list_comment_reactions_engaged_users() (top_skip paging).
 
-response = execute_request("GET", url, HEADERS)
+    Takes the same arguments, plus:
+        max_items: Stop after this many items (default: all).
+        prefetch: Fetch the next page while the current one is consumed.
+    """
+    url = build_url(client.organization, f"_apis/wit/workItems/{work_item_id}/comments/{comment_id}/reactions/{reaction_type}/users", API_VERSION, project=project)
+    return paginate(client, "GET", url, "top_skip",
+                    max_items=max_items, prefetch=prefetch)
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call list_comment_reactions_engaged_users() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    work_item_id = require_env("WORK_ITEM_ID", "WorkItem ID.")
+    comment_id = require_env("COMMENT_ID", "Comment ID.")
+    reaction_type = require_env("REACTION_TYPE", "Type of the reaction.")
+
+    parser = argparse.ArgumentParser(description="Get users who reacted on the comment.")
+    parser.add_argument("--all-pages", action="store_true", help="Follow pagination and return every item")
+    parser.add_argument("--max-items", type=int, help="Follow pagination up to this many items")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("list_comment_reactions_engaged_users", pat)
+    logger.info("Get users who reacted on the comment.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        if args.all_pages or args.max_items:
+            items = iter_list_comment_reactions_engaged_users(client, project, work_item_id, comment_id, reaction_type, max_items=args.max_items, prefetch=True)
+        else:
+            items = items_of(list_comment_reactions_engaged_users(client, project, work_item_id, comment_id, reaction_type), "value")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    if args.all_pages or args.max_items:
+        items = list(iter_list_comment_reactions_engaged_users(client, project, work_item_id, comment_id, reaction_type, max_items=args.max_items, prefetch=True))
+        data = {"count": len(items), "value": items}
+    else:
+        data = list_comment_reactions_engaged_users(client, project, work_item_id, comment_id, reaction_type)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,61 +10,81 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/wit/comments/add?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2-preview.4"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-WORK_ITEM_ID = get_env_or_exit("WORK_ITEM_ID", "Work item ID (integer)")
-COMMENT_TEXT = get_env_or_exit("COMMENT_TEXT", "Comment text (supports HTML)")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("add_comment", PAT)
-logger.info("Add a comment to a work item.")
+def add_comment(client, project: str, work_item_id: str, comment_text: str) -> dict:
+    """
+    Add a comment to a work item.
 
-# ---------------------------------------------------------------------------
-# Request body
-# ---------------------------------------------------------------------------
-body = {
-    "text": COMMENT_TEXT,
-}
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        work_item_id: Work item ID (integer)
+        comment_text: Comment text (supports HTML)
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/wit/workitems/{WORK_ITEM_ID}/comments", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "text": comment_text,
+    }
+    url = build_url(client.organization, f"_apis/wit/workitems/{work_item_id}/comments", API_VERSION, project=project)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'text'], API_VERSION)
+    return data
 
-response = execute_request("POST", url, HEADERS, body=body)
 
-data = response.json()
+async def add_comment_async(client, project: str, work_item_id: str, comment_text: str) -> dict:
+    """Async variant of add_comment() for use with AsyncAdoClient."""
+    body = {
+        "text": comment_text,
+    }
+    url = build_url(client.organization, f"_apis/wit/workitems/{work_item_id}/comments", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'text'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'text'], API_VERSION)
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(f"Comment {data.get("id", "N/A")} added to work item {data.get("workItemId", "N/A")}")
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call add_comment() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    work_item_id = require_env("WORK_ITEM_ID", "Work item ID (integer)")
+    comment_text = require_env("COMMENT_TEXT", "Comment text (supports HTML)")
+
+    logger = AdoLogger("add_comment", pat)
+    logger.info("Add a comment to a work item.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = add_comment(client, project, work_item_id, comment_text)
+
+    print(f"Comment {data.get('id', 'N/A')} added to work item {data.get('workItemId', 'N/A')}")
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,67 +11,85 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/wit/comments/add-c
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-WORK_ITEM_ID = get_env_or_exit("WORK_ITEM_ID", "Id of a work item.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Add a comment on a work item.")
-parser.add_argument("--text", required=False, help="The text of the comment.")
-args = parser.parse_args()
+def create_comment(client, project: str, work_item_id: str, *, text: Optional[str] = None) -> dict:
+    """
+    Add a comment on a work item.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        work_item_id: Id of a work item.
+        text: The text of the comment.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "text": text,
+    }
+    url = build_url(client.organization, f"_apis/wit/workItems/{work_item_id}/comments", API_VERSION, project=project)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'createdBy'], API_VERSION)
+    return data
+
+
+async def create_comment_async(client, project: str, work_item_id: str, *, text: Optional[str] = None) -> dict:
+    """Async variant of create_comment() for use with AsyncAdoClient."""
+    body = {
+        "text": text,
+    }
+    url = build_url(client.organization, f"_apis/wit/workItems/{work_item_id}/comments", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'createdBy'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_comment", PAT)
-logger.info("Add a comment on a work item.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "text": args.text,
-}
+def main() -> None:
+    """Read env vars / flags, call create_comment() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    work_item_id = require_env("WORK_ITEM_ID", "Id of a work item.")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/wit/workItems/{WORK_ITEM_ID}/comments", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Add a comment on a work item.")
+    parser.add_argument("--text", required=False, help="The text of the comment.")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_comment", pat)
+    logger.info("Add a comment on a work item.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_comment(client, project, work_item_id, text=args.text)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'createdBy'], API_VERSION)
+    print(f"Comments ID: {data.get('id', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Comments ID: {data.get("id", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,48 +10,72 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/wit/comments/delete?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-WORK_ITEM_ID = get_env_or_exit("WORK_ITEM_ID", "Id of a work item.")
-COMMENT_ID = get_env_or_exit("COMMENT_ID", "commentId")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("delete_comments", PAT)
-logger.info("Delete a comment on a work item.")
+def delete_comments(client, project: str, work_item_id: str, comment_id: str) -> dict:
+    """
+    Delete a comment on a work item.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        work_item_id: Id of a work item.
+        comment_id: commentId
+
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/wit/workItems/{work_item_id}/comments/{comment_id}", API_VERSION, project=project)
+    response = client.request("DELETE", url)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/wit/workItems/{WORK_ITEM_ID}/comments/{COMMENT_ID}", API_VERSION, project=PROJECT_ID)
-logger.info(f"DELETE {url}")
 
-response = execute_request("DELETE", url, HEADERS)
+async def delete_comments_async(client, project: str, work_item_id: str, comment_id: str) -> dict:
+    """Async variant of delete_comments() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/wit/workItems/{work_item_id}/comments/{comment_id}", API_VERSION, project=project)
+    response = await client.request("DELETE", url)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call delete_comments() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    work_item_id = require_env("WORK_ITEM_ID", "Id of a work item.")
+    comment_id = require_env("COMMENT_ID", "commentId")
+
+    logger = AdoLogger("delete_comments", pat)
+    logger.info("Delete a comment on a work item.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = delete_comments(client, project, work_item_id, comment_id)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
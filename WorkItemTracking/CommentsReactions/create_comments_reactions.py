@@ -10,56 +10,89 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/wit/comments-reactions/create?view=azure-devops-rest-7.2
 """
 
-import json
+import argparse
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-WORK_ITEM_ID = get_env_or_exit("WORK_ITEM_ID", "WorkItem ID")
-COMMENT_ID = get_env_or_exit("COMMENT_ID", "Comment ID")
-REACTION_TYPE = get_env_or_exit("REACTION_TYPE", "Type of the reaction")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_comments_reactions", PAT)
-logger.info("Adds a new reaction to a comment.")
+def create_comments_reactions(client, project: str, work_item_id: str, comment_id: str, reaction_type: str) -> dict:
+    """
+    Adds a new reaction to a comment.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/wit/workItems/{WORK_ITEM_ID}/comments/{COMMENT_ID}/reactions/{REACTION_TYPE}", API_VERSION, project=PROJECT_ID)
-logger.info(f"PUT {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        work_item_id: WorkItem ID
+        comment_id: Comment ID
+        reaction_type: Type of the reaction
 
-response = execute_request("PUT", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/wit/workItems/{work_item_id}/comments/{comment_id}/reactions/{reaction_type}", API_VERSION, project=project)
+    response = client.request("PUT", url)
+    data = loads(response.content)
+    version_guard(data, ['count', 'commentId'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['count', 'commentId'], API_VERSION)
+async def create_comments_reactions_async(client, project: str, work_item_id: str, comment_id: str, reaction_type: str) -> dict:
+    """Async variant of create_comments_reactions() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/wit/workItems/{work_item_id}/comments/{comment_id}/reactions/{reaction_type}", API_VERSION, project=project)
+    response = await client.request("PUT", url)
+    data = loads(response.content)
+    version_guard(data, ['count', 'commentId'], API_VERSION)
+    return data
 
-logger.info(f"Retrieved {data.get('count', '?')} items")
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call create_comments_reactions() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    work_item_id = require_env("WORK_ITEM_ID", "WorkItem ID")
+    comment_id = require_env("COMMENT_ID", "Comment ID")
+    reaction_type = require_env("REACTION_TYPE", "Type of the reaction")
+
+    parser = argparse.ArgumentParser(description="Adds a new reaction to a comment.")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("create_comments_reactions", pat)
+    logger.info("Adds a new reaction to a comment.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        items = items_of(create_comments_reactions(client, project, work_item_id, comment_id, reaction_type), "value")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    data = create_comments_reactions(client, project, work_item_id, comment_id, reaction_type)
+    logger.info(f"Retrieved {data.get('count', '?')} items")
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,65 +11,82 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/wit/fields/create?
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Create a new field.")
-parser.add_argument("--is-locked", required=False, help="Indicates whether this field is marked as locked for editing.")
-args = parser.parse_args()
+def create_fields(client, project: str, *, is_locked: Optional[str] = None) -> dict:
+    """
+    Create a new field.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        is_locked: Indicates whether this field is marked as locked for editing.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "isLocked": is_locked,
+    }
+    url = build_url(client.organization, f"_apis/wit/fields", API_VERSION, project=project)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['isLocked'], API_VERSION)
+    return data
+
+
+async def create_fields_async(client, project: str, *, is_locked: Optional[str] = None) -> dict:
+    """Async variant of create_fields() for use with AsyncAdoClient."""
+    body = {
+        "isLocked": is_locked,
+    }
+    url = build_url(client.organization, f"_apis/wit/fields", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['isLocked'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_fields", PAT)
-logger.info("Create a new field.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "isLocked": args.is_locked,
-}
+def main() -> None:
+    """Read env vars / flags, call create_fields() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/wit/fields", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Create a new field.")
+    parser.add_argument("--is-locked", required=False, help="Indicates whether this field is marked as locked for editing.")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_fields", pat)
+    logger.info("Create a new field.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_fields(client, project, is_locked=args.is_locked)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['isLocked'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,68 +11,88 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/wit/fields/update?
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-FIELD_NAME_OR_REF_NAME = get_env_or_exit("FIELD_NAME_OR_REF_NAME", "Name/reference name of the field to be updated")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Update a field.")
-parser.add_argument("--is-deleted", required=False, help="Indicates whether the user wants to restore the field.")
-parser.add_argument("--is-locked", required=False, help="Indicates whether the user wants to lock the field.")
-args = parser.parse_args()
+def update_fields(client, project: str, field_name_or_ref_name: str, *, is_deleted: Optional[str] = None, is_locked: Optional[str] = None) -> dict:
+    """
+    Update a field.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        field_name_or_ref_name: Name/reference name of the field to be updated
+        is_deleted: Indicates whether the user wants to restore the field.
+        is_locked: Indicates whether the user wants to lock the field.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "isDeleted": is_deleted,
+        "isLocked": is_locked,
+    }
+    url = build_url(client.organization, f"_apis/wit/fields/{field_name_or_ref_name}", API_VERSION, project=project)
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['isLocked'], API_VERSION)
+    return data
+
+
+async def update_fields_async(client, project: str, field_name_or_ref_name: str, *, is_deleted: Optional[str] = None, is_locked: Optional[str] = None) -> dict:
+    """Async variant of update_fields() for use with AsyncAdoClient."""
+    body = {
+        "isDeleted": is_deleted,
+        "isLocked": is_locked,
+    }
+    url = build_url(client.organization, f"_apis/wit/fields/{field_name_or_ref_name}", API_VERSION, project=project)
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['isLocked'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_fields", PAT)
-logger.info("Update a field.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "isDeleted": args.is_deleted,
-    "isLocked": args.is_locked,
-}
+def main() -> None:
+    """Read env vars / flags, call update_fields() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    field_name_or_ref_name = require_env("FIELD_NAME_OR_REF_NAME", "Name/reference name of the field to be updated")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/wit/fields/{FIELD_NAME_OR_REF_NAME}", API_VERSION, project=PROJECT_ID)
-logger.info(f"PATCH {url}")
+    parser = argparse.ArgumentParser(description="Update a field.")
+    parser.add_argument("--is-deleted", required=False, help="Indicates whether the user wants to restore the field.")
+    parser.add_argument("--is-locked", required=False, help="Indicates whether the user wants to lock the field.")
+    args = parser.parse_args()
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+    logger = AdoLogger("update_fields", pat)
+    logger.info("Update a field.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_fields(client, project, field_name_or_ref_name, is_deleted=args.is_deleted, is_locked=args.is_locked)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['isLocked'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
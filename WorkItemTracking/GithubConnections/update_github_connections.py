@@ -11,63 +11,94 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/wit/github-connect
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-CONNECTION_ID = get_env_or_exit("CONNECTION_ID", "connectionId")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Add/remove list of repos within specified github connection.")
-parser.add_argument("--git-hub-repository-urls", required=False, help="Requested repos urls")
-parser.add_argument("--operation-type", required=False, help="Operation type (f. e. add, remove)")
-args = parser.parse_args()
+def update_github_connections(client, project: str, connection_id: str, *, git_hub_repository_urls: Optional[str] = None, operation_type: Optional[str] = None) -> dict:
+    """
+    Add/remove list of repos within specified github connection.
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_github_connections", PAT)
-logger.info("Add/remove list of repos within specified github connection.")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        connection_id: connectionId
+        git_hub_repository_urls: Requested repos urls
+        operation_type: Operation type (f. e. add, remove)
 
-# ---------------------------------------------------------------------------
-# Request body
-# ---------------------------------------------------------------------------
-body = {
-    "gitHubRepositoryUrls": args.git_hub_repository_urls,
-    "operationType": args.operation_type,
-}
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "gitHubRepositoryUrls": git_hub_repository_urls,
+        "operationType": operation_type,
+    }
+    url = build_url(client.organization, f"_apis/githubconnections/{connection_id}/reposBatch", API_VERSION, project=project)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/githubconnections/{CONNECTION_ID}/reposBatch", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
 
-response = execute_request("POST", url, HEADERS, body=body)
+async def update_github_connections_async(client, project: str, connection_id: str, *, git_hub_repository_urls: Optional[str] = None, operation_type: Optional[str] = None) -> dict:
+    """Async variant of update_github_connections() for use with AsyncAdoClient."""
+    body = {
+        "gitHubRepositoryUrls": git_hub_repository_urls,
+        "operationType": operation_type,
+    }
+    url = build_url(client.organization, f"_apis/githubconnections/{connection_id}/reposBatch", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call update_github_connections() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    connection_id = require_env("CONNECTION_ID", "connectionId")
+
+    parser = argparse.ArgumentParser(description="Add/remove list of repos within specified github connection.")
+    parser.add_argument("--git-hub-repository-urls", required=False, help="Requested repos urls")
+    parser.add_argument("--operation-type", required=False, help="Operation type (f. e. add, remove)")
+    add_format_arguments(parser)
+    args = parser.parse_args()
+
+    logger = AdoLogger("update_github_connections", pat)
+    logger.info("Add/remove list of repos within specified github connection.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        items = items_of(update_github_connections(client, project, connection_id, git_hub_repository_urls=args.git_hub_repository_urls, operation_type=args.operation_type), "value")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    data = update_github_connections(client, project, connection_id, git_hub_repository_urls=args.git_hub_repository_urls, operation_type=args.operation_type)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,65 +11,82 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/wit/project-proces
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Migrates a project to a different process within the same OOB type.")
-parser.add_argument("--type-id", required=False, help="The ID of the process.")
-args = parser.parse_args()
+def create_migrate_projects_process(client, project: str, *, type_id: Optional[str] = None) -> dict:
+    """
+    Migrates a project to a different process within the same OOB type.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        type_id: The ID of the process.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "typeId": type_id,
+    }
+    url = build_url(client.organization, f"_apis/wit/projectprocessmigration", API_VERSION, project=project)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['processId', 'projectId'], API_VERSION)
+    return data
+
+
+async def create_migrate_projects_process_async(client, project: str, *, type_id: Optional[str] = None) -> dict:
+    """Async variant of create_migrate_projects_process() for use with AsyncAdoClient."""
+    body = {
+        "typeId": type_id,
+    }
+    url = build_url(client.organization, f"_apis/wit/projectprocessmigration", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['processId', 'projectId'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_migrate_projects_process", PAT)
-logger.info("Migrates a project to a different process within the same OOB type.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "typeId": args.type_id,
-}
+def main() -> None:
+    """Read env vars / flags, call create_migrate_projects_process() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/wit/projectprocessmigration", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Migrates a project to a different process within the same OOB type.")
+    parser.add_argument("--type-id", required=False, help="The ID of the process.")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_migrate_projects_process", pat)
+    logger.info("Migrates a project to a different process within the same OOB type.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_migrate_projects_process(client, project, type_id=args.type_id)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['processId', 'projectId'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,77 +11,105 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/wit/queries/create
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-QUERY = get_env_or_exit("QUERY", "The parent id or path under which the query is to be created.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Creates a query, or moves a query.")
-parser.add_argument("--children", required=False, help="The child query items inside a query folder.")
-parser.add_argument("--clauses", required=False, help="The clauses for a flat query.")
-parser.add_argument("--columns", required=False, help="The columns of the query.")
-parser.add_argument("--created-by", required=False, help="The identity who created the query item.")
-parser.add_argument("--created-date", required=False, help="When the query item was created.")
-parser.add_argument("--filter-options", required=False, help="The link query mode.")
-args = parser.parse_args()
+def create_queries(client, project: str, query: str, *, children: Optional[str] = None, clauses: Optional[str] = None, columns: Optional[str] = None, created_by: Optional[str] = None, created_date: Optional[str] = None, filter_options: Optional[str] = None) -> dict:
+    """
+    Creates a query, or moves a query.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        query: The parent id or path under which the query is to be created.
+        children: The child query items inside a query folder.
+        clauses: The clauses for a flat query.
+        columns: The columns of the query.
+        created_by: The identity who created the query item.
+        created_date: When the query item was created.
+        filter_options: The link query mode.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "children": children,
+        "clauses": clauses,
+        "columns": columns,
+        "createdBy": created_by,
+        "createdDate": created_date,
+        "filterOptions": filter_options,
+    }
+    url = build_url(client.organization, f"_apis/wit/queries/{query}", API_VERSION, project=project)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name', 'children'], API_VERSION)
+    return data
+
+
+async def create_queries_async(client, project: str, query: str, *, children: Optional[str] = None, clauses: Optional[str] = None, columns: Optional[str] = None, created_by: Optional[str] = None, created_date: Optional[str] = None, filter_options: Optional[str] = None) -> dict:
+    """Async variant of create_queries() for use with AsyncAdoClient."""
+    body = {
+        "children": children,
+        "clauses": clauses,
+        "columns": columns,
+        "createdBy": created_by,
+        "createdDate": created_date,
+        "filterOptions": filter_options,
+    }
+    url = build_url(client.organization, f"_apis/wit/queries/{query}", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name', 'children'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_queries", PAT)
-logger.info("Creates a query, or moves a query.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "children": args.children,
-    "clauses": args.clauses,
-    "columns": args.columns,
-    "createdBy": args.created_by,
-    "createdDate": args.created_date,
-    "filterOptions": args.filter_options,
-}
+def main() -> None:
+    """Read env vars / flags, call create_queries() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    query = require_env("QUERY", "The parent id or path under which the query is to be created.")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/wit/queries/{QUERY}", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Creates a query, or moves a query.")
+    parser.add_argument("--children", required=False, help="The child query items inside a query folder.")
+    parser.add_argument("--clauses", required=False, help="The clauses for a flat query.")
+    parser.add_argument("--columns", required=False, help="The columns of the query.")
+    parser.add_argument("--created-by", required=False, help="The identity who created the query item.")
+    parser.add_argument("--created-date", required=False, help="When the query item was created.")
+    parser.add_argument("--filter-options", required=False, help="The link query mode.")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("create_queries", pat)
+    logger.info("Creates a query, or moves a query.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = create_queries(client, project, query, children=args.children, clauses=args.clauses, columns=args.columns, created_by=args.created_by, created_date=args.created_date, filter_options=args.filter_options)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'name', 'children'], API_VERSION)
+    print(f"Queries ID: {data.get('id', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Queries ID: {data.get("id", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,66 +11,84 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/wit/recyclebin/res
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-RESOURCE_ID = get_env_or_exit("RESOURCE_ID", "ID of the work item to be restored")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Restores the deleted work item from Recycle Bin.")
-parser.add_argument("--is-deleted", required=False, help="Sets a value indicating whether this work item is deleted.")
-args = parser.parse_args()
+def update_restore_work_item(client, project: str, id: str, *, is_deleted: Optional[str] = None) -> dict:
+    """
+    Restores the deleted work item from Recycle Bin.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        id: ID of the work item to be restored
+        is_deleted: Sets a value indicating whether this work item is deleted.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "isDeleted": is_deleted,
+    }
+    url = build_url(client.organization, f"_apis/wit/recyclebin/{id}", API_VERSION, project=project)
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['resource'], API_VERSION)
+    return data
+
+
+async def update_restore_work_item_async(client, project: str, id: str, *, is_deleted: Optional[str] = None) -> dict:
+    """Async variant of update_restore_work_item() for use with AsyncAdoClient."""
+    body = {
+        "isDeleted": is_deleted,
+    }
+    url = build_url(client.organization, f"_apis/wit/recyclebin/{id}", API_VERSION, project=project)
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['resource'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_restore_work_item", PAT)
-logger.info("Restores the deleted work item from Recycle Bin.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "isDeleted": args.is_deleted,
-}
+def main() -> None:
+    """Read env vars / flags, call update_restore_work_item() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    id = require_env("RESOURCE_ID", "ID of the work item to be restored")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/wit/recyclebin/{RESOURCE_ID}", API_VERSION, project=PROJECT_ID)
-logger.info(f"PATCH {url}")
+    parser = argparse.ArgumentParser(description="Restores the deleted work item from Recycle Bin.")
+    parser.add_argument("--is-deleted", required=False, help="Sets a value indicating whether this work item is deleted.")
+    args = parser.parse_args()
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+    logger = AdoLogger("update_restore_work_item", pat)
+    logger.info("Restores the deleted work item from Recycle Bin.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_restore_work_item(client, project, id, is_deleted=args.is_deleted)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['resource'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,70 +11,139 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/wit/reporting-work
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Iterator, Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
+from _shared.pagination import paginate
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Get a batch of work item revisions.")
-parser.add_argument("--fields", required=False, help="A list of fields to return in work item revisions. Omit this parameter to get all reportable fields.")
-parser.add_argument("--include-deleted", required=False, help="Include deleted work item in the result.")
-parser.add_argument("--include-identity-ref", required=False, help="Return an identity reference instead of a string value for identity fields.")
-parser.add_argument("--include-latest-only", required=False, help="Include only the latest version of a work item, skipping over all previous revisions of the work ...")
-parser.add_argument("--include-tag-ref", required=False, help="Include tag reference instead of string value for System.Tags field")
-parser.add_argument("--types", required=False, help="A list of types to filter the results to specific work item types. Omit this parameter to get wor...")
-args = parser.parse_args()
+def create_read_reporting_revisions_post(client, project: str, *, fields: Optional[str] = None, include_deleted: Optional[str] = None, include_identity_ref: Optional[str] = None, include_latest_only: Optional[str] = None, include_tag_ref: Optional[str] = None, types: Optional[str] = None) -> dict:
+    """
+    Get a batch of work item revisions.
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_read_reporting_revisions_post", PAT)
-logger.info("Get a batch of work item revisions.")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        fields: A list of fields to return in work item revisions. Omit this parameter to get all reportable fields.
+        include_deleted: Include deleted work item in the result.
+        include_identity_ref: Return an identity reference instead of a string value for identity fields.
+        include_latest_only: Include only the latest version of a work item, skipping over all previous revisions of the work ...
+        include_tag_ref: Include tag reference instead of string value for System.Tags field
+        types: A list of types to filter the results to specific work item types. Omit this parameter to get wor...
 
-# ---------------------------------------------------------------------------
-# Request body
-# ---------------------------------------------------------------------------
-body = {
-    "fields": args.fields,
-    "includeDeleted": args.include_deleted,
-    "includeIdentityRef": args.include_identity_ref,
-    "includeLatestOnly": args.include_latest_only,
-    "includeTagRef": args.include_tag_ref,
-    "types": args.types,
-}
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "fields": fields,
+        "includeDeleted": include_deleted,
+        "includeIdentityRef": include_identity_ref,
+        "includeLatestOnly": include_latest_only,
+        "includeTagRef": include_tag_ref,
+        "types": types,
+    }
+    url = build_url(client.organization, f"_apis/wit/reporting/workitemrevisions", API_VERSION, project=project)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
+
+
+async def create_read_reporting_revisions_post_async(client, project: str, *, fields: Optional[str] = None, include_deleted: Optional[str] = None, include_identity_ref: Optional[str] = None, include_latest_only: Optional[str] = None, include_tag_ref: Optional[str] = None, types: Optional[str] = None) -> dict:
+    """Async variant of create_read_reporting_revisions_post() for use with AsyncAdoClient."""
+    body = {
+        "fields": fields,
+        "includeDeleted": include_deleted,
+        "includeIdentityRef": include_identity_ref,
+        "includeLatestOnly": include_latest_only,
+        "includeTagRef": include_tag_ref,
+        "types": types,
+    }
+    url = build_url(client.organization, f"_apis/wit/reporting/workitemrevisions", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/wit/reporting/workitemrevisions", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
 
-response = execute_request("POST", url, HEADERS, body=body)
+def iter_create_read_reporting_revisions_post(client, project: str, *, fields: Optional[str] = None, include_deleted: Optional[str] = None, include_identity_ref: Optional[str] = None, include_latest_only: Optional[str] = None, include_tag_ref: Optional[str] = None, types: Optional[str] = None, max_items: Optional[int] = None, prefetch: bool = False) -> Iterator[dict]:
+    """
+    Yield every item across all pages of create_read_reporting_revisions_post() (continuation paging).
+
+    Takes the same arguments, plus:
+        max_items: Stop after this many items (default: all).
+        prefetch: Fetch the next page while the current one is consumed.
+    """
+    body = {
+        "fields": fields,
+        "includeDeleted": include_deleted,
+        "includeIdentityRef": include_identity_ref,
+        "includeLatestOnly": include_latest_only,
+        "includeTagRef": include_tag_ref,
+        "types": types,
+    }
+    url = build_url(client.organization, f"_apis/wit/reporting/workitemrevisions", API_VERSION, project=project)
+    return paginate(client, "POST", url, "continuation", body=body, list_key="values",
+                    max_items=max_items, prefetch=prefetch)
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call create_read_reporting_revisions_post() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+
+    parser = argparse.ArgumentParser(description="Get a batch of work item revisions.")
+    parser.add_argument("--fields", required=False, help="A list of fields to return in work item revisions. Omit this parameter to get all reportable fields.")
+    parser.add_argument("--include-deleted", required=False, help="Include deleted work item in the result.")
+    parser.add_argument("--include-identity-ref", required=False, help="Return an identity reference instead of a string value for identity fields.")
+    parser.add_argument("--include-latest-only", required=False, help="Include only the latest version of a work item, skipping over all previous revisions of the work ...")
+    parser.add_argument("--include-tag-ref", required=False, help="Include tag reference instead of string value for System.Tags field")
+    parser.add_argument("--types", required=False, help="A list of types to filter the results to specific work item types. Omit this parameter to get wor...")
+    parser.add_argument("--all-pages", action="store_true", help="Follow pagination and return every item")
+    parser.add_argument("--max-items", type=int, help="Follow pagination up to this many items")
+    add_format_arguments(parser, "--select")
+    args = parser.parse_args()
+
+    logger = AdoLogger("create_read_reporting_revisions_post", pat)
+    logger.info("Get a batch of work item revisions.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        if args.all_pages or args.max_items:
+            items = iter_create_read_reporting_revisions_post(client, project, fields=args.fields, include_deleted=args.include_deleted, include_identity_ref=args.include_identity_ref, include_latest_only=args.include_latest_only, include_tag_ref=args.include_tag_ref, types=args.types, max_items=args.max_items, prefetch=True)
+        else:
+            items = items_of(create_read_reporting_revisions_post(client, project, fields=args.fields, include_deleted=args.include_deleted, include_identity_ref=args.include_identity_ref, include_latest_only=args.include_latest_only, include_tag_ref=args.include_tag_ref, types=args.types), "values")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    if args.all_pages or args.max_items:
+        items = list(iter_create_read_reporting_revisions_post(client, project, fields=args.fields, include_deleted=args.include_deleted, include_identity_ref=args.include_identity_ref, include_latest_only=args.include_latest_only, include_tag_ref=args.include_tag_ref, types=args.types, max_items=args.max_items, prefetch=True))
+        data = {"count": len(items), "values": items}
+    else:
+        data = create_read_reporting_revisions_post(client, project, fields=args.fields, include_deleted=args.include_deleted, include_identity_ref=args.include_identity_ref, include_latest_only=args.include_latest_only, include_tag_ref=args.include_tag_ref, types=args.types)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Incrementally sync work item revisions into a local append-only store.
+
+API:  POST {org}/{project}/_apis/wit/reporting/workitemrevisions?continuationToken=...&api-version=7.2
+Auth: Basic (PAT)
+
+Each run follows continuationToken (or nextLink) until isLastBatch and
+appends every page to <store>/revisions.ndjson, one revision per line.
+After each page the store saves a watermark file:
+
+    <store>/watermark.json  {"continuationToken": ..., "offset": ..., "filter": ...}
+
+The token returned with the last batch marks "everything read so far", so
+the next run (e.g. an hourly job) asks only for revisions made since then.
+The watermark also records how many bytes of revisions.ndjson it covers.
+A run that died between appending a page and saving the watermark
+truncates the file back to that offset before resuming, so no revision is
+stored twice. The bytes between a run's start_offset and end_offset are
+exactly that run's delta.
+
+A watermark is only valid for the filter (fields, types, flags) it was
+created with; changing the filter needs a new store.
+
+Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/wit/reporting-work-item-revisions/read-reporting-revisions-post?view=azure-devops-rest-7.2
+"""
+
+import argparse
+import datetime
+import json
+import os
+import sys
+from typing import Any, Dict, List, Optional, Sequence
+from urllib.parse import parse_qsl, urlsplit
+
+# Add project root to path for shared helpers
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import dumpb, loads, write_json
+from _shared.errors import AdoConfigError
+from _shared.http_client import AdoClient, build_url
+from _shared.logging_utils import AdoLogger
+from _shared.pagination import with_query
+
+API_VERSION = "7.2"
+REVISIONS_FILE = "revisions.ndjson"
+WATERMARK_FILE = "watermark.json"
+
+
+def _token_from(data: Dict[str, Any]) -> Optional[str]:
+    """Continuation token of a batch, falling back to the one in nextLink."""
+    token = data.get("continuationToken")
+    if not token and data.get("nextLink"):
+        token = dict(parse_qsl(urlsplit(data["nextLink"]).query)).get("continuationToken")
+    return token or None
+
+
+class RevisionStore:
+    """Append-only revisions file plus the watermark that covers it."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self.revisions_path = os.path.join(directory, REVISIONS_FILE)
+        self.watermark_path = os.path.join(directory, WATERMARK_FILE)
+
+    def load_watermark(self) -> Dict[str, Any]:
+        try:
+            with open(self.watermark_path, encoding="utf-8") as fh:
+                return json.load(fh)
+        except FileNotFoundError:
+            return {}
+        except ValueError as exc:
+            raise AdoConfigError(f"ERROR: Corrupt watermark file {self.watermark_path}: {exc}") from exc
+
+    def open_for_append(self, offset: int):
+        """Open revisions.ndjson, dropping anything written past offset."""
+        fh = open(self.revisions_path, "ab")
+        if fh.tell() > offset:
+            fh.truncate(offset)
+            fh.seek(offset)
+        return fh
+
+    def save_watermark(self, watermark: Dict[str, Any]) -> None:
+        tmp = self.watermark_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(watermark, fh, indent=2)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, self.watermark_path)
+
+
+def sync_revisions(
+    client,
+    project: Optional[str],
+    store: RevisionStore,
+    fields: Optional[Sequence[str]] = None,
+    types: Optional[Sequence[str]] = None,
+    include_deleted: bool = True,
+    include_identity_ref: bool = False,
+    include_tag_ref: bool = False,
+    start_date_time: Optional[str] = None,
+    max_pages: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Append all revisions made since the last run to the store.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID (None syncs the whole organisation).
+        store: Where revisions and the watermark are kept.
+        fields: Field reference names to return (default: all reportable fields).
+        types: Work item types to include (default: all).
+        include_deleted: Include revisions of deleted work items.
+        include_identity_ref: Identity fields as references instead of strings.
+        include_tag_ref: System.Tags as references instead of a string.
+        start_date_time: First run only: skip revisions before this UTC time.
+        max_pages: Stop after this many batches (the next run continues).
+
+    Returns:
+        {"pages", "revisions", "start_offset", "end_offset", "complete", "continuationToken"}
+    """
+    body = {
+        "fields": list(fields) if fields else None,
+        "types": list(types) if types else None,
+        "includeDeleted": include_deleted,
+        "includeIdentityRef": include_identity_ref,
+        "includeTagRef": include_tag_ref,
+        "includeLatestOnly": False,
+    }
+    scope = {"organization": client.organization, "project": project, **body}
+    watermark = store.load_watermark()
+    if watermark and watermark.get("filter") != scope:
+        raise AdoConfigError(
+            f"ERROR: The watermark in {store.directory} was created with a different filter. "
+            f"Use a new store directory for the new filter."
+        )
+    token = watermark.get("continuationToken")
+    start_offset = offset = int(watermark.get("offset", 0))
+    url = build_url(client.organization, "_apis/wit/reporting/workitemrevisions", API_VERSION, project=project)
+
+    pages = revisions = 0
+    complete = False
+    with store.open_for_append(offset) as out:
+        while max_pages is None or pages < max_pages:
+            if token:
+                page_url = with_query(url, continuationToken=token)
+            elif start_date_time:
+                page_url = with_query(url, startDateTime=start_date_time)
+            else:
+                page_url = url
+            data = loads(client.request("POST", page_url, body=body).content)
+            values: List[Dict[str, Any]] = data.get("values") or []
+            if values:
+                out.write(b"".join(dumpb(v) + b"\n" for v in values))
+                out.flush()
+                os.fsync(out.fileno())
+            offset = out.tell()
+            token = _token_from(data) or token
+            pages += 1
+            revisions += len(values)
+            store.save_watermark({
+                "continuationToken": token,
+                "offset": offset,
+                "filter": scope,
+                "updated": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            })
+            if data.get("isLastBatch") or not values:
+                complete = True
+                break
+
+    return {
+        "pages": pages,
+        "revisions": revisions,
+        "start_offset": start_offset,
+        "end_offset": offset,
+        "complete": complete,
+        "continuationToken": token,
+    }
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+def main() -> None:
+    """Read env vars / flags, run sync_revisions() and print the summary."""
+    organization, pat = get_common_env()
+    project = os.environ.get("PROJECT_ID") or None
+
+    parser = argparse.ArgumentParser(description="Append work item revisions made since the last run to a local store.")
+    parser.add_argument("--store", default=os.environ.get("REVISION_STORE"), help="Store directory (or REVISION_STORE)")
+    parser.add_argument("--fields", default=None, help="Comma-separated field reference names (default: all reportable)")
+    parser.add_argument("--types", default=None, help="Comma-separated work item types (default: all)")
+    parser.add_argument("--exclude-deleted", action="store_true", help="Skip revisions of deleted work items")
+    parser.add_argument("--identity-ref", action="store_true", help="Return identity fields as references")
+    parser.add_argument("--tag-ref", action="store_true", help="Return System.Tags as references")
+    parser.add_argument("--start-date-time", default=None, help="First run only: skip revisions before this UTC time")
+    parser.add_argument("--max-pages", type=int, default=None, help="Stop after this many batches")
+    args = parser.parse_args()
+    store_dir = args.store or require_env("REVISION_STORE", "directory for revisions.ndjson and watermark.json")
+
+    def split(value: Optional[str]) -> Optional[List[str]]:
+        return [v.strip() for v in value.split(",") if v.strip()] if value else None
+
+    logger = AdoLogger("sync_revisions", pat)
+    logger.info("Sync work item revisions since the last watermark.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    result = sync_revisions(
+        client, project, RevisionStore(store_dir),
+        fields=split(args.fields), types=split(args.types),
+        include_deleted=not args.exclude_deleted, include_identity_ref=args.identity_ref,
+        include_tag_ref=args.tag_ref, start_date_time=args.start_date_time, max_pages=args.max_pages,
+    )
+    logger.info(f"Appended {result['revisions']} revisions in {result['pages']} batches")
+
+    write_json(result)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,70 +11,100 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/wit/send-mail/send
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="RESTful method to send mail for selected/queried work items.")
-parser.add_argument("--fields", required=False, help="fields")
-parser.add_argument("--ids", required=False, help="ids")
-parser.add_argument("--message", required=False, help="message")
-parser.add_argument("--persistence-id", required=False, help="persistenceId")
-parser.add_argument("--project-id", required=False, help="projectId")
-parser.add_argument("--sort-fields", required=False, help="sortFields")
-args = parser.parse_args()
+def create_send_mail(client, project: str, *, fields: Optional[str] = None, ids: Optional[str] = None, message: Optional[str] = None, persistence_id: Optional[str] = None, project_id: Optional[str] = None, sort_fields: Optional[str] = None) -> dict:
+    """
+    RESTful method to send mail for selected/queried work items.
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("create_send_mail", PAT)
-logger.info("RESTful method to send mail for selected/queried work items.")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        fields: fields
+        ids: ids
+        message: message
+        persistence_id: persistenceId
+        project_id: projectId
+        sort_fields: sortFields
 
-# ---------------------------------------------------------------------------
-# Request body
-# ---------------------------------------------------------------------------
-body = {
-    "fields": args.fields,
-    "ids": args.ids,
-    "message": args.message,
-    "persistenceId": args.persistence_id,
-    "projectId": args.project_id,
-    "sortFields": args.sort_fields,
-}
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "fields": fields,
+        "ids": ids,
+        "message": message,
+        "persistenceId": persistence_id,
+        "projectId": project_id,
+        "sortFields": sort_fields,
+    }
+    url = build_url(client.organization, f"_apis/wit/sendmail", API_VERSION, project=project)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/wit/sendmail", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
 
-response = execute_request("POST", url, HEADERS, body=body)
+async def create_send_mail_async(client, project: str, *, fields: Optional[str] = None, ids: Optional[str] = None, message: Optional[str] = None, persistence_id: Optional[str] = None, project_id: Optional[str] = None, sort_fields: Optional[str] = None) -> dict:
+    """Async variant of create_send_mail() for use with AsyncAdoClient."""
+    body = {
+        "fields": fields,
+        "ids": ids,
+        "message": message,
+        "persistenceId": persistence_id,
+        "projectId": project_id,
+        "sortFields": sort_fields,
+    }
+    url = build_url(client.organization, f"_apis/wit/sendmail", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call create_send_mail() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+
+    parser = argparse.ArgumentParser(description="RESTful method to send mail for selected/queried work items.")
+    parser.add_argument("--fields", required=False, help="fields")
+    parser.add_argument("--ids", required=False, help="ids")
+    parser.add_argument("--message", required=False, help="message")
+    parser.add_argument("--persistence-id", required=False, help="persistenceId")
+    parser.add_argument("--project-id", required=False, help="projectId")
+    parser.add_argument("--sort-fields", required=False, help="sortFields")
+    args = parser.parse_args()
+
+    logger = AdoLogger("create_send_mail", pat)
+    logger.info("RESTful method to send mail for selected/queried work items.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = create_send_mail(client, project, fields=args.fields, ids=args.ids, message=args.message, persistence_id=args.persistence_id, project_id=args.project_id, sort_fields=args.sort_fields)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
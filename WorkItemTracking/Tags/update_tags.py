@@ -11,73 +11,97 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/wit/tags/update?vi
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-TAG_ID_OR_NAME = get_env_or_exit("TAG_ID_OR_NAME", "Tag ID or tag name.")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Update the tag for the project.")
-parser.add_argument("--id", required=False, help="id")
-parser.add_argument("--last-updated", required=False, help="lastUpdated")
-parser.add_argument("--name", required=False, help="name")
-parser.add_argument("--url", required=False, help="url")
-args = parser.parse_args()
+def update_tags(client, project: str, tag_id_or_name: str, *, id: Optional[str] = None, last_updated: Optional[str] = None, name: Optional[str] = None, url_value: Optional[str] = None) -> dict:
+    """
+    Update the tag for the project.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        tag_id_or_name: Tag ID or tag name.
+        id: id
+        last_updated: lastUpdated
+        name: name
+        url_value: url
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "id": id,
+        "lastUpdated": last_updated,
+        "name": name,
+        "url": url_value,
+    }
+    url = build_url(client.organization, f"_apis/wit/tags/{tag_id_or_name}", API_VERSION, project=project)
+    response = client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name'], API_VERSION)
+    return data
+
+
+async def update_tags_async(client, project: str, tag_id_or_name: str, *, id: Optional[str] = None, last_updated: Optional[str] = None, name: Optional[str] = None, url_value: Optional[str] = None) -> dict:
+    """Async variant of update_tags() for use with AsyncAdoClient."""
+    body = {
+        "id": id,
+        "lastUpdated": last_updated,
+        "name": name,
+        "url": url_value,
+    }
+    url = build_url(client.organization, f"_apis/wit/tags/{tag_id_or_name}", API_VERSION, project=project)
+    response = await client.request("PATCH", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['id', 'name'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("update_tags", PAT)
-logger.info("Update the tag for the project.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "id": args.id,
-    "lastUpdated": args.last_updated,
-    "name": args.name,
-    "url": args.url,
-}
+def main() -> None:
+    """Read env vars / flags, call update_tags() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    tag_id_or_name = require_env("TAG_ID_OR_NAME", "Tag ID or tag name.")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/wit/tags/{TAG_ID_OR_NAME}", API_VERSION, project=PROJECT_ID)
-logger.info(f"PATCH {url}")
+    parser = argparse.ArgumentParser(description="Update the tag for the project.")
+    parser.add_argument("--id", required=False, help="id")
+    parser.add_argument("--last-updated", required=False, help="lastUpdated")
+    parser.add_argument("--name", required=False, help="name")
+    parser.add_argument("--url", required=False, help="url")
+    args = parser.parse_args()
 
-response = execute_request("PATCH", url, HEADERS, body=body)
+    logger = AdoLogger("update_tags", pat)
+    logger.info("Update the tag for the project.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = update_tags(client, project, tag_id_or_name, id=args.id, last_updated=args.last_updated, name=args.name, url_value=args.url)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'name'], API_VERSION)
+    print(f"Tags: {data.get('name', 'N/A')}")
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Tags: {data.get("name", "N/A")}")
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,67 +11,86 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/wit/templates/repl
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-TEAM_ID = get_env_or_exit("TEAM_ID", "Team ID or team name")
-TEMPLATE_ID = get_env_or_exit("TEMPLATE_ID", "Template id")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Replace template contents")
-parser.add_argument("--fields", required=False, help="Mapping of field and its templated value.")
-args = parser.parse_args()
+def set_replace_template(client, project: str, team: str, template_id: str, *, fields: Optional[str] = None) -> dict:
+    """
+    Replace template contents
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        team: Team ID or team name
+        template_id: Template id
+        fields: Mapping of field and its templated value.
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "fields": fields,
+    }
+    url = build_url(client.organization, f"{team}/_apis/wit/templates/{template_id}", API_VERSION, project=project)
+    response = client.request("PUT", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['fields'], API_VERSION)
+    return data
+
+
+async def set_replace_template_async(client, project: str, team: str, template_id: str, *, fields: Optional[str] = None) -> dict:
+    """Async variant of set_replace_template() for use with AsyncAdoClient."""
+    body = {
+        "fields": fields,
+    }
+    url = build_url(client.organization, f"{team}/_apis/wit/templates/{template_id}", API_VERSION, project=project)
+    response = await client.request("PUT", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['fields'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("set_replace_template", PAT)
-logger.info("Replace template contents")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "fields": args.fields,
-}
+def main() -> None:
+    """Read env vars / flags, call set_replace_template() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    team = require_env("TEAM_ID", "Team ID or team name")
+    template_id = require_env("TEMPLATE_ID", "Template id")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"{TEAM_ID}/_apis/wit/templates/{TEMPLATE_ID}", API_VERSION, project=PROJECT_ID)
-logger.info(f"PUT {url}")
+    parser = argparse.ArgumentParser(description="Replace template contents")
+    parser.add_argument("--fields", required=False, help="Mapping of field and its templated value.")
+    args = parser.parse_args()
 
-response = execute_request("PUT", url, HEADERS, body=body)
+    logger = AdoLogger("set_replace_template", pat)
+    logger.info("Replace template contents")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = set_replace_template(client, project, team, template_id, fields=args.fields)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['fields'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
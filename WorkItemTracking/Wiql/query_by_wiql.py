@@ -11,66 +11,84 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/wit/wiql/query-by-
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-TEAM_ID = get_env_or_exit("TEAM_ID", "Team ID or team name")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Gets the results of the query given its WIQL.")
-parser.add_argument("--query", required=False, help="The text of the WIQL query")
-args = parser.parse_args()
+def query_by_wiql(client, project: str, team: str, *, query: Optional[str] = None) -> dict:
+    """
+    Gets the results of the query given its WIQL.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        team: Team ID or team name
+        query: The text of the WIQL query
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "query": query,
+    }
+    url = build_url(client.organization, f"{team}/_apis/wit/wiql", API_VERSION, project=project)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['asOf', 'columns'], API_VERSION)
+    return data
+
+
+async def query_by_wiql_async(client, project: str, team: str, *, query: Optional[str] = None) -> dict:
+    """Async variant of query_by_wiql() for use with AsyncAdoClient."""
+    body = {
+        "query": query,
+    }
+    url = build_url(client.organization, f"{team}/_apis/wit/wiql", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['asOf', 'columns'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("query_by_wiql", PAT)
-logger.info("Gets the results of the query given its WIQL.")
 
 # ---------------------------------------------------------------------------
-# Request body
+# CLI
 # ---------------------------------------------------------------------------
-body = {
-    "query": args.query,
-}
+def main() -> None:
+    """Read env vars / flags, call query_by_wiql() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    team = require_env("TEAM_ID", "Team ID or team name")
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"{TEAM_ID}/_apis/wit/wiql", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
+    parser = argparse.ArgumentParser(description="Gets the results of the query given its WIQL.")
+    parser.add_argument("--query", required=False, help="The text of the WIQL query")
+    args = parser.parse_args()
 
-response = execute_request("POST", url, HEADERS, body=body)
+    logger = AdoLogger("query_by_wiql", pat)
+    logger.info("Gets the results of the query given its WIQL.")
+    client = AdoClient(organization, pat, logger=logger)
 
-data = response.json()
+    data = query_by_wiql(client, project, team, query=args.query)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['asOf', 'columns'], API_VERSION)
+    write_json(data)
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,59 +10,78 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/wit/wiql/query-by-wiql?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2-preview.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-WIQL_QUERY = get_env_or_exit("WIQL_QUERY", "WIQL query string (e.g. SELECT [System.Id] FROM workitems WHERE [System.State] = 'Active')")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("query_work_items", PAT)
-logger.info("Execute a WIQL query to search for work items.")
+def query_work_items(client, project: str, wiql_query: str) -> dict:
+    """
+    Execute a WIQL query to search for work items.
 
-# ---------------------------------------------------------------------------
-# Request body
-# ---------------------------------------------------------------------------
-body = {
-    "query": WIQL_QUERY,
-}
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        wiql_query: WIQL query string (e.g. SELECT [System.Id] FROM workitems WHERE [System.State] = 'Active')
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/wit/wiql", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "query": wiql_query,
+    }
+    url = build_url(client.organization, f"_apis/wit/wiql", API_VERSION, project=project)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['workItems', 'columns'], API_VERSION)
+    return data
 
-response = execute_request("POST", url, HEADERS, body=body)
 
-data = response.json()
+async def query_work_items_async(client, project: str, wiql_query: str) -> dict:
+    """Async variant of query_work_items() for use with AsyncAdoClient."""
+    body = {
+        "query": wiql_query,
+    }
+    url = build_url(client.organization, f"_apis/wit/wiql", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['workItems', 'columns'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['workItems', 'columns'], API_VERSION)
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call query_work_items() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    wiql_query = require_env("WIQL_QUERY", "WIQL query string (e.g. SELECT [System.Id] FROM workitems WHERE [System.State] = 'Active')")
+
+    logger = AdoLogger("query_work_items", pat)
+    logger.info("Execute a WIQL query to search for work items.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = query_work_items(client, project, wiql_query)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
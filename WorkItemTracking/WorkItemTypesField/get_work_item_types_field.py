@@ -10,53 +10,74 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/wit/work-item-types-field/get?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
-TYPE = get_env_or_exit("TYPE", "Work item type.")
-FIELD = get_env_or_exit("FIELD", "field")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_work_item_types_field", PAT)
-logger.info("Get a field for a work item type with detailed references.")
+def get_work_item_types_field(client, project: str, type: str, field: str) -> dict:
+    """
+    Get a field for a work item type with detailed references.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/wit/workitemtypes/{TYPE}/fields/{FIELD}", API_VERSION, project=PROJECT_ID)
-logger.info(f"GET {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        type: Work item type.
+        field: field
 
-response = execute_request("GET", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/wit/workitemtypes/{type}/fields/{field}", API_VERSION, project=project)
+    response = client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['allowedValues', 'defaultValue'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['allowedValues', 'defaultValue'], API_VERSION)
+async def get_work_item_types_field_async(client, project: str, type: str, field: str) -> dict:
+    """Async variant of get_work_item_types_field() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/wit/workitemtypes/{type}/fields/{field}", API_VERSION, project=project)
+    response = await client.request("GET", url)
+    data = loads(response.content)
+    version_guard(data, ['allowedValues', 'defaultValue'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_work_item_types_field() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+    type = require_env("TYPE", "Work item type.")
+    field = require_env("FIELD", "field")
+
+    logger = AdoLogger("get_work_item_types_field", pat)
+    logger.info("Get a field for a work item type with detailed references.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = get_work_item_types_field(client, project, type, field)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,63 +10,92 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/wit/work-items/get-work-items-batch?view=azure-devops-rest-7.2
 """
 
-import json
+import argparse
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2-preview.1"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-WORK_ITEM_IDS = get_env_or_exit("WORK_ITEM_IDS", "Comma-separated work item IDs (e.g. 1,2,3)")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("batch_get_work_items", PAT)
-logger.info("Get multiple work items by IDs in a single request.")
+def batch_get_work_items(client, work_item_ids: str) -> dict:
+    """
+    Get multiple work items by IDs in a single request.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        work_item_ids: Comma-separated work item IDs (e.g. 1,2,3)
+
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "ids": work_item_ids,
+    }
+    url = build_url(client.organization, f"_apis/wit/workitemsbatch", API_VERSION)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['count', 'value'], API_VERSION)
+    return data
+
+
+async def batch_get_work_items_async(client, work_item_ids: str) -> dict:
+    """Async variant of batch_get_work_items() for use with AsyncAdoClient."""
+    body = {
+        "ids": work_item_ids,
+    }
+    url = build_url(client.organization, f"_apis/wit/workitemsbatch", API_VERSION)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    version_guard(data, ['count', 'value'], API_VERSION)
+    return data
 
-# ---------------------------------------------------------------------------
-# Request body
-# ---------------------------------------------------------------------------
-body = {
-    "ids": WORK_ITEM_IDS,
-}
 
 # ---------------------------------------------------------------------------
-# API call
+# CLI
 # ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/wit/workitemsbatch", API_VERSION)
-logger.info(f"POST {url}")
+def main() -> None:
+    """Read env vars / flags, call batch_get_work_items() and print the result."""
+    organization, pat = get_common_env()
+    work_item_ids = require_env("WORK_ITEM_IDS", "Comma-separated work item IDs (e.g. 1,2,3)")
 
-response = execute_request("POST", url, HEADERS, body=body)
+    parser = argparse.ArgumentParser(description="Get multiple work items by IDs in a single request.")
+    add_format_arguments(parser)
+    args = parser.parse_args()
 
-data = response.json()
+    logger = AdoLogger("batch_get_work_items", pat)
+    logger.info("Get multiple work items by IDs in a single request.")
+    client = AdoClient(organization, pat, logger=logger)
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['count', 'value'], API_VERSION)
+    if args.format:
+        items = items_of(batch_get_work_items(client, work_item_ids), "value")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
 
-logger.info(f"Retrieved {data.get('count', '?')} items")
+    data = batch_get_work_items(client, work_item_ids)
+    logger.info(f"Retrieved {data.get('count', '?')} items")
 
-# ---------------------------------------------------------------------------
-# Output
-# ---------------------------------------------------------------------------
-print(f"Total: {data.get('count', 'N/A')}\n")
-for item in data.get("value", []):
-    cols = [item.get("id", "N/A"), item.get("fields", "N/A")]
-    print("  " + "  ".join(str(c) for c in cols))
+    print(f"Total: {data.get('count', 'N/A')}\n")
+    for item in data.get("value", []):
+        cols = [item.get("id", "N/A"), item.get("fields", "N/A")]
+        print("  " + "  ".join(str(c) for c in cols))
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -10,52 +10,71 @@ Auth: Basic (PAT)
 Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/wit/work-items/delete?view=azure-devops-rest-7.2
 """
 
-import json
 import os
 import sys
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2-preview.3"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-WORK_ITEM_ID = get_env_or_exit("WORK_ITEM_ID", "Work item ID (integer)")
 
 # ---------------------------------------------------------------------------
-# Auth header & logging
+# API
 # ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("delete_work_item", PAT)
-logger.info("Delete (recycle) a work item.")
+def delete_work_item(client, work_item_id: str) -> dict:
+    """
+    Delete (recycle) a work item.
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/wit/workitems/{WORK_ITEM_ID}", API_VERSION)
-logger.info(f"DELETE {url}")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        work_item_id: Work item ID (integer)
 
-response = execute_request("DELETE", url, HEADERS)
+    Returns:
+        Parsed JSON response.
+    """
+    url = build_url(client.organization, f"_apis/wit/workitems/{work_item_id}", API_VERSION)
+    response = client.request("DELETE", url)
+    data = loads(response.content)
+    version_guard(data, ['id', 'code'], API_VERSION)
+    return data
 
-data = response.json()
 
-# ---------------------------------------------------------------------------
-# Version guard
-# ---------------------------------------------------------------------------
-version_guard(data, ['id', 'code'], API_VERSION)
+async def delete_work_item_async(client, work_item_id: str) -> dict:
+    """Async variant of delete_work_item() for use with AsyncAdoClient."""
+    url = build_url(client.organization, f"_apis/wit/workitems/{work_item_id}", API_VERSION)
+    response = await client.request("DELETE", url)
+    data = loads(response.content)
+    version_guard(data, ['id', 'code'], API_VERSION)
+    return data
+
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(f"Work item {data.get("id", "N/A")} deleted (moved to recycle bin)")
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call delete_work_item() and print the result."""
+    organization, pat = get_common_env()
+    work_item_id = require_env("WORK_ITEM_ID", "Work item ID (integer)")
+
+    logger = AdoLogger("delete_work_item", pat)
+    logger.info("Delete (recycle) a work item.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    data = delete_work_item(client, work_item_id)
+
+    print(f"Work item {data.get('id', 'N/A')} deleted (moved to recycle bin)")
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -11,68 +11,104 @@ Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/wit/work-items/get
 """
 
 import argparse
-import json
 import os
 import sys
+from typing import Optional
 
 # Add project root to path for shared helpers
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
 
-import requests
-
-from _shared.auth import build_auth_header, get_env_or_exit
+from _shared.auth import get_common_env, require_env
+from _shared.cli import run_cli
+from _shared.codec import loads, write_json
 from _shared.logging_utils import AdoLogger
-from _shared.http_client import build_url, execute_request, version_guard
+from _shared.http_client import AdoClient, build_url, version_guard
+from _shared.output import add_format_arguments, items_of, parse_fields, write_items
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 API_VERSION = "7.2"
 
-ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
-PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")
 
 # ---------------------------------------------------------------------------
-# CLI arguments
+# API
 # ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Gets work items for a list of work item ids (Maximum 200)")
-parser.add_argument("--expand", required=False, help="The expand parameters for work item attributes. Possible options are { None, Relations, Fields, L...")
-parser.add_argument("--as-of", required=False, help="AsOf UTC date time string")
-parser.add_argument("--error-policy", required=False, help="The flag to control error policy in a bulk get work items request. Possible options are {Fail, Om...")
-parser.add_argument("--fields", required=False, help="The requested fields")
-parser.add_argument("--ids", required=False, help="The requested work item ids")
-args = parser.parse_args()
+def get_work_items_batch(client, project: str, *, expand: Optional[str] = None, as_of: Optional[str] = None, error_policy: Optional[str] = None, fields: Optional[str] = None, ids: Optional[str] = None) -> dict:
+    """
+    Gets work items for a list of work item ids (Maximum 200)
 
-# ---------------------------------------------------------------------------
-# Auth header & logging
-# ---------------------------------------------------------------------------
-HEADERS = build_auth_header(PAT)
-logger = AdoLogger("get_work_items_batch", PAT)
-logger.info("Gets work items for a list of work item ids (Maximum 200)")
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        project: Project name or GUID.
+        expand: The expand parameters for work item attributes. Possible options are { None, Relations, Fields, L...
+        as_of: AsOf UTC date time string
+        error_policy: The flag to control error policy in a bulk get work items request. Possible options are {Fail, Om...
+        fields: The requested fields
+        ids: The requested work item ids
 
-# ---------------------------------------------------------------------------
-# Request body
-# ---------------------------------------------------------------------------
-body = {
-    "$expand": args.expand,
-    "asOf": args.as_of,
-    "errorPolicy": args.error_policy,
-    "fields": args.fields,
-    "ids": args.ids,
-}
+    Returns:
+        Parsed JSON response.
+    """
+    body = {
+        "$expand": expand,
+        "asOf": as_of,
+        "errorPolicy": error_policy,
+        "fields": fields,
+        "ids": ids,
+    }
+    url = build_url(client.organization, f"_apis/wit/workitemsbatch", API_VERSION, project=project)
+    response = client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
 
-# ---------------------------------------------------------------------------
-# API call
-# ---------------------------------------------------------------------------
-url = build_url(ORGANIZATION, f"_apis/wit/workitemsbatch", API_VERSION, project=PROJECT_ID)
-logger.info(f"POST {url}")
 
-response = execute_request("POST", url, HEADERS, body=body)
+async def get_work_items_batch_async(client, project: str, *, expand: Optional[str] = None, as_of: Optional[str] = None, error_policy: Optional[str] = None, fields: Optional[str] = None, ids: Optional[str] = None) -> dict:
+    """Async variant of get_work_items_batch() for use with AsyncAdoClient."""
+    body = {
+        "$expand": expand,
+        "asOf": as_of,
+        "errorPolicy": error_policy,
+        "fields": fields,
+        "ids": ids,
+    }
+    url = build_url(client.organization, f"_apis/wit/workitemsbatch", API_VERSION, project=project)
+    response = await client.request("POST", url, body=body)
+    data = loads(response.content)
+    return data
 
-data = response.json()
 
 # ---------------------------------------------------------------------------
-# Output
+# CLI
 # ---------------------------------------------------------------------------
-print(json.dumps(data, indent=2))
+def main() -> None:
+    """Read env vars / flags, call get_work_items_batch() and print the result."""
+    organization, pat = get_common_env()
+    project = require_env("PROJECT_ID", "project name or GUID")
+
+    parser = argparse.ArgumentParser(description="Gets work items for a list of work item ids (Maximum 200)")
+    parser.add_argument("--expand", required=False, help="The expand parameters for work item attributes. Possible options are { None, Relations, Fields, L...")
+    parser.add_argument("--as-of", required=False, help="AsOf UTC date time string")
+    parser.add_argument("--error-policy", required=False, help="The flag to control error policy in a bulk get work items request. Possible options are {Fail, Om...")
+    parser.add_argument("--fields", required=False, help="The requested fields")
+    parser.add_argument("--ids", required=False, help="The requested work item ids")
+    add_format_arguments(parser, "--select")
+    args = parser.parse_args()
+
+    logger = AdoLogger("get_work_items_batch", pat)
+    logger.info("Gets work items for a list of work item ids (Maximum 200)")
+    client = AdoClient(organization, pat, logger=logger)
+
+    if args.format:
+        items = items_of(get_work_items_batch(client, project, expand=args.expand, as_of=args.as_of, error_policy=args.error_policy, fields=args.fields, ids=args.ids), "value")
+        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+        logger.info(f"Wrote {written} items")
+        return
+
+    data = get_work_items_batch(client, project, expand=args.expand, as_of=args.as_of, error_policy=args.error_policy, fields=args.fields, ids=args.ids)
+
+    write_json(data)
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Run a WIQL query and stream the matching work items with their fields.
+
+API:  POST {org}/{project}/_apis/wit/wiql?api-version=7.2
+      POST {org}/{project}/_apis/wit/workitemsbatch?api-version=7.2
+Auth: Basic (PAT)
+
+The query returns IDs only. They are split into chunks of 200 (the
+workitemsbatch limit) and the chunks are fetched concurrently on the pooled
+client. Work items are yielded in query order while later chunks are still
+in flight. Only a bounded window of chunks is held in memory. Without an
+explicit as_of, every chunk is read at the query's own asOf, so the result
+is one consistent snapshot.
+
+WIQL returns at most 20,000 IDs per query. Split larger sets with a
+[System.Id] or [System.ChangedDate] range in the WHERE clause.
+
+Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/wit/work-items/get-work-items-batch?view=azure-devops-rest-7.2
+"""
+
+import argparse
+import collections
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+# Add project root to path for shared helpers
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+
+from _shared.auth import get_common_env
+from _shared.cli import run_cli
+from _shared.errors import AdoConfigError
+from _shared.http_client import AdoClient
+from _shared.logging_utils import AdoLogger
+from _shared.output import add_format_arguments, parse_fields, write_items
+from WorkItemTracking.Wiql.query_by_wiql import query_by_wiql
+from WorkItemTracking.Wiql.query_work_items import query_work_items
+from WorkItemTracking.WorkItems.get_work_items_batch import get_work_items_batch
+
+# Maximum IDs accepted by one workitemsbatch request
+BATCH_LIMIT = 200
+DEFAULT_WORKERS = 4
+
+
+def query_ids(client, query: str, project: Optional[str] = None, team: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Run a WIQL query and return its work item IDs.
+
+    Flat queries list ``workItems``; link queries list ``workItemRelations``
+    whose sources and targets are both returned, each ID once. A team-scoped
+    query also needs the project.
+
+    Returns:
+        {"ids": [...], "asOf": "<query snapshot time>"}
+    """
+    if team and not project:
+        raise AdoConfigError("ERROR: A team-scoped query needs a project. Set PROJECT_ID or drop --team.")
+    if team:
+        data = query_by_wiql(client, project, team, query=query)
+    else:
+        data = query_work_items(client, project, query)
+    ids: Dict[int, None] = {}
+    for item in data.get("workItems") or []:
+        ids[item["id"]] = None
+    for relation in data.get("workItemRelations") or []:
+        for end in ("source", "target"):
+            if relation.get(end):
+                ids[relation[end]["id"]] = None
+    return {"ids": list(ids), "asOf": data.get("asOf")}
+
+
+def chunked(ids: Sequence[int], size: int = BATCH_LIMIT) -> Iterator[List[int]]:
+    """Split IDs into lists of at most size."""
+    for start in range(0, len(ids), size):
+        yield list(ids[start:start + size])
+
+
+def fetch_work_items(
+    client,
+    ids: Sequence[int],
+    project: Optional[str] = None,
+    fields: Optional[Sequence[str]] = None,
+    as_of: Optional[str] = None,
+    expand: Optional[str] = None,
+    chunk_size: int = BATCH_LIMIT,
+    workers: int = DEFAULT_WORKERS,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Fetch work items by ID in concurrent workitemsbatch chunks.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        ids: Work item IDs, in the order the items should be yielded.
+        project: Optional project name or GUID.
+        fields: Field reference names to return (default: all fields).
+        as_of: Read the items as they were at this UTC date time.
+        expand: None, Relations, Fields, Links or All (not with fields).
+        chunk_size: IDs per request (at most 200).
+        workers: Chunks fetched concurrently.
+
+    Yields:
+        Work item dicts in the order of ids. IDs that no longer exist or
+        are not readable are skipped.
+    """
+    if not 0 < chunk_size <= BATCH_LIMIT:
+        raise AdoConfigError(f"ERROR: chunk_size must be between 1 and {BATCH_LIMIT}, got {chunk_size}.")
+    if fields and expand:
+        raise AdoConfigError("ERROR: fields and expand cannot be combined in a workitemsbatch request.")
+
+    def fetch(chunk: List[int]) -> List[Dict[str, Any]]:
+        data = get_work_items_batch(
+            client, project, ids=chunk, fields=list(fields) if fields else None,
+            as_of=as_of, expand=expand, error_policy="omit",
+        )
+        return [item for item in data.get("value", []) if item]
+
+    workers = max(1, workers)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Keep a bounded window of chunks in flight; yield strictly in order
+        pending: "collections.deque" = collections.deque()
+        for chunk in chunked(ids, chunk_size):
+            pending.append(executor.submit(fetch, chunk))
+            if len(pending) > workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def hydrate_work_items(
+    client,
+    query: str,
+    project: Optional[str] = None,
+    team: Optional[str] = None,
+    fields: Optional[Sequence[str]] = None,
+    as_of: Optional[str] = None,
+    expand: Optional[str] = None,
+    chunk_size: int = BATCH_LIMIT,
+    workers: int = DEFAULT_WORKERS,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Run a WIQL query and yield each matching work item with its fields.
+
+    Args:
+        client: AdoClient holding the organisation and PAT.
+        query: The WIQL query text.
+        project: Optional project name or GUID.
+        team: Optional team, for queries using @CurrentIteration and similar
+              macros; requires project.
+        fields: Field reference names to return (default: all fields).
+        as_of: Snapshot time; defaults to the asOf reported by the query.
+        expand: None, Relations, Fields, Links or All (not with fields).
+        chunk_size: IDs per workitemsbatch request (at most 200).
+        workers: Chunks fetched concurrently.
+
+    Yields:
+        Work item dicts in query order.
+    """
+    result = query_ids(client, query, project=project, team=team)
+    yield from fetch_work_items(
+        client, result["ids"], project=project, fields=fields,
+        as_of=as_of or result["asOf"], expand=expand, chunk_size=chunk_size, workers=workers,
+    )
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+def main() -> None:
+    """Read env vars / flags, stream hydrate_work_items() as JSON Lines (or --format)."""
+    organization, pat = get_common_env()
+    project = os.environ.get("PROJECT_ID") or None
+
+    parser = argparse.ArgumentParser(description="Run a WIQL query and print every matching work item as one JSON line.")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--query", help="The text of the WIQL query")
+    source.add_argument("--query-file", help="File holding the WIQL query")
+    parser.add_argument("--team", default=None, help="Team ID or name for team-scoped macros (needs PROJECT_ID)")
+    parser.add_argument("--fields", default=None, help="Comma-separated field reference names (default: all)")
+    parser.add_argument("--as-of", default=None, help="AsOf UTC date time (default: the query's snapshot)")
+    parser.add_argument("--expand", default=None, help="None, Relations, Fields, Links or All")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help=f"Concurrent batch requests (default {DEFAULT_WORKERS})")
+    add_format_arguments(parser, "--select")
+    parser.set_defaults(format="ndjson")
+    args = parser.parse_args()
+
+    query = args.query
+    if args.query_file:
+        with open(args.query_file, encoding="utf-8") as handle:
+            query = handle.read()
+    fields = [f.strip() for f in args.fields.split(",") if f.strip()] if args.fields else None
+
+    logger = AdoLogger("hydrate_work_items", pat)
+    logger.info("Run a WIQL query and stream the matching work items.")
+    client = AdoClient(organization, pat, logger=logger)
+
+    items = hydrate_work_items(
+        client, query, project=project, team=args.team, fields=fields,
+        as_of=args.as_of, expand=args.expand, workers=args.workers,
+    )
+    count = write_items(items, args.format, args.output, parse_fields(args.select_fields))
+    logger.info(f"Retrieved {count} work items")
+
+
+if __name__ == "__main__":
+    run_cli(main)
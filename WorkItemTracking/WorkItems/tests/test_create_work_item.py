@@ -12,9 +12,6 @@ Validates:
 """
 
 import json
-import os
-import subprocess
-import sys
 from pathlib import Path
 
 import pytest
@@ -29,35 +26,9 @@ PROJECT_ID = "ProjectAlpha"
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _run_script(extra_args=None, env_override=None, expect_fail=False):
-    """Run create_work_item.py as a subprocess with the given env and args."""
-    env = {
-        "AZURE_DEVOPS_ORG": "testorg",
-        "AZURE_DEVOPS_PAT": "fakepat1234567890",
-        "PROJECT_ID": PROJECT_ID,
-        "PATH": os.environ.get("PATH", ""),
-    }
-    if env_override:
-        env.update(env_override)
-    env = {k: v for k, v in env.items() if v is not None}
-
-    cmd = [sys.executable, SCRIPT]
-    if extra_args:
-        cmd.extend(extra_args)
-
-    result = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        env=env,
-        timeout=30,
-    )
-    if not expect_fail:
-        assert result.returncode == 0, (
-            f"Script failed (rc={result.returncode}):\n"
-            f"STDOUT: {result.stdout}\nSTDERR: {result.stderr}"
-        )
-    return result
+ENV = {
+    "PROJECT_ID": PROJECT_ID,
+}
 
 
 # ---------------------------------------------------------------------------
@@ -70,54 +41,36 @@ class TestCreateWorkItemEnvValidation:
 
     @pytest.mark.offline
     @pytest.mark.wit
-    def test_missing_org_exits(self):
-        result = _run_script(
-            extra_args=["--type", "Task", "--title", "Test"],
-            env_override={"AZURE_DEVOPS_ORG": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "AZURE_DEVOPS_ORG" in (result.stderr + result.stdout)
+    def test_missing_org_exits(self, run_main):
+        code, output = run_main(SCRIPT, env={**ENV, "AZURE_DEVOPS_ORG": None}, args=["--type", "Task", "--title", "Test"])
+        assert code != 0
+        assert "AZURE_DEVOPS_ORG" in output
 
     @pytest.mark.offline
     @pytest.mark.wit
-    def test_missing_pat_exits(self):
-        result = _run_script(
-            extra_args=["--type", "Task", "--title", "Test"],
-            env_override={"AZURE_DEVOPS_PAT": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "AZURE_DEVOPS_PAT" in (result.stderr + result.stdout)
+    def test_missing_pat_exits(self, run_main):
+        code, output = run_main(SCRIPT, env={**ENV, "AZURE_DEVOPS_PAT": None}, args=["--type", "Task", "--title", "Test"])
+        assert code != 0
+        assert "AZURE_DEVOPS_PAT" in output
 
     @pytest.mark.offline
     @pytest.mark.wit
-    def test_missing_project_id_exits(self):
-        result = _run_script(
-            extra_args=["--type", "Task", "--title", "Test"],
-            env_override={"PROJECT_ID": None},
-            expect_fail=True,
-        )
-        assert result.returncode != 0
-        assert "PROJECT_ID" in (result.stderr + result.stdout)
+    def test_missing_project_id_exits(self, run_main):
+        code, output = run_main(SCRIPT, env={**ENV, "PROJECT_ID": None}, args=["--type", "Task", "--title", "Test"])
+        assert code != 0
+        assert "PROJECT_ID" in output
 
     @pytest.mark.offline
     @pytest.mark.wit
-    def test_missing_type_arg_exits(self):
-        result = _run_script(
-            extra_args=["--title", "Test"],
-            expect_fail=True,
-        )
-        assert result.returncode != 0
+    def test_missing_type_arg_exits(self, run_main):
+        code, output = run_main(SCRIPT, env=ENV, args=["--title", "Test"])
+        assert code != 0
 
     @pytest.mark.offline
     @pytest.mark.wit
-    def test_missing_title_arg_exits(self):
-        result = _run_script(
-            extra_args=["--type", "Task"],
-            expect_fail=True,
-        )
-        assert result.returncode != 0
+    def test_missing_title_arg_exits(self, run_main):
+        code, output = run_main(SCRIPT, env=ENV, args=["--type", "Task"])
+        assert code != 0
 
 
 class TestCreateWorkItemURLAndBody:
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Offline unit tests for hydrate_work_items.py
+
+Validates:
+  - WIQL IDs are fetched in chunks of at most 200, with fields and asOf
+  - Work items are yielded in query order across concurrent chunks
+  - Link queries contribute both ends of each relation once
+  - Omitted (deleted) items are skipped
+  - Team-scoped queries need a project
+"""
+
+import json
+
+import pytest
+import responses
+
+from _shared.errors import AdoConfigError
+from _shared.http_client import AdoClient
+from WorkItemTracking.WorkItems.hydrate_work_items import fetch_work_items, hydrate_work_items
+
+WIQL_URL = "https://dev.azure.com/testorg/myproj/_apis/wit/wiql?api-version=7.2-preview.2"
+BATCH_URL = "https://dev.azure.com/testorg/myproj/_apis/wit/workitemsbatch?api-version=7.2"
+
+
+def _batch_callback(request):
+    body = json.loads(request.body)
+    value = [{"id": i, "fields": {"System.Id": i}} if i % 100 else None for i in body["ids"]]
+    return 200, {}, json.dumps({"count": len(value), "value": value})
+
+
+@pytest.fixture
+def client():
+    return AdoClient("testorg", "fakepat1234567890")
+
+
+class TestHydrateWorkItems:
+    """Validate the WIQL → workitemsbatch pipeline."""
+
+    @pytest.mark.offline
+    @pytest.mark.wit
+    @responses.activate
+    def test_chunks_in_order(self, client):
+        ids = list(range(1, 451))
+        responses.add(responses.POST, WIQL_URL, json={
+            "asOf": "2024-05-01T00:00:00Z", "columns": [],
+            "workItems": [{"id": i} for i in ids],
+        })
+        responses.add_callback(responses.POST, BATCH_URL, callback=_batch_callback)
+
+        items = list(hydrate_work_items(client, "SELECT [System.Id] FROM WorkItems", project="myproj",
+                                        fields=["System.Title"], workers=3))
+
+        assert [item["id"] for item in items] == [i for i in ids if i % 100]
+        bodies = [json.loads(call.request.body) for call in responses.calls[1:]]
+        assert sorted(len(b["ids"]) for b in bodies) == [50, 200, 200]
+        assert all(b["fields"] == ["System.Title"] and b["asOf"] == "2024-05-01T00:00:00Z" for b in bodies)
+        assert all(b["errorPolicy"] == "omit" for b in bodies)
+
+    @pytest.mark.offline
+    @pytest.mark.wit
+    @responses.activate
+    def test_link_query_ids(self, client):
+        responses.add(responses.POST, WIQL_URL, json={"workItemRelations": [
+            {"source": None, "target": {"id": 1}},
+            {"source": {"id": 1}, "target": {"id": 2}},
+            {"source": {"id": 1}, "target": {"id": 3}},
+        ]})
+        responses.add_callback(responses.POST, BATCH_URL, callback=_batch_callback)
+
+        items = list(hydrate_work_items(client, "SELECT [System.Id] FROM WorkItemLinks", project="myproj"))
+
+        assert [item["id"] for item in items] == [1, 2, 3]
+
+    @pytest.mark.offline
+    @pytest.mark.wit
+    def test_rejects_oversized_chunks(self, client):
+        with pytest.raises(AdoConfigError):
+            list(fetch_work_items(client, [1], chunk_size=500))
+
+    @pytest.mark.offline
+    @pytest.mark.wit
+    @responses.activate
+    def test_team_needs_project(self, client):
+        with pytest.raises(AdoConfigError, match="needs a project"):
+            list(hydrate_work_items(client, "SELECT [System.Id] FROM WorkItems", team="Team A"))
+        assert len(responses.calls) == 0
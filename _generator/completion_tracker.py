@@ -12,6 +12,14 @@ Usage:
     python _generator/completion_tracker.py              # JSON to stdout
     python _generator/completion_tracker.py --verbose     # human-readable
     python _generator/completion_tracker.py --check-only  # exit 0 if complete, 1 if not
+    python _generator/completion_tracker.py --no-cache    # ignore cached check results
+
+The syntax check compiles scripts in-process across a worker pool and the
+test check runs pytest for several domains at once. Both cache their
+results in _generator/.completion_cache.json (git-ignored): a script is
+recompiled only when its content hash changes, and a domain's tests rerun
+only when the hash of the domain's files, or of the shared code its tests
+depend on, changes.
 
 Exit codes:
     0 — project is complete (or --check-only and complete)
@@ -22,15 +30,23 @@ from __future__ import annotations
 
 import argparse
 import glob
+import hashlib
 import json
 import os
 import re
 import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 ROOT = Path(__file__).resolve().parents[1]
+CACHE_PATH = ROOT / "_generator" / ".completion_cache.json"
+# Bump when the cache layout or the meaning of a cached result changes
+CACHE_FORMAT = 1
+# Files outside a domain that its tests depend on
+SHARED_TEST_INPUTS = ("conftest.py", "pytest.ini", "_shared/**/*.py")
+TEST_TIMEOUT = 120
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # All 46 domain directories the project targets
@@ -76,11 +92,158 @@ BATCH_CI_FILTER = 10
 BATCH_README = 5
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# Result cache — check results keyed by content hash
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class ResultCache:
+    """
+    Check results persisted between runs, in named sections.
+
+    Each entry is stored with the hash of the content it was computed from
+    and is only returned while that hash still matches. A different Python
+    version (compile() and pytest results depend on it) or cache format
+    starts an empty cache. path=None keeps results in memory only.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path
+        self.sections: Dict[str, Dict[str, List[Any]]] = {}
+        self.changed = False
+        if path is None:
+            return
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if (
+            isinstance(data, dict)
+            and data.get("format") == CACHE_FORMAT
+            and data.get("python") == _python_version()
+        ):
+            self.sections = data.get("sections", {})
+
+    def get(self, section: str, key: str, digest: str) -> Any:
+        """Cached result for key, or None when missing or computed from other content."""
+        entry = self.sections.get(section, {}).get(key)
+        if entry is not None and entry[0] == digest:
+            return entry[1]
+        return None
+
+    def put(self, section: str, key: str, digest: str, result: Any) -> None:
+        self.sections.setdefault(section, {})[key] = [digest, result]
+        self.changed = True
+
+    def prune(self, section: str, keys: Iterable[str]) -> None:
+        """Drop entries whose key is not in keys (deleted scripts, removed domains)."""
+        entries = self.sections.get(section, {})
+        stale = set(entries) - set(keys)
+        for key in stale:
+            del entries[key]
+        self.changed = self.changed or bool(stale)
+
+    def save(self) -> None:
+        if self.path is None or not self.changed:
+            return
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            tmp.write_text(json.dumps({
+                "format": CACHE_FORMAT,
+                "python": _python_version(),
+                "sections": self.sections,
+            }), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            # A read-only checkout still works, just without the cache
+            pass
+        self.changed = False
+
+
+def _python_version() -> str:
+    return "%d.%d.%d" % sys.version_info[:3]
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _tree_hash(paths: Iterable[Path]) -> str:
+    """Hash of the relative paths and contents of paths, in sorted order."""
+    digest = hashlib.sha256()
+    for path in sorted(paths):
+        digest.update(os.path.relpath(path, ROOT).encode("utf-8") + b"\0")
+        digest.update(path.read_bytes())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _worker_count(workers: Optional[int]) -> int:
+    return max(1, workers or os.cpu_count() or 1)
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # Checkers — each returns None if the check passes, or a task dict if work needed
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def _check_python_syntax() -> Optional[Dict[str, Any]]:
+def _compile_errors(batch: List[Tuple[str, bytes]]) -> List[Optional[str]]:
+    """compile() each (path, source); None for success, else the error message."""
+    results: List[Optional[str]] = []
+    for path, source in batch:
+        try:
+            compile(source, path, "exec", dont_inherit=True)
+            results.append(None)
+        except (SyntaxError, ValueError) as exc:
+            results.append(f"{type(exc).__name__}: {exc}")
+    return results
+
+
+def _syntax_errors(
+    scripts: List[str],
+    cache_path: Optional[Path] = CACHE_PATH,
+    workers: Optional[int] = None,
+) -> Dict[str, str]:
+    """Map each script that does not compile to its error; unchanged scripts come from the cache."""
+    cache = ResultCache(cache_path)
+    errors: Dict[str, str] = {}
+    pending: List[Tuple[str, str, bytes]] = []
+    for script in scripts:
+        rel = os.path.relpath(script, ROOT)
+        source = Path(script).read_bytes()
+        digest = _sha256(source)
+        cached = cache.get("syntax", rel, digest)
+        if cached is None:
+            pending.append((rel, digest, source))
+        elif cached["error"]:
+            errors[rel] = cached["error"]
+
+    if pending:
+        count = _worker_count(workers)
+        # A few batches per worker keeps the pool busy without per-file overhead
+        size = max(1, len(pending) // (count * 4) + 1)
+        batches = [
+            [(str(ROOT / rel), source) for rel, _, source in pending[i:i + size]]
+            for i in range(0, len(pending), size)
+        ]
+        if count == 1 or len(batches) == 1:
+            outcomes = [_compile_errors(batch) for batch in batches]
+        else:
+            with ProcessPoolExecutor(max_workers=count) as pool:
+                outcomes = list(pool.map(_compile_errors, batches))
+        flat = [error for batch in outcomes for error in batch]
+        for (rel, digest, _), error in zip(pending, flat):
+            cache.put("syntax", rel, digest, {"error": error})
+            if error:
+                errors[rel] = error
+
+    cache.prune("syntax", (os.path.relpath(s, ROOT) for s in scripts))
+    cache.save()
+    return errors
+
+
+def _check_python_syntax(
+    cache_path: Optional[Path] = CACHE_PATH,
+    workers: Optional[int] = None,
+) -> Optional[Dict[str, Any]]:
     """P0: Verify all generated Python scripts compile without errors."""
     scripts = sorted(glob.glob(str(ROOT / "**" / "*.py"), recursive=True))
     scripts = [
@@ -92,15 +255,9 @@ def _check_python_syntax() -> Optional[Dict[str, Any]]:
     ]
 
     bad_by_domain: Dict[str, List[str]] = {}
-    for s in scripts:
-        r = subprocess.run(
-            [sys.executable, "-m", "py_compile", s],
-            capture_output=True, text=True,
-        )
-        if r.returncode != 0:
-            rel = os.path.relpath(s, ROOT)
-            domain = rel.split("/")[0]
-            bad_by_domain.setdefault(domain, []).append(rel)
+    for rel in sorted(_syntax_errors(scripts, cache_path, workers)):
+        domain = rel.split("/")[0]
+        bad_by_domain.setdefault(domain, []).append(rel)
 
     if not bad_by_domain:
         return None
@@ -393,9 +550,67 @@ def _check_root_readme() -> Optional[Dict[str, Any]]:
     }
 
 
-def _check_test_failures() -> Optional[Dict[str, Any]]:
+def _domain_files(domain: str) -> List[Path]:
+    return [
+        p for p in (ROOT / domain).rglob("*")
+        if p.is_file() and "__pycache__" not in p.parts and p.suffix != ".pyc"
+    ]
+
+
+def _run_domain_tests(domain: str) -> Dict[str, Any]:
+    """Run one domain's tests and keep what the task body needs."""
+    r = subprocess.run(
+        [sys.executable, "-m", "pytest", str(ROOT / domain), "-q", "--tb=line", "-x",
+         # Parallel runs must not share the .pytest_cache directory
+         "-p", "no:cacheprovider"],
+        capture_output=True, text=True, timeout=TEST_TIMEOUT,
+        cwd=str(ROOT),
+    )
+    return {"returncode": r.returncode, "stdout": r.stdout}
+
+
+def _domain_test_results(
+    domains: List[str],
+    cache_path: Optional[Path] = CACHE_PATH,
+    workers: Optional[int] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    pytest outcome per domain, run concurrently.
+
+    A domain's cached outcome is reused while the hash of its files and of
+    SHARED_TEST_INPUTS is unchanged.
+    """
+    cache = ResultCache(cache_path)
+    shared = _tree_hash(
+        path for pattern in SHARED_TEST_INPUTS for path in ROOT.glob(pattern)
+        if "__pycache__" not in path.parts
+    )
+    results: Dict[str, Dict[str, Any]] = {}
+    digests: Dict[str, str] = {}
+    for domain in domains:
+        digests[domain] = _sha256(f"{shared}:{_tree_hash(_domain_files(domain))}".encode("ascii"))
+        cached = cache.get("tests", domain, digests[domain])
+        if cached is not None:
+            results[domain] = cached
+
+    pending = [d for d in domains if d not in results]
+    if pending:
+        with ThreadPoolExecutor(max_workers=min(_worker_count(workers), len(pending))) as pool:
+            for domain, outcome in zip(pending, pool.map(_run_domain_tests, pending)):
+                results[domain] = outcome
+                cache.put("tests", domain, digests[domain], outcome)
+
+    cache.prune("tests", domains)
+    cache.save()
+    return results
+
+
+def _check_test_failures(
+    cache_path: Optional[Path] = CACHE_PATH,
+    workers: Optional[int] = None,
+) -> Optional[Dict[str, Any]]:
     """P5: Find domains with failing T1 tests and create a fix task."""
-    # Test one domain at a time (cheapest first — fewest test files)
+    # Domains that have tests, with their test file counts
     domain_tests: List[tuple] = []
     for d in ALL_DOMAINS:
         test_dir = ROOT / d
@@ -405,18 +620,15 @@ def _check_test_failures() -> Optional[Dict[str, Any]]:
         if test_files:
             domain_tests.append((d, len(test_files)))
 
-    # Sort by fewest tests first (quicker to validate)
+    # Report the domain with the fewest tests first (quickest to fix)
     domain_tests.sort(key=lambda x: x[1])
+    results = _domain_test_results([d for d, _ in domain_tests], cache_path, workers)
 
     for domain, count in domain_tests:
-        r = subprocess.run(
-            [sys.executable, "-m", "pytest", str(ROOT / domain), "-q", "--tb=line", "-x"],
-            capture_output=True, text=True, timeout=120,
-            cwd=str(ROOT),
-        )
-        if r.returncode != 0:
+        stdout = results[domain]["stdout"]
+        if results[domain]["returncode"] != 0:
             # Parse failure count from pytest output
-            last_line = r.stdout.strip().split("\n")[-1] if r.stdout.strip() else ""
+            last_line = stdout.strip().split("\n")[-1] if stdout.strip() else ""
             # e.g. "3 failed, 12 passed in 2.50s"
             fail_match = re.search(r"(\d+) failed", last_line)
             pass_match = re.search(r"(\d+) passed", last_line)
@@ -425,7 +637,7 @@ def _check_test_failures() -> Optional[Dict[str, Any]]:
 
             # Get first few failure lines
             failure_lines = []
-            for line in r.stdout.split("\n"):
+            for line in stdout.split("\n"):
                 if line.startswith("FAILED "):
                     failure_lines.append(line.strip())
                 if len(failure_lines) >= 5:
@@ -441,7 +653,7 @@ def _check_test_failures() -> Optional[Dict[str, Any]]:
                         f"**First failures:**\n"
                         + "\n".join(f"- `{f}`" for f in failure_lines)
                         + "\n\n**Full output (last 20 lines):**\n```\n"
-                        + "\n".join(r.stdout.strip().split("\n")[-20:])
+                        + "\n".join(stdout.strip().split("\n")[-20:])
                         + "\n```\n\n"
                         "Common causes: missing fixture files, URL pattern mismatches, "
                         "or unescaped special characters in generated code. Check if the "
@@ -524,9 +736,23 @@ CHECKS = [
     ("P5: Test failures", _check_test_failures),
 ]
 
+# Checks that take cache_path / workers
+CACHED_CHECKS = {_check_python_syntax, _check_test_failures}
+
 
-def run_tracker(verbose: bool = False) -> Dict[str, Any]:
-    """Run all checks in priority order and return the first task found."""
+def run_tracker(
+    verbose: bool = False,
+    cache_path: Optional[Path] = CACHE_PATH,
+    workers: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Run all checks in priority order and return the first task found.
+
+    Args:
+        verbose: Print progress for each check.
+        cache_path: Result cache file; None recomputes every result.
+        workers: Worker pool size for the syntax and test checks (default: CPU count).
+    """
 
     # ── Pre-check: block new work if auto-heal issues are open ────────
     if verbose:
@@ -561,7 +787,10 @@ def run_tracker(verbose: bool = False) -> Dict[str, Any]:
         if verbose:
             print(f"  Checking {name}...", end=" ", flush=True)
         try:
-            task = check_fn()
+            if check_fn in CACHED_CHECKS:
+                task = check_fn(cache_path=cache_path, workers=workers)
+            else:
+                task = check_fn()
         except Exception as e:
             if verbose:
                 print(f"ERROR: {e}")
@@ -601,9 +830,15 @@ def main():
         "--check-only", action="store_true",
         help="Exit 0 if complete, 1 if not (no JSON output)",
     )
+    parser.add_argument("--no-cache", action="store_true", help="Recompute every check result")
+    parser.add_argument("--workers", type=int, default=None, help="Parallel workers (default: CPU count)")
     args = parser.parse_args()
 
-    result = run_tracker(verbose=args.verbose)
+    result = run_tracker(
+        verbose=args.verbose,
+        cache_path=None if args.no_cache else CACHE_PATH,
+        workers=args.workers,
+    )
 
     if args.check_only:
         sys.exit(0 if result["status"] == "complete" else 1)
@@ -9,12 +9,28 @@ Usage:
     python -m _generator.generate --definition _generator/definitions/example.yaml
     python -m _generator.generate --definition _generator/definitions/example.yaml --lang python
     python -m _generator.generate --definition _generator/definitions/example.yaml --dry-run
+    python -m _generator.generate --all
+    python -m _generator.generate --glob "_generator/definitions/wit_*.yaml" --jobs 8
+
+Bulk mode (--all / --glob) renders definitions in a process pool and is
+incremental. _generator/.manifest.json records a hash of each definition
+together with the generator and template sources. Only definitions whose
+inputs changed are rendered again, and only files whose content differs
+are rewritten. Files that exist without the AUTO-GENERATED header are
+treated as hand-maintained and left alone. --force renders everything.
+--all also refreshes devops_api/registry.py.
 """
 
 import argparse
+import glob
+import hashlib
 import json
+import os
 import sys
+import types
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from _generator.operation_def import load_definition
 from _generator.templates.python_impl import render_python
@@ -24,11 +40,16 @@ from _generator.templates.python_test import render_python_test
 from _generator.templates.pester_test import render_pester_test
 from _generator.templates.bats_test import render_bats_test
 
+GENERATOR_DIR = Path(__file__).resolve().parent
+DEFINITIONS_DIR = GENERATOR_DIR / "definitions"
+MANIFEST_PATH = GENERATOR_DIR / ".manifest.json"
+GENERATED_MARKER = "AUTO-GENERATED"
+# Outputs that carry the marker when they come from the generator
+MARKED_SUFFIXES = (".py", ".ps1", ".sh", ".bats")
 
-def generate(definition_path: Path, output_dir: Path, languages: list, dry_run: bool = False):
-    """Generate all files for an operation definition."""
-    op = load_definition(definition_path)
 
+def render_files(op, output_dir: Path, languages: list) -> Dict[Path, str]:
+    """Render every output file for an operation: path -> content."""
     base = output_dir / op.domain / op.resource
     test_dir = base / "tests"
     fixture_dir = test_dir / "fixtures"
@@ -73,6 +94,14 @@ def generate(definition_path: Path, output_dir: Path, languages: list, dry_run:
         if not init_file.exists():
             files_to_write[init_file] = ""
 
+    return files_to_write
+
+
+def generate(definition_path: Path, output_dir: Path, languages: list, dry_run: bool = False):
+    """Generate all files for an operation definition."""
+    op = load_definition(definition_path)
+    files_to_write = render_files(op, output_dir, languages)
+
     # --- Write files ---
     print(f"\n{'[DRY RUN] ' if dry_run else ''}Generating {len(files_to_write)} files for {op.domain}/{op.resource}/{op.operation}:\n")
 
@@ -92,15 +121,148 @@ def generate(definition_path: Path, output_dir: Path, languages: list, dry_run:
     return files_to_write
 
 
+# ---------------------------------------------------------------------------
+# Bulk mode
+# ---------------------------------------------------------------------------
+
+def _generator_hash() -> str:
+    """Hash of the generator sources every output depends on."""
+    digest = hashlib.sha256()
+    sources = [GENERATOR_DIR / "operation_def.py", GENERATOR_DIR / "generate.py"]
+    sources += sorted((GENERATOR_DIR / "templates").glob("*.py"))
+    for path in sources:
+        digest.update(path.name.encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _load_manifest(path: Path) -> Dict[str, dict]:
+    try:
+        return json.loads(path.read_text(encoding="utf-8")).get("definitions", {})
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_manifest(path: Path, entries: Dict[str, dict]) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps({"definitions": entries}, indent=1, sort_keys=True) + "\n", encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _hand_written(path: Path) -> bool:
+    """True for an existing script or test that was not produced by the generator."""
+    if path.suffix not in MARKED_SUFFIXES or path.name == "__init__.py" or not path.exists():
+        return False
+    with open(path, encoding="utf-8", errors="replace") as fh:
+        return GENERATED_MARKER not in fh.read(512)
+
+
+def _render_worker(task: Tuple[str, str, List[str]]) -> Tuple[str, List[str], Dict[str, str]]:
+    """Process-pool entry point: load one definition and render its files."""
+    definition, output_dir, languages = task
+    op = load_definition(Path(definition))
+    files = render_files(op, Path(output_dir), languages)
+    return definition, [op.domain, op.resource, op.operation], {str(p): c for p, c in files.items()}
+
+
+def generate_all(
+    definition_paths: Iterable[Path],
+    output_dir: Path,
+    languages: list,
+    jobs: Optional[int] = None,
+    force: bool = False,
+    dry_run: bool = False,
+    manifest_path: Path = MANIFEST_PATH,
+) -> Dict[str, object]:
+    """
+    Render many definitions in a process pool, skipping unchanged inputs.
+
+    Returns:
+        Counts of definitions / rendered / written / unchanged / hand_written,
+        plus "operations": [domain, resource, operation] for every definition.
+    """
+    manifest = _load_manifest(manifest_path)
+    prefix = f"{_generator_hash()}|{','.join(languages)}|{output_dir.resolve()}|".encode("utf-8")
+
+    inputs: Dict[str, str] = {}
+    todo: List[str] = []
+    for path in definition_paths:
+        key = str(path.resolve())
+        inputs[key] = hashlib.sha256(prefix + path.read_bytes()).hexdigest()
+        entry = manifest.get(key)
+        fresh = (
+            entry is not None and entry.get("inputs") == inputs[key]
+            and all(Path(p).exists() for p in entry.get("outputs", []))
+        )
+        if force or not fresh:
+            todo.append(key)
+
+    stats = {"definitions": len(inputs), "rendered": len(todo), "written": 0, "unchanged": 0, "hand_written": 0}
+    tasks = [(key, str(output_dir), list(languages)) for key in todo]
+    workers = jobs or os.cpu_count() or 1
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_render_worker, tasks, chunksize=max(1, len(tasks) // (workers * 4))))
+    else:
+        results = [_render_worker(task) for task in tasks]
+
+    for key, operation, files in results:
+        for name, content in sorted(files.items()):
+            path = Path(name)
+            if _hand_written(path):
+                stats["hand_written"] += 1
+                continue
+            if path.exists() and path.read_text(encoding="utf-8") == content:
+                stats["unchanged"] += 1
+                continue
+            stats["written"] += 1
+            rel = path.relative_to(output_dir)
+            if dry_run:
+                print(f"  [DRY] {rel}")
+                continue
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content, encoding="utf-8")
+            if path.suffix == ".sh":
+                path.chmod(0o755)
+            print(f"  ✓ {rel}")
+        manifest[key] = {"inputs": inputs[key], "operation": operation, "outputs": sorted(files)}
+
+    if not dry_run:
+        _save_manifest(manifest_path, manifest)
+    stats["operations"] = [manifest[key]["operation"] for key in inputs if key in manifest]
+    return stats
+
+
+def _refresh_registry(operations: List[List[str]]) -> bool:
+    """Rewrite devops_api/registry.py from [domain, resource, operation] triples."""
+    from _generator.registry import DEFAULT_OUTPUT, build_registry, render_registry
+
+    ops = (types.SimpleNamespace(domain=d, resource=r, operation=o) for d, r, o in operations)
+    content = render_registry(build_registry(ops))
+    if DEFAULT_OUTPUT.exists() and DEFAULT_OUTPUT.read_text(encoding="utf-8") == content:
+        return False
+    DEFAULT_OUTPUT.write_text(content, encoding="utf-8")
+    return True
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Generate Azure DevOps API client implementations from a definition file."
     )
-    parser.add_argument(
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument(
         "--definition", "-d",
-        required=True,
         help="Path to the YAML/JSON operation definition file.",
     )
+    source.add_argument(
+        "--all",
+        action="store_true",
+        help="Generate every definition in _generator/definitions/ (incremental).",
+    )
+    source.add_argument(
+        "--glob",
+        help="Generate every definition matching this glob pattern (incremental).",
+    )
     parser.add_argument(
         "--output-dir", "-o",
         default=".",
@@ -118,12 +280,42 @@ def main():
         action="store_true",
         help="Preview what would be generated without writing files.",
     )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=None,
+        help="Worker processes for --all / --glob (default: CPU count).",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="With --all / --glob, render every definition even if unchanged.",
+    )
     args = parser.parse_args()
 
     languages = args.lang
     if "all" in languages:
         languages = ["python", "powershell", "bash"]
 
+    if args.all or args.glob:
+        if args.all:
+            paths = sorted(DEFINITIONS_DIR.glob("*.yaml")) + sorted(DEFINITIONS_DIR.glob("*.json"))
+        else:
+            paths = [Path(p) for p in sorted(glob.glob(args.glob))]
+        if not paths:
+            sys.exit(f"ERROR: No definition files match: {args.glob}")
+        output_dir = Path(args.output_dir)
+        stats = generate_all(paths, output_dir, languages, jobs=args.jobs, force=args.force, dry_run=args.dry_run)
+        print(
+            f"\n{'[DRY RUN] ' if args.dry_run else ''}{stats['definitions']} definitions, "
+            f"{stats['rendered']} rendered, {stats['written']} files "
+            f"{'would be ' if args.dry_run else ''}written, {stats['unchanged']} unchanged, "
+            f"{stats['hand_written']} hand-maintained skipped."
+        )
+        if args.all and not args.dry_run and _refresh_registry(stats["operations"]):
+            print("  ✓ devops_api/registry.py")
+        return
+
     definition_path = Path(args.definition)
     if not definition_path.exists():
         sys.exit(f"ERROR: Definition file not found: {definition_path}")
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Compiled index of every operation definition.
+
+Loading all definitions means parsing over a thousand YAML files. The
+index pickles the parsed OperationDefs, keyed by "Domain/Resource/operation",
+into _generator/.index.pickle (git-ignored), together with each source
+file's mtime and size. load_index() stats the definition files, re-parses
+only the ones that were added or changed, drops removed ones, and rewrites
+the index when anything moved. A change to operation_def.py invalidates the
+whole index.
+
+Usage:
+    python -m _generator.index            # refresh the index and print a summary
+    python -m _generator.index --rebuild  # re-parse every definition
+
+    from _generator.index import load_index
+    ops = load_index()                    # {"Build/Builds/get_builds": OperationDef, ...}
+    files = definition_files()            # {"Build/Builds/get_builds": Path(".../build_get_builds.yaml"), ...}
+"""
+
+import argparse
+import hashlib
+import os
+import pickle
+import time
+from pathlib import Path
+from typing import Dict, Tuple
+
+from _generator import operation_def
+from _generator.operation_def import OperationDef, load_definition
+
+GENERATOR_DIR = Path(__file__).resolve().parent
+DEFAULT_DEFINITIONS = GENERATOR_DIR / "definitions"
+INDEX_PATH = GENERATOR_DIR / ".index.pickle"
+# Bump when the pickle layout changes
+INDEX_FORMAT = 1
+
+# file name -> ((mtime_ns, size), OperationDef)
+_Entries = Dict[str, Tuple[Tuple[int, int], OperationDef]]
+
+
+def operation_key(op: OperationDef) -> str:
+    """Index key of an operation: Domain/Resource/operation."""
+    return f"{op.domain}/{op.resource}/{op.operation}"
+
+
+def _schema_stamp() -> str:
+    """Hash of the OperationDef schema; pickled objects depend on it."""
+    return hashlib.sha256(Path(operation_def.__file__).read_bytes()).hexdigest()
+
+
+def _read(index_path: Path, definitions_dir: Path) -> _Entries:
+    try:
+        with open(index_path, "rb") as fh:
+            data = pickle.load(fh)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        return {}
+    if (
+        not isinstance(data, dict)
+        or data.get("format") != INDEX_FORMAT
+        or data.get("schema") != _schema_stamp()
+        or data.get("definitions_dir") != str(definitions_dir.resolve())
+    ):
+        return {}
+    return data["entries"]
+
+
+def _write(index_path: Path, definitions_dir: Path, entries: _Entries) -> None:
+    tmp = index_path.with_name(f"{index_path.name}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as fh:
+        pickle.dump({
+            "format": INDEX_FORMAT,
+            "schema": _schema_stamp(),
+            "definitions_dir": str(definitions_dir.resolve()),
+            "entries": entries,
+        }, fh, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, index_path)
+
+
+def _load_entries(definitions_dir: Path, index_path: Path, rebuild: bool) -> _Entries:
+    cached = {} if rebuild else _read(index_path, definitions_dir)
+    entries: _Entries = {}
+    changed = False
+    for pattern in ("*.yaml", "*.json"):
+        for path in definitions_dir.glob(pattern):
+            st = path.stat()
+            stamp = (st.st_mtime_ns, st.st_size)
+            hit = cached.get(path.name)
+            if hit is not None and hit[0] == stamp:
+                entries[path.name] = hit
+            else:
+                entries[path.name] = (stamp, load_definition(path))
+                changed = True
+    if changed or len(entries) != len(cached):
+        try:
+            _write(index_path, definitions_dir, entries)
+        except OSError:
+            # A read-only checkout still works, just without the cache
+            pass
+    return entries
+
+
+def load_index(
+    definitions_dir: Path = DEFAULT_DEFINITIONS,
+    index_path: Path = INDEX_PATH,
+    rebuild: bool = False,
+) -> Dict[str, OperationDef]:
+    """
+    Return every definition as {"Domain/Resource/operation": OperationDef}.
+
+    Args:
+        definitions_dir: Directory of YAML / JSON definitions.
+        index_path: Where the compiled index is cached.
+        rebuild: Ignore the cached index and parse every file.
+    """
+    entries = _load_entries(definitions_dir, index_path, rebuild)
+    ops = (op for _, op in (entries[name] for name in sorted(entries)))
+    return {operation_key(op): op for op in ops}
+
+
+def definition_files(
+    definitions_dir: Path = DEFAULT_DEFINITIONS,
+    index_path: Path = INDEX_PATH,
+) -> Dict[str, Path]:
+    """Return the file each operation was parsed from, as {"Domain/Resource/operation": Path}."""
+    entries = _load_entries(definitions_dir, index_path, rebuild=False)
+    return {operation_key(op): definitions_dir / name for name, (_, op) in sorted(entries.items())}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Refresh the compiled operation definition index.")
+    parser.add_argument("--definitions-dir", default=str(DEFAULT_DEFINITIONS), help="Directory of operation definitions.")
+    parser.add_argument("--rebuild", action="store_true", help="Re-parse every definition.")
+    args = parser.parse_args()
+    start = time.perf_counter()
+    ops = load_index(Path(args.definitions_dir), rebuild=args.rebuild)
+    print(f"Indexed {len(ops)} operations in {time.perf_counter() - start:.3f}s ({INDEX_PATH})")
+
+
+if __name__ == "__main__":
+    main()
@@ -75,6 +75,14 @@ class OperationDef:
     table_columns: List[str] = field(default_factory=list)  # for table mode
     list_key: str = "value"  # JSON key holding the list in collection responses
 
+    # Paging style: "continuation", "continuation_body", "top_skip" or "" (single page)
+    pagination: str = ""
+
+    # "json" (parsed), "stream" (raw content written to a file / stdout) or
+    # "download" (large binary content fetched with resumable ranged requests)
+    response_mode: str = "json"
+    content_type: str = ""  # Accept header for raw content, e.g. "application/zip"
+
     # Fixture: sample successful response
     fixture_success: Optional[Dict[str, Any]] = None
     fixture_error_404: Optional[Dict[str, Any]] = None
@@ -85,6 +93,11 @@ class OperationDef:
     # Base hostname (default dev.azure.com; override for Graph, Release, etc.)
     base_host: str = "dev.azure.com"
 
+    @property
+    def raw_content(self) -> bool:
+        """True when the response body is raw content rather than JSON."""
+        return self.response_mode in ("stream", "download")
+
     @property
     def ps_script_name(self) -> str:
         """PowerShell script name: Verb-Noun.ps1"""
@@ -111,14 +124,22 @@ class OperationDef:
         return f"{self.operation}_{self.success_status}.json"
 
 
+# libyaml's C loader parses ~10x faster; fall back to the pure-Python one
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
 def load_definition(path: Path) -> OperationDef:
     """Load an operation definition from a YAML or JSON file."""
     text = path.read_text(encoding="utf-8")
     if path.suffix in (".yaml", ".yml"):
-        raw = yaml.safe_load(text)
+        raw = yaml.load(text, Loader=_YamlLoader)
     else:
         raw = json.loads(text)
+    return definition_from_dict(raw)
+
 
+def definition_from_dict(raw: Dict[str, Any]) -> OperationDef:
+    """Build an OperationDef from a parsed definition mapping."""
     # Parse params
     params = []
     for p in raw.get("params", []):
@@ -149,6 +170,9 @@ def load_definition(path: Path) -> OperationDef:
         output_message=raw.get("output_message", ""),
         table_columns=raw.get("table_columns", []),
         list_key=raw.get("list_key", "value"),
+        pagination=raw.get("pagination", ""),
+        response_mode=raw.get("response_mode", "json"),
+        content_type=raw.get("content_type", ""),
         fixture_success=raw.get("fixture_success"),
         fixture_error_404=raw.get("fixture_error_404"),
         project_scoped=raw.get("project_scoped", False),
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Operation registry generator for the ``python -m devops_api`` dispatcher.
+
+Writes devops_api/registry.py, a plain dict of domain -> resource ->
+operation names built from the operation definitions. The dispatcher reads
+only this file at startup and imports the one operation module it runs.
+
+Usage:
+    python -m _generator.registry
+    python -m _generator.registry --definitions-dir _generator/definitions --output devops_api/registry.py
+"""
+
+import argparse
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+from _generator.index import load_index
+from _generator.operation_def import OperationDef
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_DEFINITIONS = REPO_ROOT / "_generator" / "definitions"
+DEFAULT_OUTPUT = REPO_ROOT / "devops_api" / "registry.py"
+
+
+def build_registry(ops: Iterable[OperationDef]) -> Dict[str, Dict[str, List[str]]]:
+    """Group operations as domain -> resource -> sorted operation names."""
+    registry: Dict[str, Dict[str, List[str]]] = {}
+    for op in ops:
+        registry.setdefault(op.domain, {}).setdefault(op.resource, []).append(op.operation)
+    return {
+        domain: {resource: sorted(names) for resource, names in sorted(resources.items())}
+        for domain, resources in sorted(registry.items())
+    }
+
+
+def render_registry(registry: Dict[str, Dict[str, List[str]]]) -> str:
+    """Render devops_api/registry.py."""
+    count = sum(len(names) for resources in registry.values() for names in resources.values())
+    lines = [
+        '# AUTO-GENERATED by _generator/registry.py — do not edit by hand.',
+        '# Source of truth: _generator/definitions/',
+        '"""',
+        f'Registry of the {count} generated operations: domain -> resource -> operations.',
+        '',
+        'Each operation lives in the module ``<Domain>.<Resource>.<operation>`` and',
+        'exposes a function of the same name.',
+        '"""',
+        '',
+        'OPERATIONS = {',
+    ]
+    for domain, resources in registry.items():
+        lines.append(f'    "{domain}": {{')
+        for resource, names in resources.items():
+            lines.append(f'        "{resource}": (')
+            lines.extend(f'            "{name}",' for name in names)
+            lines.append('        ),')
+        lines.append('    },')
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+
+def write_registry(definitions_dir: Path = DEFAULT_DEFINITIONS, output: Path = DEFAULT_OUTPUT) -> int:
+    """Load every definition and write the registry; returns the operation count."""
+    registry = build_registry(load_index(definitions_dir).values())
+    output.write_text(render_registry(registry), encoding="utf-8")
+    return sum(len(names) for resources in registry.values() for names in resources.values())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the devops_api operation registry.")
+    parser.add_argument("--definitions-dir", default=str(DEFAULT_DEFINITIONS), help="Directory of operation definitions.")
+    parser.add_argument("--output", default=str(DEFAULT_OUTPUT), help="Registry file to write.")
+    args = parser.parse_args()
+    count = write_registry(Path(args.definitions_dir), Path(args.output))
+    print(f"Wrote {count} operations to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,21 +11,34 @@ Usage:
     python _generator/spec_to_yaml.py           # generate all
     python _generator/spec_to_yaml.py --domain git   # single domain
     python _generator/spec_to_yaml.py --dry-run      # preview only
+    python _generator/spec_to_yaml.py --incremental  # re-emit only what upstream changed
+
+--incremental keeps a hash of every emitted definition in
+_generator/.spec_manifest.json (git-ignored). New endpoints are written.
+An existing definition is rewritten only when the definition generated
+from the spec differs from the one emitted last time, so an upstream spec
+sync touches just the affected files and hand edits to unchanged
+endpoints survive. The first incremental run only records the baseline.
 """
 
 from __future__ import annotations
 
 import argparse
 import glob
+import hashlib
 import json
 import os
 import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
+# libyaml's emitter is ~4x faster and produces identical output here
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 # ---------------------------------------------------------------------------
 # Paths
 # ---------------------------------------------------------------------------
@@ -33,6 +46,7 @@ ROOT = Path(__file__).resolve().parents[1]
 SPEC_DIR = ROOT / "_shared" / "specs"
 DEFS_DIR = ROOT / "_generator" / "definitions"
 INVENTORY = ROOT / "_research" / "api_specs_full.json"
+MANIFEST = ROOT / "_generator" / ".spec_manifest.json"
 
 # ---------------------------------------------------------------------------
 # Domain → directory name mapping (PascalCase as used in repo layout)
@@ -183,6 +197,7 @@ def _safe_text(text: str, max_len: int = 120) -> str:
     return text
 
 
+@lru_cache(maxsize=None)
 def _snake(name: str) -> str:
     """Convert camelCase / PascalCase to snake_case."""
     s1 = re.sub(r"([A-Z]+)([A-Z][a-z])", r"\1_\2", name)
@@ -490,6 +505,89 @@ def _table_columns_from_schema(schema: dict, definitions: dict) -> List[str]:
     return cols
 
 
+def _pagination_style(details: dict, definitions: dict) -> str:
+    """
+    Detect how an endpoint pages its results.
+
+    Returns "continuation" (continuationToken query param or an
+    x-ms-continuationtoken response header), "continuation_body" (token
+    carried in the request body), "top_skip" ($top + $skip query params),
+    or "" when the endpoint is not paged.
+    """
+    params = [p for p in details.get("parameters", []) if isinstance(p, dict)]
+    query = {p.get("name", "") for p in params if p.get("in") == "query"}
+    if "continuationToken" in query:
+        return "continuation"
+    for p in params:
+        if p.get("in") != "body":
+            continue
+        body_schema = p.get("schema", {})
+        if body_schema.get("$ref"):
+            body_schema = _resolve_schema_ref(body_schema["$ref"], definitions)
+        if "continuationToken" in body_schema.get("properties", {}):
+            return "continuation_body"
+    for resp in details.get("responses", {}).values():
+        headers = {h.lower() for h in (resp.get("headers") or {})}
+        if "x-ms-continuationtoken" in headers:
+            return "continuation"
+    if "$top" in query and "$skip" in query:
+        return "top_skip"
+    return ""
+
+
+def _response_mode(details: dict, success_code: int, method: str = "GET") -> Tuple[str, str]:
+    """
+    Decide whether an endpoint returns JSON or raw content.
+
+    Content endpoints (logs, zips, packages, attachments) are detected from a
+    ``format: Stream`` / ``type: file`` success schema, a ``produces`` list
+    without JSON, or a schema-less response described as a stream. Binary
+    GET content (packages, zips, attachments) is "download": it can be
+    large and is fetched with resumable ranged requests.
+
+    Returns:
+        ("download" | "stream", content_type) or ("json", "").
+    """
+    produces = details.get("produces") or []
+    success = details.get("responses", {}).get(str(success_code), {})
+    schema = success.get("schema") or {}
+    binary_schema = schema.get("format") == "Stream" or schema.get("type") == "file"
+    no_json = bool(produces) and not any("json" in p for p in produces)
+    described = not schema and "stream" in (success.get("description") or "").lower()
+    if not (binary_schema or no_json or described):
+        return "json", ""
+    content_types = [p for p in produces if "json" not in p]
+    content_type = content_types[0] if content_types else "application/octet-stream"
+    for preferred in ("application/octet-stream", "text/plain"):
+        if preferred in content_types:
+            content_type = preferred
+            break
+    binary = content_type in ("application/octet-stream", "application/zip")
+    return ("download" if binary and method.upper() == "GET" else "stream"), content_type
+
+
+def _paged_items_key(schema: dict, definitions: dict) -> Optional[str]:
+    """
+    Name of the array holding a page's items: "value" for a bare array or a
+    ``value`` property, otherwise the only array property. None when the
+    response is a single object (its $top/$skip page a nested list).
+    """
+    if schema.get("type") == "array":
+        return "value"
+    if schema.get("$ref"):
+        schema = _resolve_schema_ref(schema["$ref"], definitions)
+    props = dict(schema.get("properties", {}))
+    # Batches such as ReportingWorkItemRevisionsBatch inherit their items via allOf
+    for base in schema.get("allOf", []):
+        if base.get("$ref"):
+            base = _resolve_schema_ref(base["$ref"], definitions)
+        props.update(base.get("properties", {}))
+    if "value" in props:
+        return "value"
+    arrays = [name for name, prop in props.items() if prop.get("type") == "array"]
+    return arrays[0] if len(arrays) == 1 else None
+
+
 # ===========================================================================
 # Main generator
 # ===========================================================================
@@ -611,6 +709,19 @@ def generate_yaml_for_endpoint(
         is_list = True
         list_key = "value"
     
+    # Raw content endpoints are streamed instead of parsed as JSON
+    response_mode, content_type = _response_mode(details, success_code, method)
+
+    # Pagination style; paged responses may hold their items under another key
+    # Only collections are paged: a 2xx array, or an object holding the items
+    pagination = "" if response_mode != "json" else _pagination_style(details, definitions)
+    if pagination:
+        items_key = _paged_items_key(resp_schema, definitions)
+        if items_key is None:
+            pagination = ""
+        else:
+            list_key = items_key
+
     # Version guard keys
     guard_keys = _build_version_guard_keys(resp_schema, definitions)
     
@@ -694,8 +805,13 @@ def generate_yaml_for_endpoint(
         yaml_dict["output_message"] = output_message
     if table_columns:
         yaml_dict["table_columns"] = table_columns
-    if list_key != "value" and is_list:
+    if list_key != "value" and (is_list or pagination):
         yaml_dict["list_key"] = list_key
+    if pagination:
+        yaml_dict["pagination"] = pagination
+    if response_mode != "json":
+        yaml_dict["response_mode"] = response_mode
+        yaml_dict["content_type"] = content_type
     
     if fixture_success:
         yaml_dict["fixture_success"] = fixture_success
@@ -753,6 +869,8 @@ def main():
     parser.add_argument("--domain", help="Process only this domain (e.g., 'git', 'build')")
     parser.add_argument("--dry-run", action="store_true", help="Preview only, don't write files")
     parser.add_argument("--overwrite", action="store_true", help="Overwrite existing YAML files")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Rewrite existing YAML files only when their generated content changed since the last run")
     args = parser.parse_args()
     
     # Discover all cached spec files
@@ -796,10 +914,16 @@ def main():
     for yf in DEFS_DIR.glob("*.yaml"):
         existing_yamls.add(yf.name)
     
+    # Hashes of the definitions emitted by the previous incremental run
+    manifest: Dict[str, str] = {}
+    if args.incremental and MANIFEST.exists():
+        manifest = json.loads(MANIFEST.read_text(encoding="utf-8"))
+
     # Process all specs
     total_generated = 0
     total_skipped = 0
     total_existing = 0
+    total_unchanged = 0
     
     DEFS_DIR.mkdir(parents=True, exist_ok=True)
     
@@ -818,10 +942,20 @@ def main():
             seen_ops.add(op)
             unique_results.append((filename, yaml_dict))
         
+        written = 0
         for filename, yaml_dict in unique_results:
-            if filename in existing_yamls and not args.overwrite:
+            if args.incremental:
+                digest = hashlib.sha256(json.dumps(yaml_dict, sort_keys=True).encode("utf-8")).hexdigest()
+                previous = manifest.get(filename)
+                manifest[filename] = digest
+                if filename in existing_yamls and previous in (None, digest):
+                    # Unchanged upstream (or first run): keep the file as it is
+                    total_unchanged += 1
+                    continue
+            elif filename in existing_yamls and not args.overwrite:
                 total_existing += 1
                 continue
+            written += 1
             
             if args.dry_run:
                 print(f"  [DRY-RUN] {filename}: {yaml_dict['domain']}/{yaml_dict['resource']}/{yaml_dict['operation']}")
@@ -831,18 +965,21 @@ def main():
             # Write YAML
             out_path = DEFS_DIR / filename
             header = "# AUTO-GENERATED by spec_to_yaml.py — review recommended\n"
-            yaml_content = yaml.dump(yaml_dict, default_flow_style=False, sort_keys=False, allow_unicode=True)
+            yaml_content = yaml.dump(yaml_dict, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False, allow_unicode=True)
             out_path.write_text(header + yaml_content, encoding="utf-8")
             total_generated += 1
         
-        if unique_results:
-            count = len([r for r in unique_results if r[0] not in existing_yamls or args.overwrite])
-            if count > 0:
-                print(f"  {DOMAIN_DIR_MAP.get(domain, domain)}: {count} definitions")
+        if written > 0:
+            print(f"  {DOMAIN_DIR_MAP.get(domain, domain)}: {written} definitions")
     
+    if args.incremental and not args.dry_run:
+        MANIFEST.write_text(json.dumps(manifest, indent=1, sort_keys=True) + "\n", encoding="utf-8")
+
     print(f"\nSummary:")
     print(f"  Generated: {total_generated}")
     print(f"  Skipped (already exist): {total_existing}")
+    if args.incremental:
+        print(f"  Unchanged upstream: {total_unchanged}")
     print(f"  Total YAML files in {DEFS_DIR}: {len(list(DEFS_DIR.glob('*.yaml')))}")
 
 
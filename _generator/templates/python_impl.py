@@ -3,9 +3,26 @@ Python implementation template for Azure DevOps API operations.
 
 AUTO-GENERATED files include a header comment marking them as such.
 Generated scripts use _shared/ helpers for auth, logging, and HTTP.
+
+Each script exposes the operation as an importable function,
+``<operation>(client, ...)``, plus an ``<operation>_async(client, ...)``
+coroutine for _shared.async_http_client.AsyncAdoClient. Both raise the
+typed errors from _shared.errors. ``main()`` is a thin CLI wrapper that
+only runs when the script is executed directly; run_cli turns those
+errors into exit codes.
 """
 
-from _generator.operation_def import OperationDef
+from typing import Dict, List
+
+from _generator.operation_def import OperationDef, ParamDef
+
+SECTION = '# ' + '-' * 75
+
+# Names the generated functions use for their own locals
+_RESERVED_NAMES = (
+    "client", "project", "url", "body", "response", "data",
+    "organization", "pat", "logger", "parser", "args", "destination", "written",
+)
 
 
 def render_python(op: OperationDef) -> str:
@@ -27,215 +44,453 @@ def render_python(op: OperationDef) -> str:
     lines.append('')
 
     # Imports
-    imports = ['import json', 'import os', 'import sys']
-    if op.body_fields and any(p.cli_flag for p in op.params):
+    imports = ['import os', 'import sys']
+    if any(p.cli_flag for p in op.params) or op.pagination or op.raw_content or _is_list(op):
         imports.insert(0, 'import argparse')
+    typing_names = []
+    if op.raw_content:
+        typing_names += ['BinaryIO', 'Union']
+    if op.pagination:
+        typing_names.append('Iterator')
+    if op.pagination or _optional_args(op):
+        typing_names.append('Optional')
+    if typing_names:
+        imports.append(f'from typing import {", ".join(sorted(typing_names))}')
     lines.extend(imports)
     lines.append('')
     lines.append('# Add project root to path for shared helpers')
     lines.append("sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))")
     lines.append('')
-    lines.append('import requests')
-    lines.append('')
-    lines.append('from _shared.auth import build_auth_header, get_env_or_exit')
+    if any(not p.cli_flag for p in op.params) or op.project_scoped:
+        lines.append('from _shared.auth import get_common_env, require_env')
+    else:
+        lines.append('from _shared.auth import get_common_env')
+    lines.append('from _shared.cli import run_cli')
+    codec_names = _codec_names(op)
+    if codec_names:
+        lines.append(f'from _shared.codec import {", ".join(codec_names)}')
     lines.append('from _shared.logging_utils import AdoLogger')
-    lines.append('from _shared.http_client import build_url, execute_request, version_guard')
+    if op.raw_content:
+        lines.append('from _shared.async_http_client import astream_to')
+    if op.response_mode == "download":
+        lines.append('from _shared.download import download_file')
+        lines.append('from _shared.http_client import AdoClient, build_url')
+    elif op.raw_content:
+        lines.append('from _shared.http_client import AdoClient, build_url, stream_to')
+    else:
+        lines.append('from _shared.http_client import AdoClient, build_url, version_guard')
+    if _is_list(op):
+        lines.append('from _shared.output import add_format_arguments, items_of, parse_fields, write_items')
+    if op.pagination:
+        lines.append('from _shared.pagination import paginate')
     lines.append('')
 
     # Configuration
-    lines.append('# ' + '-' * 75)
+    lines.append(SECTION)
     lines.append('# Configuration')
-    lines.append('# ' + '-' * 75)
+    lines.append(SECTION)
     lines.append(f'API_VERSION = "{op.api_version}"')
     lines.append('')
-
-    # Standard env vars — use get_env_or_exit for required ones
-    lines.append('ORGANIZATION = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")')
-    lines.append('PAT = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")')
-    if op.project_scoped:
-        lines.append('PROJECT_ID = get_env_or_exit("PROJECT_ID", "project name or GUID")')
-
-    # Extra params from env — skip those already handled above
-    _py_already_handled = {"AZURE_DEVOPS_ORG", "AZURE_DEVOPS_PAT"}
-    if op.project_scoped:
-        _py_already_handled.add("PROJECT_ID")
-    for p in op.params:
-        if not p.cli_flag:
-            if p.env_var not in _py_already_handled:
-                # Escape description for safe embedding in double-quoted string
-                safe_desc = p.description.replace('"', "'").replace("\n", " ")
-                lines.append(f'{p.env_var} = get_env_or_exit("{p.env_var}", "{safe_desc}")')
     lines.append('')
 
-    # Argparse for CLI params
-    cli_params = [p for p in op.params if p.cli_flag]
-    if cli_params:
-        lines.append('# ' + '-' * 75)
-        lines.append('# CLI arguments')
-        lines.append('# ' + '-' * 75)
-        safe_syn = op.synopsis.replace('"', "'").replace('\n', ' ')
-        lines.append(f'parser = argparse.ArgumentParser(description="{safe_syn}")')
-        for p in cli_params:
-            req = "True" if p.required else "False"
-            safe_pdesc = p.description.replace('"', "'").replace('\n', ' ')
-            lines.append(f'parser.add_argument("{p.cli_flag}", required={req}, help="{safe_pdesc}")')
-        lines.append('args = parser.parse_args()')
+    # Importable operation functions
+    lines.append(SECTION)
+    lines.append('# API')
+    lines.append(SECTION)
+    lines.extend(_render_function(op, is_async=False))
+    lines.append('')
+    lines.append('')
+    lines.extend(_render_function(op, is_async=True))
+    lines.append('')
+    lines.append('')
+    if op.pagination:
+        lines.extend(_render_iter_function(op))
+        lines.append('')
         lines.append('')
 
-    # Auth header & logging
-    lines.append('# ' + '-' * 75)
-    lines.append('# Auth header & logging')
-    lines.append('# ' + '-' * 75)
-    lines.append('HEADERS = build_auth_header(PAT)')
-    lines.append(f'logger = AdoLogger("{op.operation}", PAT)')
-    safe_log_synopsis = op.synopsis.replace('"', "'").replace('\n', ' ')
-    lines.append(f'logger.info("{safe_log_synopsis}")')
+    # CLI entry point
+    lines.append(SECTION)
+    lines.append('# CLI')
+    lines.append(SECTION)
+    lines.extend(_render_main(op))
+    lines.append('')
+    lines.append('')
+    lines.append('if __name__ == "__main__":')
+    lines.append('    run_cli(main)')
     lines.append('')
+    return '\n'.join(lines)
 
-    # Request body
-    if op.body_fields:
-        lines.append('# ' + '-' * 75)
-        lines.append('# Request body')
-        lines.append('# ' + '-' * 75)
-        lines.append('body = {')
-        for bf in op.body_fields:
-            val = _resolve_body_source_py(bf, op)
-            if '.' in bf.json_path:
-                pass
-            else:
-                lines.append(f'    "{bf.json_path}": {val},')
-        # Handle nested fields
-        nested = {}
-        for bf in op.body_fields:
-            if '.' in bf.json_path:
-                parts = bf.json_path.split('.', 1)
-                parent = parts[0]
-                child = parts[1]
-                if parent not in nested:
-                    nested[parent] = []
-                nested[parent].append((child, _resolve_body_source_py(bf, op)))
-        for parent, children in nested.items():
-            lines.append(f'    "{parent}": {{')
-            for child_name, child_val in children:
-                lines.append(f'        "{child_name}": {child_val},')
-            lines.append(f'    }},')
-        lines.append('}')
-        lines.append('')
 
-    # URL construction
-    lines.append('# ' + '-' * 75)
-    lines.append('# API call')
-    lines.append('# ' + '-' * 75)
+# ---------------------------------------------------------------------------
+# Operation functions
+# ---------------------------------------------------------------------------
 
-    # Build URL path with param substitution
-    url_path = op.url_path
+def _arg_names(op: OperationDef) -> Dict[str, str]:
+    """
+    Map each param name to its argument name in the operation function.
+
+    Project scope is always the ``project`` argument; a path param fed from
+    PROJECT_ID shares it. Params that would shadow the scope argument or a
+    local of the generated code (url, body, ...) get a ``_value`` suffix.
+    """
+    names = {}
+    used = set(_RESERVED_NAMES)
     for p in op.params:
-        placeholder = '{' + p.name + '}'
-        if placeholder in url_path:
-            if p.cli_flag:
-                url_path = url_path.replace(placeholder, '{args.' + p.cli_flag.lstrip('-').replace('-', '_') + '}')
-            else:
-                url_path = url_path.replace(placeholder, '{' + p.env_var + '}')
+        if op.project_scoped and not p.cli_flag and p.env_var == "PROJECT_ID":
+            names[p.name] = "project"
+            continue
+        name = p.name
+        if name in used:
+            name = f"{name}_value"
+        names[p.name] = name
+        used.add(name)
+    return names
+
+
+def _codec_names(op: OperationDef) -> List[str]:
+    """_shared.codec functions the script uses: loads to parse, write_json to print."""
+    if op.raw_content or op.success_status == 204:
+        return []
+    if op.output_mode == "table" and op.table_columns:
+        return ['loads']
+    return ['loads', 'write_json']
+
+
+def _is_list(op: OperationDef) -> bool:
+    """Whether the operation returns a list of items (and takes --format)."""
+    return bool(op.pagination) or op.output_mode == "table" or "count" in (op.version_guard_keys or [])
+
+
+def _required_args(op: OperationDef) -> List[ParamDef]:
+    """Params that become positional arguments (env vars + required flags)."""
+    names = _arg_names(op)
+    args = [p for p in op.params if not p.cli_flag and names[p.name] != "project"]
+    args += [p for p in op.params if p.cli_flag and p.required]
+    return args
+
+
+def _optional_args(op: OperationDef) -> List[ParamDef]:
+    """Params that become keyword arguments defaulting to None."""
+    return [p for p in op.params if p.cli_flag and not p.required]
+
+
+def _signature(op: OperationDef) -> str:
+    """Build the parameter list of the operation function."""
+    names = _arg_names(op)
+    parts = ['client']
+    if op.project_scoped:
+        parts.append('project: str')
+    for p in _required_args(op):
+        parts.append(f'{names[p.name]}: str')
+    optional = _optional_args(op)
+    if optional:
+        parts.append('*')
+        for p in optional:
+            parts.append(f'{names[p.name]}: Optional[str] = None')
+    return ', '.join(parts)
 
-    # Use build_url helper
+
+def _url_call(op: OperationDef, path_expr: str) -> str:
+    """Render the build_url(...) call for this operation."""
     if op.project_scoped and op.base_host != 'dev.azure.com':
-        lines.append(f'url = build_url(ORGANIZATION, f"{url_path}", API_VERSION, project=PROJECT_ID, base_host="{op.base_host}")')
-    elif op.project_scoped:
-        lines.append(f'url = build_url(ORGANIZATION, f"{url_path}", API_VERSION, project=PROJECT_ID)')
-    elif op.base_host != 'dev.azure.com':
-        lines.append(f'url = build_url(ORGANIZATION, f"{url_path}", API_VERSION, base_host="{op.base_host}")')
-    else:
-        lines.append(f'url = build_url(ORGANIZATION, f"{url_path}", API_VERSION)')
-    lines.append('logger.info(f"{0} {{url}}")'.format(op.http_method))
-    lines.append('')
+        return f'build_url(client.organization, f"{path_expr}", API_VERSION, project=project, base_host="{op.base_host}")'
+    if op.project_scoped:
+        return f'build_url(client.organization, f"{path_expr}", API_VERSION, project=project)'
+    if op.base_host != 'dev.azure.com':
+        return f'build_url(client.organization, f"{path_expr}", API_VERSION, base_host="{op.base_host}")'
+    return f'build_url(client.organization, f"{path_expr}", API_VERSION)'
 
-    # HTTP call via execute_request
-    method_upper = op.http_method
+
+def _body_dict_lines(op: OperationDef, names: Dict[str, str]) -> List[str]:
+    """Render the ``body = {...}`` literal, with nested fields grouped by parent."""
+    lines = ['body = {']
+    for bf in op.body_fields:
+        if '.' not in bf.json_path:
+            lines.append(f'    "{bf.json_path}": {_resolve_body_source_py(bf, names)},')
+    nested = {}
+    for bf in op.body_fields:
+        if '.' in bf.json_path:
+            parent, child = bf.json_path.split('.', 1)
+            nested.setdefault(parent, []).append((child, _resolve_body_source_py(bf, names)))
+    for parent, children in nested.items():
+        lines.append(f'    "{parent}": {{')
+        for child_name, child_val in children:
+            lines.append(f'        "{child_name}": {child_val},')
+        lines.append(f'    }},')
+    lines.append('}')
+    return lines
+
+
+def _request_call(op: OperationDef) -> str:
+    """Render the client.request(...) call with body / expected_status / stream keyword args."""
+    kwargs = ''
     if op.body_fields:
-        if op.success_status != 200:
-            lines.append(f'response = execute_request("{method_upper}", url, HEADERS, body=body, expected_status={op.success_status})')
-        else:
-            lines.append(f'response = execute_request("{method_upper}", url, HEADERS, body=body)')
-    else:
-        if op.success_status != 200:
-            lines.append(f'response = execute_request("{method_upper}", url, HEADERS, expected_status={op.success_status})')
-        else:
-            lines.append(f'response = execute_request("{method_upper}", url, HEADERS)')
-    lines.append('')
+        kwargs += ', body=body'
+    if op.success_status != 200:
+        kwargs += f', expected_status={op.success_status}'
+    if op.raw_content:
+        kwargs += f', stream=True, accept="{_accept(op)}"'
+    return f'client.request("{op.http_method}", url{kwargs})'
 
-    # Handle 204 No Content
-    if op.success_status == 204:
-        lines.append('# ' + '-' * 75)
-        lines.append('# Output — DELETE returns 204 No Content on success')
-        lines.append('# ' + '-' * 75)
-        lines.append(f'if response.status_code == 204:')
-        if op.output_message:
-            lines.append(f'    logger.info("{op.output_message}")')
-            lines.append(f'    print("{op.output_message}")')
-        else:
-            lines.append(f'    logger.info("Operation completed successfully.")')
-            lines.append(f'    print("Operation completed successfully.")')
-        lines.append('else:')
-        lines.append('    logger.error(f"Unexpected status code: {response.status_code}")')
-        lines.append('    print(f"Unexpected status code: {response.status_code}", file=sys.stderr)')
-        lines.append('    if response.text:')
-        lines.append('        print(response.text)')
+
+def _accept(op: OperationDef) -> str:
+    """Accept header for a raw content operation."""
+    return op.content_type or "application/octet-stream"
+
+
+def _doc_text(text: str) -> str:
+    """Flatten free text for safe embedding in a generated docstring."""
+    return ' '.join(text.replace('"', "'").replace('\\', '/').split())
+
+
+def _render_function(op: OperationDef, is_async: bool) -> List[str]:
+    """Render ``def <operation>(client, ...)`` or its ``_async`` coroutine."""
+    names = _arg_names(op)
+    url_path = op.url_path
+    for p in op.params:
+        url_path = url_path.replace('{' + p.name + '}', '{' + names[p.name] + '}')
+
+    stream = op.raw_content
+    signature = _signature(op)
+    if stream:
+        if not _optional_args(op):
+            signature += ', *'
+        signature += ', destination: Union[str, BinaryIO]'
+    returns = 'int' if stream else 'None' if op.success_status == 204 else 'dict'
+    lines = []
+    if is_async:
+        lines.append(f'async def {op.operation}_async({signature}) -> {returns}:')
+        lines.append(f'    """Async variant of {op.operation}() for use with AsyncAdoClient."""')
     else:
-        lines.append('data = response.json()')
+        lines.append(f'def {op.operation}({signature}) -> {returns}:')
+        lines.append('    """')
+        lines.append(f'    {_doc_text(op.synopsis)}')
         lines.append('')
-
-        # Version guard
-        if op.version_guard_keys:
-            lines.append('# ' + '-' * 75)
-            lines.append('# Version guard')
-            lines.append('# ' + '-' * 75)
-            keys_list = repr(op.version_guard_keys)
-            lines.append(f'version_guard(data, {keys_list}, API_VERSION)')
+        lines.append('    Args:')
+        lines.append('        client: AdoClient holding the organisation and PAT.')
+        if op.project_scoped:
+            lines.append('        project: Project name or GUID.')
+        for p in _required_args(op) + _optional_args(op):
+            lines.append(f'        {names[p.name]}: {_doc_text(p.description) or p.name}')
+        if stream:
+            lines.append('        destination: Output path or binary file (e.g. sys.stdout.buffer).')
             lines.append('')
-
-        # Log summary
-        if "count" in (op.version_guard_keys or []):
-            lines.append('logger.info(f"Retrieved {data.get(\'count\', \'?\')} items")')
+            lines.append('    Returns:')
+            if op.response_mode == 'download':
+                lines.append('        Bytes written. A path destination is fetched in parallel ranged')
+                lines.append('        segments and resumes after an interruption (see _shared.download).')
+            else:
+                lines.append(f'        Bytes written; the {op.content_type} body is streamed in constant memory.')
+        elif op.success_status != 204:
             lines.append('')
+            lines.append('    Returns:')
+            lines.append('        Parsed JSON response.')
+        lines.append('    """')
+
+    if op.body_fields:
+        lines.extend('    ' + line for line in _body_dict_lines(op, names))
+    lines.append(f'    url = {_url_call(op, url_path)}')
+    await_ = 'await ' if is_async else ''
+    if op.response_mode == 'download' and not is_async:
+        lines.append(f'    return download_file(client, url, destination, accept="{_accept(op)}")')
+        return lines
+    if stream:
+        lines.append(f'    response = {await_}{_request_call(op)}')
+        copy = 'await astream_to' if is_async else 'stream_to'
+        lines.append(f'    return {copy}(response, destination)')
+        return lines
+    if op.success_status == 204:
+        lines.append(f'    {await_}{_request_call(op)}')
+        lines.append('    return None')
+        return lines
+    lines.append(f'    response = {await_}{_request_call(op)}')
+    lines.append('    data = loads(response.content)')
+    if op.version_guard_keys:
+        lines.append(f'    version_guard(data, {op.version_guard_keys!r}, API_VERSION)')
+    lines.append('    return data')
+    return lines
 
-        # Output
-        lines.append('# ' + '-' * 75)
-        lines.append('# Output')
-        lines.append('# ' + '-' * 75)
-        if op.output_mode == "table" and op.table_columns:
-            if "count" in (op.version_guard_keys or []):
-                lines.append("print(f\"Total: {data.get('count', 'N/A')}\\n\")")
-            lines.append(f'for item in data.get("{op.list_key}", []):')
-            access_parts = []
-            for c in op.table_columns:
-                access_parts.append(f'item.get("{c}", "N/A")')
-            lines.append(f'    cols = [{", ".join(access_parts)}]')
-            lines.append('    print("  " + "  ".join(str(c) for c in cols))')
-        elif op.output_mode == "message" and op.output_message:
-            msg = op.output_message.replace('{', '{data.get("').replace('}', '", "N/A")}')
-            lines.append(f'print(f"{msg}")')
-            lines.append('print(json.dumps(data, indent=2))')
-        else:
-            lines.append('print(json.dumps(data, indent=2))')
 
+def _render_iter_function(op: OperationDef) -> List[str]:
+    """Render ``iter_<operation>(client, ...)``, a lazy all-pages generator."""
+    names = _arg_names(op)
+    url_path = op.url_path
+    for p in op.params:
+        url_path = url_path.replace('{' + p.name + '}', '{' + names[p.name] + '}')
+
+    signature = _signature(op)
+    if not _optional_args(op):
+        signature += ', *'
+    signature += ', max_items: Optional[int] = None, prefetch: bool = False'
+    lines = [f'def iter_{op.operation}({signature}) -> Iterator[dict]:']
+    lines.append('    """')
+    lines.append(f'    Yield every item across all pages of {op.operation}() ({op.pagination} paging).')
     lines.append('')
-    return '\n'.join(lines)
+    lines.append('    Takes the same arguments, plus:')
+    lines.append('        max_items: Stop after this many items (default: all).')
+    lines.append('        prefetch: Fetch the next page while the current one is consumed.')
+    lines.append('    """')
+    if op.body_fields:
+        lines.extend('    ' + line for line in _body_dict_lines(op, names))
+    lines.append(f'    url = {_url_call(op, url_path)}')
+    kwargs = ''
+    if op.body_fields:
+        kwargs += ', body=body'
+    if op.list_key != 'value':
+        kwargs += f', list_key="{op.list_key}"'
+    if op.success_status != 200:
+        kwargs += f', expected_status={op.success_status}'
+    lines.append(f'    return paginate(client, "{op.http_method}", url, "{op.pagination}"{kwargs},')
+    lines.append('                    max_items=max_items, prefetch=prefetch)')
+    return lines
 
 
-def _resolve_body_source_py(bf, op):
-    """Resolve a body field source to a Python expression."""
+def _resolve_body_source_py(bf, names):
+    """Resolve a body field source to an expression inside the operation function."""
     if bf.source.startswith("param:"):
         pname = bf.source.split(":", 1)[1]
-        # Find the param
-        for p in op.params:
-            if p.name == pname:
-                if p.cli_flag:
-                    flag = p.cli_flag.lstrip('-').replace('-', '_')
-                    return f'args.{flag}'
-                else:
-                    return p.env_var
+        if pname in names:
+            return names[pname]
         return f'"{pname}"'
     elif bf.source.startswith("literal:"):
         val = bf.source.split(":", 1)[1]
         return f'"{val}"'
     return f'"{bf.source}"'
+
+
+# ---------------------------------------------------------------------------
+# CLI wrapper
+# ---------------------------------------------------------------------------
+
+def _cli_value(p: ParamDef, names: Dict[str, str]) -> str:
+    """Expression main() passes for a param: its env local or argparse attribute."""
+    if p.cli_flag:
+        return 'args.' + p.cli_flag.lstrip('-').replace('-', '_')
+    return names[p.name]
+
+
+def _render_main(op: OperationDef) -> List[str]:
+    """Render main(): read env vars / flags, call the operation, print output."""
+    names = _arg_names(op)
+    lines = ['def main() -> None:']
+    lines.append(f'    """Read env vars / flags, call {op.operation}() and print the result."""')
+
+    # Standard env vars — a missing one raises AdoConfigError (exit code 2)
+    lines.append('    organization, pat = get_common_env()')
+    if op.project_scoped:
+        lines.append('    project = require_env("PROJECT_ID", "project name or GUID")')
+
+    # Extra params from env — skip those already handled above
+    _py_already_handled = {"AZURE_DEVOPS_ORG", "AZURE_DEVOPS_PAT"}
+    if op.project_scoped:
+        _py_already_handled.add("PROJECT_ID")
+    for p in op.params:
+        if not p.cli_flag and p.env_var not in _py_already_handled:
+            # Escape description for safe embedding in double-quoted string
+            safe_desc = p.description.replace('"', "'").replace("\n", " ")
+            lines.append(f'    {names[p.name]} = require_env("{p.env_var}", "{safe_desc}")')
+
+    # Argparse for CLI params (+ paging flags for paged list operations)
+    cli_params = [p for p in op.params if p.cli_flag]
+    if cli_params or op.pagination or op.raw_content or _is_list(op):
+        lines.append('')
+        safe_syn = op.synopsis.replace('"', "'").replace('\n', ' ')
+        lines.append(f'    parser = argparse.ArgumentParser(description="{safe_syn}")')
+        for p in cli_params:
+            req = "True" if p.required else "False"
+            safe_pdesc = p.description.replace('"', "'").replace('\n', ' ')
+            lines.append(f'    parser.add_argument("{p.cli_flag}", required={req}, help="{safe_pdesc}")')
+        if op.raw_content:
+            lines.append('    parser.add_argument("--output", help="Write the content to this file (default: stdout)")')
+        if op.pagination:
+            lines.append('    parser.add_argument("--all-pages", action="store_true", help="Follow pagination and return every item")')
+            lines.append('    parser.add_argument("--max-items", type=int, help="Follow pagination up to this many items")')
+        if _is_list(op):
+            # An API --fields parameter keeps its flag; the projection moves to --select
+            fields_flag = '"--select"' if any(p.cli_flag == "--fields" for p in cli_params) else ''
+            lines.append(f'    add_format_arguments(parser{", " + fields_flag if fields_flag else ""})')
+        lines.append('    args = parser.parse_args()')
+
+    # Logging + client
+    lines.append('')
+    lines.append(f'    logger = AdoLogger("{op.operation}", pat)')
+    safe_log_synopsis = op.synopsis.replace('"', "'").replace('\n', ' ')
+    lines.append(f'    logger.info("{safe_log_synopsis}")')
+    lines.append('    client = AdoClient(organization, pat, logger=logger)')
+    lines.append('')
+
+    # Call the operation function
+    call_args = ['client']
+    if op.project_scoped:
+        call_args.append('project')
+    for p in _required_args(op):
+        call_args.append(_cli_value(p, names))
+    for p in _optional_args(op):
+        call_args.append(f'{names[p.name]}={_cli_value(p, names)}')
+    call = f'{op.operation}({", ".join(call_args)})'
+    iter_call = f'iter_{op.operation}({", ".join(call_args + ["max_items=args.max_items", "prefetch=True"])})'
+
+    # Raw content is streamed straight to the output file / stdout
+    if op.raw_content:
+        call = call[:-1] + ', destination=args.output or sys.stdout.buffer)'
+        lines.append(f'    written = {call}')
+        lines.append('    logger.info(f"Downloaded {written} bytes")')
+        lines.append('    if args.output:')
+        lines.append('        print(f"Saved {written} bytes to {args.output}")')
+        return lines
+
+    # DELETE-style operations return 204 No Content on success
+    if op.success_status == 204:
+        message = op.output_message or "Operation completed successfully."
+        lines.append(f'    {call}')
+        lines.append(f'    logger.info("{message}")')
+        lines.append(f'    print("{message}")')
+        return lines
+
+    # --format streams one record per item (page by page when following pagination)
+    if _is_list(op):
+        lines.append('    if args.format:')
+        if op.pagination:
+            lines.append('        if args.all_pages or args.max_items:')
+            lines.append(f'            items = {iter_call}')
+            lines.append('        else:')
+            lines.append(f'            items = items_of({call}, "{op.list_key}")')
+        else:
+            lines.append(f'        items = items_of({call}, "{op.list_key}")')
+        lines.append('        written = write_items(items, args.format, args.output, parse_fields(args.select_fields))')
+        lines.append('        logger.info(f"Wrote {written} items")')
+        lines.append('        return')
+        lines.append('')
+
+    if op.pagination:
+        lines.append('    if args.all_pages or args.max_items:')
+        lines.append(f'        items = list({iter_call})')
+        lines.append(f'        data = {{"count": len(items), "{op.list_key}": items}}')
+        lines.append('    else:')
+        lines.append(f'        data = {call}')
+    else:
+        lines.append(f'    data = {call}')
+
+    # Log summary
+    if "count" in (op.version_guard_keys or []):
+        lines.append('    logger.info(f"Retrieved {data.get(\'count\', \'?\')} items")')
+
+    # Output
+    lines.append('')
+    if op.output_mode == "table" and op.table_columns:
+        if "count" in (op.version_guard_keys or []):
+            lines.append("    print(f\"Total: {data.get('count', 'N/A')}\\n\")")
+        lines.append(f'    for item in data.get("{op.list_key}", []):')
+        access_parts = []
+        for c in op.table_columns:
+            access_parts.append(f'item.get("{c}", "N/A")')
+        lines.append(f'        cols = [{", ".join(access_parts)}]')
+        lines.append('        print("  " + "  ".join(str(c) for c in cols))')
+    elif op.output_mode == "message" and op.output_message:
+        # Single quotes inside the f-string keep it valid before Python 3.12
+        msg = op.output_message.replace('{', "{data.get('").replace('}', "', 'N/A')}")
+        lines.append(f'    print(f"{msg}")')
+        lines.append('    write_json(data)')
+    else:
+        lines.append('    write_json(data)')
+    return lines
@@ -22,6 +22,9 @@ function New-AdoUrl {
         Optional project scope in the URL.
     .PARAMETER BaseHost
         Hostname (default 'dev.azure.com'; override for vssps.dev.azure.com etc.).
+    .NOTES
+        With $env:ADO_DAEMON_URL set, the URL is routed through the local
+        daemon (python -m _shared.daemon), which keeps connections warm.
     #>
     [CmdletBinding()]
     param (
@@ -38,6 +41,9 @@ function New-AdoUrl {
     )
 
     $base = "https://${BaseHost}/$Organization"
+    if (-not [string]::IsNullOrWhiteSpace($env:ADO_DAEMON_URL)) {
+        $base = "$($env:ADO_DAEMON_URL.TrimEnd('/'))/proxy/$base"
+    }
     if (-not [string]::IsNullOrWhiteSpace($Project)) {
         $base = "$base/$Project"
     }
@@ -0,0 +1,290 @@
+"""
+Asyncio HTTP client helpers for Azure DevOps API clients.
+
+Async counterpart of _shared.http_client built on httpx: the same retry
+semantics for 429/5xx (Retry-After or exponential backoff), the same
+actionable error messages and the same version_guard hook. AsyncAdoClient
+bounds the number of requests in flight with a semaphore, so thousands of
+generated ``<operation>_async`` calls can be gathered safely.
+
+Requires the optional httpx dependency:  pip install httpx
+
+Example:
+    async with AsyncAdoClient.from_env(max_concurrency=32) as client:
+        builds = await asyncio.gather(
+            *(get_builds_async(client, project, b) for b in build_ids)
+        )
+"""
+
+import asyncio
+import os
+import sys
+import time
+from typing import Any, BinaryIO, Dict, Optional, Union
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - exercised only without httpx
+    httpx = None
+
+from _shared import metrics
+from _shared.auth import build_auth_header, get_common_env
+from _shared.errors import AdoConfigError, AdoError, AdoRequestError, parse_retry_after
+from _shared.http_client import DEFAULT_CHUNK_SIZE, handle_error_response
+from _shared.rate_limit import get_limiter
+from _shared.response_cache import get_cache
+from _shared.session_pool import DEFAULT_HEADERS, DEFAULT_POOL_SIZE, reroute_url
+
+DEFAULT_CONCURRENCY = 16
+
+
+def _require_httpx() -> None:
+    """Raise AdoConfigError with an install hint when httpx is missing."""
+    if httpx is None:
+        raise AdoConfigError("ERROR: The async client requires httpx. Install it with: pip install httpx")
+
+
+async def execute_request_async(
+    http: "httpx.AsyncClient",
+    method: str,
+    url: str,
+    headers: Dict[str, str],
+    body: Optional[Dict] = None,
+    timeout: int = 30,
+    expected_status: Optional[int] = None,
+    max_retries: int = 3,
+    stream: bool = False,
+) -> "httpx.Response":
+    """
+    Execute an HTTP request asynchronously with retry logic for 429/5xx.
+
+    Mirrors _shared.http_client.execute_request, awaiting the backoff and
+    the shared rate limiter instead of blocking the event loop. GETs use
+    the same conditional-request cache, and _shared.metrics hooks receive
+    the same records (without DNS/connect/TLS phases, which httpx hides).
+
+    Args:
+        http: The httpx.AsyncClient holding the connection pool.
+        method: HTTP method (GET, POST, PATCH, PUT, DELETE).
+        url: Full request URL.
+        headers: Request headers (including auth).
+        body: Optional JSON body for POST/PATCH/PUT.
+        timeout: Request timeout in seconds.
+        expected_status: If set, accept this status without error handling.
+        max_retries: Maximum retry attempts for transient errors.
+        stream: Leave the body unread so it can be consumed with
+                astream_to() in constant memory.
+
+    Returns:
+        httpx.Response object on success.
+
+    Raises:
+        AdoRequestError: The request failed without an HTTP response.
+        AdoError: A subclass per status code once retries are exhausted.
+    """
+    record = metrics.begin(method, url)
+    try:
+        response = await _send_async(http, method, url, headers, body, timeout, expected_status, max_retries, stream, record)
+    except AdoError as exc:
+        metrics.finish(record, error=exc)
+        raise
+    metrics.finish(record, response)
+    return response
+
+
+async def _send_async(
+    http: "httpx.AsyncClient",
+    method: str,
+    url: str,
+    headers: Dict[str, str],
+    body: Optional[Dict],
+    timeout: int,
+    expected_status: Optional[int],
+    max_retries: int,
+    stream: bool,
+    record: Optional[metrics.RequestMetrics],
+) -> "httpx.Response":
+    """The retry loop behind execute_request_async; fills in record when set."""
+    start = time.monotonic()
+    limiter = get_limiter()
+    cache = get_cache() if method == "GET" and not stream else None
+    cached = None
+    if cache is not None:
+        cache_key = cache.key(url, headers)
+        cached = cache.lookup(cache_key)
+        if cached is not None:
+            headers = dict(headers, **cached.validators())
+    for attempt in range(max_retries):
+        if limiter is not None:
+            wait = limiter.reserve()
+            if wait > 0:
+                await asyncio.sleep(wait)
+                if record is not None:
+                    record.throttle_wait += wait
+        try:
+            request = http.build_request(method, url, headers=headers, json=body, timeout=timeout)
+            response = await http.send(request, stream=stream)
+            if stream and not (response.is_success or response.status_code == expected_status):
+                # Error bodies are small; read them for the error message
+                await response.aread()
+        except httpx.HTTPError as exc:
+            raise AdoRequestError(
+                f"ERROR: Request failed: {exc}", url=url, elapsed=time.monotonic() - start,
+            ) from exc
+        if limiter is not None:
+            limiter.observe(response.headers)
+        metrics.observe_response(record, response, body)
+
+        # Not modified: answer from the cache
+        if cached is not None and response.status_code == 304:
+            cache.touch(cache_key)
+            return httpx.Response(200, headers=cached.headers, content=cached.body, request=response.request)
+
+        # Success path
+        if expected_status and response.status_code == expected_status:
+            return response
+        if response.is_success:
+            if cache is not None and response.status_code == 200:
+                cache.store(cache_key, url, response.headers, response.content)
+            return response
+
+        # Retryable: 429 and 5xx
+        if response.status_code == 429 or response.status_code >= 500:
+            if attempt < max_retries - 1:
+                wait = parse_retry_after(response.headers.get("Retry-After"))
+                if wait is None:
+                    wait = 2 ** (attempt + 1)
+                print(
+                    f"WARN: HTTP {response.status_code}, retrying in {wait}s "
+                    f"(attempt {attempt + 1}/{max_retries})...",
+                    file=sys.stderr,
+                )
+                await asyncio.sleep(wait)
+                if record is not None:
+                    record.retry_wait += wait
+                continue
+
+        # Non-retryable error, or retries exhausted
+        break
+
+    handle_error_response(response, url, time.monotonic() - start)
+
+
+async def astream_to(
+    response: "httpx.Response",
+    destination: Union[str, "os.PathLike[str]", BinaryIO],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """
+    Copy a streamed response body to a file path or binary file object.
+
+    Async counterpart of _shared.http_client.stream_to; the response is
+    closed afterwards.
+
+    Returns:
+        Number of bytes written.
+    """
+    written = 0
+    try:
+        if isinstance(destination, (str, os.PathLike)):
+            with open(destination, "wb") as fh:
+                return await astream_to(response, fh, chunk_size)
+        async for chunk in response.aiter_bytes(chunk_size):
+            destination.write(chunk)
+            written += len(chunk)
+        destination.flush()
+        return written
+    finally:
+        await response.aclose()
+
+
+def _reroute_hook(reroute: str):
+    """httpx request hook sending each request to <reroute>/proxy/<original URL>."""
+    base = reroute.rstrip("/")
+
+    async def hook(request: "httpx.Request") -> None:
+        request.url = httpx.URL(f"{base}/proxy/{request.url}")
+        request.headers["Host"] = request.url.netloc.decode("ascii")
+
+    return hook
+
+
+class AsyncAdoClient:
+    """
+    Shared state for async Azure DevOps calls.
+
+    Holds the organisation, auth headers, one pooled httpx.AsyncClient
+    (keep-alive connections across all ADO hosts) and a semaphore that
+    caps the number of requests in flight.
+    """
+
+    def __init__(
+        self,
+        organization: str,
+        pat: str,
+        max_concurrency: int = DEFAULT_CONCURRENCY,
+        timeout: int = 30,
+        max_retries: int = 3,
+    ):
+        _require_httpx()
+        self.organization = organization
+        self.pat = pat
+        self.headers = build_auth_header(pat)
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        reroute = reroute_url()
+        self._http = httpx.AsyncClient(
+            headers=DEFAULT_HEADERS,
+            limits=httpx.Limits(
+                max_connections=max(max_concurrency, DEFAULT_POOL_SIZE),
+                max_keepalive_connections=max(max_concurrency, DEFAULT_POOL_SIZE),
+            ),
+            event_hooks={"request": [_reroute_hook(reroute)]} if reroute else None,
+        )
+
+    @classmethod
+    def from_env(cls, **kwargs: Any) -> "AsyncAdoClient":
+        """Build a client from AZURE_DEVOPS_ORG and AZURE_DEVOPS_PAT."""
+        organization, pat = get_common_env()
+        return cls(organization, pat, **kwargs)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        body: Optional[Dict] = None,
+        expected_status: Optional[int] = None,
+        stream: bool = False,
+        accept: Optional[str] = None,
+    ) -> "httpx.Response":
+        """
+        Send one request, waiting for a free concurrency slot first.
+
+        ``stream`` leaves the body unread (see astream_to); the slot is
+        released once the headers arrive. ``accept`` overrides the Accept
+        header.
+        """
+        headers = self.headers if accept is None else dict(self.headers, Accept=accept)
+        async with self._semaphore:
+            return await execute_request_async(
+                self._http,
+                method,
+                url,
+                headers,
+                body=body,
+                timeout=self.timeout,
+                expected_status=expected_status,
+                max_retries=self.max_retries,
+                stream=stream,
+            )
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self._http.aclose()
+
+    async def __aenter__(self) -> "AsyncAdoClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
@@ -10,16 +10,26 @@ import os
 import sys
 from typing import Dict, Optional
 
+from _shared.errors import AdoConfigError
 
-def get_env_or_exit(var_name: str, friendly: str = "") -> str:
-    """Read an environment variable or exit with an actionable error."""
+
+def require_env(var_name: str, friendly: str = "") -> str:
+    """Read an environment variable or raise AdoConfigError with an actionable message."""
     value = os.environ.get(var_name)
     if not value:
         label = friendly or var_name
-        sys.exit(f"ERROR: Set the {var_name} environment variable ({label}).")
+        raise AdoConfigError(f"ERROR: Set the {var_name} environment variable ({label}).")
     return value
 
 
+def get_env_or_exit(var_name: str, friendly: str = "") -> str:
+    """Read an environment variable or exit with an actionable error."""
+    try:
+        return require_env(var_name, friendly)
+    except AdoConfigError as exc:
+        sys.exit(exc.message)
+
+
 def build_auth_header(pat: str) -> Dict[str, str]:
     """
     Build the HTTP headers for Azure DevOps Basic Auth.
@@ -40,9 +50,12 @@ def get_common_env() -> tuple:
 
     Returns:
         (organization, pat) — both guaranteed non-empty.
+
+    Raises:
+        AdoConfigError: If either variable is missing.
     """
-    org = get_env_or_exit("AZURE_DEVOPS_ORG", "organisation slug")
-    pat = get_env_or_exit("AZURE_DEVOPS_PAT", "Personal Access Token")
+    org = require_env("AZURE_DEVOPS_ORG", "organisation slug")
+    pat = require_env("AZURE_DEVOPS_PAT", "Personal Access Token")
     return org, pat
 
 
@@ -0,0 +1,26 @@
+"""
+Command-line entry point helpers for Azure DevOps API clients.
+
+Generated scripts call ``run_cli(main)`` so the shared layer can raise
+typed exceptions (see _shared.errors) while the CLI still prints one
+actionable message and exits with a status code per error class.
+"""
+
+import sys
+from typing import Callable
+
+from _shared.errors import AdoError
+
+
+def run_cli(main: Callable[[], None]) -> None:
+    """
+    Run a CLI entry point, translating AdoError into an exit code.
+
+    The error message goes to stderr without a traceback; any other
+    exception propagates unchanged.
+    """
+    try:
+        main()
+    except AdoError as exc:
+        print(exc.message, file=sys.stderr)
+        sys.exit(exc.exit_code)
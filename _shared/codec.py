@@ -0,0 +1,162 @@
+"""
+Pluggable JSON codec for Azure DevOps API clients.
+
+Response parsing and printing go through loads() / dumpb() here instead
+of requests' ``response.json()`` and ``json.dumps(data, indent=2)``. The
+fastest installed backend is used:
+
+    orjson  Parses bytes and serialises straight to UTF-8 bytes
+            (pip install orjson).
+    ujson   Faster than the standard library for large payloads
+            (pip install ujson).
+    json    The standard library; always available.
+
+Every backend writes the same layout. Non-ASCII text is written as UTF-8
+rather than escaped. Values a fast backend cannot handle (integers wider
+than 64 bits, input with a byte-order mark) are retried on the standard
+library. Decode errors are therefore always json.JSONDecodeError.
+
+Settings (environment variable, or configure_codec() at runtime):
+
+    ADO_JSON_CODEC  auto (default), orjson, ujson or json.
+
+Example:
+    from _shared.codec import loads, write_json
+    data = loads(response.content)
+    write_json(data)   # bytes straight to stdout
+"""
+
+import json
+import os
+import sys
+from typing import Any, Callable, Optional, TextIO, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover - exercised only without ujson
+    ujson = None
+
+from _shared.errors import AdoConfigError
+
+CODECS = ("auto", "orjson", "ujson", "json")
+
+_backend = "json"
+
+
+def _require(name: str) -> None:
+    """Raise AdoConfigError with an install hint when a forced backend is missing."""
+    if name not in CODECS:
+        raise AdoConfigError(f"ERROR: Unknown JSON codec '{name}'. Choose from: {', '.join(CODECS)}")
+    if (name == "orjson" and orjson is None) or (name == "ujson" and ujson is None):
+        raise AdoConfigError(f"ERROR: JSON codec '{name}' is not installed. Install it with: pip install {name}")
+
+
+def configure_codec(name: str = "auto") -> str:
+    """
+    Select the JSON backend; returns the backend in use.
+
+    "auto" picks orjson, then ujson, then the standard library.
+    """
+    global _backend
+    name = (name or "auto").lower()
+    _require(name)
+    if name == "auto":
+        name = "orjson" if orjson is not None else "ujson" if ujson is not None else "json"
+    _backend = name
+    return name
+
+
+def get_codec() -> str:
+    """Name of the backend in use."""
+    return _backend
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """Parse a JSON document from bytes or text."""
+    if _backend == "orjson":
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    elif _backend == "ujson":
+        try:
+            return ujson.loads(bytes(data) if isinstance(data, memoryview) else data)
+        except ValueError:
+            pass
+    return json.loads(bytes(data) if isinstance(data, memoryview) else data)
+
+
+def _dumps_text(obj: Any, indent: bool, default: Optional[Callable[[Any], Any]]) -> str:
+    """ujson / standard library serialisation; both produce str natively."""
+    if _backend == "ujson" and default is None:
+        try:
+            return ujson.dumps(obj, indent=2 if indent else 0, ensure_ascii=False, escape_forward_slashes=False)
+        except (TypeError, OverflowError):
+            pass
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False, default=default)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=default)
+
+
+def _orjson_dumpb(obj: Any, indent: bool, default: Optional[Callable[[Any], Any]]) -> Optional[bytes]:
+    """orjson serialisation, or None for values orjson cannot handle."""
+    option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+    try:
+        return orjson.dumps(obj, default=default, option=option)
+    except TypeError:
+        return None
+
+
+def dumpb(obj: Any, *, indent: bool = False, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """
+    Serialise obj to UTF-8 JSON bytes.
+
+    Args:
+        obj: The value to serialise.
+        indent: Pretty-print with two-space indentation; compact otherwise.
+        default: Called for values that are not JSON types, as in json.dumps.
+    """
+    if _backend == "orjson":
+        data = _orjson_dumpb(obj, indent, default)
+        if data is not None:
+            return data
+    return _dumps_text(obj, indent, default).encode("utf-8")
+
+
+def dumps(obj: Any, *, indent: bool = False, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """Serialise obj to a JSON string; see dumpb()."""
+    if _backend == "orjson":
+        data = _orjson_dumpb(obj, indent, default)
+        if data is not None:
+            return data.decode("utf-8")
+    return _dumps_text(obj, indent, default)
+
+
+def write_json(obj: Any, stream: Optional[TextIO] = None, *, indent: bool = True) -> None:
+    """
+    Write obj as JSON plus a newline to stream (default: stdout).
+
+    With orjson the bytes go straight to the stream's binary buffer when it
+    has one, so large responses are never decoded back to str.
+    """
+    stream = stream if stream is not None else sys.stdout
+    buffer = getattr(stream, "buffer", None)
+    if _backend != "orjson" or buffer is None:
+        stream.write(dumps(obj, indent=indent) + "\n")
+        return
+    # Keep the order of anything already printed to the text layer
+    stream.flush()
+    buffer.write(dumpb(obj, indent=indent) + b"\n")
+    buffer.flush()
+
+
+try:
+    configure_codec(os.environ.get("ADO_JSON_CODEC", "auto"))
+except AdoConfigError as exc:
+    print(f"WARN: {exc.message.removeprefix('ERROR: ')} Using the default codec.", file=sys.stderr)
+    configure_codec("auto")
@@ -15,11 +15,16 @@ ado_build_auth() {
 
 # ---------------------------------------------------------------------------
 # URL builder
+# With ADO_DAEMON_URL set, URLs are routed through the local daemon
+# (python -m _shared.daemon), which keeps connections warm across calls.
 # ---------------------------------------------------------------------------
 ado_build_url() {
     # Usage: ado_build_url <org> <path> <api_version> [project] [base_host]
     local org="${1:?}" path="${2:?}" api_version="${3:?}" project="${4:-}" base_host="${5:-dev.azure.com}"
     local base="https://${base_host}/${org}"
+    if [[ -n "${ADO_DAEMON_URL:-}" ]]; then
+        base="${ADO_DAEMON_URL%/}/proxy/${base}"
+    fi
     if [[ -n "$project" ]]; then
         base="${base}/${project}"
     fi
@@ -0,0 +1,225 @@
+"""
+Persistent local daemon for Azure DevOps API clients.
+
+A long-lived process that keeps the pooled keep-alive sessions, the rate
+limiter, the response cache and the operation registry warm, so each call
+from a short-lived script becomes one local round trip instead of a fresh
+interpreter start and TLS handshake.
+
+Start it once per agent:
+
+    python -m _shared.daemon --port 8765 &
+    export ADO_DAEMON_URL=http://127.0.0.1:8765
+
+With ADO_DAEMON_URL set, ``ado_build_url`` (_shared/common.sh) and
+``New-AdoUrl`` (_shared/AdoHttp.ps1) prefix every URL with
+``$ADO_DAEMON_URL/proxy/``. The generated Bash and PowerShell scripts then
+send their unchanged requests (method, Authorization header, body) to the
+daemon, which forwards them through execute_request and mirrors the status
+code and body. Only Azure DevOps hosts are forwarded, and the daemon
+listens on the loopback interface only.
+
+Endpoints:
+
+    GET  /health              {"ok": true, "pid": ..., "operations": ...}
+    ANY  /proxy/<full url>    Forward one request.
+    POST /run                 Run one registry operation; the body is a
+                              ``python -m devops_api --batch`` line.
+
+Each caller's own Authorization header is used upstream, so several PATs
+can share one daemon; the response cache is scoped per PAT.
+"""
+
+import argparse
+import base64
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+# Add project root to path for shared helpers and the operation packages
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from _shared.cli import run_cli
+from _shared.codec import dumpb, loads
+from _shared.errors import AdoConfigError, AdoError
+from _shared.http_client import DEFAULT_CHUNK_SIZE, AdoClient, execute_request
+from devops_api.dispatcher import run_batch
+from devops_api.registry import OPERATIONS
+
+DEFAULT_PORT = 8765
+PROXY_PREFIX = "/proxy/"
+# Hosts the daemon forwards to; anything else is refused
+ALLOWED_HOST_SUFFIXES = (".azure.com", ".visualstudio.com")
+# Request headers passed through to Azure DevOps
+FORWARDED_HEADERS = ("Authorization", "Accept", "Content-Type")
+
+_clients: Dict[Tuple[str, str], AdoClient] = {}
+_clients_lock = threading.Lock()
+
+
+def _allowed(url: str) -> bool:
+    parts = urlsplit(url)
+    host = (parts.hostname or "").lower()
+    return parts.scheme == "https" and (host == "dev.azure.com" or host.endswith(ALLOWED_HOST_SUFFIXES))
+
+
+def _pat_from(authorization: str) -> Optional[str]:
+    """Extract the PAT from a ``Basic base64(:PAT)`` header."""
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "basic" or not token:
+        return None
+    try:
+        decoded = base64.b64decode(token).decode("utf-8")
+    except (ValueError, UnicodeDecodeError):
+        return None
+    return decoded.partition(":")[2] or None
+
+
+def _client_for(organization: str, pat: str) -> AdoClient:
+    """One warm AdoClient per (organisation, PAT)."""
+    with _clients_lock:
+        client = _clients.get((organization, pat))
+        if client is None:
+            client = _clients[(organization, pat)] = AdoClient(organization, pat)
+        return client
+
+
+class DaemonHandler(BaseHTTPRequestHandler):
+    """Serves /health, /proxy/<url> and /run."""
+
+    server_version = "DevOpsApiDaemon/1.0"
+
+    def do_GET(self) -> None:
+        if self.path == "/health":
+            count = sum(len(ops) for resources in OPERATIONS.values() for ops in resources.values())
+            self._send_json(200, {"ok": True, "pid": os.getpid(), "operations": count})
+            return
+        self._dispatch()
+
+    def do_POST(self) -> None:
+        if self.path == "/run":
+            self._run()
+            return
+        self._dispatch()
+
+    def do_PUT(self) -> None:
+        self._dispatch()
+
+    do_PATCH = do_DELETE = do_PUT
+
+    # -- responses -------------------------------------------------------------
+
+    def _send_json(self, status: int, payload: object) -> None:
+        body = dumpb(payload, default=str)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_error(self, exc: AdoError) -> None:
+        """Mirror an upstream failure; failures without a response become 502."""
+        status = exc.status or (400 if isinstance(exc, AdoConfigError) else 502)
+        body = exc.body.encode("utf-8") if exc.body else dumpb({"message": exc.message})
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_body(self) -> bytes:
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    # -- /proxy ------------------------------------------------------------------
+
+    def _dispatch(self) -> None:
+        if not self.path.startswith(PROXY_PREFIX):
+            self._send_json(404, {"message": f"Unknown daemon path: {self.path}"})
+            return
+        url = self.path[len(PROXY_PREFIX):]
+        if not _allowed(url):
+            self._send_json(403, {"message": f"Refusing to forward to a non Azure DevOps URL: {url}"})
+            return
+        headers = {k: self.headers[k] for k in FORWARDED_HEADERS if self.headers.get(k)}
+        raw = self._read_body()
+        try:
+            body = loads(raw) if raw else None
+        except ValueError:
+            self._send_json(400, {"message": "Request body is not valid JSON"})
+            return
+        # JSON is read whole (and is cacheable); other content is relayed in chunks
+        stream = "json" not in headers.get("Accept", "application/json")
+        try:
+            response = execute_request(self.command, url, headers, body=body, stream=stream)
+        except AdoError as exc:
+            self._send_error(exc)
+            return
+        try:
+            self.send_response(response.status_code)
+            for name in ("Content-Type", "ETag", "Last-Modified", "x-ms-continuationtoken"):
+                if response.headers.get(name):
+                    self.send_header(name, response.headers[name])
+            if stream:
+                self.send_header("Connection", "close")
+                self.end_headers()
+                for chunk in response.iter_content(chunk_size=DEFAULT_CHUNK_SIZE):
+                    self.wfile.write(chunk)
+            else:
+                self.send_header("Content-Length", str(len(response.content)))
+                self.end_headers()
+                self.wfile.write(response.content)
+        finally:
+            response.close()
+
+    # -- /run --------------------------------------------------------------------
+
+    def _run(self) -> None:
+        raw = self._read_body().decode("utf-8")
+        pat = _pat_from(self.headers.get("Authorization", ""))
+        try:
+            spec = loads(raw or "{}")
+        except ValueError:
+            spec = {}
+        organization = (spec.get("organization") if isinstance(spec, dict) else None) or os.environ.get("AZURE_DEVOPS_ORG")
+        if not pat or not organization:
+            self._send_json(400, {"message": "ERROR: /run needs a Basic Authorization header and an organization."})
+            return
+        record = next(iter(run_batch(_client_for(organization, pat), [raw])))
+        self._send_json(200 if record["ok"] else record.get("status") or 400, record)
+
+    def log_message(self, format: str, *args: object) -> None:
+        # Request paths may carry identifiers; keep the console quiet
+        pass
+
+
+def serve(port: int = DEFAULT_PORT, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """Create the daemon server (call serve_forever() on the result)."""
+    server = ThreadingHTTPServer((host, port), DaemonHandler)
+    server.daemon_threads = True
+    return server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the local Azure DevOps API daemon.")
+    parser.add_argument("--port", type=int, default=int(os.environ.get("ADO_DAEMON_PORT", DEFAULT_PORT)),
+                        help=f"Loopback port to listen on (default {DEFAULT_PORT})")
+    args = parser.parse_args()
+    try:
+        server = serve(args.port)
+    except OSError as exc:
+        raise AdoConfigError(f"ERROR: Cannot listen on 127.0.0.1:{args.port}: {exc}") from exc
+    print(f"Listening on http://127.0.0.1:{args.port} (pid {os.getpid()})", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -0,0 +1,319 @@
+"""
+Resumable, parallel ranged downloads for large Azure DevOps content.
+
+download_file() probes the URL with a one-byte Range request. When the server
+supports ranges, it splits the body into segments and fetches them in
+parallel with HTTP Range requests. It writes them into ``<destination>.part``
+and records progress in ``<destination>.part.json``. If the process dies or
+a connection drops, the next call with the same URL resumes every segment
+from its last checkpoint instead of byte zero, provided the server's ETag
+or Last-Modified shows the file has not changed. Once all segments are
+complete, the size (and optionally a hash) is verified and the file is
+renamed into place.
+
+Servers that ignore Range, or do not report the total size, fall back to a
+single streamed GET.
+
+Settings (environment variables, or keyword arguments):
+
+    ADO_DOWNLOAD_SEGMENTS     Parallel segments per file (default 4).
+    ADO_DOWNLOAD_MIN_SEGMENT  Smallest segment in bytes (default 8 MiB).
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple, Union
+
+import requests
+
+from _shared.errors import AdoError, AdoRequestError
+from _shared.http_client import DEFAULT_CHUNK_SIZE, execute_request, handle_error_response, stream_to
+
+DEFAULT_SEGMENTS = 4
+DEFAULT_MIN_SEGMENT = 8 * 1024 * 1024
+# Flush and record progress after this many bytes per segment
+CHECKPOINT_BYTES = 4 * 1024 * 1024
+PART_SUFFIX = ".part"
+STATE_SUFFIX = ".part.json"
+
+_CONTENT_RANGE = re.compile(r"bytes\s+\d+-\d+/(\d+)")
+# 416 answer to a Range request on an empty resource
+_EMPTY_RANGE = re.compile(r"bytes\s+\*/0$")
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        value = int(os.environ.get(name, ""))
+    except ValueError:
+        return default
+    return value if value > 0 else default
+
+
+def _plan_segments(size: int, segments: int, min_segment: int) -> List[Dict[str, int]]:
+    """Split [0, size) into up to ``segments`` inclusive byte ranges."""
+    if size <= 0:
+        return []
+    count = max(1, min(segments, -(-size // min_segment)))
+    step = -(-size // count)
+    return [
+        {"start": start, "end": min(start + step, size) - 1, "done": 0}
+        for start in range(0, size, step)
+    ]
+
+
+class _Download:
+    """State of one ranged download: segments, checkpoints and the part file."""
+
+    def __init__(self, client: Any, url: str, path: str, accept: str, chunk_size: int):
+        self.client = client
+        self.url = url
+        self.path = path
+        self.part_path = path + PART_SUFFIX
+        self.state_path = path + STATE_SUFFIX
+        self.accept = accept
+        self.chunk_size = chunk_size
+        self.state: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def headers(self, first: int, last: int) -> Dict[str, str]:
+        return dict(self.client.headers, Accept=self.accept, Range=f"bytes={first}-{last}")
+
+    def get(self, first: int, last: int, expected_status: Optional[int] = None) -> requests.Response:
+        return execute_request(
+            "GET", self.url, self.headers(first, last), stream=True, expected_status=expected_status,
+            timeout=self.client.timeout, max_retries=self.client.max_retries,
+        )
+
+    def get_all(self) -> requests.Response:
+        """Plain GET of the whole body, without a Range header."""
+        return execute_request(
+            "GET", self.url, dict(self.client.headers, Accept=self.accept), stream=True,
+            timeout=self.client.timeout, max_retries=self.client.max_retries,
+        )
+
+    # -- state ----------------------------------------------------------------
+
+    def load_or_create(self, size: int, validators: Dict[str, Optional[str]], segments: int, min_segment: int) -> None:
+        """
+        Resume a matching previous attempt, or start a fresh part file.
+
+        Resuming needs an ETag or Last-Modified that matches the previous
+        attempt; without one a changed file could be spliced from two versions.
+        """
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as fh:
+                state = json.load(fh)
+        except (OSError, ValueError):
+            state = {}
+        resumable = (
+            any(validators.values())
+            and all(state.get(name) == value for name, value in validators.items())
+            and state.get("url") == self.url
+            and state.get("size") == size
+            and os.path.exists(self.part_path)
+            and os.path.getsize(self.part_path) == size
+        )
+        if resumable:
+            self.state = state
+            return
+        self.state = dict(
+            validators,
+            url=self.url,
+            size=size,
+            segments=_plan_segments(size, segments, min_segment),
+        )
+        with open(self.part_path, "wb") as fh:
+            fh.truncate(size)
+        self.save()
+
+    def save(self) -> None:
+        """Write the state file atomically."""
+        tmp = self.state_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(self.state, fh)
+        os.replace(tmp, self.state_path)
+
+    def checkpoint(self, segment: Dict[str, int], nbytes: int) -> None:
+        with self._lock:
+            segment["done"] += nbytes
+            self.save()
+
+    # -- transfer -------------------------------------------------------------
+
+    def fetch_segment(self, segment: Dict[str, int], max_attempts: int) -> None:
+        """Fetch one segment, resuming from its checkpoint after a dropped connection."""
+        for attempt in range(max_attempts):
+            offset = segment["start"] + segment["done"]
+            if offset > segment["end"]:
+                return
+            try:
+                self._copy_range(segment, offset)
+                return
+            except (requests.exceptions.RequestException, AdoRequestError) as exc:
+                # Bytes written since the last checkpoint are simply refetched
+                if attempt == max_attempts - 1:
+                    raise AdoRequestError(
+                        f"ERROR: Download of bytes {offset}-{segment['end']} failed: {exc}",
+                        url=self.url,
+                    ) from exc
+
+    def _copy_range(self, segment: Dict[str, int], offset: int) -> None:
+        response = self.get(offset, segment["end"])
+        try:
+            if response.status_code != 206:
+                raise AdoError(
+                    f"ERROR: Server ignored the Range request (HTTP {response.status_code}).",
+                    status=response.status_code, url=self.url,
+                )
+            pending = 0
+            with open(self.part_path, "r+b") as fh:
+                fh.seek(offset)
+                for chunk in response.iter_content(chunk_size=self.chunk_size):
+                    fh.write(chunk)
+                    pending += len(chunk)
+                    if pending >= CHECKPOINT_BYTES:
+                        fh.flush()
+                        self.checkpoint(segment, pending)
+                        pending = 0
+            self.checkpoint(segment, pending)
+        finally:
+            response.close()
+
+    def remaining(self) -> List[Dict[str, int]]:
+        return [s for s in self.state["segments"] if s["start"] + s["done"] <= s["end"]]
+
+    def discard(self) -> None:
+        for leftover in (self.part_path, self.state_path):
+            if os.path.exists(leftover):
+                os.remove(leftover)
+
+
+def _validators(response: requests.Response) -> Dict[str, Optional[str]]:
+    """The validators that identify this version of the resource."""
+    return {"etag": response.headers.get("ETag"), "last_modified": response.headers.get("Last-Modified")}
+
+
+def _probe(download: _Download) -> Tuple[Optional[int], Dict[str, Optional[str]], Optional[requests.Response]]:
+    """
+    Ask for the first byte to learn the size and whether ranges work.
+
+    Returns:
+        (size, validators, None) when ranges are supported or the resource
+        is empty (size 0), otherwise (None, {}, response) with the full body
+        ready to stream.
+    """
+    response = download.get(0, 0, expected_status=416)
+    content_range = response.headers.get("Content-Range", "")
+    if response.status_code == 416:
+        if _EMPTY_RANGE.match(content_range):
+            response.close()
+            return 0, _validators(response), None
+        handle_error_response(response, download.url)
+    if response.status_code == 206:
+        response.close()
+        match = _CONTENT_RANGE.match(content_range)
+        if match:
+            return int(match.group(1)), _validators(response), None
+        # Ranges work but the total is unknown ("bytes 0-0/*"): fetch it in one stream
+        return None, {}, download.get_all()
+    # Range not supported: this is the whole body, so stream it as-is
+    return None, {}, response
+
+
+def file_hash(path: str, algorithm: str = "sha256", chunk_size: int = DEFAULT_CHUNK_SIZE) -> str:
+    """Hex digest of a file, read in chunks."""
+    digest = hashlib.new(algorithm)
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def download_file(
+    client: Any,
+    url: str,
+    destination: Union[str, "os.PathLike[str]", BinaryIO],
+    accept: str = "application/octet-stream",
+    segments: Optional[int] = None,
+    min_segment: Optional[int] = None,
+    expected_size: Optional[int] = None,
+    expected_hash: Optional[str] = None,
+    hash_algorithm: str = "sha256",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_segment_attempts: int = 3,
+) -> int:
+    """
+    Download url to destination with parallel, resumable Range requests.
+
+    Args:
+        client: AdoClient supplying auth headers, timeout and retries.
+        url: Content URL (an operation URL or an artifact downloadUrl).
+        destination: Output path. A binary file object (e.g. stdout) is
+                     accepted too, but is written with one plain stream.
+        accept: Accept header for the content.
+        segments: Parallel segments (default ADO_DOWNLOAD_SEGMENTS or 4).
+        min_segment: Smallest segment in bytes, so small files use fewer
+                     connections (default ADO_DOWNLOAD_MIN_SEGMENT or 8 MiB).
+        expected_size: If set, the final size must match.
+        expected_hash: If set, the hex digest of the file must match.
+        hash_algorithm: hashlib algorithm for expected_hash.
+        chunk_size: Bytes read per chunk.
+        max_segment_attempts: Attempts per segment after dropped connections.
+
+    Returns:
+        Number of bytes in the completed file.
+
+    Raises:
+        AdoError: HTTP failure, size or hash mismatch.
+    """
+    if not isinstance(destination, (str, os.PathLike)):
+        response = client.request("GET", url, stream=True, accept=accept)
+        return stream_to(response, destination, chunk_size)
+
+    path = os.fspath(destination)
+    download = _Download(client, url, path, accept, chunk_size)
+    if getattr(client, "logger", None) is not None:
+        client.logger.info(f"GET {url} -> {path}")
+
+    size, validators, response = _probe(download)
+    if response is not None:
+        download.discard()
+        written = stream_to(response, download.part_path, chunk_size)
+    elif size == 0:
+        # Empty resource: nothing to fetch, the destination is just truncated
+        download.discard()
+        open(download.part_path, "wb").close()
+        written = 0
+    else:
+        download.load_or_create(
+            size, validators,
+            segments or _env_int("ADO_DOWNLOAD_SEGMENTS", DEFAULT_SEGMENTS),
+            min_segment or _env_int("ADO_DOWNLOAD_MIN_SEGMENT", DEFAULT_MIN_SEGMENT),
+        )
+        pending = download.remaining()
+        if pending:
+            with ThreadPoolExecutor(max_workers=len(pending)) as pool:
+                futures = [pool.submit(download.fetch_segment, s, max_segment_attempts) for s in pending]
+                for future in futures:
+                    future.result()
+        written = os.path.getsize(download.part_path)
+        if download.remaining() or written != size:
+            raise AdoError(f"ERROR: Incomplete download ({written} of {size} bytes).", url=url)
+
+    if expected_size is not None and written != expected_size:
+        download.discard()
+        raise AdoError(f"ERROR: Size mismatch: expected {expected_size} bytes, got {written}.", url=url)
+    if expected_hash is not None:
+        actual = file_hash(download.part_path, hash_algorithm, chunk_size)
+        if actual.lower() != expected_hash.lower():
+            download.discard()
+            raise AdoError(f"ERROR: {hash_algorithm} mismatch: expected {expected_hash}, got {actual}.", url=url)
+
+    os.replace(download.part_path, path)
+    if os.path.exists(download.state_path):
+        os.remove(download.state_path)
+    return written
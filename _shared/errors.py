@@ -0,0 +1,161 @@
+"""
+Exception hierarchy for Azure DevOps API clients.
+
+The shared HTTP layer raises these instead of calling sys.exit, so one bad
+request does not end a bulk crawl and callers in worker pools can skip,
+requeue or keep partial results. Every exception carries the HTTP status,
+a truncated response body, the URL and the elapsed time.
+
+CLI entry points translate them into process exit codes via
+_shared.cli.run_cli:
+
+    AdoError          1  (anything not listed below)
+    AdoConfigError    2  missing environment variable / dependency
+    AdoAuthError      3  HTTP 401 / 403
+    AdoNotFound       4  HTTP 404
+    AdoThrottled      5  HTTP 429 after all retries
+    AdoServerError    6  HTTP 5xx after all retries
+"""
+
+import math
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+# Response bodies are truncated to this many characters
+BODY_LIMIT = 500
+
+
+class AdoError(Exception):
+    """Base class for all Azure DevOps client errors."""
+
+    exit_code = 1
+
+    def __init__(
+        self,
+        message: str,
+        status: Optional[int] = None,
+        body: str = "",
+        url: str = "",
+        elapsed: float = 0.0,
+    ):
+        super().__init__(message)
+        self.message = message
+        self.status = status
+        self.body = body
+        self.url = url
+        self.elapsed = elapsed
+
+
+class AdoConfigError(AdoError):
+    """Missing or invalid local configuration (env vars, optional deps)."""
+
+    exit_code = 2
+
+
+class AdoRequestError(AdoError):
+    """The request never produced an HTTP response (DNS, TLS, timeout, ...)."""
+
+
+class AdoAuthError(AdoError):
+    """HTTP 401 (bad or expired PAT) or 403 (insufficient PAT scopes)."""
+
+    exit_code = 3
+
+
+class AdoNotFound(AdoError):
+    """HTTP 404 — the organisation, project or resource does not exist."""
+
+    exit_code = 4
+
+
+class AdoThrottled(AdoError):
+    """HTTP 429 that persisted through every retry."""
+
+    exit_code = 5
+
+    def __init__(self, message: str, retry_after: Optional[int] = None, **kwargs):
+        super().__init__(message, **kwargs)
+        self.retry_after = retry_after
+
+
+class AdoServerError(AdoError):
+    """HTTP 5xx that persisted through every retry."""
+
+    exit_code = 6
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[int]:
+    """
+    Parse a Retry-After header to whole seconds.
+
+    Accepts delay-seconds ("120") and HTTP-dates ("Wed, 21 Oct 2026
+    07:28:00 GMT"); a date in the past is 0. None when absent or unparseable.
+    """
+    if value is None:
+        return None
+    try:
+        return max(0, int(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        return None
+    return max(0, math.ceil(when.timestamp() - time.time()))
+
+
+def error_for_status(status: int, body: str, url: str, elapsed: float = 0.0,
+                     retry_after: Optional[int] = None) -> AdoError:
+    """
+    Build the exception for an error response, with an actionable message.
+
+    Args:
+        status: HTTP status code.
+        body: Response text (truncated to BODY_LIMIT).
+        url: Request URL.
+        elapsed: Seconds spent on the request, including retries.
+        retry_after: Parsed Retry-After header, for 429 responses.
+
+    Returns:
+        The matching AdoError subclass instance (not raised).
+    """
+    body = body[:BODY_LIMIT] if body else "(empty body)"
+    detail = f"\n  URL: {url}\n  Response: {body}"
+    fields = {"status": status, "body": body, "url": url, "elapsed": elapsed}
+
+    if status == 401:
+        return AdoAuthError(
+            "ERROR: Authentication failed (HTTP 401). "
+            "Verify AZURE_DEVOPS_PAT is valid and not expired." + detail,
+            **fields,
+        )
+    if status == 403:
+        return AdoAuthError(
+            "ERROR: Insufficient permissions (HTTP 403). "
+            "Check PAT scopes. See https://learn.microsoft.com/en-us/azure/devops/"
+            "organizations/accounts/use-personal-access-tokens-to-authenticate" + detail,
+            **fields,
+        )
+    if status == 404:
+        return AdoNotFound(
+            "ERROR: Resource not found (HTTP 404). "
+            "Verify AZURE_DEVOPS_ORG and resource identifiers are correct." + detail,
+            **fields,
+        )
+    if status == 429:
+        wait = retry_after if retry_after is not None else 10
+        return AdoThrottled(
+            f"ERROR: Rate limited (HTTP 429). Retry after {wait} seconds." + detail,
+            retry_after=retry_after,
+            **fields,
+        )
+    if 500 <= status < 600:
+        return AdoServerError(
+            f"ERROR: Server error (HTTP {status}). "
+            "Retry in 10s. If persistent, check https://status.dev.azure.com" + detail,
+            **fields,
+        )
+    return AdoError(f"ERROR: Unexpected HTTP {status}." + detail, **fields)
@@ -0,0 +1,522 @@
+"""
+Local fake Azure DevOps service for offline end-to-end runs and benchmarks.
+
+Serves every path and method in the cached Swagger specs
+(_shared/specs/.cache_*.json). An operation with a generated test fixture
+(<Domain>/<Resource>/tests/fixtures/<operation>_<status>.json) answers with
+that fixture. Everything else gets an example built from the response
+schema in the spec. Requests without an Authorization header get a 401.
+
+Requests use the daemon's proxy form, /proxy/<full URL>, so every client
+can be pointed here without touching its URLs:
+
+    python -m _shared.fake_server --port 8766 --page-size 50 --throttle-rate 0.05 &
+    export ADO_HTTP_REROUTE=http://127.0.0.1:8766   # Python (sync and async)
+    export ADO_DAEMON_URL=http://127.0.0.1:8766     # Bash and PowerShell
+
+Behaviour (FakeConfig fields; the CLI flags have the same names):
+
+    latency, jitter   Seconds added to every response, plus a random 0..jitter.
+    page_size         List responses are cut into pages of this many items.
+                      Each page but the last carries an x-ms-continuationtoken
+                      header (and continuationToken, when the body has one).
+                      $top / $skip are honoured as well.
+    collection_size   Every list holds this many items (the sample items
+                      repeated, with fresh integer ids).
+    collection_sizes  Per-path list sizes, {"<path suffix>": items}, that
+                      override collection_size (e.g. {"_apis/wit/wiql": 50000}).
+    throttle_rate     Fraction of requests answered 429 with Retry-After.
+    error_rate        Fraction of requests answered 500 or 503.
+    retry_after       Retry-After seconds sent with 429 and 503.
+    content_size      Bytes of raw (non JSON) content, produced as it is sent;
+                      Range requests get 206.
+    seed              Seed for the fault and latency draws, so a run repeats.
+
+A batch request whose JSON body lists "ids" (workitemsbatch and similar)
+gets one item per requested ID.
+
+GET /_fake/stats returns the request, status and injected fault counts.
+"""
+
+import argparse
+import copy
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+# Add project root to path for shared helpers and the generator index
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from _shared.cli import run_cli
+from _shared.errors import AdoConfigError
+
+ROOT = Path(__file__).resolve().parents[1]
+SPECS_DIR = ROOT / "_shared" / "specs"
+DEFAULT_PORT = 8766
+PROXY_PREFIX = "/proxy/"
+STATS_PATH = "/_fake/stats"
+CONTINUATION_HEADER = "x-ms-continuationtoken"
+# Nesting depth at which schema examples stop expanding objects
+MAX_EXAMPLE_DEPTH = 6
+# Raw content byte i is i % CONTENT_PERIOD
+CONTENT_PERIOD = 251
+_CONTENT_BLOCK = bytes(i % CONTENT_PERIOD for i in range(CONTENT_PERIOD * 4096))
+CONTENT_CHUNK = len(_CONTENT_BLOCK) - CONTENT_PERIOD
+
+
+class ContentSlice:
+    """Bytes first..last of the raw content, generated chunk by chunk as they are sent."""
+
+    def __init__(self, first: int, last: int):
+        self.first = first
+        self.last = last
+
+    def __len__(self) -> int:
+        return max(0, self.last - self.first + 1)
+
+    def __iter__(self) -> Iterator[bytes]:
+        offset, end = self.first, self.last + 1
+        while offset < end:
+            size = min(CONTENT_CHUNK, end - offset)
+            start = offset % CONTENT_PERIOD
+            yield _CONTENT_BLOCK[start:start + size]
+            offset += size
+
+    def __bytes__(self) -> bytes:
+        return b"".join(self)
+
+
+# (status, headers, body) of one response
+Reply = Tuple[int, Dict[str, str], Union[bytes, ContentSlice]]
+
+
+@dataclass
+class FakeConfig:
+    """Behaviour of the fake service; see the module docstring."""
+    latency: float = 0.0
+    jitter: float = 0.0
+    page_size: Optional[int] = None
+    collection_size: Optional[int] = None
+    throttle_rate: float = 0.0
+    error_rate: float = 0.0
+    retry_after: int = 1
+    content_size: int = 1024
+    seed: Optional[int] = None
+    collection_sizes: Dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class Route:
+    """One servable operation."""
+    method: str
+    host: str
+    template: str
+    pattern: "re.Pattern[str]"
+    status: int
+    schema: Optional[Dict[str, Any]] = None
+    definitions: Optional[Dict[str, Any]] = None
+    fixture: Optional[Path] = None
+    raw: bool = False
+    list_key: str = "value"
+
+
+def _compile(template: str) -> "re.Pattern[str]":
+    """Regex for a path template; each {name} matches one path segment."""
+    parts = re.split(r"(\{[^}]+\})", template)
+    return re.compile("".join("[^/]+" if p.startswith("{") else re.escape(p) for p in parts))
+
+
+def _literal_segments(template: str) -> int:
+    return sum(1 for seg in template.split("/") if seg and "{" not in seg)
+
+
+def _success(responses: Dict[str, Any]) -> Tuple[int, Optional[Dict[str, Any]]]:
+    """First 2xx status of a spec operation and its schema."""
+    for code in sorted(responses):
+        if code.isdigit() and 200 <= int(code) < 300:
+            return int(code), (responses[code] or {}).get("schema")
+    return 200, None
+
+
+def _spec_routes(specs_dir: Path) -> List[Route]:
+    routes = []
+    for path in sorted(specs_dir.glob(".cache_*.json")):
+        spec = json.loads(path.read_text(encoding="utf-8-sig"))
+        host = spec.get("host") or "dev.azure.com"
+        definitions = spec.get("definitions") or {}
+        paths = dict(spec.get("paths") or {}, **(spec.get("x-ms-paths") or {}))
+        for template, operations in paths.items():
+            template = template.split("?", 1)[0]
+            for method, operation in operations.items():
+                if not isinstance(operation, dict) or "responses" not in operation:
+                    continue
+                status, schema = _success(operation["responses"])
+                produces = operation.get("produces") or ["application/json"]
+                routes.append(Route(
+                    method=method.upper(), host=host, template=template, pattern=_compile(template),
+                    status=status, schema=schema, definitions=definitions,
+                    raw="application/json" not in produces,
+                ))
+    return routes
+
+
+def _fixture_routes(root: Path) -> List[Route]:
+    """Routes of the generated operations that have a fixture file."""
+    from _generator.index import load_index
+
+    routes = []
+    for op in load_index().values():
+        fixture = root / op.domain / op.resource / "tests" / "fixtures" / op.fixture_filename
+        if not op.raw_content and op.success_status != 204 and not fixture.is_file():
+            continue
+        scope = "/{organization}/{project}/" if op.project_scoped else "/{organization}/"
+        template = scope + op.url_path
+        routes.append(Route(
+            method=op.http_method, host=op.base_host, template=template, pattern=_compile(template),
+            status=op.success_status, fixture=fixture if fixture.is_file() else None,
+            raw=op.raw_content, list_key=op.list_key,
+        ))
+    return routes
+
+
+def schema_example(schema: Optional[Dict[str, Any]], definitions: Dict[str, Any], depth: int = 0,
+                   seen: Tuple[str, ...] = ()) -> Any:
+    """
+    Build a value that satisfies a Swagger schema.
+
+    Recursive definitions are cut off at their second appearance (the
+    property is left out) and objects stop expanding at MAX_EXAMPLE_DEPTH.
+    """
+    if not schema:
+        return {}
+    ref = schema.get("$ref")
+    if ref:
+        name = ref.rsplit("/", 1)[-1]
+        if name in seen or depth > MAX_EXAMPLE_DEPTH:
+            return None
+        return schema_example(definitions.get(name), definitions, depth + 1, seen + (name,))
+    if "allOf" in schema:
+        merged: Dict[str, Any] = {}
+        for part in schema["allOf"]:
+            value = schema_example(part, definitions, depth, seen)
+            if isinstance(value, dict):
+                merged.update(value)
+        return merged
+    if "enum" in schema:
+        return schema["enum"][0]
+    kind = schema.get("type", "object")
+    if kind == "array":
+        item = schema_example(schema.get("items"), definitions, depth + 1, seen)
+        return [] if item is None else [item]
+    if kind == "object":
+        result = {}
+        for name, prop in (schema.get("properties") or {}).items():
+            value = schema_example(prop, definitions, depth + 1, seen)
+            if value is not None:
+                result[name] = value
+        extra = schema.get("additionalProperties")
+        if isinstance(extra, dict) and not result:
+            value = schema_example(extra, definitions, depth + 1, seen)
+            if value is not None:
+                result["key"] = value
+        return result
+    if kind in ("integer", "number"):
+        return 1
+    if kind == "boolean":
+        return False
+    fmt = schema.get("format")
+    if fmt == "date-time":
+        return "2024-01-01T00:00:00Z"
+    if fmt == "uuid":
+        return "00000000-0000-0000-0000-000000000001"
+    return "string"
+
+
+def _expand(items: List[Any], start: int, stop: int, ids: Optional[List[Any]] = None) -> List[Any]:
+    """
+    Items start..stop-1 of the sample items repeated endlessly, with ids
+    index + 1 (or ids[index]). Only the requested slice is built.
+    """
+    if not items:
+        return []
+    result = []
+    for index in range(start, stop):
+        item = copy.deepcopy(items[index % len(items)])
+        if isinstance(item, dict) and (ids is not None or isinstance(item.get("id"), int)):
+            item["id"] = ids[index] if ids is not None else index + 1
+        result.append(item)
+    return result
+
+
+def _list_key(route: Route, data: Dict[str, Any]) -> Optional[str]:
+    """Key of the item list in a response: the operation's list_key, else the first list of items with ids."""
+    if isinstance(data.get(route.list_key), list):
+        return route.list_key
+    for key, value in data.items():
+        if isinstance(value, list) and value and isinstance(value[0], dict) and "id" in value[0]:
+            return key
+    return None
+
+
+def _json_reply(status: int, payload: Any, headers: Optional[Dict[str, str]] = None) -> Reply:
+    body = json.dumps(payload).encode("utf-8")
+    return status, dict(headers or {}, **{"Content-Type": "application/json; charset=utf-8"}), body
+
+
+class FakeAdo:
+    """The fake service: routes a request and builds the reply."""
+
+    def __init__(self, config: Optional[FakeConfig] = None, specs_dir: Path = SPECS_DIR, root: Path = ROOT):
+        self.config = config or FakeConfig()
+        self._random = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._examples: Dict[int, Any] = {}
+        self.stats: Dict[str, Any] = {"requests": 0, "throttled": 0, "errors": 0, "unmatched": 0, "status": {}}
+        # Generated operations first: their fixtures beat schema examples
+        routes = _fixture_routes(root) + sorted(_spec_routes(specs_dir), key=lambda r: -_literal_segments(r.template))
+        self._routes: Dict[Tuple[str, int], List[Route]] = {}
+        for route in routes:
+            self._routes.setdefault((route.method, route.template.count("/")), []).append(route)
+
+    @property
+    def route_count(self) -> int:
+        return sum(len(routes) for routes in self._routes.values())
+
+    def match(self, method: str, host: str, path: str) -> Optional[Route]:
+        """The route for a request; one on the same host wins over any other."""
+        candidates = [r for r in self._routes.get((method, path.count("/")), ()) if r.pattern.fullmatch(path)]
+        for route in candidates:
+            if route.host == host:
+                return route
+        return candidates[0] if candidates else None
+
+    def _draw(self) -> Tuple[float, Optional[int]]:
+        """Latency and injected fault status (or None) for one request."""
+        config = self.config
+        with self._lock:
+            delay = config.latency + (self._random.uniform(0, config.jitter) if config.jitter else 0.0)
+            roll = self._random.random()
+            fault = None
+            if roll < config.throttle_rate:
+                fault = 429
+            elif roll < config.throttle_rate + config.error_rate:
+                fault = self._random.choice((500, 503))
+        return delay, fault
+
+    def _count(self, key: str, status: int) -> None:
+        with self._lock:
+            if key:
+                self.stats[key] += 1
+            self.stats["status"][str(status)] = self.stats["status"].get(str(status), 0) + 1
+
+    def handle(self, method: str, url: str, headers: Dict[str, str], body: bytes = b"") -> Reply:
+        """
+        Answer one request.
+
+        Args:
+            method: HTTP method.
+            url: Full Azure DevOps URL (https://<host>/<org>/...).
+            headers: Request headers (names are matched case-insensitively).
+            body: Raw request body.
+        """
+        with self._lock:
+            self.stats["requests"] += 1
+        headers = {k.lower(): v for k, v in headers.items()}
+        delay, fault = self._draw()
+        if delay > 0:
+            time.sleep(delay)
+
+        if not headers.get("authorization"):
+            self._count("", 401)
+            return _json_reply(401, {"message": "TF400813: The user is not authorized to access this resource."})
+        if fault is not None:
+            self._count("throttled" if fault == 429 else "errors", fault)
+            extra = {"Retry-After": str(self.config.retry_after)} if fault in (429, 503) else {}
+            return _json_reply(fault, {"message": f"Injected HTTP {fault} from the fake server."}, extra)
+
+        parts = urlsplit(url)
+        route = self.match(method, (parts.hostname or "").lower(), unquote(parts.path))
+        if route is None:
+            self._count("unmatched", 404)
+            return _json_reply(404, {"message": f"The fake server has no route for {method} {parts.path}"})
+        self._count("", route.status)
+
+        if route.status == 204:
+            return 204, {}, b""
+        if route.raw:
+            return self._content(route, headers)
+        return self._page(route, self._sample(route), dict(parse_qsl(parts.query)), body)
+
+    def _sample(self, route: Route) -> Any:
+        """A fresh copy of the route's fixture or schema example."""
+        key = id(route)
+        if key not in self._examples:
+            if route.fixture is not None:
+                self._examples[key] = json.loads(route.fixture.read_text(encoding="utf-8"))
+            else:
+                example = schema_example(route.schema, route.definitions or {})
+                # Azure DevOps wraps the arrays of its specs in a count/value envelope
+                if isinstance(example, list):
+                    example = {"count": len(example), "value": example}
+                self._examples[key] = example
+        return copy.deepcopy(self._examples[key])
+
+    def _collection_size(self, route: Route) -> Optional[int]:
+        for suffix, size in self.config.collection_sizes.items():
+            if route.template.endswith(suffix):
+                return size
+        return self.config.collection_size
+
+    def _page(self, route: Route, data: Any, query: Dict[str, str], body: bytes) -> Reply:
+        """Serve the requested page of a list response (anything else as-is)."""
+        key = _list_key(route, data) if isinstance(data, dict) else None
+        items = data if isinstance(data, list) else data[key] if key else None
+        if not isinstance(items, list):
+            return _json_reply(route.status, data)
+        try:
+            sent = json.loads(body) if body else None
+        except ValueError:
+            sent = None
+        sent = sent if isinstance(sent, dict) else {}
+        # Batch endpoints return one item per requested ID
+        ids = sent["ids"] if isinstance(sent.get("ids"), list) else None
+        total = len(ids) if ids is not None else self._collection_size(route)
+        expand = total is not None and bool(items)
+        if not expand:
+            total = len(items)
+        token = query.get("continuationToken") or sent.get("continuationToken")
+        try:
+            start = int(token or query.get("$skip") or 0)
+            size = int(query.get("$top") or self.config.page_size or total or 1)
+        except ValueError:
+            return _json_reply(400, {"message": "Invalid continuationToken, $skip or $top."})
+        if expand:
+            # Build only this page; the whole collection is never materialised
+            page = _expand(items, max(0, start), max(0, min(start + size, total)), ids=ids)
+        else:
+            page = items[start:start + size]
+        more = start + size < total
+        headers = {CONTINUATION_HEADER: str(start + size)} if more else {}
+        if isinstance(data, list):
+            return _json_reply(route.status, page, headers)
+        data[key] = page
+        if "count" in data:
+            data["count"] = len(page)
+        if "continuationToken" in data:
+            data["continuationToken"] = str(start + size) if more else None
+        return _json_reply(route.status, data, headers)
+
+    def _content(self, route: Route, headers: Dict[str, str]) -> Reply:
+        """Deterministic raw content, with single-range support."""
+        size = self.config.content_size
+        match = re.fullmatch(r"bytes=(\d+)-(\d*)", headers.get("range", ""))
+        base = {"Content-Type": "application/octet-stream", "Accept-Ranges": "bytes"}
+        if match:
+            first = int(match.group(1))
+            last = min(int(match.group(2) or size - 1), size - 1)
+            if first >= size:
+                return 416, dict(base, **{"Content-Range": f"bytes */{size}"}), b""
+            return 206, dict(base, **{"Content-Range": f"bytes {first}-{last}/{size}"}), ContentSlice(first, last)
+        return route.status, base, ContentSlice(0, size - 1)
+
+
+class FakeHandler(BaseHTTPRequestHandler):
+    """Serves /proxy/<url> and /_fake/stats."""
+
+    server_version = "FakeAzureDevOps/1.0"
+    # Keep-alive, so clients reuse connections the way they do with Azure DevOps
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without this, Nagle's
+    # algorithm holds the body until the client's delayed ACK (~40 ms)
+    disable_nagle_algorithm = True
+
+    def _dispatch(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        fake: FakeAdo = self.server.fake  # type: ignore[attr-defined]
+        if self.command == "GET" and self.path == STATS_PATH:
+            with fake._lock:
+                status, headers, payload = _json_reply(200, dict(fake.stats, config=asdict(fake.config)))
+        elif self.path.startswith(PROXY_PREFIX):
+            status, headers, payload = fake.handle(self.command, self.path[len(PROXY_PREFIX):], dict(self.headers), body)
+        else:
+            status, headers, payload = _json_reply(404, {"message": f"Unknown fake server path: {self.path}"})
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        if self.command != "HEAD":
+            for chunk in ([payload] if isinstance(payload, bytes) else payload):
+                self.wfile.write(chunk)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = do_HEAD = _dispatch
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    # Room for many concurrent clients connecting at once (default 5)
+    request_queue_size = 128
+
+
+def serve(config: Optional[FakeConfig] = None, port: int = DEFAULT_PORT, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """Create the fake server (call serve_forever() on the result)."""
+    server = _Server((host, port), FakeHandler)
+    server.daemon_threads = True
+    server.fake = FakeAdo(config)  # type: ignore[attr-defined]
+    return server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run a local fake Azure DevOps service built from the cached specs.")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Loopback port to listen on (default {DEFAULT_PORT})")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random latency, 0..jitter seconds")
+    parser.add_argument("--page-size", type=int, default=None, help="Items per page of list responses")
+    parser.add_argument("--collection-size", type=int, default=None, help="Items in every list response")
+    parser.add_argument("--collection-size-for", action="append", default=[], metavar="SUFFIX=N",
+                        help="Items in list responses of paths ending in SUFFIX (repeatable)")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of requests answered 429")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered 500/503")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds on 429 and 503 (default 1)")
+    parser.add_argument("--content-size", type=int, default=1024, help="Bytes of raw content responses (default 1024)")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for injected latency and faults")
+    args = parser.parse_args()
+    collection_sizes = {}
+    for entry in args.collection_size_for:
+        suffix, _, size = entry.rpartition("=")
+        if not suffix or not size.isdigit():
+            raise AdoConfigError(f"ERROR: --collection-size-for expects SUFFIX=N, got {entry!r}.")
+        collection_sizes[suffix] = int(size)
+    config = FakeConfig(
+        latency=args.latency, jitter=args.jitter, page_size=args.page_size,
+        collection_size=args.collection_size, throttle_rate=args.throttle_rate,
+        error_rate=args.error_rate, retry_after=args.retry_after,
+        content_size=args.content_size, seed=args.seed, collection_sizes=collection_sizes,
+    )
+    try:
+        server = serve(config, args.port)
+    except OSError as exc:
+        raise AdoConfigError(f"ERROR: Cannot listen on 127.0.0.1:{args.port}: {exc}") from exc
+    print(f"Serving {server.fake.route_count} routes on http://127.0.0.1:{server.server_address[1]} (pid {os.getpid()})", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    run_cli(main)
@@ -2,17 +2,36 @@
 Shared HTTP client helpers for Azure DevOps API clients.
 
 Provides standardised request execution with error handling, version guards,
-and response parsing. Implements the error-handling table from the spec.
+and response parsing. Implements the error-handling table from the spec;
+failures raise the typed exceptions from _shared.errors.
+Requests go through the pooled per-host sessions in _shared.session_pool so
+repeated calls reuse keep-alive connections.
+
+AdoClient bundles the organisation, auth header and retry settings that the
+generated ``<operation>(client, ...)`` functions need, so operations can be
+called in-process without going through environment variables:
+
+    client = AdoClient("myorg", pat)
+    build = get_builds(client, "MyProject", "42")
 """
 
 import json
+import os
 import sys
 import time
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple, Union
 
 import requests
 
-from _shared.auth import redact_pat
+from _shared.auth import build_auth_header, get_common_env, redact_pat
+from _shared import metrics
+from _shared.errors import AdoError, AdoRequestError, error_for_status, parse_retry_after
+from _shared.rate_limit import get_limiter
+from _shared.response_cache import CachedResponse, get_cache
+from _shared.session_pool import session_for_url
+
+# Bytes read per chunk when streaming raw content
+DEFAULT_CHUNK_SIZE = 1024 * 1024
 
 
 def build_url(
@@ -43,62 +62,34 @@ def build_url(
     return f"{base}/{path}{separator}api-version={api_version}"
 
 
-def handle_error_response(response: requests.Response, url: str) -> None:
+def handle_error_response(response: requests.Response, url: str, elapsed: float = 0.0) -> None:
     """
-    Provide actionable error messages per the spec's error-handling table.
+    Raise the typed error for a failed response, per the spec's error-handling table.
 
     Handles 401, 403, 404, 429, and 5xx with specific guidance.
+
+    Raises:
+        AdoError: The subclass matching the status code (see _shared.errors).
     """
-    status = response.status_code
-    # Truncate response body for logging
-    body = response.text[:500] if response.text else "(empty body)"
-    # Redact PAT from URL if present
-    safe_url = url
-
-    if status == 401:
-        print(
-            f"ERROR: Authentication failed (HTTP 401). "
-            f"Verify AZURE_DEVOPS_PAT is valid and not expired.\n"
-            f"  URL: {safe_url}\n  Response: {body}",
-            file=sys.stderr,
-        )
-    elif status == 403:
-        print(
-            f"ERROR: Insufficient permissions (HTTP 403). "
-            f"Check PAT scopes. See https://learn.microsoft.com/en-us/azure/devops/"
-            f"organizations/accounts/use-personal-access-tokens-to-authenticate\n"
-            f"  URL: {safe_url}\n  Response: {body}",
-            file=sys.stderr,
-        )
-    elif status == 404:
-        print(
-            f"ERROR: Resource not found (HTTP 404). "
-            f"Verify AZURE_DEVOPS_ORG and resource identifiers are correct.\n"
-            f"  URL: {safe_url}\n  Response: {body}",
-            file=sys.stderr,
-        )
-    elif status == 429:
-        retry_after = response.headers.get("Retry-After", "10")
-        print(
-            f"WARN: Rate limited (HTTP 429). Retrying after {retry_after} seconds.\n"
-            f"  URL: {safe_url}",
-            file=sys.stderr,
-        )
-    elif 500 <= status < 600:
-        print(
-            f"ERROR: Server error (HTTP {status}). "
-            f"Retry in 10s. If persistent, check https://status.dev.azure.com\n"
-            f"  URL: {safe_url}\n  Response: {body}",
-            file=sys.stderr,
-        )
-    else:
-        print(
-            f"ERROR: Unexpected HTTP {status}.\n"
-            f"  URL: {safe_url}\n  Response: {body}",
-            file=sys.stderr,
-        )
+    raise error_for_status(
+        response.status_code,
+        response.text,
+        url,
+        elapsed=elapsed,
+        retry_after=parse_retry_after(response.headers.get("Retry-After")),
+    )
+
 
-    sys.exit(1)
+def _cached_response(cached: CachedResponse, not_modified: requests.Response) -> requests.Response:
+    """Turn a cache entry into the 200 response a 304 stands for."""
+    response = requests.Response()
+    response.status_code = 200
+    response.headers = requests.structures.CaseInsensitiveDict(cached.headers)
+    response._content = cached.body
+    response.url = not_modified.url
+    response.request = not_modified.request
+    response.elapsed = not_modified.elapsed
+    return response
 
 
 def execute_request(
@@ -109,10 +100,18 @@ def execute_request(
     timeout: int = 30,
     expected_status: Optional[int] = None,
     max_retries: int = 3,
+    stream: bool = False,
 ) -> requests.Response:
     """
     Execute an HTTP request with retry logic for 429/5xx.
 
+    The request is sent on the pooled keep-alive session for the URL's host,
+    paced by the process-wide adaptive rate limiter (_shared.rate_limit).
+    When the response cache is enabled (_shared.response_cache), GETs are
+    revalidated with If-None-Match / If-Modified-Since and 304s are
+    answered from the cache. Hooks registered with _shared.metrics receive
+    one timing record per call.
+
     Args:
         method: HTTP method (GET, POST, PATCH, PUT, DELETE).
         url: Full request URL.
@@ -121,47 +120,141 @@ def execute_request(
         timeout: Request timeout in seconds.
         expected_status: If set, accept this status without error handling.
         max_retries: Maximum retry attempts for transient errors.
+        stream: Leave the body unread so it can be consumed with
+                stream_to() / iter_content() in constant memory.
 
     Returns:
         requests.Response object on success.
+
+    Raises:
+        AdoRequestError: The request failed without an HTTP response.
+        AdoError: A subclass per status code once retries are exhausted.
     """
+    record = metrics.begin(method, url)
+    try:
+        response = _send(method, url, headers, body, timeout, expected_status, max_retries, stream, record)
+    except AdoError as exc:
+        metrics.finish(record, error=exc)
+        raise
+    metrics.finish(record, response)
+    return response
+
+
+def _send(
+    method: str,
+    url: str,
+    headers: Dict[str, str],
+    body: Optional[Dict],
+    timeout: int,
+    expected_status: Optional[int],
+    max_retries: int,
+    stream: bool,
+    record: Optional[metrics.RequestMetrics],
+) -> requests.Response:
+    """The retry loop behind execute_request; fills in record when set."""
+    start = time.monotonic()
+    limiter = get_limiter()
+    cache = get_cache() if method == "GET" and not stream else None
+    cached = None
+    if cache is not None:
+        cache_key = cache.key(url, headers)
+        cached = cache.lookup(cache_key)
+        if cached is not None:
+            headers = dict(headers, **cached.validators())
     for attempt in range(max_retries):
+        if limiter is not None:
+            wait = limiter.reserve()
+            if wait > 0:
+                time.sleep(wait)
+                if record is not None:
+                    record.throttle_wait += wait
         try:
-            response = requests.request(
-                method=method,
-                url=url,
-                headers=headers,
-                json=body,
-                timeout=timeout,
-            )
+            with metrics.connection_scope(record):
+                response = session_for_url(url).request(
+                    method=method,
+                    url=url,
+                    headers=headers,
+                    json=body,
+                    timeout=timeout,
+                    stream=stream,
+                )
         except requests.exceptions.RequestException as exc:
-            print(f"ERROR: Request failed: {exc}", file=sys.stderr)
-            sys.exit(1)
+            raise AdoRequestError(
+                f"ERROR: Request failed: {exc}", url=url, elapsed=time.monotonic() - start,
+            ) from exc
+        if limiter is not None:
+            limiter.observe(response.headers)
+        metrics.observe_response(record, response, body)
+
+        # Not modified: answer from the cache
+        if cached is not None and response.status_code == 304:
+            cache.touch(cache_key)
+            return _cached_response(cached, response)
 
         # Success path
         if expected_status and response.status_code == expected_status:
             return response
         if response.ok:
+            if cache is not None and response.status_code == 200:
+                cache.store(cache_key, url, response.headers, response.content)
             return response
 
         # Retryable: 429 and 5xx
         if response.status_code == 429 or response.status_code >= 500:
             if attempt < max_retries - 1:
-                wait = int(response.headers.get("Retry-After", 2 ** (attempt + 1)))
+                wait = parse_retry_after(response.headers.get("Retry-After"))
+                if wait is None:
+                    wait = 2 ** (attempt + 1)
                 print(
                     f"WARN: HTTP {response.status_code}, retrying in {wait}s "
                     f"(attempt {attempt + 1}/{max_retries})...",
                     file=sys.stderr,
                 )
+                response.close()
                 time.sleep(wait)
+                if record is not None:
+                    record.retry_wait += wait
                 continue
 
-        # Non-retryable error
-        handle_error_response(response, url)
+        # Non-retryable error, or retries exhausted
+        break
+
+    handle_error_response(response, url, time.monotonic() - start)
+
+
+def stream_to(
+    response: requests.Response,
+    destination: Union[str, "os.PathLike[str]", BinaryIO],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """
+    Copy a streamed response body to a file path or binary file object.
+
+    Memory use is bounded by chunk_size whatever the payload size. The
+    response is closed afterwards.
+
+    Args:
+        response: Response from execute_request(..., stream=True).
+        destination: Output path, or an open binary file such as
+                     sys.stdout.buffer.
+        chunk_size: Bytes read per chunk.
 
-    # Exhausted retries
-    handle_error_response(response, url)
-    return response  # unreachable, handle_error_response exits
+    Returns:
+        Number of bytes written.
+    """
+    written = 0
+    try:
+        if isinstance(destination, (str, os.PathLike)):
+            with open(destination, "wb") as fh:
+                return stream_to(response, fh, chunk_size)
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            if chunk:
+                destination.write(chunk)
+                written += len(chunk)
+        destination.flush()
+        return written
+    finally:
+        response.close()
 
 
 def version_guard(data: Any, required_keys: List[str], api_version: str) -> None:
@@ -182,3 +275,62 @@ def version_guard(data: Any, required_keys: List[str], api_version: str) -> None
                     file=sys.stderr,
                 )
                 return
+
+
+class AdoClient:
+    """
+    Shared state for blocking Azure DevOps calls.
+
+    Holds the organisation, auth headers and retry settings; requests go
+    through execute_request and therefore the pooled keep-alive sessions.
+    """
+
+    def __init__(
+        self,
+        organization: str,
+        pat: str,
+        timeout: int = 30,
+        max_retries: int = 3,
+        logger: Optional[Any] = None,
+    ):
+        self.organization = organization
+        self.pat = pat
+        self.headers = build_auth_header(pat)
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.logger = logger
+
+    @classmethod
+    def from_env(cls, **kwargs: Any) -> "AdoClient":
+        """Build a client from AZURE_DEVOPS_ORG and AZURE_DEVOPS_PAT."""
+        organization, pat = get_common_env()
+        return cls(organization, pat, **kwargs)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        body: Optional[Dict] = None,
+        expected_status: Optional[int] = None,
+        stream: bool = False,
+        accept: Optional[str] = None,
+    ) -> requests.Response:
+        """
+        Send one request with the client's auth and retry settings.
+
+        ``stream`` leaves the body unread (see stream_to); ``accept``
+        overrides the Accept header, e.g. for zip or text content.
+        """
+        if self.logger is not None:
+            self.logger.info(f"{method} {url}")
+        headers = self.headers if accept is None else dict(self.headers, Accept=accept)
+        return execute_request(
+            method,
+            url,
+            headers,
+            body=body,
+            timeout=self.timeout,
+            expected_status=expected_status,
+            max_retries=self.max_retries,
+            stream=stream,
+        )
@@ -3,20 +3,47 @@ Shared logging utilities for Azure DevOps API clients.
 
 Provides dual-format logging (.log human-readable + .json structured),
 PAT redaction, and GitHub Actions annotation support.
+
+File output goes through one background writer thread per process. Callers
+only enqueue a line, and the writer appends to buffered handles that stay
+open (at most MAX_OPEN_FILES, least recently used closed first). It
+flushes every FLUSH_INTERVAL seconds, or when the queue goes idle, and
+rotates a file once it passes ADO_LOG_MAX_BYTES. Everything still
+queued is written at interpreter exit (or on flush_logs()). Console output
+and GitHub Actions annotations stay synchronous so they interleave correctly
+with the script's own output.
+
+Settings (environment variables):
+
+    ADO_LOG_MAX_BYTES  Rotate a log file past this size (default 10 MiB; 0 = never).
+    ADO_LOG_BACKUPS    Rotated files kept per log, <name>.1 ... (default 3).
 """
 
+import atexit
 import datetime
-import json
 import os
+import queue
 import sys
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
+from typing import IO, Dict, List, Optional, Tuple
 
 from _shared.auth import redact_pat
+from _shared.codec import dumps
 
 # Log output directory — created automatically, should be .gitignored
 LOG_DIR = Path(__file__).resolve().parents[1] / "logs"
 
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+DEFAULT_BACKUPS = 3
+# Seconds between flushes while lines keep arriving
+FLUSH_INTERVAL = 1.0
+# Log files kept open at once; a long-lived process touching many
+# operations would otherwise run out of file descriptors
+MAX_OPEN_FILES = 32
+
 
 def _ensure_log_dir() -> Path:
     """Create the logs/ directory if it doesn't exist."""
@@ -29,17 +56,142 @@ def _timestamp() -> str:
     return datetime.datetime.now(datetime.timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
 
 
+def _secrets(pat: Optional[str] = None) -> List[Tuple[str, str]]:
+    """(secret, replacement) pairs for the given PAT and AZURE_DEVOPS_PAT."""
+    pairs = []
+    for candidate in (pat, os.environ.get("AZURE_DEVOPS_PAT", "")):
+        if candidate and len(candidate) > 4 and all(candidate != s for s, _ in pairs):
+            pairs.append((candidate, redact_pat(candidate)))
+    return pairs
+
+
 def _redact_message(message: str, pat: Optional[str] = None) -> str:
     """Redact any PAT occurrences in the message."""
-    if pat and len(pat) > 4:
-        message = message.replace(pat, redact_pat(pat))
-    # Also try to catch PATs from environment
-    env_pat = os.environ.get("AZURE_DEVOPS_PAT", "")
-    if env_pat and len(env_pat) > 4 and env_pat in message:
-        message = message.replace(env_pat, redact_pat(env_pat))
+    for secret, replacement in _secrets(pat):
+        message = message.replace(secret, replacement)
     return message
 
 
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+class _LogWriter:
+    """Background thread appending queued lines to buffered, rotating files."""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, backups: int = DEFAULT_BACKUPS,
+                 max_open: int = MAX_OPEN_FILES):
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.max_open = max(1, max_open)
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        # Open handles, least recently written first
+        self._handles: "OrderedDict[Path, IO[str]]" = OrderedDict()
+        # Bytes in each open file; tell() on a text handle would flush it
+        self._sizes: Dict[Path, int] = {}
+        self._thread = threading.Thread(target=self._run, name="ado-log-writer", daemon=True)
+        self._thread.start()
+
+    def write(self, path: Path, line: str) -> None:
+        self._queue.put((path, line))
+
+    def flush(self, timeout: float = 5.0) -> None:
+        """Block until every line queued so far is on disk."""
+        if not self._thread.is_alive():
+            return
+        done = threading.Event()
+        self._queue.put((None, done))
+        done.wait(timeout)
+
+    def _run(self) -> None:
+        last_flush = time.monotonic()
+        while True:
+            try:
+                path, item = self._queue.get(timeout=FLUSH_INTERVAL)
+            except queue.Empty:
+                self._flush_all()
+                last_flush = time.monotonic()
+                continue
+            if path is None:
+                self._flush_all()
+                item.set()
+                continue
+            try:
+                self._append(path, item)
+            except OSError:
+                # Logging must never take the caller down
+                pass
+            if time.monotonic() - last_flush >= FLUSH_INTERVAL:
+                self._flush_all()
+                last_flush = time.monotonic()
+
+    def _append(self, path: Path, line: str) -> None:
+        handle = self._handles.get(path)
+        if handle is None:
+            while len(self._handles) >= self.max_open:
+                self._close(next(iter(self._handles)))
+            handle = self._handles[path] = open(path, "a", encoding="utf-8")
+            self._sizes[path] = os.path.getsize(path)
+        else:
+            self._handles.move_to_end(path)
+        handle.write(line)
+        self._sizes[path] += len(line.encode("utf-8"))
+        if self.max_bytes > 0 and self._sizes[path] >= self.max_bytes:
+            self._rotate(path)
+
+    def _close(self, path: Path) -> None:
+        """Flush and close the handle for path."""
+        self._sizes.pop(path, None)
+        self._handles.pop(path).close()
+
+    def _rotate(self, path: Path) -> None:
+        """Rename <path> to <path>.1 (shifting older backups) and start afresh."""
+        self._close(path)
+        if self.backups <= 0:
+            path.unlink()
+            return
+        for n in range(self.backups - 1, 0, -1):
+            older = path.with_name(f"{path.name}.{n}")
+            if older.exists():
+                os.replace(older, path.with_name(f"{path.name}.{n + 1}"))
+        os.replace(path, path.with_name(f"{path.name}.1"))
+
+    def _flush_all(self) -> None:
+        for handle in self._handles.values():
+            try:
+                handle.flush()
+            except OSError:
+                pass
+
+
+_writer: Optional[_LogWriter] = None
+_writer_lock = threading.Lock()
+
+
+def _get_writer() -> _LogWriter:
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = _LogWriter(
+                    max_bytes=_env_int("ADO_LOG_MAX_BYTES", DEFAULT_MAX_BYTES),
+                    backups=_env_int("ADO_LOG_BACKUPS", DEFAULT_BACKUPS),
+                )
+    return _writer
+
+
+def flush_logs(timeout: float = 5.0) -> None:
+    """Write every queued log line to disk (also runs at interpreter exit)."""
+    if _writer is not None:
+        _writer.flush(timeout)
+
+
+atexit.register(flush_logs)
+
+
 class AdoLogger:
     """
     Dual-format logger for Azure DevOps API client scripts.
@@ -58,16 +210,18 @@ class AdoLogger:
         self._log_dir = _ensure_log_dir()
         self._log_file = self._log_dir / f"{operation}.log"
         self._json_file = self._log_dir / f"{operation}.json"
+        self._secrets = _secrets(self.pat)
+        self._writer = _get_writer()
 
     def _write(self, level: str, message: str) -> None:
         """Write a log entry to all outputs."""
-        safe_msg = _redact_message(message, self.pat)
+        safe_msg = message
+        for secret, replacement in self._secrets:
+            safe_msg = safe_msg.replace(secret, replacement)
         ts = _timestamp()
 
         # Human-readable log
-        log_line = f"[{ts}] [{level}] {safe_msg}\n"
-        with open(self._log_file, "a", encoding="utf-8") as f:
-            f.write(log_line)
+        self._writer.write(self._log_file, f"[{ts}] [{level}] {safe_msg}\n")
 
         # Structured JSON log
         entry = {
@@ -76,8 +230,7 @@ class AdoLogger:
             "operation": self.operation,
             "message": safe_msg,
         }
-        with open(self._json_file, "a", encoding="utf-8") as f:
-            f.write(json.dumps(entry) + "\n")
+        self._writer.write(self._json_file, dumps(entry) + "\n")
 
         # Console output
         print(f"[{level}] {safe_msg}", file=sys.stderr)
@@ -89,6 +242,10 @@ class AdoLogger:
             elif level == "WARN":
                 print(f"::warning::{safe_msg}")
 
+    def flush(self) -> None:
+        """Block until this process's queued log lines are on disk."""
+        self._writer.flush()
+
     def info(self, message: str) -> None:
         """Log at INFO level."""
         self._write("INFO", message)
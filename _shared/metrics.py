@@ -0,0 +1,280 @@
+"""
+Per-request timing and metrics hooks for Azure DevOps API clients.
+
+execute_request and execute_request_async build one RequestMetrics record
+per call when at least one hook is registered:
+
+    status, attempts           Final HTTP status and number of sends.
+    dns, connect, tls          Seconds spent opening new connections
+                               (0 when a pooled connection was reused;
+                               blocking client only).
+    ttfb, total                Seconds to the response headers / overall.
+    bytes_out, bytes_in        Request body size / response body size.
+    throttle_wait, retry_wait  Seconds paced by the rate limiter / slept
+                               in 429 / 5xx backoff.
+    rate_limit                 X-RateLimit-* and Retry-After headers.
+
+That separates a throttled job (throttle_wait, retry_wait) from a slow
+server (ttfb) and from one that spends its time on handshakes (connect,
+tls). Hooks are plain callables that receive the record:
+
+    from _shared.metrics import add_hook
+    add_hook(lambda m: print(m.method, m.url, m.total))
+
+Two sinks ship with the module, enabled by environment variables or
+configure_metrics():
+
+    ADO_METRICS_FILE     Append one JSON object per request to this file.
+    ADO_METRICS_SUMMARY  Set to 1 to print a latency histogram per host at exit.
+"""
+
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from urllib.parse import urlsplit
+
+# Upper bounds (seconds) of the latency histogram buckets
+BUCKETS = (0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, float("inf"))
+
+Hook = Callable[["RequestMetrics"], None]
+
+_hooks: List[Hook] = []
+_hooks_lock = threading.Lock()
+_local = threading.local()
+
+
+@dataclass
+class RequestMetrics:
+    """Telemetry for one logical request, including its retries."""
+
+    method: str
+    url: str
+    timestamp: float
+    status: Optional[int] = None
+    attempts: int = 0
+    dns: float = 0.0
+    connect: float = 0.0
+    tls: float = 0.0
+    ttfb: Optional[float] = None
+    total: float = 0.0
+    bytes_out: int = 0
+    bytes_in: Optional[int] = None
+    throttle_wait: float = 0.0
+    retry_wait: float = 0.0
+    rate_limit: Dict[str, str] = field(default_factory=dict)
+    error: str = ""
+    _start: float = field(default=0.0, repr=False)
+
+    @property
+    def host(self) -> str:
+        return urlsplit(self.url).netloc
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        del data["_start"]
+        return data
+
+
+# -- hooks ----------------------------------------------------------------------
+
+def add_hook(hook: Hook) -> None:
+    """Call hook(RequestMetrics) after every request."""
+    with _hooks_lock:
+        _hooks.append(hook)
+
+
+def remove_hook(hook: Hook) -> None:
+    with _hooks_lock:
+        if hook in _hooks:
+            _hooks.remove(hook)
+
+
+def enabled() -> bool:
+    return bool(_hooks)
+
+
+def begin(method: str, url: str) -> Optional[RequestMetrics]:
+    """Start a record, or return None when no hook is registered."""
+    if not _hooks:
+        return None
+    return RequestMetrics(method, url, timestamp=time.time(), _start=time.perf_counter())
+
+
+def observe_response(record: Optional[RequestMetrics], response: Any, body: Any = None) -> None:
+    """Copy status, TTFB, sizes and throttling headers from one attempt."""
+    if record is None:
+        return
+    record.attempts += 1
+    record.status = response.status_code
+    record.rate_limit = {
+        k: v for k, v in response.headers.items()
+        if k.lower().startswith("x-ratelimit-") or k.lower() == "retry-after"
+    }
+    try:
+        # requests: time to the headers; httpx: until the body was read
+        record.ttfb = response.elapsed.total_seconds()
+    except (AttributeError, RuntimeError):
+        # httpx raises RuntimeError for a stream that is still open
+        pass
+    if body is not None:
+        record.bytes_out = len(json.dumps(body).encode("utf-8"))
+
+
+def finish(record: Optional[RequestMetrics], response: Any = None, error: Optional[Exception] = None) -> None:
+    """Complete a record and pass it to every hook."""
+    if record is None:
+        return
+    record.total = time.perf_counter() - record._start
+    if error is not None:
+        record.error = getattr(error, "message", str(error))
+        record.status = getattr(error, "status", None) or record.status
+    if response is not None:
+        length = response.headers.get("Content-Length")
+        consumed = getattr(response, "_content_consumed", True)
+        if consumed and getattr(response, "_content", None) not in (None, False):
+            record.bytes_in = len(response._content)
+        elif length and length.isdigit():
+            record.bytes_in = int(length)
+    for hook in list(_hooks):
+        try:
+            hook(record)
+        except Exception as exc:  # a broken sink must not fail the request
+            print(f"WARN: metrics hook failed: {exc}", file=sys.stderr)
+
+
+# -- connection phases ----------------------------------------------------------
+
+@contextmanager
+def connection_scope(record: Optional[RequestMetrics]) -> Iterator[None]:
+    """Attribute connections opened in this thread to record."""
+    previous = getattr(_local, "record", None)
+    _local.record = record
+    try:
+        yield
+    finally:
+        _local.record = previous
+
+
+def current() -> Optional[RequestMetrics]:
+    """The record that new connections in this thread belong to, if any."""
+    return getattr(_local, "record", None)
+
+
+# -- sinks ----------------------------------------------------------------------
+
+class NdjsonSink:
+    """Hook appending one JSON object per request to a file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, "a", encoding="utf-8", buffering=1)
+        atexit.register(self.close)
+
+    def __call__(self, record: RequestMetrics) -> None:
+        line = json.dumps(record.to_dict(), default=str) + "\n"
+        with self._lock:
+            if not self._file.closed:
+                self._file.write(line)
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+class Summary:
+    """Hook keeping an in-memory latency histogram and totals per host."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hosts: Dict[str, Dict[str, Any]] = {}
+
+    def __call__(self, record: RequestMetrics) -> None:
+        with self._lock:
+            stats = self.hosts.setdefault(record.host, {
+                "requests": 0, "errors": 0, "retries": 0, "total": 0.0, "ttfb": 0.0,
+                "handshake": 0.0, "throttle_wait": 0.0, "retry_wait": 0.0, "bytes_in": 0,
+                "buckets": [0] * len(BUCKETS),
+            })
+            stats["requests"] += 1
+            stats["errors"] += bool(record.error)
+            stats["retries"] += max(0, record.attempts - 1)
+            stats["total"] += record.total
+            stats["ttfb"] += record.ttfb or 0.0
+            stats["handshake"] += record.dns + record.connect + record.tls
+            stats["throttle_wait"] += record.throttle_wait
+            stats["retry_wait"] += record.retry_wait
+            stats["bytes_in"] += record.bytes_in or 0
+            for i, bound in enumerate(BUCKETS):
+                if record.total <= bound:
+                    stats["buckets"][i] += 1
+                    break
+
+    @staticmethod
+    def percentile(buckets: List[int], fraction: float) -> float:
+        """Upper bound of the bucket holding the given fraction of requests."""
+        target = fraction * sum(buckets)
+        seen = 0
+        for count, bound in zip(buckets, BUCKETS):
+            seen += count
+            if seen >= target and count:
+                return bound
+        return 0.0
+
+    def render(self) -> str:
+        """Multi-line summary: one line per host plus its histogram."""
+        lines = ["Azure DevOps request summary:"]
+        with self._lock:
+            for host, s in sorted(self.hosts.items()):
+                n = s["requests"]
+                p50, p90, p99 = (self.percentile(s["buckets"], f) for f in (0.5, 0.9, 0.99))
+                lines.append(
+                    f"  {host}: {n} requests, {s['errors']} errors, {s['retries']} retries | "
+                    f"avg total {s['total'] / n * 1000:.0f} ms, avg ttfb {s['ttfb'] / n * 1000:.0f} ms, "
+                    f"p50<={p50 * 1000:.0f} ms p90<={p90 * 1000:.0f} ms p99<={p99 * 1000:.0f} ms | "
+                    f"handshakes {s['handshake']:.2f}s, throttled {s['throttle_wait']:.2f}s, "
+                    f"backoff {s['retry_wait']:.2f}s, {s['bytes_in']} bytes in"
+                )
+                bars = "  ".join(
+                    f"<={'inf' if b == float('inf') else f'{b * 1000:g}'}ms:{c}"
+                    for b, c in zip(BUCKETS, s["buckets"]) if c
+                )
+                lines.append(f"    {bars}")
+        return "\n".join(lines)
+
+    def print_at_exit(self) -> None:
+        if self.hosts:
+            print(self.render(), file=sys.stderr)
+
+
+def configure_metrics(ndjson_file: Optional[str] = None, summary: bool = False) -> Optional[Summary]:
+    """
+    Register the bundled sinks.
+
+    Args:
+        ndjson_file: Append per-request JSON lines to this file.
+        summary: Keep a histogram and print it to stderr at exit.
+
+    Returns:
+        The Summary hook when summary is enabled (call render() any time).
+    """
+    if ndjson_file:
+        add_hook(NdjsonSink(ndjson_file))
+    if not summary:
+        return None
+    hook = Summary()
+    add_hook(hook)
+    atexit.register(hook.print_at_exit)
+    return hook
+
+
+configure_metrics(
+    os.environ.get("ADO_METRICS_FILE") or None,
+    os.environ.get("ADO_METRICS_SUMMARY", "").lower() in ("1", "true", "yes"),
+)
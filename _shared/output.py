@@ -0,0 +1,289 @@
+"""
+Columnar export of list results for Azure DevOps API clients.
+
+List operations accept ``--format ndjson|csv|parquet`` (plus ``--fields``
+and ``--output``) and write one record per item instead of pretty-printed
+JSON. Items are written as they arrive, so a paged listing streams page by
+page in constant memory:
+
+    ndjson   One compact JSON object per line. Items keep their nesting
+             unless --fields projects them.
+    csv      One row per item. Nested objects are flattened to dotted
+             columns (``project.name``, ``fields.System.Title``); lists
+             are written as JSON.
+    parquet  Flattened like csv, written in row groups. Requires the
+             optional pyarrow dependency (pip install pyarrow) and --output.
+
+``--fields`` takes flattened column names, e.g.
+``--fields id,fields.System.Title,fields.System.State``.
+
+Example:
+    from _shared.output import write_items
+    write_items(iter_list_builds(client, project), "csv", "builds.csv",
+                fields=["id", "buildNumber", "definition.name"])
+"""
+
+import argparse
+import csv
+import io
+import sys
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, TextIO
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover - exercised only without pyarrow
+    pyarrow = None
+
+from _shared.codec import dumps
+from _shared.errors import AdoConfigError
+
+FORMATS = ("ndjson", "csv", "parquet")
+# Items sampled for the csv / parquet columns when --fields is not given
+SCHEMA_SAMPLE = 1000
+# Rows per parquet row group
+ROW_GROUP = 10_000
+
+
+def _require_pyarrow() -> None:
+    """Raise AdoConfigError with an install hint when pyarrow is missing."""
+    if pyarrow is None:
+        raise AdoConfigError("ERROR: --format parquet requires pyarrow. Install it with: pip install pyarrow")
+
+
+def flatten(item: Any, prefix: str = "") -> Dict[str, Any]:
+    """
+    Flatten nested dicts to dotted keys: {"project": {"name": "x"}} -> {"project.name": "x"}.
+
+    Lists and scalars are kept as values; a non-dict item becomes {"value": item}.
+    """
+    if not isinstance(item, dict):
+        return {prefix or "value": item}
+    flat: Dict[str, Any] = {}
+    for key, value in item.items():
+        name = f"{prefix}.{key}" if prefix else str(key)
+        if isinstance(value, dict) and value:
+            flat.update(flatten(value, name))
+        else:
+            flat[name] = value
+    return flat
+
+
+def project(item: Any, fields: Sequence[str]) -> Dict[str, Any]:
+    """Flattened item restricted to fields, in that order (missing fields are None)."""
+    flat = flatten(item)
+    return {name: flat.get(name) for name in fields}
+
+
+def items_of(data: Any, list_key: str = "value") -> List[Any]:
+    """The items of a list response; a single object is one item."""
+    if isinstance(data, list):
+        return data
+    if isinstance(data, dict) and isinstance(data.get(list_key), list):
+        return data[list_key]
+    return [] if data is None else [data]
+
+
+def parse_fields(value: Optional[str]) -> Optional[List[str]]:
+    """Split a comma-separated --fields value; None or empty means every field."""
+    if not value:
+        return None
+    fields = [name.strip() for name in value.split(",") if name.strip()]
+    return fields or None
+
+
+def _cell(value: Any) -> Any:
+    """Scalar for a csv / parquet cell; lists and objects are written as JSON."""
+    if isinstance(value, (list, dict)):
+        return dumps(value)
+    return value
+
+
+def _columns(rows: Sequence[Dict[str, Any]]) -> List[str]:
+    """Union of the keys of rows, in first-seen order."""
+    seen: Dict[str, None] = {}
+    for row in rows:
+        for key in row:
+            seen.setdefault(key, None)
+    return list(seen)
+
+
+def _rows(items: Iterable[Any], fields: Optional[Sequence[str]]) -> Iterator[Dict[str, Any]]:
+    for item in items:
+        yield project(item, fields) if fields else flatten(item)
+
+
+def _sampled(rows: Iterator[Dict[str, Any]], fields: Optional[Sequence[str]]):
+    """(columns, rows): the columns are fields, or those of the first SCHEMA_SAMPLE rows."""
+    if fields:
+        return list(fields), rows
+    sample = []
+    for row in rows:
+        sample.append(row)
+        if len(sample) >= SCHEMA_SAMPLE:
+            break
+
+    columns = _columns(sample)
+
+    def replay() -> Iterator[Dict[str, Any]]:
+        yield from sample
+        known = set(columns)
+        for row in rows:
+            extra = [key for key in row if key not in known]
+            if extra:
+                print(f"WARN: dropping fields not seen in the first {SCHEMA_SAMPLE} items: "
+                      f"{', '.join(extra)} (use --fields to select them)", file=sys.stderr)
+                known.update(extra)
+            yield row
+
+    return columns, replay()
+
+
+def write_ndjson(items: Iterable[Any], out: TextIO, fields: Optional[Sequence[str]] = None) -> int:
+    """Write one compact JSON object per line; returns the number of items."""
+    count = 0
+    for item in items:
+        record = project(item, fields) if fields else item
+        out.write(dumps(record))
+        out.write("\n")
+        count += 1
+    return count
+
+
+def write_csv(items: Iterable[Any], out: TextIO, fields: Optional[Sequence[str]] = None) -> int:
+    """
+    Write flattened items as CSV with a header row; returns the number of items.
+
+    Without fields the columns are those seen in the first SCHEMA_SAMPLE
+    items; columns that only appear later are dropped.
+    """
+    columns, rows = _sampled(_rows(items, fields), fields)
+    writer = csv.writer(out)
+    writer.writerow(columns)
+    count = 0
+    for row in rows:
+        writer.writerow(["" if row.get(c) is None else _cell(row.get(c)) for c in columns])
+        count += 1
+    return count
+
+
+def _arrow_column(values: List[Any]) -> "pyarrow.Array":
+    """Arrow array for one column; values of mixed types are written as text."""
+    try:
+        return pyarrow.array(values)
+    except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+        return pyarrow.array([v if v is None or isinstance(v, str) else dumps(v) for v in values], pyarrow.string())
+
+
+def _promote(current: "pyarrow.DataType", new: "pyarrow.DataType") -> "pyarrow.DataType":
+    """Narrowest type holding both: null gives way, int widens to float, anything else to string."""
+    if new == current or pyarrow.types.is_null(new):
+        return current
+    if pyarrow.types.is_null(current):
+        return new
+    numeric = (pyarrow.types.is_integer, pyarrow.types.is_floating)
+    if any(check(current) for check in numeric) and any(check(new) for check in numeric):
+        return pyarrow.float64()
+    return pyarrow.string()
+
+
+def _merge_schema(schema: Optional["pyarrow.Schema"], table: "pyarrow.Table") -> "pyarrow.Schema":
+    """schema widened to hold table; columns still without a type become string."""
+    fields = []
+    for index, field in enumerate(table.schema):
+        dtype = field.type if schema is None else _promote(schema.field(index).type, field.type)
+        fields.append(pyarrow.field(field.name, pyarrow.string() if pyarrow.types.is_null(dtype) else dtype))
+    return pyarrow.schema(fields)
+
+
+def write_parquet(items: Iterable[Any], path: str, fields: Optional[Sequence[str]] = None) -> int:
+    """
+    Write flattened items to a Parquet file in row groups; returns the number of items.
+
+    Column types are inferred per row group and widened as later groups
+    need (a column that is empty so far is string, int widens to float,
+    mixed values become string). Widening a type already written rewrites
+    the file so far. Columns are chosen as for write_csv.
+    """
+    _require_pyarrow()
+    columns, rows = _sampled(_rows(items, fields), fields)
+    writer = None
+    schema = None
+    count = 0
+    batch: List[Dict[str, Any]] = []
+
+    def flush() -> None:
+        nonlocal writer, schema
+        table = pyarrow.table({c: _arrow_column([_cell(row.get(c)) for row in batch]) for c in columns})
+        merged = _merge_schema(schema, table)
+        if writer is not None and merged != schema:
+            # A later group widened a column: rewrite what is on disk with the new types
+            writer.close()
+            written = pyarrow.parquet.read_table(path).cast(merged)
+            writer = pyarrow.parquet.ParquetWriter(path, merged)
+            writer.write_table(written, row_group_size=ROW_GROUP)
+        elif writer is None:
+            writer = pyarrow.parquet.ParquetWriter(path, merged)
+        schema = merged
+        writer.write_table(table.cast(schema))
+        batch.clear()
+
+    try:
+        for row in rows:
+            batch.append(row)
+            count += 1
+            if len(batch) >= ROW_GROUP:
+                flush()
+        if batch or writer is None:
+            flush()
+    finally:
+        if writer is not None:
+            writer.close()
+    return count
+
+
+def write_items(
+    items: Iterable[Any],
+    fmt: str,
+    output: Optional[str] = None,
+    fields: Optional[Sequence[str]] = None,
+) -> int:
+    """
+    Stream items to output (default: stdout) in the given format.
+
+    Args:
+        items: Item dicts, e.g. an iter_<operation>() generator.
+        fmt: One of FORMATS.
+        output: File path; required for parquet.
+        fields: Flattened field names to keep (default: all).
+
+    Returns:
+        Number of items written.
+    """
+    if fmt not in FORMATS:
+        raise AdoConfigError(f"ERROR: Unknown format '{fmt}'. Choose from: {', '.join(FORMATS)}")
+    if fmt == "parquet":
+        if not output:
+            raise AdoConfigError("ERROR: --format parquet needs --output <file>.")
+        return write_parquet(items, output, fields)
+
+    writer = write_ndjson if fmt == "ndjson" else write_csv
+    if not output:
+        return writer(items, sys.stdout, fields)
+    # newline="" lets the csv module write its own line endings
+    with io.open(output, "w", encoding="utf-8", newline="") as fh:
+        return writer(items, fh, fields)
+
+
+def add_format_arguments(parser: argparse.ArgumentParser, fields_flag: str = "--fields") -> None:
+    """
+    Add --format, --fields and --output to a list operation's parser.
+
+    The projection is stored as ``args.select_fields``. Operations that
+    already send a ``--fields`` API parameter pass another fields_flag.
+    """
+    parser.add_argument("--format", choices=FORMATS, default=None,
+                        help="Write one record per item as ndjson, csv or parquet instead of JSON")
+    parser.add_argument(fields_flag, dest="select_fields", default=None,
+                        help="Comma-separated flattened fields to keep, e.g. id,project.name")
+    parser.add_argument("--output", default=None, help="Write the records to this file (default: stdout)")
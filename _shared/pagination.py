@@ -0,0 +1,179 @@
+"""
+Pagination helpers for Azure DevOps list operations.
+
+Azure DevOps pages list results in one of three ways; the style of each
+operation is detected from the Swagger specs by spec_to_yaml.py and stored
+in its definition (``pagination:``):
+
+    continuation       Next-page token in the x-ms-continuationtoken response
+                       header (or a continuationToken body field), sent back
+                       as the continuationToken query parameter.
+    continuation_body  Same token, sent back in the request body (POST
+                       batch endpoints such as wiki pagesbatch).
+    top_skip           Classic $top / $skip offsets.
+
+paginate() yields items lazily across every page and can fetch the next
+page on a background thread while the caller consumes the current one.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from _shared.codec import loads
+
+CONTINUATION_HEADER = "x-ms-continuationtoken"
+DEFAULT_PAGE_SIZE = 100
+STYLES = ("continuation", "continuation_body", "top_skip")
+
+# (url, body) of one page request
+_PageRequest = Tuple[str, Optional[Dict]]
+
+
+def with_query(url: str, **params: Any) -> str:
+    """Return url with the given query parameters added or replaced."""
+    parts = urlsplit(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k not in params]
+    query.extend((k, str(v)) for k, v in params.items())
+    return urlunsplit(parts._replace(query=urlencode(query, safe="$,")))
+
+
+def page_items(data: Any, list_key: str = "value") -> List[Any]:
+    """Extract the items of one page (bare JSON arrays are returned as-is)."""
+    if isinstance(data, list):
+        return data
+    if isinstance(data, dict):
+        return data.get(list_key) or []
+    return []
+
+
+def next_token(response: Any, data: Any) -> Optional[str]:
+    """Continuation token for the next page, or None on the last page."""
+    token = response.headers.get(CONTINUATION_HEADER)
+    if token:
+        return token
+    if isinstance(data, dict) and data.get("hasMore", True):
+        return data.get("continuationToken") or None
+    return None
+
+
+def _next_request(
+    style: str,
+    current: _PageRequest,
+    response: Any,
+    data: Any,
+    items: List[Any],
+) -> Optional[_PageRequest]:
+    """Build the request for the page after ``current``, or None when done."""
+    url, body = current
+    if style == "top_skip":
+        query = dict(parse_qsl(urlsplit(url).query))
+        top = int(query.get("$top", DEFAULT_PAGE_SIZE))
+        if len(items) < top:
+            return None
+        skip = int(query.get("$skip", 0)) + len(items)
+        return with_query(url, **{"$skip": skip}), body
+
+    token = next_token(response, data)
+    if not token:
+        return None
+    if style == "continuation_body":
+        if body is not None and body.get("continuationToken") == token:
+            return None
+        return url, dict(body or {}, continuationToken=token)
+    if dict(parse_qsl(urlsplit(url).query)).get("continuationToken") == token:
+        return None
+    return with_query(url, continuationToken=token), body
+
+
+def iter_pages(
+    client: Any,
+    method: str,
+    url: str,
+    style: str,
+    body: Optional[Dict] = None,
+    list_key: str = "value",
+    expected_status: Optional[int] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch: bool = False,
+) -> Iterator[List[Any]]:
+    """
+    Yield the items of each page in turn.
+
+    Args:
+        client: AdoClient (anything with a blocking ``request`` method).
+        method: HTTP method of the list operation.
+        url: URL of the first page, as built by the operation function.
+        style: One of STYLES.
+        body: Request body for POST list operations.
+        list_key: JSON key holding the items of a page.
+        expected_status: Passed through to client.request.
+        page_size: $top for the top_skip style.
+        prefetch: Request the next page on a background thread while the
+                  caller consumes the current one.
+    """
+    if style not in STYLES:
+        raise ValueError(f"Unknown pagination style: {style!r}")
+    if style == "top_skip":
+        url = with_query(url, **{"$top": page_size, "$skip": 0})
+
+    def fetch(request: _PageRequest) -> Any:
+        return client.request(method, request[0], body=request[1], expected_status=expected_status)
+
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    pending = None
+    try:
+        request: Optional[_PageRequest] = (url, body)
+        response = fetch(request)
+        while True:
+            data = loads(response.content)
+            items = page_items(data, list_key)
+            request = _next_request(style, request, response, data, items)
+            if request is not None and executor is not None:
+                pending = executor.submit(fetch, request)
+            yield items
+            if request is None:
+                return
+            response = pending.result() if pending is not None else fetch(request)
+            pending = None
+    finally:
+        if pending is not None:
+            pending.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+def paginate(
+    client: Any,
+    method: str,
+    url: str,
+    style: str,
+    body: Optional[Dict] = None,
+    list_key: str = "value",
+    expected_status: Optional[int] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_items: Optional[int] = None,
+    prefetch: bool = False,
+) -> Iterator[Any]:
+    """
+    Yield items lazily across all pages of a list operation.
+
+    Takes the same arguments as iter_pages, plus ``max_items`` to stop
+    after that many items without requesting further pages.
+    """
+    if max_items is not None and max_items <= 0:
+        return
+    yielded = 0
+    pages = iter_pages(
+        client, method, url, style, body=body, list_key=list_key,
+        expected_status=expected_status, page_size=page_size, prefetch=prefetch,
+    )
+    try:
+        for items in pages:
+            for item in items:
+                yield item
+                yielded += 1
+                if max_items is not None and yielded >= max_items:
+                    return
+    finally:
+        pages.close()
@@ -0,0 +1,271 @@
+"""
+Adaptive client-side rate limiting for Azure DevOps API clients.
+
+Azure DevOps meters usage in TSTUs and reports the budget on every response:
+
+    X-RateLimit-Resource   Which limit the headers describe.
+    X-RateLimit-Limit      Total TSTUs allowed in the sliding window.
+    X-RateLimit-Remaining  TSTUs left before requests are delayed.
+    X-RateLimit-Delay      Seconds the service delayed this request.
+    Retry-After            Seconds (or an HTTP-date) to wait before the next request.
+
+One process-wide token bucket paces every request sent by execute_request
+and execute_request_async. observe() reads the headers above on each response:
+the rate is cut as the remaining budget shrinks or delays appear, requests
+pause for Retry-After, and the rate recovers gradually while the service
+reports headroom. The goal is to slow down before the service returns 429s.
+
+By default there is no fixed cap: requests go out unpaced until the headers
+report throttling. Pacing then starts from THROTTLED_RPS and is lifted again
+once the rate has recovered to it. ADO_RATE_LIMIT_RPS sets a fixed cap instead.
+
+Parallel jobs on one machine can share the same pacing state through a
+small JSON file guarded by an advisory lock (POSIX only; elsewhere the file
+is shared without locking).
+
+Settings (environment variables, or configure_rate_limit() at runtime):
+
+    ADO_RATE_LIMIT_RPS    Max requests per second (default 0: no fixed cap,
+                          only the headers slow requests down; "off"
+                          disables the limiter).
+    ADO_RATE_LIMIT_BURST  Bucket capacity (default: same as the rate).
+    ADO_RATE_LIMIT_FILE   Path of a state file shared across processes.
+"""
+
+import json
+import math
+import os
+import threading
+import time
+from typing import Any, Dict, Mapping, Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+from _shared.errors import parse_retry_after
+
+DEFAULT_RPS = 0.0
+# Rate throttling feedback starts from when there is no fixed cap
+THROTTLED_RPS = 20.0
+MIN_RPS = 0.5
+# Below this fraction of X-RateLimit-Limit the rate is scaled down linearly
+LOW_BUDGET_FRACTION = 0.25
+# Fraction of the max rate regained after each unthrottled response
+RECOVERY_STEP = 0.05
+# Minimum seconds between reads of the shared state file
+SHARED_READ_INTERVAL = 1.0
+
+_lock = threading.Lock()
+_limiter: Optional["RateLimiter"] = None
+_configured = False
+
+
+def _header_float(headers: Mapping[str, str], name: str) -> Optional[float]:
+    """Read a numeric header; None when absent or not a number."""
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket whose rate follows the throttling headers.
+
+    reserve() takes a token and returns how long the caller must wait
+    before sending, so the same limiter serves blocking and asyncio code.
+    A max_rate of 0 means no fixed cap: the rate is unbounded until the
+    headers report throttling.
+    """
+
+    def __init__(
+        self,
+        max_rate: float = DEFAULT_RPS,
+        burst: Optional[float] = None,
+        shared_file: Optional[str] = None,
+    ):
+        self.max_rate = max_rate
+        self.rate = max_rate if max_rate > 0 else math.inf
+        # Reference for the feedback below when there is no fixed cap
+        self._ceiling = max_rate if max_rate > 0 else THROTTLED_RPS
+        self.capacity = burst if burst is not None else max(self._ceiling, 1.0)
+        self.shared_file = shared_file
+        self.resource = ""
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._shared_read = 0.0
+        self._lock = threading.Lock()
+
+    # -- pacing -------------------------------------------------------------
+
+    def reserve(self) -> float:
+        """Take one token; return the seconds to wait before sending."""
+        with self._lock:
+            now = time.monotonic()
+            self._load_shared(now)
+            if self.rate == math.inf:
+                self._tokens = self.capacity
+                self._updated = now
+                return max(0.0, self._paused_until - now)
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._paused_until - now)
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    # -- feedback -----------------------------------------------------------
+
+    def observe(self, headers: Mapping[str, str]) -> None:
+        """Adjust the rate from one response's throttling headers."""
+        retry_after = parse_retry_after(headers.get("Retry-After"))
+        delay = _header_float(headers, "X-RateLimit-Delay")
+        limit = _header_float(headers, "X-RateLimit-Limit")
+        remaining = _header_float(headers, "X-RateLimit-Remaining")
+
+        with self._lock:
+            self.resource = headers.get("X-RateLimit-Resource", self.resource)
+            now = time.monotonic()
+            shared = False
+            current = min(self.rate, self._ceiling)
+            if retry_after is not None:
+                self._paused_until = max(self._paused_until, now + retry_after)
+                self.rate = max(MIN_RPS, current / 2)
+                shared = True
+            elif delay:
+                self.rate = max(MIN_RPS, current / 2)
+                shared = True
+            elif limit and remaining is not None and remaining < limit * LOW_BUDGET_FRACTION:
+                scaled = self._ceiling * remaining / (limit * LOW_BUDGET_FRACTION)
+                self.rate = max(MIN_RPS, min(current, scaled))
+                shared = True
+            elif self.rate < self._ceiling:
+                self.rate = min(self._ceiling, self.rate + self._ceiling * RECOVERY_STEP)
+            elif self.max_rate <= 0:
+                # Recovered: no fixed cap to return to
+                self.rate = math.inf
+            if shared:
+                self._store_shared(now)
+
+    # -- cross-process state -------------------------------------------------
+
+    def _load_shared(self, now: float) -> None:
+        """Adopt a slower rate or longer pause written by another process."""
+        if not self.shared_file or now - self._shared_read < SHARED_READ_INTERVAL:
+            return
+        self._shared_read = now
+        state = self._read_state()
+        if not state:
+            return
+        pause = float(state.get("paused_until", 0)) - time.time()
+        if pause > 0:
+            self._paused_until = max(self._paused_until, now + pause)
+        if float(state.get("expires", 0)) > time.time():
+            self.rate = max(MIN_RPS, min(self.rate, float(state.get("rate", self.rate))))
+
+    def _store_shared(self, now: float) -> None:
+        """Publish this process's rate and pause for its siblings."""
+        if not self.shared_file:
+            return
+        wall_pause = time.time() + max(0.0, self._paused_until - now)
+        try:
+            with open(self.shared_file, "a+", encoding="utf-8") as fh:
+                if fcntl is not None:
+                    fcntl.flock(fh, fcntl.LOCK_EX)
+                fh.seek(0)
+                try:
+                    state = json.loads(fh.read() or "{}")
+                except ValueError:
+                    state = {}
+                state = {
+                    "paused_until": max(float(state.get("paused_until", 0)), wall_pause),
+                    "rate": self.rate,
+                    # A reduced rate applies to siblings for one throttling window
+                    "expires": time.time() + 60,
+                    "resource": self.resource,
+                }
+                fh.seek(0)
+                fh.truncate()
+                fh.write(json.dumps(state))
+        except OSError:
+            pass
+
+    def _read_state(self) -> Dict[str, Any]:
+        try:
+            with open(self.shared_file, "r", encoding="utf-8") as fh:
+                if fcntl is not None:
+                    fcntl.flock(fh, fcntl.LOCK_SH)
+                return json.loads(fh.read() or "{}")
+        except (OSError, ValueError):
+            return {}
+
+
+def _from_env() -> Optional[RateLimiter]:
+    """Build the process-wide limiter from environment variables."""
+    value = os.environ.get("ADO_RATE_LIMIT_RPS", "").strip().lower()
+    if value == "off":
+        return None
+    try:
+        rps = max(0.0, float(value)) if value else DEFAULT_RPS
+    except ValueError:
+        rps = DEFAULT_RPS
+    try:
+        burst = float(os.environ["ADO_RATE_LIMIT_BURST"])
+    except (KeyError, ValueError):
+        burst = None
+    return RateLimiter(rps, burst=burst, shared_file=os.environ.get("ADO_RATE_LIMIT_FILE") or None)
+
+
+def get_limiter() -> Optional[RateLimiter]:
+    """Return the process-wide limiter (None when rate limiting is disabled)."""
+    global _limiter, _configured
+    if _configured:
+        return _limiter
+    with _lock:
+        if not _configured:
+            _limiter = _from_env()
+            _configured = True
+        return _limiter
+
+
+def configure_rate_limit(
+    max_rate: Optional[float] = None,
+    burst: Optional[float] = None,
+    shared_file: Optional[str] = None,
+    enabled: bool = True,
+) -> Optional[RateLimiter]:
+    """
+    Replace the process-wide limiter.
+
+    Args:
+        max_rate: Max requests per second; 0 sets no fixed cap, so only
+                  the throttling headers slow requests down. None re-reads
+                  the environment variables.
+        burst: Bucket capacity (default: same as max_rate).
+        shared_file: State file shared with other processes.
+        enabled: False removes the limiter altogether.
+
+    Returns:
+        The new limiter, or None when disabled.
+    """
+    global _limiter, _configured
+    with _lock:
+        if not enabled:
+            _limiter = None
+        elif max_rate is None:
+            _limiter = _from_env()
+        else:
+            _limiter = RateLimiter(max_rate, burst=burst, shared_file=shared_file)
+        _configured = True
+        return _limiter
@@ -0,0 +1,244 @@
+"""
+Opt-in conditional-request cache for Azure DevOps GET responses.
+
+Polled resources (projects, repositories, fields, build definitions) rarely
+change between polls. When a cache directory is configured, execute_request
+and execute_request_async store every 200 GET response that carries an
+ETag or Last-Modified validator. The next GET for the same URL sends
+If-None-Match / If-Modified-Since; a 304 is answered from disk. A 304 is
+cheaper than a full response, both in latency and in rate-limit budget.
+
+Entries are keyed by URL, Accept header and a hash of the Authorization
+header, so callers with different PATs never share responses. The PAT
+itself is never written to disk. Entries neither stored nor revalidated
+by a 304 within the TTL are dropped, and the least recently used entries
+are evicted once the directory exceeds its size bound. The directory size
+is tracked as a running total, so only a store that pushes it past the
+bound scans the directory.
+
+Settings (environment variables, or configure_cache() at runtime):
+
+    ADO_HTTP_CACHE_DIR     Cache directory; caching is off when unset.
+    ADO_HTTP_CACHE_TTL     Seconds an entry stays usable after it was stored or
+                           last revalidated (default 86400).
+    ADO_HTTP_CACHE_MAX_MB  Size bound of the directory (default 256).
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Optional, Tuple
+
+DEFAULT_TTL = 24 * 60 * 60
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+ENTRY_SUFFIX = ".entry"
+# Headers that describe the original transfer, not the cached body
+_DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection", "set-cookie"}
+
+_lock = threading.Lock()
+_cache: Optional["ResponseCache"] = None
+_configured = False
+
+
+@dataclass
+class CachedResponse:
+    """A stored 200 response and its validators."""
+
+    url: str
+    stored: float
+    headers: Dict[str, str]
+    body: bytes
+
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers that revalidate this entry."""
+        lowered = {k.lower(): v for k, v in self.headers.items()}
+        conditional = {}
+        if "etag" in lowered:
+            conditional["If-None-Match"] = lowered["etag"]
+        if "last-modified" in lowered:
+            conditional["If-Modified-Since"] = lowered["last-modified"]
+        return conditional
+
+
+class ResponseCache:
+    """On-disk, size-bounded LRU cache of validated GET responses."""
+
+    def __init__(self, directory: str, ttl: float = DEFAULT_TTL, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        # Bytes of every entry on disk, kept up to date by store() and removals
+        self._total = sum(size for _, size, _ in self._scan())
+
+    @staticmethod
+    def key(url: str, headers: Mapping[str, str]) -> str:
+        """Cache key for a request: URL, Accept and the auth scope."""
+        scope = "\n".join((headers.get("Authorization", ""), headers.get("Accept", ""), url))
+        return hashlib.sha256(scope.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + ENTRY_SUFFIX)
+
+    def lookup(self, key: str) -> Optional[CachedResponse]:
+        """Return the entry for key, or None when missing, unreadable or expired."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as fh:
+                # touch() moves the modification time forward on every 304
+                modified = os.fstat(fh.fileno()).st_mtime
+                meta = json.loads(fh.readline())
+                body = fh.read()
+        except (OSError, ValueError):
+            return None
+        if time.time() - max(modified, meta.get("stored", 0)) > self.ttl:
+            self._discard(path)
+            return None
+        return CachedResponse(meta.get("url", ""), meta["stored"], meta.get("headers", {}), body)
+
+    def touch(self, key: str) -> None:
+        """
+        Mark an entry as revalidated: it is fresh for another TTL and recently
+        used (both are read from the modification time).
+        """
+        try:
+            os.utime(self._path(key))
+        except OSError:
+            pass
+
+    def store(self, key: str, url: str, headers: Mapping[str, str], body: bytes) -> bool:
+        """
+        Store a 200 response if it carries a validator.
+
+        Returns:
+            True when the response was cached.
+        """
+        kept = {k: v for k, v in headers.items() if k.lower() not in _DROPPED_HEADERS}
+        if not CachedResponse(url, 0, kept, b"").validators():
+            return False
+        if len(body) > self.max_bytes:
+            return False
+        meta = json.dumps({"url": url, "stored": time.time(), "headers": kept})
+        data = meta.encode("utf-8") + b"\n" + body
+        path = self._path(key)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp, "wb") as fh:
+                fh.write(data)
+            with self._lock:
+                replaced = self._size(path)
+                os.replace(tmp, path)
+                self._total += len(data) - replaced
+                over = self._total > self.max_bytes
+        except OSError:
+            self._remove(tmp)
+            return False
+        if over:
+            self._evict()
+        return True
+
+    def _scan(self) -> List[Tuple[float, int, str]]:
+        """(mtime, size, path) of every entry in the directory."""
+        entries = []
+        for item in os.scandir(self.directory):
+            if item.name.endswith(ENTRY_SUFFIX):
+                try:
+                    stat = item.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, item.path))
+        return entries
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the directory fits max_bytes."""
+        with self._lock:
+            entries = self._scan()
+            # Resynchronise with the directory, which other processes may share
+            self._total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if self._total <= self.max_bytes:
+                    break
+                self._remove(path)
+                self._total -= size
+
+    def _discard(self, path: str) -> None:
+        """Remove an entry and take it off the running total."""
+        with self._lock:
+            size = self._size(path)
+            self._remove(path)
+            self._total -= size
+
+    @staticmethod
+    def _size(path: str) -> int:
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            return 0
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def _from_env() -> Optional[ResponseCache]:
+    """Build the process-wide cache from environment variables."""
+    directory = os.environ.get("ADO_HTTP_CACHE_DIR")
+    if not directory:
+        return None
+    try:
+        ttl = float(os.environ.get("ADO_HTTP_CACHE_TTL", DEFAULT_TTL))
+    except ValueError:
+        ttl = DEFAULT_TTL
+    try:
+        max_bytes = int(float(os.environ["ADO_HTTP_CACHE_MAX_MB"]) * 1024 * 1024)
+    except (KeyError, ValueError):
+        max_bytes = DEFAULT_MAX_BYTES
+    return ResponseCache(directory, ttl=ttl, max_bytes=max_bytes)
+
+
+def get_cache() -> Optional[ResponseCache]:
+    """Return the process-wide cache (None when caching is disabled)."""
+    global _cache, _configured
+    if _configured:
+        return _cache
+    with _lock:
+        if not _configured:
+            _cache = _from_env()
+            _configured = True
+        return _cache
+
+
+def configure_cache(
+    directory: Optional[str] = None,
+    ttl: float = DEFAULT_TTL,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+) -> Optional[ResponseCache]:
+    """
+    Replace the process-wide cache.
+
+    Args:
+        directory: Cache directory; "" disables caching.
+                   None re-reads the environment variables.
+        ttl: Seconds an entry may be revalidated.
+        max_bytes: Size bound of the directory.
+
+    Returns:
+        The new cache, or None when disabled.
+    """
+    global _cache, _configured
+    with _lock:
+        if directory is None:
+            _cache = _from_env()
+        elif not directory:
+            _cache = None
+        else:
+            _cache = ResponseCache(directory, ttl=ttl, max_bytes=max_bytes)
+        _configured = True
+        return _cache
@@ -0,0 +1,241 @@
+"""
+Pooled HTTP session registry for Azure DevOps API clients.
+
+Keeps one keep-alive ``requests.Session`` per base host (dev.azure.com,
+vssps.dev.azure.com, vsrm.dev.azure.com, almsearch.dev.azure.com,
+pkgs.dev.azure.com, ...) so consecutive calls reuse TCP+TLS connections
+instead of paying a fresh handshake every time.
+
+Pool settings can be tuned with environment variables or at runtime:
+
+    ADO_HTTP_POOL_SIZE         Max connections kept per host (default 10).
+    ADO_HTTP_POOL_CONNECTIONS  Number of per-host pools to cache (default 10).
+    ADO_HTTP_KEEP_ALIVE        Set to 0/false to send 'Connection: close'.
+    ADO_HTTP_REROUTE           Base URL of a local stand-in such as
+                               _shared.fake_server. Every request is sent
+                               there as <base>/proxy/<original URL>.
+
+New connections report their DNS, TCP connect and TLS handshake times to
+the _shared.metrics record of the request that opened them.
+"""
+
+import atexit
+import http.cookiejar
+import os
+import socket
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from _shared import metrics
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_HEADERS = {
+    "User-Agent": "DevOpsApiClients/7.2 (python-requests)",
+    "Accept": "application/json",
+}
+
+_lock = threading.Lock()
+_sessions: Dict[str, requests.Session] = {}
+_config: Dict[str, object] = {}
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read a positive integer from the environment, falling back to default."""
+    try:
+        value = int(os.environ.get(name, ""))
+    except ValueError:
+        return default
+    return value if value > 0 else default
+
+
+def _default_config() -> Dict[str, object]:
+    """Build the pool configuration from environment variables."""
+    keep_alive = os.environ.get("ADO_HTTP_KEEP_ALIVE", "true").lower()
+    return {
+        "pool_maxsize": _env_int("ADO_HTTP_POOL_SIZE", DEFAULT_POOL_SIZE),
+        "pool_connections": _env_int("ADO_HTTP_POOL_CONNECTIONS", DEFAULT_POOL_CONNECTIONS),
+        "keep_alive": keep_alive not in ("0", "false", "no"),
+        "default_headers": dict(DEFAULT_HEADERS),
+        "reroute": os.environ.get("ADO_HTTP_REROUTE") or None,
+    }
+
+
+class _TimedConnectionMixin:
+    """Splits _new_conn into name resolution and TCP connect time."""
+
+    _socket_time = 0.0
+
+    def _new_conn(self) -> socket.socket:
+        record = metrics.current()
+        if record is None:
+            return super()._new_conn()
+        host = self._dns_host
+        start = time.perf_counter()
+        try:
+            resolved = socket.getaddrinfo(host, self.port, type=socket.SOCK_STREAM)[0][4][0]
+        except OSError:
+            resolved = None
+        resolved_at = time.perf_counter()
+        try:
+            if resolved is None:
+                # Let urllib3 raise its usual name resolution error
+                return super()._new_conn()
+            self._dns_host = resolved
+            try:
+                return super()._new_conn()
+            except Exception:
+                # The first address failed; retry on the name so every address is tried
+                self._dns_host = host
+                return super()._new_conn()
+        finally:
+            self._dns_host = host
+            record.dns += resolved_at - start
+            record.connect += time.perf_counter() - resolved_at
+            self._socket_time = time.perf_counter() - start
+
+
+class _TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    def connect(self) -> None:
+        record = metrics.current()
+        start = time.perf_counter()
+        self._socket_time = 0.0
+        super().connect()
+        if record is not None:
+            record.tls += time.perf_counter() - start - self._socket_time
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class _RerouteAdapter(HTTPAdapter):
+    """Sends each request to <reroute>/proxy/<original URL> instead."""
+
+    def __init__(self, reroute: str, **kwargs: object):
+        self.reroute = reroute.rstrip("/")
+        super().__init__(**kwargs)
+
+    def send(self, request: requests.PreparedRequest, **kwargs: object) -> requests.Response:
+        request.url = f"{self.reroute}/proxy/{request.url}"
+        return super().send(request, **kwargs)
+
+
+def reroute_url() -> Optional[str]:
+    """Base URL requests are rerouted to (ADO_HTTP_REROUTE), or None."""
+    return (_config or _default_config())["reroute"] or None
+
+
+def _new_session(host: str) -> requests.Session:
+    """Create a session with a sized connection pool for a single host."""
+    config = _config or _default_config()
+    session = requests.Session()
+    # Retries are handled by execute_request so the adapter must not retry.
+    pool = {
+        "pool_connections": int(config["pool_connections"]),
+        "pool_maxsize": int(config["pool_maxsize"]),
+        "max_retries": 0,
+    }
+    adapter = _RerouteAdapter(config["reroute"], **pool) if config["reroute"] else HTTPAdapter(**pool)
+    adapter.poolmanager.pool_classes_by_scheme = {
+        "http": _TimedHTTPConnectionPool,
+        "https": _TimedHTTPSConnectionPool,
+    }
+    session.mount(f"https://{host}/", adapter)
+    session.mount(f"http://{host}/", adapter)
+    session.headers.update(config["default_headers"])
+    if not config["keep_alive"]:
+        session.headers["Connection"] = "close"
+    # Sessions are shared between callers that may use different PATs,
+    # so never carry cookies from one call to the next.
+    session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+    return session
+
+
+def configure_sessions(
+    pool_maxsize: Optional[int] = None,
+    pool_connections: Optional[int] = None,
+    keep_alive: Optional[bool] = None,
+    default_headers: Optional[Dict[str, str]] = None,
+    reroute: Optional[str] = None,
+) -> None:
+    """
+    Override the pool settings used for new sessions.
+
+    Existing sessions are closed so the next call to get_session() picks
+    up the new configuration.
+
+    Args:
+        pool_maxsize: Max connections kept open per host.
+        pool_connections: Number of per-host connection pools to cache.
+        keep_alive: False to send 'Connection: close' on every request.
+        default_headers: Headers merged into every request (replaces the
+                         built-in defaults).
+        reroute: Base URL to send every request to as <base>/proxy/<URL>
+                 (see ADO_HTTP_REROUTE); "" turns rerouting off.
+    """
+    global _config
+    with _lock:
+        config = dict(_config or _default_config())
+        if pool_maxsize is not None:
+            config["pool_maxsize"] = pool_maxsize
+        if pool_connections is not None:
+            config["pool_connections"] = pool_connections
+        if keep_alive is not None:
+            config["keep_alive"] = keep_alive
+        if default_headers is not None:
+            config["default_headers"] = dict(default_headers)
+        if reroute is not None:
+            config["reroute"] = reroute or None
+        _config = config
+        _close_all_locked()
+
+
+def get_session(host: str) -> requests.Session:
+    """Return the shared pooled session for a host, creating it on first use."""
+    host = host.lower()
+    session = _sessions.get(host)
+    if session is not None:
+        return session
+    with _lock:
+        session = _sessions.get(host)
+        if session is None:
+            session = _new_session(host)
+            _sessions[host] = session
+        return session
+
+
+def session_for_url(url: str) -> requests.Session:
+    """Return the shared pooled session for the host of a full URL."""
+    return get_session(urlsplit(url).netloc)
+
+
+def _close_all_locked() -> None:
+    """Close and forget every session. Caller must hold _lock."""
+    for session in _sessions.values():
+        session.close()
+    _sessions.clear()
+
+
+def close_sessions() -> None:
+    """Close all pooled sessions (called automatically at interpreter exit)."""
+    with _lock:
+        _close_all_locked()
+
+
+atexit.register(close_sessions)
@@ -5,10 +5,22 @@ API Spec Sync — Detection Script
 Compares upstream Azure DevOps REST API specifications against locally stored
 hashes. Outputs a structured JSON report of detected changes per domain.
 
+Specs are fetched concurrently. Each request sends the ETag / Last-Modified
+recorded at the last sync, so an unchanged spec costs a 304 and no body;
+otherwise the body is hashed (SHA-256) as it streams in. A changed spec is
+diffed against its cached copy operation by operation and schema by schema:
+parameters, required fields, enum values and response shapes, following
+$refs into the definitions. Every changed operation is mapped back to the
+_generator/definitions/*.yaml files that generate it, so only those need
+regenerating:
+
+    python -m _generator.generate -d _generator/definitions/build_get_build.yaml
+
 Usage:
     python sync_check.py                  # Check all domains
     python sync_check.py --domain core    # Check a single domain
     python sync_check.py --update-hashes  # Write new hashes after sync
+    python sync_check.py --workers 8      # Concurrent fetches (default 8)
 
 Exit codes:
     0  — No changes detected (or hashes updated successfully)
@@ -19,17 +31,20 @@ Exit codes:
 import argparse
 import hashlib
 import json
+import re
 import sys
 import urllib.request
 import urllib.error
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 # ---------------------------------------------------------------------------
 # Paths
 # ---------------------------------------------------------------------------
 SCRIPT_DIR = Path(__file__).resolve().parent
+ROOT = SCRIPT_DIR.parents[1]
 HASHES_FILE = SCRIPT_DIR / "last_sync_hashes.json"
 URLS_FILE = SCRIPT_DIR / "upstream_urls.json"
 
@@ -44,6 +59,12 @@ DOMAIN_DIR_MAP = {
     "pipelines": "Pipelines",
 }
 
+DEFAULT_WORKERS = 8
+CHUNK_SIZE = 64 * 1024
+HTTP_METHODS = ("get", "put", "post", "delete", "options", "head", "patch")
+# Operation keys whose change alters the generated client
+OPERATION_KEYS = ("x-ms-docs-override-version", "consumes", "produces")
+
 
 def load_json(path: Path) -> dict:
     """Load a JSON file and return the parsed dict."""
@@ -58,13 +79,41 @@ def save_json(path: Path, data: dict) -> None:
         f.write("\n")
 
 
-def fetch_spec(url: str, timeout: int = 30) -> bytes | None:
-    """Fetch the upstream spec, returning raw bytes or None on failure."""
+def fetch_spec(url: str, timeout: int = 30, etag: str | None = None, last_modified: str | None = None) -> dict | None:
+    """
+    Conditionally fetch the upstream spec, hashing the body as it streams in.
+
+    Returns:
+        {"status": 304, "etag": ..., "last_modified": ...} when the validators
+        still match, {"status": 200, "hash": ..., "body": bytes, "etag": ...,
+        "last_modified": ...} otherwise, or None on failure.
+    """
+    headers = {"User-Agent": "DevOpsApiClients-SyncCheck/1.0"}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
     try:
-        req = urllib.request.Request(url, headers={"User-Agent": "DevOpsApiClients-SyncCheck/1.0"})
+        req = urllib.request.Request(url, headers=headers)
         with urllib.request.urlopen(req, timeout=timeout) as resp:
-            return resp.read()
-    except (urllib.error.URLError, urllib.error.HTTPError, OSError) as exc:
+            digest = hashlib.sha256()
+            chunks = []
+            for chunk in iter(lambda: resp.read(CHUNK_SIZE), b""):
+                digest.update(chunk)
+                chunks.append(chunk)
+            return {
+                "status": resp.status,
+                "hash": digest.hexdigest(),
+                "body": b"".join(chunks),
+                "etag": resp.headers.get("ETag"),
+                "last_modified": resp.headers.get("Last-Modified"),
+            }
+    except urllib.error.HTTPError as exc:
+        if exc.code == 304:
+            return {"status": 304, "etag": etag, "last_modified": last_modified}
+        print(f"WARN: Failed to fetch {url}: {exc}", file=sys.stderr)
+        return None
+    except (urllib.error.URLError, OSError) as exc:
         print(f"WARN: Failed to fetch {url}: {exc}", file=sys.stderr)
         return None
 
@@ -74,6 +123,175 @@ def sha256_hex(data: bytes) -> str:
     return hashlib.sha256(data).hexdigest()
 
 
+# ---------------------------------------------------------------------------
+# Structural diff
+# ---------------------------------------------------------------------------
+def _change(changes: list[dict], location: str, kind: str, detail: str, breaking: bool) -> None:
+    changes.append({"location": location, "kind": kind, "detail": detail, "breaking": breaking})
+
+
+def diff_schema(old: Any, new: Any, location: str, changes: list[dict]) -> None:
+    """
+    Append the structural differences between two schemas to changes.
+
+    Compared: $ref targets, type, format, enum values, required fields,
+    properties, array items, additionalProperties and allOf / anyOf /
+    oneOf members, recursively. Descriptions and examples are ignored.
+    Removed properties or enum values, new required fields and type
+    changes are breaking; additions are not.
+    """
+    if not isinstance(old, dict) or not isinstance(new, dict):
+        if (old is None) != (new is None):
+            _change(changes, location, "schema-added" if old is None else "schema-removed",
+                    "schema added" if old is None else "schema removed", old is not None)
+        return
+
+    if old.get("$ref") != new.get("$ref"):
+        _change(changes, location, "ref", f"{old.get('$ref')} → {new.get('$ref')}", True)
+    for key in ("type", "format"):
+        if old.get(key) != new.get(key):
+            _change(changes, location, key, f"{old.get(key)} → {new.get(key)}", True)
+
+    old_enum, new_enum = old.get("enum"), new.get("enum")
+    if old_enum is not None or new_enum is not None:
+        removed = [v for v in old_enum or [] if v not in (new_enum or [])]
+        added = [v for v in new_enum or [] if v not in (old_enum or [])]
+        if removed:
+            _change(changes, location, "enum-removed", ", ".join(map(str, removed)), True)
+        if added:
+            _change(changes, location, "enum-added", ", ".join(map(str, added)), False)
+
+    old_required, new_required = set(old.get("required") or []), set(new.get("required") or [])
+    for name in sorted(new_required - old_required):
+        _change(changes, f"{location}/properties/{name}", "now-required", name, True)
+    for name in sorted(old_required - new_required):
+        _change(changes, f"{location}/properties/{name}", "now-optional", name, False)
+
+    old_props, new_props = old.get("properties") or {}, new.get("properties") or {}
+    for name in sorted(set(old_props) | set(new_props)):
+        where = f"{location}/properties/{name}"
+        if name not in new_props:
+            _change(changes, where, "property-removed", name, True)
+        elif name not in old_props:
+            _change(changes, where, "property-added", name, False)
+        else:
+            diff_schema(old_props[name], new_props[name], where, changes)
+
+    for key in ("items", "additionalProperties"):
+        if key in old or key in new:
+            diff_schema(old.get(key), new.get(key), f"{location}/{key}", changes)
+    for key in ("allOf", "anyOf", "oneOf"):
+        old_list, new_list = old.get(key) or [], new.get(key) or []
+        for index in range(max(len(old_list), len(new_list))):
+            diff_schema(
+                old_list[index] if index < len(old_list) else None,
+                new_list[index] if index < len(new_list) else None,
+                f"{location}/{key}/{index}", changes,
+            )
+
+
+def _resolve_parameter(spec: dict, param: dict) -> dict:
+    ref = param.get("$ref", "")
+    if ref.startswith("#/parameters/"):
+        return spec.get("parameters", {}).get(ref.rsplit("/", 1)[1], {})
+    return param
+
+
+def _parameter_schema(param: dict) -> dict:
+    """The schema of a body parameter, or the schema keys of any other parameter."""
+    if "schema" in param:
+        return param["schema"]
+    return {key: param[key] for key in ("type", "format", "enum", "items") if key in param}
+
+
+def _parameters(spec: dict, path_item: dict, operation: dict) -> dict:
+    """Effective parameters of an operation, keyed by (in, name)."""
+    params = {}
+    for raw in list(path_item.get("parameters") or []) + list(operation.get("parameters") or []):
+        param = _resolve_parameter(spec, raw)
+        params[(param.get("in"), param.get("name"))] = param
+    return params
+
+
+def _operations(spec: dict) -> dict:
+    """{(METHOD, path): (path_item, operation)} for every operation of a spec."""
+    ops = {}
+    for section in ("paths", "x-ms-paths"):
+        for path, item in (spec.get(section) or {}).items():
+            for method, operation in (item or {}).items():
+                if method in HTTP_METHODS and isinstance(operation, dict):
+                    ops[(method.upper(), path)] = (item, operation)
+    return ops
+
+
+def diff_operation(old_spec: dict, new_spec: dict, old: tuple, new: tuple, location: str) -> list[dict]:
+    """Differences in the parameters, responses and content types of one operation."""
+    changes: list[dict] = []
+    (old_item, old_op), (new_item, new_op) = old, new
+
+    old_params = _parameters(old_spec, old_item, old_op)
+    new_params = _parameters(new_spec, new_item, new_op)
+    for key in sorted(set(old_params) | set(new_params), key=lambda k: (str(k[0]), str(k[1]))):
+        where = f"{location}/parameters/{key[0]}/{key[1]}"
+        if key not in new_params:
+            _change(changes, where, "parameter-removed", key[1], True)
+            continue
+        if key not in old_params:
+            required = bool(new_params[key].get("required"))
+            _change(changes, where, "parameter-added", f"{key[1]} ({'required' if required else 'optional'})", required)
+            continue
+        was, now = bool(old_params[key].get("required")), bool(new_params[key].get("required"))
+        if was != now:
+            _change(changes, where, "now-required" if now else "now-optional", key[1], now)
+        diff_schema(_parameter_schema(old_params[key]), _parameter_schema(new_params[key]), where, changes)
+
+    old_responses, new_responses = old_op.get("responses") or {}, new_op.get("responses") or {}
+    for code in sorted(set(old_responses) | set(new_responses)):
+        where = f"{location}/responses/{code}"
+        if code not in new_responses:
+            _change(changes, where, "response-removed", code, True)
+        elif code not in old_responses:
+            _change(changes, where, "response-added", code, False)
+        else:
+            diff_schema((old_responses[code] or {}).get("schema"), (new_responses[code] or {}).get("schema"), where, changes)
+
+    for key in OPERATION_KEYS:
+        if old_op.get(key) != new_op.get(key):
+            _change(changes, f"{location}/{key}", key, f"{old_op.get(key)} → {new_op.get(key)}", False)
+    return changes
+
+
+def _refs(node: Any) -> set:
+    """Names of the definitions a schema (or any spec fragment) references directly."""
+    found = set()
+    stack = [node]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            ref = item.get("$ref")
+            if isinstance(ref, str) and ref.startswith("#/definitions/"):
+                found.add(ref.rsplit("/", 1)[1])
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return found
+
+
+def _reaches(spec: dict, roots: set, targets: set) -> bool:
+    """True when a definition in targets is reachable from roots through $refs."""
+    definitions = spec.get("definitions") or {}
+    seen, stack = set(), list(roots)
+    while stack:
+        name = stack.pop()
+        if name in targets:
+            return True
+        if name in seen:
+            continue
+        seen.add(name)
+        stack.extend(_refs(definitions.get(name)))
+    return False
+
+
 def classify_changes(old_spec: dict | None, new_spec: dict) -> dict:
     """
     Compare two parsed spec dicts and classify changes.
@@ -98,6 +316,9 @@ def classify_changes(old_spec: dict | None, new_spec: dict) -> dict:
             "removed_paths": [],
             "added_definitions": defs,
             "removed_definitions": [],
+            "type_changes": [],
+            "changes": [],
+            "affected_operations": [f"{method} {path}" for method, path in sorted(_operations(new_spec), key=lambda k: (k[1], k[0]))],
             "summary": f"Initial sync. {len(paths)} paths, {len(defs)} definitions catalogued.",
         }
 
@@ -111,20 +332,42 @@ def classify_changes(old_spec: dict | None, new_spec: dict) -> dict:
     added_defs = sorted(new_defs - old_defs)
     removed_defs = sorted(old_defs - new_defs)
 
-    # Check for type changes in shared definitions
-    type_changes = []
-    for defn in old_defs & new_defs:
-        old_props = old_spec.get("definitions", {}).get(defn, {}).get("properties", {})
-        new_props = new_spec.get("definitions", {}).get(defn, {}).get("properties", {})
-        for prop in set(old_props.keys()) & set(new_props.keys()):
-            old_type = old_props[prop].get("type")
-            new_type = new_props[prop].get("type")
-            if old_type and new_type and old_type != new_type:
-                type_changes.append(f"{defn}.{prop}: {old_type} → {new_type}")
-
-    is_breaking = bool(removed_paths or removed_defs or type_changes)
-
-    if not added_paths and not removed_paths and not added_defs and not removed_defs and not type_changes:
+    # Recursive diff of every shared definition and operation
+    changes: list[dict] = []
+    changed_defs = set()
+    for defn in sorted(old_defs & new_defs):
+        before = len(changes)
+        diff_schema(old_spec["definitions"][defn], new_spec["definitions"][defn], f"definitions/{defn}", changes)
+        if len(changes) > before:
+            changed_defs.add(defn)
+
+    old_ops, new_ops = _operations(old_spec), _operations(new_spec)
+    affected = set()
+    for key in sorted(set(old_ops) | set(new_ops)):
+        method, path = key
+        location = f"paths{path}/{method.lower()}"
+        if key not in new_ops:
+            _change(changes, location, "operation-removed", f"{method} {path}", True)
+            affected.add(key)
+        elif key not in old_ops:
+            _change(changes, location, "operation-added", f"{method} {path}", False)
+            affected.add(key)
+        else:
+            op_changes = diff_operation(old_spec, new_spec, old_ops[key], new_ops[key], location)
+            changes.extend(op_changes)
+            # Also affected: operations whose schemas reach a changed definition
+            if op_changes or _reaches(new_spec, _refs(new_ops[key]), changed_defs | set(removed_defs)):
+                affected.add(key)
+
+    type_changes = [
+        f"{c['location'].replace('definitions/', '', 1).replace('/properties/', '.')}: {c['detail']}"
+        for c in changes if c["kind"] == "type" and c["location"].startswith("definitions/")
+    ]
+    affected_operations = [f"{method} {path}" for method, path in sorted(affected, key=lambda k: (k[1], k[0]))]
+    structural = [c for c in changes if not c["kind"].startswith("operation-")]
+    is_breaking = bool(removed_paths or removed_defs or any(c["breaking"] for c in changes))
+
+    if not added_paths and not removed_paths and not added_defs and not removed_defs and not changes:
         # Content changed but paths/defs are the same — likely description edits
         return {
             "change_type": "non-breaking",
@@ -133,6 +376,8 @@ def classify_changes(old_spec: dict | None, new_spec: dict) -> dict:
             "added_definitions": [],
             "removed_definitions": [],
             "type_changes": [],
+            "changes": [],
+            "affected_operations": [],
             "summary": "Spec content changed (descriptions, examples, or metadata). No structural impact.",
         }
 
@@ -147,6 +392,10 @@ def classify_changes(old_spec: dict | None, new_spec: dict) -> dict:
         parts.append(f"-{len(removed_defs)} definitions")
     if type_changes:
         parts.append(f"{len(type_changes)} type changes")
+    if structural:
+        parts.append(f"{len(structural)} schema changes ({sum(c['breaking'] for c in structural)} breaking)")
+    if affected_operations:
+        parts.append(f"{len(affected_operations)} operations affected")
 
     return {
         "change_type": "breaking" if is_breaking else "non-breaking",
@@ -155,31 +404,93 @@ def classify_changes(old_spec: dict | None, new_spec: dict) -> dict:
         "added_definitions": added_defs,
         "removed_definitions": removed_defs,
         "type_changes": type_changes,
+        "changes": changes,
+        "affected_operations": affected_operations,
         "summary": "; ".join(parts),
     }
 
 
-def check_domain(domain: str, url: str, stored_hash: str | None) -> dict | None:
+def _path_key(method: str, path: str) -> tuple:
     """
-    Check a single domain for upstream changes.
+    (METHOD, path) with parameter names blanked and the organization /
+    project / team prefix dropped, so spec paths and definition url_paths
+    compare equal.
+    """
+    segments = [seg for seg in path.strip("/").split("/") if seg]
+    if "_apis" in segments:
+        segments = segments[segments.index("_apis"):]
+    else:
+        while segments and segments[0].startswith("{"):
+            segments.pop(0)
+    normalized = "/".join(re.sub(r"\{[^}]*\}", "{}", seg).lower() for seg in segments)
+    return method.upper(), normalized
+
+
+def definitions_for(operations: Iterable[str]) -> list[str] | None:
+    """
+    Map "METHOD /spec/path" operations to the _generator/definitions files
+    that generate them (paths relative to the repo root).
 
-    Returns a delta report dict, or None if no changes / fetch failed.
+    Returns None when the generator's index cannot be loaded (e.g. PyYAML
+    is not installed).
     """
-    raw = fetch_spec(url)
-    if raw is None:
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+    try:
+        from _generator.index import definition_files, load_index
+    except ImportError as exc:
+        print(f"WARN: Cannot map changes to definitions: {exc}", file=sys.stderr)
         return None
+    wanted = {_path_key(*operation.split(" ", 1)) for operation in operations}
+    files = definition_files()
+    matched = {
+        files[key] for key, op in load_index().items()
+        if _path_key(op.http_method, op.url_path) in wanted
+    }
+    return sorted(path.relative_to(ROOT).as_posix() for path in matched)
 
-    current_hash = sha256_hex(raw)
 
+def check_domain(domain: str, url: str, stored: dict | None) -> dict:
+    """
+    Check a single domain for upstream changes.
+
+    Args:
+        stored: The domain's entry in last_sync_hashes.json (hash and the
+                ETag / Last-Modified validators of that version), if any.
+
+    Returns:
+        {"domain", "status", "etag", "last_modified", "delta"} where status
+        is "not-modified" (304), "in-sync" (same hash), "changed" or
+        "failed", and delta is the change report for "changed".
+    """
+    stored = stored or {}
+    stored_hash = stored.get("hash")
+    result = {"domain": domain, "status": "failed", "etag": None, "last_modified": None, "delta": None}
+    # Validators only describe the stored version while it has a hash
+    fetched = fetch_spec(
+        url,
+        etag=stored.get("etag") if stored_hash else None,
+        last_modified=stored.get("last_modified") if stored_hash else None,
+    )
+    if fetched is None:
+        return result
+    result.update(etag=fetched["etag"], last_modified=fetched["last_modified"])
+    if fetched["status"] == 304:
+        result["status"] = "not-modified"
+        return result
+
+    current_hash = fetched["hash"]
     if current_hash == stored_hash:
-        return None  # In sync
+        result["status"] = "in-sync"
+        return result
+    result["status"] = "changed"
 
     # Parse spec for classification
     try:
-        new_spec = json.loads(raw)
+        new_spec = json.loads(fetched["body"])
     except json.JSONDecodeError:
         print(f"WARN: Upstream spec for '{domain}' is not valid JSON. Treating as opaque change.", file=sys.stderr)
-        return {
+        result["delta"] = {
             "domain": domain,
             "previous_hash": stored_hash,
             "new_hash": current_hash,
@@ -191,6 +502,7 @@ def check_domain(domain: str, url: str, stored_hash: str | None) -> dict | None:
             "detected_at": datetime.now(timezone.utc).isoformat(),
             "spec_url": url,
         }
+        return result
 
     # Try to load the old spec for diff (if we have a cached copy)
     old_spec = None
@@ -209,37 +521,68 @@ def check_domain(domain: str, url: str, stored_hash: str | None) -> dict | None:
     except OSError as exc:
         print(f"WARN: Could not cache spec for '{domain}': {exc}", file=sys.stderr)
 
-    return {
+    result["delta"] = {
         "domain": domain,
         "local_dir": DOMAIN_DIR_MAP.get(domain, domain),
         "previous_hash": stored_hash,
         "new_hash": current_hash,
         "change_type": classification["change_type"],
         "classification": classification,
+        "affected_definitions": definitions_for(classification["affected_operations"]),
         "detected_at": datetime.now(timezone.utc).isoformat(),
         "spec_url": url,
     }
+    return result
+
 
+def check_all(domains: list[str], urls: dict, hashes: dict, workers: int = DEFAULT_WORKERS) -> list[dict]:
+    """check_domain() for every domain with a URL, concurrently; results in domain order."""
+    jobs = []
+    for domain in domains:
+        url = urls.get(domain)
+        if not url:
+            print(f"WARN: No upstream URL configured for domain '{domain}'", file=sys.stderr)
+            continue
+        jobs.append((domain, url, hashes.get(domain)))
+    if not jobs:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(jobs)))) as pool:
+        return list(pool.map(lambda job: check_domain(*job), jobs))
 
-def update_hashes(deltas: list[dict]) -> None:
-    """Persist new hashes for domains that were successfully synced."""
+
+def update_hashes(results: list[dict]) -> None:
+    """
+    Persist new hashes for domains that were successfully synced.
+
+    Changed domains get their new hash and validators. Unchanged domains
+    that were fetched in full get their validators, so the next check can
+    be answered with a 304.
+    """
     hashes = load_json(HASHES_FILE)
     now = datetime.now(timezone.utc).isoformat()
 
-    for delta in deltas:
-        domain = delta["domain"]
-        if domain in hashes:
-            hashes[domain]["hash"] = delta["new_hash"]
-            hashes[domain]["synced_at"] = now
+    updated = []
+    for result in results:
+        domain, delta = result["domain"], result["delta"]
+        if result["status"] == "changed":
+            entry = hashes.setdefault(domain, {"spec_url": delta["spec_url"]})
+            entry["hash"] = delta["new_hash"]
+            entry["synced_at"] = now
+        elif result["status"] == "in-sync" and domain in hashes:
+            entry = hashes[domain]
         else:
-            hashes[domain] = {
-                "hash": delta["new_hash"],
-                "synced_at": now,
-                "spec_url": delta["spec_url"],
-            }
-
+            continue
+        for key in ("etag", "last_modified"):
+            if result[key]:
+                entry[key] = result[key]
+            else:
+                entry.pop(key, None)
+        updated.append(domain)
+
+    if not updated:
+        return
     save_json(HASHES_FILE, hashes)
-    print(f"Updated hashes for: {', '.join(d['domain'] for d in deltas)}", file=sys.stderr)
+    print(f"Updated hashes for: {', '.join(updated)}", file=sys.stderr)
 
 
 def main() -> int:
@@ -255,6 +598,12 @@ def main() -> int:
         action="store_true",
         help="Write new hashes to last_sync_hashes.json (run after successful sync)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Specs fetched concurrently (default: {DEFAULT_WORKERS})",
+    )
     args = parser.parse_args()
 
     urls = load_json(URLS_FILE)
@@ -262,33 +611,31 @@ def main() -> int:
 
     domains = list(urls.keys()) if args.domain == "all" else [args.domain]
 
+    results = check_all(domains, urls, hashes, args.workers)
     deltas = []
-    for domain in domains:
-        url = urls.get(domain)
-        if not url:
-            print(f"WARN: No upstream URL configured for domain '{domain}'", file=sys.stderr)
-            continue
-
-        stored = hashes.get(domain, {}).get("hash")
-        delta = check_domain(domain, url, stored)
-
+    for result in results:
+        delta = result["delta"]
         if delta:
             deltas.append(delta)
             print(
-                f"  CHANGED  {domain:8s}  {delta['change_type']:13s}  {delta['classification']['summary']}",
+                f"  CHANGED  {result['domain']:8s}  {delta['change_type']:13s}  {delta['classification']['summary']}",
                 file=sys.stderr,
             )
+        elif result["status"] == "not-modified":
+            print(f"  IN-SYNC  {result['domain']}  (304 not modified)", file=sys.stderr)
+        elif result["status"] == "in-sync":
+            print(f"  IN-SYNC  {result['domain']}", file=sys.stderr)
         else:
-            print(f"  IN-SYNC  {domain}", file=sys.stderr)
+            print(f"  FAILED   {result['domain']}", file=sys.stderr)
+
+    if args.update_hashes:
+        update_hashes(results)
 
     if not deltas:
         report = {"status": "in-sync", "domains_checked": domains, "deltas": []}
         print(json.dumps(report, indent=2))
         return 0
 
-    if args.update_hashes:
-        update_hashes(deltas)
-
     report = {
         "status": "changes-detected",
         "domains_checked": domains,
@@ -0,0 +1 @@
+# _shared/tests/__init__.py
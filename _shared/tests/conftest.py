@@ -0,0 +1,20 @@
+# _shared/tests/conftest.py
+import pytest
+
+from _shared import rate_limit, response_cache
+
+
+@pytest.fixture(autouse=True)
+def _no_rate_limit():
+    """Disable the process-wide rate limiter so pacing never leaks between tests."""
+    rate_limit.configure_rate_limit(enabled=False)
+    yield
+    rate_limit.configure_rate_limit(enabled=False)
+
+
+@pytest.fixture(autouse=True)
+def _no_response_cache():
+    """Disable the response cache unless a test configures its own."""
+    response_cache.configure_cache("")
+    yield
+    response_cache.configure_cache("")
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Offline unit tests for _shared/async_http_client.py
+
+Validates:
+  - Successful request through AsyncAdoClient
+  - 429 retry honouring Retry-After, as seconds or an HTTP-date
+  - Error responses raise typed exceptions
+  - Concurrency cap enforced by the semaphore
+  - Streaming content with astream_to
+  - 304 Not Modified answered from the response cache
+  - Generated <operation>_async functions are importable without env vars
+"""
+
+import asyncio
+import importlib
+import time
+from email.utils import formatdate
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from _shared import async_http_client, response_cache
+from _shared.async_http_client import AsyncAdoClient, astream_to
+from _shared.errors import AdoNotFound
+
+
+def _client_with(handler, **kwargs) -> AsyncAdoClient:
+    """Build an AsyncAdoClient whose transport is the given mock handler."""
+    client = AsyncAdoClient("testorg", "fakepat1234567890", **kwargs)
+    client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+class TestAsyncRequest:
+    """Validate request execution and retry semantics."""
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_not_modified_served_from_cache(self, tmp_path):
+        response_cache.configure_cache(str(tmp_path))
+        seen = []
+
+        def handler(request):
+            seen.append(request.headers.get("If-None-Match"))
+            if len(seen) == 1:
+                return httpx.Response(200, json={"id": 1}, headers={"ETag": '"v1"'})
+            return httpx.Response(304)
+
+        async def run():
+            async with _client_with(handler) as client:
+                url = "https://dev.azure.com/testorg/_apis/projects"
+                return [await client.request("GET", url) for _ in range(2)]
+
+        first, second = asyncio.run(run())
+        assert second.status_code == 200
+        assert second.json() == first.json() == {"id": 1}
+        assert seen == [None, '"v1"']
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_success_returns_response(self):
+        def handler(request):
+            assert request.headers["Authorization"].startswith("Basic ")
+            return httpx.Response(200, json={"count": 1, "value": [{"id": 1}]})
+
+        async def run():
+            async with _client_with(handler) as client:
+                return await client.request("GET", "https://dev.azure.com/testorg/_apis/projects")
+
+        response = asyncio.run(run())
+        assert response.json()["count"] == 1
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_429_retries_after_delay(self, monkeypatch):
+        calls = []
+        sleeps = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                return httpx.Response(429, headers={"Retry-After": "3"})
+            return httpx.Response(200, json={"id": 1})
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+
+        monkeypatch.setattr(async_http_client.asyncio, "sleep", fake_sleep)
+
+        async def run():
+            async with _client_with(handler) as client:
+                return await client.request("GET", "https://dev.azure.com/testorg/_apis/x")
+
+        response = asyncio.run(run())
+        assert response.status_code == 200
+        assert len(calls) == 2
+        assert sleeps == [3]
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_429_retry_after_http_date(self, monkeypatch):
+        calls = []
+        sleeps = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                return httpx.Response(429, headers={"Retry-After": formatdate(time.time() + 30, usegmt=True)})
+            return httpx.Response(200, json={"id": 1})
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+
+        monkeypatch.setattr(async_http_client.asyncio, "sleep", fake_sleep)
+
+        async def run():
+            async with _client_with(handler) as client:
+                return await client.request("GET", "https://dev.azure.com/testorg/_apis/x")
+
+        response = asyncio.run(run())
+        assert response.status_code == 200
+        assert 29 <= sleeps[0] <= 31
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_404_raises_not_found(self):
+        def handler(request):
+            return httpx.Response(404, json={"message": "not found"})
+
+        async def run():
+            async with _client_with(handler) as client:
+                await client.request("GET", "https://dev.azure.com/testorg/_apis/x")
+
+        with pytest.raises(AdoNotFound) as excinfo:
+            asyncio.run(run())
+        assert excinfo.value.status == 404
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_concurrency_is_capped(self):
+        in_flight = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json={})
+
+        async def run():
+            async with _client_with(handler, max_concurrency=3) as client:
+                await asyncio.gather(*(
+                    client.request("GET", f"https://dev.azure.com/testorg/_apis/x/{i}")
+                    for i in range(12)
+                ))
+
+        asyncio.run(run())
+        assert peak == 3
+
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_stream_to_file(self, tmp_path):
+        payload = b"PK" + bytes(5000)
+
+        def handler(request):
+            assert request.headers["Accept"] == "application/zip"
+            return httpx.Response(200, content=payload)
+
+        async def run():
+            async with _client_with(handler) as client:
+                response = await client.request(
+                    "GET", "https://dev.azure.com/testorg/_apis/x", stream=True, accept="application/zip",
+                )
+                return await astream_to(response, str(tmp_path / "out.zip"))
+
+        assert asyncio.run(run()) == len(payload)
+        assert (tmp_path / "out.zip").read_bytes() == payload
+
+
+class TestGeneratedAsyncFunction:
+    """Validate a generated operation exposes an importable async variant."""
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_get_builds_async(self, monkeypatch):
+        for var in ("AZURE_DEVOPS_ORG", "AZURE_DEVOPS_PAT", "PROJECT_ID", "BUILD_ID"):
+            monkeypatch.delenv(var, raising=False)
+        module = importlib.import_module("Build.Builds.get_builds")
+
+        def handler(request):
+            assert str(request.url) == (
+                "https://dev.azure.com/testorg/myproj/_apis/build/builds/42?api-version=7.2"
+            )
+            return httpx.Response(200, json={"id": 42, "agentSpecification": None})
+
+        async def run():
+            async with _client_with(handler) as client:
+                return await module.get_builds_async(client, "myproj", "42")
+
+        assert asyncio.run(run())["id"] == 42
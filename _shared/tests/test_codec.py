@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Offline unit tests for _shared/codec.py
+
+Validates:
+  - Every installed backend parses and writes the same documents
+  - Byte-order marks and integers wider than 64 bits fall back to the standard library
+  - Forcing a missing or unknown backend raises AdoConfigError
+  - write_json keeps its output after earlier text output on the same stream
+"""
+
+import io
+import json
+
+import pytest
+
+from _shared import codec
+from _shared.errors import AdoConfigError
+
+DOC = {"id": 1, "name": "Ünïcode build", "tags": ["a", "b"], "nested": {"ok": True, "none": None}, "ratio": 0.5}
+
+
+def _installed():
+    return ["json"] + [name for name in ("orjson", "ujson") if getattr(codec, name) is not None]
+
+
+@pytest.fixture(params=_installed())
+def backend(request):
+    previous = codec.get_codec()
+    codec.configure_codec(request.param)
+    yield request.param
+    codec.configure_codec(previous)
+
+
+class TestBackends:
+    """Validate every installed backend against the standard library."""
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_round_trip(self, backend):
+        raw = json.dumps(DOC).encode("utf-8")
+        assert codec.loads(raw) == DOC
+        assert codec.loads(raw.decode("utf-8")) == DOC
+        assert codec.loads(memoryview(raw)) == DOC
+        assert json.loads(codec.dumpb(DOC)) == DOC
+        assert codec.dumps(DOC, indent=True) == json.dumps(DOC, indent=2, ensure_ascii=False)
+        assert codec.dumps({"a": [1, 2]}) == '{"a":[1,2]}'
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_fallbacks(self, backend):
+        assert codec.loads(b"\xef\xbb\xbf" + b'{"id": 1}') == {"id": 1}
+        assert codec.loads(codec.dumpb({"big": 2 ** 70})) == {"big": 2 ** 70}
+        assert codec.dumps({"when": object}, default=lambda v: "obj") == '{"when":"obj"}'
+        with pytest.raises(json.JSONDecodeError):
+            codec.loads(b"<html>")
+
+
+class TestConfiguration:
+    """Validate backend selection."""
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_missing_backends(self, monkeypatch):
+        monkeypatch.setattr(codec, "_backend", codec.get_codec())
+        monkeypatch.setattr(codec, "orjson", None)
+        monkeypatch.setattr(codec, "ujson", None)
+        with pytest.raises(AdoConfigError, match="pip install orjson"):
+            codec.configure_codec("orjson")
+        with pytest.raises(AdoConfigError, match="Unknown JSON codec"):
+            codec.configure_codec("simdjson")
+        assert codec.configure_codec("auto") == "json"
+
+
+class TestWriteJson:
+    """Validate writing to stdout-like streams."""
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_keeps_order_after_text(self):
+        buffer = io.BytesIO()
+        stream = io.TextIOWrapper(buffer, encoding="utf-8")
+        stream.write("Total: 1\n")
+        codec.write_json({"id": 1}, stream, indent=False)
+        stream.flush()
+        assert buffer.getvalue() == b'Total: 1\n{"id":1}\n'
+
+        text = io.StringIO()
+        codec.write_json({"id": 1}, text)
+        assert text.getvalue() == '{\n  "id": 1\n}\n'
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Offline unit tests for _shared/daemon.py
+
+Validates:
+  - /health reports the loaded registry
+  - /proxy/<url> forwards method, auth and body, and mirrors the response
+  - Upstream errors keep their status code
+  - Non Azure DevOps hosts are refused
+  - /run executes a registry operation with the caller's PAT
+"""
+
+import base64
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+import responses
+
+from _shared import daemon
+
+AUTH = "Basic " + base64.b64encode(b":fakepat1234567890").decode("ascii")
+
+
+@pytest.fixture
+def daemon_url():
+    server = daemon.serve(port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _call(url, method="GET", body=None, headers=None):
+    """Send a request to the daemon with urllib (not intercepted by responses)."""
+    data = json.dumps(body).encode("utf-8") if body is not None else None
+    request = urllib.request.Request(url, data=data, method=method, headers=dict(headers or {}, Authorization=AUTH))
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return response.status, json.loads(response.read() or b"null")
+    except urllib.error.HTTPError as exc:
+        return exc.code, json.loads(exc.read() or b"null")
+
+
+class TestProxy:
+    """Validate request forwarding."""
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_health(self, daemon_url):
+        status, data = _call(f"{daemon_url}/health")
+        assert status == 200
+        assert data["ok"] and data["operations"] > 1000
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    @responses.activate
+    def test_forwards_request(self, daemon_url):
+        upstream = "https://dev.azure.com/testorg/myproj/_apis/wit/wiql?api-version=7.2"
+        responses.add(responses.POST, upstream, json={"workItems": [{"id": 1}]})
+
+        status, data = _call(f"{daemon_url}/proxy/{upstream}", "POST", {"query": "SELECT [System.Id] FROM WorkItems"})
+
+        assert status == 200
+        assert data == {"workItems": [{"id": 1}]}
+        sent = responses.calls[0].request
+        assert sent.headers["Authorization"] == AUTH
+        assert json.loads(sent.body) == {"query": "SELECT [System.Id] FROM WorkItems"}
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    @responses.activate
+    def test_mirrors_error_status(self, daemon_url):
+        upstream = "https://dev.azure.com/testorg/_apis/projects/missing?api-version=7.2"
+        responses.add(responses.GET, upstream, json={"message": "Project missing not found"}, status=404)
+
+        status, data = _call(f"{daemon_url}/proxy/{upstream}")
+
+        assert status == 404
+        assert data["message"] == "Project missing not found"
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_refuses_other_hosts(self, daemon_url):
+        status, _ = _call(f"{daemon_url}/proxy/https://example.com/steal")
+        assert status == 403
+
+
+class TestRun:
+    """Validate registry operations run inside the daemon."""
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    @responses.activate
+    def test_run_operation(self, daemon_url):
+        responses.add(responses.GET, "https://dev.azure.com/testorg/_apis/projects", json={"count": 1, "value": [{"name": "p1"}]})
+
+        status, record = _call(f"{daemon_url}/run", "POST", {
+            "organization": "testorg", "operation": "Core/Projects/list_projects",
+        })
+
+        assert status == 200
+        assert record["ok"] and record["result"]["value"] == [{"name": "p1"}]
+        assert responses.calls[0].request.headers["Authorization"] == AUTH
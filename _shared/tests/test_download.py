@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Offline unit tests for _shared/download.py
+
+Validates:
+  - Parallel Range segments reassemble into the original content
+  - An interrupted download resumes from its checkpoints, only with a matching validator
+  - A dropped segment is retried from its checkpoint
+  - Size and hash verification
+  - Single-stream fallback when the server ignores Range or hides the total size
+  - Empty resources (416 with bytes */0) download as an empty file
+  - Generated package download operations use the ranged engine
+"""
+
+import hashlib
+import importlib
+import json
+import re
+import threading
+
+import pytest
+import requests
+import responses
+
+from _shared import fake_server, session_pool
+from _shared.download import PART_SUFFIX, STATE_SUFFIX, download_file
+from _shared.errors import AdoError
+from _shared.fake_server import FakeConfig
+from _shared.http_client import AdoClient
+
+URL = "https://pkgs.dev.azure.com/testorg/_apis/packaging/feeds/f/nuget/packages/p/versions/1.0/content?api-version=7.2"
+CONTENT = bytes(range(256)) * 4
+PROJECT_URL = URL.replace("testorg/_apis", "testorg/myproj/_apis")
+
+
+def _client() -> AdoClient:
+    return AdoClient("testorg", "fakepat1234567890")
+
+
+def _ranged(content: bytes, ranges_seen: list, fail_first_at=None):
+    """responses callback serving byte ranges of content."""
+    def callback(request):
+        first, last = map(int, re.match(r"bytes=(\d+)-(\d+)", request.headers["Range"]).groups())
+        if fail_first_at is not None and first == fail_first_at and fail_first_at not in ranges_seen:
+            ranges_seen.append(fail_first_at)
+            return requests.exceptions.ConnectionError("connection reset")
+        ranges_seen.append((first, last))
+        headers = {"Content-Range": f"bytes {first}-{last}/{len(content)}", "ETag": '"v1"'}
+        return 206, headers, content[first:last + 1]
+    return callback
+
+
+class TestRangedDownload:
+    """Validate segmented, resumable downloads."""
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    @responses.activate
+    def test_segments_reassemble(self, tmp_path):
+        seen = []
+        responses.add_callback(responses.GET, URL.split("?")[0], callback=_ranged(CONTENT, seen))
+        target = tmp_path / "pkg.nupkg"
+
+        written = download_file(_client(), URL, str(target), segments=4, min_segment=100)
+
+        assert written == len(CONTENT)
+        assert target.read_bytes() == CONTENT
+        assert seen[0] == (0, 0)
+        assert sorted(seen[1:]) == [(0, 255), (256, 511), (512, 767), (768, 1023)]
+        assert not (tmp_path / ("pkg.nupkg" + PART_SUFFIX)).exists()
+        assert not (tmp_path / ("pkg.nupkg" + STATE_SUFFIX)).exists()
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    @responses.activate
+    def test_resumes_from_checkpoint(self, tmp_path):
+        target = tmp_path / "pkg.nupkg"
+        part = tmp_path / ("pkg.nupkg" + PART_SUFFIX)
+        part.write_bytes(CONTENT[:600] + b"\0" * (len(CONTENT) - 600))
+        (tmp_path / ("pkg.nupkg" + STATE_SUFFIX)).write_text(json.dumps({
+            "url": URL, "size": len(CONTENT), "etag": '"v1"',
+            "segments": [{"start": 0, "end": 511, "done": 512}, {"start": 512, "end": 1023, "done": 88}],
+        }))
+        seen = []
+        responses.add_callback(responses.GET, URL.split("?")[0], callback=_ranged(CONTENT, seen))
+
+        download_file(_client(), URL, str(target))
+
+        assert target.read_bytes() == CONTENT
+        assert seen == [(0, 0), (600, 1023)]
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    @responses.activate
+    def test_restarts_without_validator(self, tmp_path):
+        target = tmp_path / "pkg.nupkg"
+        part = tmp_path / ("pkg.nupkg" + PART_SUFFIX)
+        part.write_bytes(b"\xff" * len(CONTENT))
+        (tmp_path / ("pkg.nupkg" + STATE_SUFFIX)).write_text(json.dumps({
+            "url": URL, "size": len(CONTENT), "etag": None,
+            "segments": [{"start": 0, "end": 1023, "done": 600}],
+        }))
+
+        def callback(request):
+            first, last = map(int, re.match(r"bytes=(\d+)-(\d+)", request.headers["Range"]).groups())
+            seen.append((first, last))
+            return 206, {"Content-Range": f"bytes {first}-{last}/{len(CONTENT)}"}, CONTENT[first:last + 1]
+
+        seen = []
+        responses.add_callback(responses.GET, URL.split("?")[0], callback=callback)
+
+        download_file(_client(), URL, str(target))
+
+        assert target.read_bytes() == CONTENT
+        assert seen == [(0, 0), (0, 1023)]
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    @responses.activate
+    def test_dropped_segment_is_retried(self, tmp_path):
+        seen = []
+        responses.add_callback(responses.GET, URL.split("?")[0], callback=_ranged(CONTENT, seen, fail_first_at=512))
+        target = tmp_path / "pkg.nupkg"
+
+        download_file(_client(), URL, str(target), segments=2, min_segment=100)
+
+        assert target.read_bytes() == CONTENT
+        assert seen.count((512, 1023)) == 1
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    @responses.activate
+    def test_hash_verified(self, tmp_path):
+        responses.add_callback(responses.GET, URL.split("?")[0], callback=_ranged(CONTENT, []))
+        target = tmp_path / "pkg.nupkg"
+        digest = hashlib.sha256(CONTENT).hexdigest()
+
+        assert download_file(_client(), URL, str(target), expected_hash=digest) == len(CONTENT)
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    @responses.activate
+    def test_hash_mismatch_discards_part(self, tmp_path):
+        responses.add_callback(responses.GET, URL.split("?")[0], callback=_ranged(CONTENT, []))
+        target = tmp_path / "pkg.nupkg"
+
+        with pytest.raises(AdoError, match="sha256 mismatch"):
+            download_file(_client(), URL, str(target), expected_hash="0" * 64)
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestFallback:
+    """Validate servers without Range support."""
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    @responses.activate
+    def test_single_stream_when_range_ignored(self, tmp_path):
+        responses.add(responses.GET, URL.split("?")[0], body=CONTENT, status=200)
+        target = tmp_path / "pkg.nupkg"
+
+        assert download_file(_client(), URL, str(target), expected_size=len(CONTENT)) == len(CONTENT)
+        assert target.read_bytes() == CONTENT
+        assert len(responses.calls) == 1
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    @responses.activate
+    def test_single_stream_when_total_unknown(self, tmp_path):
+        def callback(request):
+            if "Range" in request.headers:
+                return 206, {"Content-Range": "bytes 0-0/*"}, CONTENT[:1]
+            return 200, {}, CONTENT
+
+        responses.add_callback(responses.GET, URL.split("?")[0], callback=callback)
+        target = tmp_path / "pkg.nupkg"
+
+        assert download_file(_client(), URL, str(target)) == len(CONTENT)
+        assert target.read_bytes() == CONTENT
+        assert "Range" not in responses.calls[1].request.headers
+
+
+class TestEmptyContent:
+    """Validate zero-length resources against the fake server."""
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_empty_resource_truncates_destination(self, tmp_path):
+        target = tmp_path / "pkg.nupkg"
+        target.write_bytes(b"stale")
+        server = fake_server.serve(FakeConfig(content_size=0), port=0)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        session_pool.configure_sessions(reroute=f"http://127.0.0.1:{server.server_address[1]}")
+        try:
+            written = download_file(_client(), PROJECT_URL, str(target), expected_size=0)
+        finally:
+            session_pool.configure_sessions(reroute="")
+            server.shutdown()
+            server.server_close()
+
+        assert written == 0
+        assert target.read_bytes() == b""
+        assert not (tmp_path / ("pkg.nupkg" + PART_SUFFIX)).exists()
+        assert not (tmp_path / ("pkg.nupkg" + STATE_SUFFIX)).exists()
+
+
+class TestGeneratedDownload:
+    """Validate package content operations use download_file."""
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    @responses.activate
+    def test_nuget_download_package(self, tmp_path):
+        module = importlib.import_module("ArtifactsPackageTypes.Nuget.get_download_package")
+        responses.add_callback(
+            responses.GET,
+            re.compile(r"https://pkgs\.dev\.azure\.com/testorg/myproj/_apis/packaging/.*/content"),
+            callback=_ranged(CONTENT, []),
+        )
+        target = tmp_path / "pkg.nupkg"
+
+        written = module.get_download_package(_client(), "myproj", "feed", "pkg", "1.0", destination=str(target))
+
+        assert written == len(CONTENT)
+        assert target.read_bytes() == CONTENT
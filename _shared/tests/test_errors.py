@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Offline unit tests for _shared/errors.py and _shared/cli.py
+
+Validates:
+  - execute_request raises the AdoError subclass for each status class
+  - Exceptions carry status, body, URL, timing and Retry-After
+  - Retry-After as seconds or an HTTP-date, with backoff when unparseable
+  - Transport failures raise AdoRequestError
+  - run_cli translates errors into exit codes without a traceback
+"""
+
+import time
+from email.utils import formatdate
+
+import pytest
+import requests
+import responses
+
+from _shared import http_client
+from _shared.auth import get_common_env
+from _shared.cli import run_cli
+from _shared.errors import (
+    AdoAuthError,
+    AdoConfigError,
+    AdoError,
+    AdoNotFound,
+    AdoRequestError,
+    AdoServerError,
+    AdoThrottled,
+    parse_retry_after,
+)
+from _shared.http_client import execute_request
+
+URL = "https://dev.azure.com/testorg/_apis/projects?api-version=7.2"
+HEADERS = {"Authorization": "Basic fake"}
+
+
+@pytest.fixture(autouse=True)
+def _no_backoff(monkeypatch):
+    """Skip the retry sleeps."""
+    monkeypatch.setattr(http_client.time, "sleep", lambda seconds: None)
+
+
+class TestTypedErrors:
+    """Validate the status-to-exception mapping in execute_request."""
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    @pytest.mark.parametrize("status,exc_type", [
+        (401, AdoAuthError),
+        (403, AdoAuthError),
+        (404, AdoNotFound),
+        (400, AdoError),
+    ])
+    @responses.activate
+    def test_status_maps_to_exception(self, status, exc_type):
+        responses.add(responses.GET, URL, json={"message": "nope"}, status=status)
+        with pytest.raises(exc_type) as excinfo:
+            execute_request("GET", URL, HEADERS)
+        err = excinfo.value
+        assert err.status == status
+        assert err.url == URL
+        assert "nope" in err.body
+        assert err.elapsed >= 0
+        assert len(responses.calls) == 1
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    @responses.activate
+    def test_throttled_after_retries_carries_retry_after(self):
+        for _ in range(3):
+            responses.add(responses.GET, URL, status=429, headers={"Retry-After": "7"})
+        with pytest.raises(AdoThrottled) as excinfo:
+            execute_request("GET", URL, HEADERS)
+        assert excinfo.value.retry_after == 7
+        assert len(responses.calls) == 3
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    @responses.activate
+    def test_retry_after_http_date(self, monkeypatch):
+        sleeps = []
+        monkeypatch.setattr(http_client.time, "sleep", sleeps.append)
+        responses.add(responses.GET, URL, status=429, headers={"Retry-After": formatdate(time.time() + 30, usegmt=True)})
+        responses.add(responses.GET, URL, status=503, headers={"Retry-After": "soon"})
+        responses.add(responses.GET, URL, json={"count": 0, "value": []})
+
+        assert execute_request("GET", URL, HEADERS).status_code == 200
+        assert 29 <= sleeps[0] <= 31
+        assert sleeps[1] == 4
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_parse_retry_after(self):
+        assert parse_retry_after("7") == 7
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    @responses.activate
+    def test_server_error_after_retries(self):
+        for _ in range(2):
+            responses.add(responses.GET, URL, status=503, body="down")
+        with pytest.raises(AdoServerError):
+            execute_request("GET", URL, HEADERS, max_retries=2)
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    @responses.activate
+    def test_transport_failure(self):
+        responses.add(responses.GET, URL, body=requests.exceptions.ConnectionError("refused"))
+        with pytest.raises(AdoRequestError) as excinfo:
+            execute_request("GET", URL, HEADERS)
+        assert excinfo.value.status is None
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_missing_env_raises_config_error(self, monkeypatch):
+        monkeypatch.delenv("AZURE_DEVOPS_ORG", raising=False)
+        with pytest.raises(AdoConfigError, match="AZURE_DEVOPS_ORG"):
+            get_common_env()
+
+
+class TestRunCli:
+    """Validate exit-code translation."""
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_error_becomes_exit_code(self, capsys):
+        def main():
+            raise AdoNotFound("ERROR: Resource not found (HTTP 404).", status=404)
+
+        with pytest.raises(SystemExit) as excinfo:
+            run_cli(main)
+        assert excinfo.value.code == AdoNotFound.exit_code
+        assert "HTTP 404" in capsys.readouterr().err
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_other_exceptions_propagate(self):
+        def main():
+            raise ValueError("bug")
+
+        with pytest.raises(ValueError):
+            run_cli(main)
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Offline unit tests for AdoClient in _shared/http_client.py
+
+Validates:
+  - Requests carry the client's Authorization header
+  - Request lines are logged when a logger is attached
+  - Generated <operation> functions are importable and callable in-process
+  - Streaming content to a file or binary stream
+"""
+
+import importlib
+import io
+
+import pytest
+import responses
+
+from _shared.http_client import AdoClient, stream_to
+
+
+class _ListLogger:
+    """Minimal stand-in for AdoLogger that records info() calls."""
+
+    def __init__(self):
+        self.messages = []
+
+    def info(self, message):
+        self.messages.append(message)
+
+
+class TestAdoClient:
+    """Validate AdoClient request execution."""
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    @responses.activate
+    def test_request_sends_auth_header(self):
+        url = "https://dev.azure.com/testorg/_apis/projects?api-version=7.2"
+        responses.add(responses.GET, url, json={"count": 0, "value": []}, status=200)
+
+        client = AdoClient("testorg", "fakepat1234567890")
+        response = client.request("GET", url)
+
+        assert response.json()["count"] == 0
+        assert responses.calls[0].request.headers["Authorization"].startswith("Basic ")
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    @responses.activate
+    def test_request_is_logged(self):
+        url = "https://dev.azure.com/testorg/_apis/projects?api-version=7.2"
+        responses.add(responses.GET, url, json={}, status=200)
+
+        logger = _ListLogger()
+        AdoClient("testorg", "fakepat1234567890", logger=logger).request("GET", url)
+
+        assert logger.messages == [f"GET {url}"]
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_from_env(self, monkeypatch):
+        monkeypatch.setenv("AZURE_DEVOPS_ORG", "envorg")
+        monkeypatch.setenv("AZURE_DEVOPS_PAT", "fakepat1234567890")
+        client = AdoClient.from_env(max_retries=1)
+        assert client.organization == "envorg"
+        assert client.max_retries == 1
+
+
+class TestGeneratedFunction:
+    """Validate a generated operation is importable as a plain function."""
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    @responses.activate
+    def test_get_builds(self, monkeypatch):
+        for var in ("AZURE_DEVOPS_ORG", "AZURE_DEVOPS_PAT", "PROJECT_ID", "BUILD_ID"):
+            monkeypatch.delenv(var, raising=False)
+        module = importlib.import_module("Build.Builds.get_builds")
+
+        url = "https://dev.azure.com/testorg/myproj/_apis/build/builds/42?api-version=7.2"
+        responses.add(responses.GET, url, json={"id": 42, "agentSpecification": None}, status=200)
+
+        client = AdoClient("testorg", "fakepat1234567890")
+        assert module.get_builds(client, "myproj", "42")["id"] == 42
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    @responses.activate
+    def test_optional_body_fields_by_keyword(self):
+        module = importlib.import_module("Artifacts.FeedManagement.create_feed")
+
+        url = "https://feeds.dev.azure.com/testorg/myproj/_apis/packaging/feeds?api-version=7.2"
+        responses.add(responses.POST, url, json={"badgesEnabled": None, "defaultViewId": None}, status=200)
+
+        client = AdoClient("testorg", "fakepat1234567890")
+        module.create_feed(client, "myproj", description="demo")
+
+        assert b'"description": "demo"' in responses.calls[0].request.body
+
+
+class TestStreaming:
+    """Validate raw content streaming."""
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    @responses.activate
+    def test_stream_to_binary_file(self):
+        url = "https://dev.azure.com/testorg/_apis/x?api-version=7.2"
+        payload = bytes(range(256)) * 64
+        responses.add(responses.GET, url, body=payload, status=200, content_type="application/zip")
+
+        client = AdoClient("testorg", "fakepat1234567890")
+        response = client.request("GET", url, stream=True, accept="application/zip")
+        out = io.BytesIO()
+
+        assert stream_to(response, out, chunk_size=1000) == len(payload)
+        assert out.getvalue() == payload
+        assert responses.calls[0].request.headers["Accept"] == "application/zip"
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    @responses.activate
+    def test_generated_stream_operation_writes_file(self, tmp_path):
+        module = importlib.import_module("Build.Builds.get_build_log")
+        url = "https://dev.azure.com/testorg/myproj/_apis/build/builds/7/logs/3?api-version=7.2"
+        responses.add(responses.GET, url, body="line 1\nline 2\n", status=200, content_type="text/plain")
+
+        target = tmp_path / "build.log"
+        written = module.get_build_log(
+            AdoClient("testorg", "fakepat1234567890"), "myproj", "7", "3", destination=str(target),
+        )
+
+        assert written == 14
+        assert target.read_text() == "line 1\nline 2\n"
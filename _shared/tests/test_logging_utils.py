@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Offline unit tests for _shared/logging_utils.py
+
+Validates:
+  - Text and NDJSON lines reach disk after flush, in order
+  - PATs are redacted before anything is queued
+  - Console output and GitHub Actions annotations stay synchronous
+  - Lines stay buffered until a flush; the size is tracked without tell()
+  - Size-based rotation keeps the configured number of backups
+  - At most max_open files stay open; evicted handles lose no lines
+"""
+
+import json
+
+import pytest
+
+from _shared import logging_utils
+from _shared.logging_utils import AdoLogger, _LogWriter, flush_logs
+
+PAT = "supersecretpat1234567890"
+
+
+@pytest.fixture
+def log_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(logging_utils, "LOG_DIR", tmp_path)
+    return tmp_path
+
+
+class TestBufferedWrites:
+    """Validate the background writer."""
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_lines_written_in_order(self, log_dir):
+        logger = AdoLogger("op_order", PAT)
+        for i in range(200):
+            logger.info(f"line {i}")
+        flush_logs()
+
+        text = (log_dir / "op_order.log").read_text(encoding="utf-8").splitlines()
+        entries = [json.loads(l) for l in (log_dir / "op_order.json").read_text(encoding="utf-8").splitlines()]
+        assert len(text) == len(entries) == 200
+        assert text[-1].endswith("[INFO] line 199")
+        assert [e["message"] for e in entries[:2]] == ["line 0", "line 1"]
+        assert entries[0]["operation"] == "op_order"
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_pat_redacted(self, log_dir, capsys):
+        logger = AdoLogger("op_redact", PAT)
+        logger.error(f"token {PAT} leaked")
+        logger.flush()
+
+        assert PAT not in (log_dir / "op_redact.log").read_text(encoding="utf-8")
+        assert PAT not in capsys.readouterr().err
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_ci_annotations(self, log_dir, monkeypatch, capsys):
+        monkeypatch.setenv("CI", "true")
+        logger = AdoLogger("op_ci", PAT)
+        logger.warn("careful")
+        logger.error("broken")
+
+        out = capsys.readouterr()
+        assert out.out.splitlines() == ["::warning::careful", "::error::broken"]
+        assert "[WARN] careful" in out.err
+
+
+class TestRotation:
+    """Validate size-based rotation."""
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_rotates_and_keeps_backups(self, log_dir):
+        logger = AdoLogger("op_rotate", PAT)
+        logger._writer = _LogWriter(max_bytes=300, backups=2)
+        for i in range(40):
+            logger.info(f"message number {i}")
+        logger.flush()
+
+        names = sorted(p.name for p in log_dir.iterdir() if p.name.startswith("op_rotate.log"))
+        assert names == ["op_rotate.log", "op_rotate.log.1", "op_rotate.log.2"]
+        assert (log_dir / "op_rotate.log.1").stat().st_size >= 300
+        recent = (log_dir / "op_rotate.log.1").read_text(encoding="utf-8") + (log_dir / "op_rotate.log").read_text(encoding="utf-8")
+        assert recent.splitlines()[-1].endswith("message number 39")
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_appends_stay_buffered(self, log_dir):
+        path = log_dir / "op_buffer.log"
+        path.write_text("x" * 100, encoding="utf-8")
+        writer = _LogWriter(max_bytes=1000, backups=1)
+        for _ in range(10):
+            writer._append(path, "ü" * 20 + "\n")
+
+        assert path.stat().st_size == 100
+        assert writer._sizes[path] == 100 + 10 * 41
+        writer._append(path, "y" * 500 + "\n")
+        assert not path.exists()
+        assert (log_dir / "op_buffer.log.1").stat().st_size == 100 + 10 * 41 + 501
+        assert path not in writer._sizes
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_open_handles_capped(self, log_dir):
+        writer = _LogWriter(max_bytes=0, max_open=4)
+        paths = [log_dir / f"op_many_{n}.log" for n in range(10)]
+        for round_ in range(3):
+            for path in paths:
+                writer._append(path, f"{path.stem} {round_}\n")
+            assert len(writer._handles) == 4
+
+        writer._flush_all()
+        for path in paths:
+            assert path.read_text(encoding="utf-8").splitlines() == [f"{path.stem} {n}" for n in range(3)]
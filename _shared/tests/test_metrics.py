@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Offline unit tests for _shared/metrics.py
+
+Validates:
+  - No record is built while no hook is registered
+  - Hooks receive status, attempts, sizes, backoff and X-RateLimit-* headers
+  - Failed requests are reported with their error
+  - New connections report DNS/connect time; reused ones do not
+  - The NDJSON sink and the histogram summary
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import responses
+
+from _shared import http_client, metrics
+from _shared.errors import AdoNotFound
+from _shared.http_client import execute_request
+from _shared.metrics import NdjsonSink, RequestMetrics, Summary
+
+URL = "https://dev.azure.com/testorg/_apis/projects?api-version=7.2"
+
+
+@pytest.fixture
+def records():
+    collected = []
+    metrics.add_hook(collected.append)
+    yield collected
+    metrics.remove_hook(collected.append)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def local_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://localhost:{server.server_address[1]}/_apis/projects"
+    server.shutdown()
+    server.server_close()
+
+
+class TestHooks:
+    """Validate the records passed to hooks."""
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_disabled_without_hooks(self):
+        assert metrics.begin("GET", URL) is None
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    @responses.activate
+    def test_records_retry_and_throttling(self, records, monkeypatch):
+        monkeypatch.setattr(http_client.time, "sleep", lambda s: None)
+        responses.add(responses.POST, URL, status=429, headers={"Retry-After": "3"})
+        responses.add(responses.POST, URL, json={"value": [1, 2]}, headers={
+            "X-RateLimit-Resource": "ATCPU", "X-RateLimit-Remaining": "12",
+        })
+
+        execute_request("POST", URL, {}, body={"name": "p1"})
+
+        [record] = records
+        assert (record.method, record.status, record.attempts) == ("POST", 200, 2)
+        assert record.retry_wait == 3
+        assert record.rate_limit == {"X-RateLimit-Resource": "ATCPU", "X-RateLimit-Remaining": "12"}
+        assert record.bytes_out == len(json.dumps({"name": "p1"}))
+        assert record.bytes_in == len(b'{"value": [1, 2]}')
+        assert record.total >= record.ttfb >= 0
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    @responses.activate
+    def test_records_errors(self, records):
+        responses.add(responses.GET, URL, json={"message": "gone"}, status=404)
+
+        with pytest.raises(AdoNotFound):
+            execute_request("GET", URL, {})
+
+        assert records[0].status == 404 and records[0].error
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_connection_phases(self, records, local_url):
+        execute_request("GET", local_url, {})
+        execute_request("GET", local_url, {})
+
+        first, second = records
+        assert first.dns > 0 and first.connect > 0 and first.tls == 0
+        assert second.dns == second.connect == 0
+
+
+class TestSinks:
+    """Validate the bundled sinks."""
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_ndjson_sink(self, tmp_path):
+        sink = NdjsonSink(str(tmp_path / "metrics.ndjson"))
+        sink(RequestMetrics("GET", URL, timestamp=0.0, status=200, total=0.2))
+        sink.close()
+
+        [line] = (tmp_path / "metrics.ndjson").read_text(encoding="utf-8").splitlines()
+        assert json.loads(line)["status"] == 200
+        assert "_start" not in json.loads(line)
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_summary_histogram(self):
+        summary = Summary()
+        for total in (0.01, 0.02, 0.03, 3.0):
+            summary(RequestMetrics("GET", URL, timestamp=0.0, total=total, attempts=1))
+
+        stats = summary.hosts["dev.azure.com"]
+        assert stats["requests"] == 4
+        assert Summary.percentile(stats["buckets"], 0.5) == 0.025
+        assert Summary.percentile(stats["buckets"], 0.99) == 5.0
+        assert "dev.azure.com: 4 requests" in summary.render()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Offline unit tests for _shared/output.py
+
+Validates:
+  - Nested objects flatten to dotted fields and --fields projects them
+  - CSV columns come from the sampled items; lists are written as JSON
+  - NDJSON is written item by item as the iterator is consumed
+  - Parquet needs --output and the optional pyarrow dependency
+  - Parquet column types widen when later row groups need it
+  - Generated list operations stream every page with --format
+"""
+
+import csv
+import importlib
+import io
+import json
+import sys
+
+import pytest
+import responses
+
+from _shared import output
+from _shared.errors import AdoConfigError
+
+ITEMS = [
+    {"id": 1, "fields": {"System.Title": "First", "System.Tags": ["a", "b"]}, "project": {"name": "p"}},
+    {"id": 2, "fields": {"System.Title": "Second"}, "project": {"name": "p"}},
+]
+BUILDS_URL = "https://dev.azure.com/testorg/myproj/_apis/build/builds"
+
+
+class TestFlatten:
+    """Validate flattening and projection."""
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_flatten_and_project(self):
+        assert output.flatten(ITEMS[0]) == {
+            "id": 1, "fields.System.Title": "First", "fields.System.Tags": ["a", "b"], "project.name": "p",
+        }
+        assert output.project(ITEMS[1], ["fields.System.Title", "fields.System.State"]) == {
+            "fields.System.Title": "Second", "fields.System.State": None,
+        }
+        assert output.parse_fields(" id, project.name ,") == ["id", "project.name"]
+        assert output.items_of({"count": 2, "workItems": ITEMS}, "workItems") == ITEMS
+        assert output.items_of({"id": 7}) == [{"id": 7}]
+
+
+class TestWriters:
+    """Validate the ndjson, csv and parquet writers."""
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_csv(self):
+        out = io.StringIO()
+        assert output.write_csv(ITEMS, out) == 2
+        rows = list(csv.reader(io.StringIO(out.getvalue())))
+        assert rows[0] == ["id", "fields.System.Title", "fields.System.Tags", "project.name"]
+        assert rows[1] == ["1", "First", '["a","b"]', "p"]
+        assert rows[2] == ["2", "Second", "", "p"]
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_csv_drops_unsampled_columns(self, monkeypatch, capsys):
+        monkeypatch.setattr(output, "SCHEMA_SAMPLE", 1)
+        out = io.StringIO()
+        output.write_csv(ITEMS[1:] + ITEMS[:1], out)
+        assert out.getvalue().splitlines()[0] == "id,fields.System.Title,project.name"
+        assert "fields.System.Tags" in capsys.readouterr().err
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_ndjson_streams(self):
+        out = io.StringIO()
+        written = []
+
+        def items():
+            for item in ITEMS:
+                written.append(out.getvalue().count("\n"))
+                yield item
+
+        assert output.write_ndjson(items(), out, fields=["id", "fields.System.Title"]) == 2
+        assert written == [0, 1]
+        assert [json.loads(line) for line in out.getvalue().splitlines()] == [
+            {"id": 1, "fields.System.Title": "First"}, {"id": 2, "fields.System.Title": "Second"},
+        ]
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_parquet_requirements(self, tmp_path, monkeypatch):
+        with pytest.raises(AdoConfigError, match="--output"):
+            output.write_items(ITEMS, "parquet")
+        monkeypatch.setattr(output, "pyarrow", None)
+        with pytest.raises(AdoConfigError, match="pip install pyarrow"):
+            output.write_items(ITEMS, "parquet", str(tmp_path / "items.parquet"))
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_parquet(self, tmp_path, monkeypatch):
+        pytest.importorskip("pyarrow")
+        monkeypatch.setattr(output, "ROW_GROUP", 1)
+        path = tmp_path / "items.parquet"
+        assert output.write_items(ITEMS, "parquet", str(path)) == 2
+        import pyarrow.parquet as pq
+        table = pq.read_table(path)
+        assert table.column("fields.System.Title").to_pylist() == ["First", "Second"]
+        assert pq.ParquetFile(path).metadata.num_row_groups == 2
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_parquet_widens_types_across_row_groups(self, tmp_path, monkeypatch):
+        pytest.importorskip("pyarrow")
+        monkeypatch.setattr(output, "ROW_GROUP", 1)
+        items = [
+            {"id": 1, "sparse": None, "points": 1, "mixed": 1},
+            {"id": 2, "sparse": "x", "points": 2.5, "mixed": [1, "a"]},
+            {"id": 3, "sparse": 5, "points": None, "mixed": "many"},
+        ]
+        path = tmp_path / "items.parquet"
+        fields = ["id", "sparse", "points", "mixed"]
+        assert output.write_items(items, "parquet", str(path), fields) == 3
+        import pyarrow.parquet as pq
+        table = pq.read_table(path)
+        assert table.column("id").to_pylist() == [1, 2, 3]
+        assert table.column("sparse").to_pylist() == [None, "x", "5"]
+        assert table.column("points").to_pylist() == [1.0, 2.5, None]
+        assert table.column("mixed").to_pylist() == ["1", '[1,"a"]', "many"]
+
+
+class TestGeneratedListOperation:
+    """Validate --format on a generated paged list operation."""
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    @responses.activate
+    def test_list_builds_csv(self, tmp_path, monkeypatch):
+        module = importlib.import_module("Build.Builds.list_builds")
+        responses.add(responses.GET, BUILDS_URL, json={"count": 1, "value": [{"id": 1, "definition": {"name": "ci"}}]},
+                      headers={"x-ms-continuationtoken": "tok1"})
+        responses.add(responses.GET, BUILDS_URL, json={"count": 1, "value": [{"id": 2, "definition": {"name": "ci"}}]})
+        monkeypatch.setenv("AZURE_DEVOPS_ORG", "testorg")
+        monkeypatch.setenv("AZURE_DEVOPS_PAT", "fakepat1234567890")
+        monkeypatch.setenv("PROJECT_ID", "myproj")
+        path = tmp_path / "builds.csv"
+        monkeypatch.setattr(sys, "argv", ["list_builds.py", "--all-pages", "--format", "csv",
+                                          "--fields", "id,definition.name", "--output", str(path)])
+
+        module.main()
+
+        assert path.read_text(encoding="utf-8").splitlines() == ["id,definition.name", "1,ci", "2,ci"]
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Offline unit tests for _shared/pagination.py
+
+Validates:
+  - Continuation tokens from the response header and the response body
+  - Continuation tokens sent back in the request body
+  - $top / $skip paging stops on a short page
+  - max_items cap stops requesting further pages
+  - Prefetching yields the same items
+  - Generated iter_<operation> functions for paged list operations
+  - The generator only pages collections, not single objects with $top/$skip
+"""
+
+import importlib
+import json
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+import responses
+
+from _shared.http_client import AdoClient
+from _shared.pagination import paginate, with_query
+
+BASE = "https://dev.azure.com/testorg/myproj/_apis/build/builds?api-version=7.2"
+
+
+def _client() -> AdoClient:
+    return AdoClient("testorg", "fakepat1234567890")
+
+
+def _query(request) -> dict:
+    return {k: v[0] for k, v in parse_qs(urlsplit(request.url).query).items()}
+
+
+def _add_token_pages(pages):
+    """Register one response per page; every page but the last returns a token."""
+    for i, items in enumerate(pages):
+        headers = {"x-ms-continuationtoken": f"tok{i + 1}"} if i < len(pages) - 1 else {}
+        responses.add(
+            responses.GET, BASE.split("?")[0],
+            json={"count": len(items), "value": items}, headers=headers, status=200,
+        )
+
+
+class TestContinuation:
+    """Validate continuation-token paging."""
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    @responses.activate
+    def test_follows_header_token(self):
+        _add_token_pages([[1, 2], [3, 4], [5]])
+        items = list(paginate(_client(), "GET", BASE, "continuation"))
+        assert items == [1, 2, 3, 4, 5]
+        assert "continuationToken" not in _query(responses.calls[0].request)
+        assert _query(responses.calls[1].request)["continuationToken"] == "tok1"
+        assert _query(responses.calls[2].request)["continuationToken"] == "tok2"
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    @responses.activate
+    def test_follows_body_token_until_has_more_false(self):
+        url = "https://auditservice.dev.azure.com/testorg/_apis/audit/auditlog?api-version=7.2"
+        responses.add(responses.GET, url.split("?")[0], json={
+            "continuationToken": "next", "hasMore": True, "decoratedAuditLogEntries": [{"id": "a"}],
+        })
+        responses.add(responses.GET, url.split("?")[0], json={
+            "continuationToken": "stale", "hasMore": False, "decoratedAuditLogEntries": [{"id": "b"}],
+        })
+        items = list(paginate(_client(), "GET", url, "continuation", list_key="decoratedAuditLogEntries"))
+        assert [i["id"] for i in items] == ["a", "b"]
+        assert len(responses.calls) == 2
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    @responses.activate
+    def test_token_in_request_body(self):
+        url = "https://dev.azure.com/testorg/myproj/_apis/wiki/wikis/w/pagesbatch?api-version=7.2"
+        responses.add(responses.POST, url, json=[{"id": 1}], headers={"x-ms-continuationtoken": "t2"})
+        responses.add(responses.POST, url, json=[{"id": 2}])
+        items = list(paginate(_client(), "POST", url, "continuation_body", body={"top": 1}))
+        assert [i["id"] for i in items] == [1, 2]
+        assert json.loads(responses.calls[1].request.body) == {"top": 1, "continuationToken": "t2"}
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    @responses.activate
+    def test_max_items_stops_early(self):
+        _add_token_pages([[1, 2], [3, 4], [5]])
+        items = list(paginate(_client(), "GET", BASE, "continuation", max_items=3))
+        assert items == [1, 2, 3]
+        assert len(responses.calls) == 2
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    @responses.activate
+    def test_prefetch_yields_same_items(self):
+        _add_token_pages([[1, 2], [3, 4], [5]])
+        items = list(paginate(_client(), "GET", BASE, "continuation", prefetch=True))
+        assert items == [1, 2, 3, 4, 5]
+
+
+class TestTopSkip:
+    """Validate $top / $skip paging."""
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    @responses.activate
+    def test_stops_on_short_page(self):
+        responses.add(responses.GET, BASE.split("?")[0], json={"value": [1, 2]})
+        responses.add(responses.GET, BASE.split("?")[0], json={"value": [3]})
+        items = list(paginate(_client(), "GET", BASE, "top_skip", page_size=2))
+        assert items == [1, 2, 3]
+        assert _query(responses.calls[0].request)["$skip"] == "0"
+        assert _query(responses.calls[1].request)["$skip"] == "2"
+        assert _query(responses.calls[1].request)["$top"] == "2"
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_with_query_replaces_existing(self):
+        url = with_query(BASE + "&$skip=5", **{"$skip": 10})
+        assert url.count("$skip") == 1
+        assert "$skip=10" in url
+
+
+class TestGeneratedIterFunction:
+    """Validate paged list operations expose iter_<operation>."""
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    @responses.activate
+    def test_iter_list_builds(self):
+        module = importlib.import_module("Build.Builds.list_builds")
+        _add_token_pages([[{"id": 1}], [{"id": 2}]])
+        builds = list(module.iter_list_builds(_client(), "myproj"))
+        assert [b["id"] for b in builds] == [1, 2]
+
+
+PR_DEFINITIONS = {
+    "GitPullRequest": {"type": "object", "properties": {
+        "pullRequestId": {"type": "integer"},
+        "commits": {"type": "array", "items": {"type": "object"}},
+        "reviewers": {"type": "array", "items": {"type": "object"}},
+    }},
+}
+TOP_SKIP = [
+    {"in": "path", "name": "organization", "required": True, "type": "string"},
+    {"in": "query", "name": "$top", "type": "integer"},
+    {"in": "query", "name": "$skip", "type": "integer"},
+]
+
+
+def _endpoint(path, schema, extra_params=()):
+    pytest.importorskip("yaml")
+    from _generator.spec_to_yaml import generate_yaml_for_endpoint
+
+    details = {
+        "operationId": "Pull Requests_Get",
+        "parameters": TOP_SKIP + list(extra_params),
+        "responses": {"200": {"description": "ok", "schema": schema}},
+    }
+    return generate_yaml_for_endpoint("git", "dev.azure.com", path, "GET", details, PR_DEFINITIONS, "7.2")
+
+
+class TestPaginationDetection:
+    """Validate which generated definitions are marked as paged."""
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_single_object_is_not_paged(self):
+        pr_id = {"in": "path", "name": "pullRequestId", "required": True, "type": "integer"}
+        definition = _endpoint("/{organization}/_apis/git/pullrequests/{pullRequestId}",
+                               {"$ref": "#/definitions/GitPullRequest"}, [pr_id])
+        assert "pagination" not in definition
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_collection_is_paged(self):
+        definition = _endpoint("/{organization}/_apis/git/pullrequests",
+                               {"type": "array", "items": {"$ref": "#/definitions/GitPullRequest"}})
+        assert definition["pagination"] == "top_skip"
+        assert "list_key" not in definition
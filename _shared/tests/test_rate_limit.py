@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Offline unit tests for _shared/rate_limit.py
+
+Validates:
+  - Token bucket pacing once the burst is spent
+  - Rate cuts from X-RateLimit-Delay and a low X-RateLimit-Remaining
+  - Retry-After pauses every caller, as seconds or an HTTP-date
+  - Gradual recovery while the service reports headroom
+  - No fixed cap by default: unpaced until the headers report throttling
+  - Pacing shared across limiters through the state file
+  - execute_request feeds response headers to the limiter
+"""
+
+import time
+from email.utils import formatdate
+
+import pytest
+import responses
+
+from _shared import rate_limit
+from _shared.http_client import execute_request
+from _shared.rate_limit import MIN_RPS, RateLimiter
+
+
+class TestTokenBucket:
+    """Validate pacing."""
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_burst_then_wait(self):
+        limiter = RateLimiter(max_rate=10, burst=2)
+        assert limiter.reserve() == 0
+        assert limiter.reserve() == 0
+        assert limiter.reserve() == pytest.approx(0.1, abs=0.02)
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_retry_after_pauses(self):
+        limiter = RateLimiter(max_rate=10)
+        limiter.observe({"Retry-After": "5"})
+        assert limiter.reserve() == pytest.approx(5, abs=0.1)
+        assert limiter.rate == 5
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_retry_after_http_date_pauses(self):
+        limiter = RateLimiter(max_rate=10)
+        limiter.observe({"Retry-After": formatdate(time.time() + 30, usegmt=True)})
+        assert 29 <= limiter.reserve() <= 31
+        assert limiter.rate == 5
+
+
+class TestAdaptiveRate:
+    """Validate header-driven rate changes."""
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_delay_halves_rate(self):
+        limiter = RateLimiter(max_rate=20)
+        limiter.observe({"X-RateLimit-Delay": "0.5", "X-RateLimit-Resource": "Core"})
+        assert limiter.rate == 10
+        assert limiter.resource == "Core"
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_low_remaining_scales_rate(self):
+        limiter = RateLimiter(max_rate=20)
+        limiter.observe({"X-RateLimit-Limit": "200", "X-RateLimit-Remaining": "25"})
+        assert limiter.rate == pytest.approx(10)
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_rate_never_below_minimum(self):
+        limiter = RateLimiter(max_rate=20)
+        for _ in range(20):
+            limiter.observe({"X-RateLimit-Delay": "2"})
+        assert limiter.rate == MIN_RPS
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_recovers_with_headroom(self):
+        limiter = RateLimiter(max_rate=20)
+        limiter.observe({"X-RateLimit-Delay": "1"})
+        limiter.observe({"X-RateLimit-Limit": "200", "X-RateLimit-Remaining": "190"})
+        assert limiter.rate == pytest.approx(11)
+
+
+class TestNoFixedCap:
+    """Validate the default limiter, which only follows the headers."""
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_unpaced_until_throttled(self):
+        limiter = RateLimiter()
+        assert all(limiter.reserve() == 0 for _ in range(1000))
+
+        limiter.observe({"X-RateLimit-Delay": "1"})
+        assert limiter.rate == rate_limit.THROTTLED_RPS / 2
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_retry_after_pauses_then_cap_lifts(self):
+        limiter = RateLimiter()
+        limiter.observe({"Retry-After": "4"})
+        assert limiter.reserve() == pytest.approx(4, abs=0.1)
+
+        for _ in range(30):
+            limiter.observe({})
+        assert limiter.rate == float("inf")
+
+
+class TestSharedState:
+    """Validate cross-process pacing through the state file."""
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_sibling_adopts_pause_and_rate(self, tmp_path):
+        state = str(tmp_path / "ado_rate.json")
+        first = RateLimiter(max_rate=20, shared_file=state)
+        second = RateLimiter(max_rate=20, shared_file=state)
+
+        first.observe({"Retry-After": "3"})
+
+        assert second.reserve() == pytest.approx(3, abs=0.2)
+        assert second.rate == 10
+
+
+class TestExecuteRequestIntegration:
+    """Validate execute_request consults the process-wide limiter."""
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    @responses.activate
+    def test_headers_observed(self):
+        limiter = rate_limit.configure_rate_limit(20)
+        url = "https://dev.azure.com/testorg/_apis/projects?api-version=7.2"
+        responses.add(responses.GET, url, json={}, headers={"X-RateLimit-Delay": "1"})
+
+        execute_request("GET", url, {"Authorization": "Basic fake"})
+
+        assert limiter.rate == 10
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_env_settings(self, monkeypatch):
+        monkeypatch.delenv("ADO_RATE_LIMIT_RPS", raising=False)
+        assert rate_limit.configure_rate_limit().max_rate == 0
+        monkeypatch.setenv("ADO_RATE_LIMIT_RPS", "5")
+        assert rate_limit.configure_rate_limit().max_rate == 5
+        monkeypatch.setenv("ADO_RATE_LIMIT_RPS", "off")
+        assert rate_limit.configure_rate_limit() is None
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Offline unit tests for _shared/response_cache.py
+
+Validates:
+  - 200 GET responses with an ETag are stored and revalidated
+  - 304 Not Modified is answered from the cache
+  - Entries are scoped by auth header
+  - TTL expiry, extended by a 304 revalidation, and size-bounded LRU eviction
+  - The directory is scanned only when the running size total passes the bound
+  - Responses without validators, and non-GET requests, are not cached
+"""
+
+import os
+import time
+
+import pytest
+import responses
+
+from _shared import response_cache
+from _shared.http_client import execute_request
+from _shared.response_cache import ResponseCache
+
+URL = "https://dev.azure.com/testorg/_apis/projects?api-version=7.2"
+AUTH = {"Authorization": "Basic fake", "Accept": "application/json"}
+
+
+class TestRevalidation:
+    """Validate conditional requests through execute_request."""
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    @responses.activate
+    def test_not_modified_served_from_cache(self, tmp_path):
+        response_cache.configure_cache(str(tmp_path))
+        responses.add(responses.GET, URL, json={"count": 1, "value": [{"name": "p"}]}, headers={"ETag": '"v1"'})
+        responses.add(responses.GET, URL, status=304, headers={"ETag": '"v1"'})
+
+        first = execute_request("GET", URL, AUTH)
+        second = execute_request("GET", URL, AUTH)
+
+        assert second.status_code == 200
+        assert second.json() == first.json()
+        assert "If-None-Match" not in responses.calls[0].request.headers
+        assert responses.calls[1].request.headers["If-None-Match"] == '"v1"'
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    @responses.activate
+    def test_changed_response_replaces_entry(self, tmp_path):
+        response_cache.configure_cache(str(tmp_path))
+        responses.add(responses.GET, URL, json={"v": 1}, headers={"ETag": '"v1"'})
+        responses.add(responses.GET, URL, json={"v": 2}, headers={"ETag": '"v2"'})
+        responses.add(responses.GET, URL, status=304)
+
+        execute_request("GET", URL, AUTH)
+        assert execute_request("GET", URL, AUTH).json() == {"v": 2}
+        assert execute_request("GET", URL, AUTH).json() == {"v": 2}
+        assert responses.calls[2].request.headers["If-None-Match"] == '"v2"'
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    @responses.activate
+    def test_last_modified_sent_back(self, tmp_path):
+        response_cache.configure_cache(str(tmp_path))
+        stamp = "Wed, 21 Oct 2026 07:28:00 GMT"
+        responses.add(responses.GET, URL, json={}, headers={"Last-Modified": stamp})
+        responses.add(responses.GET, URL, status=304)
+
+        execute_request("GET", URL, AUTH)
+        execute_request("GET", URL, AUTH)
+
+        assert responses.calls[1].request.headers["If-Modified-Since"] == stamp
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    @responses.activate
+    def test_other_pat_not_served(self, tmp_path):
+        response_cache.configure_cache(str(tmp_path))
+        responses.add(responses.GET, URL, json={}, headers={"ETag": '"v1"'})
+        responses.add(responses.GET, URL, json={}, headers={"ETag": '"v1"'})
+
+        execute_request("GET", URL, AUTH)
+        execute_request("GET", URL, dict(AUTH, Authorization="Basic other"))
+
+        assert "If-None-Match" not in responses.calls[1].request.headers
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    @responses.activate
+    def test_without_validator_not_cached(self, tmp_path):
+        response_cache.configure_cache(str(tmp_path))
+        responses.add(responses.GET, URL, json={})
+
+        execute_request("GET", URL, AUTH)
+
+        assert os.listdir(tmp_path) == []
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    @responses.activate
+    def test_post_not_cached(self, tmp_path):
+        response_cache.configure_cache(str(tmp_path))
+        responses.add(responses.POST, URL, json={}, headers={"ETag": '"v1"'})
+
+        execute_request("POST", URL, AUTH, body={})
+
+        assert os.listdir(tmp_path) == []
+
+
+class TestEviction:
+    """Validate TTL and size bounds."""
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_expired_entry_dropped(self, tmp_path):
+        cache = ResponseCache(str(tmp_path), ttl=0)
+        key = cache.key(URL, AUTH)
+        cache.store(key, URL, {"ETag": '"v1"'}, b"{}")
+        time.sleep(0.01)
+        assert cache.lookup(key) is None
+        assert os.listdir(tmp_path) == []
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_least_recently_used_evicted(self, tmp_path):
+        cache = ResponseCache(str(tmp_path))
+        keys = [cache.key(f"{URL}&n={i}", AUTH) for i in range(3)]
+        for age, key in zip((30, 20, 10), keys):
+            cache.store(key, URL, {"ETag": '"v"'}, b"x" * 50)
+            stamp = time.time() - age
+            os.utime(os.path.join(tmp_path, key + ".entry"), (stamp, stamp))
+        cache.touch(keys[0])
+        # Room for three entries (their sizes differ by a few bytes of timestamp)
+        cache.max_bytes = int(3.5 * os.path.getsize(os.path.join(tmp_path, keys[0] + ".entry")))
+
+        cache.store(cache.key(URL, AUTH), URL, {"ETag": '"v"'}, b"x" * 50)
+
+        assert cache.lookup(keys[0]) is not None
+        assert cache.lookup(keys[1]) is None
+        assert cache.lookup(keys[2]) is not None
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_touch_extends_freshness(self, tmp_path, monkeypatch):
+        cache = ResponseCache(str(tmp_path), ttl=10)
+        keys = [cache.key(f"{URL}&n={i}", AUTH) for i in range(2)]
+        now = time.time()
+        monkeypatch.setattr(response_cache.time, "time", lambda: now - 20)
+        for key in keys:
+            cache.store(key, URL, {"ETag": '"v"'}, b"{}")
+        monkeypatch.undo()
+        for key in keys:
+            os.utime(os.path.join(tmp_path, key + ".entry"), (now - 20, now - 20))
+
+        cache.touch(keys[0])
+
+        assert cache.lookup(keys[0]) is not None
+        assert cache.lookup(keys[1]) is None
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_scans_only_past_the_bound(self, tmp_path, monkeypatch):
+        seed = ResponseCache(str(tmp_path)).key(URL, AUTH)
+        ResponseCache(str(tmp_path)).store(seed, URL, {"ETag": '"v"'}, b"x" * 100)
+        scans = []
+        real_scandir = os.scandir
+        monkeypatch.setattr(response_cache.os, "scandir", lambda path: scans.append(path) or real_scandir(path))
+        cache = ResponseCache(str(tmp_path), max_bytes=10_000)
+        assert len(scans) == 1
+
+        for i in range(20):
+            cache.store(cache.key(f"{URL}&n={i}", AUTH), URL, {"ETag": '"v"'}, b"x" * 100)
+        cache.store(seed, URL, {"ETag": '"v"'}, b"x" * 100)
+        assert len(scans) == 1
+        assert cache._total == sum(entry.stat().st_size for entry in real_scandir(tmp_path))
+
+        cache.max_bytes = cache._total - 1
+        cache.store(seed, URL, {"ETag": '"v2"'}, b"x" * 100)
+        assert len(scans) == 2
+        assert cache._total <= cache.max_bytes
+        assert cache._total == sum(entry.stat().st_size for entry in real_scandir(tmp_path))
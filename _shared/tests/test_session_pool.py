@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Offline unit tests for _shared/session_pool.py
+
+Validates:
+  - One shared session per base host
+  - Pool size / keep-alive configuration
+  - execute_request sends through the pooled session
+"""
+
+import pytest
+import responses
+
+from _shared import session_pool
+from _shared.http_client import execute_request
+
+
+@pytest.fixture(autouse=True)
+def _fresh_pool():
+    """Start and finish every test with an empty, default-configured registry."""
+    session_pool._config = {}
+    session_pool.close_sessions()
+    yield
+    session_pool._config = {}
+    session_pool.close_sessions()
+
+
+class TestSessionRegistry:
+    """Validate session reuse per host."""
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_same_host_reuses_session(self):
+        first = session_pool.get_session("dev.azure.com")
+        second = session_pool.session_for_url("https://dev.azure.com/org/_apis/projects")
+        assert first is second
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_different_hosts_get_different_sessions(self):
+        core = session_pool.session_for_url("https://dev.azure.com/org/_apis/projects")
+        graph = session_pool.session_for_url("https://vssps.dev.azure.com/org/_apis/graph/users")
+        assert core is not graph
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_pool_size_from_env(self, monkeypatch):
+        monkeypatch.setenv("ADO_HTTP_POOL_SIZE", "32")
+        session = session_pool.get_session("dev.azure.com")
+        adapter = session.get_adapter("https://dev.azure.com/org")
+        assert adapter._pool_maxsize == 32
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_configure_replaces_sessions(self):
+        before = session_pool.get_session("dev.azure.com")
+        session_pool.configure_sessions(pool_maxsize=4, keep_alive=False)
+        after = session_pool.get_session("dev.azure.com")
+        assert before is not after
+        assert after.get_adapter("https://dev.azure.com/org")._pool_maxsize == 4
+        assert after.headers["Connection"] == "close"
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_default_headers_applied(self):
+        session_pool.configure_sessions(default_headers={"X-Test": "1"})
+        session = session_pool.get_session("dev.azure.com")
+        assert session.headers["X-Test"] == "1"
+
+
+class TestExecuteRequestUsesPool:
+    """Validate execute_request goes through the pooled session."""
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    @responses.activate
+    def test_requests_share_one_session(self, monkeypatch):
+        url = "https://dev.azure.com/testorg/_apis/projects?api-version=7.2"
+        responses.add(responses.GET, url, json={"count": 0, "value": []}, status=200)
+        responses.add(responses.GET, url, json={"count": 0, "value": []}, status=200)
+
+        used = []
+        real = session_pool.session_for_url
+
+        def _spy(u):
+            session = real(u)
+            used.append(session)
+            return session
+
+        monkeypatch.setattr("_shared.http_client.session_for_url", _spy)
+
+        execute_request("GET", url, {"Authorization": "Basic fake"})
+        execute_request("GET", url, {"Authorization": "Basic fake"})
+
+        assert len(responses.calls) == 2
+        assert used[0] is used[1]
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    @responses.activate
+    def test_cookies_not_persisted(self):
+        url = "https://dev.azure.com/testorg/_apis/projects?api-version=7.2"
+        responses.add(
+            responses.GET, url, json={}, status=200,
+            headers={"Set-Cookie": "session=abc; Domain=dev.azure.com; Path=/"},
+        )
+        execute_request("GET", url, {"Authorization": "Basic fake"})
+        assert len(session_pool.get_session("dev.azure.com").cookies) == 0
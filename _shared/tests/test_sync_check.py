@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Offline unit tests for _shared/specs/sync_check.py
+
+Validates:
+  - The recursive diff finds parameter, required, enum and response changes
+  - Description-only edits have no structural impact
+  - Definition changes reach every operation that references them
+  - Changed operations map to their _generator definition files
+  - Unchanged specs are answered with a 304 once validators are stored
+"""
+
+import copy
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from _shared.specs import sync_check
+
+BUILD_PATH = "/{organization}/{project}/_apis/build/builds/{buildId}"
+SPEC = {
+    "paths": {
+        BUILD_PATH: {"get": {
+            "parameters": [
+                {"in": "path", "name": "buildId", "required": True, "type": "integer"},
+                {"in": "query", "name": "propertyFilters", "required": False, "type": "string"},
+            ],
+            "responses": {"200": {"description": "ok", "schema": {"$ref": "#/definitions/Build"}}},
+        }},
+        "/{organization}/_apis/build/controllers": {"get": {
+            "responses": {"200": {"schema": {"type": "array", "items": {"$ref": "#/definitions/Controller"}}}},
+        }},
+    },
+    "definitions": {
+        "Build": {"type": "object", "properties": {
+            "id": {"type": "integer"},
+            "status": {"$ref": "#/definitions/Status"},
+        }},
+        "Status": {"type": "string", "enum": ["none", "inProgress", "completed"]},
+        "Controller": {"type": "object", "properties": {"name": {"type": "string"}}},
+    },
+}
+
+
+def _kinds(classification):
+    return {(c["kind"], c["detail"]) for c in classification["changes"]}
+
+
+class TestDiff:
+    """Validate the structural diff."""
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_operation_changes(self):
+        new = copy.deepcopy(SPEC)
+        op = new["paths"][BUILD_PATH]["get"]
+        op["parameters"][1]["required"] = True
+        op["parameters"].append({"in": "query", "name": "expand", "required": False, "type": "string", "enum": ["all"]})
+        op["responses"]["404"] = {"description": "missing"}
+        new["definitions"]["Build"]["required"] = ["id"]
+
+        result = sync_check.classify_changes(SPEC, new)
+
+        assert result["change_type"] == "breaking"
+        assert _kinds(result) == {
+            ("now-required", "propertyFilters"),
+            ("parameter-added", "expand (optional)"),
+            ("response-added", "404"),
+            ("now-required", "id"),
+        }
+        assert result["affected_operations"] == [f"GET {BUILD_PATH}"]
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_definition_change_reaches_referencing_operations(self):
+        new = copy.deepcopy(SPEC)
+        new["definitions"]["Status"]["enum"] = ["none", "completed", "cancelling"]
+
+        result = sync_check.classify_changes(SPEC, new)
+
+        assert _kinds(result) == {("enum-removed", "inProgress"), ("enum-added", "cancelling")}
+        assert result["affected_operations"] == [f"GET {BUILD_PATH}"]
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_descriptions_are_not_structural(self):
+        new = copy.deepcopy(SPEC)
+        new["definitions"]["Build"]["description"] = "A build."
+        new["paths"][BUILD_PATH]["get"]["responses"]["200"]["description"] = "The build"
+
+        result = sync_check.classify_changes(SPEC, new)
+
+        assert result["change_type"] == "non-breaking"
+        assert result["changes"] == [] and result["affected_operations"] == []
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_maps_operations_to_definition_files(self):
+        files = sync_check.definitions_for([f"GET {BUILD_PATH}"])
+        assert "_generator/definitions/build_get_build.yaml" in files
+        assert all(f.startswith("_generator/definitions/build_") for f in files)
+
+
+class _SpecHandler(BaseHTTPRequestHandler):
+    body = json.dumps(SPEC).encode("utf-8")
+    etag = '"v1"'
+    seen = []
+
+    def do_GET(self):
+        self.seen.append(self.headers.get("If-None-Match"))
+        if self.headers.get("If-None-Match") == self.etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("ETag", self.etag)
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestFetch:
+    """Validate conditional, concurrent fetching against a local server."""
+
+    @pytest.mark.offline
+    @pytest.mark.shared
+    def test_conditional_fetch(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(sync_check, "SCRIPT_DIR", tmp_path)
+        monkeypatch.setattr(sync_check, "HASHES_FILE", tmp_path / "hashes.json")
+        sync_check.save_json(sync_check.HASHES_FILE, {})
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _SpecHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_address[1]}/spec.json"
+        urls = {"build": url, "core": url}
+        try:
+            first = sync_check.check_all(["build", "core"], urls, {})
+            sync_check.update_hashes(first)
+            hashes = sync_check.load_json(sync_check.HASHES_FILE)
+            second = sync_check.check_all(["build", "core"], urls, hashes)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert [r["status"] for r in first] == ["changed", "changed"]
+        assert first[0]["delta"]["new_hash"] == sync_check.sha256_hex(_SpecHandler.body)
+        assert hashes["build"]["etag"] == '"v1"'
+        assert [r["status"] for r in second] == ["not-modified", "not-modified"]
+        assert _SpecHandler.seen[-2:] == ['"v1"', '"v1"']
@@ -0,0 +1,13 @@
+"""
+End-to-end benchmarks against a local fake Azure DevOps service.
+
+    python -m benchmarks [--scale 0.01] [--workloads ...] [--modes ...]
+                         [--output results.json] [--compare baseline.json]
+
+Workloads (benchmarks.workloads): a single GET, listing 100k builds,
+hydrating 50k work items, a 10 GiB download and a 429-heavy run. Each is
+measured as one process per call (cli), on one pooled client (inprocess)
+and on the async client (async). benchmarks.runner reports requests/s,
+p50 / p99 latency, peak RSS and startup time, and compares JSON reports
+to catch regressions.
+"""
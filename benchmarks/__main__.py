@@ -0,0 +1,7 @@
+"""python -m benchmarks entry point."""
+
+from _shared.cli import run_cli
+from benchmarks.runner import main
+
+if __name__ == "__main__":
+    run_cli(main)
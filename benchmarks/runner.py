@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+Run the benchmark workloads against the local fake server.
+
+Every (workload, mode) pair runs in a fresh worker process, so peak RSS
+and startup time are those of that pair alone. The fake server
+(_shared.fake_server) runs in this process on a loopback port; workers
+reach it through ADO_HTTP_REROUTE with no fixed rate cap and the response
+cache turned off, so the numbers measure the client rather than its pacing.
+
+Reported per pair:
+
+    requests     HTTP requests the server answered (retries included)
+    rps          requests / wall seconds
+    p50_ms       Median request latency (_shared.metrics totals)
+    p99_ms       99th percentile request latency
+    peak_rss_mb  Peak resident memory of the worker (cli: of the largest
+                 script process)
+    startup_ms   cli: ``python <script> --help``; inprocess / async:
+                 importing the operation module
+    errors       Calls that failed after retries
+
+Usage:
+    python -m benchmarks --scale 0.01
+    python -m benchmarks --workloads single_get,throttled --modes inprocess,async
+    python -m benchmarks --output results.json
+    python -m benchmarks --compare baseline.json --threshold 0.1
+"""
+
+import argparse
+import importlib
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None
+
+from _shared import fake_server
+from _shared.errors import AdoConfigError
+from benchmarks.workloads import MODES, ROOT, WORKLOADS, Context
+
+TEST_ORG = "benchorg"
+TEST_PAT = "benchpat"
+TEST_PROJECT = "benchproject"
+STARTUP_RUNS = 3
+DEFAULT_THRESHOLD = 0.1
+
+# metric -> True when larger is better
+COMPARED = {"rps": True, "p50_ms": False, "p99_ms": False, "peak_rss_mb": False, "startup_ms": False}
+# Settings of the caller that would skew the measurements
+_DROPPED_ENV = ("ADO_HTTP_CACHE_DIR", "ADO_METRICS_FILE", "ADO_METRICS_SUMMARY", "ADO_DAEMON_URL", "ADO_RATE_LIMIT_FILE")
+
+
+def percentile(values: Sequence[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile, or None for no values."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def peak_rss_mb(who: str = "self") -> Optional[float]:
+    """Peak RSS of this process ("self") or its largest waited-for child ("children")."""
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_SELF if who == "self" else resource.RUSAGE_CHILDREN)
+    # ru_maxrss is in KiB on Linux, bytes on macOS
+    scale = 1 if sys.platform == "darwin" else 1024
+    return round(usage.ru_maxrss * scale / 1024 ** 2, 1)
+
+
+def _ms(seconds: Optional[float]) -> Optional[float]:
+    return None if seconds is None else round(seconds * 1000, 3)
+
+
+# -- worker ----------------------------------------------------------------------
+
+def _cli_startup(script: str) -> float:
+    """Median seconds of ``python <script> --help``: interpreter start plus imports."""
+    runs = []
+    for _ in range(STARTUP_RUNS):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, str(ROOT / script), "--help"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        runs.append(time.perf_counter() - start)
+    return statistics.median(runs)
+
+
+def _import_startup(script: str, mode: str) -> float:
+    """Seconds to import the operation module (and httpx for the async mode)."""
+    start = time.perf_counter()
+    importlib.import_module(script[:-len(".py")].replace("/", "."))
+    if mode == "async":
+        importlib.import_module("_shared.async_http_client")
+    return time.perf_counter() - start
+
+
+def run_worker(workload: str, mode: str, scale: float, workdir: str) -> Dict[str, Any]:
+    """Run one mode of one workload in this process and return its measurements."""
+    from _shared import metrics
+
+    spec = WORKLOADS[workload]
+    latencies: List[float] = []
+    metrics_file = os.path.join(workdir, f"{workload}-{mode}.metrics.ndjson")
+    if mode == "cli":
+        startup = _cli_startup(spec.script)
+        os.environ["ADO_METRICS_FILE"] = metrics_file
+    else:
+        startup = _import_startup(spec.script, mode)
+        metrics.add_hook(lambda record: latencies.append(record.total))
+
+    start = time.perf_counter()
+    outcome = spec.modes[mode](Context(scale, workdir))
+    seconds = time.perf_counter() - start
+
+    if mode == "cli" and os.path.exists(metrics_file):
+        with open(metrics_file, encoding="utf-8") as fh:
+            latencies = [json.loads(line)["total"] for line in fh if line.strip()]
+        os.remove(metrics_file)
+    return {
+        "items": outcome["items"],
+        "errors": outcome["errors"],
+        "seconds": round(seconds, 3),
+        "p50_ms": _ms(percentile(latencies, 50)),
+        "p99_ms": _ms(percentile(latencies, 99)),
+        "peak_rss_mb": peak_rss_mb("children" if mode == "cli" else "self"),
+        "startup_ms": _ms(startup),
+    }
+
+
+# -- orchestration ---------------------------------------------------------------
+
+def _worker_env(reroute: str) -> Dict[str, str]:
+    env = {k: v for k, v in os.environ.items() if k not in _DROPPED_ENV}
+    env.update({
+        "AZURE_DEVOPS_ORG": TEST_ORG,
+        "AZURE_DEVOPS_PAT": TEST_PAT,
+        "PROJECT_ID": TEST_PROJECT,
+        "ADO_HTTP_REROUTE": reroute,
+        "ADO_RATE_LIMIT_RPS": "0",
+        "PYTHONPATH": os.pathsep.join(filter(None, [str(ROOT), os.environ.get("PYTHONPATH")])),
+    })
+    return env
+
+
+def _spawn(workload: str, mode: str, scale: float, workdir: str, reroute: str) -> Dict[str, Any]:
+    result_path = os.path.join(workdir, f"{workload}-{mode}.json")
+    proc = subprocess.run(
+        [sys.executable, "-m", "benchmarks", "--worker", workload, mode,
+         "--scale", repr(scale), "--workdir", workdir, "--result", result_path],
+        cwd=str(ROOT), env=_worker_env(reroute),
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+    )
+    if proc.returncode or not os.path.exists(result_path):
+        return {"error": proc.stderr.strip()[-1000:] or f"worker exited {proc.returncode}"}
+    with open(result_path, encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def run_benchmarks(
+    workloads: Sequence[str] = tuple(WORKLOADS),
+    modes: Sequence[str] = MODES,
+    scale: float = 1.0,
+) -> Dict[str, Any]:
+    """
+    Run every selected (workload, mode) pair and return the report.
+
+    Returns:
+        {"meta": {...}, "results": [{"workload", "mode", "requests", "rps", ...}]}
+    """
+    results = []
+    with tempfile.TemporaryDirectory(prefix="ado-bench-") as workdir:
+        for name in workloads:
+            spec = WORKLOADS[name]
+            server = fake_server.serve(spec.server(Context(scale, workdir)), port=0)
+            thread = threading.Thread(target=server.serve_forever, daemon=True)
+            thread.start()
+            reroute = f"http://127.0.0.1:{server.server_address[1]}"
+            try:
+                for mode in modes:
+                    record: Dict[str, Any] = {"workload": name, "mode": mode}
+                    if mode in spec.skipped:
+                        record["skipped"] = spec.skipped[mode]
+                    else:
+                        before = server.fake.stats["requests"]
+                        record.update(_spawn(name, mode, scale, workdir, reroute))
+                        requests = server.fake.stats["requests"] - before
+                        record["requests"] = requests
+                        if record.get("seconds"):
+                            record["rps"] = round(requests / record["seconds"], 1)
+                    results.append(record)
+            finally:
+                server.shutdown()
+                server.server_close()
+    return {"meta": _meta(scale), "results": results}
+
+
+def _meta(scale: float) -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=str(ROOT), capture_output=True, text=True, timeout=10,
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "commit": commit,
+        "scale": scale,
+    }
+
+
+# -- reporting -------------------------------------------------------------------
+
+def format_table(report: Dict[str, Any]) -> str:
+    """Human-readable table of a report."""
+    columns = ("workload", "mode", "requests", "rps", "p50_ms", "p99_ms", "peak_rss_mb", "startup_ms", "errors")
+    rows, notes = [columns], {}
+    for record in report["results"]:
+        if "skipped" in record:
+            notes[len(rows)] = f"skipped: {record['skipped']}"
+        elif "error" in record:
+            notes[len(rows)] = f"failed: {record['error'].splitlines()[-1]}"
+        rows.append(tuple("-" if record.get(c) is None else str(record[c]) for c in columns))
+    widths = [max(len(row[i]) for index, row in enumerate(rows) if index not in notes) for i in range(len(columns))]
+    lines = []
+    for index, row in enumerate(rows):
+        if index in notes:
+            lines.append(f"{row[0]:<{widths[0]}}  {row[1]:<{widths[1]}}  {notes[index]}")
+        else:
+            lines.append("  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip())
+    return "\n".join(lines)
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float = DEFAULT_THRESHOLD) -> List[str]:
+    """
+    List the metrics of current that are worse than baseline by more than threshold.
+
+    Pairs or metrics missing from either report are not compared.
+    """
+    before = {(r["workload"], r["mode"]): r for r in baseline.get("results", [])}
+    regressions = []
+    for record in current.get("results", []):
+        old = before.get((record["workload"], record["mode"]))
+        if old is None:
+            continue
+        for metric, higher_is_better in COMPARED.items():
+            was, now = old.get(metric), record.get(metric)
+            if not was or now is None:
+                continue
+            change = (now - was) / was
+            if (-change if higher_is_better else change) > threshold:
+                regressions.append(
+                    f"{record['workload']}/{record['mode']} {metric}: {was} -> {now} ({change:+.1%})"
+                )
+    return regressions
+
+
+def _split(value: Optional[str], known: Sequence[str], what: str) -> List[str]:
+    if not value:
+        return list(known)
+    names = [name.strip() for name in value.split(",") if name.strip()]
+    unknown = [name for name in names if name not in known]
+    if unknown:
+        raise AdoConfigError(f"ERROR: Unknown {what}: {', '.join(unknown)}. Choose from: {', '.join(known)}")
+    return names
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+def main() -> None:
+    """Parse flags, run the benchmarks, print a table and optionally save / compare JSON."""
+    parser = argparse.ArgumentParser(description="Benchmark the API clients against a local fake Azure DevOps service.")
+    parser.add_argument("--workloads", default=None, help=f"Comma-separated workloads (default: all of {', '.join(WORKLOADS)})")
+    parser.add_argument("--modes", default=None, help=f"Comma-separated modes (default: all of {', '.join(MODES)})")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply every workload size and call count (default 1.0)")
+    parser.add_argument("--output", default=None, help="Write the report as JSON to this file")
+    parser.add_argument("--compare", default=None, help="Baseline JSON report; exit 1 when a metric regressed")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"Allowed relative regression for --compare (default {DEFAULT_THRESHOLD})")
+    parser.add_argument("--worker", nargs=2, metavar=("WORKLOAD", "MODE"), help=argparse.SUPPRESS)
+    parser.add_argument("--workdir", help=argparse.SUPPRESS)
+    parser.add_argument("--result", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.scale <= 0:
+        raise AdoConfigError(f"ERROR: --scale must be positive, got {args.scale}.")
+    if args.worker:
+        result = run_worker(args.worker[0], args.worker[1], args.scale, args.workdir)
+        with open(args.result, "w", encoding="utf-8") as fh:
+            json.dump(result, fh)
+        return
+
+    baseline = None
+    if args.compare:
+        try:
+            with open(args.compare, encoding="utf-8") as fh:
+                baseline = json.load(fh)
+        except (OSError, ValueError) as exc:
+            raise AdoConfigError(f"ERROR: Cannot read baseline {args.compare}: {exc}") from exc
+
+    report = run_benchmarks(
+        _split(args.workloads, list(WORKLOADS), "workload"),
+        _split(args.modes, MODES, "mode"),
+        args.scale,
+    )
+    print(format_table(report))
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"Saved report to {args.output}")
+    if baseline is not None:
+        regressions = compare(baseline, report, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions beyond {args.threshold:.0%} against {args.compare}")
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Offline unit tests for benchmarks/runner.py
+
+Validates:
+  - Nearest-rank percentiles
+  - Regressions beyond the threshold are reported in the right direction
+  - A scaled-down workload runs end to end against the fake server
+  - The CLI mode counts the items the script actually printed
+"""
+
+import pytest
+
+from benchmarks.runner import compare, format_table, percentile, run_benchmarks
+
+
+def _report(**metrics):
+    return {"results": [dict({"workload": "single_get", "mode": "inprocess"}, **metrics)]}
+
+
+class TestReport:
+    """Validate report arithmetic."""
+
+    @pytest.mark.offline
+    @pytest.mark.benchmarks
+    def test_percentile(self):
+        values = list(range(1, 101))
+        assert percentile(values, 50) == 50
+        assert percentile(values, 99) == 99
+        assert percentile([], 50) is None
+
+    @pytest.mark.offline
+    @pytest.mark.benchmarks
+    def test_compare_flags_regressions_only(self):
+        baseline = _report(rps=100.0, p99_ms=10.0, peak_rss_mb=50.0)
+        current = _report(rps=120.0, p99_ms=12.0, peak_rss_mb=51.0)
+        assert compare(baseline, current, threshold=0.1) == ["single_get/inprocess p99_ms: 10.0 -> 12.0 (+20.0%)"]
+        assert compare(baseline, _report(rps=85.0), threshold=0.1) == ["single_get/inprocess rps: 100.0 -> 85.0 (-15.0%)"]
+        assert compare(baseline, {"results": []}) == []
+
+
+class TestRun:
+    """Validate a real, scaled-down run."""
+
+    @pytest.mark.offline
+    @pytest.mark.benchmarks
+    def test_scaled_run(self):
+        report = run_benchmarks(["single_get", "list_builds"], ["inprocess", "async"], scale=0.002)
+
+        records = {(r["workload"], r["mode"]): r for r in report["results"]}
+        single = records[("single_get", "inprocess")]
+        assert "error" not in single, single.get("error")
+        assert (single["requests"], single["items"], single["errors"]) == (2, 2, 0)
+        assert single["p50_ms"] > 0 and single["rps"] > 0
+        assert records[("list_builds", "inprocess")]["items"] == 200
+        assert "skipped" in records[("list_builds", "async")]
+        assert report["meta"]["scale"] == 0.002
+        assert "single_get" in format_table(report)
+
+    @pytest.mark.offline
+    @pytest.mark.benchmarks
+    def test_cli_counts_listed_items(self):
+        report = run_benchmarks(["list_builds"], ["cli"], scale=0.002)
+
+        record = report["results"][0]
+        assert "error" not in record, record.get("error")
+        assert (record["items"], record["errors"]) == (200, 0)
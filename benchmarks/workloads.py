@@ -0,0 +1,278 @@
+"""
+Benchmark workloads.
+
+Each workload names the fake server settings it needs and one function per
+mode. A mode function runs inside a fresh worker process (see
+benchmarks.runner), with ADO_HTTP_REROUTE pointing at the fake server, and
+returns {"items": ..., "errors": ...}.
+
+    cli        One ``python <script>`` process per call, the way shell
+               pipelines use the repo.
+    inprocess  The generated functions on one pooled AdoClient.
+    async      The ``<operation>_async`` variants gathered on AsyncAdoClient.
+"""
+
+import asyncio
+import os
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from _shared.codec import loads
+from _shared.errors import AdoError
+from _shared.fake_server import FakeConfig
+
+ROOT = Path(__file__).resolve().parent.parent
+MODES = ("cli", "inprocess", "async")
+
+# Full-size workloads; --scale multiplies every count and size
+BUILD_ID = "42"
+ATTACHMENT_ID = "a1b2c3d4-0000-0000-0000-000000000001"
+BUILD_COUNT = 100_000
+BUILD_PAGE_SIZE = 1000
+WORK_ITEM_COUNT = 50_000
+DOWNLOAD_BYTES = 10 * 1024 ** 3
+CALLS = 1000
+# One interpreter start per call, so the CLI mode makes fewer calls
+CLI_CALLS = 100
+THROTTLE_RATE = 0.3
+ASYNC_CONCURRENCY = 16
+WIQL = "SELECT [System.Id] FROM WorkItems"
+
+
+@dataclass
+class Context:
+    """Inputs shared by every mode function."""
+
+    scale: float
+    workdir: str
+
+    def scaled(self, count: int) -> int:
+        return max(1, int(count * self.scale))
+
+
+@dataclass
+class Workload:
+    """One benchmark scenario."""
+
+    name: str
+    description: str
+    script: str
+    server: Callable[[Context], FakeConfig]
+    modes: Dict[str, Callable[[Context], Dict[str, int]]] = field(default_factory=dict)
+    # mode -> why the mode is not measured
+    skipped: Dict[str, str] = field(default_factory=dict)
+
+
+# -- helpers ---------------------------------------------------------------------
+
+def run_script(
+    script: str,
+    args: Optional[List[str]] = None,
+    env: Optional[Dict[str, str]] = None,
+    capture: bool = False,
+) -> Optional[str]:
+    """
+    Run one operation script as a CLI call; a non-zero exit raises AdoError.
+
+    Returns the script's stdout when capture is set, otherwise None (the
+    output is discarded).
+    """
+    result = subprocess.run(
+        [sys.executable, str(ROOT / script)] + list(args or []),
+        env=dict(os.environ, **(env or {})),
+        stdout=subprocess.PIPE if capture else subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+    )
+    if result.returncode:
+        raise AdoError(f"{script} exited {result.returncode}: {result.stderr.strip()[-500:]}")
+    return result.stdout
+
+
+def _repeat(calls: int, call: Callable[[], Any]) -> Dict[str, int]:
+    errors = 0
+    for _ in range(calls):
+        try:
+            call()
+        except AdoError:
+            errors += 1
+    return {"items": calls - errors, "errors": errors}
+
+
+def _gather(calls: int, call: Callable[[Any], Any]) -> Dict[str, int]:
+    from _shared.async_http_client import AsyncAdoClient
+
+    async def run():
+        async with AsyncAdoClient.from_env(max_concurrency=ASYNC_CONCURRENCY) as client:
+            return await asyncio.gather(*(call(client) for _ in range(calls)), return_exceptions=True)
+
+    results = asyncio.run(run())
+    errors = sum(isinstance(result, AdoError) for result in results)
+    for result in results:
+        if isinstance(result, BaseException) and not isinstance(result, AdoError):
+            raise result
+    return {"items": calls - errors, "errors": errors}
+
+
+def _client():
+    from _shared.http_client import AdoClient
+    return AdoClient.from_env()
+
+
+def _project() -> str:
+    return os.environ["PROJECT_ID"]
+
+
+def _download_path(ctx: Context) -> str:
+    return os.path.join(ctx.workdir, "download.bin")
+
+
+def _check_download(ctx: Context, written: int) -> Dict[str, int]:
+    path = _download_path(ctx)
+    size = os.path.getsize(path)
+    os.remove(path)
+    expected = ctx.scaled(DOWNLOAD_BYTES)
+    if written != expected or size != expected:
+        raise AdoError(f"Downloaded {size} bytes ({written} reported), expected {expected}")
+    return {"items": written, "errors": 0}
+
+
+# -- single GET ------------------------------------------------------------------
+
+def _single_get_cli(ctx: Context, calls: int) -> Dict[str, int]:
+    return _repeat(calls, lambda: run_script("Build/Builds/get_build.py", env={"BUILD_ID": BUILD_ID}))
+
+
+def _single_get_inprocess(ctx: Context, calls: int) -> Dict[str, int]:
+    from Build.Builds.get_build import get_build
+    client = _client()
+    return _repeat(calls, lambda: get_build(client, _project(), BUILD_ID))
+
+
+def _single_get_async(ctx: Context, calls: int) -> Dict[str, int]:
+    from Build.Builds.get_build import get_build_async
+    return _gather(calls, lambda client: get_build_async(client, _project(), BUILD_ID))
+
+
+# -- paginated listing -----------------------------------------------------------
+
+def _list_builds_cli(ctx: Context) -> Dict[str, int]:
+    data = loads(run_script("Build/Builds/list_builds.py", ["--all-pages"], capture=True))
+    count = len(data.get("value") or [])
+    expected = ctx.scaled(BUILD_COUNT)
+    if count != expected:
+        raise AdoError(f"Listed {count} builds, expected {expected}")
+    return {"items": count, "errors": 0}
+
+
+def _list_builds_inprocess(ctx: Context) -> Dict[str, int]:
+    from Build.Builds.list_builds import iter_list_builds
+    count = sum(1 for _ in iter_list_builds(_client(), _project(), prefetch=True))
+    return {"items": count, "errors": 0}
+
+
+# -- work item hydration ---------------------------------------------------------
+
+def _hydrate_cli(ctx: Context) -> Dict[str, int]:
+    output = os.path.join(ctx.workdir, "work_items.jsonl")
+    run_script("WorkItemTracking/WorkItems/hydrate_work_items.py", ["--query", WIQL, "--output", output])
+    with open(output, encoding="utf-8") as fh:
+        count = sum(1 for _ in fh)
+    os.remove(output)
+    return {"items": count, "errors": 0}
+
+
+def _hydrate_inprocess(ctx: Context) -> Dict[str, int]:
+    from WorkItemTracking.WorkItems.hydrate_work_items import hydrate_work_items
+    count = sum(1 for _ in hydrate_work_items(_client(), WIQL, project=_project()))
+    return {"items": count, "errors": 0}
+
+
+def _hydrate_async(ctx: Context) -> Dict[str, int]:
+    from _shared.async_http_client import AsyncAdoClient
+    from WorkItemTracking.Wiql.query_work_items import query_work_items_async
+    from WorkItemTracking.WorkItems.get_work_items_batch import get_work_items_batch_async
+    from WorkItemTracking.WorkItems.hydrate_work_items import chunked
+
+    async def run():
+        async with AsyncAdoClient.from_env(max_concurrency=ASYNC_CONCURRENCY) as client:
+            data = await query_work_items_async(client, _project(), WIQL)
+            ids = [item["id"] for item in data.get("workItems") or []]
+            pages = await asyncio.gather(*(
+                get_work_items_batch_async(client, _project(), ids=chunk, as_of=data.get("asOf"), error_policy="omit")
+                for chunk in chunked(ids)
+            ))
+            return sum(len(page.get("value", [])) for page in pages)
+
+    return {"items": asyncio.run(run()), "errors": 0}
+
+
+# -- artifact download -----------------------------------------------------------
+
+def _download_cli(ctx: Context) -> Dict[str, int]:
+    path = _download_path(ctx)
+    run_script("WorkItemTracking/Attachments/get_attachments.py", ["--output", path], env={"RESOURCE_ID": ATTACHMENT_ID})
+    return _check_download(ctx, os.path.getsize(path))
+
+
+def _download_inprocess(ctx: Context) -> Dict[str, int]:
+    from WorkItemTracking.Attachments.get_attachments import get_attachments
+    written = get_attachments(_client(), _project(), ATTACHMENT_ID, destination=_download_path(ctx))
+    return _check_download(ctx, written)
+
+
+def _download_async(ctx: Context) -> Dict[str, int]:
+    from _shared.async_http_client import AsyncAdoClient
+    from WorkItemTracking.Attachments.get_attachments import get_attachments_async
+
+    async def run():
+        async with AsyncAdoClient.from_env() as client:
+            return await get_attachments_async(client, _project(), ATTACHMENT_ID, destination=_download_path(ctx))
+
+    return _check_download(ctx, asyncio.run(run()))
+
+
+# -- registry --------------------------------------------------------------------
+
+WORKLOADS: Dict[str, Workload] = {w.name: w for w in (
+    Workload(
+        "single_get", "GET one build, repeated",
+        "Build/Builds/get_build.py",
+        server=lambda ctx: FakeConfig(),
+        modes={
+            "cli": lambda ctx: _single_get_cli(ctx, ctx.scaled(CLI_CALLS)),
+            "inprocess": lambda ctx: _single_get_inprocess(ctx, ctx.scaled(CALLS)),
+            "async": lambda ctx: _single_get_async(ctx, ctx.scaled(CALLS)),
+        },
+    ),
+    Workload(
+        "list_builds", "List 100k builds in pages of 1000",
+        "Build/Builds/list_builds.py",
+        server=lambda ctx: FakeConfig(page_size=BUILD_PAGE_SIZE, collection_size=ctx.scaled(BUILD_COUNT)),
+        modes={"cli": _list_builds_cli, "inprocess": _list_builds_inprocess},
+        skipped={"async": "generated operations have no async paginator"},
+    ),
+    Workload(
+        "hydrate", "WIQL query for 50k work items, fetched in workitemsbatch chunks",
+        "WorkItemTracking/WorkItems/hydrate_work_items.py",
+        server=lambda ctx: FakeConfig(collection_sizes={"_apis/wit/wiql": ctx.scaled(WORK_ITEM_COUNT)}),
+        modes={"cli": _hydrate_cli, "inprocess": _hydrate_inprocess, "async": _hydrate_async},
+    ),
+    Workload(
+        "download", "Download a 10 GiB attachment",
+        "WorkItemTracking/Attachments/get_attachments.py",
+        server=lambda ctx: FakeConfig(content_size=ctx.scaled(DOWNLOAD_BYTES)),
+        modes={"cli": _download_cli, "inprocess": _download_inprocess, "async": _download_async},
+    ),
+    Workload(
+        "throttled", "GET one build while 30% of responses are 429",
+        "Build/Builds/get_build.py",
+        server=lambda ctx: FakeConfig(throttle_rate=THROTTLE_RATE, retry_after=0, seed=1),
+        modes={
+            "cli": lambda ctx: _single_get_cli(ctx, ctx.scaled(CLI_CALLS)),
+            "inprocess": lambda ctx: _single_get_inprocess(ctx, ctx.scaled(CALLS)),
+            "async": lambda ctx: _single_get_async(ctx, ctx.scaled(CALLS)),
+        },
+    ),
+)}
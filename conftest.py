@@ -0,0 +1,89 @@
+# conftest.py
+"""
+Shared fixtures for the offline tests.
+
+The generated tests import each operation script and call it in-process
+with HTTP mocked by ``responses``, so no test pays for an interpreter start.
+"""
+
+import runpy
+import sys
+
+import pytest
+import responses
+
+from _shared import rate_limit, response_cache
+from _shared.cli import run_cli
+from _shared.http_client import AdoClient
+
+TEST_ORG = "testorg"
+TEST_PAT = "fakepat1234567890"
+TEST_PROJECT = "a1b2c3d4-e5f6-7890-abcd-ef1234567890"
+
+
+@pytest.fixture
+def ado_env(monkeypatch):
+    """
+    Set the standard env vars and disable pacing and caching.
+
+    Returns the env vars that were set, so tests can reuse the values.
+    """
+    env = {
+        "AZURE_DEVOPS_ORG": TEST_ORG,
+        "AZURE_DEVOPS_PAT": TEST_PAT,
+        "PROJECT_ID": TEST_PROJECT,
+    }
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    rate_limit.configure_rate_limit(enabled=False)
+    response_cache.configure_cache("")
+    yield env
+    rate_limit.configure_rate_limit(enabled=False)
+    response_cache.configure_cache("")
+
+
+@pytest.fixture
+def ado_client(ado_env):
+    """AdoClient for the test organisation and PAT."""
+    return AdoClient(ado_env["AZURE_DEVOPS_ORG"], ado_env["AZURE_DEVOPS_PAT"])
+
+
+@pytest.fixture
+def run_main(ado_env, monkeypatch, capsys):
+    """
+    Run a script in-process the way ``python script.py`` would.
+
+    Call it as ``run_main(module.main, env={...}, args=[...])``; an env
+    value of None removes the variable. Older scripts without a main()
+    are run from their path instead: ``run_main(SCRIPT, ...)``. HTTP is
+    mocked with no responses registered, so a call that reaches the
+    network fails instead of leaving the machine.
+
+    Returns (exit_code, stdout + stderr).
+    """
+    def run(target, env=None, args=None):
+        for name, value in (env or {}).items():
+            if value is None:
+                monkeypatch.delenv(name, raising=False)
+            else:
+                monkeypatch.setenv(name, value)
+        script = target if isinstance(target, str) else target.__module__
+        monkeypatch.setattr(sys, "argv", [script] + list(args or []))
+        code = 0
+        with responses.RequestsMock(assert_all_requests_are_fired=False):
+            try:
+                if isinstance(target, str):
+                    runpy.run_path(target, run_name="__main__")
+                else:
+                    run_cli(target)
+            except SystemExit as exc:
+                # sys.exit("message") prints the message and exits 1
+                if isinstance(exc.code, str):
+                    print(exc.code, file=sys.stderr)
+                    code = 1
+                else:
+                    code = exc.code or 0
+        captured = capsys.readouterr()
+        return code, captured.out + captured.err
+
+    return run
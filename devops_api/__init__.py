@@ -0,0 +1,12 @@
+"""
+Single entry point for every generated Azure DevOps operation.
+
+    python -m devops_api <domain> <resource> <operation> [operation flags]
+    python -m devops_api --list [domain [resource]]
+    python -m devops_api --batch calls.jsonl [--workers N]
+
+Operations are looked up in the generated registry (devops_api/registry.py)
+and imported on demand, so one call pays for one operation module only.
+Batch mode runs many operations in one process over one pooled client;
+see devops_api.dispatcher for the JSON Lines format.
+"""
@@ -0,0 +1,7 @@
+"""python -m devops_api entry point."""
+
+from _shared.cli import run_cli
+from devops_api.dispatcher import main
+
+if __name__ == "__main__":
+    run_cli(main)
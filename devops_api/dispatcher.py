@@ -0,0 +1,187 @@
+"""
+Dispatcher behind ``python -m devops_api``.
+
+A single call hands the remaining arguments to the operation's own CLI:
+
+    python -m devops_api core projects list_projects --max-items 50
+
+Names are matched case-insensitively. Environment-variable parameters
+(AZURE_DEVOPS_ORG, AZURE_DEVOPS_PAT, PROJECT_ID, ...) work exactly as they do
+for the standalone scripts.
+
+Batch mode reads JSON Lines, one call per line, and writes one result line
+per call in input order:
+
+    {"id": 1, "operation": "Core/Projects/list_projects", "all_pages": true}
+    {"id": 2, "operation": "Build/Builds/get_builds", "args": {"project": "P", "build_id": "42"}}
+
+    {"id": 1, "operation": "Core/Projects/list_projects", "ok": true, "result": {...}}
+    {"id": 2, "operation": "Build/Builds/get_builds", "ok": false, "status": 404, "error": "..."}
+
+``args`` are keyword arguments of the operation function. ``all_pages`` /
+``max_items`` follow pagination through ``iter_<operation>``.
+"""
+
+import argparse
+import difflib
+import importlib
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from types import ModuleType
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from _shared.codec import dumps, loads
+from _shared.errors import AdoConfigError, AdoError
+from devops_api.registry import OPERATIONS
+
+
+def _match(name: str, choices: Iterable[str], kind: str) -> str:
+    """Case-insensitive lookup of name in choices, with a suggestion on a miss."""
+    choices = list(choices)
+    by_lower = {c.lower(): c for c in choices}
+    found = by_lower.get(name.lower())
+    if found is None:
+        close = difflib.get_close_matches(name.lower(), by_lower, n=3)
+        hint = f" Did you mean: {', '.join(by_lower[c] for c in close)}?" if close else ""
+        raise AdoConfigError(f"ERROR: Unknown {kind} '{name}'.{hint}")
+    return found
+
+
+def resolve(domain: str, resource: str, operation: str) -> Tuple[str, str, str]:
+    """Return the registry spelling of (domain, resource, operation)."""
+    domain = _match(domain, OPERATIONS, "domain")
+    resource = _match(resource, OPERATIONS[domain], f"resource in {domain}")
+    operation = _match(operation, OPERATIONS[domain][resource], f"operation in {domain}/{resource}")
+    return domain, resource, operation
+
+
+def parse_operation(name: str) -> Tuple[str, str, str]:
+    """Resolve "Domain/Resource/operation" (or dot-separated)."""
+    parts = name.replace(".", "/").split("/")
+    if len(parts) != 3:
+        raise AdoConfigError(f"ERROR: Operation must be Domain/Resource/operation, got '{name}'.")
+    return resolve(*parts)
+
+
+def load_operation(domain: str, resource: str, operation: str) -> ModuleType:
+    """Import the module of one operation."""
+    domain, resource, operation = resolve(domain, resource, operation)
+    return importlib.import_module(f"{domain}.{resource}.{operation}")
+
+
+def run_operation(domain: str, resource: str, operation: str, argv: List[str]) -> None:
+    """Run an operation's CLI main() with argv as its command-line flags."""
+    module = load_operation(domain, resource, operation)
+    saved = sys.argv
+    sys.argv = [module.__file__] + list(argv)
+    try:
+        module.main()
+    finally:
+        sys.argv = saved
+
+
+# -- batch --------------------------------------------------------------------
+
+def _call(client: Any, spec: Dict[str, Any]) -> Any:
+    """Execute one batch call and return its JSON-serialisable result."""
+    domain, resource, operation = parse_operation(str(spec.get("operation", "")))
+    module = importlib.import_module(f"{domain}.{resource}.{operation}")
+    kwargs = spec.get("args") or {}
+    if spec.get("all_pages") or spec.get("max_items"):
+        paged = getattr(module, f"iter_{operation}", None)
+        if paged is None:
+            raise AdoConfigError(f"ERROR: {operation} is not a paged list operation.")
+        items = list(paged(client, **kwargs, max_items=spec.get("max_items"), prefetch=True))
+        return {"count": len(items), "value": items}
+    return getattr(module, operation)(client, **kwargs)
+
+
+def _result(client: Any, line_no: int, line: str) -> Dict[str, Any]:
+    """Run one batch line, turning every failure into an error record."""
+    try:
+        spec = loads(line)
+    except ValueError as exc:
+        return {"id": line_no, "ok": False, "error": f"ERROR: Invalid JSON on line {line_no}: {exc}"}
+    if not isinstance(spec, dict):
+        return {"id": line_no, "ok": False, "error": f"ERROR: Line {line_no} is not a JSON object."}
+    record = {"id": spec.get("id", line_no), "operation": spec.get("operation")}
+    try:
+        record.update(ok=True, result=_call(client, spec))
+    except AdoError as exc:
+        record.update(ok=False, status=exc.status, error=exc.message)
+    except TypeError as exc:
+        record.update(ok=False, error=f"ERROR: Bad arguments: {exc}")
+    except Exception as exc:
+        # One bad call must not end the stream, e.g. a non-JSON 200 body
+        record.update(ok=False, error=f"ERROR: {type(exc).__name__}: {exc}")
+    return record
+
+
+def run_batch(client: Any, lines: Iterable[str], workers: int = 1) -> Iterator[Dict[str, Any]]:
+    """
+    Run JSON Lines batch calls, yielding one result record per call in order.
+
+    Args:
+        client: AdoClient shared by every call (one connection pool).
+        lines: JSON Lines input; blank lines are skipped.
+        workers: Calls run concurrently on this many threads.
+    """
+    calls = [(n, line) for n, line in enumerate(lines, start=1) if line.strip()]
+    if workers <= 1:
+        for n, line in calls:
+            yield _result(client, n, line)
+        return
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(lambda call: _result(client, *call), calls)
+
+
+# -- CLI ----------------------------------------------------------------------
+
+def _list(names: List[str]) -> None:
+    """Print domains, the resources of a domain, or the operations of a resource."""
+    if not names:
+        print("\n".join(OPERATIONS))
+        return
+    domain = _match(names[0], OPERATIONS, "domain")
+    if len(names) == 1:
+        print("\n".join(OPERATIONS[domain]))
+        return
+    resource = _match(names[1], OPERATIONS[domain], f"resource in {domain}")
+    print("\n".join(OPERATIONS[domain][resource]))
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Parse the dispatcher's own flags, then list, batch or run one operation."""
+    argv = sys.argv[1:] if argv is None else argv
+    # Everything after the operation name belongs to the operation's own CLI
+    if len(argv) >= 3 and not any(a.startswith("-") for a in argv[:3]):
+        run_operation(*argv[:3], argv[3:])
+        return
+
+    parser = argparse.ArgumentParser(
+        prog="python -m devops_api",
+        description="Run any generated Azure DevOps operation from one entry point.",
+    )
+    parser.add_argument("--list", action="store_true", help="List domains, resources or operations")
+    parser.add_argument("--batch", metavar="FILE", help="Run the JSON Lines calls in FILE ('-' for stdin)")
+    parser.add_argument("--workers", type=int, default=1, help="Concurrent batch calls (default 1)")
+    parser.add_argument("names", nargs="*", help="<domain> <resource> <operation> [operation flags]")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        _list(args.names)
+        return
+    if args.batch:
+        from _shared.http_client import AdoClient
+
+        client = AdoClient.from_env()
+        source = sys.stdin if args.batch == "-" else open(args.batch, "r", encoding="utf-8")
+        failed = 0
+        with source:
+            for record in run_batch(client, source, workers=args.workers):
+                failed += not record["ok"]
+                print(dumps(record, default=str), flush=True)
+        if failed:
+            sys.exit(1)
+        return
+    parser.error("expected <domain> <resource> <operation>, --list or --batch")
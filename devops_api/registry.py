@@ -0,0 +1,1954 @@
+# AUTO-GENERATED by _generator/registry.py — do not edit by hand.
+# Source of truth: _generator/definitions/
+"""
+Registry of the 1069 generated operations: domain -> resource -> operations.
+
+Each operation lives in the module ``<Domain>.<Resource>.<operation>`` and
+exposes a function of the same name.
+"""
+
+OPERATIONS = {
+    "Account": {
+        "Accounts": (
+            "list_accounts",
+        ),
+    },
+    "AdvancedSecurity": {
+        "Alerts": (
+            "get_alerts",
+            "list_alerts",
+            "update_alerts",
+        ),
+        "AlertsBatch": (
+            "list_alerts_batch",
+        ),
+        "Analysis": (
+            "list_analysis",
+        ),
+        "Instances": (
+            "list_instances",
+        ),
+        "Metadata2": (
+            "get_metadata2",
+        ),
+        "MetadataBatch": (
+            "list_metadata_batch",
+        ),
+        "MeterUsage": (
+            "get_meter_usage",
+        ),
+        "OrgEnablement": (
+            "get_org_enablement",
+            "update_org_enablement",
+        ),
+        "OrgMeterUsageEstimate": (
+            "get_org_meter_usage_estimate",
+        ),
+        "ProjectEnablement": (
+            "get_project_enablement",
+            "update_project_enablement",
+        ),
+        "ProjectMeterUsageEstimate": (
+            "get_project_meter_usage_estimate",
+        ),
+        "RepoEnablement": (
+            "get_repo_enablement",
+            "update_repo_enablement",
+        ),
+        "RepoMeterUsageEstimate": (
+            "get_repo_meter_usage_estimate",
+        ),
+        "SummaryDashboard": (
+            "get_alert_summary_for_org",
+            "get_enablement_summary_for_org",
+            "list_summary_dashboard",
+        ),
+    },
+    "ApprovalsAndChecks": {
+        "Approvals": (
+            "get_approvals",
+            "query_approvals",
+            "update_approvals",
+        ),
+        "CheckConfigurations": (
+            "create_check_configurations",
+            "delete_check_configurations",
+            "get_check_configurations",
+            "list_check_configurations",
+            "query_check_configurations",
+            "update_check_configurations",
+        ),
+        "CheckEvaluations": (
+            "create_evaluate",
+            "get_check_evaluations",
+            "update_check_evaluations",
+        ),
+        "PipelinePermissions": (
+            "get_pipeline_permissions",
+            "update_pipeline_permisions_for_resource",
+            "update_pipeline_permisions_for_resources",
+        ),
+    },
+    "Artifacts": {
+        "ArtifactDetails": (
+            "get_badge",
+            "get_package",
+            "get_package_version",
+            "get_package_versions",
+            "get_packages",
+            "get_packageversionprovenance",
+            "query_package_metrics",
+            "query_package_version_metrics",
+        ),
+        "ChangeTracking": (
+            "get_feed_change",
+            "get_feed_changes",
+            "get_package_changes",
+        ),
+        "FeedManagement": (
+            "create_feed",
+            "create_feed_view",
+            "delete_feed",
+            "delete_feed_view",
+            "get_feed",
+            "get_feed_permissions",
+            "get_feed_view",
+            "get_feed_views",
+            "get_feeds",
+            "set_feed_permissions",
+            "update_feed",
+            "update_feed_view",
+        ),
+        "FeedRecycleBin": (
+            "delete_permanent_delete_feed",
+            "delete_restore_deleted_feed",
+            "list_feed_recycle_bin",
+        ),
+        "Provenance": (
+            "create_session",
+        ),
+        "RecycleBin": (
+            "delete_empty_recycle_bin",
+            "get_recycle_bin_package",
+            "get_recycle_bin_package_version",
+            "get_recycle_bin_package_versions",
+            "get_recycle_bin_packages",
+        ),
+        "RetentionPolicies": (
+            "delete_retention_policy",
+            "get_retention_policy",
+            "set_retention_policy",
+        ),
+        "ServiceSettings": (
+            "get_globalpermissions",
+            "set_globalpermissions",
+        ),
+    },
+    "ArtifactsPackageTypes": {
+        "Cargo": (
+            "delete_package_version",
+            "delete_package_version_from_recycle_bin",
+            "get_package_version",
+            "get_packageversionfromrecyclebin",
+            "get_upstreaming_behavior",
+            "set_upstreaming_behavior",
+            "update_package_version",
+            "update_package_versions",
+            "update_recycle_bin_package_versions",
+            "update_restore_package_version_from_recycle_bin",
+        ),
+        "Maven": (
+            "delete_packageversion",
+            "delete_packageversionfromrecyclebin",
+            "get_downloadpackage",
+            "update_recycle_bin_packages",
+        ),
+        "Npm": (
+            "delete_scoped_package_version_from_recycle_bin",
+            "delete_unpublish_package",
+            "delete_unpublish_scoped_package",
+            "get_downloadscopedpackage",
+            "get_packagereadme",
+            "get_packageupstreamingbehavior",
+            "get_packageversion",
+            "get_scopedpackagereadme",
+            "get_scopedpackageupstreamingbehavior",
+            "get_scopedpackageversion",
+            "get_scopedpackageversionfromrecyclebin",
+            "set_scoped_upstreaming_behavior",
+            "update_package",
+            "update_packages",
+            "update_restore_scoped_package_version_from_recycle_bin",
+            "update_scoped_package",
+        ),
+        "Nuget": (
+            "get_download_package",
+        ),
+    },
+    "Audit": {
+        "Actions": (
+            "list_actions",
+        ),
+        "AuditLog": (
+            "query_audit_log",
+        ),
+        "DownloadLog": (
+            "get_download_log",
+        ),
+        "Streams": (
+            "create_streams",
+            "delete_streams",
+            "query_all_streams",
+            "query_stream_by_id",
+            "update_status",
+            "update_stream",
+        ),
+    },
+    "Build": {
+        "Artifacts": (
+            "create_artifacts",
+            "list_artifacts",
+        ),
+        "Attachments": (
+            "get_attachments",
+            "list_attachments",
+        ),
+        "Authorizedresources": (
+            "list_authorizedresources",
+            "update_authorize_project_resources",
+        ),
+        "Badge": (
+            "get_badge",
+            "get_build_badge_data",
+        ),
+        "Builds": (
+            "delete_builds",
+            "get_build",
+            "get_build_changes",
+            "get_build_log",
+            "get_build_logs",
+            "get_build_work_items_refs",
+            "get_build_work_items_refs_from_commits",
+            "get_builds",
+            "get_changes_between_builds",
+            "get_retention_leases_for_build",
+            "get_work_items_between_builds",
+            "list_builds",
+            "run_builds",
+            "update_build",
+            "update_builds",
+        ),
+        "Controllers": (
+            "get_controllers",
+            "list_controllers",
+        ),
+        "Definitions": (
+            "create_definitions",
+            "delete_definitions",
+            "get_definition_revisions",
+            "get_definitions",
+            "list_definitions",
+            "update_definitions",
+            "update_restore_definition",
+        ),
+        "Folders": (
+            "create_folders",
+            "delete_folders",
+            "list_folders",
+            "update_folders",
+        ),
+        "GeneralSettings": (
+            "get_general_settings",
+            "update_general_settings",
+        ),
+        "History": (
+            "get_history",
+        ),
+        "Latest": (
+            "get_latest",
+        ),
+        "Leases": (
+            "create_leases",
+            "delete_leases",
+            "get_leases",
+            "get_retention_leases_by_minimal_retention_leases",
+            "update_leases",
+        ),
+        "Metrics": (
+            "get_definition_metrics",
+            "get_project_metrics",
+        ),
+        "Options": (
+            "list_options",
+        ),
+        "Properties": (
+            "get_build_properties",
+            "get_definition_properties",
+            "update_build_properties",
+            "update_definition_properties",
+        ),
+        "Report": (
+            "get_report",
+        ),
+        "ResourceUsage": (
+            "get_resource_usage",
+        ),
+        "Resources": (
+            "list_resources",
+            "update_authorize_definition_resources",
+        ),
+        "Retention": (
+            "get_retention",
+            "update_retention",
+        ),
+        "Settings": (
+            "get_settings",
+            "update_settings",
+        ),
+        "SourceProviders": (
+            "create_restore_webhooks",
+            "get_file_contents",
+            "get_path_contents",
+            "get_pull_request",
+            "list_branches",
+            "list_repositories",
+            "list_source_providers",
+            "list_webhooks",
+        ),
+        "Stages": (
+            "update_stages",
+        ),
+        "Status": (
+            "get_status",
+        ),
+        "Tags": (
+            "create_build_tag",
+            "create_build_tags",
+            "create_definition_tag",
+            "create_definition_tags",
+            "delete_build_tag",
+            "delete_definition_tag",
+            "delete_tag",
+            "get_build_tags",
+            "get_definition_tags",
+            "get_tags",
+            "update_build_tags",
+            "update_definition_tags",
+        ),
+        "Templates": (
+            "delete_templates",
+            "get_templates",
+            "list_templates",
+            "set_save_template",
+        ),
+        "Timeline": (
+            "get_timeline",
+        ),
+        "Yaml": (
+            "get_yaml",
+        ),
+    },
+    "Core": {
+        "Avatar": (
+            "delete_project_avatar",
+            "set_project_avatar",
+        ),
+        "CategorizedTeams": (
+            "get_categorized_teams",
+        ),
+        "Processes": (
+            "get_processes",
+            "list_processes",
+        ),
+        "Projects": (
+            "create_projects",
+            "delete_projects",
+            "get_project_properties",
+            "get_projects",
+            "list_projects",
+            "set_project_properties",
+            "update_projects",
+        ),
+        "Teams": (
+            "create_teams",
+            "delete_teams",
+            "get_team_members_with_extended_properties",
+            "get_teams",
+            "list_all_teams",
+            "list_teams",
+            "update_teams",
+        ),
+    },
+    "Dashboard": {
+        "Dashboards": (
+            "create_dashboards",
+            "delete_dashboards",
+            "get_dashboards",
+            "list_dashboards",
+            "set_replace_dashboard",
+            "set_replace_dashboards",
+        ),
+        "WidgetTypes": (
+            "get_widget_metadata",
+            "get_widget_types",
+        ),
+        "Widgets": (
+            "create_widgets",
+            "delete_widgets",
+            "get_replace_widget",
+            "get_replace_widgets",
+            "get_widget",
+            "get_widgets",
+        ),
+    },
+    "DelegatedAuth": {
+        "RegistrationSecret": (
+            "create_registration_secret",
+            "set_rotate_secret",
+        ),
+    },
+    "DistributedTask": {
+        "Agentclouds": (
+            "create_agentclouds",
+            "delete_agentclouds",
+            "get_agentclouds",
+            "list_agentclouds",
+            "update_agentclouds",
+        ),
+        "Agentcloudtypes": (
+            "list_agentcloudtypes",
+        ),
+        "Agents": (
+            "create_agents",
+            "delete_agents",
+            "get_agents",
+            "list_agents",
+            "set_replace_agent",
+            "update_agents",
+        ),
+        "Deploymentgroups": (
+            "create_deploymentgroups",
+            "delete_deploymentgroups",
+            "get_deploymentgroups",
+            "list_deploymentgroups",
+            "update_deploymentgroups",
+        ),
+        "Elasticpoollogs": (
+            "list_elasticpoollogs",
+        ),
+        "Elasticpools": (
+            "create_elasticpools",
+            "get_elasticpools",
+            "list_elasticpools",
+            "update_elasticpools",
+        ),
+        "Environments": (
+            "get_environment",
+            "list_environments",
+        ),
+        "Events": (
+            "create_post_event",
+        ),
+        "Logs": (
+            "create_append_log_content",
+            "create_logs",
+        ),
+        "Nodes": (
+            "list_nodes",
+            "update_nodes",
+        ),
+        "Oidctoken": (
+            "create_oidctoken",
+        ),
+        "Poolpermissions": (
+            "get_has_pool_permissions",
+        ),
+        "Pools": (
+            "create_pools",
+            "delete_pools",
+            "get_agent_pools_by_ids",
+            "get_pools",
+            "list_pools",
+            "update_pools",
+        ),
+        "Queues": (
+            "create_queues",
+            "delete_queues",
+            "get_agent_queues_for_pools",
+            "get_queues",
+        ),
+        "Records": (
+            "update_records",
+        ),
+        "Requests": (
+            "list_requests",
+        ),
+        "Targets": (
+            "delete_targets",
+            "get_targets",
+            "list_targets",
+            "update_targets",
+        ),
+        "Taskgroups": (
+            "create_taskgroups",
+            "delete_taskgroups",
+            "list_taskgroups",
+            "update_taskgroups",
+        ),
+        "VariableGroups": (
+            "get_variable_group",
+            "list_variable_groups",
+        ),
+        "Variablegroups": (
+            "create_variablegroups",
+            "delete_variablegroups",
+            "get_variable_groups_by_id",
+            "get_variablegroups",
+            "update_share_variable_group",
+            "update_variablegroups",
+        ),
+        "Webhooks": (
+            "create_receive_external_event",
+        ),
+        "Yamlschema": (
+            "get_yamlschema",
+        ),
+    },
+    "Environments": {
+        "Environmentaccesstoken": (
+            "create_generate_environment_access_token",
+        ),
+        "Environmentdeploymentrecords": (
+            "list_environmentdeploymentrecords",
+        ),
+        "Environments": (
+            "create_environments",
+            "delete_environments",
+            "get_environments",
+            "list_environments",
+            "update_environments",
+        ),
+        "Kubernetes": (
+            "create_kubernetes",
+            "delete_kubernetes",
+            "get_kubernetes",
+            "update_kubernetes",
+        ),
+        "Pool": (
+            "get_pool",
+        ),
+        "Vmresource": (
+            "create_vmresource",
+            "delete_vmresource",
+            "list_vmresource",
+            "set_replace_virtual_machine_resource",
+            "update_vmresource",
+        ),
+    },
+    "ExtensionManagement": {
+        "InstalledExtensions": (
+            "create_install_extension_by_name",
+            "delete_uninstall_extension_by_name",
+            "get_installed_extensions",
+            "list_installed_extensions",
+            "update_installed_extensions",
+        ),
+    },
+    "Favorite": {
+        "Favorites": (
+            "create_favorite",
+            "delete_favorite_by_id",
+            "get_favorite_by_id",
+            "get_favorites",
+        ),
+    },
+    "Git": {
+        "AnnotatedTags": (
+            "create_annotated_tags",
+            "get_annotated_tags",
+        ),
+        "Blobs": (
+            "get_blob",
+            "get_blobs_zip",
+        ),
+        "CherryPicks": (
+            "create_cherry_picks",
+            "get_cherry_pick",
+            "get_cherry_pick_for_ref_name",
+        ),
+        "Commits": (
+            "get_changes",
+            "get_commit",
+            "get_commits",
+            "get_commits_batch",
+            "get_push_commits",
+            "list_commits",
+        ),
+        "Diffs": (
+            "get_diffs",
+        ),
+        "Forks": (
+            "create_fork_sync_request",
+            "get_fork_sync_request",
+            "get_fork_sync_requests",
+            "list_forks",
+        ),
+        "ImportRequests": (
+            "create_import_requests",
+            "get_import_requests",
+            "query_import_requests",
+            "update_import_requests",
+        ),
+        "Items": (
+            "get_items_batch",
+            "list_items",
+        ),
+        "MergeBases": (
+            "list_merge_bases",
+        ),
+        "Merges": (
+            "create_merges",
+            "get_merges",
+        ),
+        "PolicyConfigurations": (
+            "get_policy_configurations",
+        ),
+        "PullRequestAttachments": (
+            "create_pull_request_attachments",
+            "delete_pull_request_attachments",
+            "get_pull_request_attachments",
+            "list_pull_request_attachments",
+        ),
+        "PullRequestCommentLikes": (
+            "create_pull_request_comment_likes",
+            "delete_pull_request_comment_likes",
+            "list_pull_request_comment_likes",
+        ),
+        "PullRequestCommits": (
+            "get_pull_request_commits",
+            "get_pull_request_iteration_commits",
+        ),
+        "PullRequestIterationChanges": (
+            "get_pull_request_iteration_changes",
+        ),
+        "PullRequestIterationStatuses": (
+            "create_pull_request_iteration_statuses",
+            "delete_pull_request_iteration_statuses",
+            "get_pull_request_iteration_statuses",
+            "list_pull_request_iteration_statuses",
+            "update_pull_request_iteration_statuses",
+        ),
+        "PullRequestIterations": (
+            "get_pull_request_iterations",
+            "list_pull_request_iterations",
+        ),
+        "PullRequestLabels": (
+            "create_pull_request_labels",
+            "delete_pull_request_labels",
+            "get_pull_request_labels",
+            "list_pull_request_labels",
+        ),
+        "PullRequestProperties": (
+            "list_pull_request_properties",
+            "update_pull_request_properties",
+        ),
+        "PullRequestQuery": (
+            "get_pull_request_query",
+        ),
+        "PullRequestReviewers": (
+            "create_pull_request_reviewer",
+            "create_pull_request_reviewers",
+            "create_unmaterialized_pull_request_reviewer",
+            "delete_pull_request_reviewers",
+            "get_pull_request_reviewers",
+            "list_pull_request_reviewers",
+            "update_pull_request_reviewer",
+            "update_pull_request_reviewers",
+        ),
+        "PullRequestShare": (
+            "create_share_pull_request",
+        ),
+        "PullRequestStatuses": (
+            "create_pull_request_statuses",
+            "delete_pull_request_statuses",
+            "get_pull_request_statuses",
+            "list_pull_request_statuses",
+            "update_pull_request_statuses",
+        ),
+        "PullRequestThreadComments": (
+            "create_pull_request_thread_comments",
+            "delete_pull_request_thread_comments",
+            "get_pull_request_thread_comments",
+            "list_pull_request_thread_comments",
+            "update_pull_request_thread_comments",
+        ),
+        "PullRequestThreads": (
+            "create_pull_request_threads",
+            "get_pull_request_threads",
+            "list_pr_threads",
+            "list_pull_request_threads",
+            "update_pull_request_threads",
+        ),
+        "PullRequestWorkItems": (
+            "list_pull_request_work_items",
+        ),
+        "PullRequests": (
+            "create_pull_request",
+            "create_pull_requests",
+            "get_pull_request",
+            "get_pull_request_by_id",
+            "get_pull_requests",
+            "get_pull_requests_by_project",
+            "list_pull_requests",
+            "update_pull_request",
+            "update_pull_requests",
+        ),
+        "Pushes": (
+            "create_pushes",
+            "get_pushes",
+            "list_pushes",
+        ),
+        "Refs": (
+            "list_refs",
+            "update_ref",
+            "update_refs",
+        ),
+        "RefsFavorites": (
+            "create_refs_favorites",
+            "delete_refs_favorites",
+            "get_refs_favorites",
+            "list_refs_favorites",
+        ),
+        "RefsFavoritesForProject": (
+            "list_refs_favorites_for_project",
+        ),
+        "Repositories": (
+            "create_repositories",
+            "delete_repositories",
+            "delete_repository_from_recycle_bin",
+            "get_deleted_repositories",
+            "get_recycle_bin_repositories",
+            "get_repository",
+            "list_repositories",
+            "update_repositories",
+            "update_restore_repository_from_recycle_bin",
+        ),
+        "Reverts": (
+            "create_reverts",
+            "get_revert",
+            "get_revert_for_ref_name",
+        ),
+        "Stats": (
+            "list_stats",
+        ),
+        "Statuses": (
+            "create_statuses",
+            "list_statuses",
+        ),
+        "Suggestions": (
+            "list_suggestions",
+        ),
+        "Trees": (
+            "get_trees",
+        ),
+    },
+    "Graph": {
+        "Avatars": (
+            "delete_avatars",
+            "get_avatars",
+            "set_avatar",
+        ),
+        "Descriptors": (
+            "get_descriptors",
+        ),
+        "Groups": (
+            "create_groups",
+            "delete_groups",
+            "get_groups",
+            "list_groups",
+            "update_groups",
+        ),
+        "MembershipStates": (
+            "get_membership_states",
+        ),
+        "Memberships": (
+            "create_memberships",
+            "delete_membership",
+            "get_memberships",
+            "list_memberships",
+        ),
+        "ProviderInfo": (
+            "get_provider_info",
+        ),
+        "RequestAccess": (
+            "create_request_access",
+        ),
+        "ServicePrincipals": (
+            "create_service_principals",
+            "delete_service_principals",
+            "get_service_principals",
+            "list_service_principals",
+        ),
+        "StorageKeys": (
+            "get_storage_keys",
+        ),
+        "SubjectLookup": (
+            "create_lookup_subjects",
+        ),
+        "SubjectQuery": (
+            "query_subject_query",
+        ),
+        "Users": (
+            "create_users",
+            "delete_users",
+            "get_users",
+            "list_users",
+            "update_users",
+        ),
+    },
+    "Hooks": {
+        "Consumers": (
+            "get_consumer_action",
+            "get_consumers",
+            "list_consumer_actions",
+            "list_consumers",
+        ),
+        "Diagnostics": (
+            "get_diagnostics",
+            "update_diagnostics",
+        ),
+        "Notifications": (
+            "create_notifications",
+            "get_notifications",
+            "list_notifications",
+            "query_notifications",
+        ),
+        "Publishers": (
+            "get_event_type",
+            "get_publishers",
+            "list_event_types",
+            "list_publishers",
+            "query_input_values",
+            "query_publishers",
+        ),
+        "Subscriptions": (
+            "create_subscriptions",
+            "create_subscriptions_query",
+            "delete_subscriptions",
+            "get_subscription",
+            "get_subscriptions",
+            "list_subscriptions",
+            "set_replace_subscription",
+        ),
+    },
+    "IMS": {
+        "Identities": (
+            "get_read_identities",
+        ),
+    },
+    "MemberEntitlementManagement": {
+        "GroupEntitlements": (
+            "create_group_entitlements",
+            "delete_group_entitlements",
+            "get_group_entitlements",
+            "list_group_entitlements",
+            "update_group_entitlements",
+        ),
+        "MemberEntitlements": (
+            "query_member_entitlements",
+        ),
+        "Members": (
+            "create_members",
+            "delete_member_from_group",
+            "get_members",
+        ),
+        "ServicePrincipalEntitlements": (
+            "create_service_principal_entitlements",
+            "delete_service_principal_entitlements",
+            "get_service_principal_entitlements",
+            "update_service_principal_entitlement",
+            "update_service_principal_entitlements",
+        ),
+        "UserEntitlementSummary": (
+            "get_user_entitlement_summary",
+        ),
+        "UserEntitlements": (
+            "create_user_entitlements",
+            "delete_user_entitlements",
+            "get_user_entitlements",
+            "query_user_entitlements",
+            "update_user_entitlement",
+            "update_user_entitlements",
+        ),
+    },
+    "Notification": {
+        "DiagnosticLogs": (
+            "list_diagnostic_logs",
+        ),
+        "Diagnostics": (
+            "get_diagnostics",
+            "update_diagnostics",
+        ),
+        "EventTypes": (
+            "get_event_types",
+            "list_event_types",
+        ),
+        "Settings": (
+            "get_settings",
+            "update_settings",
+        ),
+        "Subscribers": (
+            "get_subscribers",
+            "update_subscribers",
+        ),
+        "Subscriptions": (
+            "create_subscriptions",
+            "delete_subscriptions",
+            "get_subscription_templates",
+            "get_subscriptions",
+            "list_subscriptions",
+            "query_subscriptions",
+            "update_subscription_user_settings",
+            "update_subscriptions",
+        ),
+    },
+    "Operations": {
+        "Operations": (
+            "get_operations",
+        ),
+    },
+    "PermissionsReport": {
+        "PermissionsReport": (
+            "create_permissions_report",
+            "get_permissions_report",
+            "list_permissions_report",
+        ),
+        "PermissionsReportDownload": (
+            "get_download",
+        ),
+    },
+    "Pipelines": {
+        "Artifacts": (
+            "get_artifacts",
+        ),
+        "Logs": (
+            "get_logs",
+            "list_logs",
+        ),
+        "Pipelines": (
+            "create_pipelines",
+            "get_pipeline",
+            "get_pipelines",
+            "list_pipelines",
+        ),
+        "Preview": (
+            "create_preview",
+        ),
+        "Runs": (
+            "get_run",
+            "get_runs",
+            "list_runs",
+            "run_pipeline",
+        ),
+    },
+    "Policy": {
+        "Configurations": (
+            "create_configurations",
+            "delete_configurations",
+            "get_configuration",
+            "get_configurations",
+            "list_configurations",
+            "update_configurations",
+        ),
+        "Evaluations": (
+            "get_evaluations",
+            "list_evaluations",
+            "run_requeue_policy_evaluation",
+        ),
+        "Revisions": (
+            "get_revisions",
+            "list_revisions",
+        ),
+        "Types": (
+            "get_types",
+            "list_types",
+        ),
+    },
+    "ProcessAdmin": {
+        "Behaviors": (
+            "list_behaviors",
+        ),
+        "Processes": (
+            "create_import_process_template",
+            "get_export_process_template",
+            "get_import_process_template_status",
+        ),
+    },
+    "ProcessDefinitions": {
+        "Add": (
+            "create_add",
+        ),
+        "Create": (
+            "create",
+        ),
+        "Delete": (
+            "delete",
+        ),
+        "EditControl": (
+            "update_edit_control",
+        ),
+        "EditGroup": (
+            "update_edit_group",
+        ),
+        "EditPage": (
+            "update_edit_page",
+        ),
+        "Get": (
+            "get",
+        ),
+        "GetBehaviorForWorkItemType": (
+            "get_behavior_for_work_item_type",
+        ),
+        "GetBehaviorsForWorkItemType": (
+            "get_behaviors_for_work_item_type",
+        ),
+        "GetWorkItemType": (
+            "get_work_item_type",
+        ),
+        "GetWorkItemTypes": (
+            "get_work_item_types",
+        ),
+        "HideStateDefinition": (
+            "set_hide_state_definition",
+        ),
+        "List": (
+            "list",
+        ),
+        "RemoveBehaviorFromWorkItemType": (
+            "delete_behavior_from_work_item_type",
+        ),
+        "RemoveControlFromGroup": (
+            "delete_control_from_group",
+        ),
+        "RemoveFieldFromWorkItemType": (
+            "delete_field_from_work_item_type",
+        ),
+        "RemoveGroup": (
+            "delete_group",
+        ),
+        "RemovePage": (
+            "delete_page",
+        ),
+        "ReplaceBehavior": (
+            "set_replace_behavior",
+        ),
+        "SetControlInGroup": (
+            "set_control_in_group",
+        ),
+        "SetGroupInSection": (
+            "set_group_in_section",
+        ),
+        "Update": (
+            "update",
+        ),
+        "UpdateBehaviorToWorkItemType": (
+            "update_behavior_to_work_item_type",
+        ),
+        "UpdateWorkItemType": (
+            "update_work_item_type",
+        ),
+    },
+    "Processes": {
+        "Behaviors": (
+            "create_behaviors",
+            "delete_behaviors",
+            "get_behaviors",
+            "list_behaviors",
+            "update_behaviors",
+        ),
+        "Controls": (
+            "create_controls",
+            "delete_control_from_group",
+            "set_move_control_to_group",
+            "update_controls",
+        ),
+        "Fields": (
+            "create_fields",
+            "delete_work_item_type_field",
+            "get_fields",
+            "list_fields",
+            "update_fields",
+        ),
+        "Groups": (
+            "create_groups",
+            "delete_group",
+            "set_move_group_to_section",
+            "update_groups",
+        ),
+        "Layout": (
+            "get_layout",
+        ),
+        "Lists": (
+            "create_lists",
+            "delete_lists",
+            "get_lists",
+            "list_lists",
+            "update_lists",
+        ),
+        "Pages": (
+            "create_pages",
+            "delete_page",
+            "update_pages",
+        ),
+        "Processes": (
+            "create_processes",
+            "delete_processes",
+            "get_processes",
+            "list_processes",
+            "update_edit_process",
+        ),
+        "Rules": (
+            "create_rules",
+            "delete_rules",
+            "get_rules",
+            "list_rules",
+            "update_rules",
+        ),
+        "States": (
+            "create_states",
+            "delete_states",
+            "get_states",
+            "list_states",
+            "set_hide_state_definition",
+            "update_states",
+        ),
+        "SystemControls": (
+            "delete_system_controls",
+            "list_system_controls",
+            "update_system_controls",
+        ),
+        "WorkItemTypes": (
+            "create_work_item_types",
+            "delete_work_item_types",
+            "get_work_item_types",
+            "list_work_item_types",
+            "update_work_item_types",
+        ),
+        "WorkItemTypesBehaviors": (
+            "create_work_item_types_behaviors",
+            "delete_behavior_from_work_item_type",
+            "get_work_item_types_behaviors",
+            "list_work_item_types_behaviors",
+            "update_work_item_types_behaviors",
+        ),
+    },
+    "Profile": {
+        "Profiles": (
+            "get_profiles",
+        ),
+    },
+    "Release": {
+        "Approvals": (
+            "list_approvals",
+            "update_approvals",
+        ),
+        "Attachments": (
+            "get_release_task_attachment_content",
+            "get_release_task_attachments",
+            "get_task_attachment_content",
+            "get_task_attachments",
+        ),
+        "Definitions": (
+            "create_definitions",
+            "delete_definitions",
+            "get_definition_revision",
+            "get_definitions",
+            "get_release_definition_history",
+            "list_definitions",
+            "update_definitions",
+        ),
+        "Deployments": (
+            "list_deployments",
+        ),
+        "Folders": (
+            "create_folders",
+            "delete_folders",
+            "list_folders",
+            "update_folders",
+        ),
+        "Gates": (
+            "update_gates",
+        ),
+        "ManualInterventions": (
+            "get_manual_interventions",
+            "list_manual_interventions",
+            "update_manual_interventions",
+        ),
+        "Releases": (
+            "create_releases",
+            "get_logs",
+            "get_release_environment",
+            "get_release_revision",
+            "get_task_log",
+            "list_releases",
+            "update_release",
+            "update_release_environment",
+            "update_release_resource",
+        ),
+    },
+    "ResourceUsage": {
+        "Project": (
+            "list_project",
+        ),
+        "TeamProjectCollection": (
+            "list_team_project_collection",
+        ),
+    },
+    "Search": {
+        "CodeSearchResults": (
+            "query_fetch_code_search_results",
+        ),
+        "PackageSearchResults": (
+            "query_fetch_package_search_results",
+        ),
+        "Repositories": (
+            "get_repositories",
+        ),
+        "Tfvc": (
+            "get_tfvc",
+        ),
+        "WikiSearchResults": (
+            "query_fetch_wiki_search_results",
+        ),
+        "WorkItemSearchResults": (
+            "query_fetch_work_item_search_results",
+        ),
+    },
+    "Security": {
+        "AccessControlEntries": (
+            "delete_access_control_entries",
+            "set_access_control_entries",
+        ),
+        "AccessControlLists": (
+            "list_access_control_lists",
+            "query_access_control_lists",
+        ),
+        "Permissions": (
+            "create_has_permissions_batch",
+            "delete_permission",
+            "get_has_permissions",
+        ),
+        "SecurityNamespaces": (
+            "query_security_namespaces",
+        ),
+    },
+    "SecurityRoles": {
+        "Roleassignments": (
+            "delete_role_assignment",
+            "delete_role_assignments",
+            "list_roleassignments",
+            "set_role_assignment",
+            "set_role_assignments",
+        ),
+        "Roledefinitions": (
+            "list_roledefinitions",
+        ),
+    },
+    "ServiceEndpoint": {
+        "Endpointproxy": (
+            "query_endpointproxy",
+        ),
+        "Endpoints": (
+            "create_endpoints",
+            "delete_endpoints",
+            "get_endpoints",
+            "get_service_endpoints_by_names",
+            "get_service_endpoints_with_refreshed_authentication",
+            "update_service_endpoint",
+            "update_service_endpoints",
+            "update_share_service_endpoint",
+        ),
+        "Executionhistory": (
+            "list_executionhistory",
+        ),
+        "Types": (
+            "get_filtered_service_endpoint_types",
+            "get_service_endpoint_types",
+        ),
+    },
+    "Status": {
+        "Health": (
+            "get_health",
+        ),
+    },
+    "Symbol": {
+        "Availability": (
+            "get_check_availability",
+        ),
+        "Client": (
+            "get_client",
+        ),
+        "Contents": (
+            "get_contents",
+        ),
+        "Requests": (
+            "create_requests",
+            "create_requests_request_id_debug_entries",
+            "delete_requests_request_id",
+            "delete_requests_request_name",
+            "get_requests_request_id",
+            "get_requests_request_name",
+            "update_requests_request_id",
+            "update_requests_request_name",
+        ),
+        "Symsrv": (
+            "get_symsrv",
+        ),
+    },
+    "TFVC": {
+        "Branches": (
+            "get_branch_refs",
+        ),
+        "Changesets": (
+            "create_changesets",
+            "get_batched_changesets",
+            "get_changeset_changes",
+            "get_changeset_work_items",
+            "get_changesets",
+        ),
+        "Items": (
+            "get_items_batch",
+            "list_items",
+        ),
+        "Labels": (
+            "get_label_items",
+            "get_labels",
+            "list_labels",
+        ),
+        "Shelvesets": (
+            "get_shelveset_changes",
+            "get_shelveset_work_items",
+            "get_shelvesets",
+        ),
+    },
+    "Test": {
+        "Attachments": (
+            "create_test_result_attachment",
+            "create_test_run_attachment",
+            "get_test_result_attachment_zip",
+            "get_test_result_attachments",
+            "get_test_run_attachment_zip",
+            "get_test_run_attachments",
+        ),
+        "CodeCoverage": (
+            "get_build_code_coverage",
+            "get_test_run_code_coverage",
+        ),
+        "Iterations": (
+            "get_iterations",
+            "list_iterations",
+        ),
+        "Points": (
+            "get_point",
+            "get_points_by_query",
+            "list_points",
+            "update_points",
+        ),
+        "ResultRetentionSettings": (
+            "get_result_retention_settings",
+            "update_result_retention_settings",
+        ),
+        "Results": (
+            "create_results",
+            "get_results",
+            "list_results",
+            "update_results",
+        ),
+        "Runs": (
+            "create_runs",
+            "delete_runs",
+            "get_test_run_by_id",
+            "get_test_run_statistics",
+            "list_runs",
+            "update_runs",
+        ),
+        "Session": (
+            "create_session",
+            "list_session",
+            "update_session",
+        ),
+        "TestCases": (
+            "delete_test_cases",
+        ),
+        "TestHistory": (
+            "query_test_history",
+        ),
+        "TestSuites": (
+            "create_test_suites",
+            "delete_test_cases_from_suite_url",
+            "get_test_suites",
+            "list_test_suites",
+            "update_test_suites",
+        ),
+    },
+    "TestPlan": {
+        "Configurations": (
+            "create_configurations",
+            "delete_configurations",
+            "get_configurations",
+            "list_configurations",
+            "update_configurations",
+        ),
+        "SuiteTestCase": (
+            "create_suite_test_case",
+            "get_test_case",
+            "list_test_case_list",
+            "list_test_cases_list_from_suite",
+            "update_suite_test_case",
+        ),
+        "TestCaseClone": (
+            "create_clone_test_case",
+            "get_test_case_clone",
+        ),
+        "TestCases": (
+            "delete_test_cases",
+        ),
+        "TestPlanClone": (
+            "create_clone_test_plan",
+            "get_test_plan_clone",
+        ),
+        "TestPlanRecycleBin": (
+            "delete_restore_deleted_test_plan",
+            "list_test_plan_recycle_bin",
+        ),
+        "TestPlans": (
+            "create_test_plans",
+            "delete_test_plans",
+            "get_test_plans",
+            "list_test_plans",
+            "update_test_plans",
+        ),
+        "TestPoint": (
+            "get_points",
+            "update_test_point",
+        ),
+        "TestSuiteClone": (
+            "create_clone_test_suite",
+            "get_test_suite_clone",
+        ),
+        "TestSuiteEntry": (
+            "list_test_suite_entry",
+            "update_reorder_suite_entries",
+        ),
+        "TestSuiteRecycleBinOperations": (
+            "delete_restore_deleted_test_suite",
+            "get_deleted_test_suites_for_plan",
+            "get_deleted_test_suites_for_project",
+        ),
+        "TestSuites": (
+            "create_test_suites",
+            "delete_test_suites",
+            "get_suites_by_test_case_id",
+            "get_test_suites",
+            "get_test_suites_for_plan",
+            "update_test_suites",
+        ),
+        "Variables": (
+            "create_variables",
+            "delete_variables",
+            "get_variables",
+            "list_variables",
+            "update_variables",
+        ),
+    },
+    "TestResults": {
+        "Attachments": (
+            "create_test_result_attachment",
+            "create_test_run_attachment",
+            "delete_test_result_attachment",
+            "delete_test_run_attachment",
+            "get_test_result_attachment_zip",
+            "get_test_result_attachments",
+            "get_test_run_attachment_zip",
+            "get_test_run_attachments",
+        ),
+        "Bugs": (
+            "list_bugs",
+        ),
+        "Codecoverage": (
+            "get_codecoverage",
+            "get_fetch_source_code_coverage_report",
+            "get_test_run_code_coverage",
+            "update_codecoverage",
+        ),
+        "Extensionfields": (
+            "create_extensionfields",
+            "delete_extensionfields",
+            "query_extensionfields",
+            "update_extensionfields",
+        ),
+        "Filecoverage": (
+            "get_filecoverage",
+        ),
+        "History": (
+            "query_history",
+        ),
+        "MessageLogs": (
+            "list_message_logs",
+        ),
+        "Metrics": (
+            "get_metrics",
+        ),
+        "ResultDocument": (
+            "create_publish_test_result_document",
+        ),
+        "ResultMetaData": (
+            "query_result_meta_data",
+            "update_result_meta_data",
+        ),
+        "ResultTrendByBuild": (
+            "query_result_trend_by_build",
+        ),
+        "ResultTrendByRelease": (
+            "query_result_trend_by_release",
+        ),
+        "Resultdetailsbybuild": (
+            "get_resultdetailsbybuild",
+        ),
+        "Resultdetailsbyrelease": (
+            "get_resultdetailsbyrelease",
+        ),
+        "Resultgroupsbybuild": (
+            "list_resultgroupsbybuild",
+        ),
+        "Resultgroupsbyrelease": (
+            "list_resultgroupsbyrelease",
+        ),
+        "Results": (
+            "create_results",
+            "get_test_result_by_id",
+            "get_test_results",
+            "get_test_results_by_query",
+            "get_test_results_by_query_wiql",
+            "update_results",
+        ),
+        "Resultsbybuild": (
+            "list_resultsbybuild",
+        ),
+        "Resultsbypipeline": (
+            "list_resultsbypipeline",
+        ),
+        "Resultsbyrelease": (
+            "list_resultsbyrelease",
+        ),
+        "ResultsgroupDetails": (
+            "get_test_results_group_details",
+        ),
+        "Resultsummarybybuild": (
+            "query_resultsummarybybuild",
+        ),
+        "Resultsummarybypipeline": (
+            "query_resultsummarybypipeline",
+        ),
+        "Resultsummarybyrelease": (
+            "query_test_results_report_for_release",
+            "query_test_results_summary_for_releases",
+        ),
+        "Resultsummarybyrequirement": (
+            "query_resultsummarybyrequirement",
+        ),
+        "Runs": (
+            "create_runs",
+            "delete_runs",
+            "get_runs",
+            "list_runs",
+            "update_runs",
+        ),
+        "Runsummary": (
+            "get_runsummary",
+        ),
+        "Settings": (
+            "get_settings",
+            "update_settings",
+        ),
+        "SimilarTestResults": (
+            "list_similar_test_results",
+        ),
+        "Statistics": (
+            "get_statistics",
+        ),
+        "Status": (
+            "get_status",
+        ),
+        "Tags": (
+            "get_test_tags_for_build",
+            "update_tags",
+        ),
+        "Tagsummary": (
+            "get_test_tag_summary_for_build",
+        ),
+        "TestHistory": (
+            "query_test_history",
+        ),
+        "Testattachments": (
+            "create_build_attachment_in_log_store",
+            "create_test_run_log_store_attachment",
+            "delete_testattachments",
+            "list_testattachments",
+        ),
+        "Testfailuretype": (
+            "create_testfailuretype",
+            "delete_testfailuretype",
+            "list_testfailuretype",
+        ),
+        "Testlog": (
+            "get_test_logs_for_build",
+            "get_test_result_logs",
+            "get_test_run_logs",
+        ),
+        "Testlogstoreendpoint": (
+            "create_test_log_store_endpoint_details_for_build",
+            "create_test_log_store_endpoint_details_for_result",
+            "get_test_log_store_endpoint_details_for_build_log",
+            "get_test_log_store_endpoint_details_for_result_log",
+            "get_test_log_store_endpoint_details_for_run_log",
+            "run_test_log_store_endpoint_details_for_run",
+        ),
+        "Testsettings": (
+            "create_testsettings",
+            "delete_testsettings",
+            "get_testsettings",
+        ),
+        "Workitems": (
+            "create_workitems",
+            "delete_workitems",
+            "list_workitems",
+            "query_test_result_work_items",
+        ),
+    },
+    "TokenAdmin": {
+        "PersonalAccessTokens": (
+            "list_personal_access_tokens",
+        ),
+        "RevocationRules": (
+            "create_revocation_rules",
+        ),
+        "Revocations": (
+            "create_revoke_authorizations",
+        ),
+    },
+    "TokenAdministration": {
+        "List": (
+            "list",
+        ),
+        "RevokeAuthorizations": (
+            "create_revoke_authorizations",
+        ),
+    },
+    "Tokens": {
+        "Pats": (
+            "create_pats",
+            "delete_revoke",
+            "get_pats",
+            "update_pats",
+        ),
+    },
+    "Wiki": {
+        "Attachments": (
+            "create_attachments",
+        ),
+        "PageMoves": (
+            "create_page_moves",
+        ),
+        "PageStats": (
+            "get_page_stats",
+        ),
+        "Pages": (
+            "create_or_update",
+            "delete_page",
+            "delete_page_by_id",
+            "get_page",
+            "get_page_by_id",
+            "update_pages",
+        ),
+        "PagesBatch": (
+            "get_pages_batch",
+        ),
+        "Wikis": (
+            "create_wikis",
+            "delete_wikis",
+            "get_wiki",
+            "get_wikis",
+            "list_wikis",
+            "update_wikis",
+        ),
+    },
+    "Work": {
+        "Backlogconfiguration": (
+            "get_backlogconfiguration",
+        ),
+        "Backlogs": (
+            "get_backlog",
+            "get_backlog_level_work_items",
+            "list_backlogs",
+        ),
+        "Boardcolumns": (
+            "list_boardcolumns",
+        ),
+        "Boardparents": (
+            "list_boardparents",
+        ),
+        "Boardrows": (
+            "list_boardrows",
+        ),
+        "Boards": (
+            "get_boards",
+            "list_boards",
+            "set_board_options",
+        ),
+        "Boardusersettings": (
+            "get_boardusersettings",
+            "update_boardusersettings",
+        ),
+        "Capacities": (
+            "get_capacities_with_identity_ref_and_totals",
+            "get_capacity_with_identity_ref",
+            "set_replace_capacities_with_identity_ref",
+            "update_capacities",
+        ),
+        "Cardrulesettings": (
+            "get_cardrulesettings",
+            "update_board_card_rule_settings",
+            "update_taskboard_card_rule_settings",
+        ),
+        "Cardsettings": (
+            "get_cardsettings",
+            "update_board_card_settings",
+            "update_taskboard_card_settings",
+        ),
+        "Chartimages": (
+            "get_board_chart_image",
+            "get_iteration_chart_image",
+            "get_iterations_chart_image",
+        ),
+        "Charts": (
+            "get_charts",
+            "list_charts",
+            "update_charts",
+        ),
+        "Columns": (
+            "list_columns",
+            "update_columns",
+        ),
+        "Deliverytimeline": (
+            "get_deliverytimeline",
+        ),
+        "Iterationcapacities": (
+            "get_iterationcapacities",
+        ),
+        "Iterations": (
+            "create_post_team_iteration",
+            "delete_iterations",
+            "get_iteration_work_items",
+            "get_iterations",
+            "list_iterations",
+        ),
+        "Plans": (
+            "create_plans",
+            "delete_plans",
+            "get_plans",
+            "list_plans",
+            "update_plans",
+        ),
+        "PredefinedQueries": (
+            "get_predefined_queries",
+            "list_predefined_queries",
+        ),
+        "Processconfiguration": (
+            "get_processconfiguration",
+        ),
+        "Rows": (
+            "list_rows",
+            "update_rows",
+        ),
+        "TaskboardColumns": (
+            "get_taskboard_columns",
+            "update_taskboard_columns",
+        ),
+        "TaskboardWorkItems": (
+            "list_taskboard_work_items",
+            "update_taskboard_work_items",
+        ),
+        "Teamdaysoff": (
+            "get_teamdaysoff",
+            "update_teamdaysoff",
+        ),
+        "Teamfieldvalues": (
+            "get_teamfieldvalues",
+            "update_teamfieldvalues",
+        ),
+        "Teamsettings": (
+            "get_teamsettings",
+            "update_teamsettings",
+        ),
+        "Workitemsorder": (
+            "update_reorder_backlog_work_items",
+            "update_reorder_iteration_work_items",
+        ),
+    },
+    "WorkItemTracking": {
+        "AccountMyWorkRecentActivity": (
+            "list_account_my_work_recent_activity",
+        ),
+        "ArtifactLinkTypes": (
+            "list_artifact_link_types",
+        ),
+        "ArtifactUriQuery": (
+            "query_artifact_uri_query",
+        ),
+        "Attachments": (
+            "create_attachments",
+            "delete_attachments",
+            "get_attachments",
+            "set_upload_chunk",
+        ),
+        "ClassificationNodes": (
+            "create_or_update",
+            "delete_classification_nodes",
+            "get_classification_nodes",
+            "get_root_nodes",
+            "update_classification_nodes",
+        ),
+        "CommentReactionsEngagedUsers": (
+            "list_comment_reactions_engaged_users",
+        ),
+        "Comments": (
+            "add_comment",
+            "create_comment",
+            "delete_comments",
+            "get_comment",
+            "get_comments_batch",
+            "list_comments",
+            "update_comment",
+        ),
+        "CommentsReactions": (
+            "create_comments_reactions",
+            "delete_comments_reactions",
+            "list_comments_reactions",
+        ),
+        "CommentsVersions": (
+            "get_comments_versions",
+            "list_comments_versions",
+        ),
+        "Fields": (
+            "create_fields",
+            "delete_fields",
+            "get_fields",
+            "list_fields",
+            "update_fields",
+        ),
+        "GithubConnections": (
+            "get_github_connection_repositories",
+            "get_github_connections",
+            "update_github_connections",
+        ),
+        "ProjectProcessMigration": (
+            "create_migrate_projects_process",
+        ),
+        "Queries": (
+            "create_queries",
+            "delete_queries",
+            "get_queries",
+            "get_queries_batch",
+            "get_query",
+            "list_queries",
+            "update_queries",
+        ),
+        "Recyclebin": (
+            "delete_destroy_work_item",
+            "get_deleted_work_item_shallow_references",
+            "get_recyclebin",
+            "update_restore_work_item",
+        ),
+        "ReportingWorkItemLinks": (
+            "get_reporting_work_item_links",
+        ),
+        "ReportingWorkItemRevisions": (
+            "create_read_reporting_revisions_post",
+            "get_read_reporting_revisions_get",
+        ),
+        "Revisions": (
+            "get_revisions",
+            "list_revisions",
+        ),
+        "SendMail": (
+            "create_send_mail",
+        ),
+        "Tags": (
+            "delete_tags",
+            "get_tags",
+            "list_tags",
+            "update_tags",
+        ),
+        "TempQueries": (
+            "create_temp_queries",
+        ),
+        "Templates": (
+            "create_templates",
+            "delete_templates",
+            "get_templates",
+            "list_templates",
+            "set_replace_template",
+        ),
+        "Updates": (
+            "get_updates",
+            "list_updates",
+        ),
+        "Wiql": (
+            "query_by_id",
+            "query_by_wiql",
+            "query_work_items",
+        ),
+        "WorkItemIcons": (
+            "get_work_item_icons",
+            "list_work_item_icons",
+        ),
+        "WorkItemRelationTypes": (
+            "get_work_item_relation_types",
+            "list_work_item_relation_types",
+        ),
+        "WorkItemRevisionsDiscussions": (
+            "get_read_reporting_discussions",
+        ),
+        "WorkItemTransitions": (
+            "list_work_item_transitions",
+        ),
+        "WorkItemTypeCategories": (
+            "get_work_item_type_categories",
+            "list_work_item_type_categories",
+        ),
+        "WorkItemTypeStates": (
+            "list_work_item_type_states",
+        ),
+        "WorkItemTypes": (
+            "get_work_item_types",
+            "list_work_item_types",
+        ),
+        "WorkItemTypesField": (
+            "get_work_item_types_field",
+            "list_work_item_types_field",
+        ),
+        "WorkItems": (
+            "batch_get_work_items",
+            "create_work_items",
+            "delete_work_item",
+            "delete_work_items",
+            "get_work_item",
+            "get_work_item_template",
+            "get_work_items_batch",
+            "list_work_items",
+            "update_work_item",
+            "update_work_items",
+        ),
+    },
+}
@@ -0,0 +1,14 @@
+# devops_api/tests/conftest.py
+import pytest
+
+from _shared import rate_limit, response_cache
+
+
+@pytest.fixture(autouse=True)
+def _no_pacing_or_cache():
+    """Disable the rate limiter and response cache so batch tests stay isolated."""
+    rate_limit.configure_rate_limit(enabled=False)
+    response_cache.configure_cache("")
+    yield
+    rate_limit.configure_rate_limit(enabled=False)
+    response_cache.configure_cache("")
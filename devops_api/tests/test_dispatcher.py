@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Offline unit tests for devops_api/dispatcher.py
+
+Validates:
+  - Case-insensitive operation lookup with suggestions on a miss
+  - The registry matches the generated operation modules
+  - Single-operation mode hands flags to the operation's CLI
+  - Batch mode runs many calls on one client, in order, with error records
+  - Unexpected exceptions become error records instead of ending the batch
+"""
+
+import json
+import sys
+
+import pytest
+import responses
+
+from _shared.errors import AdoConfigError
+from _shared.http_client import AdoClient
+from devops_api import dispatcher
+from devops_api.registry import OPERATIONS
+
+PROJECTS_URL = "https://dev.azure.com/testorg/_apis/projects"
+
+
+@pytest.fixture
+def ado_env(monkeypatch):
+    monkeypatch.setenv("AZURE_DEVOPS_ORG", "testorg")
+    monkeypatch.setenv("AZURE_DEVOPS_PAT", "fakepat1234567890")
+
+
+class TestLookup:
+    """Validate registry lookup."""
+
+    @pytest.mark.offline
+    @pytest.mark.dispatcher
+    def test_resolve_is_case_insensitive(self):
+        assert dispatcher.resolve("core", "PROJECTS", "List_Projects") == ("Core", "Projects", "list_projects")
+
+    @pytest.mark.offline
+    @pytest.mark.dispatcher
+    def test_unknown_name_suggests(self):
+        with pytest.raises(AdoConfigError, match="Did you mean: Projects"):
+            dispatcher.resolve("core", "projet", "list_projects")
+
+    @pytest.mark.offline
+    @pytest.mark.dispatcher
+    def test_registry_modules_expose_functions(self):
+        module = dispatcher.load_operation("Build", "Builds", "get_builds")
+        assert callable(module.get_builds)
+        assert "list_projects" in OPERATIONS["Core"]["Projects"]
+
+
+class TestSingleOperation:
+    """Validate python -m devops_api <domain> <resource> <operation>."""
+
+    @pytest.mark.offline
+    @pytest.mark.dispatcher
+    @responses.activate
+    def test_flags_reach_operation_cli(self, ado_env, monkeypatch, capsys):
+        monkeypatch.setattr(sys, "argv", ["devops_api"])
+        responses.add(responses.GET, PROJECTS_URL, json={"count": 1, "value": [{"name": "p1"}]})
+
+        dispatcher.main(["core", "projects", "list_projects", "--max-items", "1"])
+
+        assert json.loads(capsys.readouterr().out)["value"] == [{"name": "p1"}]
+        assert sys.argv == ["devops_api"]
+
+
+class TestBatch:
+    """Validate --batch JSON Lines mode."""
+
+    @pytest.mark.offline
+    @pytest.mark.dispatcher
+    @responses.activate
+    def test_results_in_order_with_errors(self):
+        responses.add(responses.GET, PROJECTS_URL, json={"count": 1, "value": [{"name": "p1"}]})
+        responses.add(
+            responses.GET, "https://dev.azure.com/testorg/myproj/_apis/build/builds/42",
+            json={"message": "Build 42 not found"}, status=404,
+        )
+        lines = [
+            json.dumps({"id": "a", "operation": "Core/Projects/list_projects", "all_pages": True}),
+            "",
+            json.dumps({"id": "b", "operation": "build.builds.get_builds", "args": {"project": "myproj", "build_id": "42"}}),
+            json.dumps({"id": "c", "operation": "Core/Projects/nope"}),
+            "not json",
+        ]
+
+        records = list(dispatcher.run_batch(AdoClient("testorg", "fakepat1234567890"), lines))
+
+        assert [r["id"] for r in records] == ["a", "b", "c", 5]
+        assert records[0]["ok"] and records[0]["result"]["value"] == [{"name": "p1"}]
+        assert records[1]["ok"] is False and records[1]["status"] == 404
+        assert "Unknown operation" in records[2]["error"]
+        assert "Invalid JSON" in records[3]["error"]
+
+    @pytest.mark.offline
+    @pytest.mark.dispatcher
+    @responses.activate
+    def test_unexpected_exception_becomes_error_record(self):
+        responses.add(responses.GET, PROJECTS_URL, body="<html>maintenance</html>", status=200)
+        responses.add(responses.GET, PROJECTS_URL, json={"count": 0, "value": []})
+        lines = [json.dumps({"id": i, "operation": "Core/Projects/list_projects"}) for i in ("bad", "good")]
+
+        records = list(dispatcher.run_batch(AdoClient("testorg", "fakepat1234567890"), lines))
+
+        assert records[0]["ok"] is False and records[0]["error"].startswith("ERROR: JSONDecodeError: ")
+        assert records[1]["ok"] and records[1]["result"] == {"count": 0, "value": []}
+
+    @pytest.mark.offline
+    @pytest.mark.dispatcher
+    @responses.activate
+    def test_workers_keep_input_order(self):
+        responses.add(responses.GET, PROJECTS_URL, json={"count": 0, "value": []})
+        lines = [json.dumps({"id": i, "operation": "Core/Projects/list_projects"}) for i in range(8)]
+
+        records = list(dispatcher.run_batch(AdoClient("testorg", "fakepat1234567890"), lines, workers=4))
+
+        assert [r["id"] for r in records] == list(range(8))
+        assert all(r["ok"] for r in records)